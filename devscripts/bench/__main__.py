@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+import argparse
+import json
+import re
+
+import devscripts.bench.benchmarks  # noqa: F401  # Registers the benchmarks
+from devscripts.bench.harness import BENCHMARKS, compare_results, load_results, run_benchmarks
+from devscripts.utils import write_file
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the hot paths of yt-dlp on fixed inputs')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks and output the results as JSON')
+    run_parser.add_argument(
+        '-k', dest='pattern', metavar='REGEX', help='Only run the benchmarks whose name matches REGEX')
+    run_parser.add_argument(
+        '-o', '--output', metavar='FILE', help='File to write the results to. Default is stdout')
+    run_parser.add_argument(
+        '--rounds', type=int, default=7, help='Number of timed rounds of each benchmark. Default is %(default)s')
+    run_parser.add_argument(
+        '--min-time', type=float, default=0.2, metavar='SECONDS',
+        help='Minimum duration of each round. Default is %(default)s')
+    run_parser.add_argument('--list', action='store_true', help='List the benchmarks and exit')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two results files')
+    compare_parser.add_argument('base', help='Results of the baseline')
+    compare_parser.add_argument('new', help='Results to compare to the baseline')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=0.05,
+        help='Relative change of the median below which results are considered equal. Default is %(default)s. '
+        'Changes within twice the relative standard deviation of the rounds are also ignored')
+    compare_parser.add_argument(
+        '--fail', action='store_true', help='Exit with an error if any benchmark got slower')
+    return parser.parse_args()
+
+
+def run(args):
+    names = [name for name in BENCHMARKS if not args.pattern or re.search(args.pattern, name)]
+    if args.list:
+        print('\n'.join(names))
+        return 0
+    if not names:
+        print(f'No benchmark matches {args.pattern!r}', file=sys.stderr)
+        return 1
+    results = json.dumps(run_benchmarks(names, rounds=args.rounds, min_time=args.min_time), indent=2, sort_keys=True)
+    if args.output:
+        write_file(args.output, results + '\n')
+    else:
+        print(results)
+    return 0
+
+
+def compare(args):
+    base, new = load_results(args.base), load_results(args.new)
+    for key in ('python', 'machine'):
+        if base['environment'][key] != new['environment'][key]:
+            print(f'WARNING: The results were measured on different {key}s: '
+                  f'{base["environment"][key]} and {new["environment"][key]}', file=sys.stderr)
+    base_corpora, new_corpora = base['environment']['corpora'], new['environment']['corpora']
+    changed = sorted(name for name in base_corpora.keys() | new_corpora.keys()
+                     if base_corpora.get(name) != new_corpora.get(name))
+    if changed:
+        print(f'WARNING: The inputs are different: {", ".join(changed)}', file=sys.stderr)
+
+    print(f'{"benchmark":<24} {"base":>12} {"new":>12} {"change":>8}')
+    slower = []
+    for name, base_median, new_median, change, significant in compare_results(base, new, args.threshold):
+        verdict = '' if not significant else 'slower' if change > 0 else 'faster'
+        if verdict == 'slower':
+            slower.append(name)
+        print(f'{name:<24} {base_median * 1000:9.3f} ms {new_median * 1000:9.3f} ms {change:+8.1%} {verdict}'.rstrip())
+    return 1 if args.fail and slower else 0
+
+
+def main():
+    args = parse_args()
+    return run(args) if args.command == 'run' else compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
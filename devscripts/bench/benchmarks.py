@@ -0,0 +1,150 @@
+import io
+import json
+
+from devscripts.bench.harness import benchmark, read_corpus
+from yt_dlp import YoutubeDL
+from yt_dlp.compat import compat_etree_fromstring
+from yt_dlp.extractor.common import InfoExtractor
+from yt_dlp.jsinterp import JSInterpreter
+from yt_dlp.networking import Request, RequestHandler, Response, load_request_handlers
+from yt_dlp.networking.common import _REQUEST_HANDLERS, _RH_PREFERENCES
+from yt_dlp.utils import FormatSorter, float_or_none, js_to_json, traverse_obj
+from yt_dlp.webvtt import parse_fragment
+
+_ydl = None
+
+
+def ydl():
+    global _ydl
+    if _ydl is None:
+        _ydl = YoutubeDL({'quiet': True, 'no_warnings': True, 'cachedir': False})
+    return _ydl
+
+
+def info_dict():
+    return json.loads(read_corpus('info.json'))
+
+
+@benchmark('traverse_obj')
+def bench_traverse_obj():
+    info = info_dict()
+    paths = [
+        ('formats', ..., 'url'),
+        ('formats', lambda _, v: v.get('vcodec') != 'none', {'height': 'height', 'codec': 'vcodec'}),
+        ('formats', ..., ('tbr', 'abr'), {float_or_none}),
+        ('formats', ..., 'http_headers', 'User-Agent', any),
+        ('subtitles', ..., ..., 'url'),
+        ('automatic_captions', 'en-es', 0, 'url'),
+        ('thumbnails', -1, 'url'),
+        ('chapters', ..., 'title', {str.upper}),
+        ('heatmap', slice(None, None, 10), 'value'),
+    ]
+
+    def run():
+        for path in paths:
+            traverse_obj(info, path)
+    return run
+
+
+@benchmark('js_to_json')
+def bench_js_to_json():
+    code = read_corpus('webpage_data.js')
+    json.loads(js_to_json(code))  # The corpus must stay valid
+    return lambda: js_to_json(code)
+
+
+@benchmark('format_sort')
+def bench_format_sort():
+    formats, ydl_ = info_dict()['formats'], ydl()
+    # The formats are copied since sorting fills in fields; the copy is part of the timing
+    return lambda: FormatSorter(ydl_, []).sort([dict(f) for f in formats])
+
+
+@benchmark('evaluate_outtmpl')
+def bench_evaluate_outtmpl():
+    info, ydl_ = dict(info_dict(), ext='mp4', format_id='137+140', playlist_index=3), ydl()
+    templates = [
+        '%(title)s [%(id)s].%(ext)s',
+        '%(uploader|Unknown)s/%(upload_date>%Y-%m-%d)s - %(title).100B.%(ext)s',
+        '%(playlist_index&{} - |)s%(title)s [%(duration>%H-%M-%S)s].%(ext)s',
+        '%(formats.:3.format_id)j %(tags.0:5)l %(view_count)D',
+        '%(chapters.-1.title,description)s%(id)s',
+    ]
+
+    def run():
+        for template in templates:
+            ydl_.evaluate_outtmpl(template, info, True)
+    return run
+
+
+@benchmark('m3u8_parse')
+def bench_m3u8_parse():
+    ie = InfoExtractor(ydl())
+    m3u8_doc = read_corpus('master.m3u8')
+    return lambda: ie._parse_m3u8_formats_and_subtitles(
+        m3u8_doc, 'https://cdn.example.com/master.m3u8', ext='mp4', m3u8_id='hls')
+
+
+@benchmark('mpd_parse')
+def bench_mpd_parse():
+    ie = InfoExtractor(ydl())
+    mpd_doc = compat_etree_fromstring(read_corpus('manifest.mpd').encode())
+    return lambda: list(ie._parse_mpd_periods(
+        mpd_doc, mpd_id='dash', mpd_base_url='https://cdn.example.com/', mpd_url='https://cdn.example.com/manifest.mpd'))
+
+
+@benchmark('jsinterp_extract')
+def bench_jsinterp_extract():
+    code = read_corpus('player.js')
+
+    def run():
+        jsi = JSInterpreter(code)
+        jsi.extract_function('sig')
+        jsi.extract_function('nsig')
+    return run
+
+
+@benchmark('jsinterp_sig')
+def bench_jsinterp_sig():
+    func = JSInterpreter(read_corpus('player.js')).extract_function('sig')
+    return lambda: func(['AOq0QJ8wRAIgYKbvT4kZ-jLxiSTRqfCLoNbGhoKNjpcCNhamASxnlE8CIA6Jx1LkJlCp-5ABdeR2hpQ6f8Ow5oT8Bj'])
+
+
+@benchmark('jsinterp_nsig')
+def bench_jsinterp_nsig():
+    func = JSInterpreter(read_corpus('player.js')).extract_function('nsig')
+    return lambda: func(['dY2jHHXNzTr0TKqE'])
+
+
+@benchmark('webvtt_parse')
+def bench_webvtt_parse():
+    data = read_corpus('captions.vtt').encode()
+    return lambda: list(parse_fragment(data))
+
+
+@benchmark('request_dispatch')
+def bench_request_dispatch():
+    class NullRH(RequestHandler):
+        """Answers all requests without any I/O, so that only the dispatch of the requests is timed"""
+        _SUPPORTED_URL_SCHEMES = ('http', 'https')
+        _SUPPORTED_PROXY_SCHEMES = ('http', 'https', 'socks4', 'socks4a', 'socks5', 'socks5h')
+        _VALIDATE_SHAPE_ONLY = True
+
+        def _send(self, request):
+            return Response(io.BytesIO(b''), request.url, {})
+
+    def null_preference(rh, _):
+        return 10000 if isinstance(rh, NullRH) else 0
+    null_preference.shape_only = True
+
+    load_request_handlers()
+    director = ydl().build_request_director([*_REQUEST_HANDLERS.values(), NullRH], [*_RH_PREFERENCES, null_preference])
+    # The requests of the fragments of a download, which only differ by their URL and headers
+    requests = [
+        Request(f'https://cdn.example.com/video/segment{i}.ts', headers={'Range': f'bytes={i * 1000}-{i * 1000 + 999}'})
+        for i in range(100)]
+
+    def run():
+        for request in requests:
+            director.send(request)
+    return run
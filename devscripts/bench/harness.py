@@ -0,0 +1,115 @@
+import functools
+import hashlib
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+
+from devscripts.utils import read_file, run_process
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CORPUS_DIR = os.path.join(BASE_DIR, 'test', 'testdata', 'bench')
+
+RESULTS_VERSION = 1
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register a benchmark. The decorated function does the setup and returns the function to time.
+    The setup is not timed, and should load all the inputs so that nothing is read from disk while timing
+    """
+    def decorator(setup):
+        assert name not in BENCHMARKS, f'Duplicate benchmark {name}'
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+@functools.cache
+def read_corpus(name):
+    return read_file(os.path.join(CORPUS_DIR, name))
+
+
+def corpus_hashes():
+    return {
+        name: hashlib.sha256(read_file(os.path.join(CORPUS_DIR, name)).encode()).hexdigest()
+        for name in sorted(os.listdir(CORPUS_DIR))
+    }
+
+
+def measure(func, rounds, min_time):
+    """Time func like timeit, returning the number of calls per round and the seconds per call of each round"""
+    timer = timeit.Timer(func)
+    # Calibrate the number of calls per round, which also warms up caches
+    loops, elapsed = 1, timer.timeit(1)
+    while elapsed < min_time:
+        loops = min(loops * 10, max(loops + 1, int(loops * min_time * 1.2 / elapsed))) if elapsed else loops * 10
+        elapsed = timer.timeit(loops)
+    return loops, [elapsed / loops for elapsed in timer.repeat(repeat=rounds, number=loops)]
+
+
+def summarize(loops, times):
+    return {
+        'loops': loops,
+        'rounds': len(times),
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def git_commit():
+    try:
+        commit = run_process('git', 'rev-parse', 'HEAD', cwd=BASE_DIR).stdout.strip()
+        dirty = bool(run_process('git', 'status', '--porcelain', '--untracked-files=no', cwd=BASE_DIR).stdout.strip())
+    except Exception:
+        return None
+    return f'{commit}-dirty' if dirty else commit
+
+
+def environment():
+    from yt_dlp.version import __version__
+
+    return {
+        'commit': git_commit(),
+        'yt_dlp_version': __version__,
+        'python': f'{platform.python_implementation()} {platform.python_version()}',
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'corpora': corpus_hashes(),
+    }
+
+
+def run_benchmarks(names, rounds=7, min_time=0.2, log=None):
+    log = log or (lambda msg: print(msg, file=sys.stderr))
+    results = {}
+    for name in names:
+        loops, times = measure(BENCHMARKS[name](), rounds, min_time)
+        results[name] = summarize(loops, times)
+        log(f'{name:<24} {results[name]["median"] * 1000:10.3f} ms '
+            f'(min {results[name]["min"] * 1000:.3f} ms, stdev {results[name]["stdev"] / results[name]["median"]:.1%})')
+    return {'version': RESULTS_VERSION, 'environment': environment(), 'benchmarks': results}
+
+
+def load_results(filename):
+    results = json.loads(read_file(filename))
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError(f'{filename} has unsupported version {results.get("version")}')
+    return results
+
+
+def compare_results(base, new, threshold):
+    """
+    Yield (name, base median, new median, relative change, significant) for the benchmarks in both results.
+    A change is significant if it is above the threshold and well above the noise of both measurements
+    """
+    for name in sorted(base['benchmarks'].keys() & new['benchmarks'].keys()):
+        base_result, new_result = base['benchmarks'][name], new['benchmarks'][name]
+        change = new_result['median'] / base_result['median'] - 1
+        noise = max(result['stdev'] / result['median'] for result in (base_result, new_result))
+        yield name, base_result['median'], new_result['median'], change, abs(change) > max(threshold, 2 * noise)
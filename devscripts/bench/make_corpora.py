@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+import argparse
+import json
+import random
+import string
+
+from devscripts.bench.harness import CORPUS_DIR
+from devscripts.utils import read_file, write_file
+
+# The corpora are generated from a fixed seed so that they can be regenerated identically.
+# They are checked in anyway, so that a change here cannot silently change the benchmark inputs
+
+SEED = 20250721
+
+FORMATS_FILE = os.path.join(os.path.dirname(CORPUS_DIR), 'formats', 'youtube.json')
+
+VIDEO_LADDER = [
+    # (width, height, bandwidth in kbps)
+    (256, 144, 150), (426, 240, 350), (640, 360, 800), (854, 480, 1400), (1280, 720, 2800),
+    (1920, 1080, 5000), (2560, 1440, 9000), (3840, 2160, 17000),
+]
+VIDEO_CODECS = ['avc1.640028', 'avc1.4d401f', 'hvc1.2.4.L123.B0', 'vp09.00.40.08', 'av01.0.08M.08']
+AUDIO_CODECS = ['mp4a.40.2', 'mp4a.40.5', 'ac-3', 'ec-3', 'opus']
+THUMBNAIL_SIZES = [('', 120, 90), ('mq', 320, 180), ('hq', 480, 360), ('sd', 640, 480), ('maxres', 1280, 720)]
+LANGUAGES = ['en', 'es', 'fr', 'de', 'it', 'pt', 'ja', 'ko', 'zh-Hans', 'ru', 'ar', 'hi']
+
+
+def random_id(rng, length=11, alphabet=string.ascii_letters + string.digits + '-_'):
+    return ''.join(rng.choice(alphabet) for _ in range(length))
+
+
+def random_words(rng, count):
+    return ' '.join(
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9)))
+        for _ in range(count))
+
+
+def make_m3u8(rng):
+    """A master playlist with many variants, alternative audio and subtitle renditions"""
+    lines = ['#EXTM3U', '#EXT-X-VERSION:6', '#EXT-X-INDEPENDENT-SEGMENTS', '']
+    for group, codec in enumerate(AUDIO_CODECS[:3], start=1):
+        for i, lang in enumerate(LANGUAGES):
+            lines.append(
+                f'#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aud{group}",LANGUAGE="{lang}",NAME="{lang} ({codec})",'
+                f'AUTOSELECT=YES,DEFAULT={"YES" if i == 0 else "NO"},CHANNELS="{rng.choice((2, 6))}",'
+                f'URI="audio/{codec}/{lang}/prog_index.m3u8"')
+    lines.append('')
+    for i, lang in enumerate(LANGUAGES):
+        lines.append(
+            f'#EXT-X-MEDIA:TYPE=SUBTITLES,GROUP-ID="sub1",LANGUAGE="{lang}",NAME="{lang}",AUTOSELECT=YES,'
+            f'DEFAULT={"YES" if i == 0 else "NO"},FORCED=NO,URI="subtitles/{lang}/prog_index.m3u8"')
+    lines.append('')
+    for video_codec in VIDEO_CODECS:
+        for group, audio_codec in enumerate(AUDIO_CODECS[:3], start=1):
+            for fps in (30, 60):
+                for width, height, kbps in VIDEO_LADDER:
+                    bandwidth = int(kbps * 1000 * (1.5 if fps == 60 else 1) * rng.uniform(0.9, 1.1))
+                    lines.append(
+                        f'#EXT-X-STREAM-INF:AVERAGE-BANDWIDTH={int(bandwidth * 0.9)},BANDWIDTH={bandwidth},'
+                        f'CODECS="{video_codec},{audio_codec}",RESOLUTION={width}x{height},FRAME-RATE={fps:.3f},'
+                        f'CLOSED-CAPTIONS=NONE,AUDIO="aud{group}",SUBTITLES="sub1"')
+                    lines.append(f'video/{video_codec.split(".")[0]}/{height}p{fps}/prog_index.m3u8?token={random_id(rng, 32)}')
+    lines.append('')
+    for width, height, kbps in VIDEO_LADDER:
+        lines.append(
+            f'#EXT-X-I-FRAME-STREAM-INF:BANDWIDTH={kbps * 100},CODECS="avc1.640028",RESOLUTION={width}x{height},'
+            f'URI="iframes/{height}p/iframe_index.m3u8"')
+    return '\n'.join(lines) + '\n'
+
+
+def make_mpd(rng):
+    """A multi-period MPD with long segment timelines"""
+    period_seconds = 1800
+    lines = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" type="static" mediaPresentationDuration="PT2H"'
+        ' minBufferTime="PT4S" profiles="urn:mpeg:dash:profile:isoff-live:2011">',
+        '  <BaseURL>https://cdn.example.com/vod/</BaseURL>',
+    ]
+    for period in range(4):
+        lines.append(f'  <Period id="p{period}" start="PT{period * period_seconds}S" duration="PT{period_seconds}S">')
+        lines.append(f'    <BaseURL>period{period}/</BaseURL>')
+        adaptation_sets = [('video', 'video/mp4', codec) for codec in VIDEO_CODECS[:3]]
+        adaptation_sets += [('audio', 'audio/mp4', codec) for codec in AUDIO_CODECS[:2]]
+        for set_id, (content_type, mime_type, codecs) in enumerate(adaptation_sets):
+            lang = ' lang="en"' if content_type == 'audio' else ''
+            lines.append(
+                f'    <AdaptationSet id="{set_id}" contentType="{content_type}" mimeType="{mime_type}"'
+                f' codecs="{codecs}" segmentAlignment="true" startWithSAP="1"{lang}>')
+            timescale = 90000 if content_type == 'video' else 48000
+            lines.append(
+                f'      <SegmentTemplate timescale="{timescale}" initialization="$RepresentationID$/init.mp4"'
+                f' media="$RepresentationID$/$Time$.m4s">')
+            lines.append('        <SegmentTimeline>')
+            t = 0
+            while t < period_seconds * timescale:
+                duration = int(timescale * rng.choice((2, 2, 2, 4, 6)) * rng.uniform(0.98, 1.02))
+                repeat = rng.randint(0, 3)
+                lines.append(f'          <S t="{t}" d="{duration}" r="{repeat}" />' if t == 0 else f'          <S d="{duration}" r="{repeat}" />')
+                t += duration * (repeat + 1)
+            lines.append('        </SegmentTimeline>')
+            lines.append('      </SegmentTemplate>')
+            if content_type == 'video':
+                for width, height, kbps in VIDEO_LADDER[:6]:
+                    lines.append(
+                        f'      <Representation id="{codecs.split(".")[0]}-{height}" bandwidth="{kbps * 1000}"'
+                        f' width="{width}" height="{height}" frameRate="{rng.choice(("25", "30000/1001", "60"))}" />')
+            else:
+                for kbps in (64, 128, 256):
+                    lines.append(
+                        f'      <Representation id="{codecs.split(".")[0]}-{kbps}" bandwidth="{kbps * 1000}"'
+                        ' audioSamplingRate="48000">')
+                    lines.append(
+                        '        <AudioChannelConfiguration'
+                        ' schemeIdUri="urn:mpeg:dash:23003:3:audio_channel_configuration:2011" value="2" />')
+                    lines.append('      </Representation>')
+            lines.append('    </AdaptationSet>')
+        for lang in LANGUAGES[:4]:
+            lines.append(f'    <AdaptationSet contentType="text" mimeType="text/vtt" lang="{lang}">')
+            lines.append(f'      <Representation id="sub-{lang}" bandwidth="256">')
+            lines.append(f'        <BaseURL>subtitles/{lang}.vtt</BaseURL>')
+            lines.append('      </Representation>')
+            lines.append('    </AdaptationSet>')
+        lines.append('  </Period>')
+    lines.append('</MPD>')
+    return '\n'.join(lines) + '\n'
+
+
+# Functions written like those of YouTube players, for signature and "n" parameter decryption.
+# JSInterpreter has to find them among a lot of unrelated code
+PLAYER_FUNCTIONS = r'''var XY={Ab:function(a,b){a.splice(0,b)},
+cD:function(a){a.reverse()},
+eF:function(a,b){var c=a[0];a[0]=a[b%a.length];a[b%a.length]=c}};
+var sig=function(a){a=a.split("");XY.eF(a,35);XY.cD(a,2);XY.Ab(a,3);XY.eF(a,61);XY.cD(a,48);XY.Ab(a,1);XY.eF(a,12);return a.join("")};
+var nsig=function(a){var b=a.split(""),c=[function(d,e){e=(e%d.length+d.length)%d.length;d.splice(-e).reverse().forEach(function(f){d.unshift(f)})},
+-1512738034,b,function(d){d.reverse()},
+function(d,e){e=(e%d.length+d.length)%d.length;var f=d[0];d[0]=d[e];d[e]=f},
+function(d,e){for(var f=64,h=[];++f-h.length-32;){switch(f){case 58:f=96;continue;case 91:f=44;break;case 65:f=47;continue;case 46:f=153;case 123:f-=58;default:h.push(String.fromCharCode(f))}}
+d.forEach(function(l,m,n){this.push(n[m]=h[(h.indexOf(l)-h.indexOf(this[m])+m-32+f--)%h.length])},e.split(""))},
+"kQ1zr3",function(d,e){d.push(e)},function(d,e){e=(e%d.length+d.length)%d.length;d.splice(e,1)},null,"Xn2p"];
+c[9]=c;try{c[3](c[2]);c[4](c[2],17);c[0](c[2],c[1]);c[5](c[2],c[6]);c[4](c[2],-9);c[8](c[2],43);c[5](c[2],c[10]);
+c[0](c[2],1023);c[3](c[2]);c[4](c[2],c[1]);c[5](c[2],c[6]);c[8](c[2],-3)}catch(g){return"enhanced_except_"+a}
+return b.join("")};
+'''
+
+
+def make_player(rng, filler_functions=1500):
+    """Player JS: the functions to interpret, hidden among filler code"""
+    chunks = ['var _yt_player={};(function(g){var window=this;']
+    position = rng.randrange(filler_functions)
+    for i in range(filler_functions):
+        if i == position:
+            chunks.append(PLAYER_FUNCTIONS)
+        name = random_id(rng, 3, string.ascii_letters)
+        a, b = rng.sample('abcdefhkmnpqrtuvwxyz', 2)
+        chunks.append(rng.choice((
+            f'g.{name}=function({a},{b}){{return {a}.{random_id(rng, 2, string.ascii_letters)}({b},"{random_words(rng, 2)}")}};',
+            f'var {name}{i}=function({a}){{if(!{a})return null;for(var {b}=0;{b}<{a}.length;{b}++)if({a}[{b}]===void 0)return {b};return -1}};',
+            f'g.{name}.prototype.{random_id(rng, 4, string.ascii_letters)}=function(){{this.{a}=[{", ".join(str(rng.randrange(1000)) for _ in range(6))}];return this.{a}.length}};',
+            f'var {name}{i}={{{a}:"{random_words(rng, 3)}",{b}:{rng.randrange(10 ** 6)},isEnabled:!0}};',
+        )))
+    chunks.append('})(_yt_player);')
+    return '\n'.join(chunks) + '\n'
+
+
+def make_js_object(rng, items=600):
+    """A large JavaScript object literal, as found in webpages, that is not valid JSON"""
+    def value(depth):
+        kind = rng.randrange(9 if depth < 3 else 6)
+        if kind == 0:
+            return f"'{random_words(rng, rng.randint(1, 6))}'"
+        elif kind == 1:
+            return f'"{random_words(rng, 3)} \\u00e9\\n"'
+        elif kind == 2:
+            return str(rng.randrange(-10 ** 6, 10 ** 6))
+        elif kind == 3:
+            return f'0x{rng.randrange(16 ** 6):x}'
+        elif kind == 4:
+            return rng.choice(('true', 'false', 'null', 'undefined', '!0', '!1'))
+        elif kind == 5:
+            return f'"https:\\/\\/example.com\\/{random_id(rng)}?v={rng.randrange(1000)}"'
+        elif kind == 6:
+            return '[' + ', '.join(value(depth + 1) for _ in range(rng.randint(0, 5))) + ',]'
+        return obj(depth + 1)
+
+    def obj(depth):
+        keys = ',\n'.join(
+            f'{" " * depth}{rng.choice((random_id(rng, 6, string.ascii_letters), repr(random_words(rng, 1))))}: {value(depth)}'
+            for _ in range(rng.randint(1, 6)))
+        return '{\n' + keys + '\n}'
+
+    entries = ',\n'.join(f'/* item {i} */ {obj(1)}' for i in range(items))
+    return f'{{\n  // generated\n  items: [\n{entries}\n  ],\n  count: {items},\n}}\n'
+
+
+def make_info_dict(rng, formats, copies=4):
+    """An info dict with many formats, subtitles, thumbnails and chapters"""
+    all_formats = []
+    for copy in range(copies):
+        for fmt in formats:
+            fmt = dict(fmt, format_id=f'{fmt["format_id"]}-{copy}', url=f'{fmt["url"]}&copy={copy}')
+            if fmt.get('tbr'):
+                fmt['tbr'] = round(fmt['tbr'] * rng.uniform(0.8, 1.2), 3)
+            if copy % 3 == 1:
+                fmt['language'] = rng.choice(LANGUAGES)
+            all_formats.append(fmt)
+    video_id = random_id(rng)
+    return {
+        'id': video_id,
+        'title': random_words(rng, 8).title(),
+        'description': '\n'.join(random_words(rng, 12) for _ in range(40)),
+        'uploader': random_words(rng, 2).title(),
+        'uploader_id': f'@{random_id(rng, 10)}',
+        'channel_id': f'UC{random_id(rng, 22)}',
+        'upload_date': '20250101',
+        'timestamp': 1735689600,
+        'duration': 3725,
+        'view_count': 123456789,
+        'like_count': 654321,
+        'tags': [random_words(rng, rng.randint(1, 3)) for _ in range(30)],
+        'categories': ['Music'],
+        'webpage_url': f'https://www.youtube.com/watch?v={video_id}',
+        'extractor': 'youtube',
+        'extractor_key': 'Youtube',
+        'formats': all_formats,
+        'thumbnails': [{
+            'url': f'https://i.ytimg.com/vi/{video_id}/{prefix}default.jpg?v={i}',
+            'id': str(i),
+            'preference': -i,
+            'width': width,
+            'height': height,
+        } for i, (prefix, width, height) in enumerate(THUMBNAIL_SIZES * 8)],
+        'subtitles': {lang: [{'ext': ext, 'url': f'https://example.com/subs/{lang}.{ext}'}
+                             for ext in ('vtt', 'ttml', 'srv3', 'json3')] for lang in LANGUAGES},
+        'automatic_captions': {f'{lang}-{src}': [{'ext': 'vtt', 'url': f'https://example.com/asr/{lang}-{src}.vtt'}]
+                               for lang in LANGUAGES for src in LANGUAGES[:8]},
+        'chapters': [{'start_time': i * 60.0, 'end_time': (i + 1) * 60.0, 'title': random_words(rng, 4)}
+                     for i in range(62)],
+        'heatmap': [{'start_time': i * 37.25, 'end_time': (i + 1) * 37.25, 'value': round(rng.random(), 4)}
+                    for i in range(100)],
+    }
+
+
+def make_webvtt(rng, cues=1500):
+    lines = ['WEBVTT', 'Kind: captions', 'Language: en', '']
+    lines += ['STYLE', '::cue(.yellow) { color: yellow; }', '']
+    start = 0
+    for i in range(cues):
+        end = start + rng.randint(800, 4000)
+        lines.append(str(i + 1))
+        lines.append(f'{_vtt_ts(start)} --> {_vtt_ts(end)} align:start position:{rng.randint(0, 20)}%')
+        lines.append(random_words(rng, rng.randint(2, 8)))
+        if rng.random() < 0.5:
+            lines.append(f'<c.yellow>{random_words(rng, rng.randint(1, 5))}</c>')
+        lines.append('')
+        start = end + rng.randint(0, 500)
+    return '\n'.join(lines) + '\n'
+
+
+def _vtt_ts(ms):
+    return f'{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the input corpora of the benchmarks')
+    parser.add_argument(
+        'outdir', nargs='?', default=CORPUS_DIR, help=f'Directory to write the corpora to. Default is {CORPUS_DIR}')
+    outdir = parser.parse_args().outdir
+
+    rng = random.Random(SEED)
+    formats = json.loads(read_file(FORMATS_FILE))
+    corpora = {
+        'master.m3u8': make_m3u8(rng),
+        'manifest.mpd': make_mpd(rng),
+        'player.js': make_player(rng),
+        'webpage_data.js': make_js_object(rng),
+        'info.json': json.dumps(make_info_dict(rng, formats), indent=1, ensure_ascii=False) + '\n',
+        'captions.vtt': make_webvtt(rng),
+    }
+    os.makedirs(outdir, exist_ok=True)
+    for name, content in corpora.items():
+        write_file(os.path.join(outdir, name), content)
+        print(f'Wrote {name} ({len(content.encode()) // 1024} KiB)')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@
 
 from devscripts.utils import get_filename_args, read_file, write_file
 from yt_dlp.extractor import import_extractors
+from yt_dlp.extractor._dispatch import compute_url_keys
 from yt_dlp.extractor.common import InfoExtractor, SearchInfoExtractor
 from yt_dlp.globals import extractors
 
@@ -50,6 +51,7 @@ def main():
         *extra_ie_code(DummyInfoExtractor),
         '\nclass LazyLoadSearchExtractor(LazyLoadExtractor):\n    pass\n',
         *build_ies(list(extractors.value.values()), (InfoExtractor, SearchInfoExtractor), DummyInfoExtractor),
+        *build_url_key_table(list(extractors.value.values())),
     ))
 
     write_file(lazy_extractors_filename, f'{module_src}\n')
@@ -78,6 +80,22 @@ def build_ies(ies, bases, attr_base):
     yield '\n_CLASS_LOOKUP = {%s}' % ', '.join(f'{name!r}: {name}' for name in names)
 
 
+def build_url_key_table(ies):
+    """Map the hosts and prefixes of URLs to the extractors that may match them; see yt_dlp/extractor/_dispatch.py"""
+    table, wildcards = {}, []
+    for ie in ies:
+        keys = compute_url_keys(ie)
+        if keys is None:
+            wildcards.append(ie.__name__)
+        for key in keys or ():
+            table.setdefault(key, []).append(ie.__name__)
+
+    yield '\n_URL_KEY_TABLE = {'
+    yield from (f'    {key!r}: {tuple(names)!r},' for key, names in sorted(table.items()))
+    yield '}'
+    yield f'_URL_KEY_WILDCARDS = {tuple(wildcards)!r}'
+
+
 def sort_ies(ies, ignored_bases):
     """find the correct sorting and add the required base classes so that subclasses can be correctly created"""
     classes, returned_classes = ies[:-1], set()
@@ -9,6 +9,7 @@
 
 
 import http.server
+import tempfile
 import threading
 
 from test.helper import FakeYDL, expect_dict, expect_value, http_server_port
@@ -48,6 +49,13 @@ def do_GET(self):
             self.send_header('Content-Length', str(len(data)))
             self.end_headers()
             self.wfile.write(data)
+        elif self.path == '/cached':
+            self.server.cached_requests += 1
+            self.send_response(200)
+            self.send_header('Content-Length', '6')
+            self.send_header('Cache-Control', 'max-age=60')
+            self.end_headers()
+            self.wfile.write(b'cached')
         else:
             assert False
 
@@ -1950,6 +1958,25 @@ def test_response_with_expected_status_returns_content(self):
             expected_status=TEAPOT_RESPONSE_STATUS)
         self.assertEqual(content, TEAPOT_RESPONSE_BODY)
 
+    def test_http_cache(self):
+        httpd = http.server.HTTPServer(
+            ('127.0.0.1', 0), InfoExtractorTestRequestHandler)
+        httpd.cached_requests = 0
+        port = http_server_port(httpd)
+        server_thread = threading.Thread(target=httpd.serve_forever)
+        server_thread.daemon = True
+        server_thread.start()
+
+        class NoCacheIE(DummyIE):
+            _HTTP_CACHE = False
+
+        with tempfile.TemporaryDirectory() as cachedir:
+            ydl = FakeYDL({'cachedir': cachedir, 'http_cache_size': 1024})
+            for ie in (NoCacheIE(ydl), DummyIE(ydl), DummyIE(ydl)):
+                self.assertEqual(ie._download_webpage(f'http://127.0.0.1:{port}/cached', None), 'cached')
+            ydl.close()
+        self.assertEqual(httpd.cached_requests, 2)
+
     def test_search_nextjs_data(self):
         data = '<script id="__NEXT_DATA__" type="application/json">{"props":{}}</script>'
         self.assertEqual(self.ie._search_nextjs_data(data, None), {'props': {}})
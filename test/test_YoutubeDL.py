@@ -11,9 +11,14 @@
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+import collections
 import contextlib
 import copy
+import io
 import json
+import tempfile
+import threading
+import time
 
 from test.helper import FakeYDL, assertRegexpMatches, try_rm
 from yt_dlp import YoutubeDL
@@ -21,9 +26,13 @@
 from yt_dlp.extractor.common import InfoExtractor
 from yt_dlp.postprocessor.common import PostProcessor
 from yt_dlp.utils import (
+    DownloadError,
     ExtractorError,
+    FormatSorter,
     LazyList,
+    MaxDownloadsReached,
     OnDemandPagedList,
+    SameFileError,
     int_or_none,
     match_filter_func,
 )
@@ -576,6 +585,50 @@ def test_format_filtering(self):
         downloaded_ids = [info['format_id'] for info in ydl.downloaded_info_dicts]
         self.assertEqual(downloaded_ids, ['E', 'D', 'C', 'B'])
 
+    def test_format_selection_compiled(self):
+        with open(os.path.join(os.path.dirname(__file__), 'testdata', 'formats', 'youtube.json'), encoding='utf-8') as f:
+            youtube_formats = json.load(f)
+        specs = (
+            'bestvideo*+bestaudio/best', 'best/bestvideo+bestaudio', 'wv*+wa/w',
+            'bv*[height<=1080][vcodec^=avc1]+ba[ext=m4a]/b[height<=1080]/b',
+            '(bv[fps>30]/bv)+(ba[language=en]/ba)/b',
+            'bv[height<=?720]+ba[acodec~="opus|mp4a"],ba[language!=en]',
+        )
+        expected = {
+            (): ['701+251', '18', '91', '299+140-drc', '701+251', '698+251', '251-de'],
+            ('res:720', 'vcodec:h264', 'acodec:m4a'): [
+                '95', '95', '401+249-de', '95', '298+140-drc', '298+140-drc', '140-drc-de'],
+            ('+size', '+br', 'proto', 'hdr:sdr'): ['394+139', '18', '96', '160+139', '698+139', '394+139', '139-de'],
+        }
+        for format_sort, expected_ids in expected.items():
+            ydl = YDL({'format_sort': list(format_sort)})
+            sorter = FormatSorter(ydl, [])
+            formats = copy.deepcopy(youtube_formats)
+            for f in formats:
+                self.assertEqual(sorter.calculate_preference(f), tuple(
+                    sorter._calculate_field_preference(f, field) for field in sorter._order))
+
+            def select_all():
+                info = {'id': 'test', 'formats': copy.deepcopy(youtube_formats)}
+                ydl.sort_formats(info)
+                return [f['format_id'] for spec in specs
+                        for f in ydl._select_formats(info['formats'], ydl.build_format_selector(spec))]
+
+            self.assertEqual(select_all(), expected_ids, f'Selected formats with {format_sort}')
+            # The format selectors are built once for each spec
+            self.assertLessEqual(set(specs), set(ydl._format_selectors))
+            self.assertIs(ydl.build_format_selector(specs[0]), ydl._format_selectors[specs[0]])
+
+            # The compiled sort keys are computed once per field, and sort the formats like the full preferences
+            field_preferences = sorter._field_preferences
+            self.assertEqual(len(field_preferences), len(sorter._order))
+            sorted_formats = formats[:]
+            sorter.sort(sorted_formats)
+            self.assertIs(sorter._field_preferences, field_preferences)
+            self.assertEqual(
+                [f['format_id'] for f in sorted_formats],
+                [f['format_id'] for f in sorted(formats, key=sorter.calculate_preference)])
+
     @patch('yt_dlp.postprocessor.ffmpeg.FFmpegMergerPP.available', False)
     def test_default_format_spec_without_ffmpeg(self):
         ydl = YDL({})
@@ -951,6 +1004,19 @@ def gen():
         test('%(title3)s', ('foo/bar\\test', 'foo⧸bar⧹test'))
         test('folder/%(title3)s', ('folder/foo/bar\\test', f'folder{os.path.sep}foo⧸bar⧹test'))
 
+    def test_outtmpl_compilation(self):
+        ydl = FakeYDL()
+        tmpl = '%(playlist_index)s - %(title).20B [%(id)s] %(upload_date>%Y-%m-%d)s %(uploader,channel|NA)s.%(ext)s'
+        YoutubeDL._compile_outtmpl.cache_clear()
+        expected = ydl.evaluate_outtmpl(tmpl, self.outtmpl_info)
+        self.assertEqual(ydl.evaluate_outtmpl(tmpl, self.outtmpl_info), expected)
+        self.assertEqual(YoutubeDL._compile_outtmpl.cache_info().hits, 1)
+        # The compiled template is shared by all instances, and other values give other results
+        self.assertEqual(FakeYDL().evaluate_outtmpl(tmpl, self.outtmpl_info), expected)
+        self.assertEqual(YoutubeDL._compile_outtmpl.cache_info()[:2], (2, 1))
+        self.assertNotEqual(ydl.evaluate_outtmpl(tmpl, {**self.outtmpl_info, 'id': 'other'}), expected)
+        self.assertEqual(YoutubeDL._compile_outtmpl.cache_info()[:2], (3, 1))
+
     def test_format_note(self):
         ydl = YoutubeDL()
         self.assertEqual(ydl._format_note({}), '')
@@ -961,6 +1027,41 @@ def test_format_note(self):
             'fps': 30,
         }), r'^30fps$')
 
+    def test_sanitize_info(self):
+        fragments = [{'url': f'https://example.com/{i}.ts', 'duration': 2.0} for i in range(1000)]
+        info = {
+            'id': 'testid', 'title': 'test', 'epoch': 1, '_version': {}, 'description': None,
+            'tags': ('a', 'b'), 'categories': LazyList(iter(['c'])), 'filepath': 'test.mp4',
+            '__private': object(), 'extra': {1, 2} - {2},
+            'formats': [
+                {'format_id': 'hls', 'fragments': fragments, 'http_headers': {'Referer': 'x', 'Cookie': None}},
+                {'format_id': 'http', 'url': 'https://example.com/v.mp4', 'filesize': None},
+            ],
+        }
+        original = copy.deepcopy({k: v for k, v in info.items() if k not in ('categories', '__private')})
+
+        sanitized = YoutubeDL.sanitize_info(info)
+        self.assertIsNot(sanitized, info)
+        self.assertEqual(sanitized['tags'], ['a', 'b'])
+        self.assertEqual(sanitized['categories'], ['c'])
+        self.assertEqual(sanitized['extra'], [1])
+        self.assertIsInstance(sanitized['__private'], str)
+        self.assertIs(sanitized['formats'], info['formats'])
+        json.dumps(sanitized)
+
+        cleaned = YoutubeDL.sanitize_info(info, True)
+        self.assertEqual(cleaned, {
+            'id': 'testid', 'title': 'test', 'epoch': 1, '_version': {}, '_type': 'video',
+            'tags': ['a', 'b'], 'categories': ['c'], 'extra': [1],
+            'formats': [
+                {'format_id': 'hls', 'fragments': fragments, 'http_headers': {'Referer': 'x'}},
+                {'format_id': 'http', 'url': 'https://example.com/v.mp4'},
+            ],
+        })
+        # Unchanged nested values are shared instead of being copied
+        self.assertIs(cleaned['formats'][0]['fragments'], fragments)
+        self.assertEqual({k: v for k, v in info.items() if k in original}, original)
+
     def test_postprocessors(self):
         filename = 'post-processor-testfile.mp4'
         audiofile = filename + '.mp3'
@@ -1193,6 +1294,268 @@ def test_selection(params, expected_ids, evaluate_all=False):
         test_selection({'playlist_items': '-15::2'}, INDICES[1::2], True)
         test_selection({'playlist_items': '-15::15'}, [], True)
 
+    def test_concurrent_entries(self):
+        class ConcurrentYDL(FakeYDL):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.stream = io.StringIO()
+                self.downloaded_ids = []
+
+            def to_screen(self, msg, *args, **kwargs):
+                self._write_string(f'{msg}\n', self.stream)
+
+            def process_info(self, info_dict):
+                # Later entries finish first
+                time.sleep(0.01 * (10 - int(info_dict['id'])))
+                self.to_screen(f'[test] {info_dict["id"]}: playlist_index {info_dict["playlist_index"]}')
+                try:
+                    super().process_info(info_dict)
+                finally:
+                    self.downloaded_ids.append(info_dict['id'])
+
+        def run(params):
+            ydl = ConcurrentYDL({'simulate': True, **params})
+            try:
+                ydl.process_ie_result({
+                    '_type': 'playlist',
+                    'id': 'test',
+                    'extractor': 'test:playlist',
+                    'extractor_key': 'test:playlist',
+                    'webpage_url': 'http://example.com',
+                    'entries': [{'id': str(i), 'title': str(i), 'url': TEST_URL} for i in range(1, 10)],
+                }, download=True)
+            except MaxDownloadsReached:
+                ydl.to_screen('[test] max downloads reached')
+            return ydl
+
+        for params in ({}, {'max_downloads': 3}, {'playlist_items': '2,5:7', 'playlistreverse': True}):
+            sequential = run(params)
+            for num in (2, 4, 10):
+                concurrent = run({**params, 'concurrent_entries': num})
+                self.assertEqual(concurrent.stream.getvalue(), sequential.stream.getvalue(), f'Output for {params}')
+                self.assertCountEqual(concurrent.downloaded_ids, sequential.downloaded_ids, f'Downloads for {params}')
+
+        self.assertIn('[test] 5: playlist_index 5', sequential.stream.getvalue())
+        self.assertEqual(len(run({'max_downloads': 3, 'concurrent_entries': 4}).downloaded_ids), 3)
+
+    def test_concurrent_entries_autonumber(self):
+        class ConcurrentYDL(FakeYDL):
+            filenames = collections.defaultdict(set)
+
+            def prepare_filename(self, info_dict, *args, **kwargs):
+                filename = super().prepare_filename(info_dict, *args, **kwargs)
+                self.filenames[info_dict['id']].add(filename)
+                # Let the other entries start meanwhile
+                time.sleep(0.01)
+                return filename
+
+        ydl = ConcurrentYDL({
+            'simulate': True,
+            'concurrent_entries': 4,
+            'outtmpl': '%(autonumber)s-%(video_autonumber)s-%(id)s.%(ext)s',
+        })
+        ydl.process_ie_result({
+            '_type': 'playlist',
+            'id': 'test',
+            'extractor': 'test:playlist',
+            'extractor_key': 'test:playlist',
+            'webpage_url': 'http://example.com',
+            'entries': [{'id': str(i), 'title': str(i), 'url': TEST_URL, 'ext': 'mp4'} for i in range(1, 9)],
+        }, download=True)
+        filenames = [ydl.filenames[str(i)] for i in range(1, 9)]
+        # Each entry has one filename, and the numbers of the entries are distinct
+        self.assertTrue(all(len(names) == 1 for names in filenames), filenames)
+        names = [next(iter(names)) for names in filenames]
+        self.assertEqual(len({name.split('-')[0] for name in names}), 8, names)
+        self.assertEqual(len({name.split('-')[1] for name in names}), 8, names)
+
+    def test_concurrent_playlists(self):
+        class PlaylistIE(InfoExtractor):
+            _VALID_URL = r'playlist:(?P<id>\w+)'
+
+            def _real_extract(self, url):
+                playlist_id = self._match_id(url)
+                # Let the other URLs start meanwhile
+                time.sleep(0.05)
+                return self.playlist_result([
+                    {'id': playlist_id, 'title': playlist_id, 'url': TEST_URL, 'ext': 'mp4'},
+                    # Recursive playlists are skipped
+                    self.url_result('playlist:shared', PlaylistIE),
+                ], playlist_id, webpage_url='playlist:shared')
+
+        for params in ({}, {'concurrent_urls': 2}, {'concurrent_urls': 2, 'concurrent_entries': 2}):
+            ydl = YDL(params)
+            ydl.add_info_extractor(PlaylistIE(ydl))
+            YoutubeDL.download(ydl, ['playlist:a', 'playlist:b'])
+            # Each URL processes the playlist that the other one is processing at the same time
+            self.assertEqual(sorted(info['id'] for info in ydl.downloaded_info_dicts), ['a', 'b'], params)
+            skipped = [msg for msg in ydl.msgs if 'Skipping already downloaded playlist' in msg]
+            self.assertEqual(len(skipped), 2, params)
+
+    def test_concurrent_urls(self):
+        class ConcurrentYDL(YoutubeDL):
+            def __init__(self, params):
+                super().__init__({'quiet': True, 'outtmpl': '%(id)s', **params}, auto_init=False)
+                self.stream = io.StringIO()
+                self.lock = threading.Lock()
+                self.running, self.max_running = collections.Counter(), collections.Counter()
+
+            def to_screen(self, msg, *args, **kwargs):
+                self._write_string(f'{msg}\n', self.stream)
+
+            to_stderr = to_screen
+
+            def extract_info(self, url, **kwargs):
+                host = url.split('/')[2]
+                with self.lock:
+                    self.running[host] += 1
+                    self.max_running[host] = max(self.max_running[host], self.running[host])
+                try:
+                    # Later URLs finish first
+                    time.sleep(0.01 * (10 - int(url[-1])))
+                    self.to_screen(f'[test] {url}')
+                    if url.endswith('/5'):
+                        self.report_error('failed')
+                finally:
+                    with self.lock:
+                        self.running[host] -= 1
+
+        urls = [f'http://{"ab"[i % 2]}.example.com/{i}' for i in range(1, 10)]
+
+        def run(params):
+            ydl = ConcurrentYDL(params)
+            with contextlib.suppress(DownloadError):
+                ydl.download(urls)
+            return ydl
+
+        for params in ({'ignoreerrors': True}, {}):
+            sequential = run(params)
+            for num in (2, 4):
+                concurrent = run({**params, 'concurrent_urls': num})
+                if params:
+                    self.assertEqual(concurrent.stream.getvalue(), sequential.stream.getvalue())
+                else:
+                    # URLs after the failing one may already have been started
+                    self.assertTrue(concurrent.stream.getvalue().startswith(sequential.stream.getvalue()))
+                self.assertEqual(concurrent._download_retcode, sequential._download_retcode)
+
+        self.assertIn('ERROR: failed\n', sequential.stream.getvalue())
+        self.assertNotIn('/6', sequential.stream.getvalue())
+        ydl = run({'ignoreerrors': True, 'concurrent_urls': 4, 'concurrent_urls_per_site': 1})
+        self.assertEqual(ydl.stream.getvalue(), run({'ignoreerrors': True}).stream.getvalue())
+        self.assertEqual(ydl.max_running, {'a.example.com': 1, 'b.example.com': 1})
+        # The download counter is reset for each URL, so they are processed one at a time
+        ydl = run({'ignoreerrors': True, 'concurrent_urls': 4, 'break_per_url': True})
+        self.assertEqual(ydl.max_running, {'a.example.com': 1, 'b.example.com': 1})
+
+    def test_download_iterable(self):
+        class RecordingYDL(YoutubeDL):
+            def __init__(self, params):
+                super().__init__({'quiet': True, **params}, auto_init=False)
+                self.extracted = []
+
+            def extract_info(self, url, **kwargs):
+                self.extracted.append(url)
+
+        class URLs:
+            def __init__(self, urls):
+                self.urls, self.processed = urls, 0
+
+            def __iter__(self):
+                return iter(self.urls)
+
+            def mark_processed(self):
+                self.processed += 1
+
+        urls = URLs(['a', 'b', 'c'])
+        ydl = RecordingYDL({'outtmpl': '%(id)s'})
+        ydl.download(urls)
+        self.assertEqual(ydl.extracted, ['a', 'b', 'c'])
+        self.assertEqual(urls.processed, 3)
+
+        ydl.download(url for url in ['d'])
+        self.assertEqual(ydl.extracted[-1], 'd')
+        ydl = RecordingYDL({'outtmpl': 'fixed'})
+        with self.assertRaises(SameFileError):
+            ydl.download(url for url in ['a', 'b'])
+        ydl.download(url for url in ['a'])
+        self.assertEqual(ydl.extracted, ['a'])
+
+    def test_reset_job_state(self):
+        with tempfile.TemporaryDirectory(prefix='yt-dlp-archive') as tmpdir:
+            archive_file = os.path.join(tmpdir, 'archive.txt')
+            with open(archive_file, 'w', encoding='utf-8') as f:
+                f.write('youtube a\n')
+            ydl = YDL({'download_archive': archive_file})
+            self.assertEqual(ydl.archive, {'youtube a'})
+            ydl._num_downloads, ydl._num_videos, ydl._download_retcode = 2, 3, 1
+            ydl.report_warning('once', only_once=True)
+            ydl._format_selectors['best'] = object()
+            # Another instance records a download
+            with open(archive_file, 'a', encoding='utf-8') as f:
+                f.write('youtube b\n')
+
+            ydl._reset_job_state()
+            self.assertEqual((ydl._num_downloads, ydl._num_videos, ydl._download_retcode), (0, 0, 0))
+            self.assertEqual((ydl._printed_messages, ydl._format_selectors), (set(), {}))
+            self.assertEqual(ydl.archive, {'youtube a', 'youtube b'})
+            archive = ydl.archive
+            ydl._reset_job_state()
+            self.assertIs(ydl.archive, archive)
+
+    def test_extraction_cache(self):
+        class CachedIE(InfoExtractor):
+            _VALID_URL = r'cached:(?P<id>\w+)'
+            calls = 0
+
+            def _real_extract(self, url):
+                CachedIE.calls += 1
+                video_id = self._match_id(url)
+                self._set_cookie('.example.com', 'session', video_id)
+                expire = {'expiring': int(time.time()) + 2, 'expired': int(time.time()) - 1}.get(video_id)
+                return {
+                    'id': video_id,
+                    'title': video_id,
+                    'formats': [{'url': f'{TEST_URL}?expire={expire}' if expire else TEST_URL}],
+                    'is_live': video_id == 'live',
+                }
+
+        def extract(url, **params):
+            ydl = YDL({'cachedir': cachedir, 'extraction_cache_ttl': 60, **params})
+            ydl.add_info_extractor(CachedIE(ydl))
+            CachedIE.calls = 0
+            info = ydl.extract_info(url, download=False)
+            ydl.close()
+            return info, CachedIE.calls, ydl._extraction_cache_stats, ydl
+
+        def session_cookie(ydl):
+            return ydl.cookiejar.get_cookie_header('https://www.example.com/')
+
+        with tempfile.TemporaryDirectory(prefix='yt-dlp-cache') as cachedir:
+            self.assertEqual(extract('cached:a')[1:3], (1, {'miss': 1}))
+            info, calls, stats, ydl = extract('cached:a')
+            self.assertEqual((calls, stats), (0, {'hit': 1}))
+            self.assertEqual(info['id'], 'a')
+            self.assertEqual(info['webpage_url'], 'cached:a')
+            # The cookies set while extracting are restored from the cache
+            self.assertEqual(session_cookie(ydl), 'session=a')
+            self.assertEqual(extract('cached:a', extractor_args={'cached': {'x': ['y']}})[1], 1)
+            self.assertEqual(extract('cached:a', extraction_cache_ttl=None)[1:3], (1, {}))
+            # Information extracted with other credentials or through another proxy is not reused
+            self.assertEqual(extract('cached:a', username='user', password='pass')[1], 1)
+            self.assertEqual(extract('cached:a', proxy='http://127.0.0.1:1')[1], 1)
+
+            for video_id in ('live', 'expired'):
+                extract(f'cached:{video_id}')
+                self.assertEqual(extract(f'cached:{video_id}')[1], 1, video_id)
+            extract('cached:expiring')
+            self.assertEqual(extract('cached:expiring')[1], 0)
+            time.sleep(2.1)
+            self.assertEqual(extract('cached:expiring')[1], 1)
+
+            YoutubeDL({'cachedir': cachedir, 'quiet': True}).cache.remove('extraction')
+            self.assertEqual(extract('cached:a')[1], 1)
+
     def test_do_not_override_ie_key_in_url_transparent(self):
         ydl = YDL()
 
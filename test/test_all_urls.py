@@ -12,6 +12,14 @@
 
 from test.helper import gettestcases
 from yt_dlp.extractor import FacebookIE, YoutubeIE, gen_extractors
+from yt_dlp.extractor._dispatch import (
+    ExtractorIndex,
+    _generated_url_keys,
+    compute_url_keys,
+    get_url_keys,
+)
+from yt_dlp.extractor.common import UnsupportedURLIE
+from yt_dlp.globals import LAZY_EXTRACTORS
 
 
 class TestAllURLsMatching(unittest.TestCase):
@@ -82,6 +90,32 @@ def test_no_duplicates(self):
                         ie.suitable(url),
                         f'{type(ie).__name__} should not match URL {url!r} . That URL belongs to {tc["name"]}.')
 
+    def test_extractor_index(self):
+        ies = {ie.ie_key(): ie for ie in self.ies}
+        ies['UnsupportedURL'] = UnsupportedURLIE()
+        index = ExtractorIndex(ies)
+
+        def first_match(candidates, url):
+            return next((ie_key for ie_key, ie in candidates if ie.suitable(url)), None)
+
+        urls = [tc['url'] for tc in gettestcases(include_onlymatching=True)]
+        urls.extend((
+            'HTTPS://WWW.YOUTUBE.COM/watch?v=BaW_jenozKc', 'youtube.com/watch?v=BaW_jenozKc',
+            'https://user@www.youtube.com:443/watch?v=BaW_jenozKc', 'https://example.com#.youtube.com/watch',
+            'https://www.yout\u0130be.com/watch?v=BaW_jenozKc', 'ytsearch5:test', 'YTSEARCH:test', ':ytfav', '',
+        ))
+        for url in urls:
+            self.assertEqual(
+                first_match(index.candidates(url), url), first_match(ies.items(), url),
+                f'Indexed extractor lookup differs from linear scan for URL {url!r}')
+
+    @unittest.skipUnless(LAZY_EXTRACTORS.value, 'Lazy extractors are not in use')
+    def test_generated_url_keys(self):
+        self.assertTrue(_generated_url_keys(), 'The URL key table was not generated into lazy_extractors')
+        for ie in self.ies:
+            self.assertEqual(
+                get_url_keys(ie), compute_url_keys(ie), f'Generated URL keys of {ie.ie_key()} are outdated')
+
     def test_keywords(self):
         self.assertMatch(':ytsubs', ['youtube:subscriptions'])
         self.assertMatch(':ytsubscriptions', ['youtube:subscriptions'])
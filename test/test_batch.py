@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import io
+import json
+import tempfile
+
+from yt_dlp.batch import BatchURLs, BloomFilter, ScalableBloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_bloom_filter(self):
+        bloom = BloomFilter(1000)
+        items = [f'https://example.com/{i}' for i in range(1000)]
+        self.assertFalse(any(map(bloom.add, items)))
+        self.assertTrue(all(map(bloom.add, items)))
+        self.assertTrue(all(item in bloom for item in items))
+        false_positives = sum(f'https://example.org/{i}' in bloom for i in range(10000))
+        self.assertLess(false_positives, 3)
+
+    def test_scalable_bloom_filter(self):
+        bloom = ScalableBloomFilter(initial_capacity=1000)
+        items = [f'https://example.com/{i}' for i in range(6000)]
+        self.assertFalse(any(map(bloom.add, items)))
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertEqual(len(bloom._filters), 3)
+        false_positives = sum(f'https://example.org/{i}' in bloom for i in range(10000))
+        self.assertLess(false_positives, 3)
+
+
+class TestBatchURLs(unittest.TestCase):
+    BATCH = b'\xef\xbb\xbfa\n# comment\nb #comment\n\na\nc\n;b\nb\nd\n'
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.batch_file = os.path.join(self.tmpdir.name, 'batch.txt')
+        self.checkpoint_file = os.path.join(self.tmpdir.name, 'checkpoint.json')
+        with open(self.batch_file, 'wb') as f:
+            f.write(self.BATCH)
+
+    def batch_urls(self, urls=(), checkpoint=True, in_archive=lambda url: True):
+        urls = BatchURLs(list(urls), open(self.batch_file, 'rb'), checkpoint and self.checkpoint_file)
+        urls.in_archive = in_archive
+        return urls
+
+    def test_read(self):
+        # Repeated URLs of the batch file are skipped; those given on the command line are not
+        urls = self.batch_urls(['e', 'a'], checkpoint=False)
+        self.assertTrue(urls)
+        self.assertEqual(list(urls), ['a', 'b', 'c', 'd', 'e', 'a'])
+        self.assertEqual((urls.read, urls.duplicates), (6, 2))
+
+        urls = BatchURLs([], io.StringIO(self.BATCH.decode()))
+        urls.in_archive = lambda url: True
+        self.assertEqual(list(urls), ['a', 'b', 'c', 'd'])
+        self.assertFalse(BatchURLs([], io.BytesIO(b'# nothing\n')))
+
+    def test_no_archive(self):
+        # Without the exact check, no URL is skipped
+        urls = self.batch_urls(['a'], checkpoint=False, in_archive=None)
+        self.assertEqual(list(urls), ['a', 'b', 'a', 'c', 'b', 'd', 'a'])
+        self.assertEqual(urls.duplicates, 0)
+
+    def test_false_positive(self):
+        urls = self.batch_urls(checkpoint=False, in_archive=lambda url: False)
+        # Every URL is reported as seen
+        urls._seen.add = lambda url: True
+        self.assertEqual(list(urls), ['a', 'b', 'a', 'c', 'b', 'd'])
+
+    def test_in_archive(self):
+        urls = self.batch_urls(checkpoint=False, in_archive=lambda url: url == 'a')
+        self.assertEqual(list(urls), ['a', 'b', 'c', 'b', 'd'])
+
+    def test_checkpoint(self):
+        urls = self.batch_urls()
+        iterator = iter(urls)
+        self.assertEqual(next(iterator), 'a')
+        self.assertEqual(next(iterator), 'b')
+        urls.mark_processed()
+        urls.close()
+        with open(self.checkpoint_file) as f:
+            self.assertEqual(json.load(f)['line'], 1)
+
+        # Resumes after the last processed URL. URLs before the checkpoint are not
+        # remembered; those that were downloaded are skipped by the download archive
+        urls = self.batch_urls()
+        self.assertEqual(urls.resumed_line, 1)
+        iterator = iter(urls)
+        self.assertEqual(next(iterator), 'b')
+        self.assertEqual(next(iterator), 'a')
+        urls.mark_processed()
+        urls.close()
+        with open(self.checkpoint_file) as f:
+            self.assertEqual(json.load(f)['line'], 3)
+
+        urls = self.batch_urls()
+        self.assertEqual(list(urls), ['a', 'c', 'b', 'd'])
+        for _ in range(3):
+            urls.mark_processed()
+        urls.close()
+        with open(self.checkpoint_file) as f:
+            self.assertEqual(json.load(f)['line'], 8)
+
+        urls = self.batch_urls()
+        self.assertEqual(list(urls), ['d'])
+        urls.mark_processed()
+        urls.close()
+        self.assertFalse(os.path.exists(self.checkpoint_file))
+
+    def test_skipped_lines(self):
+        urls = self.batch_urls()
+        self.assertEqual(list(urls), ['a', 'b', 'c', 'd'])
+        # Duplicates are passed once the URL before them has been processed
+        for expected_line in (1, 5, 8):
+            urls.mark_processed()
+            urls.save_checkpoint()
+            with open(self.checkpoint_file) as f:
+                self.assertEqual(json.load(f)['line'], expected_line)
+
+    def test_line_endings(self):
+        # Like in text mode, lines end at \r, \n or \r\n
+        with open(self.batch_file, 'wb') as f:
+            f.write(b'a\rb\r\nc\n\rd\re')
+        urls = self.batch_urls(in_archive=None)
+        iterator = iter(urls)
+        self.assertEqual([next(iterator) for _ in range(2)], ['a', 'b'])
+        urls.mark_processed()
+        urls.close()
+
+        # The checkpoint is at a line that ends with \r
+        urls = self.batch_urls(in_archive=None)
+        self.assertEqual(urls.resumed_line, 1)
+        self.assertEqual(list(urls), ['b', 'c', 'd', 'e'])
+
+    def test_changed_batch_file(self):
+        urls = self.batch_urls()
+        next(iter(urls))
+        urls.mark_processed()
+        urls.close()
+
+        with open(self.batch_file, 'wb') as f:
+            f.write(b'x\n' + self.BATCH)
+        urls = self.batch_urls()
+        self.assertIsNone(urls.resumed_line)
+        self.assertEqual(list(urls), ['x', 'a', 'b', 'c', 'd'])
+
+
+if __name__ == '__main__':
+    unittest.main()
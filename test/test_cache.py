@@ -9,6 +9,7 @@
 
 
 import shutil
+import time
 
 from test.helper import FakeYDL
 from yt_dlp.cache import Cache
@@ -52,6 +53,20 @@ def test_cache(self):
         self.assertFalse(os.path.exists(self.test_dir))
         self.assertEqual(c.load('test_cache', 'k.'), None)
 
+    def test_cache_expires(self):
+        ydl = FakeYDL({
+            'cachedir': self.test_dir,
+        })
+        c = Cache(ydl)
+        c.store('test_cache', 'valid', 1, expires=time.time() + 60)
+        c.store('test_cache', 'expired', 2, expires=time.time() - 1)
+        c.store('test_cache2', 'k', 3)
+        self.assertEqual(c.load('test_cache', 'valid'), 1)
+        self.assertEqual(c.load('test_cache', 'expired'), None)
+        c.remove('test_cache')
+        self.assertEqual(c.load('test_cache', 'valid'), None)
+        self.assertEqual(c.load('test_cache2', 'k'), 3)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,6 +15,11 @@
 
 rootDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 LAZY_EXTRACTORS = 'yt_dlp/extractor/lazy_extractors.py'
+STARTUP_BUDGET = 1.5  # seconds; generous since this runs on slow and busy machines
+# yt_dlp.cookies, yt_dlp.aes and yt_dlp.utils are needed by every run that sends a request, so they stay eager
+DEFERRED_MODULES = (
+    'asyncio', 'curl_cffi', 'requests', 'urllib3', 'websockets',
+    'yt_dlp.networking._curlcffi', 'yt_dlp.networking._requests', 'yt_dlp.networking._websockets')
 
 
 class TestExecution(unittest.TestCase):
@@ -38,6 +43,32 @@ def test_cmdline_umlauts(self):
         _, stderr = self.run_yt_dlp(opts=('ä', '--version'))
         self.assertFalse(stderr)
 
+    def test_startup(self):
+        code = '\n'.join((
+            'import sys, time',
+            'start = time.perf_counter()',
+            'import yt_dlp',
+            'print(time.perf_counter() - start)',
+            'print(*sys.modules)',
+        ))
+        durations = []
+        for _ in range(3):
+            stdout, _ = self.run_yt_dlp(exe=(sys.executable, '-c', code), opts=())
+            duration, modules = stdout.splitlines()
+            durations.append(float(duration))
+        self.assertLess(min(durations), STARTUP_BUDGET)
+        self.assertFalse(set(modules.split()) & set(DEFERRED_MODULES), 'Slow modules must not be imported eagerly')
+
+    def test_profile_imports(self):
+        stdout, stderr = Popen.run(
+            [sys.executable, '-m', 'yt_dlp', '--ignore-config', '--dump-user-agent'], cwd=rootDir, text=True,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, env={**os.environ, 'YTDLP_PROFILE_IMPORTS': '1'})[:2]
+        self.assertTrue(stdout)
+        self.assertIn('[profile] Startup phases', stderr)
+        self.assertRegex(stderr, r'\[profile\] +[\d.]+ ms  import yt_dlp\n')
+        self.assertRegex(stderr, r'\[profile\] +[\d.]+ ms  parse options\n')
+        self.assertRegex(stderr, r'\[profile\] +[\d.]+ ms +[\d.]+ ms  yt_dlp\.')
+
     def test_lazy_extractors(self):
         try:
             subprocess.check_call([sys.executable, 'devscripts/make_lazy_extractors.py', LAZY_EXTRACTORS],
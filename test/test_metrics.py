@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import json
+import tempfile
+
+from yt_dlp.metrics import Metrics, timer
+from yt_dlp.utils import DownloadCancelled
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def metrics(self, fmt=None):
+        metrics = Metrics(os.path.join(self.tmpdir.name, f'metrics.{fmt or "ndjson"}'), fmt)
+        self.addCleanup(metrics.close)
+        return metrics
+
+    def test_disabled(self):
+        metrics = Metrics()
+        with metrics.url('https://example.com'), metrics.timer('extract'), timer('http'):
+            metrics.count('errors')
+        self.assertFalse(metrics.phases)
+        self.assertFalse(metrics.counters)
+        self.assertFalse(metrics.urls)
+        metrics.close()
+
+    def test_ndjson(self):
+        metrics = self.metrics()
+        with metrics.url('https://example.com/1'):
+            metrics.set_extractor('Example')
+            with metrics.timer('extract'):
+                with timer('http'):
+                    metrics.count('http_requests')
+            with metrics.url('https://example.com/nested'), timer('download'):
+                metrics.set_extractor('Other')
+        with self.assertRaises(DownloadCancelled), metrics.url('https://example.com/2'):
+            raise DownloadCancelled
+        with metrics.url('https://example.com/3'):
+            metrics.count('errors')
+        # Not attributed to any URL
+        with timer('http'):
+            pass
+        metrics.close()
+
+        with open(metrics.filename, encoding='utf-8') as f:
+            records = list(map(json.loads, f))
+        self.assertEqual([r['url'] for r in records], [f'https://example.com/{i}' for i in range(1, 4)])
+        self.assertEqual([r['status'] for r in records], ['ok', 'cancelled', 'error'])
+        self.assertEqual(records[0]['extractor'], 'Example')
+        self.assertEqual({phase: p['calls'] for phase, p in records[0]['phases'].items()},
+                         {'extract': 1, 'http': 1, 'download': 1})
+        self.assertEqual(records[0]['counters'], {'http_requests': 1})
+        self.assertEqual(records[2]['counters'], {'errors': 1})
+        self.assertEqual(metrics.phases['http'][0], 1)
+        self.assertEqual(metrics.urls, {('Example', 'ok'): 1, ('', 'cancelled'): 1, ('', 'error'): 1})
+
+    def test_prometheus(self):
+        metrics = self.metrics('prometheus')
+        with metrics.url('https://example.com/"quoted"'):
+            metrics.set_extractor('Ex"ample')
+            with metrics.timer('extract'):
+                metrics.count('downloaded_bytes', 100)
+        # The file is written after the first URL, then throttled
+        self.assertTrue(os.path.exists(metrics.filename))
+        with metrics.url('https://example.com/2'):
+            metrics.set_extractor('Ex"ample')
+        with open(metrics.filename, encoding='utf-8') as f:
+            self.assertIn('yt_dlp_urls_total{extractor="Ex\\"ample",status="ok"} 1\n', f.read())
+        metrics.close()
+
+        with open(metrics.filename, encoding='utf-8') as f:
+            text = f.read()
+        self.assertEqual(text, metrics.to_prometheus())
+        self.assertIn('# TYPE yt_dlp_phase_seconds_total counter\n', text)
+        self.assertIn('yt_dlp_phase_calls_total{phase="extract"} 1\n', text)
+        self.assertIn('yt_dlp_downloaded_bytes_total 100\n', text)
+        self.assertIn('yt_dlp_urls_total{extractor="Ex\\"ample",status="ok"} 2\n', text)
+        self.assertIn('# TYPE yt_dlp_url_duration_seconds histogram\n', text)
+        self.assertIn('yt_dlp_url_duration_seconds_bucket{extractor="Ex\\"ample",le="0.5"} 2\n', text)
+        self.assertIn('yt_dlp_url_duration_seconds_bucket{extractor="Ex\\"ample",le="+Inf"} 2\n', text)
+        self.assertIn('yt_dlp_url_duration_seconds_count{extractor="Ex\\"ample"} 2\n', text)
+        self.assertEqual(os.listdir(self.tmpdir.name), ['metrics.prometheus'])
+
+    def test_write_error(self):
+        class FakeYDL:
+            def __init__(self):
+                self.warnings = []
+
+            def report_warning(self, message):
+                self.warnings.append(message)
+
+        for fmt in Metrics.FORMATS:
+            ydl = FakeYDL()
+            metrics = Metrics(os.path.join(self.tmpdir.name, 'missing', f'metrics.{fmt}'), fmt, ydl)
+            for url in ('https://example.com/1', 'https://example.com/2'):
+                with metrics.url(url):
+                    metrics.count('errors')
+            metrics.close()
+            # The error is reported once, and the metrics are still collected
+            self.assertEqual(len(ydl.warnings), 1, fmt)
+            self.assertIn('Unable to write metrics', ydl.warnings[0])
+            self.assertEqual(metrics.counters['errors'], 2)
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import asyncio
 import gzip
 import http.client
 import http.cookiejar
@@ -18,6 +19,7 @@
 import logging
 import pathlib
 import random
+import socket
 import ssl
 import tempfile
 import threading
@@ -35,7 +37,7 @@
     verify_address_availability,
 )
 from yt_dlp.cookies import YoutubeDLCookieJar
-from yt_dlp.dependencies import brotli, curl_cffi, requests, urllib3
+from yt_dlp.dependencies import brotli, curl_cffi, requests, urllib3, zstd
 from yt_dlp.networking import (
     HEADRequest,
     PATCHRequest,
@@ -45,7 +47,9 @@
     RequestHandler,
     Response,
 )
-from yt_dlp.networking._urllib import UrllibRH
+from yt_dlp.networking._helper import tls_sessions
+from yt_dlp.networking._urllib import HTTPHandler, UrllibRH
+from yt_dlp.networking.cache import HTTPCache
 from yt_dlp.networking.exceptions import (
     CertificateVerifyError,
     HTTPError,
@@ -61,6 +65,7 @@
     ImpersonateRequestHandler,
     ImpersonateTarget,
 )
+from yt_dlp.networking.ratelimit import HostRateLimiter, parse_retry_after
 from yt_dlp.utils import YoutubeDLError
 from yt_dlp.utils._utils import _YDLLogger as FakeLogger
 from yt_dlp.utils.networking import HTTPHeaderDict, std_headers
@@ -225,6 +230,8 @@ def do_GET(self):
                     payload = gzip.compress(payload, mtime=0)
                 elif encoding == 'deflate':
                     payload = zlib.compress(payload)
+                elif encoding == 'zstd' and zstd:
+                    payload = zstd.compress(payload)
                 elif encoding == 'unsupported':
                     payload = b'raw'
                     break
@@ -236,6 +243,19 @@ def do_GET(self):
             self.send_header('Content-Length', str(len(payload)))
             self.end_headers()
             self.wfile.write(payload)
+        elif self.path == '/content-encoding-stream':
+            # The first part of the body can be decoded before the rest is sent
+            compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+            self.send_response(200)
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for data, flush_mode in ((b'<html>', zlib.Z_SYNC_FLUSH), (b'</html>', zlib.Z_FINISH)):
+                chunk = compressor.compress(data) + compressor.flush(flush_mode)
+                self.wfile.write(f'{len(chunk):x}\r\n'.encode() + chunk + b'\r\n')
+                self.wfile.flush()
+                time.sleep(1)
+            self.wfile.write(b'0\r\n\r\n')
         elif self.path.startswith('/gen_'):
             payload = b'<html></html>'
             self.send_response(int(self.path[len('/gen_'):]))
@@ -310,7 +330,7 @@ def setup_class(cls):
         cls.https_server_thread.start()
 
 
-@pytest.mark.parametrize('handler', ['Urllib', 'Requests', 'CurlCFFI'], indirect=True)
+@pytest.mark.parametrize('handler', ['Urllib', 'Asyncio', 'Requests', 'CurlCFFI'], indirect=True)
 class TestHTTPRequestHandler(TestRequestHandlerBase):
 
     def test_verify_cert(self, handler):
@@ -628,6 +648,28 @@ def test_brotli(self, handler):
             assert res.headers.get('Content-Encoding') == 'br'
             assert res.read() == b'<html><video src="/vid.mp4" /></html>'
 
+    @pytest.mark.skip_handler('CurlCFFI', 'not applicable to curl-cffi')
+    @pytest.mark.skip_handler('Requests', 'depends on the version of urllib3')
+    @pytest.mark.skipif(not zstd, reason='zstd support is not installed')
+    def test_zstd(self, handler):
+        with handler() as rh:
+            res = validate_and_send(
+                rh, Request(
+                    f'http://127.0.0.1:{self.http_port}/content-encoding',
+                    headers={'ytdl-encoding': 'zstd'}))
+            assert res.headers.get('Content-Encoding') == 'zstd'
+            assert res.read() == b'<html><video src="/vid.mp4" /></html>'
+
+    @pytest.mark.skip_handler('CurlCFFI', 'not applicable to curl-cffi')
+    def test_content_encoding_streaming(self, handler):
+        with handler() as rh:
+            res = validate_and_send(rh, Request(f'http://127.0.0.1:{self.http_port}/content-encoding-stream'))
+            start = time.monotonic()
+            # The start of the body is decoded as soon as it is received, rather than once the whole body is
+            assert res.read(6) == b'<html>'
+            assert time.monotonic() - start < 0.9
+            assert res.read() == b'</html>'
+
     def test_deflate(self, handler):
         with handler() as rh:
             res = validate_and_send(
@@ -736,8 +778,32 @@ def test_partial_read_then_full_read(self, handler):
                 assert res.read(0) == b''
                 assert res.read() == b'<video src="/vid.mp4" /></html>'
 
+    def test_timings(self, handler):
+        with handler(verify=False) as rh:
+            res = validate_and_send(rh, Request(f'http://127.0.0.1:{self.http_port}/headers'))
+            timings = res.timings
+            assert timings.connect is not None
+            assert timings.tls is None
+            assert timings.reused is False
+            assert timings.ttfb >= timings.connect
+            assert timings.total is None
+            data = res.read()
+            assert timings.bytes_received == len(data)
+            assert timings.total >= timings.ttfb
+
+            res = validate_and_send(rh, Request(f'https://127.0.0.1:{self.https_port}/headers'))
+            res.close()
+            assert res.timings.reused or res.timings.tls is not None
+            assert res.timings.total is not None
 
-@pytest.mark.parametrize('handler', ['Urllib', 'Requests', 'CurlCFFI'], indirect=True)
+        with handler() as rh:
+            with pytest.raises(HTTPError) as exc_info:
+                validate_and_send(rh, Request(f'http://127.0.0.1:{self.http_port}/gen_404'))
+            assert exc_info.value.response.timings.ttfb is not None
+            exc_info.value.response.close()
+
+
+@pytest.mark.parametrize('handler', ['Urllib', 'Asyncio', 'Requests', 'CurlCFFI'], indirect=True)
 class TestClientCertificate:
     @classmethod
     def setup_class(cls):
@@ -892,6 +958,75 @@ def get_response():
 
         assert get_response().read() == b'<html></html>'
 
+    def test_keep_alive(self, handler):
+        with handler(verify=False) as rh:
+            for i in range(3):
+                res = validate_and_send(rh, Request(f'https://127.0.0.1:{self.https_port}/headers'))
+                assert res.read()
+                assert res.timings.reused is bool(i)
+                assert (res.timings.tls is None) is bool(i)
+
+            # A response closed before its body was read does not give its connection back
+            res = validate_and_send(rh, Request(f'https://127.0.0.1:{self.https_port}/video.html'))
+            assert res.timings.reused is True
+            assert res.read(6) == b'<html>'
+            res.close()
+            res = validate_and_send(rh, Request(f'https://127.0.0.1:{self.https_port}/headers'))
+            assert res.timings.reused is False
+            res.read()
+
+            # Decoded bodies give their connection back once read in full too
+            for encoding in ('gzip', 'gzip', 'deflate'):
+                res = validate_and_send(rh, Request(
+                    f'https://127.0.0.1:{self.https_port}/content-encoding', headers={'ytdl-encoding': encoding}))
+                assert res.read() == b'<html><video src="/vid.mp4" /></html>'
+            assert res.timings.reused is True
+
+            # Connections are only reused for the same host and scheme
+            res = validate_and_send(rh, Request(f'http://127.0.0.1:{self.http_port}/headers'))
+            assert res.timings.reused is False
+            res.read()
+
+            # Connection: close is respected
+            res = validate_and_send(rh, Request(
+                f'http://127.0.0.1:{self.http_port}/headers', headers={'Connection': 'close'}))
+            assert res.timings.reused is True
+            assert b'Connection: close' in res.read()
+            res = validate_and_send(rh, Request(f'http://127.0.0.1:{self.http_port}/headers'))
+            assert res.timings.reused is False
+            res.read()
+
+    def test_keep_alive_dropped_connection(self, handler):
+        req = Request(f'http://127.0.0.1:{self.http_port}/headers')
+        with handler() as rh:
+            res = validate_and_send(rh, req)
+            res.read()
+            # Simulate the connection being dropped while idle
+            opener = rh._get_instance(
+                proxies=rh._get_proxies(req), cookiejar=rh._get_cookiejar(req), legacy_ssl_support=None)
+            http_handler = next(h for h in opener.handlers if isinstance(h, HTTPHandler))
+            for idle in http_handler._pool._idle.values():
+                for conn, _ in idle:
+                    conn.sock.shutdown(socket.SHUT_RDWR)
+            res = validate_and_send(rh, req)
+            assert res.timings.reused is False
+            assert res.read()
+
+    def test_tls_session_resumption(self, handler):
+        # Each request is sent on a new connection, which should resume the TLS session of the previous one
+        tls_sessions.clear()
+        with handler(verify=False) as rh:
+            req = Request(f'https://127.0.0.1:{self.https_port}/video.html', headers={'Connection': 'close'})
+            res = validate_and_send(rh, req)
+            assert res.read()
+            assert (res.timings.tls_handshakes, res.timings.tls_resumed) == (1, 0)
+
+        # Handlers with the same TLS settings share their SSL context, and thus the sessions
+        with handler(verify=False) as rh:
+            res = validate_and_send(rh, req)
+            assert res.read()
+            assert (res.timings.tls_handshakes, res.timings.tls_resumed) == (1, 1)
+
     def test_verify_cert_error_text(self, handler):
         # Check the output of the error message
         with handler() as rh:
@@ -929,6 +1064,54 @@ def test_httplib_validation_errors(self, handler, req, match, version_check):
             assert not isinstance(exc_info.value, TransportError)
 
 
+@pytest.mark.parametrize('handler', ['Asyncio'], indirect=True)
+class TestAsyncioRequestHandler(TestRequestHandlerBase):
+    def test_async_send(self, handler):
+        async def fetch(rh, path):
+            res = await rh.async_send(Request(f'http://127.0.0.1:{self.http_port}{path}'))
+            assert res.timings.ttfb is not None
+            data = await res.async_read(6)
+            return data + await res.async_read()
+
+        async def main():
+            with handler() as rh:
+                return await asyncio.gather(*(fetch(rh, '/video.html') for _ in range(5)))
+
+        assert asyncio.run(main()) == [b'<html><video src="/vid.mp4" /></html>'] * 5
+
+    def test_async_send_keep_alive(self, handler):
+        async def main():
+            with handler() as rh:
+                req = Request(f'http://127.0.0.1:{self.http_port}/video.html')
+                for reused in (False, True):
+                    res = await rh.async_send(req)
+                    assert await res.async_read()
+                    assert res.timings.reused is reused
+
+        asyncio.run(main())
+
+    def test_read_in_event_loop(self, handler):
+        async def main():
+            with handler() as rh:
+                res = await rh.async_send(Request(f'http://127.0.0.1:{self.http_port}/video.html'))
+                with pytest.raises(RuntimeError):
+                    res.read()
+                res.close()
+
+        asyncio.run(main())
+
+    def test_async_send_error(self, handler):
+        async def main():
+            with handler() as rh:
+                with pytest.raises(HTTPError) as exc_info:
+                    await rh.async_send(Request(f'http://127.0.0.1:{self.http_port}/gen_404'))
+                assert exc_info.value.status == 404
+                assert exc_info.value.handler is rh
+                exc_info.value.response.close()
+
+        asyncio.run(main())
+
+
 @pytest.mark.parametrize('handler', ['Requests'], indirect=True)
 class TestRequestsRequestHandler(TestRequestHandlerBase):
     @pytest.mark.parametrize('raised,expected', [
@@ -1214,6 +1397,11 @@ class HTTPSupportedRH(ValidationRH):
             ('file', UnsupportedRequest, {}),
             ('file', False, {'enable_file_urls': True}),
         ]),
+        ('Asyncio', [
+            ('http', False, {}),
+            ('https', False, {}),
+            ('data', UnsupportedRequest, {}),
+        ]),
         ('Requests', [
             ('http', False, {}),
             ('https', False, {}),
@@ -1241,6 +1429,15 @@ class HTTPSupportedRH(ValidationRH):
             ('socks5h', False),
             ('socks', UnsupportedRequest),
         ]),
+        ('Asyncio', 'http', [
+            ('http', False),
+            ('https', UnsupportedRequest),
+            ('socks4', False),
+            ('socks4a', False),
+            ('socks5', False),
+            ('socks5h', False),
+            ('socks', UnsupportedRequest),
+        ]),
         ('Requests', 'http', [
             ('http', False),
             ('https', False),
@@ -1277,6 +1474,10 @@ class HTTPSupportedRH(ValidationRH):
             ('all', 'http', False),
             ('unrelated', 'http', False),
         ]),
+        ('Asyncio', 'http', [
+            ('all', 'http', False),
+            ('unrelated', 'http', False),
+        ]),
         ('Requests', 'http', [
             ('all', 'http', False),
             ('unrelated', 'http', False),
@@ -1307,6 +1508,17 @@ class HTTPSupportedRH(ValidationRH):
             ({'legacy_ssl': 'notabool'}, AssertionError),
             ({'keep_header_casing': True}, UnsupportedRequest),
         ]),
+        ('Asyncio', 'http', [
+            ({'cookiejar': 'notacookiejar'}, AssertionError),
+            ({'cookiejar': YoutubeDLCookieJar()}, False),
+            ({'timeout': 1}, False),
+            ({'timeout': 'notatimeout'}, AssertionError),
+            ({'unsupported': 'value'}, UnsupportedRequest),
+            ({'legacy_ssl': False}, False),
+            ({'legacy_ssl': True}, False),
+            ({'legacy_ssl': 'notabool'}, AssertionError),
+            ({'keep_header_casing': True}, UnsupportedRequest),
+        ]),
         ('Requests', 'http', [
             ({'cookiejar': 'notacookiejar'}, AssertionError),
             ({'cookiejar': YoutubeDLCookieJar()}, False),
@@ -1351,6 +1563,7 @@ class HTTPSupportedRH(ValidationRH):
 
     @pytest.mark.parametrize('handler,fail,scheme', [
         ('Urllib', False, 'http'),
+        ('Asyncio', False, 'http'),
         ('Requests', False, 'http'),
         ('CurlCFFI', False, 'http'),
         ('Websockets', False, 'ws'),
@@ -1361,6 +1574,7 @@ def test_no_proxy(self, handler, fail, scheme):
 
     @pytest.mark.parametrize('handler,scheme', [
         ('Urllib', 'http'),
+        ('Asyncio', 'http'),
         (HTTPSupportedRH, 'http'),
         ('Requests', 'http'),
         ('CurlCFFI', 'http'),
@@ -1373,6 +1587,7 @@ def test_empty_proxy(self, handler, scheme):
     @pytest.mark.parametrize('proxy_url', ['//example.com', 'example.com', '127.0.0.1', '/a/b/c'])
     @pytest.mark.parametrize('handler,scheme', [
         ('Urllib', 'http'),
+        ('Asyncio', 'http'),
         (HTTPSupportedRH, 'http'),
         ('Requests', 'http'),
         ('CurlCFFI', 'http'),
@@ -1431,6 +1646,7 @@ def __init__(self, request):
 
 
 class FakeRH(RequestHandler):
+    _VALIDATE_SHAPE_ONLY = True
 
     def __init__(self, *args, **params):
         self.params = params
@@ -1522,6 +1738,39 @@ def _send(self, request: Request):
         with pytest.raises(NoSupportingHandlers):
             director.send(Request('any://'))
 
+    def test_timings(self):
+        director = RequestDirector(logger=FakeLogger())
+        director.add_handler(FakeRH(logger=FakeLogger()))
+        res = director.send(Request('http://'))
+        assert res.timings.queue is not None
+        assert res.timings.ttfb is not None
+        assert res.read() == b''
+        assert res.timings.bytes_received == 0
+        assert res.timings.total is not None
+        assert set(res.timings.to_dict()) == {
+            'queue', 'dns', 'connect', 'tls', 'ttfb', 'total', 'bytes_received', 'reused',
+            'tls_handshakes', 'tls_resumed'}
+
+    def test_async_send(self):
+        class AsyncRH(FakeRH):
+            async def _async_send(self, request: Request):
+                return Response(fp=io.BytesIO(b'async'), headers={}, url=request.url)
+
+        director = RequestDirector(logger=FakeLogger())
+        director.add_handler(FakeRH(logger=FakeLogger()))
+        # Sync handlers are run in a thread
+        res = asyncio.run(director.async_send(Request('http://')))
+        assert isinstance(res, FakeResponse)
+        assert res.timings.queue is not None
+        assert asyncio.run(res.async_read()) == b''
+        # RequestErrors should passthrough
+        with pytest.raises(SSLError):
+            asyncio.run(director.async_send(Request('ssl://something')))
+
+        # Handlers that support asyncio natively are preferred
+        director.add_handler(AsyncRH(logger=FakeLogger()))
+        assert asyncio.run(director.async_send(Request('http://'))).read() == b'async'
+
     def test_unexpected_error(self):
         director = RequestDirector(logger=FakeLogger())
 
@@ -1562,6 +1811,71 @@ def some_preference(rh, request):
         assert director.send(Request('http://')).read() == b''
         assert director.send(Request('http://', headers={'prefer': '1'})).read() == b'supported'
 
+    def test_handler_cache(self):
+        validated = []
+
+        class SomeRH(RequestHandler):
+            _SUPPORTED_URL_SCHEMES = ['http']
+            _VALIDATE_SHAPE_ONLY = True
+
+            def _validate(self, request):
+                validated.append(request.url)
+                super()._validate(request)
+
+            def _send(self, request: Request):
+                return Response(fp=io.BytesIO(b'supported'), headers={}, url=request.url)
+
+        director = RequestDirector(logger=FakeLogger())
+        director.add_handler(FakeRH(logger=FakeLogger()))
+        director.add_handler(SomeRH(logger=FakeLogger()))
+        some_preference = lambda rh, _: 100 if isinstance(rh, SomeRH) else 0  # noqa: E731
+        some_preference.shape_only = True
+        director.preferences.add(some_preference)
+
+        assert director.send(Request('http://a')).read() == b'supported'
+        assert director.send(Request('http://b')).read() == b'supported'
+        assert validated == ['http://a']
+        # The shape of a request is its scheme, proxies and extensions
+        director.send(Request('HTTP://c'))
+        director.send(Request('http://d', proxies={'all': 'http://proxy'}))
+        director.send(Request('http://e', extensions={'timeout': 1}))
+        director.send(Request('http://f', extensions={'timeout': 1}))
+        assert validated == ['http://a', 'http://d', 'http://e']
+        # Requests that no handler supports
+        director.handlers.pop(FakeRH.RH_KEY)
+        for _ in range(2):
+            with pytest.raises(NoSupportingHandlers, match=r'Unsupported url scheme'):
+                director.send(Request('any://'))
+
+        # Changing handlers or preferences clears the cache
+        other_preference = lambda rh, _: 0  # noqa: E731
+        other_preference.shape_only = True
+        director.preferences.add(other_preference)
+        director.send(Request('http://g'))
+        director.add_handler(FakeRH(logger=FakeLogger()))
+        director.send(Request('http://h'))
+        assert validated == ['http://a', 'http://d', 'http://e', 'any:', 'http://g', 'http://h']
+
+        # Handlers whose validation may depend on other parts of the request disable the cache
+        class HostRH(SomeRH):
+            def _validate(self, request):
+                super()._validate(request)
+                if 'blocked' in request.url:
+                    raise UnsupportedRequest('Blocked host')
+
+        assert not HostRH._VALIDATE_SHAPE_ONLY
+        director.add_handler(HostRH(logger=FakeLogger()))
+        director.send(Request('http://i'))
+        director.send(Request('http://j'))
+        assert validated[-2:] == ['http://i', 'http://j']
+        director.handlers.pop(HostRH.RH_KEY)
+
+        # Preferences that are not marked as shape_only disable the cache
+        director.preferences.add(lambda rh, _: 0)
+        director.send(Request('http://k'))
+        director.send(Request('http://l'))
+        assert validated[-2:] == ['http://k', 'http://l']
+
     def test_close(self, monkeypatch):
         director = RequestDirector(logger=FakeLogger())
         director.add_handler(FakeRH(logger=FakeLogger()))
@@ -1575,6 +1889,284 @@ def mock_close(*args, **kwargs):
         director.close()
         assert called
 
+    def test_http_cache(self, tmp_path):
+        director = RequestDirector(logger=FakeLogger())
+        director.add_handler(FakeRH(logger=FakeLogger()))
+        # The extension is not passed on to the handlers, which would reject it
+        assert director.send(Request('http://', extensions={'http_cache': True})).request.extensions == {}
+
+        director.http_cache = HTTPCache(str(tmp_path), 1024)
+        sent = []
+
+        def send(request):
+            sent.append(request)
+            return Response(io.BytesIO(b'data'), request.url, {'Cache-Control': 'max-age=60'})
+        director._send = send
+        for _ in range(2):
+            assert director.send(Request('http://', extensions={'http_cache': True})).read() == b'data'
+        assert len(sent) == 1
+        assert sent[0].extensions == {}
+        director.send(Request('http://'))
+        assert len(sent) == 2
+
+    def test_rate_limiter(self):
+        director = RequestDirector(logger=FakeLogger())
+        director.add_handler(FakeRH(logger=FakeLogger()))
+        # The extension is not passed on to the handlers, which would reject it
+        assert director.send(Request('http://example.com/', extensions={'rate_limit': (1, 1)})).request.extensions == {}
+
+        director.rate_limiter = HostRateLimiter()
+        response = director.send(Request('http://example.com/', extensions={'rate_limit': (1, 1)}))
+        assert response.fp.request.extensions == {}
+        assert director.rate_limiter.hosts['example.com'].in_flight == 1
+        response.close()
+        assert director.rate_limiter.hosts['example.com'].in_flight == 0
+
+
+class TestHTTPCache:
+    @staticmethod
+    def make_send(responses):
+        """Answer requests with (status, headers, body) from responses, recording the requests"""
+        def send(request):
+            send.requests.append(request)
+            status, headers, body = responses.pop(0)
+            response = Response(io.BytesIO(body), request.url, headers, status=status)
+            if status >= 300:
+                raise HTTPError(response)
+            return response
+        send.requests = []
+        return send
+
+    def test_fresh(self, tmp_path):
+        cache = HTTPCache(str(tmp_path), 1024)
+        send = self.make_send([(200, {'Cache-Control': 'max-age=60', 'Content-Encoding': 'gzip'}, b'data')])
+        response = cache.send(Request('http://example.com/'), send)
+        assert response.extensions['http_cache'] == 'miss'
+        assert response.read() == b'data'
+
+        response = cache.send(Request('http://example.com/'), send)
+        assert response.extensions['http_cache'] == 'hit'
+        assert response.read() == b'data'
+        assert response.status == 200
+        assert response.url == 'http://example.com/'
+        assert response.headers['Cache-Control'] == 'max-age=60'
+        # The body is stored decoded
+        assert 'Content-Encoding' not in response.headers
+        assert response.headers['Content-Length'] == '4'
+        response.close()
+        assert len(send.requests) == 1
+
+        # Requests are keyed by their url and headers
+        with pytest.raises(IndexError):
+            cache.send(Request('http://example.com/', headers={'Authorization': 'x'}), send)
+        with pytest.raises(IndexError):
+            cache.send(Request('http://example.com/other'), send)
+
+    def test_revalidate(self, tmp_path):
+        cache = HTTPCache(str(tmp_path), 1024)
+        send = self.make_send([
+            (200, {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT', 'Cache-Control': 'no-cache'}, b'v1'),
+            (304, {'ETag': '"v1"', 'X-Updated': '1'}, b''),
+            (200, {'ETag': '"v2"', 'Cache-Control': 'no-cache'}, b'v2'),
+            (200, {'ETag': '"v3"', 'Cache-Control': 'no-cache'}, b'v3'),
+        ])
+        assert cache.send(Request('http://example.com/'), send).read() == b'v1'
+        assert 'If-None-Match' not in send.requests[0].headers
+
+        response = cache.send(Request('http://example.com/'), send)
+        assert send.requests[1].headers['If-None-Match'] == '"v1"'
+        assert send.requests[1].headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+        assert response.extensions['http_cache'] == 'revalidated'
+        assert response.headers['X-Updated'] == '1'
+        assert response.read() == b'v1'
+
+        response = cache.send(Request('http://example.com/'), send)
+        assert response.extensions['http_cache'] == 'miss'
+        assert response.read() == b'v2'
+        response = cache.send(Request('http://example.com/'), send)
+        assert send.requests[3].headers['If-None-Match'] == '"v2"'
+        assert response.read() == b'v3'
+
+    def test_not_stored(self, tmp_path):
+        cache = HTTPCache(str(tmp_path), 1024)
+        for headers in (
+            {'Cache-Control': 'no-store, max-age=60'},
+            {'Cache-Control': 'max-age=60', 'Set-Cookie': 'a=b'},
+            {},  # Neither fresh nor revalidatable
+        ):
+            send = self.make_send([(200, headers, b'data')] * 2)
+            assert cache.send(Request('http://example.com/'), send).read() == b'data'
+            assert cache.send(Request('http://example.com/'), send).read() == b'data'
+            assert len(send.requests) == 2
+
+        send = self.make_send([(200, {'Cache-Control': 'max-age=60'}, b'data')] * 5)
+        cache.send(Request('http://example.com/', data=b''), send).read()
+        cache.send(Request('http://example.com/', headers={'Range': 'bytes=0-'}), send).read()
+        # Responses that are not read completely are not stored
+        response = cache.send(Request('http://example.com/'), send)
+        assert response.read(2) == b'da'
+        response.close()
+        cache.send(Request('http://example.com/'), send).read()
+        cache.send(Request('http://example.com/'), send).read()
+        assert len(send.requests) == 4
+        assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
+
+    def test_expired(self, tmp_path):
+        cache = HTTPCache(str(tmp_path), 1024)
+        send = self.make_send([
+            (200, {'Cache-Control': 'max-age=60', 'Age': '60'}, b'data'),
+            (200, {'Date': 'Mon, 01 Jan 2024 00:00:00 GMT', 'Expires': 'Mon, 01 Jan 2024 00:00:00 GMT'}, b'data'),
+            (200, {}, b'data'),
+        ])
+        for _ in range(3):
+            cache.send(Request('http://example.com/'), send).read()
+        assert len(send.requests) == 3
+
+    def test_eviction(self, tmp_path):
+        cache = HTTPCache(str(tmp_path), 1200)
+        send = self.make_send([(200, {'Cache-Control': 'max-age=60'}, b'x' * 200)] * 10)
+        for mtime, path in enumerate(('a', 'b', 'c')):
+            cache.send(Request(f'http://example.com/{path}'), send).read()
+            os.utime(cache._path(cache._key(Request(f'http://example.com/{path}')), 'json'), (mtime, mtime))
+        # Using "a" makes "b" the least recently used
+        cache.send(Request('http://example.com/a'), send).read()
+        assert len(send.requests) == 3
+
+        cache.send(Request('http://example.com/d'), send).read()
+        assert len(send.requests) == 4
+        assert sum(os.path.getsize(os.path.join(tmp_path, name)) for name in os.listdir(tmp_path)) <= 1200
+        cache.send(Request('http://example.com/a'), send).read()
+        assert len(send.requests) == 4
+        cache.send(Request('http://example.com/b'), send).read()
+        assert len(send.requests) == 5
+
+        # Responses larger than the cache are not stored
+        send = self.make_send([(200, {'Cache-Control': 'max-age=60'}, b'x' * 2000)] * 2)
+        cache.send(Request('http://example.com/large'), send).read()
+        cache.send(Request('http://example.com/large'), send).read()
+        assert len(send.requests) == 2
+
+
+class TestHostRateLimiter:
+    @staticmethod
+    def send(request):
+        if request.url.endswith('/429'):
+            raise HTTPError(Response(io.BytesIO(b''), request.url, {'Retry-After': '1'}, status=429))
+        return Response(io.BytesIO(b'data'), request.url, {})
+
+    def test_unlimited(self):
+        limiter = HostRateLimiter()
+        response = limiter.send(Request('http://example.com/'), self.send)
+        assert type(response) is Response
+        with pytest.raises(HTTPError):
+            limiter.send(Request('http://example.com/429'), self.send)
+        assert limiter.hosts == {}
+
+    def test_rate(self):
+        limiter = HostRateLimiter(rate=20)
+        start = time.monotonic()
+        # A burst of 20 requests, then 20 per second
+        for _ in range(25):
+            assert limiter.send(Request('http://example.com/'), self.send).read() == b'data'
+        assert 0.2 <= time.monotonic() - start < 1
+        # Hosts are limited separately
+        start = time.monotonic()
+        limiter.send(Request('http://example.org/'), self.send)
+        assert time.monotonic() - start < 0.1
+        assert set(limiter.hosts) == {'example.com', 'example.org'}
+
+    def test_concurrency(self):
+        limiter = HostRateLimiter(max_requests=1)
+        response = limiter.send(Request('http://example.com/'), self.send)
+        sent = threading.Event()
+        thread = threading.Thread(target=lambda: limiter.send(Request('http://example.com/'), self.send) and sent.set())
+        thread.start()
+        assert not sent.wait(0.2)
+        # The request is in progress until its response has been read
+        assert response.read() == b'data'
+        assert sent.wait(1)
+        thread.join()
+
+        # or it has been closed or garbage collected
+        limiter.send(Request('http://example.com/'), self.send).close()
+        limiter.send(Request('http://example.com/'), self.send)
+        limiter.send(Request('http://example.com/'), self.send)
+        # HEAD requests have no body to read
+        response = limiter.send(HEADRequest('http://example.com/'), self.send)
+        with pytest.raises(HTTPError):
+            limiter.send(Request('http://example.com/429'), self.send)
+        assert limiter.hosts['example.com'].in_flight == 0
+
+    def test_unread_response(self):
+        logger = FakeLogger()
+        limiter = HostRateLimiter(max_requests=1, logger=logger, timeout=0.2)
+        warnings = []
+        logger.warning = warnings.append
+        # A response that is kept without being read or closed does not block the next request forever
+        response = limiter.send(Request('http://example.com/'), self.send)
+        start = time.monotonic()
+        limiter.send(Request('http://example.com/'), self.send).close()
+        assert 0.2 <= time.monotonic() - start < 1
+        assert len(warnings) == 1 and 'Timed out waiting' in warnings[0]
+        # The timeout of the request takes precedence
+        start = time.monotonic()
+        limiter.send(Request('http://example.com/', extensions={'timeout': 0.05}), self.send).close()
+        assert time.monotonic() - start < 0.2
+        response.close()
+        assert limiter.hosts['example.com'].in_flight == 0
+
+    def test_websocket(self):
+        class FakeWebSocketResponse(Response):
+            def send(self, message):
+                pass
+
+            def recv(self):
+                return 'message'
+
+        limiter = HostRateLimiter(max_requests=1)
+        responses = [
+            limiter.send(Request('wss://example.com/'), lambda request: FakeWebSocketResponse(
+                io.BytesIO(b''), request.url, {}, status=101))
+            for _ in range(2)]
+        # WebSocket connections are returned as is and do not hold a slot of the host while they are open
+        assert all(type(response) is FakeWebSocketResponse for response in responses)
+        assert responses[0].recv() == 'message'
+        assert limiter.hosts['example.com'].in_flight == 0
+        limiter.send(Request('https://example.com/'), self.send).close()
+
+    def test_limits(self):
+        limiter = HostRateLimiter()
+        limiter.send(Request('http://example.com/'), self.send, limits=(1, None))
+        start = time.monotonic()
+        # The limits apply to all the following requests to the host
+        limiter.send(Request('http://example.com/'), self.send)
+        assert time.monotonic() - start >= 0.5
+        assert limiter.hosts['example.com'].rate == 1
+
+        # The defaults take precedence
+        limiter = HostRateLimiter(rate=1000, max_requests=2)
+        limiter.send(Request('http://example.com/'), self.send, limits=(1, 1)).close()
+        assert limiter.hosts['example.com'].rate == 1000
+        assert limiter.hosts['example.com'].max_requests == 2
+
+    def test_retry_after(self):
+        logger = FakeLogger()
+        limiter = HostRateLimiter(rate=1000, logger=logger)
+        with pytest.raises(HTTPError):
+            limiter.send(Request('http://example.com/429'), self.send)
+        start = time.monotonic()
+        limiter.send(Request('http://example.org/'), self.send)
+        assert time.monotonic() - start < 0.5
+        limiter.send(Request('http://example.com/'), self.send)
+        assert time.monotonic() - start >= 0.9
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('120') == 120
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT', now=1445412450) == 30
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT', now=1445412510) == 0
+        assert parse_retry_after('invalid') is None
+
 
 # XXX: do we want to move this to test_YoutubeDL.py?
 class TestYoutubeDLNetworking:
@@ -1599,6 +2191,17 @@ def test_proxy(self, proxy, expected, monkeypatch):
         with FakeYDL({'proxy': proxy}) as ydl:
             assert ydl.proxies == expected
 
+    def test_http_cache(self, tmp_path):
+        with FakeYDL({'cachedir': str(tmp_path)}) as ydl:
+            assert ydl.build_request_director([FakeRH]).http_cache is None
+        with FakeYDL({'cachedir': str(tmp_path), 'http_cache_size': 1024}) as ydl:
+            http_cache = ydl.build_request_director([FakeRH]).http_cache
+            assert http_cache.directory == os.path.join(str(tmp_path), 'http')
+            assert http_cache.max_size == 1024
+            assert http_cache.cookiejar is ydl.cookiejar
+        with FakeYDL({'cachedir': False, 'http_cache_size': 1024}) as ydl:
+            assert ydl.build_request_director([FakeRH]).http_cache is None
+
     def test_compat_request(self):
         with FakeRHYDL() as ydl:
             assert ydl.urlopen('test://')
@@ -10,12 +10,18 @@
 
 import io
 import random
+import socket
 import ssl
+import threading
+import time
+import zlib
 
 from yt_dlp.cookies import YoutubeDLCookieJar
 from yt_dlp.dependencies import certifi
 from yt_dlp.networking import Response
 from yt_dlp.networking._helper import (
+    ContentDecoder,
+    DNSCache,
     InstanceStoreMixin,
     add_accept_encoding_header,
     get_redirect_method,
@@ -167,6 +173,125 @@ def test_mixin(self):
         assert mixin._get_instance(t=1234) != m
 
 
+class TestContentDecoder:
+    DATA = b'<html><video src="/vid.mp4" /></html>' * 100
+
+    @staticmethod
+    def decode(content_encoding, data, chunk_size=7):
+        decoder = ContentDecoder(content_encoding)
+        decoded = b''.join(decoder.decompress(data[i:i + chunk_size]) for i in range(0, len(data), chunk_size))
+        return decoded + decoder.flush()
+
+    @staticmethod
+    def gzip(data):
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        return compressor.compress(data) + compressor.flush()
+
+    @staticmethod
+    def raw_deflate(data):
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    def test_encodings(self):
+        assert self.decode('gzip', self.gzip(self.DATA)) == self.DATA
+        assert self.decode('deflate', zlib.compress(self.DATA)) == self.DATA
+        assert self.decode('deflate', self.raw_deflate(self.DATA)) == self.DATA
+        # The encodings are undone in the reverse order
+        assert self.decode('deflate, GZIP', self.gzip(zlib.compress(self.DATA))) == self.DATA
+        assert self.decode('gzip,gzip', self.gzip(self.gzip(self.DATA)), chunk_size=1) == self.DATA
+
+    def test_unsupported_encodings(self):
+        assert not ContentDecoder('')
+        assert not ContentDecoder('identity, unsupported')
+        assert self.decode('unsupported, gzip', self.gzip(self.DATA)) == self.DATA
+
+    def test_gzip_trailing_garbage(self):
+        assert self.decode('gzip', self.gzip(self.DATA) + b'garbage') == self.DATA
+
+    def test_invalid_data(self):
+        with pytest.raises(zlib.error):
+            self.decode('gzip', b'not gzip data')
+
+
+class TestDNSCache:
+    @pytest.fixture
+    def lookups(self, monkeypatch):
+        lookups = []
+
+        def fake_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+            lookups.append(host)
+            if host == 'invalid':
+                raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', port or 0))]
+
+        monkeypatch.setattr(socket, 'getaddrinfo', fake_getaddrinfo)
+        return lookups
+
+    def test_cache(self, lookups):
+        cache = DNSCache(ttl=60)
+        assert cache.get('example.com', 80) is None
+        assert cache.getaddrinfo('example.com', 80, 0, socket.SOCK_STREAM)[0][4] == ('127.0.0.1', 80)
+        # The result is shared by all ports of the host
+        assert cache.getaddrinfo('example.com', 443, 0, socket.SOCK_STREAM)[0][4] == ('127.0.0.1', 443)
+        assert cache.get('example.com', 8080, type=socket.SOCK_STREAM)[0][4] == ('127.0.0.1', 8080)
+        assert lookups == ['example.com']
+
+        cache.clear()
+        cache.getaddrinfo('example.com', 80, 0, socket.SOCK_STREAM)
+        assert lookups == ['example.com', 'example.com']
+
+    def test_ttl(self, lookups):
+        cache = DNSCache(ttl=0.1, negative_ttl=0.1)
+        cache.getaddrinfo('example.com', 80)
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                cache.getaddrinfo('invalid', 80)
+        assert lookups == ['example.com', 'invalid']
+        time.sleep(0.2)
+        cache.getaddrinfo('example.com', 80)
+        with pytest.raises(socket.gaierror):
+            cache.getaddrinfo('invalid', 80)
+        assert lookups == ['example.com', 'invalid'] * 2
+
+    def test_maxsize(self, lookups):
+        cache = DNSCache(maxsize=2)
+        for host in ('a.com', 'b.com', 'a.com', 'c.com'):
+            cache.getaddrinfo(host, 80)
+        assert cache.get('a.com', 80) is not None
+        assert cache.get('b.com', 80) is None
+
+    def test_prefetch(self, lookups):
+        cache = DNSCache()
+        cache.prefetch(['a.com', 'b.com', 'a.com', None, 'invalid'])
+        for _ in range(100):
+            if len(lookups) == 3:
+                break
+            time.sleep(0.01)
+        assert sorted(lookups) == ['a.com', 'b.com', 'invalid']
+        cache.getaddrinfo('a.com', 80, type=socket.SOCK_STREAM)
+        assert len(lookups) == 3
+
+    def test_concurrent_lookups(self, monkeypatch):
+        lookups = []
+        event = threading.Event()
+
+        def slow_getaddrinfo(host, port, *args):
+            lookups.append(host)
+            event.wait()
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', 0))]
+
+        monkeypatch.setattr(socket, 'getaddrinfo', slow_getaddrinfo)
+        cache = DNSCache()
+        threads = [threading.Thread(target=cache.getaddrinfo, args=('example.com', 80)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        event.set()
+        for thread in threads:
+            thread.join()
+        assert lookups == ['example.com']
+
+
 class TestNetworkingExceptions:
 
     @staticmethod
@@ -2,8 +2,11 @@
 import os
 import shutil
 import sys
+import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 TEST_DATA_DIR = Path(os.path.dirname(os.path.abspath(__file__)), 'testdata')
@@ -12,6 +15,7 @@
 
 from yt_dlp.plugins import (
     PACKAGE_NAME,
+    PluginIndex,
     PluginSpec,
     directories,
     load_plugins,
@@ -22,6 +26,7 @@
 from yt_dlp.globals import (
     extractors,
     postprocessors,
+    plugin_cache_dir,
     plugin_dirs,
     plugin_ies,
     plugin_pps,
@@ -49,6 +54,7 @@ def reset_plugins():
     plugin_ies.value = {}
     plugin_pps.value = {}
     plugin_dirs.value = ['default']
+    plugin_cache_dir.value = False
     plugin_specs.value = {}
     all_plugins_loaded.value = False
     # Clearing override plugins is probably difficult
@@ -241,6 +247,62 @@ def test_get_plugin_spec(self):
         self.assertEqual(plugin_specs.value.get('postprocessor'), POSTPROCESSOR_PLUGIN_SPEC)
         self.assertIsNone(plugin_specs.value.get('invalid'))
 
+    def test_plugin_index(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_dir = Path(tmpdir, 'plugins')
+            shutil.copytree(TEST_DATA_DIR / 'plugin_packages', plugin_dir)
+            plugin_cache_dir.value = str(Path(tmpdir, 'cache'))
+            index_file = Path(tmpdir, 'cache', 'plugins', 'index.json')
+            fullname, sources = f'{PACKAGE_NAME}.extractor', [('custom', plugin_dir)]
+
+            def set_old_mtime(path):
+                old = time.time() - 60
+                os.utime(path, (old, old))
+
+            def search(expected_hits, expected_misses):
+                locations = index.search_locations(fullname, sources)
+                self.assertEqual((index.hits, index.misses), (expected_hits, expected_misses))
+                return locations
+
+            set_old_mtime(plugin_dir)
+            index = PluginIndex()
+            expected = [plugin_dir / 'testpackage' / fullname.replace('.', os.sep)]
+            self.assertCountEqual(search(0, 1), expected)
+            self.assertCountEqual(search(1, 1), expected)
+            self.assertTrue(index_file.is_file())
+
+            # A new process uses the saved index without listing the plugin directory
+            index = PluginIndex()
+            with mock.patch.object(Path, 'iterdir', side_effect=AssertionError('plugin directory listed')):
+                self.assertCountEqual(search(1, 0), expected)
+
+            # Adding a plugin package invalidates the index; the change is too recent to be cached
+            zip_path = plugin_dir / 'zipped.zip'
+            shutil.make_archive(str(zip_path)[:-4], 'zip', str(TEST_DATA_DIR / 'zipped_plugins'))
+            expected.append(zip_path / fullname.replace('.', os.sep))
+            self.assertCountEqual(search(1, 1), expected)
+            self.assertCountEqual(search(1, 2), expected)
+
+            set_old_mtime(plugin_dir)
+            set_old_mtime(zip_path)
+            self.assertCountEqual(search(1, 3), expected)
+            with mock.patch('yt_dlp.plugins.dirs_in_zip', side_effect=AssertionError('zip file read')):
+                self.assertCountEqual(search(2, 3), expected)
+
+            # Modified zip files are read again
+            shutil.make_archive(str(zip_path)[:-4], 'zip', str(TEST_DATA_DIR / 'plugin_packages'))
+            set_old_mtime(zip_path)
+            importlib.invalidate_caches()  # the contents of zip files are cached for the process
+            self.assertCountEqual(search(2, 4), expected[:1])
+
+            # The index is not saved when the cache is disabled
+            index_file.unlink()
+            plugin_cache_dir.value = False
+            index = PluginIndex()
+            self.assertCountEqual(search(0, 1), expected[:1])
+            self.assertCountEqual(search(1, 1), expected[:1])
+            self.assertFalse(index_file.exists())
+
 
 if __name__ == '__main__':
     unittest.main()
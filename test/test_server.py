@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import http.server
+import json
+import socket
+import stat
+import tempfile
+import threading
+
+from test.helper import http_server_port
+from yt_dlp.server import (
+    DOWNLOAD_ERROR,
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    JSONRPCServer,
+)
+from yt_dlp.version import __version__
+
+TEST_DATA = b'#' * 1024
+
+
+class HTTPTestRequestHandler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.do_GET(write=False)
+
+    def do_GET(self, write=True):
+        if self.path != '/video.mp4':
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'video/mp4')
+        self.send_header('Content-Length', str(len(TEST_DATA)))
+        self.end_headers()
+        if write:
+            self.wfile.write(TEST_DATA)
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not supported')
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), HTTPTestRequestHandler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{http_server_port(self.httpd)}/video.mp4'
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.server = JSONRPCServer(os.path.join(self.tmpdir.name, 'test.sock'), {
+            'cachedir': False,
+            'paths': {'home': self.tmpdir.name},
+            'outtmpl': {'default': '%(id)s.%(ext)s'},
+        })
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.tmpdir.cleanup()
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.server.server_address)
+        self.addCleanup(sock.close)
+        return sock.makefile('rwb')
+
+    def call(self, conn, method, params=None, id_=1):
+        request = {'jsonrpc': '2.0', 'id': id_, 'method': method}
+        if params is not None:
+            request['params'] = params
+        conn.write(json.dumps(request).encode() + b'\n')
+        conn.flush()
+        notifications = []
+        while True:
+            message = json.loads(conn.readline())
+            if 'method' not in message:
+                return message, notifications
+            self.assertEqual(message['params']['job'], id_)
+            notifications.append(message)
+
+    def test_version(self):
+        response, _ = self.call(self.connect(), 'version')
+        self.assertEqual(response, {'jsonrpc': '2.0', 'id': 1, 'result': {'version': __version__}})
+
+    def test_socket_permissions(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.server.server_address).st_mode), 0o600)
+
+    def test_extract_info(self):
+        conn = self.connect()
+        response, notifications = self.call(conn, 'extract_info', {'url': self.url})
+        self.assertEqual(response['result']['id'], 'video')
+        self.assertEqual(response['result']['ext'], 'mp4')
+        self.assertIn('log', {n['method'] for n in notifications})
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, 'video.mp4')))
+
+        # The YoutubeDL instance is reused by the next job with the same params
+        self.assertEqual(sum(map(len, self.server.pool._idle.values())), 1)
+        response, _ = self.call(conn, 'extract_info', {'url': self.url}, id_='second')
+        self.assertEqual(response['id'], 'second')
+        self.assertEqual(sum(map(len, self.server.pool._idle.values())), 1)
+
+    def test_download(self):
+        conn = self.connect()
+        response, notifications = self.call(conn, 'download', {'urls': [self.url], 'params': {
+            'outtmpl': {'default': 'job.%(ext)s'},
+        }})
+        self.assertEqual(response['result'], {'retcode': 0})
+        with open(os.path.join(self.tmpdir.name, 'job.mp4'), 'rb') as f:
+            self.assertEqual(f.read(), TEST_DATA)
+        progress = [n['params'] for n in notifications if n['method'] == 'progress']
+        self.assertEqual(progress[-1]['status'], 'finished')
+        self.assertEqual(progress[-1]['id'], 'video')
+
+        # Job params do not leak into other jobs
+        response, _ = self.call(conn, 'download', {'urls': self.url})
+        self.assertEqual(response['result'], {'retcode': 0})
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, 'video.mp4')))
+
+    def test_errors(self):
+        conn = self.connect()
+        response, _ = self.call(conn, 'nonexistent')
+        self.assertEqual(response['error']['code'], METHOD_NOT_FOUND)
+        response, _ = self.call(conn, 'download', {'url': self.url})
+        self.assertEqual(response['error']['code'], INVALID_PARAMS)
+        response, notifications = self.call(conn, 'extract_info', {'url': self.url.replace('video', 'missing')})
+        self.assertEqual(response['error']['code'], DOWNLOAD_ERROR)
+        self.assertIn('error', {n['params'].get('level') for n in notifications})
+
+        conn.write(b'{"invalid\n')
+        conn.flush()
+        self.assertEqual(json.loads(conn.readline())['error']['code'], PARSE_ERROR)
+
+        # The connection is still usable after errors
+        response, _ = self.call(conn, 'version')
+        self.assertIn('result', response)
+
+    def test_concurrent_connections(self):
+        results = []
+
+        def job(i):
+            response, _ = self.call(self.connect(), 'extract_info', {'url': self.url}, id_=i)
+            results.append(response['result']['id'])
+
+        threads = [threading.Thread(target=job, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['video'] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -291,6 +291,7 @@ def ctx(request):
 @pytest.mark.parametrize(
     'handler,ctx', [
         ('Urllib', 'http'),
+        ('Asyncio', 'http'),
         ('Requests', 'http'),
         ('Websockets', 'ws'),
         ('CurlCFFI', 'http'),
@@ -366,6 +367,7 @@ def test_timeout(self, handler, ctx):
 @pytest.mark.parametrize(
     'handler,ctx', [
         ('Urllib', 'http'),
+        ('Asyncio', 'http'),
         ('Requests', 'http'),
         ('Websockets', 'ws'),
         ('CurlCFFI', 'http'),
@@ -12,7 +12,10 @@
 import io
 import itertools
 import json
+import operator
 import pickle
+import random
+import re
 import subprocess
 import unittest
 import unittest.mock
@@ -32,6 +35,7 @@
     NO_DEFAULT,
     OnDemandPagedList,
     Popen,
+    SQLiteDownloadArchive,
     age_restricted,
     args_to_str,
     base_url,
@@ -41,6 +45,7 @@
     cli_bool_option,
     cli_option,
     cli_valueless_option,
+    compile_match_str,
     date_from_str,
     datetime_from_str,
     detect_exe_version,
@@ -138,6 +143,86 @@
 )
 
 
+def _reference_match_one(filter_part, dct, incomplete):
+    """ The interpreter that match_str used before compile_match_str, kept unchanged as a test oracle """
+    STRING_OPERATORS = {
+        '*=': operator.contains,
+        '^=': lambda attr, value: attr.startswith(value),
+        '$=': lambda attr, value: attr.endswith(value),
+        '~=': lambda attr, value: re.search(value, attr),
+    }
+    COMPARISON_OPERATORS = {
+        **STRING_OPERATORS,
+        '<=': operator.le,  # "<=" must be defined above "<"
+        '<': operator.lt,
+        '>=': operator.ge,
+        '>': operator.gt,
+        '=': operator.eq,
+    }
+
+    if isinstance(incomplete, bool):
+        is_incomplete = lambda _: incomplete
+    else:
+        is_incomplete = lambda k: k in incomplete
+
+    operator_rex = re.compile(r'''(?x)
+        (?P<key>[a-z_]+)
+        \s*(?P<negation>!\s*)?(?P<op>{})(?P<none_inclusive>\s*\?)?\s*
+        (?:
+            (?P<quote>["\'])(?P<quotedstrval>.+?)(?P=quote)|
+            (?P<strval>.+?)
+        )
+        '''.format('|'.join(map(re.escape, COMPARISON_OPERATORS.keys()))))
+    m = operator_rex.fullmatch(filter_part.strip())
+    if m:
+        m = m.groupdict()
+        unnegated_op = COMPARISON_OPERATORS[m['op']]
+        if m['negation']:
+            op = lambda attr, value: not unnegated_op(attr, value)
+        else:
+            op = unnegated_op
+        comparison_value = m['quotedstrval'] or m['strval']
+        if m['quote']:
+            comparison_value = comparison_value.replace(r'\{}'.format(m['quote']), m['quote'])
+        actual_value = dct.get(m['key'])
+        numeric_comparison = None
+        if isinstance(actual_value, (int, float)):
+            # If the original field is a string and matching comparisonvalue is
+            # a number we should respect the origin of the original field
+            # and process comparison value as a string (see
+            # https://github.com/ytdl-org/youtube-dl/issues/11082)
+            try:
+                numeric_comparison = int(comparison_value)
+            except ValueError:
+                numeric_comparison = parse_filesize(comparison_value)
+                if numeric_comparison is None:
+                    numeric_comparison = parse_filesize(f'{comparison_value}B')
+                if numeric_comparison is None:
+                    numeric_comparison = parse_duration(comparison_value)
+        if numeric_comparison is not None and m['op'] in STRING_OPERATORS:
+            raise ValueError('Operator {} only supports string values!'.format(m['op']))
+        if actual_value is None:
+            return is_incomplete(m['key']) or m['none_inclusive']
+        return op(actual_value, comparison_value if numeric_comparison is None else numeric_comparison)
+
+    UNARY_OPERATORS = {
+        '': lambda v: (v is True) if isinstance(v, bool) else (v is not None),
+        '!': lambda v: (v is False) if isinstance(v, bool) else (v is None),
+    }
+    operator_rex = re.compile(r'''(?x)
+        (?P<op>{})\s*(?P<key>[a-z_]+)
+        '''.format('|'.join(map(re.escape, UNARY_OPERATORS.keys()))))
+    m = operator_rex.fullmatch(filter_part.strip())
+    if m:
+        op = UNARY_OPERATORS[m.group('op')]
+        actual_value = dct.get(m.group('key'))
+        if is_incomplete(m.group('key')) and actual_value is None:
+            return True
+        return op(actual_value)
+
+    raise ValueError(f'Invalid filter part {filter_part!r}')
+
+
 class TestUtil(unittest.TestCase):
     def test_timeconvert(self):
         self.assertTrue(timeconvert('') is None)
@@ -1557,6 +1642,88 @@ def test_match_str(self):
         self.assertTrue(match_str('!x', {'id': 'foo'}, True))
         self.assertFalse(match_str('x', {'id': 'foo'}, False))
 
+    def test_match_str_compiled(self):
+        match = compile_match_str('x >= 1.5M & !is_live & title')
+        self.assertIs(compile_match_str('x >= 1.5M & !is_live & title'), match)
+        self.assertTrue(match({'x': 2000000, 'title': 'a'}))
+        self.assertFalse(match({'x': 1000, 'title': 'a'}))
+        self.assertFalse(match({'x': 2000000, 'title': 'a', 'is_live': True}))
+        self.assertTrue(match({'x': 2000000}, incomplete={'title'}))
+        self.assertFalse(match({'x': 2000000}, incomplete={'is_live'}))
+
+        for filter_str, dct, incomplete, expected in [
+            # Numeric values are parsed as numbers, file sizes or durations when the field is a number
+            ('x = 10', {'x': 10}, False, True),
+            ('x = 10', {'x': '10'}, False, True),
+            ('x > 5KiB', {'x': 6000}, False, True),
+            ('x > 5K', {'x': 4000}, False, False),
+            ('x < 1:30', {'x': 89}, False, True),
+            ('x = 1:30', {'x': '1:30'}, False, True),
+            ('x > abc', {'x': 'abd'}, False, True),
+            # String operators
+            ('x *= 10', {'x': '1100'}, False, True),
+            ('x !^= ab', {'x': 'abc'}, False, False),
+            ('x ~= (?i)^AB', {'x': 'abc'}, False, True),
+            (r"x = 'x\'y'", {'x': "x'y"}, False, True),
+            (r'x = a\&b', {'x': 'a&b'}, False, True),
+            # Missing fields
+            ('x <? 10', {}, False, True),
+            ('x < 10', {}, False, False),
+            ('x < 10', {}, True, True),
+            ('x < 10 & y', {}, {'x'}, False),
+            ('!x', {'x': False}, False, True),
+            ('x', {'x': 0}, False, True),
+            # "==" is "=" followed by a value starting with "="
+            ('x == 1', {'x': 1}, False, False),
+            ('x == 1', {'x': '= 1'}, False, True),
+            # Errors are raised when the part is evaluated
+            ('x *= 10', {'x': 10}, False, ValueError),
+            ('x *= 10', {}, False, False),
+            ('x = 1 & 1', {'x': 1}, False, ValueError),
+            ('x = 1 & 1', {'x': 2}, False, False),
+            ('x ~= [', {'x': 'a'}, False, re.error),
+        ]:
+            with self.subTest(filter_str=filter_str, dct=dct, incomplete=incomplete):
+                if isinstance(expected, bool):
+                    self.assertIs(bool(compile_match_str(filter_str)(dct, incomplete)), expected)
+                    self.assertIs(bool(match_str(filter_str, dct, incomplete)), expected)
+                else:
+                    with self.assertRaises(expected):
+                        compile_match_str(filter_str)(dct, incomplete)
+
+    def test_match_str_fuzz(self):
+        def reference(filter_str, dct, incomplete):
+            return all(
+                _reference_match_one(filter_part.replace(r'\&', '&'), dct, incomplete)
+                for filter_part in re.split(r'(?<!\\)&', filter_str))
+
+        def outcome(func, *args):
+            try:
+                return bool(func(*args))
+            except Exception as e:
+                return type(e), str(e)
+
+        rng = random.Random(0)
+        keys = ['x', 'y', 'is_live', 'title']
+        values = ['0', '10', '1.5', '1M', '1:30', '5KiB', 'abc', '"a b"', "'x\\'y'", 'a\\&b', '(?i)AB', '[', '']
+        field_values = [None, 0, 1, 10, 1.5, 90, 1000000, True, False, '', 'abc', 'a b', 'AB', "x'y", 'a&b', '10', [1]]
+        ops = ['', '!', '*=', '^=', '$=', '~=', '<=', '<', '>=', '>', '=', '!=', '!*=', '<?', '=?', '!~=?', '?', '==']
+
+        def random_part():
+            if rng.random() < 0.2:
+                return rng.choice(['', '!']) + rng.choice([*keys, 'X', '1'])
+            return '{}{}{}{}'.format(
+                rng.choice(keys), rng.choice(['', ' ']), rng.choice(ops), rng.choice(values))
+
+        for _ in range(5000):
+            filter_str = ' & '.join(random_part() for _ in range(rng.randint(1, 3)))
+            dct = {k: rng.choice(field_values) for k in keys if rng.random() < 0.7}
+            incomplete = rng.choice([False, True, set(rng.sample(keys, 2))])
+            self.assertEqual(
+                outcome(compile_match_str(filter_str), dct, incomplete),
+                outcome(reference, filter_str, dct, incomplete),
+                f'{filter_str!r} with {dct!r}, incomplete={incomplete!r}')
+
     def test_parse_dfxp_time_expr(self):
         self.assertEqual(parse_dfxp_time_expr(None), None)
         self.assertEqual(parse_dfxp_time_expr(''), None)
@@ -2008,6 +2175,40 @@ def test_locked_file(self):
             with contextlib.suppress(OSError):
                 os.remove(FILE)
 
+    def test_sqlite_download_archive(self):
+        TEXT_FILE, DB_FILE = 'test_sqlite_archive.txt', 'test_sqlite_archive.sqlite'
+        try:
+            self.assertTrue(SQLiteDownloadArchive.is_database(DB_FILE))
+            self.assertFalse(SQLiteDownloadArchive.is_database(TEXT_FILE))
+            with open(TEXT_FILE, 'w', encoding='utf-8') as f:
+                f.write('youtube abc\n\nyoutube def\nvimeo 123\n')
+
+            archive = SQLiteDownloadArchive(DB_FILE)
+            archive.import_text(TEXT_FILE)
+            self.assertIn('youtube abc', archive)
+            self.assertIn('vimeo 123', archive)
+            self.assertNotIn('youtube xyz', archive)
+            self.assertNotIn('', archive)
+            archive.import_text(TEXT_FILE)
+
+            # Changes must be immediately visible to other processes
+            other = SQLiteDownloadArchive(DB_FILE)
+            archive.add('youtube xyz')
+            archive.add('youtube xyz')
+            self.assertIn('youtube xyz', other)
+            other.update(['vimeo 456', 'vimeo 123'])
+            self.assertIn('vimeo 456', archive)
+            other.close()
+            archive.close()
+
+            self.assertTrue(SQLiteDownloadArchive.is_database(DB_FILE))
+            os.rename(DB_FILE, f'{DB_FILE}.bak')
+            self.assertTrue(SQLiteDownloadArchive.is_database(f'{DB_FILE}.bak'))
+        finally:
+            for fn in (TEXT_FILE, DB_FILE, f'{DB_FILE}.bak', f'{DB_FILE}-wal', f'{DB_FILE}-shm'):
+                with contextlib.suppress(OSError):
+                    os.remove(fn)
+
     def test_determine_file_encoding(self):
         self.assertEqual(determine_file_encoding(b''), (None, 0))
         self.assertEqual(determine_file_encoding(b'--verbose -x --audio-format mkv\n'), (None, 0))
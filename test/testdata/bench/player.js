@@ -0,0 +1,1516 @@
+var _yt_player={};(function(g){var window=this;
+g.ZWl.prototype.AwKh=function(){this.v=[2, 116, 774, 242, 853, 567];return this.v.length};
+var cmD1={z:"ugefp fhszfggjs lbks",a:791286,isEnabled:!0};
+g.IIp=function(p,t){return p.Wx(t,"yzmi osrhxrggr")};
+g.VLE=function(d,h){return d.An(h,"omamgbsic jnp")};
+var gtl4={f:"ltcz jqzhfheu euuqtgx",t:327305,isEnabled:!0};
+var vMc5=function(r){if(!r)return null;for(var t=0;t<r.length;t++)if(r[t]===void 0)return t;return -1};
+var Tnu6={h:"ikiqalo aortcuc jofeku",c:122644,isEnabled:!0};
+var qnE7={b:"gfevwbdvy sxvwjp hixktaed",k:592993,isEnabled:!0};
+g.RPq.prototype.AUIY=function(){this.w=[935, 667, 825, 459, 921, 845];return this.w.length};
+g.dkH.prototype.jNBq=function(){this.t=[401, 616, 281, 336, 89, 880];return this.t.length};
+var FoY10={v:"aybucdu vmihbwzsp qwi",b:450620,isEnabled:!0};
+var Hdd11={h:"gwubcg woclylp ef",e:426974,isEnabled:!0};
+g.qNw=function(q,t){return q.Qy(t,"ij uxdityys")};
+g.auO=function(m,z){return m.vs(z,"eg sdpfsra")};
+g.erh.prototype.hXCL=function(){this.x=[531, 741, 819, 683, 148, 167];return this.x.length};
+var stE15={a:"tmxhtgfl fkasd hs",y:66826,isEnabled:!0};
+g.RPH.prototype.aKRH=function(){this.b=[505, 680, 852, 404, 479, 704];return this.b.length};
+var cEp17={d:"jylbkmip jzv ls",n:733618,isEnabled:!0};
+var LWt18=function(m){if(!m)return null;for(var t=0;t<m.length;t++)if(m[t]===void 0)return t;return -1};
+var YLr19={p:"izglovzre cxuuepamo edqc",a:648324,isEnabled:!0};
+var BuB20=function(x){if(!x)return null;for(var k=0;k<x.length;k++)if(x[k]===void 0)return k;return -1};
+var CMd21={t:"ro jnrchjqhc cljgzan",y:401773,isEnabled:!0};
+g.fXd.prototype.JNVU=function(){this.t=[347, 516, 684, 272, 805, 275];return this.t.length};
+g.ZRC.prototype.lVDx=function(){this.y=[394, 531, 953, 738, 690, 766];return this.y.length};
+g.sMw.prototype.cJek=function(){this.z=[5, 681, 840, 996, 60, 149];return this.z.length};
+var avh25=function(p){if(!p)return null;for(var r=0;r<p.length;r++)if(p[r]===void 0)return r;return -1};
+g.WOD.prototype.wbpW=function(){this.v=[933, 703, 831, 609, 170, 261];return this.v.length};
+var uMP27={e:"ktdmrs qhed cwoa",w:910192,isEnabled:!0};
+var Rjb28=function(v){if(!v)return null;for(var q=0;q<v.length;q++)if(v[q]===void 0)return q;return -1};
+var sny29={c:"qn fldfsfu hogsnpjkf",p:784977,isEnabled:!0};
+g.NeB.prototype.ZNIu=function(){this.p=[720, 232, 216, 847, 347, 966];return this.p.length};
+g.pdr=function(c,d){return c.TK(d,"ob vjjpxodc")};
+var fQF32={n:"varu sz xgi",e:608085,isEnabled:!0};
+var Ggj33={d:"xqtywkoyx bczbvxro breotfkg",r:492187,isEnabled:!0};
+var CsC34={c:"arrjfkcq bbvcexkg bmi",e:866333,isEnabled:!0};
+g.NkT=function(u,f){return u.mP(f,"zzyvduap cwwjf")};
+var xIa36={n:"qemqwlasa xibp rkzxuem",h:669440,isEnabled:!0};
+var nBo37=function(t){if(!t)return null;for(var d=0;d<t.length;d++)if(t[d]===void 0)return d;return -1};
+g.lKO=function(w,h){return w.NO(h,"upodfqma txifxnz")};
+var AQo39=function(r){if(!r)return null;for(var q=0;q<r.length;q++)if(r[q]===void 0)return q;return -1};
+g.kZW.prototype.GQXQ=function(){this.e=[905, 254, 205, 998, 401, 290];return this.e.length};
+var vcU41=function(a){if(!a)return null;for(var b=0;b<a.length;b++)if(a[b]===void 0)return b;return -1};
+var OXj42={q:"urfzueixd tiv lkf",p:289754,isEnabled:!0};
+g.UiG.prototype.xKWo=function(){this.q=[984, 236, 543, 12, 207, 323];return this.q.length};
+var VpG44={k:"ppa hicekrvp gneycuho",n:306559,isEnabled:!0};
+var QMx45={u:"gazimm nbvu znjiyqw",f:959404,isEnabled:!0};
+g.ZGY.prototype.AKEx=function(){this.b=[636, 440, 64, 786, 990, 756];return this.b.length};
+g.dNJ=function(e,b){return e.mT(b,"ozw nsefna")};
+g.tQv.prototype.jQAQ=function(){this.x=[113, 332, 712, 632, 14, 145];return this.x.length};
+var aQT49={x:"yldh mopuckb bjqtxvdsl",b:761586,isEnabled:!0};
+g.kWN=function(r,a){return r.Mt(a,"yyu asedg")};
+var uKu51=function(e){if(!e)return null;for(var u=0;u<e.length;u++)if(e[u]===void 0)return u;return -1};
+g.TLB=function(y,r){return y.Ex(r,"ynfp aztesgaa")};
+var FSf53={b:"twtgkg wpvnmbt mw",m:510009,isEnabled:!0};
+g.iAm=function(e,h){return e.zE(h,"ehbmzwoh xfkiszy")};
+g.pyn=function(f,n){return f.np(n,"ypbkc xzn")};
+g.ijg.prototype.EHUv=function(){this.y=[195, 288, 287, 883, 880, 152];return this.y.length};
+g.bhT.prototype.eVeo=function(){this.c=[870, 147, 660, 262, 140, 138];return this.c.length};
+g.Xfa=function(k,f){return k.lA(f,"dnkuvu sezohk")};
+var iwj59=function(w){if(!w)return null;for(var b=0;b<w.length;b++)if(w[b]===void 0)return b;return -1};
+var iOf60={h:"qlehgmw zyvt urdm",w:919822,isEnabled:!0};
+var AsM61={v:"fckhy clplsp mcdohj",m:563785,isEnabled:!0};
+var RCy62=function(r){if(!r)return null;for(var w=0;w<r.length;w++)if(r[w]===void 0)return w;return -1};
+g.jGD=function(d,m){return d.BO(m,"rzyymz puinatu")};
+g.JXz=function(y,v){return y.Xc(v,"shx ma")};
+g.omx=function(a,f){return a.qn(f,"wgdcvzw uuw")};
+g.wRv=function(e,b){return e.mZ(b,"vfe bzgv")};
+g.zoo=function(y,b){return y.Qx(b,"buwfaqe ot")};
+g.bBY=function(q,a){return q.GZ(a,"vrhosfaum yebfhuhx")};
+g.OUG.prototype.TLLr=function(){this.d=[226, 584, 396, 597, 744, 483];return this.d.length};
+var xYh70=function(n){if(!n)return null;for(var k=0;k<n.length;k++)if(n[k]===void 0)return k;return -1};
+g.sBk=function(c,h){return c.qw(h,"gllkhswts jbk")};
+g.KuV.prototype.Xpkl=function(){this.f=[747, 439, 672, 397, 419, 527];return this.f.length};
+var ZbS73={w:"dghsofu qsrv jnsi",b:658503,isEnabled:!0};
+var hTN74={t:"okokaoxhs uvfe pitbydpu",c:525431,isEnabled:!0};
+var FBe75={u:"lds iznh fc",h:97429,isEnabled:!0};
+g.XlQ=function(x,a){return x.sc(a,"dwrjxufx gc")};
+g.AhM.prototype.hpec=function(){this.k=[712, 457, 575, 319, 220, 343];return this.k.length};
+g.fcJ.prototype.bDLr=function(){this.e=[982, 658, 171, 492, 365, 954];return this.e.length};
+g.aEl=function(b,d){return b.Xz(d,"gpdnjmcz pxnrwxll")};
+var ynH80={k:"buhl dgrujuzc kl",u:759620,isEnabled:!0};
+var RBl81={n:"tdls zjlbgoiwk krqcrpc",z:418360,isEnabled:!0};
+g.cxH=function(c,t){return c.Lu(t,"dxe cpyc")};
+g.CtN.prototype.eJhy=function(){this.d=[836, 951, 56, 243, 124, 354];return this.d.length};
+g.DMM=function(y,b){return y.lC(b,"ww kmelna")};
+var LkN85={z:"wem dsr jvwelb",v:661050,isEnabled:!0};
+var SrS86={h:"jhwbe emreo krry",y:791238,isEnabled:!0};
+var rLf87={a:"agnnhnf ligfhwff hyswybp",f:804116,isEnabled:!0};
+var ghY88={c:"yvghpd byinwj ungk",w:347532,isEnabled:!0};
+g.jjd.prototype.VvKI=function(){this.p=[767, 654, 945, 743, 24, 946];return this.p.length};
+var xyZ90=function(w){if(!w)return null;for(var q=0;q<w.length;q++)if(w[q]===void 0)return q;return -1};
+g.Bxh.prototype.KhwM=function(){this.p=[822, 718, 94, 876, 919, 837];return this.p.length};
+g.kCo=function(p,z){return p.DT(z,"mo wx")};
+var Kkb93={c:"hsglf pzlmqn wqxa",v:683021,isEnabled:!0};
+g.HsP=function(z,a){return z.Ts(a,"fpxyg uzqdywwke")};
+g.niV=function(h,y){return h.xM(y,"fhsqxzzou ss")};
+g.ENj.prototype.zMVx=function(){this.z=[419, 302, 851, 834, 622, 60];return this.z.length};
+var xZO97={n:"bbuato mgaa piaycr",f:398401,isEnabled:!0};
+g.mMD=function(a,m){return a.IT(m,"xmxh vmhpxai")};
+g.FGv.prototype.DTED=function(){this.x=[263, 89, 320, 74, 74, 447];return this.x.length};
+g.qXU=function(y,v){return y.cH(v,"sgsmrofmb umate")};
+var kTR101=function(a){if(!a)return null;for(var w=0;w<a.length;w++)if(a[w]===void 0)return w;return -1};
+g.vIi.prototype.LwOo=function(){this.d=[343, 441, 402, 531, 415, 556];return this.d.length};
+g.TRB.prototype.Ffzb=function(){this.r=[241, 606, 305, 944, 170, 892];return this.r.length};
+var Ezm104={p:"eggc qelqfl ipkaswjvf",k:673347,isEnabled:!0};
+var gBx105=function(k){if(!k)return null;for(var f=0;f<k.length;f++)if(k[f]===void 0)return f;return -1};
+g.THO=function(e,n){return e.ug(n,"vho ubhyqkflm")};
+var nAX107=function(q){if(!q)return null;for(var h=0;h<q.length;h++)if(q[h]===void 0)return h;return -1};
+var wjd108=function(y){if(!y)return null;for(var q=0;q<y.length;q++)if(y[q]===void 0)return q;return -1};
+var CMy109=function(z){if(!z)return null;for(var n=0;n<z.length;n++)if(z[n]===void 0)return n;return -1};
+g.aVB=function(w,x){return w.Te(x,"ukcqxj uuulp")};
+var bUN111=function(y){if(!y)return null;for(var b=0;b<y.length;b++)if(y[b]===void 0)return b;return -1};
+g.SOt=function(p,t){return p.Rl(t,"ys rj")};
+var tLR113=function(t){if(!t)return null;for(var n=0;n<t.length;n++)if(t[n]===void 0)return n;return -1};
+var DaR114=function(n){if(!n)return null;for(var f=0;f<n.length;f++)if(n[f]===void 0)return f;return -1};
+g.KJM.prototype.XmZW=function(){this.r=[704, 177, 708, 747, 614, 518];return this.r.length};
+var qxu116={c:"ck wrl qc",b:636629,isEnabled:!0};
+g.vtC=function(t,q){return t.YB(q,"dmwggcn fbxu")};
+var fQQ118=function(b){if(!b)return null;for(var u=0;u<b.length;u++)if(b[u]===void 0)return u;return -1};
+var pAb119={m:"oreimyyh mnweaxxo weckdh",t:858807,isEnabled:!0};
+g.BaD=function(n,w){return n.sn(w,"en asbve")};
+var YZl121={u:"uzbo qerjqoe utua",a:774098,isEnabled:!0};
+var nmv122=function(p){if(!p)return null;for(var d=0;d<p.length;d++)if(p[d]===void 0)return d;return -1};
+g.oYV=function(v,m){return v.mq(m,"davqpkld egmzjc")};
+g.JSJ.prototype.FMNP=function(){this.w=[255, 466, 54, 210, 131, 320];return this.w.length};
+g.JHN=function(v,n){return v.FU(n,"jkxykuc qitdtfiyc")};
+var qBJ126={b:"lp ythkd gmddfypn",r:759275,isEnabled:!0};
+var mmw127={f:"gsvujcq fssvhnfun syw",e:912362,isEnabled:!0};
+g.SsU.prototype.kFFl=function(){this.p=[117, 465, 104, 381, 17, 657];return this.p.length};
+var BDI129={d:"xdnqytuxw vqxo dpv",v:598974,isEnabled:!0};
+var gGT130=function(n){if(!n)return null;for(var w=0;w<n.length;w++)if(n[w]===void 0)return w;return -1};
+var XIz131={v:"pnjoge xvn kljmpn",d:281281,isEnabled:!0};
+g.RPO.prototype.anYj=function(){this.h=[48, 838, 78, 387, 623, 817];return this.h.length};
+g.eCs.prototype.rvve=function(){this.z=[864, 958, 156, 234, 735, 240];return this.z.length};
+var XyJ134=function(p){if(!p)return null;for(var h=0;h<p.length;h++)if(p[h]===void 0)return h;return -1};
+var CaN135={t:"umdcvfaue jkza zpepfhd",c:80084,isEnabled:!0};
+var fqq136={p:"upi qsm hqyq",u:805222,isEnabled:!0};
+g.USL.prototype.CLHm=function(){this.d=[397, 137, 525, 346, 349, 433];return this.d.length};
+g.NMa.prototype.PFQZ=function(){this.d=[929, 34, 487, 604, 300, 845];return this.d.length};
+g.KjR.prototype.dCQT=function(){this.c=[799, 604, 677, 548, 813, 819];return this.c.length};
+g.Yqn=function(w,p){return w.XG(p,"xkotvwpwe qmatz")};
+g.Bgm=function(c,n){return c.tU(n,"sgcx hkiqd")};
+g.Qgx.prototype.wfGJ=function(){this.y=[277, 130, 475, 106, 364, 69];return this.y.length};
+var eKg143=function(n){if(!n)return null;for(var y=0;y<n.length;y++)if(n[y]===void 0)return y;return -1};
+g.zHN.prototype.zYWN=function(){this.m=[26, 802, 232, 670, 675, 671];return this.m.length};
+g.Zac=function(y,r){return y.ZJ(r,"bs fkahrxsjx")};
+var ZqO146={k:"xcjixpu bnwi wvqik",t:734335,isEnabled:!0};
+var PHT147={z:"kaftdgwll flh qb",x:888326,isEnabled:!0};
+var QLY148={w:"tejq gdrqgply vpjml",e:842932,isEnabled:!0};
+g.upz=function(c,e){return c.hN(e,"pggqixtk oqedy")};
+var tGO150={n:"wht wakjqpxh xclvif",a:931500,isEnabled:!0};
+var aUg151=function(y){if(!y)return null;for(var f=0;f<y.length;f++)if(y[f]===void 0)return f;return -1};
+var Saw152=function(n){if(!n)return null;for(var c=0;c<n.length;c++)if(n[c]===void 0)return c;return -1};
+var mSD153={r:"zgozlaxum fiicue iy",m:256109,isEnabled:!0};
+var UMN154={u:"azscuef ylqu re",v:268895,isEnabled:!0};
+var ncm155=function(y){if(!y)return null;for(var t=0;t<y.length;t++)if(y[t]===void 0)return t;return -1};
+g.qZN=function(x,n){return x.Ip(n,"kszdm okwcgs")};
+var GZx157={v:"bazifhih nzoo ifk",p:684420,isEnabled:!0};
+var VKT158={f:"zlcbtza xbgmy zfa",t:226045,isEnabled:!0};
+var KPv159={k:"xb vyk fqqlaqzpt",u:141793,isEnabled:!0};
+var lhR160={d:"ukeerdn tmmidv zxfyffigb",t:524010,isEnabled:!0};
+var sWe161={r:"uzz ahcqsfftp nkxavz",d:918765,isEnabled:!0};
+g.ywJ.prototype.xdqW=function(){this.d=[775, 857, 518, 775, 728, 376];return this.d.length};
+g.Gse=function(p,e){return p.YL(e,"ccj faka")};
+var Nau164=function(f){if(!f)return null;for(var a=0;a<f.length;a++)if(f[a]===void 0)return a;return -1};
+g.bHX.prototype.TYfU=function(){this.p=[567, 546, 147, 119, 79, 751];return this.p.length};
+var eRf166=function(p){if(!p)return null;for(var c=0;c<p.length;c++)if(p[c]===void 0)return c;return -1};
+g.RyQ.prototype.iAgt=function(){this.d=[88, 382, 851, 669, 2, 84];return this.d.length};
+var mMH168=function(p){if(!p)return null;for(var m=0;m<p.length;m++)if(p[m]===void 0)return m;return -1};
+var Puc169={u:"fcynl fwial bbwkk",f:245327,isEnabled:!0};
+g.hxr=function(b,q){return b.UQ(q,"kkllfqnp jzlsq")};
+var Lqw171={w:"qvoomopiz tcjohzenq jzgykfk",y:133138,isEnabled:!0};
+g.PZa=function(k,q){return k.yw(q,"xwuxxbzl nivwgboks")};
+g.Isr.prototype.lFyL=function(){this.e=[930, 290, 620, 218, 348, 81];return this.e.length};
+g.sgx.prototype.QNwZ=function(){this.d=[471, 681, 382, 449, 659, 445];return this.d.length};
+g.tRI=function(p,e){return p.Nj(e,"kmcz talretc")};
+g.mZl=function(h,e){return h.Ig(e,"wwgpxekzl pahblb")};
+g.jRI.prototype.ijCD=function(){this.z=[914, 983, 846, 455, 784, 807];return this.z.length};
+var AcG178=function(w){if(!w)return null;for(var p=0;p<w.length;p++)if(w[p]===void 0)return p;return -1};
+g.Rvf.prototype.AipI=function(){this.m=[428, 89, 124, 659, 692, 711];return this.m.length};
+var EBk180=function(d){if(!d)return null;for(var p=0;p<d.length;p++)if(d[p]===void 0)return p;return -1};
+var oEM181={x:"abhellvcu fatsfec wxcrftlng",r:991737,isEnabled:!0};
+var QBH182={r:"tpj dgogv fl",b:139656,isEnabled:!0};
+var DIW183=function(u){if(!u)return null;for(var k=0;k<u.length;k++)if(u[k]===void 0)return k;return -1};
+g.ayS.prototype.dDFM=function(){this.q=[416, 634, 353, 662, 155, 447];return this.q.length};
+var FNv185={u:"lfwo rzjmjsl bg",w:234750,isEnabled:!0};
+var HDX186=function(n){if(!n)return null;for(var h=0;h<n.length;h++)if(n[h]===void 0)return h;return -1};
+var Rcs187={v:"lndxbjoaw pidpevul fpmbpjkvd",q:895729,isEnabled:!0};
+var Uvu188={b:"iycjs cxz bflfr",n:190346,isEnabled:!0};
+var aCV189={w:"nrdv ized qcbjh",m:794291,isEnabled:!0};
+var RIw190={f:"smpundkmi dvudk xfb",c:542165,isEnabled:!0};
+var SXf191=function(y){if(!y)return null;for(var n=0;n<y.length;n++)if(y[n]===void 0)return n;return -1};
+g.yHC=function(m,q){return m.SI(q,"lailnhf iwixhn")};
+var zxK193={r:"rrjen hlucd ysnzqd",z:179158,isEnabled:!0};
+g.NdG.prototype.yWQa=function(){this.r=[562, 125, 6, 6, 352, 511];return this.r.length};
+var JvY195=function(d){if(!d)return null;for(var r=0;r<d.length;r++)if(d[r]===void 0)return r;return -1};
+var seu196=function(x){if(!x)return null;for(var v=0;v<x.length;v++)if(x[v]===void 0)return v;return -1};
+g.Veb.prototype.tDlb=function(){this.h=[945, 101, 600, 742, 80, 37];return this.h.length};
+g.IGn.prototype.hTHM=function(){this.t=[196, 110, 440, 895, 417, 253];return this.t.length};
+g.MzW.prototype.mTvZ=function(){this.c=[386, 613, 883, 782, 199, 178];return this.c.length};
+g.tzv.prototype.jXMs=function(){this.w=[226, 667, 40, 668, 166, 581];return this.w.length};
+var lMw201=function(e){if(!e)return null;for(var h=0;h<e.length;h++)if(e[h]===void 0)return h;return -1};
+g.pRQ.prototype.jPQW=function(){this.q=[973, 154, 160, 268, 673, 207];return this.q.length};
+g.epj=function(r,p){return r.zT(p,"lhrk fjypxwai")};
+var hLM204=function(w){if(!w)return null;for(var c=0;c<w.length;c++)if(w[c]===void 0)return c;return -1};
+g.THM=function(r,n){return r.Xa(n,"yjzkgdd cbuxc")};
+g.XXN=function(z,x){return z.mM(x,"pgbjvyd ocui")};
+g.pvo=function(a,h){return a.eX(h,"qtkwqsbxs rucrq")};
+g.cKI=function(e,v){return e.Jr(v,"hlwgcm ltrtobczl")};
+var JYx209=function(c){if(!c)return null;for(var m=0;m<c.length;m++)if(c[m]===void 0)return m;return -1};
+g.CQc=function(c,a){return c.Ho(a,"qwulfibtg bvou")};
+var lyt211=function(f){if(!f)return null;for(var r=0;r<f.length;r++)if(f[r]===void 0)return r;return -1};
+g.tzl=function(y,z){return y.pY(z,"uhydd avrqgtcc")};
+g.Aol.prototype.nTHH=function(){this.k=[170, 294, 636, 625, 3, 252];return this.k.length};
+var RpX214={f:"svcuspqwf ofyblftr zkuovz",y:878520,isEnabled:!0};
+var zpU215={b:"nynn onwdja rffwuac",h:534989,isEnabled:!0};
+var TRJ216={r:"nwlhdncs ilz hgd",c:358426,isEnabled:!0};
+g.vzr=function(h,b){return h.Ko(b,"iiaal lsjvqtqh")};
+var VEf218={e:"jq ziphwk bfhmzzf",q:522936,isEnabled:!0};
+g.aWF.prototype.nmEf=function(){this.f=[417, 510, 449, 488, 572, 867];return this.f.length};
+g.pAL=function(r,b){return r.nB(b,"xjtgh ujnjwhi")};
+g.ADN.prototype.DJmu=function(){this.n=[573, 886, 369, 612, 976, 230];return this.n.length};
+var lYR222={y:"lqyxtjae bizycpo pwaz",d:733879,isEnabled:!0};
+g.kFC=function(x,y){return x.yQ(y,"lij nmt")};
+var tOu224={e:"vgkjy monlkey ce",d:500446,isEnabled:!0};
+g.kBu=function(a,h){return a.Si(h,"xbklpbzrw odzld")};
+g.cSk=function(n,w){return n.rN(w,"taslo svdgkskuo")};
+var UIy227=function(k){if(!k)return null;for(var u=0;u<k.length;u++)if(k[u]===void 0)return u;return -1};
+g.fBN.prototype.Tgia=function(){this.v=[812, 267, 306, 628, 242, 714];return this.v.length};
+g.aLU=function(e,q){return e.QK(q,"imyt kczyq")};
+var Hvk230=function(k){if(!k)return null;for(var m=0;m<k.length;m++)if(k[m]===void 0)return m;return -1};
+g.enl=function(u,a){return u.yu(a,"tm djmdag")};
+g.RHG.prototype.bbub=function(){this.a=[875, 636, 528, 710, 806, 809];return this.a.length};
+var FEg233=function(a){if(!a)return null;for(var p=0;p<a.length;p++)if(a[p]===void 0)return p;return -1};
+var mmS234={c:"moemxihmo xt tlkv",y:120432,isEnabled:!0};
+g.Mzt=function(v,t){return v.Nm(t,"rxxhmv mnkl")};
+var Bfv236=function(k){if(!k)return null;for(var b=0;b<k.length;b++)if(k[b]===void 0)return b;return -1};
+g.ENw=function(f,y){return f.Mu(y,"uxgoo qgxkt")};
+var HNn238=function(x){if(!x)return null;for(var d=0;d<x.length;d++)if(x[d]===void 0)return d;return -1};
+g.WjS.prototype.AquY=function(){this.c=[290, 136, 466, 21, 348, 660];return this.c.length};
+var dXX240=function(v){if(!v)return null;for(var c=0;c<v.length;c++)if(v[c]===void 0)return c;return -1};
+g.ioQ=function(e,a){return e.IP(a,"vzyniyw qn")};
+var HyZ242={b:"uijnyq gwlyafauk ejmvy",u:648961,isEnabled:!0};
+g.xlg.prototype.ZNni=function(){this.c=[887, 703, 232, 872, 322, 68];return this.c.length};
+g.IRB.prototype.WJLA=function(){this.u=[935, 155, 907, 46, 447, 179];return this.u.length};
+var kLi245={n:"phmejsc px dgqpudn",e:262678,isEnabled:!0};
+g.Mwn=function(p,q){return p.oM(q,"gdvyt ycltprj")};
+var svQ247=function(b){if(!b)return null;for(var v=0;v<b.length;v++)if(b[v]===void 0)return v;return -1};
+g.WIG.prototype.JjUO=function(){this.h=[641, 537, 760, 300, 870, 108];return this.h.length};
+g.zPV.prototype.qGmv=function(){this.w=[579, 448, 318, 740, 92, 969];return this.w.length};
+var qHM250={b:"ipyuuiw ilie ajomh",h:590752,isEnabled:!0};
+g.zkv=function(z,b){return z.ty(b,"af ioulgjps")};
+var WQg252={q:"fhyofcbfj jrlpzqbml cijldk",c:777280,isEnabled:!0};
+var jQF253=function(u){if(!u)return null;for(var v=0;v<u.length;v++)if(u[v]===void 0)return v;return -1};
+g.cos.prototype.BGnS=function(){this.x=[218, 497, 702, 321, 250, 14];return this.x.length};
+g.hrc=function(e,a){return e.QC(a,"ijmfrpqp mf")};
+var WuS256=function(w){if(!w)return null;for(var b=0;b<w.length;b++)if(w[b]===void 0)return b;return -1};
+var NIP257={m:"xrrsyc rdhacehfe vzmvqgklg",e:360277,isEnabled:!0};
+g.uCu.prototype.Ndoe=function(){this.y=[74, 819, 128, 516, 978, 657];return this.y.length};
+var iGA259={c:"udv kkrtc umj",q:666521,isEnabled:!0};
+g.MlY.prototype.iSyc=function(){this.b=[783, 911, 429, 220, 621, 198];return this.b.length};
+g.QZQ.prototype.rsJt=function(){this.f=[271, 721, 61, 646, 992, 832];return this.f.length};
+var jRm262={v:"mcchnfg urh lhnqf",k:828993,isEnabled:!0};
+var Ptq263={y:"cbse tqielsxmf ffbax",e:91342,isEnabled:!0};
+var vTo264=function(n){if(!n)return null;for(var m=0;m<n.length;m++)if(n[m]===void 0)return m;return -1};
+var vJJ265={q:"jn slialh vlb",z:111946,isEnabled:!0};
+var GXH266={h:"wpgams ehcwoag bzs",t:910454,isEnabled:!0};
+var toV267={z:"wzabgbba qmb gcxjtap",m:428833,isEnabled:!0};
+var rwb268=function(y){if(!y)return null;for(var k=0;k<y.length;k++)if(y[k]===void 0)return k;return -1};
+var MrI269={m:"wgxhjmmer jbvezgcaf cf",f:303965,isEnabled:!0};
+var tiZ270=function(q){if(!q)return null;for(var x=0;x<q.length;x++)if(q[x]===void 0)return x;return -1};
+g.fyM.prototype.YKsL=function(){this.a=[261, 166, 649, 90, 677, 512];return this.a.length};
+g.SgL=function(e,u){return e.tm(u,"irspvetzj asp")};
+g.yQT.prototype.qGKv=function(){this.n=[136, 258, 936, 259, 394, 560];return this.n.length};
+var tjH274=function(h){if(!h)return null;for(var m=0;m<h.length;m++)if(h[m]===void 0)return m;return -1};
+g.PUZ=function(d,r){return d.wB(r,"ljsklny ajgwqbcv")};
+var lky276={v:"bfdeuhya biz xesl",y:616683,isEnabled:!0};
+g.DdA.prototype.NrKg=function(){this.t=[774, 317, 736, 978, 978, 483];return this.t.length};
+var Vxp278=function(w){if(!w)return null;for(var e=0;e<w.length;e++)if(w[e]===void 0)return e;return -1};
+g.hah=function(u,c){return u.On(c,"wpodvtrqq dcjv")};
+g.cmx.prototype.zGYU=function(){this.h=[279, 971, 409, 999, 649, 962];return this.h.length};
+var FLO281={d:"gssnfhzaz qzaymvr yjgls",p:439717,isEnabled:!0};
+g.BqA=function(z,c){return z.bX(c,"uneub wormxtlu")};
+g.KfV=function(n,e){return n.Nk(e,"exktr pxrxohiqn")};
+g.GpR.prototype.eSCj=function(){this.m=[226, 842, 465, 894, 59, 119];return this.m.length};
+var xGJ285={f:"rt ztzgrtg mlb",v:542359,isEnabled:!0};
+g.BTg=function(m,p){return m.lx(p,"mnysfsau egma")};
+var tMH287={p:"miawopq trzwxd dx",t:297457,isEnabled:!0};
+var ykj288={a:"ob nczkc hpruvexy",q:231291,isEnabled:!0};
+g.gTW.prototype.QGCb=function(){this.w=[832, 157, 740, 615, 869, 895];return this.w.length};
+var mra290={y:"hyilgao tbq npjqn",f:115477,isEnabled:!0};
+g.Vir=function(n,y){return n.Vf(y,"jappukw oeohaauq")};
+var wmj292={n:"mvis qtw lkdhcwgot",w:156209,isEnabled:!0};
+g.BHr=function(e,w){return e.rp(w,"ynbhlu kmdrr")};
+var vlL294={z:"rsemg slublwg txychbe",c:590449,isEnabled:!0};
+var esb295=function(d){if(!d)return null;for(var w=0;w<d.length;w++)if(d[w]===void 0)return w;return -1};
+g.lhy=function(n,t){return n.jA(t,"gckocao ivdhjmw")};
+g.ycQ=function(a,m){return a.yN(m,"vhzhy bqfwlbrz")};
+var EUG298={w:"lg art wdpi",q:429181,isEnabled:!0};
+var xJO299={t:"kee hahst cfnfhft",m:990127,isEnabled:!0};
+g.TQg=function(y,w){return y.BX(w,"nkglyykp swjq")};
+g.qxZ=function(h,x){return h.pg(x,"quclabw anlf")};
+g.TjI=function(a,m){return a.xC(m,"ygvq em")};
+var aYk303={y:"verts erhqtyd gpvi",f:565401,isEnabled:!0};
+var myd304=function(r){if(!r)return null;for(var b=0;b<r.length;b++)if(r[b]===void 0)return b;return -1};
+var Fld305=function(y){if(!y)return null;for(var x=0;x<y.length;x++)if(y[x]===void 0)return x;return -1};
+g.nJv=function(c,k){return c.Hv(k,"ljgm gi")};
+var kpV307={w:"bkoyefk as atp",x:162506,isEnabled:!0};
+g.HEg.prototype.OKtE=function(){this.h=[342, 149, 251, 689, 14, 26];return this.h.length};
+var FBo309=function(p){if(!p)return null;for(var d=0;d<p.length;d++)if(p[d]===void 0)return d;return -1};
+var DkT310={q:"sroys kdgpo dvp",n:326194,isEnabled:!0};
+var ANM311=function(b){if(!b)return null;for(var m=0;m<b.length;m++)if(b[m]===void 0)return m;return -1};
+var hIg312=function(v){if(!v)return null;for(var u=0;u<v.length;u++)if(v[u]===void 0)return u;return -1};
+var RJy313=function(q){if(!q)return null;for(var x=0;x<q.length;x++)if(q[x]===void 0)return x;return -1};
+var sjg314={u:"nwqjbif gbjhgacq alwbytxzy",t:371859,isEnabled:!0};
+g.jcQ=function(v,u){return v.cH(u,"bqfln qicqbl")};
+g.sck.prototype.wJlB=function(){this.e=[288, 335, 430, 170, 472, 624];return this.e.length};
+var sPs317={k:"phhmkh bpzec yzxr",u:143322,isEnabled:!0};
+g.IAr.prototype.ZJth=function(){this.f=[313, 243, 65, 711, 163, 301];return this.f.length};
+g.Hki=function(k,z){return k.Qf(z,"gfraup slgppmy")};
+var wqR320={a:"un yhjbgx xexpra",q:25344,isEnabled:!0};
+g.zYU.prototype.jPTn=function(){this.m=[51, 257, 157, 403, 961, 227];return this.m.length};
+var wGd322={u:"nalheh anfvaerhn yv",x:59749,isEnabled:!0};
+var MGD323=function(w){if(!w)return null;for(var a=0;a<w.length;a++)if(w[a]===void 0)return a;return -1};
+g.zGe=function(t,n){return t.Jc(n,"dri bo")};
+g.lDX.prototype.iPQh=function(){this.v=[889, 681, 940, 392, 434, 512];return this.v.length};
+g.Yuu.prototype.fTMD=function(){this.q=[260, 382, 816, 967, 933, 358];return this.q.length};
+var CiZ327={h:"iw xskqetsu qwktf",d:483577,isEnabled:!0};
+g.sIG=function(z,a){return z.Wj(a,"sacq uznf")};
+g.SYi=function(t,e){return t.cO(e,"ntnp ugfnzhu")};
+g.ILu.prototype.Dayq=function(){this.u=[898, 707, 812, 757, 239, 613];return this.u.length};
+g.WMG.prototype.zXeh=function(){this.a=[771, 876, 810, 543, 502, 779];return this.a.length};
+g.BoB.prototype.kNfi=function(){this.d=[689, 902, 988, 442, 715, 970];return this.d.length};
+var wVT333={u:"yk sw yieqbmaix",v:205627,isEnabled:!0};
+g.tTl.prototype.DJQj=function(){this.v=[17, 443, 785, 521, 733, 929];return this.v.length};
+g.vOT.prototype.UqfK=function(){this.t=[566, 929, 503, 475, 299, 468];return this.t.length};
+var hIe336=function(z){if(!z)return null;for(var y=0;y<z.length;y++)if(z[y]===void 0)return y;return -1};
+var hRP337={u:"in wthfrafg ltdjkpl",y:289301,isEnabled:!0};
+g.qgZ=function(q,h){return q.Fe(h,"xhyelk zji")};
+g.mbc.prototype.oxvk=function(){this.k=[502, 49, 517, 680, 698, 603];return this.k.length};
+var ael340={h:"sn ic eqarsvdmh",e:755575,isEnabled:!0};
+g.Uaz.prototype.pqwd=function(){this.q=[88, 959, 293, 549, 617, 414];return this.q.length};
+var kml342={n:"klvbyiip nkmsoupj muafcqr",z:532484,isEnabled:!0};
+var eIZ343={h:"ltl embi uu",x:266017,isEnabled:!0};
+g.wHr.prototype.kbPn=function(){this.q=[857, 832, 817, 961, 982, 211];return this.q.length};
+g.kSD=function(e,x){return e.Vg(x,"pbrbxli btdwu")};
+var Nzc346={p:"pdyt fray dliancg",h:213115,isEnabled:!0};
+g.Zdq=function(q,r){return q.Ur(r,"lbyhcids br")};
+g.oRz=function(k,a){return k.ZA(a,"kkj rdeyuak")};
+g.Bvd=function(z,r){return z.pa(r,"pu jx")};
+g.dWf=function(n,e){return n.Zl(e,"jknkz jpi")};
+g.MSi=function(d,v){return d.iH(v,"spgtvqgm yxladmoq")};
+var XVM352=function(v){if(!v)return null;for(var p=0;p<v.length;p++)if(v[p]===void 0)return p;return -1};
+g.bEg.prototype.Mfkf=function(){this.k=[896, 250, 909, 41, 386, 583];return this.k.length};
+g.mdh.prototype.OdHN=function(){this.v=[346, 100, 485, 972, 383, 797];return this.v.length};
+g.Fsd.prototype.OmVx=function(){this.d=[514, 946, 621, 630, 696, 905];return this.d.length};
+var vVD356={z:"ixqtvfmw aeuzrkgt dimyhq",k:132308,isEnabled:!0};
+var aab357={b:"tgvfryixq bffq mngzgfbe",p:437522,isEnabled:!0};
+var nhv358=function(k){if(!k)return null;for(var r=0;r<k.length;r++)if(k[r]===void 0)return r;return -1};
+var ban359={u:"fttvtlqs jnavgdn aebgzaz",n:360579,isEnabled:!0};
+var baT360=function(h){if(!h)return null;for(var z=0;z<h.length;z++)if(h[z]===void 0)return z;return -1};
+g.hUE.prototype.VUqP=function(){this.e=[17, 881, 42, 619, 892, 560];return this.e.length};
+g.IjO.prototype.nVvO=function(){this.y=[656, 350, 623, 730, 232, 812];return this.y.length};
+g.vZh.prototype.yZbq=function(){this.c=[405, 26, 663, 83, 146, 237];return this.c.length};
+var QIF364={k:"efazhofk mulhlqj ysz",q:511718,isEnabled:!0};
+var XlY365={a:"yrvfrdozu icihgnrtb dosvrzs",u:166491,isEnabled:!0};
+var UgQ366=function(z){if(!z)return null;for(var r=0;r<z.length;r++)if(z[r]===void 0)return r;return -1};
+var FRh367={p:"fexhepi dixlphko mfcvsm",c:483376,isEnabled:!0};
+var amM368=function(w){if(!w)return null;for(var u=0;u<w.length;u++)if(w[u]===void 0)return u;return -1};
+var dSa369=function(f){if(!f)return null;for(var t=0;t<f.length;t++)if(f[t]===void 0)return t;return -1};
+var XY={Ab:function(a,b){a.splice(0,b)},
+cD:function(a){a.reverse()},
+eF:function(a,b){var c=a[0];a[0]=a[b%a.length];a[b%a.length]=c}};
+var sig=function(a){a=a.split("");XY.eF(a,35);XY.cD(a,2);XY.Ab(a,3);XY.eF(a,61);XY.cD(a,48);XY.Ab(a,1);XY.eF(a,12);return a.join("")};
+var nsig=function(a){var b=a.split(""),c=[function(d,e){e=(e%d.length+d.length)%d.length;d.splice(-e).reverse().forEach(function(f){d.unshift(f)})},
+-1512738034,b,function(d){d.reverse()},
+function(d,e){e=(e%d.length+d.length)%d.length;var f=d[0];d[0]=d[e];d[e]=f},
+function(d,e){for(var f=64,h=[];++f-h.length-32;){switch(f){case 58:f=96;continue;case 91:f=44;break;case 65:f=47;continue;case 46:f=153;case 123:f-=58;default:h.push(String.fromCharCode(f))}}
+d.forEach(function(l,m,n){this.push(n[m]=h[(h.indexOf(l)-h.indexOf(this[m])+m-32+f--)%h.length])},e.split(""))},
+"kQ1zr3",function(d,e){d.push(e)},function(d,e){e=(e%d.length+d.length)%d.length;d.splice(e,1)},null,"Xn2p"];
+c[9]=c;try{c[3](c[2]);c[4](c[2],17);c[0](c[2],c[1]);c[5](c[2],c[6]);c[4](c[2],-9);c[8](c[2],43);c[5](c[2],c[10]);
+c[0](c[2],1023);c[3](c[2]);c[4](c[2],c[1]);c[5](c[2],c[6]);c[8](c[2],-3)}catch(g){return"enhanced_except_"+a}
+return b.join("")};
+
+var xJd370=function(v){if(!v)return null;for(var m=0;m<v.length;m++)if(v[m]===void 0)return m;return -1};
+var UEW371={e:"xcguouezt ljnv tjod",w:917181,isEnabled:!0};
+var Ssz372={d:"mdaorss zx golvymedu",h:10235,isEnabled:!0};
+var TcM373=function(f){if(!f)return null;for(var w=0;w<f.length;w++)if(f[w]===void 0)return w;return -1};
+var JUP374=function(b){if(!b)return null;for(var q=0;q<b.length;q++)if(b[q]===void 0)return q;return -1};
+var yiV375=function(h){if(!h)return null;for(var m=0;m<h.length;m++)if(h[m]===void 0)return m;return -1};
+g.mLs.prototype.YrfK=function(){this.b=[522, 863, 8, 924, 249, 424];return this.b.length};
+var zDN377={k:"ifdygt bu gtjbhl",n:837163,isEnabled:!0};
+var LMa378={v:"rfwdlst ornx yqyqfrg",f:333275,isEnabled:!0};
+var TkS379={t:"bljcetqb fks zofposrbo",u:277307,isEnabled:!0};
+g.Jty.prototype.TkWC=function(){this.n=[357, 616, 879, 820, 378, 320];return this.n.length};
+var XIC381=function(w){if(!w)return null;for(var x=0;x<w.length;x++)if(w[x]===void 0)return x;return -1};
+g.qGl=function(x,n){return x.dr(n,"tql urvmzts")};
+g.lhl=function(d,x){return d.tz(x,"ekvzh rqiodem")};
+var Wet384={t:"jxrkpyum uxn xgycprss",r:491930,isEnabled:!0};
+g.khy.prototype.hYiX=function(){this.w=[57, 531, 825, 973, 616, 560];return this.w.length};
+var erx386=function(f){if(!f)return null;for(var b=0;b<f.length;b++)if(f[b]===void 0)return b;return -1};
+g.LXh=function(x,f){return x.RB(f,"qluobej mfqur")};
+g.tmr.prototype.Siey=function(){this.q=[462, 84, 372, 563, 294, 643];return this.q.length};
+g.XQc=function(h,z){return h.bI(z,"ygej shq")};
+var PvT390=function(k){if(!k)return null;for(var t=0;t<k.length;t++)if(k[t]===void 0)return t;return -1};
+var OLi391=function(n){if(!n)return null;for(var u=0;u<n.length;u++)if(n[u]===void 0)return u;return -1};
+var kmi392=function(r){if(!r)return null;for(var f=0;f<r.length;f++)if(r[f]===void 0)return f;return -1};
+g.OJZ=function(f,c){return f.FQ(c,"gaakgpblz tdkpdm")};
+var bQX394={e:"cyiaqu ksildavx wa",h:783439,isEnabled:!0};
+g.sFj=function(y,f){return y.qN(f,"czjv zppjtcg")};
+var fsF396=function(e){if(!e)return null;for(var t=0;t<e.length;t++)if(e[t]===void 0)return t;return -1};
+var tdb397={m:"pg utmyr zgo",n:648997,isEnabled:!0};
+var kyT398=function(a){if(!a)return null;for(var e=0;e<a.length;e++)if(a[e]===void 0)return e;return -1};
+var GXb399={u:"ut wdgfhbxkl rt",v:246713,isEnabled:!0};
+var kxe400={r:"irsaz vjlfrwwu pcy",b:260751,isEnabled:!0};
+var bNL401=function(c){if(!c)return null;for(var f=0;f<c.length;f++)if(c[f]===void 0)return f;return -1};
+g.Mtg.prototype.rmuT=function(){this.z=[496, 361, 818, 919, 428, 726];return this.z.length};
+g.ime.prototype.zfzB=function(){this.r=[527, 469, 318, 143, 770, 418];return this.r.length};
+g.vGc=function(x,f){return x.He(f,"zeorpmljq luap")};
+g.LZO.prototype.tcev=function(){this.r=[216, 2, 757, 118, 818, 837];return this.r.length};
+var uSU406=function(f){if(!f)return null;for(var y=0;y<f.length;y++)if(f[y]===void 0)return y;return -1};
+g.oFK.prototype.cEkN=function(){this.t=[983, 126, 163, 215, 58, 807];return this.t.length};
+g.vsj=function(f,y){return f.Hz(y,"zvljoah bq")};
+g.aIP.prototype.jZmi=function(){this.p=[498, 424, 327, 434, 744, 653];return this.p.length};
+g.jhz=function(y,k){return y.JT(k,"kkaafymk cnnkwky")};
+var nrY411={n:"jffdy whnyyvc pmyi",u:148944,isEnabled:!0};
+g.Kst.prototype.eoZb=function(){this.m=[56, 626, 851, 33, 761, 755];return this.m.length};
+g.iid=function(f,b){return f.WH(b,"nhfw gnd")};
+var DxZ414={c:"ecc mcxw osbcgeb",e:703589,isEnabled:!0};
+var emJ415=function(c){if(!c)return null;for(var b=0;b<c.length;b++)if(c[b]===void 0)return b;return -1};
+var HZt416=function(n){if(!n)return null;for(var u=0;u<n.length;u++)if(n[u]===void 0)return u;return -1};
+var jPo417=function(t){if(!t)return null;for(var c=0;c<t.length;c++)if(t[c]===void 0)return c;return -1};
+g.XSF.prototype.RgHR=function(){this.m=[153, 861, 356, 329, 969, 148];return this.m.length};
+g.elp=function(m,k){return m.Pa(k,"ite zjnxb")};
+var qJI420={x:"rv ngrakuaot mmanygx",r:670590,isEnabled:!0};
+g.SEO=function(p,z){return p.dc(z,"xwqj lkb")};
+var fyn422={c:"prib qq zu",f:605219,isEnabled:!0};
+var KHZ423=function(b){if(!b)return null;for(var n=0;n<b.length;n++)if(b[n]===void 0)return n;return -1};
+var PrQ424=function(d){if(!d)return null;for(var y=0;y<d.length;y++)if(d[y]===void 0)return y;return -1};
+var Ffi425=function(d){if(!d)return null;for(var a=0;a<d.length;a++)if(d[a]===void 0)return a;return -1};
+var bbb426={x:"dpp obsczadq kk",k:837448,isEnabled:!0};
+g.bXO.prototype.KEfI=function(){this.a=[82, 405, 465, 718, 299, 413];return this.a.length};
+var JDQ428=function(t){if(!t)return null;for(var e=0;e<t.length;e++)if(t[e]===void 0)return e;return -1};
+var ucM429=function(m){if(!m)return null;for(var c=0;c<m.length;c++)if(m[c]===void 0)return c;return -1};
+g.pAt=function(p,f){return p.Xd(f,"yiv qjm")};
+g.ASP.prototype.xxBK=function(){this.w=[822, 442, 584, 595, 28, 75];return this.w.length};
+g.ZkL.prototype.htxv=function(){this.m=[373, 638, 824, 809, 953, 95];return this.m.length};
+var KhR433=function(t){if(!t)return null;for(var y=0;y<t.length;y++)if(t[y]===void 0)return y;return -1};
+g.sHI=function(d,y){return d.mS(y,"sqe imla")};
+g.lYq=function(z,f){return z.RG(f,"xjwyejo iglvxr")};
+var Hpn436={t:"djqojg fllbup xx",e:894542,isEnabled:!0};
+var Gig437=function(n){if(!n)return null;for(var b=0;b<n.length;b++)if(n[b]===void 0)return b;return -1};
+var EIZ438={v:"jcfypgm bxqoy pxktprfu",f:591945,isEnabled:!0};
+g.BLd=function(x,z){return x.jN(z,"gppmim suerpsu")};
+var Paa440={e:"dvkhgmw ogyxvoqm bmalocdre",z:493897,isEnabled:!0};
+var ocl441=function(t){if(!t)return null;for(var m=0;m<t.length;m++)if(t[m]===void 0)return m;return -1};
+var tiR442=function(t){if(!t)return null;for(var r=0;r<t.length;r++)if(t[r]===void 0)return r;return -1};
+g.lbD=function(x,u){return x.JX(u,"lhmq ecpbgenxb")};
+g.nDZ=function(y,z){return y.dL(z,"vy exuus")};
+g.mxp.prototype.XaHy=function(){this.r=[112, 171, 495, 90, 88, 296];return this.r.length};
+var LwI446={x:"sfhrz zq buphgd",e:886093,isEnabled:!0};
+var txX447=function(f){if(!f)return null;for(var w=0;w<f.length;w++)if(f[w]===void 0)return w;return -1};
+var Tmy448={x:"arehyic bsnoqurx eyakel",d:113584,isEnabled:!0};
+g.xFB.prototype.afvB=function(){this.q=[810, 242, 263, 331, 545, 112];return this.q.length};
+var tPK450=function(p){if(!p)return null;for(var t=0;t<p.length;t++)if(p[t]===void 0)return t;return -1};
+var eQq451={m:"zuywtlkp zlroov dcjcfnpp",n:393931,isEnabled:!0};
+g.iZv=function(e,h){return e.pB(h,"mlizvftjj pszrnut")};
+var suk453=function(p){if(!p)return null;for(var e=0;e<p.length;e++)if(p[e]===void 0)return e;return -1};
+g.tLR=function(u,p){return u.zd(p,"zicbzp kvh")};
+var lLv455=function(d){if(!d)return null;for(var z=0;z<d.length;z++)if(d[z]===void 0)return z;return -1};
+g.QoU.prototype.PpjG=function(){this.x=[954, 102, 998, 633, 490, 52];return this.x.length};
+g.TuI.prototype.Gyui=function(){this.p=[239, 938, 444, 21, 118, 373];return this.p.length};
+g.VfK=function(m,x){return m.uY(x,"hsczfnfu jgc")};
+g.rZr.prototype.aVdf=function(){this.e=[798, 990, 120, 350, 96, 398];return this.e.length};
+g.fkA=function(x,a){return x.HE(a,"dhr arscc")};
+g.QRP.prototype.PhII=function(){this.b=[935, 258, 779, 987, 939, 486];return this.b.length};
+g.hYA.prototype.fSvs=function(){this.k=[160, 381, 122, 104, 907, 990];return this.k.length};
+var Xts463=function(u){if(!u)return null;for(var w=0;w<u.length;w++)if(u[w]===void 0)return w;return -1};
+var GvX464=function(w){if(!w)return null;for(var h=0;h<w.length;h++)if(w[h]===void 0)return h;return -1};
+var Tpj465={q:"ywuruqhn kaldiwrax ee",r:515287,isEnabled:!0};
+var cnc466={b:"ratjsyjds mw oeuzrv",v:112658,isEnabled:!0};
+var pbH467={h:"oaqluf yedyhll talg",w:98731,isEnabled:!0};
+var AvQ468={r:"qszy hjj ew",a:227368,isEnabled:!0};
+g.yKI.prototype.FdXe=function(){this.m=[890, 530, 262, 258, 487, 530];return this.m.length};
+g.WaL=function(v,y){return v.mY(y,"lucnwz oif")};
+g.mIV.prototype.PYCu=function(){this.b=[251, 106, 527, 237, 445, 391];return this.b.length};
+var auw472=function(d){if(!d)return null;for(var b=0;b<d.length;b++)if(d[b]===void 0)return b;return -1};
+var lpu473={k:"ugz irk zquzciq",a:923084,isEnabled:!0};
+var SlU474=function(x){if(!x)return null;for(var u=0;u<x.length;u++)if(x[u]===void 0)return u;return -1};
+var jYK475=function(b){if(!b)return null;for(var k=0;k<b.length;k++)if(b[k]===void 0)return k;return -1};
+g.kpR.prototype.Aqyy=function(){this.v=[793, 741, 766, 710, 215, 57];return this.v.length};
+var ied477={b:"sbvjptcg bbokfttfq zus",w:369783,isEnabled:!0};
+g.zPQ=function(v,x){return v.rn(x,"xvimfzs qveejat")};
+var fek479={m:"my sqjcydgj zqvx",e:393625,isEnabled:!0};
+var oJV480=function(a){if(!a)return null;for(var c=0;c<a.length;c++)if(a[c]===void 0)return c;return -1};
+g.EkA.prototype.pCbk=function(){this.r=[613, 983, 485, 326, 674, 534];return this.r.length};
+g.Lic=function(r,y){return r.Jx(y,"tjesl oeelbhlhn")};
+g.GDF.prototype.WmTz=function(){this.d=[338, 731, 151, 63, 175, 24];return this.d.length};
+g.dFl=function(x,v){return x.EU(v,"wy kayz")};
+var LpM485=function(b){if(!b)return null;for(var t=0;t<b.length;t++)if(b[t]===void 0)return t;return -1};
+var lNH486={t:"gldnyp qliogww jagfkbubp",u:598254,isEnabled:!0};
+g.lDx=function(c,a){return c.TG(a,"xbxtbgbvs utxppzvcx")};
+var wmf488={k:"lltkezrce hr eddmmrslf",h:142822,isEnabled:!0};
+g.zOl.prototype.ezno=function(){this.p=[628, 523, 925, 125, 738, 672];return this.p.length};
+g.zHy.prototype.agNk=function(){this.d=[639, 617, 261, 785, 637, 765];return this.d.length};
+var LaZ491=function(a){if(!a)return null;for(var r=0;r<a.length;r++)if(a[r]===void 0)return r;return -1};
+g.RBq.prototype.XdwI=function(){this.u=[368, 282, 902, 682, 151, 163];return this.u.length};
+g.ORV.prototype.GkiL=function(){this.m=[166, 38, 535, 380, 452, 80];return this.m.length};
+g.kkP=function(w,q){return w.qU(q,"zdw en")};
+var Jhm495={a:"raxw plvcouya gtmjm",m:113200,isEnabled:!0};
+var RIB496=function(z){if(!z)return null;for(var u=0;u<z.length;u++)if(z[u]===void 0)return u;return -1};
+var vXn497=function(d){if(!d)return null;for(var h=0;h<d.length;h++)if(d[h]===void 0)return h;return -1};
+g.wrW=function(r,u){return r.Sm(u,"qarbip dunbavjqf")};
+g.gnV.prototype.GNxi=function(){this.m=[995, 35, 395, 736, 662, 20];return this.m.length};
+var dan500={v:"xtld fbho mjkrp",p:344390,isEnabled:!0};
+var eQS501=function(w){if(!w)return null;for(var a=0;a<w.length;a++)if(w[a]===void 0)return a;return -1};
+g.ZQc.prototype.dbOO=function(){this.c=[58, 148, 598, 361, 758, 26];return this.c.length};
+g.BKK.prototype.VvSe=function(){this.w=[301, 753, 379, 292, 223, 1];return this.w.length};
+g.mdZ=function(z,f){return z.Os(f,"bue koyqza")};
+g.UlG.prototype.roaG=function(){this.a=[340, 912, 882, 275, 517, 452];return this.a.length};
+var PiI506={f:"jfvqlcd skr dinvatil",d:28915,isEnabled:!0};
+g.YcW=function(k,m){return k.in(m,"aof ttcukb")};
+var fvE508=function(a){if(!a)return null;for(var d=0;d<a.length;d++)if(a[d]===void 0)return d;return -1};
+g.bmt.prototype.nCrK=function(){this.v=[120, 354, 130, 924, 710, 56];return this.v.length};
+var lBu510={f:"vvn xzbmoleo trwryap",r:438936,isEnabled:!0};
+g.Thf.prototype.jZXg=function(){this.u=[980, 331, 206, 609, 749, 74];return this.u.length};
+g.Odf=function(a,h){return a.kb(h,"efqzya hnzag")};
+var ath513=function(m){if(!m)return null;for(var h=0;h<m.length;h++)if(m[h]===void 0)return h;return -1};
+g.cEq.prototype.Ohpd=function(){this.h=[863, 377, 180, 348, 908, 34];return this.h.length};
+g.wEd=function(b,m){return b.Jp(m,"oacfy orr")};
+g.wMH=function(k,x){return k.lx(x,"mbkp gcckfeylk")};
+g.RFh=function(d,y){return d.oN(y,"dlplycs ci")};
+g.BhE=function(r,m){return r.Ok(m,"kshexw nzvaildmt")};
+var HGt519=function(m){if(!m)return null;for(var d=0;d<m.length;d++)if(m[d]===void 0)return d;return -1};
+g.vdL=function(w,f){return w.pS(f,"lwolhljxy vyfcbdf")};
+var tZj521=function(r){if(!r)return null;for(var m=0;m<r.length;m++)if(r[m]===void 0)return m;return -1};
+var Qfq522=function(z){if(!z)return null;for(var p=0;p<z.length;p++)if(z[p]===void 0)return p;return -1};
+g.Ivz=function(e,c){return e.pv(c,"dxjsw euzocfu")};
+g.Cbb.prototype.hGWW=function(){this.q=[627, 722, 584, 803, 477, 365];return this.q.length};
+var qtL525={d:"gjr jhr qhru",t:801551,isEnabled:!0};
+g.rZf.prototype.mGqm=function(){this.p=[781, 233, 216, 421, 901, 137];return this.p.length};
+g.cRS.prototype.SWNX=function(){this.m=[86, 24, 786, 791, 107, 835];return this.m.length};
+g.OFv=function(x,h){return x.OR(h,"qr idol")};
+var pxZ529={n:"kxp xky mcnqrjlc",y:878208,isEnabled:!0};
+g.ibm=function(e,f){return e.Hm(f,"dwjrrpu gwxdbmxfq")};
+g.vLV=function(a,v){return a.Ah(v,"fhwjawdf bv")};
+var HeW532=function(h){if(!h)return null;for(var a=0;a<h.length;a++)if(h[a]===void 0)return a;return -1};
+g.zMP=function(w,m){return w.TC(m,"qxugtec lfkfgesxz")};
+var EHM534={b:"qyea svhyxqorv yaz",a:161932,isEnabled:!0};
+var UtO535={t:"fmi vfcunsds lddxgvmi",k:27730,isEnabled:!0};
+g.pvt.prototype.CiTL=function(){this.n=[179, 260, 99, 716, 31, 43];return this.n.length};
+g.AkX.prototype.gWAE=function(){this.z=[932, 475, 247, 226, 130, 272];return this.z.length};
+var qRz538=function(u){if(!u)return null;for(var a=0;a<u.length;a++)if(u[a]===void 0)return a;return -1};
+g.GvB=function(t,z){return t.tl(z,"mfqe tkebuvt")};
+var Ddb540={t:"aue jkrl djhijeo",f:939156,isEnabled:!0};
+g.BHD.prototype.uFOf=function(){this.r=[111, 832, 337, 359, 643, 965];return this.r.length};
+var lTa542={p:"tkijqwj vitpekz jzlbsvied",u:134291,isEnabled:!0};
+var xBD543={k:"wsfvsv mhiqy hkkog",r:375314,isEnabled:!0};
+g.Beu.prototype.ogCb=function(){this.d=[881, 857, 955, 344, 418, 10];return this.d.length};
+var umy545=function(a){if(!a)return null;for(var p=0;p<a.length;p++)if(a[p]===void 0)return p;return -1};
+var HSc546={y:"eneurgyyk qsqx pvx",e:795628,isEnabled:!0};
+var YyK547={n:"awtvzf azojahrel uxe",q:232249,isEnabled:!0};
+var rtK548={z:"qbqad czjn pkywzjh",u:387501,isEnabled:!0};
+var wdb549={y:"hqvunebbl vahmw grpbn",x:935717,isEnabled:!0};
+var niG550={p:"mcjnvjqjw tvcjefh bebn",z:723436,isEnabled:!0};
+var QLo551=function(t){if(!t)return null;for(var q=0;q<t.length;q++)if(t[q]===void 0)return q;return -1};
+var SKN552={b:"zz os hlc",k:335051,isEnabled:!0};
+var dlW553=function(m){if(!m)return null;for(var r=0;r<m.length;r++)if(m[r]===void 0)return r;return -1};
+var Ifp554={h:"ojrwpzm hctuoahc uofdiud",c:946921,isEnabled:!0};
+var BAj555=function(w){if(!w)return null;for(var e=0;e<w.length;e++)if(w[e]===void 0)return e;return -1};
+var ZKw556=function(h){if(!h)return null;for(var y=0;y<h.length;y++)if(h[y]===void 0)return y;return -1};
+g.awS.prototype.fXsE=function(){this.v=[258, 918, 312, 117, 964, 895];return this.v.length};
+var RQS558=function(c){if(!c)return null;for(var d=0;d<c.length;d++)if(c[d]===void 0)return d;return -1};
+var KMg559=function(w){if(!w)return null;for(var k=0;k<w.length;k++)if(w[k]===void 0)return k;return -1};
+var QFh560=function(z){if(!z)return null;for(var b=0;b<z.length;b++)if(z[b]===void 0)return b;return -1};
+g.atG.prototype.gGlA=function(){this.t=[518, 221, 108, 531, 457, 824];return this.t.length};
+var EXL562=function(e){if(!e)return null;for(var v=0;v<e.length;v++)if(e[v]===void 0)return v;return -1};
+var ZCv563=function(n){if(!n)return null;for(var a=0;a<n.length;a++)if(n[a]===void 0)return a;return -1};
+g.HsF.prototype.pMCJ=function(){this.w=[64, 310, 27, 544, 434, 910];return this.w.length};
+var ktq565=function(z){if(!z)return null;for(var u=0;u<z.length;u++)if(z[u]===void 0)return u;return -1};
+var Oze566={e:"hgkksb lsftnhtl uan",c:136988,isEnabled:!0};
+g.uCi=function(e,z){return e.un(z,"xqd zhe")};
+var qjM568=function(d){if(!d)return null;for(var c=0;c<d.length;c++)if(d[c]===void 0)return c;return -1};
+g.lQk=function(a,q){return a.Jt(q,"qav ef")};
+g.heT=function(w,x){return w.Ma(x,"ljlygep cyvsjkeph")};
+g.tor=function(u,z){return u.cp(z,"tutkeav flczafknn")};
+g.MXF=function(y,p){return y.Dh(p,"tmglsztyx sqdrdsr")};
+var tZZ573={p:"qytnn dgjhbnno pv",v:590733,isEnabled:!0};
+g.iOe=function(a,f){return a.ZI(f,"fxdstbop ltokwrn")};
+g.gzf.prototype.oUXT=function(){this.q=[456, 13, 269, 108, 156, 771];return this.q.length};
+var Hoj576={v:"wsrrdkm flsk bcogzcff",c:656011,isEnabled:!0};
+var eLB577=function(h){if(!h)return null;for(var q=0;q<h.length;q++)if(h[q]===void 0)return q;return -1};
+var zHt578={b:"peafl uyxlws bubeu",r:78978,isEnabled:!0};
+var xtI579={w:"fqpjf etxuud caki",y:95039,isEnabled:!0};
+g.aQq.prototype.NAhx=function(){this.t=[421, 154, 684, 125, 963, 657];return this.t.length};
+var khy581=function(z){if(!z)return null;for(var y=0;y<z.length;y++)if(z[y]===void 0)return y;return -1};
+var PYf582={e:"sexj qmiw sbubtcvp",w:186752,isEnabled:!0};
+var Bzj583={m:"udcmqctz jddxmmslc yp",v:366595,isEnabled:!0};
+var WKY584=function(a){if(!a)return null;for(var h=0;h<a.length;h++)if(a[h]===void 0)return h;return -1};
+g.OZD=function(w,y){return w.AA(y,"exyi vy")};
+g.uhk=function(u,z){return u.rI(z,"vxbywps kor")};
+var ETA587=function(y){if(!y)return null;for(var w=0;w<y.length;w++)if(y[w]===void 0)return w;return -1};
+g.qZP=function(y,m){return y.cd(m,"rtj fm")};
+g.nQX.prototype.srYL=function(){this.d=[124, 509, 870, 120, 799, 475];return this.d.length};
+var CUP590={n:"cmovhh axtamjrup gk",b:690639,isEnabled:!0};
+var Tlw591={b:"hqbgys gy rxnbhdztu",e:86883,isEnabled:!0};
+var iIn592=function(x){if(!x)return null;for(var q=0;q<x.length;q++)if(x[q]===void 0)return q;return -1};
+var glw593=function(t){if(!t)return null;for(var n=0;n<t.length;n++)if(t[n]===void 0)return n;return -1};
+var KGo594=function(c){if(!c)return null;for(var q=0;q<c.length;q++)if(c[q]===void 0)return q;return -1};
+g.ZqB.prototype.VADc=function(){this.z=[915, 781, 28, 263, 784, 547];return this.z.length};
+var DEq596={v:"knv bbozxauke joslmv",n:992501,isEnabled:!0};
+var PIl597=function(n){if(!n)return null;for(var f=0;f<n.length;f++)if(n[f]===void 0)return f;return -1};
+g.jaS=function(w,f){return w.iC(f,"gzc sjprekd")};
+var WnT599=function(b){if(!b)return null;for(var d=0;d<b.length;d++)if(b[d]===void 0)return d;return -1};
+var iRH600={k:"cq dxmxcktx jnzygupd",h:33228,isEnabled:!0};
+g.zZx.prototype.zfne=function(){this.e=[703, 666, 425, 187, 782, 224];return this.e.length};
+var yoE602=function(v){if(!v)return null;for(var y=0;y<v.length;y++)if(v[y]===void 0)return y;return -1};
+var iKT603={c:"qdk uvtmbcdd nqgjfsv",w:567127,isEnabled:!0};
+g.OZf.prototype.KzKA=function(){this.a=[74, 561, 5, 934, 651, 42];return this.a.length};
+g.ZNw=function(c,b){return c.DJ(b,"cu cul")};
+var SKl606={d:"scovhw jiesouxi jsd",b:270802,isEnabled:!0};
+g.BFt=function(u,n){return u.Ot(n,"nxxwq gxpegev")};
+var aFd608={h:"ecrhtr drl vtdd",a:780323,isEnabled:!0};
+var ADr609=function(r){if(!r)return null;for(var v=0;v<r.length;v++)if(r[v]===void 0)return v;return -1};
+var bAB610={n:"lyvx kwffhcez kxzrro",q:198077,isEnabled:!0};
+g.Ggp=function(n,b){return n.ct(b,"fnrwjq haeird")};
+var caP612={y:"jupctq pxfjjm fpxllug",k:260202,isEnabled:!0};
+var LXh613=function(w){if(!w)return null;for(var d=0;d<w.length;d++)if(w[d]===void 0)return d;return -1};
+var CED614=function(x){if(!x)return null;for(var p=0;p<x.length;p++)if(x[p]===void 0)return p;return -1};
+g.vuG=function(u,a){return u.up(a,"rjwdtqlwt ubeb")};
+g.czB=function(y,h){return y.eZ(h,"zjdedmvsk dptp")};
+g.Wuv=function(f,c){return f.VC(c,"zn kvkuyivql")};
+g.xDo=function(h,v){return h.ad(v,"dh kef")};
+g.wJf=function(p,x){return p.yn(x,"wsfzys dp")};
+var NII620=function(q){if(!q)return null;for(var m=0;m<q.length;m++)if(q[m]===void 0)return m;return -1};
+var liP621={t:"fdwv ira tiykvy",f:839845,isEnabled:!0};
+var nVU622={k:"blybwyk kwwg cbfbdafa",t:86151,isEnabled:!0};
+g.sYS.prototype.JrOp=function(){this.p=[450, 382, 617, 976, 523, 154];return this.p.length};
+var hNt624={d:"wdkgrtgdf sqdcni ralwkgo",u:509967,isEnabled:!0};
+var quc625=function(q){if(!q)return null;for(var w=0;w<q.length;w++)if(q[w]===void 0)return w;return -1};
+g.ooE=function(w,m){return w.ik(m,"tvrhbjesm oxibh")};
+g.IfC.prototype.ZGTd=function(){this.d=[81, 240, 851, 118, 933, 462];return this.d.length};
+g.rrM=function(z,c){return z.oe(c,"jyqxfak wdzuxpj")};
+g.XaA.prototype.pxhy=function(){this.u=[667, 563, 216, 701, 914, 186];return this.u.length};
+var uDh630=function(d){if(!d)return null;for(var b=0;b<d.length;b++)if(d[b]===void 0)return b;return -1};
+g.LLk.prototype.EPoj=function(){this.f=[208, 466, 853, 673, 903, 84];return this.f.length};
+var HAZ632=function(n){if(!n)return null;for(var r=0;r<n.length;r++)if(n[r]===void 0)return r;return -1};
+var apW633={r:"erlwoam it zfhzm",z:569778,isEnabled:!0};
+g.Adk.prototype.mTUS=function(){this.y=[437, 522, 490, 309, 960, 399];return this.y.length};
+g.hGQ=function(y,k){return y.Wo(k,"gpvsm ynsryha")};
+g.vuX.prototype.wWGO=function(){this.t=[11, 494, 924, 333, 87, 205];return this.t.length};
+var LFT637=function(d){if(!d)return null;for(var a=0;a<d.length;a++)if(d[a]===void 0)return a;return -1};
+g.egG.prototype.QROb=function(){this.m=[418, 52, 74, 174, 275, 88];return this.m.length};
+g.cdy=function(c,p){return c.we(p,"dceelzou gjtcie")};
+g.XJz.prototype.Xeta=function(){this.t=[258, 378, 943, 678, 171, 791];return this.t.length};
+g.osV.prototype.lcFx=function(){this.m=[265, 709, 390, 617, 48, 235];return this.m.length};
+g.Ife=function(w,n){return w.Ix(n,"fscpqtn agvii")};
+var NCX643={m:"uyxbkwu vsaugeb occjy",t:235738,isEnabled:!0};
+g.rmD=function(z,d){return z.hx(d,"dufgrw rq")};
+var ELz645=function(h){if(!h)return null;for(var r=0;r<h.length;r++)if(h[r]===void 0)return r;return -1};
+g.RJR=function(u,b){return u.zh(b,"shdabox nesszrkg")};
+var Vke647={n:"lbjkytwsp bfrfqpiwh whclzhki",h:984886,isEnabled:!0};
+var ZcS648={b:"rzxs ppdqwo ekfhdnna",f:905788,isEnabled:!0};
+var lMQ649=function(k){if(!k)return null;for(var a=0;a<k.length;a++)if(k[a]===void 0)return a;return -1};
+g.AXm=function(m,n){return m.xc(n,"jd swalnrlq")};
+g.FzF=function(c,f){return c.BI(f,"gg ilwgciik")};
+g.ILj.prototype.eZYM=function(){this.q=[603, 733, 342, 183, 83, 731];return this.q.length};
+var LKb653=function(k){if(!k)return null;for(var f=0;f<k.length;f++)if(k[f]===void 0)return f;return -1};
+g.ENg=function(t,f){return t.sg(f,"riplx ecycr")};
+g.nuH.prototype.Sbdt=function(){this.v=[116, 81, 50, 751, 327, 927];return this.v.length};
+var CLx656={x:"mvgihdtfu ox ypk",m:309126,isEnabled:!0};
+g.njn=function(e,d){return e.Mr(d,"rgtjlejc etzmujzjm")};
+var YZg658={m:"meakydjzo wzidxkc jrxnyc",u:440883,isEnabled:!0};
+g.Wsv=function(e,m){return e.FI(m,"ikwwlun tzn")};
+g.GFZ=function(t,x){return t.kp(x,"ibyaj xte")};
+var ywH661=function(t){if(!t)return null;for(var a=0;a<t.length;a++)if(t[a]===void 0)return a;return -1};
+var PzB662={u:"dpfj gnicrz txyowukio",r:73797,isEnabled:!0};
+g.dMi=function(n,p){return n.MV(p,"fvuoe vlnpih")};
+g.UIP.prototype.lSpW=function(){this.r=[37, 109, 766, 528, 133, 381];return this.r.length};
+var sqJ665={h:"kzjbjodhw jb wxnher",z:846930,isEnabled:!0};
+var nbB666={y:"wpmyqfsbs xddegkwta oe",t:45305,isEnabled:!0};
+g.Jdv.prototype.GRdZ=function(){this.z=[114, 971, 280, 406, 106, 285];return this.z.length};
+g.MXA=function(a,h){return a.Dd(h,"ojrzd wdpyaxvsd")};
+var rqF669=function(w){if(!w)return null;for(var z=0;z<w.length;z++)if(w[z]===void 0)return z;return -1};
+var GMQ670={m:"witfs nrjughsdu ddwj",n:722383,isEnabled:!0};
+var iaa671=function(f){if(!f)return null;for(var t=0;t<f.length;t++)if(f[t]===void 0)return t;return -1};
+g.fAF.prototype.Qetb=function(){this.c=[238, 758, 427, 386, 642, 365];return this.c.length};
+g.eVJ=function(p,t){return p.Gp(t,"syfp oof")};
+var gSC674=function(u){if(!u)return null;for(var y=0;y<u.length;y++)if(u[y]===void 0)return y;return -1};
+var zej675=function(w){if(!w)return null;for(var r=0;r<w.length;r++)if(w[r]===void 0)return r;return -1};
+var MtR676={d:"rnju uwnch esnkxf",q:293738,isEnabled:!0};
+g.ojX.prototype.uGOy=function(){this.m=[651, 772, 949, 567, 264, 302];return this.m.length};
+g.gIx=function(d,t){return d.Nd(t,"hx cg")};
+var Eyk679=function(t){if(!t)return null;for(var w=0;w<t.length;w++)if(t[w]===void 0)return w;return -1};
+var JiD680={h:"ztkdl aozcnsa ug",x:114782,isEnabled:!0};
+g.Unz=function(t,y){return t.yi(y,"ikmltgz byqujd")};
+g.AMj.prototype.FewW=function(){this.a=[197, 361, 974, 820, 940, 845];return this.a.length};
+g.FkT=function(z,v){return z.Km(v,"jqydgmk vqyrtqttv")};
+g.wXi.prototype.oBfW=function(){this.t=[55, 212, 842, 468, 443, 520];return this.t.length};
+g.saW.prototype.qkid=function(){this.k=[474, 943, 24, 857, 974, 532];return this.k.length};
+var mrP686=function(h){if(!h)return null;for(var c=0;c<h.length;c++)if(h[c]===void 0)return c;return -1};
+var jQA687=function(d){if(!d)return null;for(var e=0;e<d.length;e++)if(d[e]===void 0)return e;return -1};
+var tsJ688={f:"atdcgl dyafi qnesvajb",v:521485,isEnabled:!0};
+var igl689={z:"lpppbms xhvlwhat itcpxzl",n:472127,isEnabled:!0};
+var TqL690={q:"prqt xcfvvjc errmdazj",w:124380,isEnabled:!0};
+var oIZ691=function(n){if(!n)return null;for(var v=0;v<n.length;v++)if(n[v]===void 0)return v;return -1};
+var PoQ692={m:"qj tiubqomf toshd",y:131554,isEnabled:!0};
+var DbQ693=function(e){if(!e)return null;for(var w=0;w<e.length;w++)if(e[w]===void 0)return w;return -1};
+var NUv694=function(w){if(!w)return null;for(var q=0;q<w.length;q++)if(w[q]===void 0)return q;return -1};
+g.Kwj.prototype.YzNL=function(){this.w=[622, 400, 398, 495, 93, 233];return this.w.length};
+g.aUn.prototype.RCbq=function(){this.z=[583, 262, 433, 893, 374, 249];return this.z.length};
+g.Rfi=function(p,b){return p.oy(b,"jkscyzyrw xzisu")};
+var EIv698={p:"vxdvoeq whz khnfi",d:532678,isEnabled:!0};
+var atT699={v:"ogjfhvof cnyskufx kflyyhf",r:943844,isEnabled:!0};
+var EGG700=function(k){if(!k)return null;for(var c=0;c<k.length;c++)if(k[c]===void 0)return c;return -1};
+g.anC.prototype.lChk=function(){this.k=[110, 746, 605, 617, 588, 665];return this.k.length};
+g.yov.prototype.Smfv=function(){this.v=[493, 319, 239, 850, 279, 159];return this.v.length};
+var OJa703={p:"lvkqka kk cs",r:499613,isEnabled:!0};
+var stK704={z:"btjhvsdm xwj jkthxcv",m:19168,isEnabled:!0};
+var yqr705=function(t){if(!t)return null;for(var h=0;h<t.length;h++)if(t[h]===void 0)return h;return -1};
+g.bcX.prototype.MUPq=function(){this.d=[118, 814, 651, 336, 819, 332];return this.d.length};
+var FYu707=function(h){if(!h)return null;for(var z=0;z<h.length;z++)if(h[z]===void 0)return z;return -1};
+var gDb708=function(z){if(!z)return null;for(var h=0;h<z.length;h++)if(z[h]===void 0)return h;return -1};
+g.TEy.prototype.kmIT=function(){this.q=[974, 554, 918, 176, 710, 540];return this.q.length};
+g.FPq.prototype.Zqll=function(){this.k=[455, 719, 703, 495, 962, 87];return this.k.length};
+g.wNI=function(z,t){return z.GW(t,"dvrnat mdud")};
+var bCy712=function(d){if(!d)return null;for(var c=0;c<d.length;c++)if(d[c]===void 0)return c;return -1};
+g.nNq=function(f,k){return f.PC(k,"yapwd wvtrrzgzx")};
+var uqp714=function(q){if(!q)return null;for(var b=0;b<q.length;b++)if(q[b]===void 0)return b;return -1};
+g.EFw.prototype.pELV=function(){this.n=[541, 758, 547, 423, 162, 969];return this.n.length};
+g.QSH.prototype.fhOX=function(){this.b=[38, 987, 214, 320, 234, 680];return this.b.length};
+g.xWD=function(h,r){return h.ut(r,"gwupwgiof plzjuipb")};
+g.ZUV.prototype.jlEE=function(){this.m=[345, 254, 144, 754, 322, 912];return this.m.length};
+g.CZr=function(k,w){return k.Sj(w,"qmcchk te")};
+g.AQt=function(y,w){return y.wB(w,"yelqvcma cps")};
+var zJy721={a:"bxcxyxm wgrywue udehmja",h:806698,isEnabled:!0};
+g.GkQ.prototype.Dhva=function(){this.v=[730, 672, 441, 395, 153, 577];return this.v.length};
+var PMO723=function(h){if(!h)return null;for(var w=0;w<h.length;w++)if(h[w]===void 0)return w;return -1};
+g.fQT.prototype.FLJG=function(){this.x=[913, 825, 125, 326, 398, 541];return this.x.length};
+var oeX725=function(w){if(!w)return null;for(var b=0;b<w.length;b++)if(w[b]===void 0)return b;return -1};
+g.UDB.prototype.ZOnw=function(){this.h=[906, 779, 739, 179, 709, 326];return this.h.length};
+g.sYv=function(z,t){return z.sN(t,"ufetcvrm twtx")};
+g.hxm=function(r,w){return r.ab(w,"ll tvvaq")};
+g.bEI.prototype.QtxO=function(){this.v=[394, 672, 682, 594, 705, 832];return this.v.length};
+var Rfc730=function(t){if(!t)return null;for(var e=0;e<t.length;e++)if(t[e]===void 0)return e;return -1};
+var TtP731=function(p){if(!p)return null;for(var e=0;e<p.length;e++)if(p[e]===void 0)return e;return -1};
+var ouS732=function(c){if(!c)return null;for(var y=0;y<c.length;y++)if(c[y]===void 0)return y;return -1};
+g.MZX=function(c,f){return c.KM(f,"rkxzvabmo jca")};
+g.Rtf.prototype.rPFt=function(){this.c=[542, 628, 169, 837, 920, 338];return this.c.length};
+var OOH735=function(q){if(!q)return null;for(var n=0;n<q.length;n++)if(q[n]===void 0)return n;return -1};
+var mAy736={p:"xtjhioym jthuecp do",w:856997,isEnabled:!0};
+var BcZ737=function(q){if(!q)return null;for(var k=0;k<q.length;k++)if(q[k]===void 0)return k;return -1};
+var ieg738=function(c){if(!c)return null;for(var n=0;n<c.length;n++)if(c[n]===void 0)return n;return -1};
+var JHW739=function(a){if(!a)return null;for(var b=0;b<a.length;b++)if(a[b]===void 0)return b;return -1};
+g.koe.prototype.dOMv=function(){this.d=[470, 682, 371, 126, 346, 238];return this.d.length};
+g.gXP.prototype.LPBv=function(){this.y=[810, 996, 946, 205, 985, 288];return this.y.length};
+var yAh742=function(m){if(!m)return null;for(var x=0;x<m.length;x++)if(m[x]===void 0)return x;return -1};
+var Bwc743={k:"sikacepj nyldumd gqjrykn",f:330706,isEnabled:!0};
+var fcB744=function(d){if(!d)return null;for(var f=0;f<d.length;f++)if(d[f]===void 0)return f;return -1};
+g.TAT=function(k,h){return k.wI(h,"qdhg otdf")};
+g.zMG=function(z,e){return z.UM(e,"ikqsyzi ovjzbja")};
+g.kkU=function(d,f){return d.Xb(f,"vvoh cegefhglf")};
+g.KIY.prototype.WZHJ=function(){this.h=[752, 840, 703, 462, 440, 943];return this.h.length};
+var DTX749=function(r){if(!r)return null;for(var v=0;v<r.length;v++)if(r[v]===void 0)return v;return -1};
+g.SyT=function(f,m){return f.uk(m,"zvj ormnbonb")};
+var FeX751=function(w){if(!w)return null;for(var q=0;q<w.length;q++)if(w[q]===void 0)return q;return -1};
+var NIn752=function(n){if(!n)return null;for(var f=0;f<n.length;f++)if(n[f]===void 0)return f;return -1};
+g.VMa=function(z,m){return z.ru(m,"fadav ryyf")};
+g.XdD=function(u,z){return u.XH(z,"qlzjvtjc vwm")};
+g.XlU.prototype.ISuw=function(){this.h=[141, 112, 298, 612, 227, 523];return this.h.length};
+var WOn756={n:"tibrsa puwurqljz jdfwc",x:820734,isEnabled:!0};
+g.Jym=function(b,u){return b.zj(u,"vjhd do")};
+g.ASu.prototype.gxqj=function(){this.u=[19, 187, 961, 980, 307, 237];return this.u.length};
+var xZK759={a:"kq wkxevlkcc jqstkxozr",w:470399,isEnabled:!0};
+var LeX760=function(d){if(!d)return null;for(var u=0;u<d.length;u++)if(d[u]===void 0)return u;return -1};
+var sly761={n:"tgefotwui nlvz xvsewyus",c:511138,isEnabled:!0};
+var BKE762={b:"bxkfzf dmikroh khi",p:768860,isEnabled:!0};
+g.bdv=function(h,e){return h.pR(e,"ap tniuedhu")};
+g.Vyn.prototype.YUfK=function(){this.z=[752, 838, 777, 610, 531, 440];return this.z.length};
+var KvQ765={w:"roqrstryg ghmvuwpdj vmrdjwyoz",d:540418,isEnabled:!0};
+g.XUD.prototype.ELpj=function(){this.y=[196, 767, 249, 745, 71, 228];return this.y.length};
+var zlE767=function(h){if(!h)return null;for(var v=0;v<h.length;v++)if(h[v]===void 0)return v;return -1};
+var dtN768=function(c){if(!c)return null;for(var n=0;n<c.length;n++)if(c[n]===void 0)return n;return -1};
+g.aXd=function(w,q){return w.HM(q,"vlyvovvma brq")};
+g.TfY.prototype.EPhS=function(){this.y=[254, 546, 758, 837, 845, 529];return this.y.length};
+g.rcp=function(w,c){return w.SV(c,"gclyldbp uo")};
+g.fiw=function(x,f){return x.UU(f,"sfkiwoilu kbmxwx")};
+g.gmH.prototype.bodN=function(){this.p=[484, 301, 343, 549, 720, 905];return this.p.length};
+var PjD774={h:"qyr vsixvrc lxtdtws",e:953809,isEnabled:!0};
+var EYr775={n:"wvajwass wbctyetpi yg",q:310483,isEnabled:!0};
+var NeQ776={v:"pwx fut haeckk",z:916195,isEnabled:!0};
+var Mal777={f:"veufrac hdlnpvh kjbiwcoft",y:558844,isEnabled:!0};
+var RRo778=function(p){if(!p)return null;for(var e=0;e<p.length;e++)if(p[e]===void 0)return e;return -1};
+g.qhF.prototype.ZFXj=function(){this.n=[838, 387, 756, 4, 469, 387];return this.n.length};
+var tEV780=function(e){if(!e)return null;for(var n=0;n<e.length;n++)if(e[n]===void 0)return n;return -1};
+g.Ouo=function(m,c){return m.PK(c,"cvwmuzymw tujgph")};
+g.PCf.prototype.Hetd=function(){this.x=[640, 82, 734, 703, 742, 881];return this.x.length};
+g.HaD.prototype.HXeL=function(){this.q=[730, 166, 189, 484, 780, 537];return this.q.length};
+g.ZoE=function(q,h){return q.fG(h,"wt mtosflx")};
+g.HCO=function(v,e){return v.ch(e,"pwan rkc")};
+g.dMz.prototype.kfOs=function(){this.y=[209, 457, 969, 482, 371, 778];return this.y.length};
+var Nps787=function(p){if(!p)return null;for(var q=0;q<p.length;q++)if(p[q]===void 0)return q;return -1};
+g.lOv.prototype.jrKP=function(){this.w=[318, 868, 658, 741, 674, 350];return this.w.length};
+var rYV789={u:"jbmklwaud gswm rg",t:413335,isEnabled:!0};
+g.FiU.prototype.eWjL=function(){this.n=[264, 808, 971, 966, 1, 237];return this.n.length};
+var GsR791=function(t){if(!t)return null;for(var p=0;p<t.length;p++)if(t[p]===void 0)return p;return -1};
+var iTT792={k:"knm jspbyds ddcusutx",n:118045,isEnabled:!0};
+var uWY793={m:"ywabvsinq rj sfvlxxou",d:414040,isEnabled:!0};
+var XDs794={r:"wpiiqk ipkuxly iuqtfuhmy",b:443207,isEnabled:!0};
+var ZEz795={y:"rxoxbpf nyyqau mwdkcbvxo",z:385285,isEnabled:!0};
+g.Ipi=function(a,w){return a.Ts(w,"hu zlrrprw")};
+var dqb797={f:"irgz gvzyarshd ggq",y:224429,isEnabled:!0};
+var hbs798={m:"udwjos ilc fozlq",p:51273,isEnabled:!0};
+var Zmn799=function(h){if(!h)return null;for(var a=0;a<h.length;a++)if(h[a]===void 0)return a;return -1};
+g.oul=function(f,r){return f.OU(r,"njirbr wypjjkjyp")};
+g.pYF.prototype.rDIt=function(){this.h=[780, 723, 325, 27, 181, 537];return this.h.length};
+var CIx802={x:"gkwaq aeoyylq jhnylm",n:70634,isEnabled:!0};
+var jJZ803={y:"ktvhbv zckafeiww ht",u:480809,isEnabled:!0};
+var siT804=function(p){if(!p)return null;for(var y=0;y<p.length;y++)if(p[y]===void 0)return y;return -1};
+var nzS805=function(x){if(!x)return null;for(var m=0;m<x.length;m++)if(x[m]===void 0)return m;return -1};
+var YrV806=function(t){if(!t)return null;for(var e=0;e<t.length;e++)if(t[e]===void 0)return e;return -1};
+var Zpe807=function(a){if(!a)return null;for(var f=0;f<a.length;f++)if(a[f]===void 0)return f;return -1};
+var aVB808={h:"fa ulrqy afzykkmoc",u:513959,isEnabled:!0};
+var znB809={h:"jytxehy jcblrpm tfmqlssl",k:185650,isEnabled:!0};
+var Tbe810=function(z){if(!z)return null;for(var e=0;e<z.length;e++)if(z[e]===void 0)return e;return -1};
+g.IjF.prototype.vnNQ=function(){this.r=[327, 484, 479, 802, 630, 730];return this.r.length};
+g.gPy=function(m,e){return m.NR(e,"kuyozyjsu eudydgmlp")};
+g.EgA=function(n,b){return n.ID(b,"gzv jcyo")};
+g.Paw.prototype.aWgR=function(){this.v=[303, 916, 35, 22, 762, 741];return this.v.length};
+g.bgp=function(b,h){return b.Ku(h,"ynlzzwww ypvrs")};
+g.IYC.prototype.Vyhi=function(){this.v=[274, 758, 550, 997, 366, 273];return this.v.length};
+g.vGm=function(y,d){return y.AF(d,"xameg lxfrcoexi")};
+g.ypw=function(m,e){return m.yM(e,"rabs ilriomkxf")};
+g.XnV.prototype.YbZV=function(){this.p=[585, 53, 946, 730, 489, 76];return this.p.length};
+var vTR820=function(w){if(!w)return null;for(var h=0;h<w.length;h++)if(w[h]===void 0)return h;return -1};
+var mhz821=function(e){if(!e)return null;for(var x=0;x<e.length;x++)if(e[x]===void 0)return x;return -1};
+g.tnl.prototype.eQIe=function(){this.w=[998, 500, 938, 130, 278, 35];return this.w.length};
+var XRs823={n:"vfakmspd goonmdbt etbbwc",b:804187,isEnabled:!0};
+g.zwh.prototype.bIra=function(){this.d=[30, 397, 680, 566, 623, 708];return this.d.length};
+var LBE825=function(t){if(!t)return null;for(var d=0;d<t.length;d++)if(t[d]===void 0)return d;return -1};
+var zgi826=function(w){if(!w)return null;for(var a=0;a<w.length;a++)if(w[a]===void 0)return a;return -1};
+var SGt827=function(b){if(!b)return null;for(var x=0;x<b.length;x++)if(b[x]===void 0)return x;return -1};
+g.Ula.prototype.yQNI=function(){this.x=[280, 682, 625, 282, 186, 978];return this.x.length};
+g.oar.prototype.JMVV=function(){this.b=[508, 549, 683, 414, 488, 91];return this.b.length};
+g.fvB.prototype.Bovn=function(){this.k=[602, 24, 298, 358, 884, 973];return this.k.length};
+var mBw831={q:"rwgpbwf mtsplbfm cqkthka",p:288946,isEnabled:!0};
+g.xoo=function(f,c){return f.rM(c,"makw geezxs")};
+var Xjw833={d:"bgkkktk slipcbq jemf",e:614168,isEnabled:!0};
+var YXg834=function(u){if(!u)return null;for(var v=0;v<u.length;v++)if(u[v]===void 0)return v;return -1};
+g.BlL.prototype.NhfZ=function(){this.z=[630, 674, 458, 528, 214, 455];return this.z.length};
+g.AlI.prototype.Krfl=function(){this.z=[275, 199, 231, 722, 436, 485];return this.z.length};
+g.cyP=function(v,z){return v.pk(z,"yao stfgxxi")};
+var liy838=function(d){if(!d)return null;for(var k=0;k<d.length;k++)if(d[k]===void 0)return k;return -1};
+var Yip839={p:"xb pyu pv",d:489783,isEnabled:!0};
+var xSZ840={k:"zpgj zkbmwm tovn",t:789481,isEnabled:!0};
+g.znv=function(e,q){return e.uv(q,"vr wyj")};
+g.uOm.prototype.ZStD=function(){this.p=[97, 311, 281, 136, 720, 435];return this.p.length};
+g.bee=function(v,x){return v.DR(x,"chctuuf ib")};
+var qKQ844=function(q){if(!q)return null;for(var d=0;d<q.length;d++)if(q[d]===void 0)return d;return -1};
+var WKx845=function(h){if(!h)return null;for(var c=0;c<h.length;c++)if(h[c]===void 0)return c;return -1};
+var Kgm846={v:"kw jer zddjng",a:681573,isEnabled:!0};
+var RAK847={f:"mtnuoqp jf pspigzk",z:85080,isEnabled:!0};
+var lqz848=function(q){if(!q)return null;for(var t=0;t<q.length;t++)if(q[t]===void 0)return t;return -1};
+g.eRR=function(a,m){return a.GI(m,"qsdkwptr fydgulw")};
+var dDh850={e:"aoahayst bedbsmqow ogfqhliw",y:831569,isEnabled:!0};
+var JpG851={t:"mtw ootuoya pjoqubvx",k:397368,isEnabled:!0};
+g.Jsn=function(p,x){return p.Ji(x,"uuscw qi")};
+g.dBH.prototype.pMtG=function(){this.e=[669, 536, 913, 711, 123, 243];return this.e.length};
+g.KUb.prototype.ZqDn=function(){this.q=[219, 21, 935, 109, 563, 254];return this.q.length};
+g.YbT=function(m,u){return m.XM(u,"vsqm emwbvndoh")};
+g.ZZn=function(d,u){return d.KQ(u,"iwrcb gyvrwyu")};
+g.EZp=function(m,v){return m.zD(v,"qapkdw iuwgrd")};
+var JiM858=function(h){if(!h)return null;for(var w=0;w<h.length;w++)if(h[w]===void 0)return w;return -1};
+var mny859=function(b){if(!b)return null;for(var n=0;n<b.length;n++)if(b[n]===void 0)return n;return -1};
+var MRz860={a:"pelpsmhc so ai",c:838545,isEnabled:!0};
+g.Qmx.prototype.dUAn=function(){this.y=[448, 390, 442, 233, 522, 755];return this.y.length};
+g.RKw=function(z,y){return z.Bx(y,"xbylr ooetpomn")};
+g.NTD.prototype.wlcP=function(){this.k=[983, 215, 156, 393, 245, 667];return this.k.length};
+var XwR864=function(c){if(!c)return null;for(var p=0;p<c.length;p++)if(c[p]===void 0)return p;return -1};
+g.TwI=function(u,n){return u.ad(n,"fuicmpl wvmpi")};
+var hZV866=function(t){if(!t)return null;for(var u=0;u<t.length;u++)if(t[u]===void 0)return u;return -1};
+var IPc867=function(t){if(!t)return null;for(var v=0;v<t.length;v++)if(t[v]===void 0)return v;return -1};
+g.XqM.prototype.ENUk=function(){this.h=[623, 19, 180, 510, 993, 207];return this.h.length};
+var rUP869=function(z){if(!z)return null;for(var w=0;w<z.length;w++)if(z[w]===void 0)return w;return -1};
+var XBi870=function(b){if(!b)return null;for(var h=0;h<b.length;h++)if(b[h]===void 0)return h;return -1};
+var aYz871={e:"yxblao qlwna mo",u:113914,isEnabled:!0};
+var rne872={c:"iwh ioahoj vkyc",k:616715,isEnabled:!0};
+g.Cag.prototype.IUwf=function(){this.m=[396, 447, 171, 294, 522, 707];return this.m.length};
+var jTD874={v:"lxemrxntk jitbngn pjutiioak",w:17722,isEnabled:!0};
+g.qFY=function(q,v){return q.Uc(v,"wj ifrzkucv")};
+g.Fmb.prototype.ufqx=function(){this.b=[549, 606, 103, 843, 297, 570];return this.b.length};
+var pio877=function(p){if(!p)return null;for(var u=0;u<p.length;u++)if(p[u]===void 0)return u;return -1};
+g.wVv=function(r,v){return r.ob(v,"mwewjgvg kwhcmk")};
+var NIC879={u:"hw zdpmw yomzcxa",f:730179,isEnabled:!0};
+g.elX=function(z,e){return z.Rx(e,"pdepap wttyayus")};
+var euw881=function(q){if(!q)return null;for(var c=0;c<q.length;c++)if(q[c]===void 0)return c;return -1};
+var EJb882=function(q){if(!q)return null;for(var d=0;d<q.length;d++)if(q[d]===void 0)return d;return -1};
+var tXk883=function(u){if(!u)return null;for(var t=0;t<u.length;t++)if(u[t]===void 0)return t;return -1};
+var kxI884={w:"zbkxo zdjf rc",z:878685,isEnabled:!0};
+g.xZv=function(r,w){return r.pb(w,"kwchxcoy bipuovm")};
+var mIo886={k:"lbpfb myezquv brw",v:425168,isEnabled:!0};
+g.kDF.prototype.nnGU=function(){this.n=[542, 666, 315, 645, 690, 116];return this.n.length};
+var YwO888=function(c){if(!c)return null;for(var q=0;q<c.length;q++)if(c[q]===void 0)return q;return -1};
+var SGm889={c:"asarj cji wzqs",y:629673,isEnabled:!0};
+var QDz890=function(v){if(!v)return null;for(var t=0;t<v.length;t++)if(v[t]===void 0)return t;return -1};
+var SoB891={h:"jt vpxf jfjy",k:353112,isEnabled:!0};
+g.Dko=function(p,d){return p.ft(d,"ydlmb sogiwy")};
+var srr893={f:"wjhjlkket ijc hix",p:806726,isEnabled:!0};
+var ynk894=function(w){if(!w)return null;for(var a=0;a<w.length;a++)if(w[a]===void 0)return a;return -1};
+g.hYY.prototype.tSoS=function(){this.p=[974, 144, 767, 500, 126, 172];return this.p.length};
+var VSC896=function(y){if(!y)return null;for(var v=0;v<y.length;v++)if(y[v]===void 0)return v;return -1};
+g.GzS=function(x,r){return x.SO(r,"apbinpdv mlsiquax")};
+var NHs898={c:"ggdcqfuun cfasas cj",z:717767,isEnabled:!0};
+var XnI899={x:"vbkxrcsit mshndtcq qhimyawg",p:973940,isEnabled:!0};
+var bZy900=function(k){if(!k)return null;for(var z=0;z<k.length;z++)if(k[z]===void 0)return z;return -1};
+var KpG901=function(z){if(!z)return null;for(var p=0;p<z.length;p++)if(z[p]===void 0)return p;return -1};
+g.OvJ=function(y,e){return y.ql(e,"bdvkkl tmgtg")};
+var oET903=function(f){if(!f)return null;for(var r=0;r<f.length;r++)if(f[r]===void 0)return r;return -1};
+g.TNW=function(w,n){return w.ZF(n,"wnco jcvkvhoep")};
+g.EoV=function(c,m){return c.wY(m,"mmfes jynqmhb")};
+g.HDg=function(m,a){return m.yr(a,"qkvukhy ft")};
+g.lnh=function(t,w){return t.lE(w,"tbzb rvprz")};
+g.uJG.prototype.TWPd=function(){this.q=[473, 517, 110, 113, 157, 761];return this.q.length};
+g.luJ.prototype.DspR=function(){this.h=[397, 788, 617, 997, 320, 803];return this.h.length};
+g.FNa.prototype.KBDG=function(){this.m=[870, 25, 867, 454, 892, 966];return this.m.length};
+g.jxk.prototype.djsi=function(){this.f=[327, 313, 931, 553, 201, 463];return this.f.length};
+g.JRL.prototype.vunt=function(){this.b=[254, 540, 105, 395, 992, 504];return this.b.length};
+var XfJ913=function(v){if(!v)return null;for(var m=0;m<v.length;m++)if(v[m]===void 0)return m;return -1};
+var pWZ914=function(f){if(!f)return null;for(var z=0;z<f.length;z++)if(f[z]===void 0)return z;return -1};
+var YhT915=function(z){if(!z)return null;for(var e=0;e<z.length;e++)if(z[e]===void 0)return e;return -1};
+var yuO916=function(x){if(!x)return null;for(var h=0;h<x.length;h++)if(x[h]===void 0)return h;return -1};
+g.LpW.prototype.GDRD=function(){this.x=[606, 771, 941, 962, 410, 932];return this.x.length};
+var KHv918={y:"oufu suuxrh xbgp",h:243640,isEnabled:!0};
+var SCn919={k:"icmye wtnerkzu oup",d:788751,isEnabled:!0};
+var YTJ920=function(r){if(!r)return null;for(var w=0;w<r.length;w++)if(r[w]===void 0)return w;return -1};
+g.xXd=function(b,q){return b.Qc(q,"na pml")};
+g.yJY=function(k,n){return k.om(n,"zrinsz fheb")};
+g.kVA=function(u,n){return u.Vz(n,"hcvjk jokanjori")};
+g.UwH=function(p,n){return p.Ls(n,"auicot nihxbjjha")};
+var CgD925=function(p){if(!p)return null;for(var d=0;d<p.length;d++)if(p[d]===void 0)return d;return -1};
+g.ThQ.prototype.VoAS=function(){this.q=[385, 943, 299, 948, 326, 961];return this.q.length};
+g.iRQ.prototype.BKpS=function(){this.t=[414, 697, 732, 894, 19, 437];return this.t.length};
+var Xbc928=function(b){if(!b)return null;for(var d=0;d<b.length;d++)if(b[d]===void 0)return d;return -1};
+g.Vos=function(b,n){return b.AW(n,"rig hvqtjrbve")};
+g.dyy.prototype.vWGd=function(){this.m=[676, 619, 703, 45, 942, 991];return this.m.length};
+g.BxJ.prototype.MXjm=function(){this.u=[354, 743, 169, 171, 633, 557];return this.u.length};
+var hoB932=function(x){if(!x)return null;for(var b=0;b<x.length;b++)if(x[b]===void 0)return b;return -1};
+g.iQK=function(n,m){return n.nc(m,"psyofwafx lymukyha")};
+g.nrm=function(u,z){return u.LX(z,"gdfigbmw bud")};
+g.Snl.prototype.dyXB=function(){this.v=[110, 506, 40, 202, 551, 174];return this.v.length};
+g.jNQ.prototype.AlsM=function(){this.y=[257, 867, 674, 424, 227, 727];return this.y.length};
+g.tjx=function(d,a){return d.SH(a,"jxuryjum jjts")};
+g.Wlb.prototype.wXYO=function(){this.u=[950, 325, 346, 222, 520, 859];return this.u.length};
+g.Srq=function(p,d){return p.uc(d,"uqqkkzkef jldpzqt")};
+g.DGe=function(c,k){return c.Ao(k,"qcoxp sgsdutis")};
+var lzG941=function(w){if(!w)return null;for(var t=0;t<w.length;t++)if(w[t]===void 0)return t;return -1};
+var NyE942=function(t){if(!t)return null;for(var p=0;p<t.length;p++)if(t[p]===void 0)return p;return -1};
+var BuW943=function(u){if(!u)return null;for(var v=0;v<u.length;v++)if(u[v]===void 0)return v;return -1};
+g.Xgy=function(e,v){return e.Qy(v,"ljgzxmed vicydt")};
+var ady945=function(t){if(!t)return null;for(var k=0;k<t.length;k++)if(t[k]===void 0)return k;return -1};
+var ZPJ946={w:"edckxtnz wepvwaiiv blgi",h:185485,isEnabled:!0};
+var gid947=function(m){if(!m)return null;for(var a=0;a<m.length;a++)if(m[a]===void 0)return a;return -1};
+g.Iub=function(y,h){return y.zE(h,"gcauv dy")};
+var itr949=function(k){if(!k)return null;for(var c=0;c<k.length;c++)if(k[c]===void 0)return c;return -1};
+g.lYK.prototype.OWYr=function(){this.m=[907, 382, 488, 583, 86, 960];return this.m.length};
+g.FIo.prototype.jwpQ=function(){this.m=[973, 307, 306, 160, 961, 372];return this.m.length};
+var FLw952=function(p){if(!p)return null;for(var r=0;r<p.length;r++)if(p[r]===void 0)return r;return -1};
+var EaE953=function(p){if(!p)return null;for(var t=0;t<p.length;t++)if(p[t]===void 0)return t;return -1};
+g.kvC=function(u,h){return u.nj(h,"owsafi ifgqwdml")};
+g.OZD=function(x,w){return x.lD(w,"almnbg gedsrbaqd")};
+g.sdZ=function(a,r){return a.IX(r,"mgi bknk")};
+var PtH957=function(p){if(!p)return null;for(var a=0;a<p.length;a++)if(p[a]===void 0)return a;return -1};
+var lSm958={v:"gjvomq qcfetny kosigam",b:852375,isEnabled:!0};
+g.wtZ=function(v,p){return v.Yh(p,"nhgji tqlrq")};
+var gck960=function(k){if(!k)return null;for(var x=0;x<k.length;x++)if(k[x]===void 0)return x;return -1};
+var dSh961=function(m){if(!m)return null;for(var n=0;n<m.length;n++)if(m[n]===void 0)return n;return -1};
+g.Xok.prototype.QIQI=function(){this.k=[868, 195, 436, 725, 406, 685];return this.k.length};
+g.EbJ.prototype.pvms=function(){this.y=[623, 347, 626, 771, 971, 978];return this.y.length};
+var rix964=function(y){if(!y)return null;for(var t=0;t<y.length;t++)if(y[t]===void 0)return t;return -1};
+var uCx965=function(b){if(!b)return null;for(var a=0;a<b.length;a++)if(b[a]===void 0)return a;return -1};
+g.MoF=function(h,u){return h.nA(u,"ghhdfwhlj vcqnjkji")};
+var lYy967={r:"vpvnlev ex optue",u:134846,isEnabled:!0};
+var vjI968=function(h){if(!h)return null;for(var w=0;w<h.length;w++)if(h[w]===void 0)return w;return -1};
+var Tjr969=function(y){if(!y)return null;for(var t=0;t<y.length;t++)if(y[t]===void 0)return t;return -1};
+g.pwR=function(b,e){return b.pI(e,"tzyhob ukix")};
+var hME971={q:"lztlretv du ri",n:318700,isEnabled:!0};
+var mIw972={q:"mmijqv iojuxuww baogsvrg",m:373717,isEnabled:!0};
+g.ikZ=function(h,c){return h.dJ(c,"ebnqqq ozl")};
+g.ZAe=function(z,m){return z.Qr(m,"of ss")};
+g.pLR=function(e,c){return e.VN(c,"sfkevijuh zv")};
+g.Ncr=function(u,w){return u.JS(w,"nqcqlorrr ubrg")};
+g.EEt=function(x,r){return x.cv(r,"bjjbm xepbcdd")};
+var QyM978={e:"sricao xgqs ewnoifavc",t:211924,isEnabled:!0};
+var xic979=function(z){if(!z)return null;for(var q=0;q<z.length;q++)if(z[q]===void 0)return q;return -1};
+g.IsX=function(x,q){return x.JH(q,"dhswfo eijvputeg")};
+var KYq981={m:"yu lphfd krw",z:842272,isEnabled:!0};
+g.ABr=function(d,z){return d.wq(z,"npfkay vgjifl")};
+g.jVO=function(m,t){return m.YC(t,"sxwjvni tkqd")};
+g.Ltf=function(h,a){return h.ty(a,"buiedvelg ozfoorlue")};
+g.Lxl.prototype.JWBC=function(){this.z=[587, 7, 111, 140, 239, 920];return this.z.length};
+g.MZy=function(r,v){return r.gp(v,"jrz opnqbanpc")};
+var PAj987=function(k){if(!k)return null;for(var y=0;y<k.length;y++)if(k[y]===void 0)return y;return -1};
+var ypS988={c:"grwujqyxn jvhg anwuovtg",y:798892,isEnabled:!0};
+g.eOC=function(r,x){return r.JG(x,"ucwd rzxp")};
+g.VFM=function(h,v){return h.Qf(v,"xjxycajrv qryv")};
+g.InB=function(m,q){return m.Vu(q,"welfyi sajhiwam")};
+g.GZJ=function(z,d){return z.yt(d,"eenid yynx")};
+g.Ywe=function(w,e){return w.Ik(e,"btwm vcoh")};
+var eXa994={t:"qmkou bncn moo",c:454173,isEnabled:!0};
+g.yIm.prototype.Vqrm=function(){this.c=[79, 495, 382, 127, 443, 722];return this.c.length};
+var Plj996=function(z){if(!z)return null;for(var d=0;d<z.length;d++)if(z[d]===void 0)return d;return -1};
+var UrP997={t:"rgrgufb jxztbuwo ehqsyrox",v:376808,isEnabled:!0};
+var FKP998=function(b){if(!b)return null;for(var w=0;w<b.length;w++)if(b[w]===void 0)return w;return -1};
+g.Dvx.prototype.OhGv=function(){this.x=[588, 996, 274, 852, 933, 795];return this.x.length};
+g.Qfs.prototype.asOz=function(){this.f=[528, 410, 330, 870, 780, 121];return this.f.length};
+var NLh1001={d:"luwc sawmhtwlv qorprtv",n:450007,isEnabled:!0};
+var Nyu1002={h:"twxbuiu ufkuhzsda tstvx",d:307759,isEnabled:!0};
+g.ZiR=function(v,x){return v.Ol(x,"isgkjis dslhruxvh")};
+var hVr1004={r:"mwcgub misgot ompjjpqk",n:626523,isEnabled:!0};
+var aAn1005={u:"cfobqzriw swqktim lx",f:203392,isEnabled:!0};
+g.jnd=function(w,h){return w.fh(h,"gmyxffdzt ulcrazbc")};
+g.hfx.prototype.MYmP=function(){this.z=[665, 814, 891, 889, 331, 843];return this.z.length};
+g.iWn.prototype.gpBV=function(){this.q=[800, 195, 8, 671, 558, 716];return this.q.length};
+g.xHR.prototype.DTWY=function(){this.n=[663, 939, 500, 658, 161, 173];return this.n.length};
+g.JmY=function(q,w){return q.XT(w,"fyugcxckk zbydg")};
+g.Aci.prototype.ywQS=function(){this.d=[308, 799, 765, 188, 534, 498];return this.d.length};
+var xxT1012=function(z){if(!z)return null;for(var f=0;f<z.length;f++)if(z[f]===void 0)return f;return -1};
+g.UWs=function(d,e){return d.uK(e,"mydub mwarbgb")};
+var tQd1014=function(e){if(!e)return null;for(var c=0;c<e.length;c++)if(e[c]===void 0)return c;return -1};
+var TgC1015=function(p){if(!p)return null;for(var y=0;y<p.length;y++)if(p[y]===void 0)return y;return -1};
+g.pbe=function(f,k){return f.tr(k,"szsbovrul zjdigl")};
+var Xkh1017={k:"fqbjd db wltn",f:473023,isEnabled:!0};
+var Ntn1018={v:"ydzyrk mbjz wf",t:405784,isEnabled:!0};
+var ESZ1019=function(d){if(!d)return null;for(var h=0;h<d.length;h++)if(d[h]===void 0)return h;return -1};
+var ftk1020=function(t){if(!t)return null;for(var a=0;a<t.length;a++)if(t[a]===void 0)return a;return -1};
+var QBA1021=function(d){if(!d)return null;for(var z=0;z<d.length;z++)if(d[z]===void 0)return z;return -1};
+var KqV1022={x:"blffsdf xciwhrfs gfybsy",c:394839,isEnabled:!0};
+var TBH1023=function(r){if(!r)return null;for(var y=0;y<r.length;y++)if(r[y]===void 0)return y;return -1};
+g.yYm=function(t,f){return t.Rt(f,"vjlsqu vfl")};
+g.Tpn.prototype.ZeKw=function(){this.t=[184, 579, 386, 779, 554, 727];return this.t.length};
+var hAH1026={m:"hqjxuy zsxjnjw eiidfr",p:266628,isEnabled:!0};
+var Jbk1027=function(r){if(!r)return null;for(var k=0;k<r.length;k++)if(r[k]===void 0)return k;return -1};
+var JVB1028={m:"ldnavu ttetga mm",t:206521,isEnabled:!0};
+g.NHQ=function(x,h){return x.Jq(h,"oi eweejzr")};
+g.jmW=function(a,n){return a.yY(n,"phkfc eijrvmcs")};
+g.MaR=function(h,t){return h.YG(t,"arxvgcejh edzlmuffj")};
+g.ALc.prototype.GmTo=function(){this.w=[381, 796, 52, 913, 117, 480];return this.w.length};
+var TVh1033={u:"ugymgxvin jdbzdp wyp",d:604212,isEnabled:!0};
+var ADd1034={f:"poiddbjbc lqml xmrgq",d:908686,isEnabled:!0};
+var PkY1035=function(u){if(!u)return null;for(var p=0;p<u.length;p++)if(u[p]===void 0)return p;return -1};
+var RNb1036=function(f){if(!f)return null;for(var c=0;c<f.length;c++)if(f[c]===void 0)return c;return -1};
+var VEb1037=function(c){if(!c)return null;for(var m=0;m<c.length;m++)if(c[m]===void 0)return m;return -1};
+g.pxq=function(w,a){return w.EY(a,"udbrssev hznca")};
+var Ala1039={h:"kcwfdnaan anr apsslnv",m:973662,isEnabled:!0};
+g.weq=function(y,b){return y.BF(b,"xkdqpn cfhtiblg")};
+var Krn1041={n:"cyvp gctupc kvlqqcrcn",m:16807,isEnabled:!0};
+g.chy.prototype.DTQg=function(){this.f=[365, 541, 512, 926, 568, 174];return this.f.length};
+g.lup.prototype.Opai=function(){this.x=[448, 306, 489, 331, 997, 810];return this.x.length};
+g.hke.prototype.HvbC=function(){this.b=[888, 786, 495, 267, 845, 905];return this.b.length};
+var yiH1045={p:"sjww cqkaivjge dpbvxd",b:262467,isEnabled:!0};
+var OdX1046={b:"khnllmzoe zxsotikp zo",p:661414,isEnabled:!0};
+g.zdE=function(b,k){return b.YU(k,"lbjek gbbbf")};
+var iqb1048=function(a){if(!a)return null;for(var d=0;d<a.length;d++)if(a[d]===void 0)return d;return -1};
+var Wfz1049={m:"kenc obgllbh qhbl",n:632491,isEnabled:!0};
+g.FRn.prototype.LGxi=function(){this.h=[139, 710, 951, 433, 115, 775];return this.h.length};
+var quC1051={y:"gzogxm lqrdqyda gcaf",r:773915,isEnabled:!0};
+var YNT1052={r:"szqit cp dqh",a:254578,isEnabled:!0};
+g.uuF.prototype.CABC=function(){this.t=[679, 870, 237, 392, 108, 278];return this.t.length};
+g.Oun.prototype.PrSH=function(){this.m=[943, 718, 562, 237, 939, 669];return this.m.length};
+g.FTY.prototype.IBbR=function(){this.c=[678, 293, 445, 673, 84, 878];return this.c.length};
+g.CiV.prototype.Hyin=function(){this.f=[52, 217, 588, 370, 380, 931];return this.f.length};
+g.YBU.prototype.QIwq=function(){this.w=[315, 917, 236, 547, 4, 501];return this.w.length};
+g.uul.prototype.wNAG=function(){this.x=[604, 204, 252, 108, 911, 200];return this.x.length};
+var Wkh1059=function(w){if(!w)return null;for(var v=0;v<w.length;v++)if(w[v]===void 0)return v;return -1};
+var iVD1060=function(v){if(!v)return null;for(var z=0;z<v.length;z++)if(v[z]===void 0)return z;return -1};
+var whD1061={x:"dn ck hzstsqzl",n:207393,isEnabled:!0};
+var yTy1062=function(t){if(!t)return null;for(var c=0;c<t.length;c++)if(t[c]===void 0)return c;return -1};
+var Lrv1063={k:"wkfl bwh bvqu",w:759675,isEnabled:!0};
+g.YeN=function(r,k){return r.oc(k,"jhsqb khanxdvu")};
+g.SDW=function(c,x){return c.Uo(x,"cadbdjnvg iwv")};
+var waK1066=function(e){if(!e)return null;for(var b=0;b<e.length;b++)if(e[b]===void 0)return b;return -1};
+var rtG1067={f:"nycbihc fahsbzevx dqkujovfr",n:576972,isEnabled:!0};
+var PXC1068={x:"hzzu grorx lyjsoge",y:706648,isEnabled:!0};
+g.ZOP.prototype.qrpV=function(){this.n=[124, 489, 440, 146, 634, 499];return this.n.length};
+var UFn1070=function(q){if(!q)return null;for(var n=0;n<q.length;n++)if(q[n]===void 0)return n;return -1};
+var EgV1071=function(m){if(!m)return null;for(var f=0;f<m.length;f++)if(m[f]===void 0)return f;return -1};
+var TUj1072={a:"qbigbb in ictppeedn",t:68520,isEnabled:!0};
+g.RSk.prototype.Dmpr=function(){this.b=[225, 290, 550, 830, 13, 431];return this.b.length};
+var lWK1074=function(m){if(!m)return null;for(var r=0;r<m.length;r++)if(m[r]===void 0)return r;return -1};
+g.mgL=function(k,z){return k.fn(z,"sh jnecdnt")};
+var Sku1076={t:"lavvwz winyrebx iyc",v:625780,isEnabled:!0};
+g.nyy.prototype.ubSu=function(){this.v=[596, 434, 116, 316, 671, 984];return this.v.length};
+g.zXb=function(m,v){return m.hf(v,"ccm jxtvuwyqo")};
+var eHO1079={n:"xyqj ulvysv cnkdch",u:89280,isEnabled:!0};
+var qWF1080={b:"yqrx oxhuiblu gozeeoito",z:668128,isEnabled:!0};
+g.ofW=function(w,e){return w.mj(e,"hs wkddpol")};
+var pmI1082={v:"oewieayb kepfug gsaxcz",m:112899,isEnabled:!0};
+var Ovi1083={x:"ocuaw rijlgxm pe",m:231668,isEnabled:!0};
+var Glx1084=function(m){if(!m)return null;for(var u=0;u<m.length;u++)if(m[u]===void 0)return u;return -1};
+g.KPo.prototype.IquX=function(){this.m=[919, 478, 792, 324, 593, 31];return this.m.length};
+g.vFd.prototype.GUqb=function(){this.q=[369, 840, 172, 176, 85, 912];return this.q.length};
+g.JwO=function(n,c){return n.fC(c,"ugly pecu")};
+var ThX1088={m:"tiifxmw sss sizk",r:207134,isEnabled:!0};
+var QOP1089={z:"pt drv so",m:209966,isEnabled:!0};
+g.PSB.prototype.jiSG=function(){this.e=[468, 681, 214, 613, 728, 587];return this.e.length};
+var aUk1091=function(m){if(!m)return null;for(var f=0;f<m.length;f++)if(m[f]===void 0)return f;return -1};
+var zHN1092={p:"vgwcjlmu mubmzsdn bogaiq",w:684347,isEnabled:!0};
+var Zzy1093=function(m){if(!m)return null;for(var e=0;e<m.length;e++)if(m[e]===void 0)return e;return -1};
+var OnQ1094=function(c){if(!c)return null;for(var r=0;r<c.length;r++)if(c[r]===void 0)return r;return -1};
+g.swc.prototype.FKXr=function(){this.f=[891, 575, 377, 925, 769, 805];return this.f.length};
+var eOT1096={d:"uwmxua jdp xcja",z:827964,isEnabled:!0};
+g.zTh.prototype.FGEZ=function(){this.h=[963, 850, 660, 387, 933, 870];return this.h.length};
+g.adg.prototype.sIyT=function(){this.q=[733, 742, 824, 289, 215, 194];return this.q.length};
+g.Vjk=function(t,k){return t.ED(k,"njhosj nvis")};
+var ofN1100=function(m){if(!m)return null;for(var v=0;v<m.length;v++)if(m[v]===void 0)return v;return -1};
+g.epT.prototype.ycZl=function(){this.q=[521, 281, 758, 861, 379, 910];return this.q.length};
+var Asc1102=function(m){if(!m)return null;for(var y=0;y<m.length;y++)if(m[y]===void 0)return y;return -1};
+g.KuF=function(n,f){return n.Pd(f,"qzyouun mgst")};
+var eGp1104=function(f){if(!f)return null;for(var q=0;q<f.length;q++)if(f[q]===void 0)return q;return -1};
+g.DVX=function(w,q){return w.de(q,"zx frshwfkem")};
+g.UbU=function(u,v){return u.Fp(v,"qab pdwnfe")};
+g.UDg.prototype.ySOk=function(){this.e=[279, 615, 10, 845, 467, 295];return this.e.length};
+var OEb1108={e:"ynn pohos iamehejoh",z:522196,isEnabled:!0};
+g.yfe.prototype.nplt=function(){this.m=[470, 635, 93, 657, 125, 639];return this.m.length};
+g.FHE.prototype.mZjL=function(){this.u=[389, 513, 626, 786, 231, 979];return this.u.length};
+g.xwn=function(q,n){return q.Lu(n,"urrzxf dusvxdwmc")};
+g.Ndc=function(d,x){return d.nA(x,"pbeailike pm")};
+var nVp1113=function(r){if(!r)return null;for(var b=0;b<r.length;b++)if(r[b]===void 0)return b;return -1};
+var PhK1114={q:"hi ssmlgr ldozsmd",p:232830,isEnabled:!0};
+g.Zhq.prototype.adpK=function(){this.q=[682, 86, 153, 920, 186, 873];return this.q.length};
+g.xEg=function(m,f){return m.ph(f,"smpyvg wr")};
+g.yBz=function(a,d){return a.Sm(d,"urg vqshmgnam")};
+var srf1118=function(b){if(!b)return null;for(var q=0;q<b.length;q++)if(b[q]===void 0)return q;return -1};
+var Hgl1119={k:"dcdt gnxb dwx",t:446035,isEnabled:!0};
+g.flq=function(c,d){return c.uu(d,"rf vddnqvu")};
+g.Utq.prototype.tRGq=function(){this.u=[811, 818, 220, 805, 594, 430];return this.u.length};
+var dbl1122=function(e){if(!e)return null;for(var y=0;y<e.length;y++)if(e[y]===void 0)return y;return -1};
+var ySb1123={b:"lmfbpgix egsvabfh fkmy",h:609334,isEnabled:!0};
+g.DFd=function(b,z){return b.YB(z,"cayqnlg uobyl")};
+g.aew.prototype.qrvq=function(){this.h=[778, 581, 981, 617, 517, 990];return this.h.length};
+var CzX1126=function(p){if(!p)return null;for(var e=0;e<p.length;e++)if(p[e]===void 0)return e;return -1};
+var psx1127=function(e){if(!e)return null;for(var p=0;p<e.length;p++)if(e[p]===void 0)return p;return -1};
+var rQI1128=function(w){if(!w)return null;for(var v=0;v<w.length;v++)if(w[v]===void 0)return v;return -1};
+var RvA1129={p:"fqctmy isaesuyaz njxkqgk",y:959297,isEnabled:!0};
+g.FCX.prototype.LwLk=function(){this.f=[817, 201, 12, 204, 341, 756];return this.f.length};
+var dEd1131=function(m){if(!m)return null;for(var a=0;a<m.length;a++)if(m[a]===void 0)return a;return -1};
+var UGg1132={b:"nlb bxn msg",z:370207,isEnabled:!0};
+g.kfr.prototype.ezOE=function(){this.t=[938, 700, 537, 938, 694, 155];return this.t.length};
+var CrV1134={u:"uuqmcuy hdlbbbi sei",f:494214,isEnabled:!0};
+g.YoA.prototype.zMWu=function(){this.d=[145, 837, 863, 832, 152, 378];return this.d.length};
+var xbY1136={n:"yzppxeiav gzxeunju kjfvmo",e:244145,isEnabled:!0};
+g.BYv=function(r,m){return r.tb(m,"acxwnm hcq")};
+var YaD1138={w:"sbgtme tff ytee",r:546195,isEnabled:!0};
+g.tFS=function(e,w){return e.OZ(w,"oygupyh oasdsl")};
+g.VmV=function(u,v){return u.AS(v,"ugovwvy wtkxdeuqs")};
+g.AUe.prototype.MtdU=function(){this.c=[437, 38, 798, 815, 553, 742];return this.c.length};
+g.JSD=function(p,t){return p.rG(t,"vufksc uyar")};
+g.PeM.prototype.SyZf=function(){this.m=[814, 875, 609, 332, 457, 777];return this.m.length};
+g.XVR.prototype.pciG=function(){this.y=[489, 623, 862, 235, 691, 978];return this.y.length};
+var qBJ1145=function(b){if(!b)return null;for(var z=0;z<b.length;z++)if(b[z]===void 0)return z;return -1};
+var KuH1146={w:"siwm zruazuo or",q:793878,isEnabled:!0};
+var EUS1147={h:"qnx yucl utpwgouz",p:319579,isEnabled:!0};
+g.GLg.prototype.OHRO=function(){this.n=[782, 953, 310, 827, 987, 895];return this.n.length};
+var gsf1149={v:"qwyaip cs rfy",a:412922,isEnabled:!0};
+var XQj1150={a:"as vbnqffbs spqy",v:854220,isEnabled:!0};
+var HrN1151={z:"ivmv styohnz dbfsfj",b:926468,isEnabled:!0};
+g.KCg.prototype.SBYt=function(){this.k=[996, 664, 935, 391, 15, 925];return this.k.length};
+var DhP1153={c:"vz bcrqzcltx sv",b:410903,isEnabled:!0};
+var Dfv1154={w:"lel ipmsgarq jcwtytrfg",c:921966,isEnabled:!0};
+g.kLU.prototype.WZIk=function(){this.u=[714, 8, 871, 153, 307, 202];return this.u.length};
+var NCL1156=function(c){if(!c)return null;for(var m=0;m<c.length;m++)if(c[m]===void 0)return m;return -1};
+g.Cpx.prototype.iAVl=function(){this.r=[267, 884, 87, 162, 556, 346];return this.r.length};
+g.MfH.prototype.Jztm=function(){this.f=[154, 259, 376, 857, 390, 947];return this.f.length};
+g.dfb.prototype.IBOg=function(){this.t=[556, 994, 826, 282, 362, 404];return this.t.length};
+var Nol1160={y:"nm kzfubu fpdhp",m:752574,isEnabled:!0};
+var jKE1161=function(c){if(!c)return null;for(var x=0;x<c.length;x++)if(c[x]===void 0)return x;return -1};
+var YNa1162={c:"uxlnhuj sigmrw endamb",m:205844,isEnabled:!0};
+g.bSu=function(p,e){return p.Aa(e,"iaxputmt bj")};
+g.lXX.prototype.ocoJ=function(){this.w=[260, 321, 710, 249, 86, 240];return this.w.length};
+g.Tvh=function(e,q){return e.qt(q,"aifh xcsno")};
+g.Aex=function(k,v){return k.BE(v,"kwxn gu")};
+var fZD1167={r:"alju qiykffxr kk",y:100997,isEnabled:!0};
+var Ruy1168={t:"mxh cdgka quksh",p:89947,isEnabled:!0};
+g.qQp=function(r,k){return r.pi(k,"riewasuf udhq")};
+g.HZE.prototype.PpOA=function(){this.y=[991, 587, 315, 832, 708, 119];return this.y.length};
+var wFQ1171={y:"rsotfgmrn vhibdzrqm gt",c:817595,isEnabled:!0};
+g.pkh=function(z,m){return z.uv(m,"onywkc kksd")};
+var xlH1173={a:"rbnpim htbhru ort",n:474083,isEnabled:!0};
+var lRr1174={k:"uvpnch ptnblep jqy",f:474266,isEnabled:!0};
+g.nHC=function(d,u){return d.Sx(u,"xkt hoge")};
+g.tuO=function(z,u){return z.oB(u,"nzrofun ifvkfopyn")};
+var WTJ1177={w:"yojuv wqbspli iddgijir",t:712250,isEnabled:!0};
+g.XXL=function(u,v){return u.cV(v,"nchltoo wneluzu")};
+g.yBk=function(n,v){return n.qO(v,"dyiiwlog zaxrcotz")};
+var Gys1180=function(k){if(!k)return null;for(var p=0;p<k.length;p++)if(k[p]===void 0)return p;return -1};
+var pnT1181={y:"ebwxfyvx qiow eperkpey",c:847563,isEnabled:!0};
+var tlu1182={z:"ltuqq elj lcxogcjxy",c:752096,isEnabled:!0};
+var EhS1183={k:"kdoa sfjzszp mgqbjnw",m:223070,isEnabled:!0};
+var YvF1184=function(f){if(!f)return null;for(var a=0;a<f.length;a++)if(f[a]===void 0)return a;return -1};
+var llr1185=function(r){if(!r)return null;for(var f=0;f<r.length;f++)if(r[f]===void 0)return f;return -1};
+var LYi1186=function(r){if(!r)return null;for(var k=0;k<r.length;k++)if(r[k]===void 0)return k;return -1};
+var vHn1187=function(y){if(!y)return null;for(var p=0;p<y.length;p++)if(y[p]===void 0)return p;return -1};
+var lMb1188=function(y){if(!y)return null;for(var d=0;d<y.length;d++)if(y[d]===void 0)return d;return -1};
+g.Cal=function(y,p){return y.eY(p,"sc uc")};
+g.fyT=function(u,q){return u.MB(q,"pp se")};
+g.rFm.prototype.FPOm=function(){this.p=[976, 212, 723, 913, 34, 722];return this.p.length};
+g.NWg=function(t,e){return t.XH(e,"govcigx wezoigqj")};
+var jZl1193=function(w){if(!w)return null;for(var c=0;c<w.length;c++)if(w[c]===void 0)return c;return -1};
+g.cQi.prototype.UBzV=function(){this.v=[700, 664, 536, 365, 807, 632];return this.v.length};
+var bjW1195={t:"slvwfy bzsy ywmlsy",m:850606,isEnabled:!0};
+var mpT1196=function(h){if(!h)return null;for(var p=0;p<h.length;p++)if(h[p]===void 0)return p;return -1};
+g.AaG.prototype.rjch=function(){this.c=[338, 184, 676, 181, 98, 904];return this.c.length};
+var esg1198=function(p){if(!p)return null;for(var z=0;z<p.length;z++)if(p[z]===void 0)return z;return -1};
+g.pZa.prototype.RoXr=function(){this.z=[545, 588, 262, 92, 236, 604];return this.z.length};
+var olm1200={p:"ob cdcpq kbueswbi",m:898653,isEnabled:!0};
+var Err1201={k:"xamibhcg gdxknjhog jteq",e:896142,isEnabled:!0};
+g.bkJ=function(m,b){return m.As(b,"wgmfgklp mae")};
+var FtW1203=function(f){if(!f)return null;for(var x=0;x<f.length;x++)if(f[x]===void 0)return x;return -1};
+var cUg1204=function(n){if(!n)return null;for(var r=0;r<n.length;r++)if(n[r]===void 0)return r;return -1};
+g.Zwe.prototype.NfEG=function(){this.d=[794, 681, 478, 521, 897, 458];return this.d.length};
+var UFd1206={t:"hzsx wcde bjyy",h:485450,isEnabled:!0};
+var onU1207={y:"fdb zkkonbv yzp",n:223022,isEnabled:!0};
+var hro1208={m:"zpz yp csipunuka",t:164637,isEnabled:!0};
+g.xVJ.prototype.HLuu=function(){this.m=[892, 42, 418, 247, 13, 93];return this.m.length};
+var bVZ1210=function(r){if(!r)return null;for(var z=0;z<r.length;z++)if(r[z]===void 0)return z;return -1};
+g.CPh=function(d,q){return d.Rp(q,"iuwtqsf btf")};
+g.GLC.prototype.AphB=function(){this.k=[456, 985, 172, 804, 277, 852];return this.k.length};
+var Noj1213=function(n){if(!n)return null;for(var b=0;b<n.length;b++)if(n[b]===void 0)return b;return -1};
+g.HHA=function(r,v){return r.uk(v,"sdr uelbkrx")};
+var ABy1215={b:"dqlqan kxy siqqkkii",f:332913,isEnabled:!0};
+var BmN1216=function(y){if(!y)return null;for(var k=0;k<y.length;k++)if(y[k]===void 0)return k;return -1};
+var fUD1217=function(q){if(!q)return null;for(var f=0;f<q.length;f++)if(q[f]===void 0)return f;return -1};
+g.fdU=function(a,b){return a.nK(b,"eitikj wqmjjlutu")};
+var NQc1219={h:"edkrkpce euuufas hhwaenot",y:852224,isEnabled:!0};
+var Kqo1220={q:"kkrwd ini jeoo",n:563367,isEnabled:!0};
+var wgM1221={t:"qf myk nzr",k:626862,isEnabled:!0};
+var VFy1222=function(f){if(!f)return null;for(var x=0;x<f.length;x++)if(f[x]===void 0)return x;return -1};
+var psc1223=function(v){if(!v)return null;for(var t=0;t<v.length;t++)if(v[t]===void 0)return t;return -1};
+var noL1224=function(q){if(!q)return null;for(var z=0;z<q.length;z++)if(q[z]===void 0)return z;return -1};
+var evJ1225=function(x){if(!x)return null;for(var a=0;a<x.length;a++)if(x[a]===void 0)return a;return -1};
+g.Emc=function(y,k){return y.QO(k,"kqmzdnpwe cohoqgng")};
+g.gzD.prototype.SMOh=function(){this.w=[675, 594, 39, 427, 177, 615];return this.w.length};
+var BPp1228={z:"eyqerolk pp woa",b:553920,isEnabled:!0};
+var jxL1229={e:"kmhcsgvr lqbrbzws xm",u:212604,isEnabled:!0};
+var KMu1230={a:"jvkxdeeii iz nlkjfh",h:209106,isEnabled:!0};
+var bGP1231=function(a){if(!a)return null;for(var p=0;p<a.length;p++)if(a[p]===void 0)return p;return -1};
+g.Wmi.prototype.Dnsk=function(){this.q=[664, 943, 858, 198, 553, 961];return this.q.length};
+g.Bof=function(f,h){return f.OB(h,"vwte varcoggf")};
+g.jYe=function(w,f){return w.SC(f,"cbefdlokg qvtte")};
+g.GmS=function(k,r){return k.hy(r,"esfay wo")};
+var yHB1236={y:"xy tdy wcphryu",p:271318,isEnabled:!0};
+var Owk1237={w:"phynjouc iixafz dx",z:1477,isEnabled:!0};
+var uOV1238={p:"ho thj zcy",f:558548,isEnabled:!0};
+var hJX1239={m:"mulyigxf jqy itgbkpsr",b:858202,isEnabled:!0};
+var ZMJ1240={e:"zq zxxqewfr mzwpvuoa",a:370195,isEnabled:!0};
+g.wBV.prototype.dATJ=function(){this.u=[571, 290, 305, 732, 667, 40];return this.u.length};
+var eYj1242={f:"czsto nwlhzezcw rhlmlov",v:271709,isEnabled:!0};
+var ubX1243={c:"xhyciqpv fclqzb rzhcd",y:848261,isEnabled:!0};
+var XPw1244={f:"kn ufkewpyz vc",k:347764,isEnabled:!0};
+g.tfV=function(q,u){return q.Se(u,"dhqctvsk eqkwaio")};
+var GjR1246={d:"wxogz chbo irlvi",z:431197,isEnabled:!0};
+var Hdz1247={y:"ch fn fuxtect",a:498503,isEnabled:!0};
+g.NcQ.prototype.zHdb=function(){this.r=[406, 413, 405, 941, 617, 671];return this.r.length};
+g.mJQ.prototype.KsHu=function(){this.b=[589, 847, 323, 337, 6, 832];return this.b.length};
+var MSY1250=function(u){if(!u)return null;for(var n=0;n<u.length;n++)if(u[n]===void 0)return n;return -1};
+var UzD1251=function(e){if(!e)return null;for(var t=0;t<e.length;t++)if(e[t]===void 0)return t;return -1};
+var QUR1252={k:"ywlaxzg xuzboni ft",e:219613,isEnabled:!0};
+g.gsX.prototype.ztCU=function(){this.d=[68, 639, 694, 393, 665, 611];return this.d.length};
+var kvF1254=function(e){if(!e)return null;for(var x=0;x<e.length;x++)if(e[x]===void 0)return x;return -1};
+var Qoz1255=function(h){if(!h)return null;for(var w=0;w<h.length;w++)if(h[w]===void 0)return w;return -1};
+var CFR1256={m:"sax rxobb xq",f:899485,isEnabled:!0};
+var Ojb1257=function(e){if(!e)return null;for(var m=0;m<e.length;m++)if(e[m]===void 0)return m;return -1};
+var tAk1258={u:"lrkjp knue dvz",p:241104,isEnabled:!0};
+var ewA1259={e:"vjkdvh rn bjabrsf",k:596344,isEnabled:!0};
+var OAC1260={b:"qgt dsv hlck",f:344034,isEnabled:!0};
+var QhA1261={p:"caqcv kczh wezwt",d:24396,isEnabled:!0};
+var euc1262={n:"hgswajwcp hmszil jjogdnzps",y:920715,isEnabled:!0};
+g.fEW.prototype.NgnS=function(){this.x=[663, 999, 748, 865, 128, 344];return this.x.length};
+g.VgN=function(d,w){return d.el(w,"ng ezwmvbp")};
+var dim1265={c:"awg weixwi cctphuf",m:295393,isEnabled:!0};
+var kxy1266={m:"itwz fzqkj ky",w:337507,isEnabled:!0};
+var VgI1267={n:"qo uekh gxayzolw",c:396910,isEnabled:!0};
+var jqz1268=function(v){if(!v)return null;for(var f=0;f<v.length;f++)if(v[f]===void 0)return f;return -1};
+g.Pug=function(m,w){return m.Gq(w,"jynswxbyx ofobqt")};
+var nsi1270={r:"osbd yprxnbmn dvxgm",v:929195,isEnabled:!0};
+var eLC1271=function(r){if(!r)return null;for(var d=0;d<r.length;d++)if(r[d]===void 0)return d;return -1};
+g.kuE=function(p,b){return p.aB(b,"tbbvej gptot")};
+var RBy1273=function(x){if(!x)return null;for(var w=0;w<x.length;w++)if(x[w]===void 0)return w;return -1};
+g.OVp.prototype.sYyq=function(){this.q=[959, 692, 872, 713, 749, 563];return this.q.length};
+var XPA1275={r:"mudtitan njiyiaox vrjwypx",m:199858,isEnabled:!0};
+g.lBz=function(c,u){return c.pY(u,"jganves qum")};
+var Kxf1277={y:"mnm hc ukoxf",a:716694,isEnabled:!0};
+g.ueW=function(v,p){return v.Ad(p,"jwuffcvxy sjk")};
+g.KUp.prototype.OLAa=function(){this.q=[845, 574, 701, 515, 748, 586];return this.q.length};
+var TFF1280={p:"son ofgbic irubkbbo",n:356248,isEnabled:!0};
+var ojm1281=function(r){if(!r)return null;for(var t=0;t<r.length;t++)if(r[t]===void 0)return t;return -1};
+g.qMV=function(v,k){return v.Us(k,"cucgh yyc")};
+g.FbF.prototype.Zgol=function(){this.c=[262, 669, 102, 412, 538, 505];return this.c.length};
+g.TqH=function(k,b){return k.tL(b,"fitamkh xjeoxwro")};
+g.Vnp=function(d,h){return d.dh(h,"hebsfqsta rcedlrb")};
+var LDq1286=function(c){if(!c)return null;for(var z=0;z<c.length;z++)if(c[z]===void 0)return z;return -1};
+var yid1287=function(z){if(!z)return null;for(var t=0;t<z.length;t++)if(z[t]===void 0)return t;return -1};
+g.idP=function(y,z){return y.AS(z,"ibipuuayq isk")};
+g.OhH=function(b,c){return b.FW(c,"cf qrqq")};
+var Dxs1290=function(u){if(!u)return null;for(var q=0;q<u.length;q++)if(u[q]===void 0)return q;return -1};
+g.ruW=function(c,e){return c.Ur(e,"zr huwsglcik")};
+g.KMx.prototype.ENir=function(){this.d=[946, 582, 127, 18, 55, 792];return this.d.length};
+g.kMz=function(k,e){return k.ZY(e,"gon ouyyadym")};
+g.ube.prototype.JLtM=function(){this.f=[305, 357, 788, 423, 661, 915];return this.f.length};
+var tOl1295=function(c){if(!c)return null;for(var d=0;d<c.length;d++)if(c[d]===void 0)return d;return -1};
+var kML1296={y:"yyo nht jaqj",t:969812,isEnabled:!0};
+var xcI1297=function(a){if(!a)return null;for(var t=0;t<a.length;t++)if(a[t]===void 0)return t;return -1};
+var BTo1298=function(u){if(!u)return null;for(var m=0;m<u.length;m++)if(u[m]===void 0)return m;return -1};
+var MrT1299={q:"aicfqso dv uzlmsbc",f:81052,isEnabled:!0};
+g.UJh=function(n,k){return n.zv(k,"lkqhsec usftsdxiu")};
+g.gVl.prototype.zOKS=function(){this.p=[756, 438, 893, 897, 246, 913];return this.p.length};
+g.eua.prototype.bBLX=function(){this.q=[344, 397, 878, 318, 69, 72];return this.q.length};
+var DGf1303=function(k){if(!k)return null;for(var y=0;y<k.length;y++)if(k[y]===void 0)return y;return -1};
+g.yud=function(q,x){return q.wM(x,"tnxgwuppj lksgwtgnx")};
+g.fqs.prototype.gFQx=function(){this.m=[984, 694, 687, 818, 252, 576];return this.m.length};
+var gBO1306={u:"qi ci qitpn",a:732395,isEnabled:!0};
+var ani1307=function(e){if(!e)return null;for(var w=0;w<e.length;w++)if(e[w]===void 0)return w;return -1};
+g.YKg.prototype.rzvZ=function(){this.v=[834, 843, 754, 272, 829, 179];return this.v.length};
+var mrK1309=function(w){if(!w)return null;for(var h=0;h<w.length;h++)if(w[h]===void 0)return h;return -1};
+var eNJ1310=function(p){if(!p)return null;for(var n=0;n<p.length;n++)if(p[n]===void 0)return n;return -1};
+g.ABE.prototype.FQEF=function(){this.m=[324, 575, 103, 442, 570, 892];return this.m.length};
+g.lHY=function(r,e){return r.mM(e,"htwr eaiefczr")};
+g.nFn=function(v,w){return v.TG(w,"sqlq ytxztmf")};
+var JVT1314=function(z){if(!z)return null;for(var h=0;h<z.length;h++)if(z[h]===void 0)return h;return -1};
+var gRL1315={y:"adtq loguildpb zsvgmuhin",n:152998,isEnabled:!0};
+var QLc1316=function(h){if(!h)return null;for(var c=0;c<h.length;c++)if(h[c]===void 0)return c;return -1};
+g.hVZ=function(h,d){return h.wF(d,"tgu xu")};
+g.oGZ.prototype.IDVv=function(){this.y=[991, 978, 265, 586, 443, 502];return this.y.length};
+g.fpR=function(f,p){return f.Kq(p,"nmvjriz iasfna")};
+g.YZA.prototype.wkqh=function(){this.u=[274, 845, 51, 441, 860, 278];return this.u.length};
+var kQF1321=function(a){if(!a)return null;for(var b=0;b<a.length;b++)if(a[b]===void 0)return b;return -1};
+g.Mog.prototype.PICu=function(){this.q=[228, 477, 585, 954, 740, 11];return this.q.length};
+var OGP1323={q:"xlpbbw hgcf um",z:494618,isEnabled:!0};
+var YMZ1324={d:"scp akmuovy izckz",v:531961,isEnabled:!0};
+g.vzI.prototype.RCzl=function(){this.f=[432, 848, 189, 871, 832, 576];return this.f.length};
+var Yyi1326={x:"pt wcqtpi zqyogs",h:770924,isEnabled:!0};
+g.pcv=function(w,n){return w.XS(n,"iqikbuo herikl")};
+var Wvl1328=function(q){if(!q)return null;for(var n=0;n<q.length;n++)if(q[n]===void 0)return n;return -1};
+var BrU1329=function(e){if(!e)return null;for(var y=0;y<e.length;y++)if(e[y]===void 0)return y;return -1};
+var Fuo1330=function(x){if(!x)return null;for(var u=0;u<x.length;u++)if(x[u]===void 0)return u;return -1};
+g.MXG.prototype.DOot=function(){this.a=[751, 131, 289, 225, 955, 147];return this.a.length};
+g.HPj=function(m,e){return m.Sq(e,"wymfhedgn hfb")};
+var nPP1333=function(q){if(!q)return null;for(var z=0;z<q.length;z++)if(q[z]===void 0)return z;return -1};
+g.LPt.prototype.EMqG=function(){this.c=[819, 669, 981, 716, 952, 266];return this.c.length};
+var VmV1335=function(a){if(!a)return null;for(var h=0;h<a.length;h++)if(a[h]===void 0)return h;return -1};
+g.cqF.prototype.qNxY=function(){this.w=[947, 222, 926, 682, 596, 156];return this.w.length};
+var tpf1337=function(d){if(!d)return null;for(var w=0;w<d.length;w++)if(d[w]===void 0)return w;return -1};
+var krT1338=function(f){if(!f)return null;for(var u=0;u<f.length;u++)if(f[u]===void 0)return u;return -1};
+g.Ghr.prototype.YboU=function(){this.x=[468, 207, 793, 749, 817, 548];return this.x.length};
+g.IVI=function(h,z){return h.AB(z,"ppelsj mjfcixh")};
+var GMk1341=function(w){if(!w)return null;for(var d=0;d<w.length;d++)if(w[d]===void 0)return d;return -1};
+g.Raq=function(w,e){return w.ob(e,"mdhtnd lubsg")};
+g.XCt=function(x,k){return x.vE(k,"zkyqh yuylkdbds")};
+g.yBx.prototype.SDoD=function(){this.u=[849, 858, 752, 121, 993, 860];return this.u.length};
+var KdT1345=function(c){if(!c)return null;for(var e=0;e<c.length;e++)if(c[e]===void 0)return e;return -1};
+g.sAn.prototype.TXzg=function(){this.h=[887, 526, 253, 226, 663, 178];return this.h.length};
+g.gZz=function(n,w){return n.xM(w,"qpvxpbhfu gj")};
+var Khp1348={a:"bnviofgp uxygms ltdxt",y:286255,isEnabled:!0};
+var aOC1349={w:"ilftbfxe klo ddzfsdt",r:957700,isEnabled:!0};
+g.RDx.prototype.jDDy=function(){this.u=[722, 849, 280, 961, 628, 558];return this.u.length};
+g.EIf.prototype.YqzG=function(){this.t=[370, 478, 726, 836, 418, 234];return this.t.length};
+var UNH1352={n:"gcz jlr sbsynxv",p:506214,isEnabled:!0};
+var Jga1353=function(a){if(!a)return null;for(var v=0;v<a.length;v++)if(a[v]===void 0)return v;return -1};
+g.Kty=function(k,d){return k.hw(d,"qv wv")};
+var wNY1355={d:"ux ruw gzvrztryc",w:672412,isEnabled:!0};
+g.vjA.prototype.WcZK=function(){this.n=[416, 963, 491, 123, 155, 549];return this.n.length};
+g.ozB=function(z,p){return z.Mr(p,"zpjr ozdnh")};
+var QRw1358=function(f){if(!f)return null;for(var u=0;u<f.length;u++)if(f[u]===void 0)return u;return -1};
+var jNm1359={n:"afuvepjf zjzxrfv nbuvqmtf",m:348454,isEnabled:!0};
+g.puK=function(n,e){return n.iX(e,"ks gywra")};
+var lYL1361={h:"uirrgrfoj xwbrq cmjmzkm",v:558209,isEnabled:!0};
+g.Rzp.prototype.SAfc=function(){this.p=[324, 353, 712, 136, 985, 69];return this.p.length};
+var SIX1363=function(b){if(!b)return null;for(var v=0;v<b.length;v++)if(b[v]===void 0)return v;return -1};
+g.TMs.prototype.ISwA=function(){this.p=[489, 334, 904, 148, 6, 643];return this.p.length};
+g.jMO=function(f,h){return f.px(h,"cmg qxyyrsmd")};
+var lgY1366={e:"imh qjaefntx mxitavt",b:348055,isEnabled:!0};
+var ZTP1367={r:"vm hlgfdi kzygvh",p:754206,isEnabled:!0};
+g.tZC=function(v,p){return v.vR(p,"blrzyx yz")};
+var UAS1369={a:"canwadf rt pb",z:602619,isEnabled:!0};
+g.DdB.prototype.GxMx=function(){this.f=[893, 54, 992, 696, 959, 188];return this.f.length};
+g.hDl.prototype.PsxL=function(){this.k=[662, 820, 34, 89, 970, 787];return this.k.length};
+var BdN1372=function(k){if(!k)return null;for(var p=0;p<k.length;p++)if(k[p]===void 0)return p;return -1};
+var Ihp1373={e:"nuex jrkbxszyq nrkbwgc",a:295014,isEnabled:!0};
+g.ugF=function(d,z){return d.WM(z,"rorc zelam")};
+var gCt1375=function(k){if(!k)return null;for(var z=0;z<k.length;z++)if(k[z]===void 0)return z;return -1};
+var eJH1376={d:"vkjm uawr insmsdjnt",c:807715,isEnabled:!0};
+g.sqp=function(k,n){return k.SP(n,"tl yo")};
+g.IMb.prototype.hrfx=function(){this.w=[560, 238, 72, 0, 175, 982];return this.w.length};
+var CBP1379=function(r){if(!r)return null;for(var h=0;h<r.length;h++)if(r[h]===void 0)return h;return -1};
+var Tym1380=function(u){if(!u)return null;for(var d=0;d<u.length;d++)if(u[d]===void 0)return d;return -1};
+g.qfA.prototype.NlBt=function(){this.v=[330, 96, 73, 320, 481, 355];return this.v.length};
+var hss1382={q:"bjvlnfk hlcpvfyyn axdfz",c:124575,isEnabled:!0};
+var brM1383={v:"rwygrd kivkqpwfg bbrik",b:646510,isEnabled:!0};
+g.dMK.prototype.BxMK=function(){this.z=[353, 815, 142, 458, 300, 767];return this.z.length};
+var PAo1385=function(n){if(!n)return null;for(var x=0;x<n.length;x++)if(n[x]===void 0)return x;return -1};
+var Xlv1386=function(h){if(!h)return null;for(var w=0;w<h.length;w++)if(h[w]===void 0)return w;return -1};
+var Xmw1387={y:"bkdrsznbd rr dwzcjor",z:707792,isEnabled:!0};
+var mrP1388={r:"mowsigcxm itlc vwpfdyfj",u:259748,isEnabled:!0};
+g.ABR=function(e,c){return e.sC(c,"agudxkczv sxaajv")};
+g.LmX.prototype.uDnJ=function(){this.m=[460, 262, 176, 774, 570, 381];return this.m.length};
+var ktO1391={d:"mhahncqkv atydf knjjaqzp",k:346814,isEnabled:!0};
+var zNe1392={d:"kutzivd utdzgit yrfvqhju",h:149503,isEnabled:!0};
+var cGB1393={a:"lknnoh hxi lgbvqoifg",v:123908,isEnabled:!0};
+var CvA1394=function(r){if(!r)return null;for(var v=0;v<r.length;v++)if(r[v]===void 0)return v;return -1};
+g.OpJ=function(b,e){return b.NG(e,"qppqgbcsv cuhtktm")};
+var noM1396={k:"zp jximjm edulqixg",u:119025,isEnabled:!0};
+g.aHo=function(f,y){return f.Dd(y,"ywgwuuhmz rtfapizr")};
+g.asm=function(q,y){return q.FH(y,"mlpblyd opfk")};
+var Gws1399=function(w){if(!w)return null;for(var u=0;u<w.length;u++)if(w[u]===void 0)return u;return -1};
+g.dSL.prototype.tpKs=function(){this.t=[686, 923, 125, 104, 594, 14];return this.t.length};
+var vOb1401=function(c){if(!c)return null;for(var h=0;h<c.length;h++)if(c[h]===void 0)return h;return -1};
+g.ZYw=function(y,b){return y.NR(b,"wyuzd ltdumlww")};
+var qjB1403={v:"ujxi qgedxf dkrnct",k:399442,isEnabled:!0};
+var wOa1404=function(c){if(!c)return null;for(var w=0;w<c.length;w++)if(c[w]===void 0)return w;return -1};
+g.uvC.prototype.TDka=function(){this.k=[228, 785, 895, 179, 574, 525];return this.k.length};
+g.Hak=function(z,v){return z.hG(v,"plarcpd mkrlgd")};
+var gxU1407=function(q){if(!q)return null;for(var n=0;n<q.length;n++)if(q[n]===void 0)return n;return -1};
+var Zij1408=function(t){if(!t)return null;for(var x=0;x<t.length;x++)if(t[x]===void 0)return x;return -1};
+var NPG1409={r:"hmctay ckyqeqs azatiemc",q:815712,isEnabled:!0};
+var HuE1410={a:"kuf isi eevbnirh",r:659116,isEnabled:!0};
+var Xlt1411=function(q){if(!q)return null;for(var t=0;t<q.length;t++)if(q[t]===void 0)return t;return -1};
+var YXc1412={q:"mh dyxgtx cblyq",p:584391,isEnabled:!0};
+g.VWz=function(e,p){return e.kS(p,"fvvetpebz naplzr")};
+var rQA1414=function(k){if(!k)return null;for(var r=0;r<k.length;r++)if(k[r]===void 0)return r;return -1};
+g.daR.prototype.wcAS=function(){this.e=[848, 889, 11, 415, 883, 172];return this.e.length};
+g.buR=function(y,x){return y.Ak(x,"tcfzyzg yr")};
+var MSc1417={n:"iom bzgtwrlwc lffnkt",y:2459,isEnabled:!0};
+var MyO1418=function(d){if(!d)return null;for(var n=0;n<d.length;n++)if(d[n]===void 0)return n;return -1};
+var oTl1419=function(c){if(!c)return null;for(var p=0;p<c.length;p++)if(c[p]===void 0)return p;return -1};
+var RMg1420=function(b){if(!b)return null;for(var c=0;c<b.length;c++)if(b[c]===void 0)return c;return -1};
+var LMT1421=function(c){if(!c)return null;for(var n=0;n<c.length;n++)if(c[n]===void 0)return n;return -1};
+g.QNp=function(x,a){return x.Ys(a,"xzhion cdzlmqybt")};
+var ncm1423=function(x){if(!x)return null;for(var f=0;f<x.length;f++)if(x[f]===void 0)return f;return -1};
+var SEj1424=function(q){if(!q)return null;for(var f=0;f<q.length;f++)if(q[f]===void 0)return f;return -1};
+var DEp1425=function(r){if(!r)return null;for(var f=0;f<r.length;f++)if(r[f]===void 0)return f;return -1};
+var RZl1426=function(r){if(!r)return null;for(var z=0;z<r.length;z++)if(r[z]===void 0)return z;return -1};
+var nLB1427={n:"woqlos egowk mm",y:831592,isEnabled:!0};
+var kOS1428={d:"xpoeuu vkzsyoxwi rhcuvodfa",q:454305,isEnabled:!0};
+g.xOn=function(y,t){return y.Zl(t,"sfe oy")};
+var uGE1430=function(f){if(!f)return null;for(var n=0;n<f.length;n++)if(f[n]===void 0)return n;return -1};
+g.TKY=function(c,d){return c.pU(d,"dgxmqzd bpd")};
+g.riL=function(r,d){return r.kX(d,"glugzq duysbwxrq")};
+var ufY1433={a:"ezo uwp yihka",n:957176,isEnabled:!0};
+g.umm.prototype.mVui=function(){this.w=[669, 176, 245, 199, 48, 264];return this.w.length};
+var qYO1435={x:"zuhohsmk izr jymvnnsp",k:30163,isEnabled:!0};
+g.wQl.prototype.TSUK=function(){this.y=[804, 237, 180, 343, 707, 447];return this.y.length};
+var mQv1437={y:"bgrupi ykxpnhm cilbrgh",z:703475,isEnabled:!0};
+g.VoZ.prototype.pNZS=function(){this.m=[955, 175, 604, 232, 187, 587];return this.m.length};
+g.EyB.prototype.sQKV=function(){this.m=[525, 566, 408, 663, 63, 125];return this.m.length};
+g.RVV=function(p,d){return p.rR(d,"fwq plj")};
+g.QlK.prototype.GbPk=function(){this.w=[5, 898, 802, 870, 644, 839];return this.w.length};
+g.pwO.prototype.Mkbz=function(){this.e=[338, 560, 47, 46, 776, 9];return this.e.length};
+g.gXm.prototype.VRpE=function(){this.f=[52, 932, 477, 446, 864, 509];return this.f.length};
+g.EzJ=function(d,q){return d.rW(q,"dab asf")};
+var vBA1445={p:"xhggvbnd wyqasxop wi",x:256329,isEnabled:!0};
+var KUT1446=function(u){if(!u)return null;for(var z=0;z<u.length;z++)if(u[z]===void 0)return z;return -1};
+var NST1447={p:"pnkjemgl ymbvqz yesxpc",t:257717,isEnabled:!0};
+var riH1448={r:"sur gkq wxczgh",h:830161,isEnabled:!0};
+g.rod.prototype.gIKA=function(){this.m=[537, 965, 314, 147, 680, 960];return this.m.length};
+g.WpZ=function(d,h){return d.Uy(h,"ifpy ws")};
+var TjT1451={f:"fw mcki xg",w:569397,isEnabled:!0};
+var uFO1452={b:"xce xpqa oxplfo",y:481332,isEnabled:!0};
+g.Gsl.prototype.LXIo=function(){this.t=[881, 989, 421, 256, 602, 822];return this.t.length};
+var sek1454=function(c){if(!c)return null;for(var q=0;q<c.length;q++)if(c[q]===void 0)return q;return -1};
+g.dyM.prototype.glio=function(){this.e=[776, 854, 885, 897, 569, 947];return this.e.length};
+var ZYl1456={c:"ay pf zu",d:533348,isEnabled:!0};
+g.CPS=function(n,p){return n.jw(p,"mozqj zrpthbxe")};
+var JvH1458=function(a){if(!a)return null;for(var t=0;t<a.length;t++)if(a[t]===void 0)return t;return -1};
+var tKd1459=function(m){if(!m)return null;for(var f=0;f<m.length;f++)if(m[f]===void 0)return f;return -1};
+var IOd1460={y:"gtoqos kcy uhvqhc",w:689304,isEnabled:!0};
+g.eUb.prototype.eOjW=function(){this.n=[84, 6, 698, 944, 598, 574];return this.n.length};
+var pZo1462=function(w){if(!w)return null;for(var b=0;b<w.length;b++)if(w[b]===void 0)return b;return -1};
+g.CUo.prototype.PKEw=function(){this.e=[320, 992, 355, 281, 333, 987];return this.e.length};
+var Wfq1464={q:"fwuvrwgp nidiw nzyd",k:717859,isEnabled:!0};
+g.iWr.prototype.lClY=function(){this.c=[221, 73, 787, 623, 89, 898];return this.c.length};
+var Txy1466={b:"tcd qwswqkhe gizlftzoh",v:967076,isEnabled:!0};
+var EdX1467=function(d){if(!d)return null;for(var u=0;u<d.length;u++)if(d[u]===void 0)return u;return -1};
+g.zFe.prototype.xFOG=function(){this.d=[690, 318, 77, 726, 614, 691];return this.d.length};
+var cgr1469={e:"cszbod imz vronnsgwu",k:114218,isEnabled:!0};
+g.mqg=function(z,x){return z.Ie(x,"nmowciom vskvgvl")};
+var ruQ1471={x:"pproj oqgxhdc gsfi",a:570095,isEnabled:!0};
+var Hkq1472=function(k){if(!k)return null;for(var n=0;n<k.length;n++)if(k[n]===void 0)return n;return -1};
+var tRu1473=function(u){if(!u)return null;for(var t=0;t<u.length;t++)if(u[t]===void 0)return t;return -1};
+var JMc1474=function(c){if(!c)return null;for(var q=0;q<c.length;q++)if(c[q]===void 0)return q;return -1};
+var pGR1475={y:"rl dwflnn fbbinyn",q:440795,isEnabled:!0};
+g.WeE=function(b,u){return b.Vn(u,"szwdeodr asbqsk")};
+g.sTU.prototype.eagf=function(){this.z=[506, 573, 771, 810, 298, 866];return this.z.length};
+var GyB1478={f:"pkztuldr ddfgmqh ypojiwmlw",h:93834,isEnabled:!0};
+g.cqj.prototype.DcRY=function(){this.b=[735, 795, 496, 20, 409, 49];return this.b.length};
+g.ERq.prototype.JHZO=function(){this.v=[392, 484, 702, 392, 4, 918];return this.v.length};
+var IEI1481=function(x){if(!x)return null;for(var u=0;u<x.length;u++)if(x[u]===void 0)return u;return -1};
+var THU1482={w:"tmngldfl mnavgu zks",k:83939,isEnabled:!0};
+g.dXj.prototype.coac=function(){this.x=[493, 193, 894, 555, 883, 710];return this.x.length};
+var FsC1484={b:"ykhfe ezinkkthl xyzxitkln",n:461656,isEnabled:!0};
+g.vlw.prototype.ftGh=function(){this.n=[977, 16, 455, 279, 996, 377];return this.n.length};
+g.hMi.prototype.zCvc=function(){this.c=[419, 658, 298, 633, 511, 890];return this.c.length};
+var EWI1487=function(x){if(!x)return null;for(var m=0;m<x.length;m++)if(x[m]===void 0)return m;return -1};
+var Lif1488={h:"dmtu hem lbpvaktsp",u:972024,isEnabled:!0};
+var neD1489=function(q){if(!q)return null;for(var r=0;r<q.length;r++)if(q[r]===void 0)return r;return -1};
+g.Uqj.prototype.oIWl=function(){this.z=[320, 429, 300, 454, 534, 920];return this.z.length};
+g.dtM.prototype.amQo=function(){this.b=[859, 527, 409, 747, 517, 629];return this.b.length};
+g.zbb=function(z,d){return z.mz(d,"yg santnaem")};
+var oNE1493=function(f){if(!f)return null;for(var m=0;m<f.length;m++)if(f[m]===void 0)return m;return -1};
+g.ovb=function(q,v){return q.kT(v,"dcuaog lmeg")};
+g.lgk.prototype.oGJU=function(){this.a=[554, 906, 793, 854, 136, 77];return this.a.length};
+g.ZVU=function(c,q){return c.Kl(q,"kmutxlxxf qjokkfb")};
+g.ImN.prototype.ACjy=function(){this.k=[179, 170, 275, 423, 545, 299];return this.k.length};
+g.ZbI=function(f,y){return f.rO(y,"clbcexagp iswpn")};
+g.puI=function(b,x){return b.by(x,"nc vktkexofp")};
+})(_yt_player);
@@ -0,0 +1,7220 @@
+{
+  // generated
+  items: [
+/* item 0 */ {
+ 'ra': "https:\/\/example.com\/w-Wt29GojOn?v=76",
+ GLuWpB: null,
+ 'dwksva': {
+  mlexXe: {
+   'ox': "https:\/\/example.com\/chQl6ShcVeh?v=837",
+   'lcdyyh': 0xa6779e,
+   'ufflhkx': -678859,
+   'harp': "gw pix oibnxpl \u00e9\n"
+},
+  ZfsqlN: "https:\/\/example.com\/eFrBj4_ckJj?v=928",
+  oTaGhc: -785782,
+  fCrSUg: "https:\/\/example.com\/gTYvMe25thx?v=512",
+  RqcQzm: {
+   'llojalp': 0x75b07d,
+   imowoZ: "ybxridqkb oxduf ru \u00e9\n",
+   'zzpv': -108620,
+   'kthcbue': 0xa7aaae,
+   bAARZu: "uuvu qh pzczo \u00e9\n"
+},
+  'ich': "https:\/\/example.com\/JyJATaheTYc?v=836"
+},
+ FBRxTG: {
+  'iddg': {
+   xSkuuG: 'toky anjq wlrsxfm og',
+   'gbaeigqn': 0x867998,
+   'lgismk': !0,
+   RkKrTb: "https:\/\/example.com\/f93cNSrUzGE?v=83"
+},
+  vTqKaj: 'plemfuqk qimnbz uychmmhej ebt drgajsofp ra'
+},
+ 'xictxshl': {
+  'zyxvwmrtb': {
+   'yjllixld': 0xc0017,
+   'fzoxy': "https:\/\/example.com\/HP4Sr1hsyEX?v=72",
+   xvQIsj: 'ahj zfmivpew'
+}
+}
+},
+/* item 1 */ {
+ 'ga': [-211196,],
+ 'yu': undefined,
+ bpqMRi: undefined,
+ MDInec: undefined
+},
+/* item 2 */ {
+ dmWspS: "https:\/\/example.com\/Xtf8WGPWYs5?v=400",
+ DzhrOE: "ljxsmrz ylkligfpm jvgdl \u00e9\n"
+},
+/* item 3 */ {
+ 'vypdx': {
+  YKZBnf: [818453, "https:\/\/example.com\/9ZZnQQFg2Ln?v=883", 767834,],
+  OsWwTd: [0xc4f583,],
+  'coqhis': "xv jwlv kx \u00e9\n",
+  wgjOkA: -644543
+},
+ 'pr': "zgbcid rabox qnmttwc \u00e9\n"
+},
+/* item 4 */ {
+ 'zokb': 0x780052,
+ 'vmdnlxmsd': 0x36cd0a,
+ 'crlo': "qhnqo gployiza nqxqg \u00e9\n",
+ 'ziipufrbj': {
+  'csd': 0x5d6fcc,
+  nvmVxw: "https:\/\/example.com\/rzwXeztsGKL?v=65",
+  NaTcnM: 'bnxnhwtce iy eq yuyjc bz kovfse',
+  shKJaL: ['qipk', "https:\/\/example.com\/z458p-3g2xN?v=677", "https:\/\/example.com\/YRY46bsespl?v=317",],
+  sXqIJH: {
+   fxCkeb: "https:\/\/example.com\/k5TVojZQQfD?v=940"
+}
+},
+ xPBhuK: null
+},
+/* item 5 */ {
+ 'yobveaon': "owlypci xaokukfi jc \u00e9\n"
+},
+/* item 6 */ {
+ 'ziqvfszx': [!0, 0x828508, "nuymx zruvtqe rwrcorl \u00e9\n", {
+   'rocdoyb': "https:\/\/example.com\/0nMgdTrRPwl?v=737",
+   IEKVgu: "https:\/\/example.com\/6mY71V291YG?v=972",
+   UMzdUw: !0,
+   'ewevgh': 0x1821d7
+},]
+},
+/* item 7 */ {
+ nIXBeC: "https:\/\/example.com\/WkH-GSMLsEc?v=48",
+ ZNzwZC: 'cp pzo eorrybl zrdqykpt rvqsoqfl',
+ tWnDXr: "ikvmnco hkcx nwplfv \u00e9\n"
+},
+/* item 8 */ {
+ 'nrwwkg': "https:\/\/example.com\/YeCStkubwrF?v=14"
+},
+/* item 9 */ {
+ cMCNpP: 'fnidwfszs qbgxk',
+ uQPYhk: -958855,
+ PRBFVB: -707542,
+ 'ebeqat': -479466
+},
+/* item 10 */ {
+ NrXMgA: -21655,
+ 'hmg': {
+  cffPZW: {
+   wCqtxm: "gozhfc lfcr cknnh \u00e9\n"
+},
+  'eoxzcz': [0xf9dca, -258564, 'kdpwew srigqck ngyiapdvg jlsxgcyzp mkql',],
+  'oupnmu': 0xf5f739
+}
+},
+/* item 11 */ {
+ yTYIBH: "nwawfxcis faopuxsxu lessqa \u00e9\n",
+ oYTtfA: {
+  kOZtsd: "jj ogea nhvledybl \u00e9\n",
+  zDSoGt: "rcf dsv tgrz \u00e9\n",
+  'bsbw': "nkirzossn utnub qdwraaep \u00e9\n"
+},
+ 'gtetyj': [true,],
+ 'icfh': {
+  vrvkJB: [25367, -427559, 'yt',],
+  'vve': {
+   'vkkrte': 'ryrhqtewc nipuuzzdc ytinwq'
+}
+}
+},
+/* item 12 */ {
+ jRyugp: "hcm cixddyr faefgl \u00e9\n",
+ 'brxa': !0
+},
+/* item 13 */ {
+ xjLTuW: [0x5c88cd, "https:\/\/example.com\/X-ZchpFId1v?v=746", "rqjsccmb kc lzhq \u00e9\n", "https:\/\/example.com\/vWciZzTg3c3?v=815",],
+ 'bznarde': 'mp tokjme lli',
+ aXBqOK: "ixxdbpio gfpiinbzi evabko \u00e9\n",
+ 'ozjwm': "vqzuprpmm xdpz qxiul \u00e9\n"
+},
+/* item 14 */ {
+ 'flyfx': "nctwrz lmg gdlzbzlol \u00e9\n"
+},
+/* item 15 */ {
+ 'bwg': {
+  RikxOQ: "phflqnm ryxytdaoj momlvdj \u00e9\n",
+  irkCKI: ['egnwmtrka', 0x2ec975, "https:\/\/example.com\/o0i15AqajyN?v=636", 90311,],
+  UeXEDx: undefined,
+  gBYBfm: 'eq odmedaenm',
+  lsmZHm: 'rkbpwdbke hfznyqift gdva xvvftz rsspgkbr',
+  'ytv': 'lydl julcxp'
+},
+ iHwflZ: -295518,
+ 'zjxnaik': {
+  'hkyqefem': 0x4df61e,
+  'akurd': {
+   'jopem': "https:\/\/example.com\/XjPzfGQdwQA?v=581",
+   uFHBuf: 499150,
+   HiWNfH: 'eh slwbvjb rqtydo nwksws zm',
+   'poughawgu': "https:\/\/example.com\/0XWuLmRHsnG?v=107"
+},
+  cLcscZ: 0x1212f6
+},
+ ZgiyhQ: [{
+   EzxgHH: -144952,
+   UShvIV: 0x9f568a,
+   'zxs': 0xccb5a0,
+   OfYlsE: 142101,
+   dpEqes: 'lg mnwv jkmkrnulx uwfdaqpjn'
+}, "inxl ejiym fo \u00e9\n",]
+},
+/* item 16 */ {
+ 'vpwqmlul': {
+  kVNFoS: -503079,
+  kYRZOa: "https:\/\/example.com\/p_mv53QjPk8?v=346",
+  'ldv': "https:\/\/example.com\/ssXHo8wSDb6?v=645",
+  oOVHhZ: [348816, "kqpc rxz hwunkl \u00e9\n", false, 'cucar yxdmfabi yuarkvsqm tu ffkprp',],
+  iJfrod: "pnaddn pt ah \u00e9\n"
+},
+ eKJpiz: 123768,
+ 'sft': {
+  'vxf': "jqgbwcgre hzdo gxqrbesfh \u00e9\n",
+  'aekzcev': -253644,
+  'xszidimvk': {
+   FrDdVW: "cznljhhs aiex shztc \u00e9\n"
+},
+  KzSdHr: "dj kykzujp sevsfdv \u00e9\n",
+  'fcug': ["https:\/\/example.com\/dh-Nu_lUMjc?v=537", "kebzbjyu gsimb lqea \u00e9\n", 'jid omyxgwpjg bjans uyti', !1, 107525,]
+},
+ zgCyKY: [-296868, {
+   'spfhajhvy': 0x438016
+}, 0x850fa2, {
+   ZiFlaf: 0xdc3b01,
+   UHhIAy: "https:\/\/example.com\/THavIO3Sn7A?v=140"
+}, !0,]
+},
+/* item 17 */ {
+ XIRbdu: 0xa73f2d,
+ xKEAvn: {
+  'fu': false,
+  UGUaEi: {
+   QXVgYM: "ake hveqeaqzo kduo \u00e9\n",
+   hPUlhM: 0x171ea3,
+   'cfknxfx': "qsplyuaq wsdh dgzrye \u00e9\n",
+   'rn': "rd bip vjib \u00e9\n"
+},
+  uLxBwv: {
+   PXCfyL: "jcdms arwfea hcxpmz \u00e9\n",
+   MrLRjd: "sbwlszl yo fj \u00e9\n",
+   'gtgkho': -686731,
+   'bt': 'drnmwa stzzov eqond wyhtznghm',
+   'hrzmwzh': 0x50a4cc
+},
+  'vtci': 0x9f5474,
+  GMDybG: {
+   'dqclfo': "vjujpj snjvc gulufqgex \u00e9\n",
+   'tz': 0x94c6ed,
+   'ejmc': 0xf629a9,
+   TlVOGa: -759894,
+   'dvozs': "https:\/\/example.com\/O-Xf45xgjR7?v=310"
+},
+  QYhlXa: "hvrh vdrdwvfrv fjkyu \u00e9\n"
+},
+ 'mogrrdb': 0xdb4246,
+ 'dfmbx': 0xc983f9,
+ 'oxm': {
+  oOidGm: 0xb84a2c,
+  oFbSHP: {
+   QNAVwr: "iv lwtr vbgtxlt \u00e9\n",
+   NDGvxU: "https:\/\/example.com\/GvPP9No2lzF?v=214",
+   UfhVjU: "https:\/\/example.com\/t20k4hetyMq?v=776"
+},
+  pBWvxr: 360462,
+  'ookn': 0x2b726a
+},
+ 'dtdjvltq': "nqyjhit exdtio qjfyxj \u00e9\n"
+},
+/* item 18 */ {
+ AlEsQy: "https:\/\/example.com\/twVmdjOjwop?v=12",
+ 'ultcwt': 541294,
+ 'ao': ['auzzic', 0x3b5424, null,],
+ SRMDSa: "https:\/\/example.com\/LR5AYbU1eBk?v=223"
+},
+/* item 19 */ {
+ 'itkzn': 'vfhut pjzwiour cmcpeiehc mxwbof'
+},
+/* item 20 */ {
+ NEClSy: {
+  aJLoQG: 0xd9b17e,
+  'wnb': [,],
+  sMhZDO: false,
+  CxRDCB: 'oybvfi hntsc cfukvawqv'
+},
+ PFGCZS: "https:\/\/example.com\/_kDzXVevcgq?v=288",
+ YKakNm: "qda nzauq zsdmvu \u00e9\n",
+ 'ap': "mjh ll pnfaupa \u00e9\n"
+},
+/* item 21 */ {
+ GOFspD: "https:\/\/example.com\/2fGFwxcV-DH?v=221",
+ diRMib: 'mciz',
+ 'ooeiyrnq': "zbiqvyka dpttyog wzdawprdf \u00e9\n",
+ iJbFUx: -256214,
+ 'qmdnib': 'utty pqzywzh',
+ 'acfzqnpr': !1
+},
+/* item 22 */ {
+ iIlJJN: {
+  'zspsgrrd': [,],
+  WLsZSc: 'ybh'
+}
+},
+/* item 23 */ {
+ 'qwpwjygt': -828906,
+ QNMSDg: {
+  EESftU: 'wwhmin ipmxft',
+  'tnwf': [-708894, "https:\/\/example.com\/eMlIvGhVhbP?v=983",],
+  'fbnvqt': "https:\/\/example.com\/xFv5SmWD6A3?v=453",
+  puyBme: undefined
+},
+ 'giiyi': "https:\/\/example.com\/G2pZ3EGGehn?v=490",
+ 'acfdqt': -415342,
+ jaenAc: !1
+},
+/* item 24 */ {
+ 'qkpgfczdf': 369762,
+ 'sphqb': {
+  'ydyef': -91766,
+  'krpxpbd': 0x9cb50f,
+  'qkhraqwwc': {
+   'izynv': "vcfk nxtjr ffu \u00e9\n",
+   QDzVtC: !0
+}
+},
+ 'kmfuaac': [!0, {
+   'xsxy': 0x9d3760,
+   CIgepX: 224276
+},],
+ 'bbx': {
+  'zuapxdj': 0x858fdf,
+  'xsvsc': 'fvmw tgw sizh dvujv uiugu qdtf'
+},
+ 'ro': {
+  NCFNRO: "aygd ibtbztor hshux \u00e9\n"
+},
+ 'teohe': {
+  'swjy': [,],
+  'lbtci': {
+   cqNRug: !1
+},
+  'migrfesm': {
+   'ldzulwc': "https:\/\/example.com\/z8jt0AWQ00p?v=2",
+   'upxskpzq': 958673,
+   hToVpe: "rao khhog qwavctsch \u00e9\n"
+},
+  NYZdlL: undefined,
+  'trp': 200756
+}
+},
+/* item 25 */ {
+ 'cpvbaorsr': [null, 0x256e52,],
+ 'wbvupi': !0,
+ ffHIin: [{
+   'fy': 0xc514db,
+   yKlShZ: null,
+   'xgv': "https:\/\/example.com\/XqASQ9iYCyC?v=822",
+   'vh': -242176,
+   'kzacrpply': "https:\/\/example.com\/wiB3JVIFmr1?v=415"
+}, "lykl demblyci rggzt \u00e9\n",]
+},
+/* item 26 */ {
+ 'fy': {
+  'uh': {
+   'vmr': "bvquy remxop xndkbys \u00e9\n",
+   'clpcr': undefined,
+   ptMdpK: 'fl zb heokhgi fonljwhq wzendqn'
+},
+  cilXsb: 0x3918cd,
+  dxpxIT: 718127,
+  'zhpjeatjy': "jbjrkrna npqawyqox qjftyppe \u00e9\n"
+},
+ 'bqriuhbw': {
+  kbRRHS: 'finirn'
+},
+ DeDbrL: "lacoble nbfxjdwce cykot \u00e9\n",
+ LBkqGG: -938002
+},
+/* item 27 */ {
+ 'zntju': {
+  QsooBm: "rmkjoheuh jsm whhieq \u00e9\n",
+  ZnRWqr: [,]
+},
+ HrusDS: !1,
+ 'tsa': 'pu vmesgcru vnic',
+ Btockz: 'npxwjhbd bhgh mzkc',
+ 'keuhp': ["https:\/\/example.com\/fJTujB8KfEd?v=442",]
+},
+/* item 28 */ {
+ soKAnP: 0xcef36a,
+ mOGlZq: false
+},
+/* item 29 */ {
+ UvDvJX: 'sdy',
+ qjPJcA: "wmmuuylhe rz oypygmct \u00e9\n"
+},
+/* item 30 */ {
+ 'volfosudy': {
+  'mso': {
+   'jsd': true,
+   'nwlacxnm': 0x8ab832,
+   'utagyej': -180274,
+   'mbigzarze': !1
+},
+  'ryiaemk': ["https:\/\/example.com\/aIk6BnhI_Lt?v=295", "sdpqasje uk ryc \u00e9\n", "https:\/\/example.com\/Qj9FbiRuqb3?v=265",],
+  'odqtqaffn': 0x54f063
+}
+},
+/* item 31 */ {
+ cpbHbu: 93577,
+ XrDrvR: {
+  'mmjnf': "https:\/\/example.com\/r657ldVXKe2?v=368"
+},
+ AJKCfT: [{
+   'jgkt': "https:\/\/example.com\/r1ieVnctwR7?v=540",
+   NyMShL: "fibjjp vbxxlspzk cxs \u00e9\n"
+}, "https:\/\/example.com\/nDwWQvx6mPQ?v=517", 661489,],
+ 'scqv': 544296,
+ 'ds': 'qojj cgwl frzh cwuhbfggj jsv',
+ 'kzrjxg': "ddiyo ob ibsxe \u00e9\n"
+},
+/* item 32 */ {
+ YlGJih: 0xce370d,
+ 'xzr': [{
+   'lbjkgf': 0xc13d4f,
+   tBykpa: 'faphqxlx kcfolxhk hgwaw oqhfsvw',
+   'uhxhz': false,
+   uyjLDY: 665276
+}, false, {
+   VQhORH: 507602,
+   'lebcfxazy': 'ool iwhk'
+},],
+ 'zsfdpjivz': 195119,
+ XNxiHm: 'tjqseath ensqs bldxy lpszt jljvgwiw',
+ 'wjmd': "https:\/\/example.com\/0rJeszPpZHf?v=750",
+ xIXkBZ: [!0, 631930, {
+   'kolmb': false,
+   zQgVqS: 596287
+}, 'iifxenuk tuufxisht kdbvml lyppj rwarvg', {
+   CCRWkT: 0x189d6f,
+   mBxlGX: 'rd nm baqoix',
+   'ahbusy': "igs qpjsd ttvcf \u00e9\n",
+   tzmmjh: "tpil yi zwdtybt \u00e9\n"
+},]
+},
+/* item 33 */ {
+ BzzsAK: ["https:\/\/example.com\/0pT5yrUDtw3?v=956", undefined, "https:\/\/example.com\/LxkLMnJbik5?v=678", "https:\/\/example.com\/s7Q_wG-Ol-E?v=974", "lnhjerawu gcpqhze penme \u00e9\n",],
+ KfcnYV: 0xf9d017,
+ 'fhl': 'iddbvlh gt',
+ 'amivvtp': {
+  lqSHzK: -940662,
+  'szrlxyso': undefined,
+  yomgjy: {
+   'kcr': true,
+   qLYwxh: "tqanaeeum rbfhi igzrq \u00e9\n"
+},
+  'wvkhdwt': "luusjrmo ybxj nfuuqtob \u00e9\n"
+},
+ 'fgidkjqh': {
+  'wceh': true,
+  INZYkG: "agkp qjj lxks \u00e9\n",
+  'zrxtcc': !1,
+  fgOdFY: "https:\/\/example.com\/mq8YlJSsXdI?v=883",
+  ocapaC: {
+   'dkkypff': 'jmaekg pq',
+   'owvljjh': 462436,
+   'wf': "cg wzwoirlt beyz \u00e9\n"
+}
+},
+ 'wqzx': {
+  'hkiclbo': "https:\/\/example.com\/2Rm8ehC2H4W?v=334",
+  qyvkrB: "ciwef twc eg \u00e9\n"
+}
+},
+/* item 34 */ {
+ rnradW: "https:\/\/example.com\/1zi_jJ3xZQi?v=258",
+ 'kd': {
+  'upzjeu': 92500,
+  'csn': "https:\/\/example.com\/1BgpyWluIwd?v=857",
+  'pl': "https:\/\/example.com\/-of4CikfpCJ?v=493",
+  pHRoTP: {
+   hPFNJm: 0xaea06d
+}
+},
+ 'ulluwfu': 'excomotm nuxdcf',
+ KeTSJp: ["https:\/\/example.com\/2Tu8XiGEVQ_?v=884", 'gxirca lcrzpgwne lkficnngl ryfjw', undefined, [false,], {
+   'gofneawfr': !1,
+   pWzzvJ: "rvcczqtgy xb fozrwpbkt \u00e9\n"
+},],
+ wzHCnK: 0x4bab0b,
+ ZvqkYm: "kgipt vcsux odp \u00e9\n"
+},
+/* item 35 */ {
+ MTsiMM: {
+  XztkbR: [true, "opyd gfzenj auszgmrr \u00e9\n",],
+  'idrcbh': null,
+  swCdAt: 0x713e4c,
+  KxqJRh: "uaaqygqhm pccozn guvtiov \u00e9\n",
+  'xgxbqwczr': undefined
+}
+},
+/* item 36 */ {
+ NpGcah: [["cinuss waloalc mj \u00e9\n",], ["hhhtjjosu elkoilt cfmvsulbt \u00e9\n",], ["https:\/\/example.com\/rlNfqgCwPoI?v=616", 0xdedd55, 138114, 15689,], 0xb59976,],
+ pPWHUw: !0,
+ 'cxjopsjum': ["https:\/\/example.com\/jbeZm9Su80b?v=1", 282426,],
+ 'ddthduyk': 0xca9f2e,
+ WfaMUs: 30722,
+ MuBYGu: [[0x425fea, "https:\/\/example.com\/Z68B62xK1IA?v=378", !1, 'hwts',], "https:\/\/example.com\/PQMD1A_KbUt?v=296", 0x269ca,]
+},
+/* item 37 */ {
+ IXxrOs: [["https:\/\/example.com\/UuphlXMdYac?v=225", 'jg cugrgnylx wujbg go tuufyd ovokiqcpt', "https:\/\/example.com\/hKAMhdZtUDw?v=410",], -220342, 'im ykrv', {
+   'hwwg': "https:\/\/example.com\/vuANqKy9w1U?v=858"
+},],
+ 'vyhhpqt': ["https:\/\/example.com\/C4ScImnrMbi?v=68", [-522296,], "https:\/\/example.com\/RLkbERDtIrc?v=113", 'ccrtt xngzisrzl ikjeg ycoftn nphm', {
+   HNTQbM: undefined,
+   SRTIbT: "https:\/\/example.com\/GwrSehGrNtj?v=150",
+   VaSWzc: false,
+   ypRoMn: null
+},]
+},
+/* item 38 */ {
+ 'hyisr': [{
+   'efn': "jhn ksvqv rx \u00e9\n"
+}, ["gx fxp iawycnpsa \u00e9\n", 0x332d16, undefined, "https:\/\/example.com\/Y6iViOm75c6?v=610", true,], {
+   UriJYa: "hhnvt kgyvyg ag \u00e9\n",
+   'shggqkzrs': 0xb1b7c2,
+   wIOBGq: 902860,
+   OqlXOA: "fkucmluwt nvi ocehiaqp \u00e9\n",
+   lBcHZB: "pnsmlivm fvhxuefk hyqcoo \u00e9\n"
+}, true, {
+   'gjxwoclwv': false
+},],
+ gcWjOT: {
+  KRqath: 'eqrv',
+  WzwGFJ: [652324,],
+  'lfxg': 754646,
+  SBpOwY: 628404
+},
+ YiDARJ: {
+  'zvwwz': null,
+  WlnrOU: ["https:\/\/example.com\/WVE3LXEnsAP?v=467", 0xf8eb6, !0, 'oponfganp tq',],
+  'huwubblb': 'fcmoas ym dbfrpjl rvx my'
+},
+ 'kvgbey': 910850
+},
+/* item 39 */ {
+ tmUxuc: 0xc7e44c,
+ 'fhyfrn': 0x331fe7
+},
+/* item 40 */ {
+ bMqJMv: "https:\/\/example.com\/kmXIlhnYdSj?v=69",
+ YxQCcg: 'ooz xif qoslidnu'
+},
+/* item 41 */ {
+ jQWsRv: {
+  jeWLTD: "qgmpjl oaijc rdurzff \u00e9\n",
+  VnpGeL: [,]
+},
+ 'vhuaxqfix': {
+  'wyvjjp': "https:\/\/example.com\/ywyMb1yyKFK?v=744"
+},
+ xliIdS: {
+  GhFpRI: 0x8d19c9,
+  'bpjbznr': "wp jjvqmg emdxbytsn \u00e9\n",
+  ycGtZE: 0x1f85ee,
+  'lgzryoel': 'rigzxme hgtu idfasrg'
+},
+ aJwFnA: null
+},
+/* item 42 */ {
+ NmaOLF: 0x8d0ff6
+},
+/* item 43 */ {
+ xyZpqO: -99815,
+ PJkJuU: "https:\/\/example.com\/o21g_OZx8x-?v=894",
+ 'vysfzedhm': {
+  'pgnbcquz': {
+   'schsxjozb': 0x738cd6,
+   XqlrpX: 'wxl fkrhn dox zj ntzplief fxwaepk',
+   'al': true,
+   'wvwnf': !0,
+   fjRpes: true,
+   'jcgnybpa': 0x65e32
+}
+}
+},
+/* item 44 */ {
+ 'fswrr': {
+  'yr': 0x907ce3,
+  'aduzionp': {
+   'jtmcoe': null,
+   mKfoDf: 0xf3cbfa
+},
+  CzTVOj: 0xda41e6,
+  'tyrtvq': 0x7ef260
+},
+ eQOpkv: !1,
+ HozEIx: "tpf mnns gl \u00e9\n"
+},
+/* item 45 */ {
+ 'anzrg': -711254,
+ 'egtouc': "https:\/\/example.com\/VqR6nmWWCsC?v=90",
+ XDtQrL: 259681,
+ robssE: 'hpqe hss ezh cmbrm xxyvypzmt hwyyg',
+ lEJPLp: 0xab9ac5,
+ 'rbzxgtsw': 'yys glauprgn ammd sd'
+},
+/* item 46 */ {
+ 'ijhmtfiqw': 0xf7f41,
+ 'fpbnv': {
+  PapqYm: {
+   lyWiiW: 'qub adozyysc',
+   pSnyWH: false
+},
+  'maqdeigy': 'fdruaogeg noshqm',
+  'orwfbjlv': {
+   zzPZyN: 'rbdw krf',
+   aGEQNs: !0,
+   'gjvhmpvmr': true,
+   PekOwK: 'fk',
+   xQddMO: null,
+   'icwbnvq': "https:\/\/example.com\/ooVnsZg5f_2?v=440"
+},
+  'rchmwmcou': [0x21c58b,]
+}
+},
+/* item 47 */ {
+ UAPgOf: {
+  'tctofur': ["https:\/\/example.com\/owdQy1uryGI?v=488", "https:\/\/example.com\/Kr5BFVgGYXz?v=931", 'rjy vjispht ez',],
+  MXMTmm: {
+   'uc': "https:\/\/example.com\/sP1aLEbdR0H?v=53",
+   rKaHtU: "https:\/\/example.com\/8cJyBoKCMQj?v=820",
+   xdRrAz: "https:\/\/example.com\/d_9zIz1H-2d?v=842",
+   FFpqma: 'vsbtz dg',
+   'qxhxvxw': 'ewejlmefi iehxlqgy koojucb ruu vakguwzw wmcjvduy'
+},
+  qbEGoY: {
+   KKhmdW: 'mvaz igzny riqlbxqtq ydqs',
+   gJVBMp: 'fcscqerku',
+   'unbbzm': "https:\/\/example.com\/risMyyQ-llh?v=916",
+   'nvgpmyc': 0xad2fe5
+},
+  'ptp': {
+   CPVZZZ: true,
+   'prrj': false,
+   'jiddbf': "gcwl wfshdsnec ijwe \u00e9\n",
+   uVVtzC: 'lqmlguwfv hadxvxfpo qwowr',
+   Ttzsjv: !1
+},
+  'nkjy': 334954
+},
+ 'xokesb': "https:\/\/example.com\/aHtxRnDTN7C?v=289",
+ igRBun: 'cn pvgttaqee mljn ujmhi ovjikzgp zkreewgrf',
+ 'vw': {
+  SDeIwe: 413105,
+  hxPboL: "https:\/\/example.com\/lkiDmNGRESJ?v=836",
+  MhbGrr: 0x2ccc1a,
+  'jy': "nqxjh dnjuysee kujlvb \u00e9\n"
+},
+ 'hefwvm': 0x1654a1,
+ kddhmr: false
+},
+/* item 48 */ {
+ hbVmoK: -561127,
+ CHBjRa: 'izrrcm kicxcvrpa enpjcipig wrycxgube oxahopndh',
+ OtJGov: 0x934daf,
+ tcAxtP: {
+  JqDNnA: {
+   'kzzvjumw': 0x7491a0,
+   zsvcdj: null,
+   nKRzVk: 0xab03d7,
+   'ijpbekwt': "https:\/\/example.com\/ZciGKfAy0BT?v=34",
+   'ibxom': "https:\/\/example.com\/uaCwOlD4jna?v=561"
+},
+  kZXVjR: {
+   'fgpgiv': "zincwkf cbdwlxth pgzc \u00e9\n",
+   xTZUHG: -131517,
+   'zhd': "nnlnyba rgb rhkbrueso \u00e9\n",
+   'kw': -508636
+}
+}
+},
+/* item 49 */ {
+ HCZAoq: 0x954d7c,
+ QNJVtp: 0x6e363a,
+ ZHOqZa: {
+  AygjBd: {
+   'efqpqtjwc': "https:\/\/example.com\/UyGCQ8Vxt2R?v=132",
+   'po': 0x5eb5bf
+},
+  kOjeni: 429836,
+  YiKSOi: "https:\/\/example.com\/WpGKQkXglBq?v=600",
+  tfPxFa: {
+   'beccnuyzt': "sleypo con gwj \u00e9\n",
+   hDdDmt: !0
+}
+},
+ uVHiUE: "https:\/\/example.com\/oE1lQoIUu_K?v=637",
+ IBXxyf: 0x15182
+},
+/* item 50 */ {
+ 'loieiwmf': "cecp adsofquv oczwub \u00e9\n",
+ 'zjz': -859229
+},
+/* item 51 */ {
+ 'ykf': [,]
+},
+/* item 52 */ {
+ 'nccp': {
+  'py': ["https:\/\/example.com\/wXH7oIN5L3J?v=484", 'bffw srxgd', true,],
+  nHRMMi: [460945, -530171, 'jz ssgeiltl xmrvewx lgwxqhkiq', 0xe1d175, -871063,],
+  'usufknnl': [!1, 0x36b807, "https:\/\/example.com\/BT2_C0_bZRe?v=308", "usidh iyj leyer \u00e9\n",],
+  sTOMmL: "mc lz ogw \u00e9\n",
+  ldYGLF: "https:\/\/example.com\/pBSDkxidp9b?v=98",
+  'mijlezf': undefined
+},
+ 'oaiinja': {
+  'fjexzcs': "wpb rjpevxznl nifi \u00e9\n"
+}
+},
+/* item 53 */ {
+ ORLCnO: 0x7a6d10,
+ 'swu': 0x102a4e,
+ sCGnyB: "https:\/\/example.com\/q9RiddhWZJ8?v=488",
+ ktrypd: {
+  PAMgey: 546540,
+  gmwaKD: {
+   'bkbloz': 186070,
+   'qpeftyrmg': 'afwdsvamw mj pkclcesop goramuah inususav uaiwtbru',
+   'hbj': "https:\/\/example.com\/YRBIPUnrTIV?v=942",
+   'xqastx': 0x6fcbde,
+   CMjqlo: 0xd7670,
+   gGvNGm: !0
+},
+  'jyzqg': ['zxggl zgwsz gann pbjcwnjr aidpuwawh',],
+  ImcTAv: {
+   'jwg': 'oepiox tgumlf',
+   piKeXS: !0,
+   wDCUMO: "https:\/\/example.com\/FWolzOrykr6?v=352",
+   'paw': 'ziiqepmjb guz odca lth dvb plrrjw',
+   DgQlZp: null
+},
+  'ufrfdkdkq': 'agu pfb abskmf qscsh',
+  uAStyR: ['vrwgvrg dohp wyshe ppzle', 180996, 'wornlsv lexm dsz swyh tedipk', 998948,]
+}
+},
+/* item 54 */ {
+ 'kkzsips': "https:\/\/example.com\/NyAZ-1555Ot?v=970",
+ 'lpq': ["voxhtso tm onyx \u00e9\n", "https:\/\/example.com\/0fZ9saeIVMn?v=532",],
+ iCatMV: 0x4edca4
+},
+/* item 55 */ {
+ FUxXFr: {
+  FxWnHX: 0xff35ae,
+  'rkqeatf': "titnmlit cevgox xdtaf \u00e9\n",
+  EIEpFU: {
+   ztxHJf: null,
+   ppBort: "jknxaa zrquket eltnsatyf \u00e9\n",
+   NpBsqT: 'ckjol byvulsyjl qha pexnbl ltshjy yrwfl',
+   IGxAVO: 0x99e650,
+   tZvJUr: true,
+   'lpkqiysfa': 'dqdbwlog hvrfgg'
+},
+  'vksmzozb': -482708,
+  QTioxf: "poi wki xezxghjm \u00e9\n",
+  'ecjdijw': undefined
+},
+ 'fgaa': -78847,
+ KlGFcC: 0xd51504
+},
+/* item 56 */ {
+ acamBv: "kawmx joludzfc ctnoael \u00e9\n",
+ 'eyq': "https:\/\/example.com\/zYYPEbr3NPQ?v=415",
+ 'pryuq': "https:\/\/example.com\/AETJA8dNgnH?v=592"
+},
+/* item 57 */ {
+ lzVvdS: {
+  CAirJn: {
+   CCwFTH: "https:\/\/example.com\/qDyuev0T_pq?v=151",
+   CBWoYO: "fozqdbi coppquw dwxwyld \u00e9\n",
+   'stcgivwde': "https:\/\/example.com\/7FsLHopK5xc?v=920"
+},
+  tacpLT: null,
+  'yzkmx': 0x30af5
+},
+ 'tkycms': {
+  'zyagvh': undefined,
+  'hrojkd': false
+},
+ PakIFP: "https:\/\/example.com\/zBPGI-A2MOt?v=417"
+},
+/* item 58 */ {
+ eouWgx: 'kuziky qopsecusy',
+ OILGoS: false
+},
+/* item 59 */ {
+ 'inn': 'kcg qzymhspn judmd xbdkyvu',
+ XkIrRf: true,
+ 'sqnbj': "https:\/\/example.com\/ujceJyJu8HE?v=543",
+ PxieKn: {
+  fARttz: null,
+  'oxunpksmx': "https:\/\/example.com\/NCZs9YiddrM?v=662",
+  'zjpiwsdu': !1
+},
+ oDZZtV: -345162,
+ 'pzfhlnsmw': 0xb99166
+},
+/* item 60 */ {
+ NPGLdJ: "https:\/\/example.com\/w8nUq7Y3LDj?v=878",
+ 'hforbw': "https:\/\/example.com\/x5CSHaV1nHK?v=867",
+ 'xwa': 'yjud socmzgdhd mju uxrynd amks avrez',
+ 'eufaje': "cwu ujsz ofgnuhg \u00e9\n",
+ ZpTngN: "https:\/\/example.com\/gIhsDkVtj-J?v=557"
+},
+/* item 61 */ {
+ pWhaly: [,],
+ QhfBbc: ["https:\/\/example.com\/Yu_zvw5pKjw?v=534", "wmimund nofusdtv kjmfoobad \u00e9\n",],
+ AXgskH: {
+  'kwhnlrviv': {
+   mYtmyD: !0,
+   'vfaembdm': 'tf byh nfcgytod nr',
+   ZLXDFW: -470733,
+   PjcPGr: "https:\/\/example.com\/qr5fjqa6ZM1?v=506",
+   'srzousd': "https:\/\/example.com\/0l4vBeQtras?v=200"
+},
+  aitzwL: "https:\/\/example.com\/iEiiubOg664?v=292",
+  'vun': [true, 'fd tg', -16355,],
+  NWRgmE: false,
+  'agwbiwxls': -652359,
+  SAHehx: "https:\/\/example.com\/lXOXq8rAzae?v=782"
+}
+},
+/* item 62 */ {
+ VjRDpY: 0x1d0be8,
+ YmMeGJ: "kd hlnbifdp su \u00e9\n",
+ hwuLhI: {
+  'rzya': -95510,
+  'hpgfwkg': ["https:\/\/example.com\/i57PKeBcXI6?v=491", 0x2bd242, 'ihpytzga ytrai ycejzetb efa hkqqxrw orox', -526851, undefined,]
+},
+ 'nrfhylgu': 'wazsxns',
+ tOqjJt: 0xfe5465
+},
+/* item 63 */ {
+ 'tegzgm': {
+  WHHmSd: !0,
+  'yqqveqfl': {
+   'uwfo': "https:\/\/example.com\/0SdO5SQMrO_?v=592",
+   qKVBDG: -427776,
+   iZFzzz: -568262,
+   'zool': !0,
+   'ncvvkdeu': "https:\/\/example.com\/a7w3HkjX-SH?v=491"
+},
+  'vuhrhblh': 149661
+},
+ LwNZkF: -369147,
+ 'mmfwquil': undefined,
+ 'almxtj': "vzpbhjc obs ox \u00e9\n"
+},
+/* item 64 */ {
+ 'fqhvodf': 'dfvhie',
+ 'nudpuqy': 345810,
+ KmOTJK: "rgzlfxw kl qa \u00e9\n",
+ mHOSxh: 993803,
+ KAvYiD: false,
+ 'zxksaudi': undefined
+},
+/* item 65 */ {
+ 'yngmayv': 0x3000d1,
+ jCdHxY: 0x556cd8,
+ 'dkhsruq': "ltzuh zfgjfmj ua \u00e9\n",
+ wfhtDh: [{
+   cjFfeh: 0xfbf8a3,
+   'hiwfqe': "rbxusknnu kntout vfnlwr \u00e9\n"
+}, {
+   'qmwpc': "vsssh rnxdzyt qb \u00e9\n",
+   ZDBnDi: 200617
+}, -235020, -97186,],
+ NwBNVd: 'cjgiijf tfuvz qarby ptt uefni',
+ kOaLCv: null
+},
+/* item 66 */ {
+ UEDwDB: "gjibwvd hlldyb zqvj \u00e9\n",
+ 'xbvqt': "https:\/\/example.com\/15GDMyYnh5y?v=319",
+ 'badlmlqrv': 'cobvzrrs drr hlwemniu'
+},
+/* item 67 */ {
+ 'snitdy': 'bpnq kvr',
+ 'ejsaabtj': [,],
+ xMhKkQ: "https:\/\/example.com\/rO_Zdr45jDR?v=773",
+ DPUwwO: 'wch iufbmfi hytskjvc kntjvne tzte iwwka',
+ Ygyrpz: "https:\/\/example.com\/R2_jTrk068S?v=170"
+},
+/* item 68 */ {
+ 'qc': 0x1543d5
+},
+/* item 69 */ {
+ 'jrr': {
+  'lqxrhqb': {
+   'vh': -715800
+},
+  DBWYXo: "https:\/\/example.com\/6TuT83co83o?v=658",
+  JEBCkb: "rymu tv chkaypb \u00e9\n",
+  'yw': undefined,
+  'rqpii': 278406,
+  'wznofjxak': ["https:\/\/example.com\/cjXr8bzwgfC?v=128",]
+}
+},
+/* item 70 */ {
+ NlDMVF: 'okxmuxv co oezqyd xktx cqd jcyz',
+ bwkqvy: "https:\/\/example.com\/FEmYNZBDOgN?v=150",
+ JgnWRN: [{
+   btjEka: undefined,
+   'xxdtbqp': undefined
+}, 'mho nf zsqrg qv', false, {
+   'tbbmg': "ha jwhybtjd ibpvfb \u00e9\n",
+   'yqrpkah': -866348,
+   QcFHgs: 'dpapzireu',
+   PdnZyz: 0x61f78b
+}, !1,],
+ mrCdmN: 'uuynh vw lrwpne'
+},
+/* item 71 */ {
+ 'mv': 0x1fef3c,
+ KIXuIj: "abowpn llpjkumah fhh \u00e9\n",
+ 'bhg': 'vkjqtyzh yek luegkkfx dmca'
+},
+/* item 72 */ {
+ PKyotS: 'dt',
+ zTdUTR: undefined,
+ 'ouhknutc': [{
+   'ftu': "https:\/\/example.com\/OeKXyHLvLYw?v=338",
+   qrpicQ: 'ayluysuta psluszp ynhsznxe qiekcnv',
+   'sfnqyoeh': "https:\/\/example.com\/gqrJpFEu7sP?v=430"
+}, !1,],
+ vzNGdG: [null, "mpggx nubtqk xxjkd \u00e9\n", 0xc72d42, {
+   QGpenH: 0xf0963e,
+   'xdwt': 633640,
+   'yaz': 0xbff96,
+   ZQlNMs: 'abvtj fbvk',
+   'gtd': 260579,
+   kCZGpK: "deocpnzrr fimdwyi rwgfvrmmn \u00e9\n"
+}, {
+   'irzoore': "https:\/\/example.com\/a9w7rq7jwq5?v=195"
+},]
+},
+/* item 73 */ {
+ 'zsnaxs': [!0,],
+ 'arspksxc': 'jlptr zghugdiqz',
+ fUkeEE: 393246,
+ 'uwistx': {
+  'rqt': 0xf9b856,
+  xChAre: null,
+  EmdoxR: ["qhsszqyq cc nrlpbdxvh \u00e9\n", "madplrqpz mx utmm \u00e9\n", !1, -653908,],
+  'sl': 946206,
+  'kiqmf': ["https:\/\/example.com\/rTQ2v2oCqul?v=694", "fj bhkeoq ubtrvm \u00e9\n", "https:\/\/example.com\/XKBXTNvLXrc?v=844", 'xmkoaew pyeovfeto wlfjhrev cdbxkmgnd zqo rjnc',],
+  JPHdGy: false
+}
+},
+/* item 74 */ {
+ DDcFHh: 650238,
+ WbyhIq: [,],
+ 'rdpbb': {
+  'sjhphil': 0xe3f3ae,
+  'iqdjg': "https:\/\/example.com\/uqXKe107sOF?v=875",
+  KQkkpn: {
+   'aemolaz': 0x91a030,
+   'gqf': "furf nsxkue bcwwhtzrm \u00e9\n",
+   'tfdv': "https:\/\/example.com\/TH1o-JezUHU?v=657",
+   'xvvkjao': 0xf74c6e,
+   DQtxsx: "afwfegdva kxdjmgqeg xfqakqct \u00e9\n",
+   'sfdm': -671967
+},
+  QKlEhS: -943921
+}
+},
+/* item 75 */ {
+ 'damls': "https:\/\/example.com\/KhTegCbq3Ep?v=427"
+},
+/* item 76 */ {
+ ZSpyTv: "https:\/\/example.com\/C3rMiQuQvBF?v=490",
+ JkFDfv: "gmybijz ifco slcy \u00e9\n"
+},
+/* item 77 */ {
+ 'estnyyp': [{
+   'jcgio': "kxciivk fkobwrav xwyp \u00e9\n",
+   bilnEm: "hbcbyt cywp riyw \u00e9\n"
+}, "nksv hwstj qtqadj \u00e9\n", {
+   HHJIOj: false,
+   'aicdvsg': !0,
+   cPRgBs: 166227,
+   'tonq': "https:\/\/example.com\/HQAiSxKBKO9?v=434",
+   KOuvhq: 0xe26a85
+}, 0x500f2e, "eoa pc tgwirux \u00e9\n",],
+ 'iutiydu': !1,
+ VvOWKv: "oprdpbwl mfeztwvn wer \u00e9\n"
+},
+/* item 78 */ {
+ AOcLhe: {
+  'zrlxwjo': -562760
+},
+ 'ccpkofsef': [0x272061,],
+ 'yg': {
+  ADKDQR: ["nkdf awgkqprqz xvd \u00e9\n", "https:\/\/example.com\/J9UMlzmyzbQ?v=314",],
+  vrFaal: {
+   QGNSgm: "kbxqraoer oxhwy ldzwq \u00e9\n",
+   UuVLMU: "https:\/\/example.com\/Y1jqwAca1ti?v=822",
+   'wpiccguek': -531224
+},
+  DApNbq: 'vdo ztcyl mpgloril',
+  'lnpwzy': {
+   Hgixge: 0x5dc5d8,
+   rjrCif: 0xeebd8e,
+   yTwASY: "https:\/\/example.com\/3Zoj_VUJxIC?v=380"
+},
+  'lhd': "https:\/\/example.com\/Dw8NZD-6xkU?v=22",
+  'sc': 0xe51a30
+},
+ 'xqqxgt': "https:\/\/example.com\/uKrIJaqlLdG?v=165",
+ fxamrc: !0
+},
+/* item 79 */ {
+ 'kvdgvubj': {
+  lpOZwC: "gvu npvnakpb csnkuyv \u00e9\n",
+  tkGjRA: "ya iyf vgsy \u00e9\n",
+  RFFGSQ: {
+   DcRdug: false,
+   'vyp': 'horyhdvvi qytceja hwayunbi omhz nkqb wrgmfm',
+   'qwjea': "emfze vaxsgyxz mq \u00e9\n",
+   'aqvh': "https:\/\/example.com\/3coa-2d3IMO?v=990"
+},
+  'dclkixu': 'ufb vyvwz eduarosk fwbtnypad',
+  'bifiujsf': {
+   HgBDXy: "https:\/\/example.com\/Q_seF0Wa1Fk?v=470"
+},
+  'uifqgibss': {
+   ewVRPg: undefined,
+   'anwpim': 'tlbkzykll xblir ghjdql ihw rtrbyiy'
+}
+},
+ wuJITQ: {
+  egtCVi: [,],
+  'xwbzmjl': {
+   CWTwtV: "gntilsfgy kwxu pcs \u00e9\n",
+   'rccraamjq': 'vebrrqp dln vmqyz',
+   'clp': 0x8dd2ba
+},
+  'smojzn': {
+   'gepshp': null
+}
+},
+ 'hmekqujby': 'wuarnrtwz hp czix teyxtao xmycqivat jubqofqvy'
+},
+/* item 80 */ {
+ uGwMtU: 0xbdd411,
+ 'jb': -84265,
+ FjDItp: {
+  bgvCQj: {
+   devLEb: "https:\/\/example.com\/twcUyxmnEUv?v=823",
+   'djamn': "hvltsw tg xhe \u00e9\n",
+   'nyuqvbfzn': undefined
+},
+  'flxqglpaq': 'qhsrhz ebcdq',
+  GjXWgm: 0x445a79,
+  ICrJND: -945822,
+  'osogtxg': "https:\/\/example.com\/kdRqnziuF86?v=18"
+}
+},
+/* item 81 */ {
+ 'hfgcm': -603490
+},
+/* item 82 */ {
+ JZPPFk: ['xdwco ymtw', 54878, !0, 354938, {
+   'xahy': "heun diyab dehtgwe \u00e9\n",
+   cQQAYT: "luyhmuq ynuc doag \u00e9\n"
+},],
+ 'ujzvixft': true,
+ 'eyylrbuko': 873668
+},
+/* item 83 */ {
+ 'wmwwjom': 'qwuyxxviu luht uuzsagpgj ph gpth',
+ 'jecyssai': {
+  'zh': 'zj oy akgf',
+  'urqqss': -285436,
+  manwpY: "https:\/\/example.com\/LRgVS7Wtll6?v=185",
+  'pulebnzes': 0x10042f,
+  'ehbxlowo': "https:\/\/example.com\/HWBqlWcY3CA?v=251",
+  'wrwhu': 'aagal tpsnnvlj dfldn hzrn dnqg'
+},
+ 'qvqxhn': "xcmx zlzixjfeb yuwyilqk \u00e9\n",
+ 'lochoytqa': 399283,
+ 'iqjbnsfi': "https:\/\/example.com\/A_P2HZ4Xuew?v=230",
+ 'sqcx': 471807
+},
+/* item 84 */ {
+ 'pkzpqo': {
+  'masec': ['ixqgjo', 853839, 0xe18a32,]
+},
+ tjHGiC: {
+  uzeQfY: 660923
+},
+ 'pggplgcrl': 'syvdkbcn',
+ 'obmy': undefined,
+ ZsYbnv: false
+},
+/* item 85 */ {
+ JosgtW: "https:\/\/example.com\/WswiSFuvtZo?v=299",
+ 'adtfda': "https:\/\/example.com\/L7c3sAJvyME?v=822",
+ 'bbe': {
+  'daqrro': "bjydujv juzasrb rfriunyqy \u00e9\n",
+  jdDFwF: 'yi an wwo lxvzx rfqcv'
+},
+ IEwwBF: -377800
+},
+/* item 86 */ {
+ 'qnyrki': 0x43aa86,
+ lqRBmp: {
+  'bpotv': {
+   'mgzexzn': "ijudaw pcnih racmkvoj \u00e9\n",
+   'ypdkeel': 0xee657e
+},
+  'leyb': "mipy tfvnoe trao \u00e9\n",
+  'ceezmyl': "https:\/\/example.com\/GMBdvcJXDHd?v=146",
+  'lj': [0x4dcacc, 0x2e6d4f, "xpdjrdmw ehzr cpsf \u00e9\n",]
+},
+ lsPYvm: "https:\/\/example.com\/OptG6zn8uKG?v=946",
+ 'yubhehj': {
+  'iezixf': [,],
+  kIcCTm: 'dpzt nktnxfgf rh',
+  'lhvfq': [0xaafa28,],
+  BHZdLP: {
+   'exgx': null,
+   'epi': 'ber ql hhtnh fbgojha',
+   xnCxbu: 0xed2595,
+   LOyAvS: true
+},
+  IAXVhn: false
+}
+},
+/* item 87 */ {
+ QjpCdk: true,
+ miLcKf: 0xdee974
+},
+/* item 88 */ {
+ DPjdUe: 'xdohvxr utzcc rweccbhku xvdfymrb elnfias rkmzqixg',
+ 'tavjyzevh': -572865,
+ YoUEbW: !1
+},
+/* item 89 */ {
+ 'pqgemajih': 91851,
+ 'mohuf': 0x556ddb,
+ 'qgetscwe': 137155,
+ 'pou': ["https:\/\/example.com\/bpdpXN8YB8I?v=639", 0x58b139,],
+ BBiVcw: 'oktuumjb rlvdzpz xwfacylv',
+ 'hoeweiny': 'cy ovk yinaytr'
+},
+/* item 90 */ {
+ bgPJEy: {
+  hCTOuO: ["https:\/\/example.com\/-By80q0XtAg?v=633", undefined, 'xlzexaogx gvf igrxhau byk gsgeej wmgke',],
+  BzpXWj: 0xb419f1,
+  'aoie': {
+   mSEpSt: 0xf08505,
+   'avskahbi': -183342,
+   'da': "https:\/\/example.com\/JCuad8Wgova?v=404",
+   'djearucjo': 0x78091a,
+   'tnd': "https:\/\/example.com\/JYS-CZDTUWE?v=225"
+},
+  'tukdbtv': "hmcpeexau tyyemaq xb \u00e9\n",
+  wOgIPY: undefined,
+  hXzPrJ: "wbflpujcn cl lqtzqt \u00e9\n"
+},
+ 'bcwohdlkk': {
+  RFJYzE: "https:\/\/example.com\/4R3dPC13YQi?v=109",
+  'ayzfpv': null,
+  XjsLFG: [858057, "https:\/\/example.com\/ovzm2GbjnsB?v=742", !0, 'cx wb', 0x9b1813,],
+  'konwcknz': {
+   'xtpefaugt': "https:\/\/example.com\/HAvPOyvs-Wy?v=676",
+   iQiurc: 0xf84dcd,
+   ILEran: "https:\/\/example.com\/6wAQnjK1dTi?v=865",
+   KyNFuV: 0x7602c3
+},
+  yIxDNX: [0xc253c2, 146124, !0, 'nwjmamhl dylxx gmawbuovb ha', 'le gkvl fg tgww bnmbepfpd daahakd',],
+  'blxmcrdm': [,]
+},
+ 'uq': ["https:\/\/example.com\/-faPHbVM1cH?v=698",],
+ 'qm': "https:\/\/example.com\/JZthd7r3_t_?v=798"
+},
+/* item 91 */ {
+ GOPfUH: 904406,
+ 'pyoeazr': [383265, "https:\/\/example.com\/m3lKfcYdaEi?v=367", ['or tiezrqsgw cdi', 'xkqmadauc',], {
+   'ry': true
+},],
+ 'uyrchsw': -828780,
+ 'ehzowpos': 331040,
+ 'enf': "https:\/\/example.com\/-xOWSok1N3U?v=662"
+},
+/* item 92 */ {
+ 'qj': [-537206, 0xb4a14c,]
+},
+/* item 93 */ {
+ vvjxdr: undefined,
+ 'rszg': {
+  UDskQK: [0x77b7d, 'xy qzingaud', "https:\/\/example.com\/EPbOfLWa3B9?v=461",],
+  ZRoTSf: "hltceqlhg xevbw zhphbyyv \u00e9\n",
+  'obbgasq': {
+   'dewu': -831279
+}
+},
+ lBowjN: 'rrnrgn nm tldkrn soelz',
+ LJhMrU: {
+  'ffad': {
+   gRWHrR: "https:\/\/example.com\/4iI51M2CZv1?v=103",
+   MkMiyu: 233652,
+   dTJWGJ: 586221,
+   kePNTB: "https:\/\/example.com\/IBf4j1RIHw-?v=385",
+   'bicomnoo': "https:\/\/example.com\/ZAOtTMMchjS?v=878"
+},
+  EWwOcd: true,
+  WPZDqd: {
+   'hkibx': "https:\/\/example.com\/0ggppVUbVkW?v=665",
+   Voltkg: "ksenqf qlarpmtx va \u00e9\n",
+   'rfuwggjv': 618186,
+   'pyzkcs': 150064,
+   zwFljT: 'hjsskqsr bpakwo gwllue vvmfyj',
+   ScenSD: 982616
+},
+  djqKnr: false
+}
+},
+/* item 94 */ {
+ 'bpi': {
+  cRyfno: false,
+  NZymsu: 84609,
+  SAmups: "https:\/\/example.com\/QR-CP1NtWdA?v=3",
+  dnxfLL: {
+   gpDWFj: -385788
+},
+  MZKmNv: 113175,
+  NIxmYU: 'xk'
+},
+ kHtUBr: false
+},
+/* item 95 */ {
+ ukbSdT: {
+  XlQabL: 0xae5948,
+  'pssnbsdf': "gfzdysc wmh boabwr \u00e9\n",
+  lDnWen: "https:\/\/example.com\/SXxgKTIyQKE?v=948",
+  CbZJYi: ['bgkkg tny zselukha', undefined,]
+},
+ MqYgSz: "gighgoj ossbbd qolkxwmc \u00e9\n",
+ 'omegnqn': -439555,
+ qAaoPt: undefined
+},
+/* item 96 */ {
+ 'cfm': 'cfrrquv xgbj mbxmq'
+},
+/* item 97 */ {
+ 'ecvgavkcm': 0xc02a3f,
+ 'nldx': {
+  'yfjaw': ["https:\/\/example.com\/Q8522lKe_eL?v=438", 625352,],
+  'ov': 756025,
+  GTveeH: 0xe030d5,
+  'stopng': "https:\/\/example.com\/-6ue8H0ndxx?v=308"
+},
+ QzMFgG: -533349,
+ DZLvRO: "hmhjkwxd aexjjxfn mucwbs \u00e9\n",
+ KkLWSf: ["https:\/\/example.com\/0HXoe6N9zZK?v=249", {
+   'pzuitom': 0xd77d22,
+   'ovjk': 674727,
+   'gc': null,
+   vALOiN: "vsgfdd enxvsb osagqp \u00e9\n",
+   ysKmoi: !1
+},]
+},
+/* item 98 */ {
+ rKqSvC: "https:\/\/example.com\/ZgqGKp1FkVu?v=815",
+ 'oxd': "jw aj rlwur \u00e9\n"
+},
+/* item 99 */ {
+ 'rtz': [192265, "iqyetsjab hic cgr \u00e9\n", {
+   cMwUYL: 'nx'
+}, !0, {
+   'zpw': !0
+},],
+ 'linbef': 'ddui weybbcp qcku',
+ iCLxYA: 0x53a633,
+ cqlzrA: [undefined,],
+ 'eyuvkkub': 'ee or mqpxtumc vnzpkgnfc'
+},
+/* item 100 */ {
+ 'yltlmaev': 'nfwy',
+ vJFTON: 174804,
+ 'uunqt': 0xd768d2,
+ 'hycm': 0x140dc7,
+ 'xalhosund': "https:\/\/example.com\/3meU-dHQ2FQ?v=116"
+},
+/* item 101 */ {
+ 'ezs': {
+  'tkg': 'yxn',
+  'iyp': {
+   'pv': 'tn ssv',
+   'jssrpa': "drkytoq kziw eyw \u00e9\n",
+   'skdjttw': false,
+   'fceurv': "https:\/\/example.com\/Yf556tNgZUe?v=847",
+   'kvk': 0x4bd53c
+},
+  'fgo': -406801,
+  'ldnyq': {
+   xUVFyE: -541658,
+   EtUPRk: 'guurr cbnakjbl igwgsub',
+   ScxQwN: "bqnkcguiw njnrfdcvl cv \u00e9\n",
+   'xdnz': "https:\/\/example.com\/HLuZWT9Hdt8?v=677",
+   ozDIVV: -155324
+}
+},
+ 'fq': 'iki kiaoimcix prfyvvkum ddmagczz hey',
+ 'lqwbuos': {
+  OixnaS: "euqprqu repgfrp lipch \u00e9\n",
+  'wuqb': -799556,
+  'egtaszec': "yxzubj xwo nrygcy \u00e9\n",
+  QwPJIE: !0,
+  HNHJnd: {
+   veEQsp: 393467
+},
+  'diytc': "https:\/\/example.com\/iYgOWrB-ylA?v=738"
+}
+},
+/* item 102 */ {
+ 'jpuoa': {
+  'iqkoqf': 0x7aa6e2
+}
+},
+/* item 103 */ {
+ 'jkcuudml': {
+  mwkoAx: {
+   'lpfvkf': 0x968aa8,
+   ZzERTa: 0x860f19,
+   sJwRuR: 0xbc038c
+},
+  'ozwo': "fngh timwqdf nc \u00e9\n"
+},
+ gRlgjX: 0xb8bb4a,
+ JVaWVP: "https:\/\/example.com\/NxLq6PGwG5n?v=707"
+},
+/* item 104 */ {
+ 'deu': "xdh qcigrey lodfu \u00e9\n",
+ wvhXkU: -57597,
+ SPOLHA: {
+  MirDvH: !1,
+  'cwfodlis': !1,
+  gBGgTL: 162650
+},
+ PHmUQZ: {
+  XGTiJw: {
+   WeDGbC: -162187,
+   DVEbnr: "https:\/\/example.com\/ikK6WSMUAvL?v=465"
+},
+  'usiui': {
+   'cwyqrhlwn': "aixtger uyri rsjomllzy \u00e9\n",
+   OcidQI: "buqo mign vrprl \u00e9\n",
+   EabhsU: 'vvnmnkkrl udjcn anmvvctb kvgl jstlm',
+   'mohilnhwk': 'zmrxbcv dbdltfm bdf bu',
+   'pzmkwnw': "https:\/\/example.com\/3aBqPB4Z_GP?v=541"
+},
+  'izg': 0x985e1,
+  'fq': "https:\/\/example.com\/8FwwO3zgFGT?v=684",
+  cqUozz: 0x75b332
+},
+ cBctXF: 682134
+},
+/* item 105 */ {
+ 'hgb': "vtuzkiaqx ijea shqwtprgt \u00e9\n",
+ 'vyxbwr': 0x63129d
+},
+/* item 106 */ {
+ 'cyufbx': {
+  'fcn': {
+   'mkbyx': 0xd8f673,
+   TDbOsp: 831755,
+   qIdoNg: 'gjhwpmb nclwt zuwbgcxzy',
+   'yvwedxhn': "yphmjez snqf aieatkyib \u00e9\n"
+},
+  mZfGxl: 'sxjyeflo fua hyywdlt zthjsuac',
+  ItVqEW: "pkwc ckvwkl tzvhiuohm \u00e9\n",
+  'bv': 0x43e7b3
+},
+ 'uby': {
+  'wuemelzsg': 0xd099d8,
+  kUyHeA: "https:\/\/example.com\/COh4cZhnCt_?v=941",
+  'iym': 0x67439c,
+  lZMXCn: "zg pzohxaq ixodi \u00e9\n",
+  ohPHOB: !1,
+  'lkpnldid': {
+   'pbkre': -910941,
+   VVfFvJ: 0x386537,
+   'gpxwgt': 123046,
+   'ztbpm': 'zkauahx',
+   mSTiRB: "qzllmp xb ylenc \u00e9\n",
+   'klqcum': 'jtd fwyjoloqe'
+}
+},
+ GFYBBM: "wbwdoepsd zxijh pdzyl \u00e9\n",
+ Nzdkhh: {
+  'nywcjfby': 0x4ff57,
+  'pxvppgk': [false, "https:\/\/example.com\/UdfBnkkqtLE?v=938", 'ihqqo', "lfp sk imdtfuumt \u00e9\n",],
+  'rsyb': "https:\/\/example.com\/eRfGe91bpKD?v=824",
+  'qidzorjtj': {
+   'pddwh': 'rwjrgfftz sxkpb xno dk',
+   'cc': 0x5b8567,
+   'qyp': 'nhpnda',
+   MYnuMd: "https:\/\/example.com\/viVc86mowjP?v=232",
+   'foasinowp': -911542,
+   'gyp': "https:\/\/example.com\/5t5Ry7BB-G9?v=299"
+},
+  zZPAdA: 408450
+},
+ 'ecviziipv': {
+  uIyoGK: "https:\/\/example.com\/8tyWXddagvD?v=156",
+  dJmgts: "wjazbyder pnxauov sulqugvgq \u00e9\n"
+},
+ CqDUNb: 'nsczhbt wljsfwl rrs hxubymix hsug'
+},
+/* item 107 */ {
+ EqzukL: "https:\/\/example.com\/KNG9SCq7oiP?v=564",
+ KIisqN: 'nyo tcyit olvej hdvhoztb',
+ 'ejip': {
+  'ajkune': [!1, false, "umd zcfy vnty \u00e9\n",]
+},
+ Afzmqj: false
+},
+/* item 108 */ {
+ vTxsgT: 0x2e2213,
+ YmcfbF: 291295,
+ CILwhz: {
+  'jma': !1
+},
+ 'hnwup': !0,
+ zUYNZN: 'ik lamhqbvcd cgy vgogccio fcsipnqlg'
+},
+/* item 109 */ {
+ 'sdv': -640778,
+ SmZOen: "https:\/\/example.com\/njz4F3ti26A?v=292",
+ ANKFQz: 0x626398,
+ XmszAg: 'mmjqdlyea fyakgoq spvigdu ngyssewg olp',
+ 'utqu': undefined,
+ FmvBzY: [[,],]
+},
+/* item 110 */ {
+ 'zkbrxjwgr': 0xee2242
+},
+/* item 111 */ {
+ 'bsnplgw': 'bjdtv ngptu frties mgbwwxz uzvtxq',
+ 'mzqh': 'lcg obt llgxircd brn vcdbsllr',
+ VyoLqC: {
+  LlZZpV: [,],
+  ERFBNd: 'wseiwgl teepj cliutgm',
+  'udcjvjyi': 0xa4f6f4,
+  're': 'owgz drtt efr mjugaucx'
+},
+ 'xg': [{
+   'ginzd': 0xc5b05e,
+   MfIUpy: 349531,
+   VvkRAr: "tlres ujku xbgf \u00e9\n",
+   gHOvnt: 0xf65834,
+   uLTYyN: "aqlhrtd yzwigi miqaaqeot \u00e9\n"
+}, {
+   'uvueauzab': 0xbce781,
+   AspqQG: "https:\/\/example.com\/oMC4B8of3b1?v=24"
+}, [,], 0x986ea3, "https:\/\/example.com\/rzdzVEupOmH?v=431",],
+ 'an': {
+  RKokzn: ["https:\/\/example.com\/Cd9cgIJNfVj?v=591", "https:\/\/example.com\/Mp5XxQ5zAdq?v=969",],
+  ylAJnx: "https:\/\/example.com\/hiy8TNpTFtk?v=718",
+  KdaVFn: 246846,
+  jmmheB: ['ngpef dzt uuwdotvk', 'tv bsvmbcln qrkuy kggzpntb ocgdc', 0x65c9ab,]
+},
+ 'ahlmmcnf': 0xfbb103
+},
+/* item 112 */ {
+ 'rtzjqeivd': {
+  GRIgcH: false,
+  'bitlrke': "fvhfo upxdk evcnv \u00e9\n",
+  'lvrb': 0xa942cf,
+  PYuVrk: 639843
+},
+ 'aluzg': false,
+ 'ze': 633289,
+ ARxlIb: "nxwhlpcnj qowed opjf \u00e9\n",
+ 'fdrgsd': "https:\/\/example.com\/yHjZQV2482v?v=366",
+ 'cwx': "https:\/\/example.com\/QSvoHZcNGjG?v=197"
+},
+/* item 113 */ {
+ 'vxhyb': "dmlkliksc oaxwx qkkaqvsh \u00e9\n",
+ rwzkrs: 'numfwmj pry ojje bogpriqu',
+ 'jxftlw': 365065,
+ 'jbh': true
+},
+/* item 114 */ {
+ 'rxvzbjew': -627859,
+ FqzoML: "https:\/\/example.com\/k2_nDRHm9x0?v=804"
+},
+/* item 115 */ {
+ NifBPp: true,
+ 'lju': 'dbow mtmccjnv rxxlmxpry',
+ 'mxcf': "https:\/\/example.com\/cq7e9vrwZvN?v=93",
+ QfAvIw: false,
+ WfKDmi: 'wmrsi tixqmjg xz vm dehghw',
+ YYGJIT: 135227
+},
+/* item 116 */ {
+ 'xdweeni': "uxpygvqus stperz wbzxnyrmd \u00e9\n",
+ 'omehbs': 0x130ceb,
+ wOCNib: {
+  'iv': ['zvsqg srfs inqhvy sfz igas baqozklv', 'qqnp vlzbhzn hzitic rltf rsdzcqawy oty', false, "zidairh expznnwc mxafvccp \u00e9\n",],
+  'aupgpi': ["https:\/\/example.com\/Je885aLwHgT?v=781", 'blmkp ixhe cmtzu ltfnpgev jp ngotbfueb',],
+  'njsjcrjo': "bm lne dggt \u00e9\n",
+  lnZXeC: ['kvf ocwxxmv yjsumc oejr', false, !1,],
+  mUKvGh: 'dbwr eqnuruk uw arua',
+  'khe': "https:\/\/example.com\/U-65S98BGQ3?v=804"
+},
+ 'zyqqmfysf': 'spbouwc rlaml ikgplrt epsfy uh fxljxv'
+},
+/* item 117 */ {
+ 'oyoaqgk': null,
+ 'po': 0x328ef,
+ eGIjqg: {
+  'tbkgiu': 0x9b5ef8,
+  'kvqshqtd': "dhzyz epmvea bpsj \u00e9\n"
+}
+},
+/* item 118 */ {
+ 'rh': "https:\/\/example.com\/iyDrj8CQeAD?v=612",
+ 'uwdm': {
+  dkNEYx: "qnqr rjxgrl vmcqswvx \u00e9\n",
+  'rz': 0x771de3,
+  yRIESs: {
+   'yri': 'ffssbo hckypi hvswa kj ysmmjsb jtntpwo',
+   'xbzkdowrx': 0xad4da9,
+   PdxUrg: 0xdca6c9
+}
+},
+ vNnviH: "https:\/\/example.com\/xlKGWlkHh8J?v=547"
+},
+/* item 119 */ {
+ 'kyryhkm': {
+  'feyepynqn': 0x1f6411,
+  'wi': "https:\/\/example.com\/VngCm7zuu8W?v=25",
+  'dlchhtxgg': {
+   SVPXct: 'pi sgsxkvchp ybala cvcdeli ne'
+}
+},
+ 'aqwqf': "kinosx xewrz wih \u00e9\n",
+ dTXwVn: -857988,
+ 'fmpckbsg': "ihrsqfph lszvo jvq \u00e9\n",
+ FXSSaE: "https:\/\/example.com\/nJmh2NqT6Ab?v=809",
+ biJhOq: ["https:\/\/example.com\/O47Mu2VJARN?v=968",]
+},
+/* item 120 */ {
+ 'xytrzeb': "https:\/\/example.com\/Y6ncQq7zWbJ?v=634",
+ 'fkd': {
+  'rlki': "https:\/\/example.com\/9gXLYs-5S9z?v=253",
+  MZDyuN: 0xec2d2f
+},
+ 'hgbfsmpz': 0x3adf33,
+ OmXKWr: {
+  'jbsyy': -371957
+},
+ 'yvwyx': "https:\/\/example.com\/VHFFbGL7dOl?v=467"
+},
+/* item 121 */ {
+ 'jkjvtrpt': "https:\/\/example.com\/Ic_2LOYTmsm?v=208",
+ 'kxarab': 'klpdfj ka rw fzuj nurjo fuk'
+},
+/* item 122 */ {
+ 'kldtbdm': "xls oecbl nqgno \u00e9\n"
+},
+/* item 123 */ {
+ 'ltxcwbe': {
+  kiKThC: {
+   'hrofypg': 0x9d65c0,
+   CbRgtD: null,
+   NNBAhr: true,
+   'tbiauaw': 0xa3bbe,
+   wMSfMl: -483789
+},
+  'lhaocwf': false
+},
+ 'sgerqaoij': ['sauiu', [0x329bdc, 0x9f9d76, "https:\/\/example.com\/i5sSFPsTzey?v=594",], {
+   'gzbwwvrs': 0xf4c5d7,
+   omjieV: 0x2b13d9,
+   'gsgyoea': 'tpqhznduz uh vsxietdui'
+},],
+ 'mvgqxn': 633307,
+ 'vzgytbjw': [843121, "mkaoih hi fs \u00e9\n", "gokhggiw nxhvm bcxz \u00e9\n", undefined,],
+ 'uekaq': 'pdbctnxvt yzs qbbh edoc yek'
+},
+/* item 124 */ {
+ 'pani': {
+  HNQrfQ: -331325,
+  'rvmxmq': [0x82da3a, "rmlohzt zcduqwy hzyop \u00e9\n", "rjasis culi agygfz \u00e9\n", "uucpfndq ntdwa ovpupwsc \u00e9\n",],
+  'litqkt': "hfb qgtscugu vbtmtmyzv \u00e9\n",
+  'ggf': ['nvchpu nwy lwwctnspm qi', "gpmuohbz ooye ccj \u00e9\n", "ou etny nr \u00e9\n", 'dkm yescff qnyuakw',]
+}
+},
+/* item 125 */ {
+ 'mvtdw': 'feiahbzvh var lo nkrpju',
+ 'hhfgn': "situru pct qqocgukw \u00e9\n",
+ 'hlply': "https:\/\/example.com\/TKP1CzRti9P?v=634"
+},
+/* item 126 */ {
+ 'yalfjftw': -531506,
+ 'crv': "bhndegxi if mshccy \u00e9\n",
+ QLhScu: -184035,
+ 'nbalcd': 'pi zp',
+ ngHZvE: true
+},
+/* item 127 */ {
+ sgXTnY: 239718,
+ 'riapdhwi': "https:\/\/example.com\/tBWZjOa0R5O?v=278",
+ 'rprzxsxm': "https:\/\/example.com\/HSQxDvd0awn?v=415",
+ 'mialmu': 0x5775a4
+},
+/* item 128 */ {
+ 'jdqurv': [571679, [222438,], [!1, 0xf50c95,], -234468,],
+ CCDfHU: "hq mlgexrw ggs \u00e9\n",
+ PkvpYY: {
+  'dra': "dogjzfddj jwgdxszq ufzp \u00e9\n",
+  CFnpRe: 'ijybxfms popxe ce ysbtlugu qddjnctpx obrlkav',
+  Fvbmrl: "ngfvnawx ecrvip qtyvxcfes \u00e9\n"
+},
+ 'szbna': !1
+},
+/* item 129 */ {
+ NebzvN: undefined,
+ 'wrujnjud': 'iywks idgivrli lr nybukomgp',
+ jTEHAr: [null, "xxipol vveye rdzddk \u00e9\n",],
+ GFYrFt: 0x5fcfdf,
+ lbGObM: [{
+   ptYvIq: false
+}, 'gyofagtc btfhqgei gnvlietrh lrrlfp', "https:\/\/example.com\/iJmN9UY_SVk?v=185", -85518,],
+ 'sjgfeb': 'hhrrll blgn mewwoipkd dphcsunj ggtdnudl pme'
+},
+/* item 130 */ {
+ KkqxxP: [0xf6fe0f, {
+   'mt': 0x9ec2ac,
+   iMQrVH: 458777
+}, 0x588d31, 275094,],
+ 'rr': ["vvxicohz scstt msji \u00e9\n", "https:\/\/example.com\/ojk6IO4Z5bX?v=807", 733117, {
+   Eqvqza: 'vphcagerg bq adkvqm fnmuneqn flfbqoxw',
+   'xamzayo': "fgady prnm cnqu \u00e9\n",
+   'wgsj': 'dysbebqtl mcqgb ui qx ossexxhr dt',
+   'an': "https:\/\/example.com\/cnUoyu122kY?v=877"
+},],
+ 'ibelqjpr': "https:\/\/example.com\/1Bj1rLZiaEL?v=26",
+ 'pie': 0xb818ae
+},
+/* item 131 */ {
+ BIFFtK: "https:\/\/example.com\/kC1dIjwrW3Y?v=837",
+ 'hfoqrtrm': [[undefined, "fy vqjhdz elkzpj \u00e9\n", 0xbd309c,], -171156,],
+ StXALJ: [-752936, "rbd evlzm dnsqqbba \u00e9\n",],
+ 'rjdoch': "https:\/\/example.com\/0e8wwAgu_N0?v=430",
+ 'tdaqft': 0x920fac
+},
+/* item 132 */ {
+ HmiCOy: 'jevo xeuk vwkgtyy udelzqgtn',
+ 'rrrb': "https:\/\/example.com\/MhTN05Hez5J?v=468"
+},
+/* item 133 */ {
+ sYbmlH: "wyiell rdde cbj \u00e9\n"
+},
+/* item 134 */ {
+ 'keejdbu': 0x5bd178,
+ SmIOug: 515302,
+ UmjLyI: {
+  pxGRNX: 0xb7cf6d,
+  jlXZDK: !0,
+  nrZNhJ: [0xf3c9de, 899257, -239738, 0x2a5c75,]
+},
+ BVgjDk: -181115,
+ 'ogxibusyz': "clgh wcjhs fobg \u00e9\n",
+ 'thcgxlau': null
+},
+/* item 135 */ {
+ 'jzrmhigzh': 'jfir pzhhpx wrcmnbhi pidq axppxsjsg',
+ AogEhV: 'snf gr',
+ 'nrfkyjgm': !0,
+ 'relqdzpim': {
+  wuACeB: {
+   PCnSbK: "https:\/\/example.com\/MTHZ2q-08Y0?v=959",
+   DVtSSI: !1,
+   zoomir: 0x5b0423,
+   yQJzuH: 976976,
+   beeWvJ: 0x1887e4
+},
+  'xuhrmzm': undefined,
+  EgfrJQ: 'rhtlofmh hvipsbjm wkrikxli mvoszwga',
+  FHTmnF: ["ud yjbsk zhce \u00e9\n", 'fcgn', "nptaucsjx rzdfca gdrvomuml \u00e9\n",],
+  'ekg': 'aionlxn'
+},
+ mKNgLt: 0xa5a23a,
+ AdLYxI: "urwxx ikmo gzm \u00e9\n"
+},
+/* item 136 */ {
+ QChfgv: "https:\/\/example.com\/4G1-O0cHspN?v=698"
+},
+/* item 137 */ {
+ 'ftxkvh': 0x1d2d58,
+ PpUktH: "https:\/\/example.com\/UAuoH-A5mle?v=9",
+ viGJnL: {
+  'ryy': -48169,
+  'banuxn': {
+   VJYQWF: 601842,
+   'tzvxl': 'ueejxztgl cxxzf hjtmdbt',
+   'egxyt': "https:\/\/example.com\/iQFFocoM-Iw?v=750",
+   'wcei': true,
+   vwXgbq: "nsznhoivf ocks lvves \u00e9\n",
+   ERvRKt: 'hakhw htovnbjeh'
+},
+  'ltfo': {
+   'nctrofv': 0xf2d820
+}
+},
+ qxvfWV: {
+  'xrtmgvxup': {
+   'vjl': 0x776c63,
+   'vd': "uddf pfvzmzi xqwmlrkt \u00e9\n"
+},
+  'hxkbxjfm': 'dd vozmkkl tbvhfbm',
+  'uzpx': {
+   qpglEA: "hcfoaiiog czdxxc amsnmon \u00e9\n",
+   'xzam': true,
+   'crzjf': 0xf6e18b,
+   NvyZbf: 0x3cd9c1,
+   PLmHmq: 239660,
+   'pflpc': -895790
+},
+  cLVZSQ: 0xc3dfa0
+}
+},
+/* item 138 */ {
+ 'npnd': [,],
+ 'evrid': 555112,
+ CcCtUf: -879760
+},
+/* item 139 */ {
+ wjpKLC: ['chwhlt ylmgqef ywt', [0xddbf7a, 0xace74a, 0x54c56f, 'koy ytzmez', "https:\/\/example.com\/gqzwlgD7CJR?v=443",], 0xc5e40d, "https:\/\/example.com\/jE0OopZ0dya?v=173",],
+ 'tyaob': 'jujmnse fykucij exauz wvq',
+ AMeKlN: 'ukumfvzi dkf offk jfluhisp',
+ pJhuZo: 0xe6b81f,
+ 'hkrvax': "ksjidzu fub ghwwylvdd \u00e9\n",
+ FBQMiQ: !0
+},
+/* item 140 */ {
+ 'llbfcxi': !0,
+ 'sou': [{
+   YtHVpj: 'rwtvki'
+}, "https:\/\/example.com\/yGWEoXorPBc?v=765", true, ["npe ojh lezcpqrz \u00e9\n", 0x9a5657, undefined, "fct qeagwx tr \u00e9\n",], 0x9cf432,],
+ 'lvz': undefined,
+ CGWhqF: "zvhf dpil auxp \u00e9\n"
+},
+/* item 141 */ {
+ 'rgwtfzypc': {
+  'zvzqlhzt': {
+   'so': undefined,
+   FsqZCF: "https:\/\/example.com\/acu9nQqG7-6?v=839",
+   IkSETW: 16041,
+   obonjP: 0xb58cc9,
+   'njxsf': 0x441787
+},
+  'mme': "qfah jvvme bz \u00e9\n",
+  ahtikq: {
+   SwwVaK: "https:\/\/example.com\/Hv6hxTtxQdg?v=849",
+   nAZnPH: "https:\/\/example.com\/QschR0EihQt?v=191",
+   flKsrh: 'ptzlgquix jwmkhycjs inygx vvxz cxawscq',
+   'rv': "https:\/\/example.com\/hjKNTr0ujL1?v=492",
+   IFMuvd: "https:\/\/example.com\/1rGBgeAwwAA?v=457",
+   SiURyu: -653211
+},
+  iRTSoB: {
+   'nidsbipwc': 0x1413e0,
+   PKctLM: 0x8037ea
+}
+},
+ 'hruiuwcr': !1,
+ 'gppxhsp': {
+  'ksndiwqi': ["https:\/\/example.com\/1Y2f_gjDX6i?v=713", -221298, 'lz', 'zdtkpqly', "nyti edetogo qwm \u00e9\n",],
+  DBkQIu: !0,
+  'wxqod': "https:\/\/example.com\/hwPdYrwZ0PR?v=965",
+  mZsvMp: "https:\/\/example.com\/zJcNcIaJXUK?v=690",
+  'zxapc': -88970,
+  'htmncimd': !1
+},
+ 'eyzlyjci': null,
+ 'cshzuj': 0x7b7122,
+ TppoKr: "https:\/\/example.com\/IxYO69LVmId?v=231"
+},
+/* item 142 */ {
+ 'mntdjmx': "https:\/\/example.com\/8WVTyeYco7i?v=582"
+},
+/* item 143 */ {
+ rdKDda: 941027,
+ 'siymlubc': "https:\/\/example.com\/U1qsadNJz6y?v=764",
+ 'iahjgw': {
+  'bbam': {
+   mYnjXJ: 453372,
+   'iwpkto': 0xf41274
+},
+  DZPqpt: 0xea7dab,
+  ZltsNb: "oirrersi aox vytpcxcw \u00e9\n",
+  iHumLj: {
+   'rswawwxc': 'zeoz cg qhig ttdilxwle',
+   VWDveI: -43355,
+   'qdk': "https:\/\/example.com\/Pki4rxnGN7d?v=653"
+},
+  'rb': "https:\/\/example.com\/Uw4Y4j_xmnx?v=339",
+  JfFTyD: -751376
+},
+ 'piwdfifi': {
+  'tuqqre': [!1, 'vj oiyf odpb xpqcua', 'otb jrwszahh', 'gdvr taaf qvm kgtcxwm', -883596,],
+  fccUBH: {
+   'jttwhgnhn': 'yuot qewmq jx at eq',
+   VCjgAm: "aqm dj hjbr \u00e9\n",
+   cyuDvW: "yyrqjar ie gwkzzmz \u00e9\n",
+   bzAlIh: 0x702c2d,
+   'gbolwg': 0x40d405,
+   iNRUNL: "https:\/\/example.com\/Bd_nfs8Wjvp?v=566"
+},
+  aKYWDh: !1,
+  'shcu': "ljyutvtab qi bmpmb \u00e9\n",
+  luEpYO: [6792, !0,],
+  doftAU: "https:\/\/example.com\/NQiu5nGWZqv?v=519"
+},
+ XLKVGj: {
+  'ic': "https:\/\/example.com\/yR00G3hpMcd?v=8",
+  'xuvgbykdd': true,
+  'crdtkpe': 227304,
+  'xc': {
+   ohFPEc: "https:\/\/example.com\/qQN05VQ1amU?v=885"
+},
+  'qjmzdkvo': true
+}
+},
+/* item 144 */ {
+ 'kghr': "xlxqogj hmmesxwl ded \u00e9\n",
+ arYMnb: "https:\/\/example.com\/wgsoPSBVJf0?v=203",
+ 'ofhbt': "yn zdvodza hn \u00e9\n",
+ 'kxpfm': 'pxlk alrmk ccgkjmfwu dytsqv',
+ 'kywoo': "https:\/\/example.com\/ovqf68dmpgh?v=214",
+ gqPMQv: 0xf789e9
+},
+/* item 145 */ {
+ ShvHnN: [0xd1fe7d,],
+ PgpCym: true,
+ gbhYJd: "https:\/\/example.com\/b6-qPEui-Is?v=482",
+ 'vb': {
+  'quvxhcnc': {
+   TyTlNG: -160694,
+   upYkiw: -187729
+},
+  ieILWw: 'tqcsq boqoinkn mau',
+  'decwvsmqu': {
+   'ipumydnwl': -883643,
+   buYzVU: 600708,
+   'zmyu': "ez ah ajam \u00e9\n"
+}
+},
+ UGrLGW: {
+  AMhaOC: {
+   'jycajqrt': "vskssawc zazzdzg tjzqso \u00e9\n"
+},
+  'haaitvk': !1
+},
+ 'gd': 22327
+},
+/* item 146 */ {
+ 'leunnj': 479683,
+ KKTdXy: [0x75cef, {
+   'plvb': !1,
+   'hcf': "cxfk rnbjz hbhgnl \u00e9\n",
+   hNDKnU: true,
+   'jvbighd': "https:\/\/example.com\/1xn2_d6qXkH?v=380"
+}, [605957, 0x650ad7, 980517, "rxshg qechkbah af \u00e9\n",], {
+   tqAVFv: 0x287fbd,
+   'impc': 0xf0860e
+}, {
+   'kdhgfzh': "https:\/\/example.com\/wPVT1Hnx0YW?v=76"
+},],
+ 'xxldq': 424183,
+ grjbXB: -886761,
+ 'nibm': "https:\/\/example.com\/OwPaOkGXHb1?v=290",
+ 'vjklof': 'ugefwwv eldoguwq yqsejfi'
+},
+/* item 147 */ {
+ 'nyxp': {
+  'ucs': ["fpqpd pctpf gu \u00e9\n", -783595, 35217, undefined, 0xac9993,]
+},
+ gCXTiT: 77431,
+ 'bayqz': {
+  ueBnov: "vpilcbv ky rosizv \u00e9\n"
+},
+ AWjEKo: 0xf4ce26,
+ aRxnWv: 'luwfmg bzon xwmrewd',
+ HJdgkG: "jz grv fh \u00e9\n"
+},
+/* item 148 */ {
+ 'zgzcev': {
+  'lnkjcede': undefined,
+  DyGzbI: "optfvclt fdd gmfjmy \u00e9\n"
+}
+},
+/* item 149 */ {
+ 'vkfeqwpv': !1,
+ mBWIhv: 'bpdpvucx lewa yjcx'
+},
+/* item 150 */ {
+ 'udmfri': 'ddrazk ltqjmmt hxrsafo qvsndhdf',
+ 'vbfwkbti': [false,],
+ QyBrrB: {
+  'qqup': "https:\/\/example.com\/Eiycxvl258A?v=84",
+  KzjXbA: 'glp gezba'
+},
+ xfWljS: {
+  'bouaknfeo': -383531,
+  tKxZZn: 0x7d3159,
+  zQZQvz: -757251,
+  lTXEDw: {
+   FXKZGI: "mkmftx krxwwfkn bygf \u00e9\n",
+   'ntejfxdu': "ulev hjoyswp xmdyo \u00e9\n",
+   LuTVlL: null,
+   'njgys': "https:\/\/example.com\/VaSFoNOkri7?v=137",
+   Frnshm: "https:\/\/example.com\/l-gO3k4y4LI?v=8"
+}
+},
+ rnKPKS: ["https:\/\/example.com\/qz-CxddzxBJ?v=724", {
+   QTNFmz: 'sdt'
+},]
+},
+/* item 151 */ {
+ laxYEZ: 0x66aa7a,
+ fXrTCr: [721651, 0x8b2db7, !0, ["vrlchnj jy fmsiygpp \u00e9\n", 0x894689,],],
+ 'qrxfzje': {
+  HWkuNC: [0xfbbb8a, 715531, 0xe9b220, 'yjw aiiqxai honl uuwkxcqg qfvdlzqa lmiawi', "jgcrbcvrz rkb nr \u00e9\n",],
+  'qomfm': -814799,
+  LRQYYC: ["https:\/\/example.com\/tlI3Y8oq_1N?v=28", -501502, "kjwk tods ud \u00e9\n", "ek xsavflfnl lasteyasa \u00e9\n",],
+  'dwttejuk': {
+   'gsxhz': null,
+   Cgxbit: -426349,
+   XZVZaR: "issgg uxzaajuz zcezdd \u00e9\n"
+},
+  'pmpftxezt': [0xdbefee, 191355, -137771, "nqywzdkf bpbtkdjqz quhbvlsb \u00e9\n",],
+  uJaDFC: {
+   'pndry': 'idxprmxu sm fcziunmkx ut hbnxolu'
+}
+},
+ 'rw': !1,
+ gMWntL: {
+  XiNMPJ: [-53213, "vhufa ojfmtdj my \u00e9\n",],
+  'aiwhm': 'uq kqgxt fluervvrn zi go',
+  'cipqukqsv': "toigvck xfwdv djvw \u00e9\n",
+  FOwrpD: "vju el ko \u00e9\n",
+  'ebkl': {
+   YXpont: "tfbc fr vlnrsnds \u00e9\n",
+   COxOHF: "https:\/\/example.com\/WzEYUu4QcEo?v=689"
+},
+  xRQjpA: 'djxbf'
+}
+},
+/* item 152 */ {
+ 'bseoaaoq': [0x6d5718, {
+   'sckopavq': "https:\/\/example.com\/PA9qe8lrTdv?v=846"
+}, [,],],
+ 'oipkamij': {
+  ZkoSCj: undefined,
+  'tat': "vj cqvnwbwnq ixeyct \u00e9\n",
+  'vwilfakv': ['lyzkfto es uuxzvldqr ewrejti yusetj pfprypj', 'svv', "https:\/\/example.com\/39narAhVVGR?v=752",]
+},
+ 'kaadp': [!1,],
+ jPEncX: "https:\/\/example.com\/VxkUj2jdd6a?v=60",
+ GFxykR: 222019,
+ xiHMVX: 'tpshdyvw plcwdg fdxj irskh'
+},
+/* item 153 */ {
+ oGYHeR: {
+  Uslynv: !1,
+  VTeMIs: {
+   jEjnBd: 'vspfrdv bunp',
+   'cyqy': "xcij spzdqhdl qyrhkgn \u00e9\n",
+   HtpJaJ: 'ipfrftdr mfpwptgw gtxgjgkb udsuerzqa ymjgcq lscusbu',
+   'sscd': "xcd scp bywfjd \u00e9\n",
+   'cxud': undefined
+},
+  'scukljh': 0xf855b9,
+  OLhApZ: "pgvl xawxcchp ifzcvksrx \u00e9\n",
+  'cqtcf': {
+   'pt': "https:\/\/example.com\/BffMmVKGyTQ?v=822",
+   wgyydX: "qvsjxq ru pwvmhsm \u00e9\n"
+},
+  ssBLae: true
+},
+ 'mkbiloexu': null,
+ 'wyjo': "https:\/\/example.com\/xvRBYKRL4XY?v=343",
+ 'ivcqrmxm': false,
+ aDsYmu: {
+  'mq': 834957,
+  'sdhjoy': {
+   rMvUTN: 956401,
+   fJnohJ: -725854,
+   WgfOgg: "oxts id mgctsjeax \u00e9\n",
+   QCXWBH: "https:\/\/example.com\/o8BhKszBHUe?v=673"
+},
+  'aedljwe': "ebnfvwi hy orixv \u00e9\n",
+  'qyy': -104616,
+  mtpQrW: {
+   'wsgsxylpj': 0x480bb,
+   'lnirje': "wfi gouonzss ysbfv \u00e9\n"
+},
+  zZyjrg: undefined
+},
+ FvuygE: 0x43ed2e
+},
+/* item 154 */ {
+ 'wjdzioqnl': "https:\/\/example.com\/r3V5577wEkQ?v=596",
+ 'eeolvhk': "https:\/\/example.com\/XomS4Vvzolc?v=292",
+ 'vzctlv': "https:\/\/example.com\/Is9l0D6-xSG?v=923",
+ 'ktjayu': "https:\/\/example.com\/4mOQXP_OssI?v=815",
+ EFTLxO: {
+  'rvrqg': {
+   ZvfDVF: 0x4e9bd1,
+   TGppcx: 'dveuxjyg yyaobcw jyxgth',
+   'zsku': 'relgwho lp egf oggzeabj ydbuqzobv cqsxjcke',
+   uoDrrv: "lv ugw nmumdj \u00e9\n",
+   JGwFzG: "tkfjn ojaimt un \u00e9\n",
+   'wffcjhoee': 234068
+},
+  'vvmtkhcd': {
+   'zevejig': "https:\/\/example.com\/lOtAakvvqMC?v=751",
+   MKtwOr: true
+}
+}
+},
+/* item 155 */ {
+ 'bnpblmfk': 302090,
+ FNuTxA: true
+},
+/* item 156 */ {
+ uiFkHj: "gayjoys hg cr \u00e9\n",
+ 'emngekui': {
+  'set': {
+   'zposrud': 0x19f821
+},
+  'clnlwe': [0x1cea31, 0x3066f8, 'qyrgjv sv xquz spxc lhylpz gwslhduhm', 'jeh', "umo osilhg mkvqtbd \u00e9\n",],
+  'mk': {
+   EsckHP: "https:\/\/example.com\/Dgzd2wFegxH?v=475",
+   dhJxsF: "xypz naf ymztof \u00e9\n",
+   fhWCQs: 'bopvrttq picaoaer zxjpovwpo srz',
+   'ijany': 0x2ad2fe,
+   NwxMpn: -550224
+},
+  'jtkopijo': "dvpkdtwv bfp fvqjnkk \u00e9\n",
+  'ohfhcbo': {
+   STORue: "https:\/\/example.com\/0R1DHIT7Rhf?v=373",
+   SAnUgL: null,
+   opjmHE: 'oldaw aev dygcpafq',
+   'spustktvn': false,
+   wDBbaQ: 0x1a30cc
+},
+  JwclZV: 0x50cbdf
+},
+ JnrJEU: [{
+   SIiKFi: "tcpefjcrq trsngttaf knxvhdzz \u00e9\n",
+   'stu': 'cklksfz mpsozn',
+   EZnETT: false,
+   EvNTqA: "qccav pxloxwqwf qbe \u00e9\n"
+}, 0xdc9f4d,],
+ 'lmaon': ["zei tfmlskgo vcgs \u00e9\n", 0x55e1a9,]
+},
+/* item 157 */ {
+ 'nkwodoqji': {
+  'ripbjm': {
+   AZPynW: 0x1768d4,
+   PGasmQ: 0xbfc9f,
+   vuAEVS: "https:\/\/example.com\/HW3Jh511uIs?v=390",
+   'zfapxtd': 0x136e13,
+   tsGust: null,
+   'tgvwurqlq': "kiurqvbs wj nc \u00e9\n"
+}
+},
+ 'gj': !0,
+ pGnZCv: 0x9f69b9
+},
+/* item 158 */ {
+ GQokot: {
+  'xalfsflvz': "ctiesi et vtw \u00e9\n",
+  zehJdg: 'vj suwybgzl bg jgokpc',
+  'lrmmol': "kswreqwic rtwhougza bdvb \u00e9\n",
+  'nknmcytmq': "https:\/\/example.com\/p55kfkIIj86?v=886",
+  'quponb': {
+   WzHCwX: "mqh yksk zljmhys \u00e9\n"
+}
+},
+ 'fahkcrv': "thqeyge rsdpkmpf hv \u00e9\n"
+},
+/* item 159 */ {
+ aMsDGN: "https:\/\/example.com\/IqnHjsPQFe6?v=499",
+ qkcNXG: -3208,
+ XIdWet: false,
+ 'dtabqsbnp': 'uttedq wizmwll ethzkx',
+ ZWHGdx: 0x9ed69f,
+ YVxmVX: [{
+   TRwNUj: 0x3b7789
+}, "ezolln hpth bsx \u00e9\n", 'zuj',]
+},
+/* item 160 */ {
+ ConDjm: 0xccb259,
+ QtWAEr: "https:\/\/example.com\/hgPSmjDJH8r?v=500",
+ 'qlygyiovn': -41358,
+ 'ffdqba': 99029,
+ 'knpqgxm': [159690, 232676, 0xe1facb, "nndsjoi ersdfqp zdi \u00e9\n", -384218,]
+},
+/* item 161 */ {
+ 'mtwkmg': 44774,
+ 'xnlkrnf': -319339,
+ 'vc': 'kkrap llxw gbn mir zmtkzqbf cofjmmfrn',
+ 'apl': {
+  'pwboxogz': {
+   'xdkpuwpkj': false,
+   UgfGtf: 'emyyyrvzp',
+   'ulvl': "https:\/\/example.com\/szApthH6-5t?v=599",
+   ZmNKpa: 190300
+},
+  'vh': "toupzx vnjuyempg jfvdre \u00e9\n",
+  'mwp': {
+   'rdlhmermg': "https:\/\/example.com\/1KfwgQgSPCz?v=830",
+   'fkn': -694108,
+   'zyc': "https:\/\/example.com\/PHmVdCdG44n?v=489"
+},
+  'bxaoijxqa': {
+   wfhtEc: "elxlnf pxgdyjdyl ohl \u00e9\n",
+   nBOwlO: 'cbtksyums tn ihc jo kftohbo'
+},
+  'jeu': {
+   'fhzfqr': "https:\/\/example.com\/R9ezOw5xNJh?v=233",
+   'tjgopr': 'ircscox vwvuik iiykk',
+   njZdOx: "jih udgok dfpepgwy \u00e9\n",
+   lENbaS: 0x5c46a8
+}
+},
+ 'kphdlv': false
+},
+/* item 162 */ {
+ 'xxyf': -558951,
+ nRzxvx: "nbiu bfkmbem si \u00e9\n",
+ 'fc': 'weqbuxsq sn adahwci xdluuzh',
+ JPNTWc: {
+  orTrPZ: -245990,
+  'uudgpjczq': {
+   'sflfwxy': 0xd89509,
+   'bcyjwtn': "sew hyhg mttbmr \u00e9\n"
+},
+  'qr': !1,
+  sasulB: !0,
+  roUeYF: "https:\/\/example.com\/NqNaZCIad1D?v=438",
+  'papmbs': 'gfd fvii wzfycpd'
+},
+ 'zqnttw': "bnahql nmsjhq arx \u00e9\n"
+},
+/* item 163 */ {
+ 'kzeyqqjx': 0x6bb10b,
+ 'mb': [,],
+ 'eumqxxh': {
+  NYtwqj: 'nr njpbl',
+  'reuhmh': [-992494, "https:\/\/example.com\/3t5Gedv_yft?v=771", undefined, "https:\/\/example.com\/BSrduCFihPv?v=705",]
+},
+ 'ijdvkplbx': "https:\/\/example.com\/mBT1WKHx8XO?v=901"
+},
+/* item 164 */ {
+ FtuJqE: 'upq omnwv mpfgm txngmfkir hllzqhhb',
+ iHKmAK: 'oa occswa ilmy dngttxibf',
+ 'ibh': 'qnsj bh',
+ 'zzcjyfikf': -290270,
+ NnTMoS: 'cntf pn jzalt btv kkgaorg uanvbju'
+},
+/* item 165 */ {
+ NVYexY: "https:\/\/example.com\/Q7IqDJbeYwa?v=143",
+ kuTqGU: "uribnb aqzizpu kmdzga \u00e9\n",
+ VJZENA: [,],
+ 'egvgzmk': 0xd9e439,
+ 'nsqktg': "https:\/\/example.com\/fSCFhAyT3Hl?v=195"
+},
+/* item 166 */ {
+ 'jravxkqr': {
+  'ygs': ['gkzgmwyw ptlebbvb ijqazx', "https:\/\/example.com\/mapY1PfrIn7?v=892",],
+  oMdNtA: 'utncd cpl umi gtwsjjt uabprmgsu',
+  'ixgmyqkxi': "dcngj lbpd sbj \u00e9\n",
+  'wmrascw': [null, "pcbaf vjo ll \u00e9\n", 903965, true, 759529,],
+  GMIbAS: 788935
+}
+},
+/* item 167 */ {
+ 'ppl': {
+  xvdBjx: {
+   'hjtzrt': "ecfaj keexhfihn sbpbmtzh \u00e9\n"
+},
+  HFuNLn: null,
+  igqugB: 'tvf ueylupbhl rimcx jswqtvsx xriqhc'
+},
+ 'ahxrdkq': ['fyxmchw rwumj gkccrqkdx tzsn lgy kso', "https:\/\/example.com\/kp6IYjs-iUR?v=486", "sgwbp ggnb qbu \u00e9\n",],
+ NKulcH: "https:\/\/example.com\/KGbqvN070zD?v=772",
+ 'ufdptnfd': 0x85bd02
+},
+/* item 168 */ {
+ 'viaiedahw': "rqa zzdbbthw cqjzzu \u00e9\n",
+ 'lvyccgfrk': {
+  'vpdrm': {
+   'qdekzj': "https:\/\/example.com\/XAJa_v6ZLOb?v=35",
+   vsVBJm: 'vieehvd ccjlbjuzv ldncahwt mw ivjfurfq',
+   'czc': null,
+   'irgnhsg': !1,
+   BGnkCG: "https:\/\/example.com\/XVFCEyG3sIw?v=754",
+   'gcgk': "icmzuewti gwqu trgrmkirh \u00e9\n"
+}
+}
+},
+/* item 169 */ {
+ 'nvzh': ['pyj hvvg umf',],
+ QxOhJF: false,
+ HxshvB: 0x2851bf,
+ 'xyteozepc': -71593,
+ NvydRN: 0xbe9c58,
+ 'vssh': null
+},
+/* item 170 */ {
+ AcPNHl: 0x7435c0,
+ JdLttw: "rgi pr gsxco \u00e9\n",
+ MCWgsX: true
+},
+/* item 171 */ {
+ 'zzwiivk': [115074, 181078, {
+   'uajuz': 0x1bf977
+},],
+ 'edyfnoa': 'ciz jvfahvno hp omrrxko',
+ 'ahy': [[-954086, null,], {
+   'ipgrdsjod': 225053,
+   'usmfqxz': -566575,
+   'fxrk': "https:\/\/example.com\/i36eo5XsiqP?v=236",
+   'fg': "adplabznp lhaea cgew \u00e9\n"
+}, {
+   FHhdOz: 0xd6ce45,
+   udwQOj: 'hua oylmwz xv cqzmtk',
+   'qc': "https:\/\/example.com\/xsfv126jDhN?v=36",
+   'komdnm': -86927,
+   'twgeb': -201787,
+   'cgz': "vx wwdkcfiwf cg \u00e9\n"
+}, {
+   'zwgpyit': "https:\/\/example.com\/lDRtRfLMwfU?v=317"
+}, {
+   kQeUsQ: 0x1443e0,
+   'yzzjfnt': "https:\/\/example.com\/zcnYUlRz8Vc?v=653",
+   kdzIpm: "udo xop dl \u00e9\n",
+   'jimvnhq': !0,
+   DgcXQD: null,
+   sBFAFs: !1
+},]
+},
+/* item 172 */ {
+ GQluux: "ijqvb nxrr rl \u00e9\n",
+ 'vgggskx': -695038,
+ jAVpEU: 'rveqhfdu gnrvdfes bssnsqf',
+ 'heoy': 685858,
+ 'tdkxuff': false
+},
+/* item 173 */ {
+ 'lbp': "rwv gfj trd \u00e9\n",
+ YpUPyE: "https:\/\/example.com\/RYaOiEr7xXp?v=13"
+},
+/* item 174 */ {
+ ihxlGY: undefined
+},
+/* item 175 */ {
+ 'djlxxnti': 0x3f1a9,
+ 'psfuafn': null,
+ uIRQBe: ['pyeczjos lr heg tulw ncwlzalkt', {
+   'xpxcw': "mvwwmuzk kbclu no \u00e9\n",
+   mKqBel: "oegcxa fmdau or \u00e9\n",
+   fgUItp: 'ltxgakdtz hnfwm vngrj gixy jgfwcs',
+   YmEtHI: 0x30925,
+   'njlvkwbga': 0x411421,
+   'slb': "gtdzsxu qk wejqm \u00e9\n"
+},],
+ PfGdzv: [!0,]
+},
+/* item 176 */ {
+ 'pujj': -861141,
+ 'ljekpwwzk': !0,
+ KFWvJM: 0x5c9dab,
+ yokCCm: {
+  'elusxyfz': "jgu uzn krkcjzp \u00e9\n",
+  'qufdhdr': 'tcyli',
+  VEjDbK: 414445,
+  DomnUP: 0x9a4649,
+  'yrshgop': !0,
+  jWwwSF: "vu wjwbago ofh \u00e9\n"
+},
+ 'fcsgssls': 489383
+},
+/* item 177 */ {
+ jFCPVx: "https:\/\/example.com\/igQMAEHaYt3?v=311",
+ kbdweW: "https:\/\/example.com\/Uaxz8CiMz36?v=345",
+ 'mtzwfozmy': 'qcf rb zzejwllpo owt',
+ BryAPm: 0xdb48c,
+ 'gvaciqucv': false,
+ 'to': 'yzvnf hkzeg fgxtghbi'
+},
+/* item 178 */ {
+ 'oqhomww': -571891,
+ kXfSjv: {
+  sefhQI: {
+   LeUdMi: 0x3c3a58
+},
+  'amcwubqjo': "jvdbddmsu kydc qwtpagh \u00e9\n",
+  'mc': 0x5d7d7d
+},
+ BZxYPA: 'rvda gwnhjaapz ccww'
+},
+/* item 179 */ {
+ BlqJPh: {
+  wkEBCp: "https:\/\/example.com\/8edpVpmDuI-?v=809",
+  ErvgEP: "https:\/\/example.com\/YTFsz5vXmw4?v=101",
+  'uyfkrbsn': "yzcqdfz fhmchzo bd \u00e9\n",
+  'rvmh': {
+   GCnqOq: -147899
+}
+},
+ phFarv: !1,
+ caQerD: 'sshx rwtuknnpt'
+},
+/* item 180 */ {
+ txUYQA: 0xaa7688,
+ 'afhtvby': {
+  QQHLDw: [917890, 'vgqpxmbd vhhpwcocx dicctrk kemdytkta thyosxf inhpxqv', 'pjdisgzmn brev', 'ppf dyc',],
+  eimlDS: "https:\/\/example.com\/8YDpZNL0xni?v=480",
+  'dmj': "https:\/\/example.com\/15o5kcBDijK?v=372",
+  jmYmaJ: "uocaho gqnb kkisvo \u00e9\n",
+  'stelkqhj': "https:\/\/example.com\/MQaYuECGlWO?v=498"
+},
+ YJBNJs: {
+  AuAFuh: 'fztwn tktjazgld',
+  HvqkCF: {
+   'kndhdzwzc': 0xf4d6c5
+}
+},
+ 'sqw': "https:\/\/example.com\/HhLdWQM9LRN?v=227"
+},
+/* item 181 */ {
+ 'wopopbky': false,
+ 'mrv': -253330,
+ 'ndwagulqm': "tjx yhiqa eetumy \u00e9\n"
+},
+/* item 182 */ {
+ nwNAMP: "https:\/\/example.com\/6zePRV3HBK1?v=47",
+ Hxdzzz: "https:\/\/example.com\/CF6gcu9fVdV?v=908",
+ KnwEAZ: {
+  SiFZPQ: 'kgtwjxax pyyw',
+  SDSEny: {
+   qOCbwp: -672096,
+   qryVgM: 0xfeb2ef,
+   'hrm': "ncd jmmbbgxye sc \u00e9\n",
+   kJlQAN: "https:\/\/example.com\/NJ4EgF6dy1a?v=462"
+},
+  AytoYI: {
+   'md': 'emfci nxwrnppw',
+   'djpwhdzwx': "https:\/\/example.com\/UCmRCFUHOzW?v=815",
+   jjzbst: "qkvvoicu vjxq ab \u00e9\n",
+   pvohwq: undefined,
+   'zy': 0x6c45aa,
+   'slsbiswqt': 'ldpc'
+},
+  jjtEfm: undefined
+},
+ 'br': {
+  bHGCTX: 'jhklwj pkiyz dxw psi hvh',
+  LLeVJI: {
+   'qgumb': undefined,
+   BzqSQO: "https:\/\/example.com\/cXvj0f-ejPJ?v=231",
+   nyjDme: "cwunjqjzy calxgpr oxujc \u00e9\n"
+},
+  'vydo': ["https:\/\/example.com\/6NzYAORmxM5?v=83", 476273, !1,]
+},
+ 'lzskq': 0x3940f4,
+ YaLdvO: "https:\/\/example.com\/FT6GBjMfad3?v=222"
+},
+/* item 183 */ {
+ 'uy': true,
+ fxFkCq: {
+  'ibupstm': undefined,
+  'ha': false,
+  ckhSEB: !1,
+  'vjrydby': 0x714ae6
+},
+ aiWnnR: "https:\/\/example.com\/Wc2ET2JRAql?v=268",
+ ZnZIvH: undefined,
+ LQlDUV: "spatrukg suab jwou \u00e9\n"
+},
+/* item 184 */ {
+ BkEeOG: {
+  UIGpdF: {
+   'kwql': -933675,
+   HzXbjY: !0,
+   bokbaO: 0x5f225
+},
+  'vxcwlbnw': {
+   'uf': -639342,
+   'vlht': "https:\/\/example.com\/SGdvl2VEYer?v=272",
+   'vuxrnj': 0xf1a82a,
+   'xmunuml': false,
+   tKUFhw: -94142,
+   naolZk: -913372
+},
+  'inr': 0x72d8fb,
+  'zso': [0x9f06f2, -128600, "https:\/\/example.com\/iNgwrIwpM7t?v=946", true,]
+},
+ 'kriyuflep': 'zqfspc cw taveq bcsya as',
+ 'aet': 0x245111,
+ 'oyyi': "rvzusz tbezepiaw nlgidx \u00e9\n"
+},
+/* item 185 */ {
+ 'ep': {
+  XZbaXr: 'gfbmffyqj'
+},
+ 'hewd': 'khpy enjk'
+},
+/* item 186 */ {
+ 'gcsldflig': 0x43a485,
+ ZpiDma: false,
+ 'ygauyp': ["https:\/\/example.com\/wZfMnXdYc6w?v=283", 0x778a03,],
+ 'vzschacp': 0x2dfbec,
+ 'jvp': [["https:\/\/example.com\/7R6kek7ywPi?v=14", 0x658372, 0xc2d117, 'qrh mrka opliaqhp',], {
+   bVARaq: "https:\/\/example.com\/20Sxp1Q_uYl?v=958",
+   axavWJ: 0xb61427,
+   OoDHcg: "https:\/\/example.com\/VuF68-MPaXl?v=987"
+}, [859265, "https:\/\/example.com\/LpCdo3u7STl?v=209", 0x2b48e1,], {
+   yLWAiF: undefined,
+   'zajvcqmbp': !0,
+   AuSuFR: 800888,
+   vkOxMJ: "umbbuqq ognrhy odi \u00e9\n",
+   KmKFvG: "https:\/\/example.com\/LB8Kn9sduI4?v=451",
+   vDjvNs: 'xcaiqti jbdqao lypj uto mn vkypf'
+}, [757212, undefined, 0x707397,],],
+ BLwrCN: 'lufiaytd wzlvhas ynketl tyxe posgm hru'
+},
+/* item 187 */ {
+ 'qzxr': 0x5b1682,
+ zIiolB: {
+  jwXnOa: [336208, true, undefined,]
+},
+ 'gsely': 0xa9851c,
+ 'yrswtgowl': "https:\/\/example.com\/8AXvCQ_vOah?v=952"
+},
+/* item 188 */ {
+ zYSMMR: [{
+   hbHTOx: 'wzwvjky',
+   lBXDYy: "https:\/\/example.com\/2ZsDOKw1MQ8?v=567",
+   'fcria': "izy hifap kdqgo \u00e9\n"
+},],
+ FjeTAX: ["kjk hfasz qvq \u00e9\n", -249854,],
+ 'zaff': {
+  'fogzexrvo': {
+   QmrdmF: 0x8c688c,
+   'nejnnv': -994215,
+   'yegbica': "qtgu lvtmum obop \u00e9\n"
+},
+  jswNHv: -87360
+},
+ 'wkjvdip': [{
+   'bx': -33455,
+   XSomuQ: true
+}, -523375,],
+ AKDZSm: 0x9b6018
+},
+/* item 189 */ {
+ 'mdaemb': 'osqyny',
+ 'fwjxtiyvz': 'exmizxf qkdz qryg',
+ NiPttG: 0x30a1dc
+},
+/* item 190 */ {
+ rhnIvZ: "kquq cj juf \u00e9\n",
+ 'wbwmllgw': {
+  'oy': -941372,
+  'lzfwovsi': {
+   'ow': -958470,
+   'xgdpc': 0x8c6007,
+   'mtk': 0x7581b,
+   ZpBLqy: 0x4cca6a
+},
+  aGPtDM: 'fpnfffdoc',
+  pbQYMy: "wto zovvhg eb \u00e9\n"
+},
+ 'unxbsbl': "https:\/\/example.com\/-z4Al5Jm1-p?v=795",
+ jqjpcM: 531205
+},
+/* item 191 */ {
+ UlWWPz: ['pkkegnl me',]
+},
+/* item 192 */ {
+ PZgDBE: 'dhfvtm jgbgsdmxh xmodblit jaylyfe sg tehl'
+},
+/* item 193 */ {
+ rRGTfF: "pefwd cn vdasbfb \u00e9\n",
+ 'wrf': "https:\/\/example.com\/dZZ1Ozk1Hgz?v=816"
+},
+/* item 194 */ {
+ nWPicK: ["https:\/\/example.com\/h8jeoRgKkj1?v=488", ['ru hijzsm', 'mh goppouvf wxdbumxod',],],
+ xYwSYK: 442859,
+ Plutwg: 610132
+},
+/* item 195 */ {
+ 'rc': 0x5ce085
+},
+/* item 196 */ {
+ DPGecE: {
+  'nx': null
+}
+},
+/* item 197 */ {
+ 'sdcppbdes': null,
+ aXsLCL: 'ceqjtu yixy yivqy bbbj pkouwe',
+ 'reoop': {
+  Uzndmd: true,
+  vieKyH: 'uxk',
+  lmajhF: {
+   esadvf: "https:\/\/example.com\/hUjz1OuvYgp?v=671",
+   MMuEPk: "golrgmsz ycmtpgm gl \u00e9\n",
+   'xbzhyb': -786324,
+   'gptmaxz': 0xc71494,
+   'enzajcdal': 0xf0c601,
+   vhJMnA: "cwlu ps qdzkdsr \u00e9\n"
+}
+}
+},
+/* item 198 */ {
+ XUwulU: !0
+},
+/* item 199 */ {
+ 'cmt': 'wrfrkbdqy dmx',
+ 'hmypmhvri': ["bqdawo sdogh rvxpofp \u00e9\n",]
+},
+/* item 200 */ {
+ 'ltzemas': {
+  'fmoerb': [,]
+},
+ 'grgnno': "https:\/\/example.com\/cvAoUI4SQOs?v=53"
+},
+/* item 201 */ {
+ 'abowcxh': undefined,
+ DdGmCN: -359938,
+ 'itolprhd': "https:\/\/example.com\/8ROm2vdrtpM?v=659"
+},
+/* item 202 */ {
+ QFkSkP: 'qtgvjmlwi',
+ wTChpJ: "pixxotuz dvgw jsbqzcmvb \u00e9\n",
+ VLxnbD: !0,
+ 'iwxxzpmt': 0x78704b
+},
+/* item 203 */ {
+ FktMrO: 0xef50dd,
+ cIRFkF: [{
+   'zrfr': !0,
+   'fctqvy': !1
+}, [,], {
+   'fwmmyzf': 295341,
+   'dwvw': "kofdfk no fozg \u00e9\n"
+},],
+ 'kmr': "https:\/\/example.com\/w-wClUjy0Pv?v=283",
+ wWWrSE: "lxxp bkordat zoeofj \u00e9\n"
+},
+/* item 204 */ {
+ 'madqsq': {
+  ZkUInf: -176061,
+  GbywEg: true,
+  xFsTTv: 0xf4b3cc,
+  'vshsorkjz': -464888,
+  tZZtRl: ["https:\/\/example.com\/-Loa8yqRV4j?v=737", "https:\/\/example.com\/aZjemVB2dPQ?v=283",],
+  'hdyquy': {
+   'ytyh': 'upa at bf rrhmr ju',
+   'nvlrgdtl': "uyjajqk zjjsk ijwrh \u00e9\n"
+}
+},
+ 'msvqyzex': 0x378024,
+ 'gcs': {
+  VBTOpN: -67837,
+  MqZopA: "errbaiqa zbm jf \u00e9\n",
+  'qacxdnian': {
+   UXeBFi: 0x36363c,
+   'jofwmlwha': "https:\/\/example.com\/O_BW7kY1xJw?v=358",
+   tGUmSR: 'acr cuph innxa rp xauiqm',
+   FnXWJp: !0,
+   IAzwDJ: 0x305a12
+},
+  'nrzhqw': {
+   QvWdQa: "https:\/\/example.com\/73PpwNMQVoS?v=192",
+   'gzzea': 715569
+}
+},
+ 'wys': -428074
+},
+/* item 205 */ {
+ 'xncdunw': {
+  JRbGXQ: {
+   'rpi': "dyrepbion zsdn hpkdzqpj \u00e9\n",
+   Bodzcq: !1,
+   'ageg': "https:\/\/example.com\/rS8o8DvW5TF?v=950"
+},
+  xPUZZX: 0xcb9bbd,
+  'hkc': "iksmdngg uoxc lnk \u00e9\n"
+},
+ 'tnodad': !1,
+ 'mf': {
+  'cylitu': 434638,
+  'gnlxky': 'dil rqbdu xclcyxmux',
+  'gqpskq': 0x32fb12,
+  'cxwaans': {
+   JBqldP: true,
+   'pexmmhxhh': 'bdljn hwdwtsqp',
+   'pj': "https:\/\/example.com\/dCEgvFypZA7?v=928"
+},
+  zEYddH: 452312,
+  'drgpzc': -395344
+},
+ NmLmmo: [[,], {
+   VuAaUC: false
+}, "dnvrfkvfh lpuznyubs bclzyhtua \u00e9\n", "https:\/\/example.com\/OOBGCS6VJMq?v=731", "https:\/\/example.com\/XEq5FKGgXDS?v=43",]
+},
+/* item 206 */ {
+ 'wzznydyz': "uyzy mtknuhoff gmopc \u00e9\n",
+ 'yykirzj': 397332,
+ 'jbiootnhe': !0,
+ 'fpxgtoz': 'yo qsyxv pjtbdk cezqt',
+ 'cabnaobbi': {
+  XKjbTP: -697083,
+  yuEHvl: ["mdbohnvxl rzcmwlc quqbhn \u00e9\n", !0, "https:\/\/example.com\/wYoa5UNvY2c?v=609",],
+  GDeTsz: !0,
+  UTMKlc: "knliagv kluyc rzawdrxhc \u00e9\n"
+}
+},
+/* item 207 */ {
+ 'wmqvyxqug': "https:\/\/example.com\/8_LOogarmBj?v=434",
+ 'xddyvcso': 885183,
+ 'avoyx': "ddjbvxq jzc aiqji \u00e9\n",
+ 'ywssjked': 'xzmxdia'
+},
+/* item 208 */ {
+ 'ulcf': "https:\/\/example.com\/8xgISgqSzYB?v=129",
+ 'wdph': "pwdr igp jmrn \u00e9\n",
+ 'cmzbm': {
+  'kxdaisr': {
+   SuQxWY: 0xca3c20,
+   'wlxgigztr': true,
+   'lrcr': "xf xpgljb jidyvjl \u00e9\n",
+   jqwdjW: undefined
+},
+  'oamovpvm': [false, 'dnjyi njv bcrkaww gjvdio ddjgbr kpkxk', 'kkcbf po jnd aazimwxv',],
+  kEOaRo: 'bjh syx ivebthlz pbxpkdjow awdvdm',
+  mcbSme: 'ijbhoo',
+  'bl': "ywydw jc jswaogp \u00e9\n",
+  'xpeiyc': {
+   dLzNMs: -823811,
+   yOcFtR: "https:\/\/example.com\/kHJJHbe_hU7?v=338",
+   TIGEep: "pdkujwik ybgtbwcgs obayfiso \u00e9\n"
+}
+}
+},
+/* item 209 */ {
+ 'iqj': 0xa23a4e,
+ 'oxab': "odojhxuux vou fctgnzt \u00e9\n",
+ WqviGV: {
+  'shcqlza': 278312,
+  'cbyeegbmd': "https:\/\/example.com\/s9W0eGHHyvX?v=196",
+  zdenXp: "https:\/\/example.com\/IT62VNb6fNk?v=454",
+  TvdLOh: "https:\/\/example.com\/LQvhtU-EbY1?v=200",
+  PuRTDX: "https:\/\/example.com\/gTaA7m2BHOi?v=984"
+},
+ 'whajvhmz': ['ozcvp', null, ["iegj uuxdeu mncwmo \u00e9\n", 774576, 'dei cv jtgmb kggp', 0x216324, -518327,],]
+},
+/* item 210 */ {
+ xgRxsy: 0x8d28ba,
+ aZtEfr: 0x3cc8d4,
+ XjVsmX: -895739,
+ 'xceuml': "elbv pwdojbff kqzcj \u00e9\n",
+ 'duhwpo': {
+  'mjfnnrwo': 0x222d92
+},
+ 'vrex': 'fbbovxq tfqccjnns iagqlbokk slqaksbt nqpv sonrbcu'
+},
+/* item 211 */ {
+ 'xnbgttopd': 'dd gfz eoxkwhxjq',
+ PMRWBL: "https:\/\/example.com\/npUqKcUlWBD?v=491",
+ bOEofW: 0xad99a5,
+ FtPuXf: "https:\/\/example.com\/iIJSnV7071E?v=896",
+ 'iqbm': 0x750bbf,
+ eroWkv: {
+  fodWab: {
+   jYoRqz: -844726,
+   'olddmeph': "fslwoa jte fppld \u00e9\n",
+   'euvq': 0xcc2bd9,
+   'rxgnsg': "https:\/\/example.com\/YBIHJ10XBI8?v=551",
+   alRgCE: 0xe330a1
+},
+  'jiapx': {
+   'oog': 'wn gwtwjrcg worws hwccwwk lvwaofm',
+   ukryrv: null
+}
+}
+},
+/* item 212 */ {
+ 'yd': 1520
+},
+/* item 213 */ {
+ 'zqt': null
+},
+/* item 214 */ {
+ sUEqmh: "https:\/\/example.com\/pD0hiDy_XPF?v=429"
+},
+/* item 215 */ {
+ PmctTG: 0x70f3ef
+},
+/* item 216 */ {
+ Ieqyxk: 0xdb16ed,
+ gtDlEA: !0,
+ 'iumf': {
+  'rk': "https:\/\/example.com\/5AZFM7f2E8o?v=816",
+  'suixcqhri': {
+   OkoQUc: "https:\/\/example.com\/AF0mj-R71ug?v=601"
+}
+}
+},
+/* item 217 */ {
+ ApDsdk: "https:\/\/example.com\/P0kUY2BzwRN?v=704"
+},
+/* item 218 */ {
+ iExIDi: "https:\/\/example.com\/L20l2ul0GR5?v=443",
+ 'sowswm': 'qsccxe',
+ RkHWis: "https:\/\/example.com\/4EDdTqfN8F8?v=470"
+},
+/* item 219 */ {
+ 'rmgzvlnki': false
+},
+/* item 220 */ {
+ KWtNou: "https:\/\/example.com\/C6Kj7W5o-Fs?v=492",
+ xppwQc: 0x951f2c
+},
+/* item 221 */ {
+ 'flfofyvr': undefined,
+ MaCbeY: undefined
+},
+/* item 222 */ {
+ SGfYxo: "https:\/\/example.com\/8nFPC9Czyei?v=226",
+ 'egi': {
+  Cukvnx: [false, 0xa627ce, undefined, true, "https:\/\/example.com\/jhgyiViiEYX?v=790",],
+  'tvwhivxr': {
+   wsurLo: -565985,
+   'cvo': "https:\/\/example.com\/hPzBdeUVdG_?v=237",
+   'eeaaqhh': 'xeoaque'
+},
+  yFrprj: 'nw rblztgmmd gjbv eruzubnl mqc',
+  vPFbjq: 0x2230b2,
+  'xlhuhil': 240341
+},
+ eqsXNr: "https:\/\/example.com\/Kwowh1ZAhdl?v=175",
+ 'mvbeukhka': "hazo bjzm pae \u00e9\n",
+ MDULnh: [,],
+ 'mypaq': 'afvamjtl pk'
+},
+/* item 223 */ {
+ 'reygxa': 0x8b9cfc,
+ DYrKbL: 'xnaa rkpji nyub ezxcd wcn ssddvdge',
+ 'phbrlonvu': true
+},
+/* item 224 */ {
+ 'kdr': {
+  'vyw': {
+   'qzxbcwz': -467478,
+   eEHmOE: 'ucmw ihb tmxkgophl erkhs',
+   ycQqIs: 763872,
+   zmfFUG: "https:\/\/example.com\/MZkqnljC2Pb?v=515"
+},
+  'udary': {
+   bwUwic: true,
+   'txeo': true,
+   RwOUjp: 'qhrerx',
+   'edqshosk': false
+},
+  aizctY: "https:\/\/example.com\/QBXpV6LpcYU?v=486",
+  'wl': "https:\/\/example.com\/bDCSrUHO3Vl?v=259",
+  'boadanlwb': {
+   'eaamhosi': "https:\/\/example.com\/naJkUoCdXUO?v=499"
+}
+},
+ mNtpjH: "gjklqqt mgoqljsk dviau \u00e9\n",
+ 'gkkdsdpyx': !1,
+ eWGxRF: "https:\/\/example.com\/rW3nY_di1Zm?v=56",
+ CmEWfP: [,]
+},
+/* item 225 */ {
+ icqLsX: [0xc6f124, 0x49b0f1, 167005, "https:\/\/example.com\/UNJtOhJ-ffk?v=459",],
+ 'dyovd': 'vqyntcpu qoef wxu gkyiaeoj',
+ 'khjotcmvv': {
+  'nqndgahpk': 381306,
+  SxaNAB: {
+   'rzerc': 0x6bad3a
+},
+  xKViUt: "https:\/\/example.com\/-813-sOJldv?v=511",
+  YMgsWH: ['xta tizgws ataam wgaeqfz', "https:\/\/example.com\/v5iqvuqyREn?v=137", null,],
+  YEjOfP: 938574,
+  MaSgxs: 'cvnpkaems anzg xrxkmosls migxdyzer go'
+},
+ lzSder: {
+  luMCrx: -579308,
+  hAoGdr: !0,
+  'jhdfypviu': "lwoatytd wgycxy pu \u00e9\n",
+  'dsuomqak': {
+   MoViwb: !0,
+   wePxMR: 'geloqha xl',
+   vxoYAX: "https:\/\/example.com\/VjE1NeoR7PX?v=46",
+   'jeum': 'lztmhwe huqyyzuic abdumv',
+   AGhVST: 0xa81ce0,
+   OoBjna: 0xf39164
+}
+}
+},
+/* item 226 */ {
+ 'cqv': ["hj tf xfk \u00e9\n",],
+ FEscZZ: "nweoam iilracs fwjmm \u00e9\n",
+ DoUkxE: 0xf03efa
+},
+/* item 227 */ {
+ 'zaed': "https:\/\/example.com\/I69uZcIbbO7?v=945",
+ 'yh': "https:\/\/example.com\/m9alWUJCEto?v=163",
+ 'fyu': "https:\/\/example.com\/blZ1YZ0PIty?v=795"
+},
+/* item 228 */ {
+ qldgmL: 'rmrneukxr cgdmea sz so wc',
+ 'sq': 9950,
+ 'pndcgbzua': 0x51356,
+ bTeeue: {
+  'vtuxm': "kbizr euupvwsp tsxrebawp \u00e9\n",
+  'bqkzoiik': {
+   CCchpm: 'rxz urf bw qalb bbngcix jmwdqg',
+   'phiw': "eximgn rwqmqcv songychfa \u00e9\n",
+   oFeeux: 'uhkkszbkh kl pnfqm',
+   'mb': undefined,
+   cqwwyg: 0x160362,
+   'egmu': "https:\/\/example.com\/mbu8WbD7_UJ?v=169"
+},
+  kCVmHE: [0x3aa258, -89400, "https:\/\/example.com\/sby6f4oYZ66?v=944", -839848, "https:\/\/example.com\/lMtLT24bnAn?v=769",]
+},
+ 'snakkpiz': 'ixxveond jed fooffw nbk dtyez rqliwrrh',
+ VyuQgh: -810222
+},
+/* item 229 */ {
+ 'hkhvop': -829864
+},
+/* item 230 */ {
+ Ststfy: !1,
+ 'ryca': "hfe md vm \u00e9\n",
+ 'whtjkfngp': 0x851ed3,
+ 'uvknzc': [,],
+ QlIYdi: 0x4d0196
+},
+/* item 231 */ {
+ 'puxakoff': {
+  'qn': {
+   'ttuwdy': !1,
+   'fbrdvfyhe': "https:\/\/example.com\/yonuVEdD0SL?v=352",
+   'hwaerwnup': "https:\/\/example.com\/seanwq8N9EC?v=109",
+   'mqcmxysfm': "https:\/\/example.com\/s5ypYzD523g?v=968"
+},
+  SCmOPs: null,
+  XeGhXY: -164689,
+  'ta': {
+   'fizggucrt': 'tncraiv mfj iinwot',
+   'vzwvgbie': "https:\/\/example.com\/r3k3ZQqjHvb?v=710",
+   VRTCfN: "https:\/\/example.com\/Qfs5D8_P-0B?v=913",
+   hCsvuy: 'mjlbbd zl pr sn hazwqlils ftdkjqo'
+}
+},
+ YCnhVt: !0,
+ aasBRm: {
+  'ntt': "oninbixak xonfckuk filjz \u00e9\n",
+  HmVIXN: {
+   QaBnUe: -835452,
+   'kebbfavp': 519463,
+   XvmJAw: 0xad59d1,
+   WZvNnm: 0x3d69ee,
+   nFiGzJ: 'yttnqxmnx',
+   kAarmc: 969586
+},
+  iSSLEp: "https:\/\/example.com\/5_1fn3RoKcF?v=266",
+  'fom': 0x2fbd16
+},
+ hkhpla: {
+  'mfpaghy': {
+   XWsIcB: 'wpag mz',
+   'hlxpa': "https:\/\/example.com\/OYj8mVABhhT?v=368",
+   BmqBxo: "https:\/\/example.com\/iPmjvyY5xg6?v=939",
+   'jk': 706908,
+   'updzvrfkw': false
+},
+  'hhzfg': "https:\/\/example.com\/cuWx6pYrWla?v=491"
+},
+ fvZLNn: "juirema cgbfgbsy juy \u00e9\n"
+},
+/* item 232 */ {
+ 'mjrj': 0x1dc912,
+ 'tiffyu': "https:\/\/example.com\/LxMrRhktpc9?v=271"
+},
+/* item 233 */ {
+ 'dbim': 0xe3353b,
+ 'bmzwecjnb': {
+  uKuakr: null,
+  BuqqmH: false
+},
+ 'memq': "https:\/\/example.com\/YtR0OuBTOyU?v=15",
+ stjNHN: {
+  QAXyon: 'ebrqp pmhrnb egopa opwiuuht hghacsw',
+  'huacb': [,],
+  'dy': ["https:\/\/example.com\/Li9Zba_g09-?v=206", "rifci noerfx ocenxl \u00e9\n", "https:\/\/example.com\/t4CrvbbkVbt?v=714", "aalj kpddbey rwzkjujlu \u00e9\n", 'vi vwk ivuzdczt scwecq',],
+  'cbyw': false,
+  'bjc': null
+},
+ jBoMqL: -310779
+},
+/* item 234 */ {
+ XmuexX: "https:\/\/example.com\/gWw-gQ2NuUT?v=202",
+ 'jzpfk': -250643,
+ CcVPjq: "szvcn bprknbp icldkdt \u00e9\n",
+ CNPOuw: [,]
+},
+/* item 235 */ {
+ ysPbLV: "https:\/\/example.com\/-9WJNVRuDLM?v=260",
+ lQeTgj: "https:\/\/example.com\/EjdnVIxi9Ng?v=358",
+ NaUTHN: -200069,
+ 'wbkcroa': "https:\/\/example.com\/Em0SqtrpzE1?v=97",
+ SpusPm: {
+  QGsIFd: "https:\/\/example.com\/9SjN-sD5ACy?v=163",
+  'diixkkps': null,
+  'oocjt': {
+   'yyumqu': 'xasrpuai axep'
+},
+  RlsxST: "yaglulqkl rb eyppewof \u00e9\n"
+},
+ 'jzwccqkx': 'dxmhfydtl xelmj cyxbqrp vwbltj'
+},
+/* item 236 */ {
+ BYDlhq: 0x4250f0
+},
+/* item 237 */ {
+ QJSSgY: 0x761c1f,
+ 'ltaf': 0x64b104,
+ IoUAXO: 0x309c5b,
+ 'gembgs': "https:\/\/example.com\/bXPHgIURmqZ?v=558"
+},
+/* item 238 */ {
+ HXnpIe: {
+  'ukh': [0x7be0ec, 'zvvydpm sk', 0x6ec32b,],
+  PZKQne: [-381424, 0x76dd0b, 0x951ff8, false,],
+  bwFiIf: ["qxfmvu azojk dxplypy \u00e9\n", "ghvxygo mcoq ocz \u00e9\n",]
+},
+ 'qyposro': "https:\/\/example.com\/QYe7QUr-Nre?v=35",
+ 'qdd': [{
+   quetcH: "https:\/\/example.com\/N5CIMoXMb1M?v=927",
+   'bcgmu': 'boybxtd mainghap xetdy uqjsb yvr lot',
+   'jmrcyq': -498870,
+   QyvkTG: false,
+   zblySZ: 'pjg sdfydpv jb mhlpmsvk'
+}, {
+   BCrQCH: "mbukg gldqhdqlr qynsjeran \u00e9\n",
+   irOvEP: "xv krvcgs qvkau \u00e9\n",
+   DSHzTH: null,
+   KSfgir: "rtqu knp nscn \u00e9\n",
+   RqbujF: true
+}, 'xdxw phbbjpk nlbuoxfs hzshdvpg neaqtoiq',]
+},
+/* item 239 */ {
+ 'zlysxjp': {
+  'vdtuv': {
+   'mgtze': "https:\/\/example.com\/5ogWeFPzSbF?v=504",
+   'vopw': "qb wnwnppnc rjek \u00e9\n"
+}
+},
+ pffoHu: undefined,
+ 'apfdqhzi': !1,
+ nOooCL: 771286,
+ HDnDcY: "https:\/\/example.com\/g5LLA_CPncD?v=184",
+ slYRXa: "https:\/\/example.com\/L7bkXhgQ6pp?v=146"
+},
+/* item 240 */ {
+ MnyEbL: {
+  WBHPJz: "gjkw mhwlqiqp blebnmto \u00e9\n",
+  sLuMRD: [-811734,],
+  'bqzo': undefined,
+  CZGaYy: null,
+  'tjs': "https:\/\/example.com\/VTfm51vHZz9?v=310"
+},
+ 'esuvwyggu': "https:\/\/example.com\/s4y7b_hyeBs?v=839",
+ PVshJx: "https:\/\/example.com\/SmMgSr2RX1P?v=354"
+},
+/* item 241 */ {
+ 'peuppiuig': {
+  'dhtkj': 813881,
+  'iqizqwnrc': 0xcce69f,
+  wiahfY: -522651,
+  BrDzZU: "https:\/\/example.com\/tZoMP5d-ljw?v=432",
+  'ikygki': 0x424964,
+  'yuyms': 0x533a0a
+}
+},
+/* item 242 */ {
+ 'lefgohmz': 'ndxlrpap lfemcujqr yyk eudwsbvrv rzlyigolk mujnudn'
+},
+/* item 243 */ {
+ 'hcfbuhhlm': 0x5476b7,
+ 'eiues': -321758,
+ 'xhwfyualz': "https:\/\/example.com\/wQ2G38XRbsG?v=929",
+ yBcwNw: 'dxvjdm zwom',
+ dcrrOS: false,
+ 'pmert': 'jbgdsmej uecmxobs vudghbxbx tntotn sgpw'
+},
+/* item 244 */ {
+ 'vlaluyp': 0x6fad71
+},
+/* item 245 */ {
+ QNKSye: "https:\/\/example.com\/1hSj1Shca3p?v=742",
+ ynytbV: "bnodad pvipwoc fvb \u00e9\n"
+},
+/* item 246 */ {
+ 'hzyfx': null,
+ wpkGxy: -749474
+},
+/* item 247 */ {
+ FBaZdP: !1,
+ stDUos: "jyzkhx mg synhxze \u00e9\n",
+ LNYzLr: "cfktp cheei yznomwr \u00e9\n",
+ 'zddmj': "https:\/\/example.com\/fxKOgViRrje?v=568",
+ 'ph': "https:\/\/example.com\/yyJAvpo-9e0?v=614",
+ CSakth: {
+  'dzadhkcnd': 'okdry hcdsib uccjpcgad dsbolcw',
+  bDuoUI: {
+   'gvtpuzl': "https:\/\/example.com\/HudWRDhz0SY?v=334",
+   jWKLHa: 443329,
+   'yee': "ig uqquozily irgnzuw \u00e9\n",
+   'iu': "https:\/\/example.com\/kAJazRCFd63?v=818",
+   oKybmh: 'aqzueakc iuqbjeqna rfzzfwlmg xuotanlf bvxithkkd'
+},
+  'owluougj': 'bp hsoorrveg'
+}
+},
+/* item 248 */ {
+ SXutBq: "sobtzx rgrsoypck oagi \u00e9\n",
+ JOXIkX: false,
+ QZFfJC: {
+  FuktoC: "ybgi ido pbt \u00e9\n",
+  SjssJZ: 'jecer df sqvgc rkkuir',
+  'ninwzzgg': "xwolvya ws pr \u00e9\n"
+},
+ 'zaeslab': 'xafqzc oozipww werrik bcqawzp vptiu xrvinqs',
+ 'dulvifi': {
+  MwvpHJ: 'uxibdv cxzi epg zfg orisql svnxqhpou',
+  'jzf': 'vxryppi lslflc',
+  mBVzGk: {
+   nyXQxF: 0xc1609a
+}
+},
+ jOBXpx: 620774
+},
+/* item 249 */ {
+ LWZFxE: 0xc77cd3,
+ IjmNNy: {
+  'wzkryxn': "opsvcer usk lmbjw \u00e9\n",
+  'pdayxlf': 'ydjsxy',
+  hkGbYs: "hwhon qlncihkmg ls \u00e9\n",
+  'wgv': 'rwgipl sgqnq ghbngqvhw',
+  ODOwzE: "tqz tuviqn kfisf \u00e9\n"
+},
+ guEbEi: 0xccf59,
+ jgWDtY: -602289,
+ AmHojc: 0xd08d27
+},
+/* item 250 */ {
+ 'fare': 'rakggrype',
+ 'zbvtizt': 0x32cec3,
+ 'xj': ["https:\/\/example.com\/MiQWV_se67k?v=633", "https:\/\/example.com\/jTAx6XczM8R?v=587", 'khgep ave',],
+ 'mxpigxnsz': "sswpr dcpw yzqojvzl \u00e9\n",
+ 'vhiwrr': {
+  'islemqswa': "https:\/\/example.com\/I2O6BtXjluV?v=542",
+  OhMquE: 'tm ofmsram abfrx',
+  ajViUM: 'ks dulk outouhmim berac',
+  vpAjQS: ['dyya uwxtjexs uwxfvvbup', "dhcuch va dlhz \u00e9\n", -501503, 767797, -34004,]
+},
+ qgYUKW: 0x5beed1
+},
+/* item 251 */ {
+ GDPxkQ: {
+  lFhLYP: "https:\/\/example.com\/8kdwcShds-f?v=417"
+},
+ 'nuqma': false,
+ 'fvlh': "ywran smqhspzs xu \u00e9\n"
+},
+/* item 252 */ {
+ jZLoJT: {
+  RbNMQn: !0,
+  hQkkoX: 0xc50515
+},
+ 'kxx': "https:\/\/example.com\/3T4NlsORxBV?v=19",
+ 'fh': "https:\/\/example.com\/k_JR-eNYRF_?v=183",
+ 'xjdekloy': 'hmmsxffs',
+ 'sszvzydu': 0x146c03
+},
+/* item 253 */ {
+ bYXnbu: 'rbpfp gnnpk usddetvt csuvvwjs lilnmjeu rnaci',
+ 'idxghy': true,
+ 'tfweogpy': 692233,
+ dTRCod: 'thpr xfuqbk znz',
+ 'ygjuxedic': null
+},
+/* item 254 */ {
+ nlLrdo: {
+  fYEuOO: "yne rwlqnguuz bksm \u00e9\n",
+  'nbs': [0xa3d2a, "https:\/\/example.com\/SFhaAFziDLu?v=804", false, undefined,],
+  'cji': {
+   itgcFZ: -282760,
+   bVGEdn: "https:\/\/example.com\/shgsbAOtgqG?v=356",
+   'cttocw': "gfdm yhrd ndyypzyph \u00e9\n",
+   UtgrWh: -551541,
+   'nsmgjeaml': 0x276e29
+},
+  'qcoae': {
+   ruEWOb: false,
+   OVlNKh: undefined
+},
+  cAsJJw: undefined,
+  'xlo': "ts uhhuv hlwfg \u00e9\n"
+},
+ HksjWq: null
+},
+/* item 255 */ {
+ MEbLMv: {
+  bRKsXG: [,],
+  NgfKNW: {
+   OeZVvj: "mxzncowi awyihzakc cgpyokjz \u00e9\n",
+   YdErUZ: !0,
+   'rcvceyd': "https:\/\/example.com\/eIZlucDWTeh?v=81",
+   GoSrYQ: "lbnlm xdxghvdy xh \u00e9\n",
+   'xothkinq': 0x129660
+}
+},
+ ucHvIV: "https:\/\/example.com\/HGTbBTVJZri?v=339"
+},
+/* item 256 */ {
+ 'haif': 'xcdwv de npukruvsw',
+ 'yjnistlh': -630330,
+ HOApwa: "yc az cfbo \u00e9\n",
+ 'kugegn': undefined,
+ pnwdLS: "euaqixeh yqxpa dop \u00e9\n",
+ jppPJW: 606934
+},
+/* item 257 */ {
+ RynLlZ: {
+  bXCIuk: "https:\/\/example.com\/sA4m_gp2CKQ?v=366",
+  FrKxzG: {
+   'gtzthxfv': !1
+},
+  'jfle': true,
+  AesmCQ: 0xc0acc2,
+  IHEwiP: !0
+},
+ 'xresgt': {
+  'kjbcktv': {
+   nVRAEU: 0xa4b32d,
+   zVPVOo: 'nfkfpdlyr phcjuyk hhsjf mtxhz vt ppxrayfsj',
+   'cfrjhez': "lq lgort dgvpup \u00e9\n",
+   NYzmtV: -748241,
+   'ovvjttqw': 843743,
+   'uhbylkxe': 'kj qauphpxdg pqivayeeg gumhqac'
+},
+  bRsXQj: 0xd647df,
+  pyiTyn: 852409,
+  'fbj': 0x72dfe7
+}
+},
+/* item 258 */ {
+ 'dsh': {
+  'jiarkejih': 'vexqt cuavdb ddvr dar swbxsg tdmzmnhbn'
+},
+ 'wviix': "gyztqkx uqedoibm xjonycc \u00e9\n",
+ 'jhm': "zfevwmz wxtrha fwotqqk \u00e9\n",
+ FZRCtd: 540585,
+ 'vflktc': {
+  'vtmujomgi': {
+   'gmezc': "rltsmnjs wn tcwevuc \u00e9\n",
+   'cdpdsu': "https:\/\/example.com\/wUbuHJB68aF?v=596",
+   XWNATT: 'lmn bwen',
+   'pidhsy': 837062,
+   'lowbrmbjw': 'rxiofn qcnafjwdq qrv jjxz skqhb ilagdv'
+},
+  'wqnxfyoz': {
+   XGmzVv: "https:\/\/example.com\/ZzwoCLqtBBg?v=119",
+   zgLKxI: "https:\/\/example.com\/QJXn-zvLKSX?v=569",
+   fIXzef: "https:\/\/example.com\/BBMr8_DW6BM?v=333",
+   'vgio': 'twtuubpl edljktly',
+   lOIoVa: 'na xymal jo'
+},
+  'zio': 0xfac9e0,
+  'vicnjspjq': "ybgkgzn qqtdci apt \u00e9\n"
+}
+},
+/* item 259 */ {
+ 'kk': -668716,
+ 'kekmmv': "https:\/\/example.com\/MG5QoTZqxw6?v=169",
+ sNthXJ: 'kh bkqy',
+ 'uchzzkdgd': 'bhgna sepqzff pusdizyl'
+},
+/* item 260 */ {
+ 'sfyaiz': 'rkocso cj hmlt ft',
+ tGrxKD: "https:\/\/example.com\/KEJ6keHQ39i?v=866"
+},
+/* item 261 */ {
+ 'wbivr': "pdemg ew olplkdjt \u00e9\n"
+},
+/* item 262 */ {
+ 'vrtbr': 0x89162e,
+ mfJLLb: "yhb jglt vjvdgy \u00e9\n",
+ hEWrNV: "https:\/\/example.com\/z49dQHAfyzO?v=58"
+},
+/* item 263 */ {
+ CbCWUJ: 0x874141,
+ 'zyxpgvin': {
+  cDkDLW: true,
+  'rgebnfe': {
+   qwxhHA: 319105,
+   fcWfFE: 'wxtp',
+   'zaw': "xigltw baljkti btyhs \u00e9\n",
+   'gwxy': "https:\/\/example.com\/HJxs6dc5W1A?v=53",
+   'chhz': "axsh npbtrr leaypg \u00e9\n",
+   ElSnTK: 0x74528
+},
+  uqzRVW: "https:\/\/example.com\/xcy3Vz9AZQE?v=58",
+  'yyyrpulco': true,
+  'lshsi': ["https:\/\/example.com\/y76cD5AHzoX?v=116", 'ovgzzns wllvri tuvdaxl wlqt nuyzd', undefined,],
+  MHVsOE: 0xccbb3f
+},
+ CEKusx: [['od clap ppi ayk hw', -476663,],],
+ 'dg': "https:\/\/example.com\/_xYr5GTr_PZ?v=151",
+ 'argrvavhr': 0xe1196a
+},
+/* item 264 */ {
+ 'ddk': "vog qmzqj jzeogfx \u00e9\n",
+ 'ubobfrd': [,],
+ 'cxnuvdgjw': true,
+ 'crt': 999360,
+ GorwnH: 849490
+},
+/* item 265 */ {
+ AqbzGp: true,
+ CpoZGr: -240718,
+ 'lq': {
+  fHSvzc: "dubed njqyamhs hpfv \u00e9\n"
+},
+ 'nliekif': true,
+ 'mtjjnd': {
+  'zsvkrxapj': null,
+  WdDyRL: {
+   'afkb': "https:\/\/example.com\/giZGB9g0lZy?v=179",
+   TTNbTP: -337807
+},
+  'do': -240863,
+  BEAUXc: 'ztxfsnjb zsgtsiu wu qssj gkykkcqd',
+  'on': 793295
+}
+},
+/* item 266 */ {
+ 'hctd': "https:\/\/example.com\/KrFq_BZY-PG?v=944",
+ 'xfogkv': "https:\/\/example.com\/Rcpy4E2WjDv?v=573",
+ 'tmqqb': ['zo', "dm jn wwlq \u00e9\n", {
+   wVXMLA: 'wh rhtt lfyivc amph zke',
+   iSoKle: 'hkhxnyt lr no otbh',
+   oQelWH: -571930
+},]
+},
+/* item 267 */ {
+ 'nlxsamxe': "criqgc dibwspo uewrsnuji \u00e9\n",
+ 'qtdytynv': "https:\/\/example.com\/dJnsNKlq7y-?v=634",
+ qtzGCG: 'icqy vkvxyp lpgulgmc yoqy iqssefc cpfyvhcgl',
+ 'wspjy': "https:\/\/example.com\/f-Sq2wPRE5u?v=453"
+},
+/* item 268 */ {
+ OIiGjG: 0x608451,
+ bikDqM: "zdul scvlrrhor jdm \u00e9\n",
+ 'rby': -228531,
+ 'hvqv': !0,
+ 'qkjv': {
+  'qt': "vmtnzn vlcrzl sjhtoa \u00e9\n",
+  psPvyq: 0x276785,
+  'yf': "hvlknk yxleo lnz \u00e9\n",
+  NFNVMl: 343016,
+  pnmdTc: 0x52fc79
+},
+ HGTRux: {
+  RNSPnB: 0xa427da,
+  'mrvpdey': {
+   JiqEEP: "https:\/\/example.com\/OZwcXgVBWef?v=339"
+},
+  'wsf': "https:\/\/example.com\/N-m9kqnryGl?v=972",
+  PCxwxU: [null, undefined, "https:\/\/example.com\/XXbauVW_99k?v=259", 'almroktex cduvlwhc mfvgl vmrl rbo', "https:\/\/example.com\/5jXZy2J9rKx?v=734",],
+  'aejklrs': "https:\/\/example.com\/QsP-FfqnACU?v=654"
+}
+},
+/* item 269 */ {
+ XSejQK: !1,
+ HAfuST: 'npwjb fracg',
+ 'ehwfxe': "dzhpgcmgy fk nwiahret \u00e9\n",
+ wBEvzb: "tqkqsptn byjahm nssqwyfb \u00e9\n",
+ 'idjulzyr': 0xd20c87,
+ 'kecwwte': undefined
+},
+/* item 270 */ {
+ ytKvlP: false,
+ 'fdtj': {
+  bsqwVA: {
+   kLARNi: !1,
+   'ymyweisgo': "tghyee eo xznnubjq \u00e9\n",
+   'wb': "https:\/\/example.com\/i9YwrOcbM3d?v=181",
+   'xogre': 116566,
+   nTaYGJ: 0x40ff12,
+   'uymtvxx': 0x8f1a48
+},
+  JmZRbL: 'tzlmlcxh rwg tikuecwz',
+  aDYeIk: {
+   sEhWfT: false,
+   'ee': "https:\/\/example.com\/gsF8t00_SCw?v=344",
+   'xluajznad': 'dystd abmtzuq gu ranenl kocdmci ctw',
+   'qhhhdncuj': 'uuy',
+   bUzoCC: false,
+   DfScRU: 'ozs awnord nxdaiycf'
+},
+  cxhIBj: null,
+  'fsnmadqs': false
+}
+},
+/* item 271 */ {
+ JaiKPu: "fbaskmv zamgdutza wrfjus \u00e9\n"
+},
+/* item 272 */ {
+ 'gq': 439913,
+ vXYmWi: "pyyw rgew djygtyw \u00e9\n",
+ fTUjqe: true,
+ 'oc': {
+  iMscYO: false,
+  'am': 635366,
+  tdCMtl: "https:\/\/example.com\/O5TaZBxc4Br?v=69",
+  'uqy': 'hgxrphqqz',
+  DrqeqO: -50189,
+  'xa': 0x7ad191
+},
+ InwzTs: "ghgse bcaifnsqf alvoxs \u00e9\n"
+},
+/* item 273 */ {
+ 'vwwck': [,],
+ gBuQFM: -257455
+},
+/* item 274 */ {
+ 'yvp': {
+  ccZEfr: "yr xsxouofb dlkusumoh \u00e9\n",
+  'eegnz': "qolfmfz hdmtrst jyxv \u00e9\n"
+},
+ 'wgmgfpi': 'ehgu naa hv dewxrvco dcvq'
+},
+/* item 275 */ {
+ 'bye': "https:\/\/example.com\/vpcHXycCMi2?v=287",
+ 'telhdcs': {
+  fjeAiU: !0,
+  'zkc': "https:\/\/example.com\/NlpUJftdoGP?v=427",
+  WCImZA: {
+   VBDmNt: "https:\/\/example.com\/1pp5aCrjs1d?v=472",
+   AdxDHA: 0x31550f,
+   SMrqYt: !1
+},
+  zpfdpU: 947241,
+  'ywuffwjf': [-574242, 0x1da8aa, "lqijmlt xvdc seyeuint \u00e9\n", "https:\/\/example.com\/jWOQlDypD5W?v=179",],
+  BobXaE: "ybes uxj rldanol \u00e9\n"
+},
+ ruMYqP: 'twrpue ofdt ooxezj yvtg upapqeb xi',
+ RefyAy: "hwc aruvqcmo qbuint \u00e9\n",
+ 'gtzwsxln': "https:\/\/example.com\/DYNnxrnfcDC?v=951"
+},
+/* item 276 */ {
+ uJDsKV: "https:\/\/example.com\/3vrYzEwZAoy?v=894",
+ 'lm': {
+  'euc': {
+   VPLNoa: 0xe4d2c,
+   'mtpbzskko': -389707,
+   SYKfXh: true,
+   'fxqzjpln': "kufpm dvpnybk nrivf \u00e9\n",
+   GPlxgK: 832482
+},
+  'dcghcletb': true,
+  CtksOJ: 0x4e1887,
+  jlDUyU: {
+   'agkhf': -102622,
+   'nannvkge': 'ta'
+},
+  'jgdb': ['cmkpfxem tzt tjutmejlu', 'buun rdzxwzw wc vlgu sgxcfyyl',]
+},
+ MuEIwO: [0x5f38a1, 0xb49b0d, [null, 'ntzoaecrw', "https:\/\/example.com\/8ttDsWa0z0L?v=962",],],
+ 'ufxx': {
+  IeOuMq: 0xcb8f10,
+  'luvkfue': 'gs emz mluprlvc dqkupntw ltna',
+  DiSzWZ: 'oeek xhxu',
+  'mhwxbjj': [0xbb1b4a, 0x3a73a0, 'vwkywjii quaeldkuh jlz kaeoxnnkm', 684583, "https:\/\/example.com\/5CQ-b3YvWzQ?v=377",]
+},
+ 'crksbyh': "shchbgrc okgoshwx vilktc \u00e9\n"
+},
+/* item 277 */ {
+ 'uiqlefw': null,
+ iunaFJ: ["https:\/\/example.com\/Mss8wT0TuCH?v=920", !0, !1, "lnw vncmlhcu nvhp \u00e9\n", 0xbf9e6a,],
+ utseSi: 526886,
+ 'vfautrh': {
+  'tjcxm': "fcretnk faahw ppqkya \u00e9\n"
+},
+ 'pwgppq': {
+  'bep': [486872, 'dcq kvj pddstxzx nafoyrx sqlwnnish hdybana',],
+  'pjfyp': {
+   'scdbeojk': 317349,
+   pyLfsR: -646129
+},
+  'ngegd': 'xeli jupczmlfv wtb',
+  zNONLG: "bdg jz pms \u00e9\n",
+  oaqASq: {
+   'ns': !1,
+   'lwpzoaip': "https:\/\/example.com\/YrHZiTBAhCD?v=676",
+   epXrqY: "cvsxbr swpeoqv dy \u00e9\n"
+},
+  'sfcnef': "https:\/\/example.com\/3bUNfCJvtwT?v=466"
+},
+ XszEHL: 0x5414ba
+},
+/* item 278 */ {
+ 'xlijypfmv': [{
+   'awe': 'tszm',
+   TTNjgk: "https:\/\/example.com\/V-UMS7t0zTr?v=437"
+},],
+ SGppKC: 0x7644da,
+ 'adbyfqs': 0x9292b7,
+ 'affjy': 967822,
+ mbkddg: "cvpzdestd qhtticzi uoshxkcdu \u00e9\n",
+ YLPscN: {
+  oxtmbf: "https:\/\/example.com\/q-P9vBvJNh0?v=942",
+  'wmcnni': 0x9a6b3b,
+  'rfpha': -50525,
+  AthKSI: ['ifeshrgs dddyjcsxd lavpqmoz', "ebojbdvmw uphqafdr iit \u00e9\n", "https:\/\/example.com\/jzjUovzTIAw?v=819", 0xe84342, "https:\/\/example.com\/ju3jilO3G9Y?v=640",],
+  NUZhCE: 'kv heggbqk pn ycsizahkl'
+}
+},
+/* item 279 */ {
+ 'gebsnslp': "kvtk ibc fkbv \u00e9\n"
+},
+/* item 280 */ {
+ AYWeoF: "https:\/\/example.com\/DrDZvd3cpwa?v=198",
+ 'zkbpmj': "https:\/\/example.com\/pq6FoeBUX2U?v=263",
+ 'smgvilha': "psxk gczk zwkcabj \u00e9\n"
+},
+/* item 281 */ {
+ 'zts': 'dlkqtz ds dxg shfuykby flrxaebr'
+},
+/* item 282 */ {
+ 'hoewv': {
+  'bidi': -286394,
+  'uaehwcp': [!0,],
+  clhZhS: true,
+  'cbhelj': 0x2553fb,
+  LDiJnP: 390820,
+  'kbw': {
+   'wd': "ybdpnkiwn exvw ufo \u00e9\n"
+}
+},
+ 'hxavn': true,
+ OaiQqX: "yqgwvz pgwcnegyb halodi \u00e9\n",
+ zjwvgY: {
+  'nuoxvje': {
+   'peonsgrf': -408213,
+   fnxhzj: 0xd5dd56,
+   'vb': 0x831ade
+},
+  uyRDzs: 0x1b58c,
+  'tph': "qnoynydm ebputwt nrliiri \u00e9\n",
+  QRjESx: -73276,
+  'cqwe': {
+   QKPrFg: "tzkfogjwh cviy zuybeqlm \u00e9\n",
+   'syctj': 0x464f0a,
+   fYlhqx: "rurlqh msrermmg ilta \u00e9\n",
+   'kn': 'tr'
+},
+  VlXKpX: "https:\/\/example.com\/iM2jTLQcr-T?v=877"
+},
+ 'foc': {
+  'xjwgoutu': "ymsfnapgt ofikwo ti \u00e9\n",
+  'csnebv': "https:\/\/example.com\/qMxs1RVDsB0?v=821"
+},
+ 'erb': {
+  hJEkUy: {
+   'ibexuq': "pqt mkmnlw myvtwhr \u00e9\n",
+   ORdnLp: null,
+   bFLwcp: "xbilqsu pfjtntv jxzku \u00e9\n"
+}
+}
+},
+/* item 283 */ {
+ XRSKjg: "gfikjfjrp dtzmwsft oqsjjjao \u00e9\n",
+ WuedPo: {
+  Yvhotb: {
+   'swnypl': 0x30c6dc,
+   LbYhNo: 'dehmsquu cp',
+   'opnimyepc': undefined,
+   IIhUnk: 0x617fa,
+   'bdcfoa': "https:\/\/example.com\/hXsJ7Yuca4c?v=688",
+   'dncroe': "https:\/\/example.com\/9hCwhz5H2z6?v=28"
+},
+  'qdlyhkrr': 'ijmrkjz'
+},
+ TXYIiD: null
+},
+/* item 284 */ {
+ Xqjjcq: "https:\/\/example.com\/sKsWltsyBK3?v=402",
+ gnvvba: 'zy xibwuc gtj wzjhcukr fvmklgass',
+ 'huc': -237155,
+ YYntUj: [{
+   hIZLua: 'kfkazvgz qpfod iwryxj npoupi rffysmyqz en',
+   'mpg': 0xad1ddf
+}, 'nygpl kyil zjdqou',],
+ 'adfualjyg': 0xb8c78b,
+ 'cuuqzhe': "https:\/\/example.com\/u9B1iq2odzM?v=845"
+},
+/* item 285 */ {
+ 'prxqaysx': undefined,
+ 'qiukdgr': {
+  QpXQMX: [0xf78dd6, !1,],
+  'idezqzli': "guw ktqw kpzyf \u00e9\n",
+  dYVgGi: null,
+  emzrjc: "jgfzm uqcs btdtoewmb \u00e9\n"
+}
+},
+/* item 286 */ {
+ esHcOf: 'gewliera',
+ laPpqX: {
+  'pptgzm': !1,
+  luDGaM: !0,
+  Rcgzhm: "https:\/\/example.com\/0LRgAVnht3S?v=761"
+},
+ 'avdkkhurl': "pbbs zvuoyy gkyglrnz \u00e9\n",
+ pWrrhY: {
+  'rayt': -34056,
+  'aqdekwetc': null,
+  'xdqezklzg': ['jlqp', 959333, "https:\/\/example.com\/pLgBdrV6cVD?v=64", 'pdwpklhs',],
+  'cdntzbhzz': {
+   'uodeijd': -106537,
+   'zojwa': "https:\/\/example.com\/k8V4oeb5y_L?v=976"
+},
+  WdfrgH: 482413,
+  'ye': undefined
+},
+ 'wi': {
+  'kxegv': 687422,
+  'bt': true,
+  'itiizlcej': "https:\/\/example.com\/xu-KQt705-X?v=42",
+  'krp': {
+   'nuxeae': 'lcohh tkfg nktymdga cspf hxstxqqr uixosf'
+}
+}
+},
+/* item 287 */ {
+ pcSqxl: "https:\/\/example.com\/msnbSHleazA?v=658",
+ lMmCcQ: undefined,
+ YbwZsP: {
+  MZadvP: "https:\/\/example.com\/Zm4t85z3Nwd?v=504",
+  'doenxncsg': {
+   uRUZoD: 0xff89b8,
+   'gagouamvu': "pd gmmt aqriln \u00e9\n",
+   PcguaO: "https:\/\/example.com\/Qr8AmIy74ic?v=574",
+   LdzLGZ: "srt ymxwyqrtk zbaxeaxe \u00e9\n",
+   pmOnMb: "https:\/\/example.com\/q5ZX88Qxdi_?v=250"
+}
+},
+ 'pn': "pvaivvqn cacwhiql mxroqmcq \u00e9\n",
+ DDcbAJ: {
+  JDTfmH: 244121,
+  XmTneQ: undefined,
+  LkmRcW: !1,
+  'yco': ['cffx jxevhxz xwe jwfdpp', 'rvmglrv xbdajd nynx',]
+},
+ 'wi': undefined
+},
+/* item 288 */ {
+ mgcgvZ: [false, "https:\/\/example.com\/rrkLljmQ3k7?v=401", -504226, {
+   'gjhjnn': 0x3db068,
+   'ivamy': "https:\/\/example.com\/vL_R0O1xU_r?v=594",
+   'wtwnpqj': 0x2c6865
+},],
+ 'yrs': -139322,
+ 'aerk': [[!1,],],
+ APWjQP: {
+  'jpg': "ei pgcxkchzy agvyaqj \u00e9\n",
+  'yxinmgnxf': ['tjbw xgom', 'dtefy me enczteq en pewmhbnu', "qpjvapadg ggsa kqpycmof \u00e9\n", "gqrk xhyps pvw \u00e9\n",]
+}
+},
+/* item 289 */ {
+ Wksqei: 'cry jj st nhv mbiyxbz xcpkmhmbc',
+ EnRJfR: -344269,
+ VbcwFU: "xnalanfg suh ng \u00e9\n"
+},
+/* item 290 */ {
+ iGUYnT: {
+  jkNjiz: 'xlivcc nifuhe hkceonydy hlwlhhal',
+  bEuKyU: "clycjpe lc khpomvho \u00e9\n",
+  OfhOHK: 'dojgajq hptja imfhh pzwa dltnnrsvt jlbjfozss',
+  'jz': 0x36a874
+},
+ zZqmvm: 0x5c291c,
+ 'cgeheoey': 0x7aa18e,
+ hfHkxF: "https:\/\/example.com\/jkGsQlatuOi?v=427",
+ 'xjmrshm': {
+  'lexdmlhci': 616194,
+  'nsih': "https:\/\/example.com\/R-Sz1KTzKjm?v=691"
+}
+},
+/* item 291 */ {
+ 'dqzpnbwts': [false, 'xxrsxtcaz zrkunutqp rybgdtxi jjjm op yfdb', {
+   'dtu': "eidlwacb rcktf oicc \u00e9\n"
+}, [0x1eab2c, 0x989583, 'hvdzsw udblagbl', 'wovy eg ls', 451340,], ["https:\/\/example.com\/XpOvsf2efVn?v=27", 0xfda6e0, 0x2165a, 0xc75040, !1,],],
+ pwlTIS: 0xfd107e,
+ SKPpyy: "https:\/\/example.com\/fakfylzhvXA?v=664",
+ BSYLbi: 'jxl mqxsyqwk bx'
+},
+/* item 292 */ {
+ pYcsBN: ["rl gat wk \u00e9\n", [0xc53d62, "https:\/\/example.com\/mYrSux-3945?v=627",], {
+   'mdkexdno': 0xaee2b6,
+   'nee': "zref yjyexern dhpshfxf \u00e9\n",
+   jBuSTb: -671448,
+   'sjsmrw': 0x1be3a,
+   dAerQO: -145487
+},],
+ 'eqkmk': {
+  'mret': ['mrqmhe ekfx', 'hia gl spp ut', "xhwsxqkng nt ow \u00e9\n",]
+},
+ PXTmhJ: 'fu',
+ 'lohu': !1
+},
+/* item 293 */ {
+ 'wyctb': 0x275853,
+ 'zldgs': !0,
+ bJUfym: {
+  'yjbm': "https:\/\/example.com\/F-98obJqAiW?v=121",
+  aUySaU: 0x8586b6,
+  'dew': -924423,
+  'qgladrsg': "ksndfee agexuk qkmb \u00e9\n",
+  gkcunb: -501700,
+  'wxmmbpyu': "https:\/\/example.com\/JWApQ0sFx7v?v=751"
+},
+ lxLblv: [[,], {
+   'ris': undefined,
+   sUZsWa: true,
+   'rq': 0xa26ab7,
+   mrWPpJ: 227517,
+   fcbkPb: "saxqb rxtp rlqnk \u00e9\n"
+},],
+ 'ravbqy': "izziol jj gglzsmw \u00e9\n"
+},
+/* item 294 */ {
+ 'qudbios': "https:\/\/example.com\/y9-7LZ5Zi-r?v=808",
+ 'fqkra': "https:\/\/example.com\/650ZuP28d_L?v=530",
+ QHUNTe: true,
+ 'vbighazhe': 'ni',
+ xRIIrS: 0x7eaad1
+},
+/* item 295 */ {
+ alZzxo: 'gx zvwu uxyq jcj',
+ CMlmiA: {
+  JuCYmb: 748699,
+  CBgLCH: 'semzauc nqc idjsdxh'
+},
+ vUvVJs: "mkqckcl xg tfvsgp \u00e9\n",
+ 'ai': 'xqev',
+ 'mlvi': {
+  WDUned: ['ntibwjdew wuudt', "https:\/\/example.com\/AgPbZhvttr5?v=871", "gpyi zbbowpk yasv \u00e9\n", 0x9ef1c0, 'yzww hmnb dxhlbsp ghv ybqhdv pfu',],
+  UilVtg: "wiftoa kdtvx bmbv \u00e9\n",
+  'shfnufwih': 'blcdis rt ilhbioiqw'
+}
+},
+/* item 296 */ {
+ DfRxww: !0,
+ 'isz': !1
+},
+/* item 297 */ {
+ Gkascn: {
+  ecUEjy: "npjscj qtubkni kcngpylji \u00e9\n",
+  fxprNY: "https:\/\/example.com\/naqGaqzlst4?v=45"
+},
+ yObOAu: undefined,
+ 'zyubbqx': 0x83466b,
+ THZNcL: 'bqgfwon',
+ YiArAL: "dfzh nfmilg muq \u00e9\n",
+ xNmFcj: 0x188d4f
+},
+/* item 298 */ {
+ ADUyut: 'ejbc',
+ 'nvfjd': {
+  fNYWUC: 0x4f2e5d,
+  nAnoLw: {
+   qnWJfP: false,
+   'uerknimy': !0,
+   'auipxdes': -239297,
+   'vskqoz': 'wgvcjx gznuvt twyryk fjsac yly'
+},
+  HnJvkv: [,],
+  IdeLOm: ['skccpgpou zujjify mgvdi', "kcba clpuijp pmdv \u00e9\n", 917907, -41208, "mbfqxg hvjerjxht rmbvpsw \u00e9\n",],
+  lpMOBL: 'monier cgcgefhw'
+},
+ 'ynyywajxv': "https:\/\/example.com\/Xm3Mg4DYvl3?v=370"
+},
+/* item 299 */ {
+ LeckbW: "https:\/\/example.com\/ST7eiu4pMvh?v=146",
+ 'uvlmyuj': -449469,
+ CneSYd: 'romk smf'
+},
+/* item 300 */ {
+ GxxKgx: "https:\/\/example.com\/AIG7vzxsCbP?v=699",
+ RwNquG: {
+  'mkfpw': false,
+  'ofnfxhjv': 'nlczmvpf pfdobmham yfpw buqobw fz muesnkuz'
+},
+ lSRKwr: undefined,
+ 'krtq': !0,
+ MiyEuX: 'ncqlbof gx wrp kktefasup gmhufoj',
+ OUmDbB: {
+  'xkgczl': 'ts thqeic kmpa',
+  OMgUnr: {
+   cWcKZw: !0,
+   'unk': 0xa84721
+},
+  'jbs': {
+   XWYsUi: 0xec15c7,
+   BWeLMq: -933704,
+   Hbrobp: 0x9ff184,
+   dQXubo: "sgi kylgxk qfgnaj \u00e9\n",
+   'izbdkmwv': 'hjy',
+   uaWQxc: "lbdsjw vpcscx giqnl \u00e9\n"
+},
+  fQsRGl: 0x60cae0,
+  ZCgUQm: "zwimeyxu qznejk vqvroedpw \u00e9\n"
+}
+},
+/* item 301 */ {
+ fLZSTw: 'rcef wllwnaq npqt hj',
+ 'ysnt': -566502,
+ QPSClq: 0x8c94fb,
+ 'mjntxgy': [,],
+ QcZtQh: !1
+},
+/* item 302 */ {
+ 'wk': ["svihx ppomfxo iad \u00e9\n", [-530110, true, true, 695431,], 'colnoaqem nrwtssece panvrgwfu ucfew fdbtba kvik', "vyriq iueq oj \u00e9\n",],
+ uJhQHx: [0x103a1e, !1, 0x805010, "https:\/\/example.com\/OAO8brOo0YS?v=548", 'hihuijpr vttzise coag',],
+ 'pki': -13622
+},
+/* item 303 */ {
+ VejbDT: 0xb1b75,
+ ACxIbn: 'nlavevwl bh',
+ 'nzpdfpxua': 271677,
+ ZLmgNw: 529999,
+ PEzNGy: 0x80f01a
+},
+/* item 304 */ {
+ GvOrEv: {
+  'zgtmpnvkw': -856067,
+  RYsNiR: 0xfe5507
+},
+ 'kw': 0x6c12e1
+},
+/* item 305 */ {
+ 'xxrhnzju': "wqgnqva opjq fzccveb \u00e9\n",
+ DYpBAo: 'rhnmfjb gvjw bvyvzis vxzeoiw msnfqdoi hfnwramjv',
+ Zqkoat: [{
+   'ngcnhoyuh': "sfuxriaq lvxhzzdw qrklbgmse \u00e9\n",
+   JHHWfo: "https:\/\/example.com\/7zuxu0_ofte?v=273"
+}, 'lpwemse', null, 0xd51af5,],
+ 'wlsopp': "zpypfcar uuyddpovz xdixza \u00e9\n",
+ 'rir': "https:\/\/example.com\/4fe_cBeCmXh?v=873"
+},
+/* item 306 */ {
+ sxpVJB: 401097,
+ 'wfy': [{
+   EIUfDX: 'aauvrs koh wi kcghqb kxtqmsjae llnpu',
+   'estfxfg': 'xbgz',
+   'vtjw': null,
+   'cucpelxgx': "https:\/\/example.com\/HgFLTm7DIRv?v=208",
+   TaClzV: 'eozb gurhobega vdcn'
+}, null, 'rqosaip hbtlspy bdocmcst kefhcqn irq',],
+ 'yucuy': -807639
+},
+/* item 307 */ {
+ LISlDK: "https:\/\/example.com\/OetjW1_sXF0?v=942",
+ 'wn': undefined,
+ 'yzlnadevk': 0x2efecb
+},
+/* item 308 */ {
+ JAaYPA: "ymfqd pql wppy \u00e9\n",
+ 'uuahpn': !0,
+ 'wc': ['xs ao skx ivnd rzx rpwde', [358991, -599512,], 807480, 0xb6a9fb,],
+ 'gwg': {
+  wCSuNF: "https:\/\/example.com\/O0b-5emk14y?v=5"
+},
+ sEspkv: [,],
+ XumTRM: "yztuet nu bdqzrvws \u00e9\n"
+},
+/* item 309 */ {
+ 'tkd': 600548,
+ 'xem': 606620,
+ 'osxokzrq': "https:\/\/example.com\/zOGPYfhBhdb?v=665",
+ lUEmem: 'nxphwttgi jdydfopx dolnjp',
+ 'gdhapzavx': -596056,
+ dXIbIg: !0
+},
+/* item 310 */ {
+ 'npserj': -920881,
+ 'ym': 945133,
+ 'xwakjn': 'rb oiaxtel'
+},
+/* item 311 */ {
+ IqvRiH: [,],
+ 'bccj': false,
+ MVHRZV: -245068
+},
+/* item 312 */ {
+ 'bsleoiegf': {
+  KCXiOp: false,
+  'vk': "https:\/\/example.com\/5haJ5zOfxzu?v=436",
+  'fap': 0xc3064d,
+  'yetclkf': -785912,
+  'kxmasa': "https:\/\/example.com\/rfrqOfy4KCU?v=702"
+},
+ WKNded: 'spbjwaew ecesbjs utxezl acnuy gvuyvwbf bw'
+},
+/* item 313 */ {
+ 'ktq': {
+  'ekdfwofm': 'eg omd wzevun kzizlq twobfiap',
+  WYKPMz: "iiyzn gls odtw \u00e9\n"
+},
+ hxzYMN: 'hpaqm quw rcvawk wu',
+ AWbzOK: 463412
+},
+/* item 314 */ {
+ NctLIf: "https:\/\/example.com\/vC7946_TJUN?v=92",
+ gxDGJV: {
+  eqMRLW: "https:\/\/example.com\/YaeT4ETFgUA?v=774",
+  FrsaHu: {
+   tTPmxB: 'aqcdbrqe',
+   'xfrrne': "https:\/\/example.com\/VPIMa3cFEJ1?v=670"
+},
+  'udmsz': false,
+  SCjJZG: {
+   'tchyjnfl': -311828,
+   'urw': "https:\/\/example.com\/NZPXoXKw5nJ?v=306",
+   AkeLqV: -825409
+},
+  UDepHy: "ent pwtbm uc \u00e9\n"
+},
+ LukeUM: 743922,
+ 'slmogm': 'dxaa xygwkl xpdabfya qzi cbke cwivnov',
+ 'ivjvnco': {
+  'tvpoicm': 'zutrozs atesxe'
+},
+ 'lggwej': true
+},
+/* item 315 */ {
+ NsjcFG: 'cpdymnm fc xhtyd gbfjcbdip',
+ evlXLj: {
+  UXUXDu: 'zvmze ccnz tukpyx',
+  iZRFut: [,]
+},
+ 'jdyowf': 'xpgsbz mml jedudrsro jo dvffwh'
+},
+/* item 316 */ {
+ 'vfwqqem': {
+  TUZgSw: 0xa2a9a9,
+  'wjh': [-156776, 0xe3206d, "https:\/\/example.com\/VjOS-kT1Esl?v=814", null, "vtls opio zfj \u00e9\n",]
+},
+ 'oy': [,],
+ 'rphrvml': 462298,
+ 'rzuidbk': {
+  aKaMRi: 0xebe647,
+  'nhbvko': "https:\/\/example.com\/8-k-ZWLN9OP?v=88",
+  VTHzsp: 0x6c7c41,
+  'ofiv': {
+   'gqvr': "zuv aqnbj anxj \u00e9\n",
+   'ehibrfuqb': "https:\/\/example.com\/FIYTKjM7Z66?v=173",
+   TODjoM: 0x6c6f87
+},
+  FpoBbw: "ugjg wylskhp nuqohyyeb \u00e9\n",
+  'co': 'ahq nkhih duawcg'
+},
+ 'yhtofpt': "dpchnuyfo tstuzouy ngofqeru \u00e9\n"
+},
+/* item 317 */ {
+ 'dqpiabeh': 0x2ee0ff,
+ EDtieR: ["rviwz frl lhopb \u00e9\n",],
+ 'yftpg': false,
+ uiKDXf: false,
+ 'oowl': {
+  YFViot: "roilof jnd uhqbgb \u00e9\n"
+}
+},
+/* item 318 */ {
+ ndPJwu: -540593,
+ XPZJWV: ["saushld tmq ccluyxovs \u00e9\n", "klgg qohaemgo hitapm \u00e9\n", {
+   lSSWdn: undefined,
+   OMeBqN: 0x945fec,
+   YfAilj: 0x3f8c37
+}, {
+   cIEIVn: 0x76e6cb,
+   'lxlwdreyx': 0x129883,
+   SXjzbk: "https:\/\/example.com\/pw5RTE0yzKe?v=270",
+   GYGqQO: 'ccv iiab zvkrjt faotpf yolcyex ykt',
+   lfokdi: 'ggb sv xdkuy oiavtuxh',
+   'mne': 0x897746
+}, 0x81cc29,]
+},
+/* item 319 */ {
+ nRLUuo: 'vxiej',
+ emNHDr: 919458,
+ lKoOTV: {
+  VPgPxb: {
+   CksUwd: "https:\/\/example.com\/M39ZZhy4Zb-?v=423",
+   'nf': 'lbucqzjp wng lzprdtk',
+   UtnwwF: 0xc6c73a,
+   'fzard': !1,
+   FPtJLa: 'fvszkn hp ttrwaqnl wvqnk js nipwdrmk'
+},
+  aLzXRT: "aej xrgntu cldausbpp \u00e9\n",
+  'gzaapmlf': {
+   NBrYJi: -369102,
+   Hwgxzy: "https:\/\/example.com\/VyBYkUSavTH?v=272",
+   ZnKyrL: "https:\/\/example.com\/pbb37g5dH4u?v=283"
+}
+}
+},
+/* item 320 */ {
+ 'eypwiq': 0x7840b4,
+ 'rycxiuz': 862319,
+ MZMZXl: 'ezwdx aquvwnr kxrxre wm hqwwmucgx',
+ 'yaklyhfuk': 0xf2f3d2
+},
+/* item 321 */ {
+ 'pufass': "https:\/\/example.com\/QwP8-VY35sx?v=347",
+ 'dfvtdona': "https:\/\/example.com\/0673VFgdiJp?v=58",
+ 'montvkdr': 795308
+},
+/* item 322 */ {
+ 'hlxthu': 0x9c2ed7,
+ 'conhc': [{
+   skpTJL: 'koksvumy fjwutp ksazqgrk kmnfql onwj dee'
+}, "nlnysrrvk oaadheh ghxcfchk \u00e9\n", 0x30c4ab, -95573, {
+   'fsksfd': "gaz khzkoojg bqjcqhtxr \u00e9\n"
+},],
+ 'dcauh': !1
+},
+/* item 323 */ {
+ GaUhDO: 297147,
+ 'mkmfajay': {
+  'hfxfg': "https:\/\/example.com\/d_xpj0jWEWG?v=222",
+  HSACQY: ["https:\/\/example.com\/T0yfsxIeY4o?v=600", -125188, 0x736f04,],
+  cqDCnk: 'ahtf eg wrlyflaz wgxy',
+  JkhEID: {
+   lJubOK: "coqlj gjftnzs bpljbzp \u00e9\n",
+   baCaWN: "https:\/\/example.com\/EBvVaMsNtFU?v=791"
+}
+},
+ 'ruwg': {
+  BTDWmA: 'lduknjhv wuldow',
+  'jmal': ["https:\/\/example.com\/r8856FmcYmZ?v=769", 0x8fe6d, undefined,],
+  'dlit': "https:\/\/example.com\/XKjXVNgd3Yp?v=848"
+}
+},
+/* item 324 */ {
+ KpaNHv: "ezjqjznr zpamd tmc \u00e9\n",
+ XpYYNE: {
+  'ylldkqdqp': ["sbkpuwpm vxdwtp fjnkakdrv \u00e9\n", 'pvuylop ps yzicbpsv cya uj', 889086,],
+  'opmzagh': "efoviiwlk el polyqfi \u00e9\n",
+  HSbXvp: 517497,
+  'tutobln': null,
+  'hspnhzuk': "dypzrrb vzkcu as \u00e9\n",
+  cschmn: "szzn dgafnqrmh qdcbvi \u00e9\n"
+}
+},
+/* item 325 */ {
+ 'nnmqv': "lktlqpmp yydi yxauxprd \u00e9\n",
+ LFOUre: 0xc4e1de,
+ xVrEOU: undefined
+},
+/* item 326 */ {
+ zOKUSm: "https:\/\/example.com\/9BQQaSgmA9u?v=288",
+ HlObVd: {
+  'yfp': !0,
+  'ddgjnc': "lj ub vdnc \u00e9\n",
+  NOmpdr: "https:\/\/example.com\/sXIyttYVh7x?v=793",
+  CKyEnI: -13519
+},
+ DSJODc: 0x90615
+},
+/* item 327 */ {
+ Qnrkvr: "qkto kgxwjf ahuqu \u00e9\n"
+},
+/* item 328 */ {
+ OMdLrH: "sqjuyxl eghwe dlkgk \u00e9\n",
+ DRletY: "https:\/\/example.com\/E9Qcp_zZ8eW?v=343",
+ 'ar': 'yjtbqjwnk ndbltb dtpz xsgo uituriuw dprigdxc',
+ 'uhmkqsst': {
+  vbTxmu: "filwy xnfvjc de \u00e9\n",
+  'bcps': {
+   YBjjur: 'tqelwllu go',
+   GjWSNH: -352866,
+   tBGLYD: -114380,
+   CwPxjc: true,
+   aKSDLN: 'gjgoxq potzpeni'
+}
+}
+},
+/* item 329 */ {
+ AGRMPT: {
+  HtcbdE: "https:\/\/example.com\/AeL2LjqtLYL?v=969"
+},
+ 'pznzh': 0x5b633
+},
+/* item 330 */ {
+ 'kd': 531785,
+ 'mtbfnzim': 86766,
+ 'qingcoow': 489234,
+ 'fbksu': "https:\/\/example.com\/FJFYIvsWHYD?v=747"
+},
+/* item 331 */ {
+ EdKUhe: 0xe3f222,
+ 'siycsbqx': "https:\/\/example.com\/iT1fJKpWT2n?v=768",
+ Zbtwul: "https:\/\/example.com\/agCGjIepnwG?v=35",
+ XsUpXq: 379067,
+ 'pa': "fla il ju \u00e9\n"
+},
+/* item 332 */ {
+ 'hgmdthkr': 0x2aeac0,
+ xEDbuf: {
+  'vk': {
+   'crfpf': "acawcvhv avn jcvv \u00e9\n"
+},
+  'kopstuedo': 0x69d1b5,
+  'gxja': {
+   ZUTbSg: 'vkvwg rfovo mll opfjsg yrfi',
+   'pyskot': "https:\/\/example.com\/Ns5WDu5do-4?v=119",
+   'ni': 29425
+},
+  bPLCRF: 0x329e72,
+  'xwhziykie': 'iq rclvontw'
+},
+ 'dy': "https:\/\/example.com\/qOUrqM4Vcn0?v=299",
+ YTLvZm: 'feiln kz ch cchokqd phaxy msahiofqu',
+ rIEguN: "hnfd adoef tae \u00e9\n",
+ jMUCIC: 0xe97a48
+},
+/* item 333 */ {
+ iHqZMq: {
+  jotIcU: 0x646d50
+},
+ 'iecbq': 'aey alq crckarv sjjfrzgcx wiacog ekp',
+ ksLwMc: false
+},
+/* item 334 */ {
+ 'gyzlygg': "vgbdjdjq an ewzvyr \u00e9\n",
+ 'tgjmdx': "duu rj bzjcnwh \u00e9\n",
+ TfwmnZ: {
+  'gapb': 'ljnse',
+  'ex': 0x5b895c
+},
+ isOvWU: -927135,
+ 'im': "oeejc amjajyggn gtikj \u00e9\n",
+ Tffknq: {
+  'xpi': 0xf76580,
+  XpadFg: 0xc7b4b5,
+  ZsIwJN: 0x9fec23,
+  ENJqgn: {
+   xsiGHy: -648930
+}
+}
+},
+/* item 335 */ {
+ 'egueifpwu': {
+  jEVxet: ['nvr', "kiw tkngqsf rgrpvd \u00e9\n",],
+  'ptsoh': 39203,
+  xKHAsw: {
+   UaijxQ: 'hhybwcmu blfgnic naymn zmir',
+   qnlkNy: 0xa1efbb,
+   'kqa': true,
+   pwEZbm: "https:\/\/example.com\/AryosiFi4Bw?v=744",
+   kLWlpb: 723076
+},
+  'cufqkyx': [true, !0, false, -121550, "legqrr fhn wumusjfna \u00e9\n",],
+  vMdgSk: ["nmsuh wt gbvqdepml \u00e9\n", "https:\/\/example.com\/McIOeucL7DX?v=459", 'fjxcxwwke hmmuqt', 'xge idkefgrw',]
+},
+ IHuJBa: [,]
+},
+/* item 336 */ {
+ YBiqHb: {
+  ElOHnS: {
+   'balfw': 0x3d2354,
+   pxynDG: !0
+},
+  'yuqe': 0x955c10,
+  XQVvaK: 15982,
+  'wujj': {
+   JyaLDe: 'zsobolel tjvxcfuxq wynmb ch',
+   'nackuqzmn': 0x809f07,
+   'dr': 216656,
+   'ijnkkpbnp': false,
+   'hd': 0x2e6aef,
+   'mlzx': "https:\/\/example.com\/WbF33-IwuZH?v=53"
+},
+  uaiDdj: 0x2fb0d6,
+  'hmmjd': {
+   'kzmyqvw': 'jcsgh rp xwm qtavirdzw iskuz nvqtm',
+   'pdwhgyqf': "https:\/\/example.com\/gpXJ2pH61k3?v=331"
+}
+},
+ 'otenoxjh': 'srfkvm bs dfi pjhdggvjd',
+ BUqvNO: 'hszay bwylwaxpp dxtg',
+ DEVpOf: {
+  hgGDzf: "hc vnkovhm hx \u00e9\n",
+  MVpCdK: 0x2a3ad2,
+  NPmWfv: 0x117577,
+  'dwll': 'xqlugksa wn',
+  'xtvrubo': {
+   AokRSI: 0x8a3e8a,
+   awYATQ: "https:\/\/example.com\/esik15rXKhn?v=801",
+   UkNfuw: "https:\/\/example.com\/sgBSgHszkqe?v=840",
+   'mcyjkml': 186515
+},
+  yEofvo: 'elsjzrkrx yo'
+},
+ 'nmc': "https:\/\/example.com\/2ylswrMdgwC?v=206",
+ CyCDUO: -636130
+},
+/* item 337 */ {
+ 'pyx': false,
+ lMhmYu: 0xb0516b,
+ 'jnyfstjoa': "oucbj jdvdzdjd oyndn \u00e9\n"
+},
+/* item 338 */ {
+ 'xlwfvjb': 'ba wkvzoa cu',
+ 'vysbm': -966131,
+ duQEDQ: "https:\/\/example.com\/WHHe5Al7a0K?v=788",
+ 'kmmi': {
+  'inyzzc': false
+},
+ dVlYqI: [{
+   VLfzPI: -178958,
+   GdNOsZ: "ksu djaj laluvl \u00e9\n"
+}, "mqqdpf oppvydxa jr \u00e9\n", {
+   dzJzkV: 0x891d8c,
+   WnoFyY: 'taqkjo uwdztao',
+   'muqd': undefined,
+   'acdqkfnt': 282323
+},]
+},
+/* item 339 */ {
+ HjfYtz: 'mwmku iwn',
+ 'qgrgtwhrk': {
+  bwulHv: 0xd73448,
+  qtiykq: "ske pchtvosnp ac \u00e9\n",
+  OiMQha: [,],
+  OlvyVZ: [0xa9fbf8, 0x566a07,],
+  'dcvjie': {
+   'pbnzh': 0x3161e9,
+   ecRqNA: 0x426d99
+}
+},
+ lifRwZ: ["https:\/\/example.com\/BAKjeccjwPf?v=42", {
+   'qswcntlc': "https:\/\/example.com\/Mf8U9gVaWA8?v=958",
+   'hxtizzwuf': 0xfea964,
+   NOUKDR: 0x16a3e4,
+   NPvXcX: 0xae2ad1
+}, [699000, 285752, 0xd94379, 'kkspvh jin ujbnxpnja',], [591218, true,], {
+   'ujgrqmm': true,
+   'puhqsb': 'nnv bhws clyb dd gjwxxi acpkxtzq'
+},]
+},
+/* item 340 */ {
+ 'vxenxi': 'enppcw',
+ PVXavR: {
+  'iooxucueg': "https:\/\/example.com\/psgfII9azPN?v=100"
+},
+ YKNujv: 357911,
+ 'kir': {
+  'uanme': undefined,
+  yZOGlk: "https:\/\/example.com\/ebGXY167BS9?v=585"
+},
+ JIQqVV: [,]
+},
+/* item 341 */ {
+ 'qpgsl': 0xc299f9,
+ zAsKZw: -413760,
+ NfCXdK: true,
+ xNfCfL: -264893,
+ 'vtqjsiv': 'vtdxgeszi rqomfkd'
+},
+/* item 342 */ {
+ 'oi': 0xb54a44,
+ 'kttmjxyy': 0xa668a5,
+ 'zt': "https:\/\/example.com\/VQExrYCvw4l?v=265"
+},
+/* item 343 */ {
+ usxPLC: 0x30ef59,
+ 'olq': undefined,
+ JDHIyo: [,]
+},
+/* item 344 */ {
+ FbjoCz: 'faomrysn zgzea nlbupewjc',
+ 'iskrq': {
+  EWnGAV: "https:\/\/example.com\/IXW7yBIPOCh?v=181",
+  'wjrfpegi': {
+   'xripwv': "nmztv ujjcsagjt nbjgd \u00e9\n"
+}
+},
+ EUdgSV: "fcdmqhrx sdclowci nst \u00e9\n",
+ 'htawqe': 'xoeto ttupdlm cvxmjis mo hjsoeyatt kedvwu',
+ 'oawea': undefined,
+ 'xamprz': 0xe6112a
+},
+/* item 345 */ {
+ RcXZQc: [-71829, undefined, 'qoaej', 0x1001ee, {
+   klkgda: 'mtcs'
+},],
+ 'dnnzjbjc': "ahjvlnw vhxupddqg dniswwz \u00e9\n",
+ 'npge': 717034,
+ hpfPJV: null,
+ 'nhxli': 0x5ebb1d,
+ xlnCvj: {
+  'keiw': -141175,
+  dNYDVf: {
+   rjesJq: "rkfdd wnewksk fswhql \u00e9\n",
+   wtimLU: 0x22a4f,
+   'lczaxjpa': "https:\/\/example.com\/t8GCzF85qHJ?v=822",
+   'gvlju': "gpbccx va gwwcful \u00e9\n"
+},
+  SakUnp: {
+   'ijl': "dhnnanm syvuvh itdqhknr \u00e9\n",
+   'hmbzh': -138762,
+   'xdacwq': 0xe35ec5,
+   IsEsba: 329269,
+   ZWeCtc: 0xce8557
+},
+  'ikud': [-353744, -756936, "cxy jdfjssahi wreigzvhe \u00e9\n",]
+}
+},
+/* item 346 */ {
+ aensDY: 'etcwpxuj jy kfv dampiywcm byidkz plagxrkj'
+},
+/* item 347 */ {
+ 'sfv': {
+  WJqStg: 'zwoeigouw vqey pf ffs zixdognn',
+  'rhapr': {
+   auRoII: 716442,
+   pfuGpl: 'agmj wqt ef',
+   'jbwc': 'zgogz',
+   'qcuqbwb': 'iiudzh styysnpa lbpzxv htavs zk',
+   YjcJEk: 'bwgbjyfy nxtcfqxk'
+},
+  pIuxWV: 0x6c2286,
+  'fqrvfzn': 'sjxpvegt wnuou',
+  'ysdpyvo': "https:\/\/example.com\/7Yx9zWfwh-E?v=612",
+  'gxx': "opty ppeplmfj wxzk \u00e9\n"
+}
+},
+/* item 348 */ {
+ 'kfoxjczwe': 0x4ada02,
+ gGaLAF: "va pzg zw \u00e9\n",
+ 'kvu': "https:\/\/example.com\/KH0yZvHfHi_?v=491",
+ 'ysu': 'srzhcnm iyojvun lucgot'
+},
+/* item 349 */ {
+ 'vfzbhgurf': "https:\/\/example.com\/t6DuQmqBNo7?v=440",
+ 'mukxavad': "https:\/\/example.com\/WLLKntdohUZ?v=336",
+ 'slzovcft': [0x78ac3a, {
+   EpCxXI: true,
+   qDocYb: -279153,
+   VOCwBd: "https:\/\/example.com\/9C8WBZp84zm?v=150"
+}, -345130, -473909,],
+ 'zxcgonxih': {
+  'xbxuuxnoy': 'em wjle kdauvpop rk yotrcd',
+  oHkxLG: 0x32e412,
+  GkQjNS: undefined,
+  CmhpRY: "https:\/\/example.com\/TtbM1U09DBJ?v=613",
+  khxVUQ: "rpwtbxty segeah uiw \u00e9\n",
+  'ixro': 'ih ktrgz xahfrb fefevc eadgi'
+},
+ 'eqwsfphq': 'kwsbrisba',
+ OadpFX: "euymfjk bzqleqdg awljaad \u00e9\n"
+},
+/* item 350 */ {
+ ggdoTZ: [-829626, -57333, {
+   iVyyWQ: "rwp pkyp wamn \u00e9\n",
+   'bde': "xbacanbvf uhzcnoz odewtpa \u00e9\n",
+   'rkqcw': 'ghzrikvud'
+},]
+},
+/* item 351 */ {
+ 'bipjcnz': {
+  'kkfig': "wlnju ea vdp \u00e9\n",
+  'ayispd': {
+   'hgdcfeum': "https:\/\/example.com\/flnYnQ_OGVq?v=500",
+   rSDPxj: !1,
+   LsUBVm: true,
+   HfefPr: true
+}
+}
+},
+/* item 352 */ {
+ 'xayrk': -441033,
+ 'nczm': {
+  'bfjv': {
+   'suxirvp': !0,
+   'ujtgoxkvc': "https:\/\/example.com\/WdGxUHzqGle?v=935",
+   'otcde': -234472,
+   BChyGy: 'qdfnxa'
+},
+  Jmfloi: 0x947b57,
+  'wljjtqck': 'pebdad rkjuuabd mpqwrckz'
+},
+ 'yhbfab': ["https:\/\/example.com\/qqLtzFvX3Tk?v=107", 'lwboq zijmsr urisqzi ovcz ncqw', {
+   'wzcejuf': 0x3bf21a
+},],
+ 'fufagr': 123981,
+ 'minwrj': {
+  lAgPSc: 997573
+}
+},
+/* item 353 */ {
+ 'edqwcn': {
+  XsCRGs: {
+   'pagkyiqju': !1
+},
+  'rkapau': {
+   eVGLMP: 0x3ff854,
+   GzUwIi: null
+},
+  NPxZRJ: 0xfc1f0c,
+  'glmmicrzy': {
+   yIMnUe: 0x9ee1a
+},
+  'zsquvndc': 693756,
+  KTRPUf: -30067
+},
+ 'dtuabi': {
+  'sodlqp': true,
+  'rjfasnijg': true,
+  'vxqzednug': 'juk bwzcju xz aushiisjf yt hujtcxmx',
+  XPiAqa: 'bnpfvbumq pxfin ewvrvn mctubadf',
+  NPBxCJ: ['ymzz sxuwkfhh zqpqkslfe qviltplr', "https:\/\/example.com\/62GX_C7uCC_?v=333", "yfimpkos lloowfrg fdfnd \u00e9\n",],
+  'awn': {
+   'yvnikxyv': 867776,
+   DXXxRk: -886299,
+   'wjpidulrl': 249563,
+   WBuivY: -740270,
+   'ecqcmf': "ghqf plkjy hjal \u00e9\n",
+   'zktjoc': !1
+}
+},
+ jDVhEM: {
+  QoIOYY: 0x5be352,
+  qyyxvP: false
+}
+},
+/* item 354 */ {
+ 'grdmrtthb': "https:\/\/example.com\/fO8rilrha8e?v=979",
+ 'ftqgykk': 0xeedce,
+ RPRMNI: [-840339, 'ceix sjkmg',],
+ YsFPYG: "https:\/\/example.com\/RU7LcYLnMz7?v=746",
+ KubsqG: "tadvrupyi kftlgshw coxivlt \u00e9\n",
+ 'bsjmyag': true
+},
+/* item 355 */ {
+ 'qawwpzj': 0x248d18,
+ HhoJtB: 'tssmzw bopsur',
+ weOtDX: {
+  QqfeLp: "gjcey qdsr hu \u00e9\n"
+},
+ 'jxsmycpwa': 'zy rpcnd ofidozs',
+ QVJbOI: "wqjw tw youycfrua \u00e9\n",
+ 'hi': "ky fgjwh hdfua \u00e9\n"
+},
+/* item 356 */ {
+ 'pfektp': !0,
+ eAdWnq: 0xa06779,
+ 'sapgxaqh': true,
+ JXXqGK: -50585,
+ OZdzfR: {
+  'ecxbamw': undefined
+}
+},
+/* item 357 */ {
+ pUymNf: [0x99541, ['paoeukit dhjfisd ylafihf dzaxq onj', "https:\/\/example.com\/L7-IAQIIo2v?v=687", "ury tiplm mwj \u00e9\n", 659798,], {
+   'jeq': "https:\/\/example.com\/W-Xj-em-1YE?v=399",
+   cUobaR: 350692,
+   'pj': 'raflbb rr ybaylahd lcrj tt jkfcbfsh'
+},],
+ zCAzjE: "https:\/\/example.com\/YZpniTHMgrt?v=798"
+},
+/* item 358 */ {
+ oYzwUp: {
+  NUnCnF: !1,
+  'pmc': [,],
+  NyouUG: {
+   ZASqeK: undefined
+}
+},
+ 'flayqtg': "https:\/\/example.com\/NJLSPstQQHv?v=364",
+ wCRYPY: ['yrwyi twrutk dheraui lrdgbhvn bds cmps',],
+ 'kuqediut': 914581,
+ YTfqNo: 0x5a05d7
+},
+/* item 359 */ {
+ 'wf': 0xa9803f,
+ oljlPm: -257718,
+ 'gupnxo': "https:\/\/example.com\/DtHUclZwzkD?v=227",
+ 'msramf': null,
+ 'drlvvoiwg': 0x21eb9d
+},
+/* item 360 */ {
+ 'pgorl': "https:\/\/example.com\/1uXU8tzL5ki?v=410",
+ VZRJJF: "https:\/\/example.com\/x7G90SGUt8i?v=386"
+},
+/* item 361 */ {
+ fxGvrE: ['kxrec jz', 0x724e27, ['thlsjpt bpnkxbb', "https:\/\/example.com\/fcxsfMDvIpF?v=213", 0xe8b39b,], "ckb rjypgmdu iittpvpg \u00e9\n", {
+   'cbfqtty': "iyplti kvxneh vauin \u00e9\n"
+},],
+ 'olz': {
+  'wgp': 'oakkcoqz zwmbj',
+  fSvmUf: 'qtywl rzetyes hsgzueeru czvf rmksqkrq rlvvrvii'
+}
+},
+/* item 362 */ {
+ ViJSZF: -283534
+},
+/* item 363 */ {
+ WoexgB: "https:\/\/example.com\/32lmbSXpykz?v=557",
+ KqDfnN: {
+  JhRTOy: 597124,
+  zyqGbC: "https:\/\/example.com\/Es4tlHDY7w4?v=407",
+  nwhegz: "mpqjenaa yqxcltqzr lhpwish \u00e9\n",
+  'fxc': 're'
+},
+ 'tgcee': {
+  'xzx': 662582,
+  qdmZGY: ["https:\/\/example.com\/2b4ah9HMCmf?v=331", 'ybmyexj ondbdesl', 'nwzm',],
+  'jsgw': 0x978c87
+},
+ 'rfquiz': {
+  yoynBR: {
+   iIUQMM: "qdhpbsbcg fus qxszapaod \u00e9\n"
+},
+  'ksbhgki': 'lhz yvhlm nyxtnw djvwzo oxhlyrtlt',
+  'teewgvp': {
+   XaYbYU: 395820
+},
+  'rdiy': {
+   'vnqhtjlag': 'sc qnyp pcy tsrbyuxq uthgzvaa',
+   'lqxc': 'ehm yzpwp ctbt',
+   'pgzyuriq': !1,
+   'dgsl': 'jo zujgrc viukpvj xf',
+   CGTaNC: 'offlumqw rr xbrkhpje zi',
+   'uclipgin': "https:\/\/example.com\/84dfqzAJKaV?v=912"
+},
+  'zcoinct': {
+   'smzjzltec': "https:\/\/example.com\/grv90r5u_pt?v=124",
+   TWCmph: 'rylzjcwda qnbqnmle gwkwau xoitnlf mxpulbc egpg',
+   'vs': 'qwxzdjvqh uojoks srsf yu jkfl gjyzs',
+   'psl': 'kulqp ai lznbxgw',
+   'eqqr': 0xf63396,
+   nTNbbs: 0x532b10
+},
+  nBylnl: 524990
+},
+ 'ydexvxkzz': {
+  'xxnmvtgf': false,
+  kbYAgM: {
+   'vckdg': "https:\/\/example.com\/E1NXkdWh0J9?v=423",
+   GkndCg: 754710,
+   plWCqP: 0x970eaa,
+   'ik': "osskidiq wkqv chzpa \u00e9\n",
+   'muhlju': 0xe9ce8c,
+   'fcddx': 'wwpghoyiv cqlbvlyk dxn'
+},
+  'xpsceocbd': {
+   lYntfS: undefined,
+   AuIcTp: 0xb84f3,
+   wQoOUQ: 0x660c75,
+   uYefkS: !0,
+   DQvpyb: 'myyw',
+   'vrmgvrf': -222784
+},
+  sbRwdl: 0x56402
+},
+ 'picafj': null
+},
+/* item 364 */ {
+ QAWKDN: 'sv',
+ TnitKT: {
+  'dbpclow': ["https:\/\/example.com\/58O8j_bqIPJ?v=966", 0xf5ac6f, "https:\/\/example.com\/8rr1CHszqiv?v=809", 0xdde02,]
+}
+},
+/* item 365 */ {
+ IhZNtJ: [752318,],
+ VYJqtj: 'svfod euovcf tlbt zobneivl vgoqj axky'
+},
+/* item 366 */ {
+ gNvtUe: {
+  GScfXX: "https:\/\/example.com\/Ox0HtILaGTR?v=936",
+  UmuEcZ: 'jxues apkjn ebhmnhv ldwlsvan qwnxlfhnu bqdtt',
+  'infgmavnz': "https:\/\/example.com\/tHDUqOjKPkH?v=371",
+  'so': 937792
+},
+ 'iebq': "https:\/\/example.com\/GumH4C3Qz6p?v=817"
+},
+/* item 367 */ {
+ qgJIDR: "cahhso ljd sipcbgvoq \u00e9\n",
+ 'isunbi': "https:\/\/example.com\/XtukWTqeMPg?v=544",
+ 'gu': 0xc008e0,
+ trXugx: 976122
+},
+/* item 368 */ {
+ oxChzt: [,],
+ 'bb': 968887,
+ aSLRkC: undefined,
+ UmhUcl: "shzdw ow rbtyvgdvn \u00e9\n",
+ vAUYiL: 661975,
+ 'czcgtq': 0x44bd81
+},
+/* item 369 */ {
+ EsPqvT: "https:\/\/example.com\/F8zzocg1_7-?v=6"
+},
+/* item 370 */ {
+ 'cogcnly': 'ety',
+ 'zm': [{
+   yqZERg: "https:\/\/example.com\/h3Wsq1vm5Th?v=212",
+   'quyo': 'cnlhts gm',
+   'lhy': 873943,
+   gISDeE: -127428
+}, {
+   XVsaTb: 0xa6480f,
+   'asqig': 266424,
+   'ot': 0xdd38fe,
+   zxQuZF: "ehgerizb bowsuywg bsuj \u00e9\n",
+   'ncatbf': !1,
+   CvVVIp: 'himysjtb difuy tdy onecqtm xkxuj'
+}, ['krug qpga eypxidx tnjxfbrkz',],],
+ 'vmwkb': {
+  'jnhk': "https:\/\/example.com\/PyxMpeHkYZ1?v=469",
+  eYZSNv: {
+   ORiDkS: "ndmyfsar fphm xezemekb \u00e9\n",
+   'xrpumyk': "https:\/\/example.com\/P4Xb5Q3MKXh?v=900"
+},
+  'zeezinbo': {
+   'cnnywitn': "rapvrdnxx odu ds \u00e9\n",
+   pcUHfO: "https:\/\/example.com\/pp5lijL0q4t?v=485",
+   'ijszjzrk': 18689,
+   'rwmscwg': 587800,
+   'ndjyarj': -350905,
+   AoiQYU: 'adsiphhwi ytexaua yfrzz'
+}
+},
+ WEthyf: 'rgazius xivjtswxv hnmput'
+},
+/* item 371 */ {
+ 'ouosmfslm': "bqdmdt qbqhrf hu \u00e9\n",
+ 'nmiwu': ["hndn outfwtdvv koqywzd \u00e9\n",],
+ 'aqrsrzmlf': 976263,
+ 'htcmd': 0xced8b4,
+ uGDRXJ: !0,
+ 'ngvjgc': {
+  rqWbUO: !1,
+  DGZafw: {
+   xVHUoa: "https:\/\/example.com\/tuzjgOeotJt?v=220",
+   'urcufdwx': -601837,
+   'xiwbfyzq': false,
+   xLOrEh: "https:\/\/example.com\/APwvIl6MUJL?v=391"
+},
+  'ism': [,],
+  'xfatxew': 0x18f05d,
+  kyyuHc: "https:\/\/example.com\/AuRNCZNDtbA?v=810",
+  'tmeftqmme': 'vswjspzsg zzvpblm bwr'
+}
+},
+/* item 372 */ {
+ 'dbdvwa': [[639960,], 0x7f868a, 'rllsg xedsa jran jl bg edfbu', {
+   'sbdmeihu': "lrdhhx cbvlyws ihj \u00e9\n",
+   jwIIFf: "https:\/\/example.com\/PQVqxeUrH1K?v=786",
+   'qbwdjszw': 0xce2e5c,
+   'sjrqfh': 287411,
+   'ozfuhleno': "https:\/\/example.com\/R1-yVDOyoph?v=593"
+}, 0xfe01fc,],
+ PJAJFa: [79038, 0x67afa6, null, "uo gkbvl vkhio \u00e9\n",],
+ bUELiL: [,],
+ 'jryqgqm': "https:\/\/example.com\/yOYqnMmdoIm?v=70",
+ 'dlpgghk': "ck lmts zhigvcgj \u00e9\n",
+ XIsCqW: 0xbd2133
+},
+/* item 373 */ {
+ 'wze': {
+  hvIbaW: 422153
+},
+ zOiKON: 392060
+},
+/* item 374 */ {
+ 'qprnjx': -558634,
+ mCFvnQ: 'mh dxrztznu sqcnlplm uxo',
+ GUTUNg: 'ko rvswrhzo ypghqdxu rmpukipbv izhblntt',
+ FSInpw: "https:\/\/example.com\/GLdoFSZRhF3?v=783",
+ intQaJ: {
+  TNFDoe: false,
+  'ifub': "https:\/\/example.com\/3sCha3mB3kl?v=990",
+  roMHOM: [,],
+  kxfUws: {
+   'hwjzmvi': "https:\/\/example.com\/XP1x1uumd2C?v=295",
+   'wg': "hzqnm tmnmsk uyv \u00e9\n"
+}
+}
+},
+/* item 375 */ {
+ VMFNLN: 0xb14835,
+ 'zxmgd': -648262,
+ xxvQPY: !1,
+ koAMfM: !1
+},
+/* item 376 */ {
+ nrnTho: 0xa8b989,
+ dkmWso: 0xa87682,
+ ygnNQS: {
+  PwhPwG: !0,
+  HznRJg: {
+   jzjsKO: 844848,
+   ZoiMlt: 'kicg xcfchg',
+   KboRlO: "https:\/\/example.com\/INFDjcF3pG4?v=798"
+},
+  AdrfbN: 0xbf8734
+},
+ 'cwzv': {
+  'ip': "dhfazawkr wb kyzn \u00e9\n"
+}
+},
+/* item 377 */ {
+ 'awlkujs': 625874,
+ 'bdjuzulir': 186645,
+ 'sus': !0
+},
+/* item 378 */ {
+ EkaxJY: "https:\/\/example.com\/-9oAJOZWkEg?v=999",
+ rESDSs: "https:\/\/example.com\/l49PYwtjLEN?v=155",
+ 'zqkm': {
+  OnrwJI: !0,
+  CgtVpW: 'fqwsh',
+  nPIkMk: !1,
+  'jrdjhvbdu': "oeui meijxth tieejmq \u00e9\n",
+  nQyrgW: "https:\/\/example.com\/0jJUqeBmmeP?v=150",
+  'vuxjyriw': 'vcsk glzg uz znijub vni'
+}
+},
+/* item 379 */ {
+ dbcFRV: ["xxfko nilgm pcdkfcrry \u00e9\n", 'gojgg cvunrbgsq bgaecotq biexh ees', true, {
+   dBgYha: "https:\/\/example.com\/DpFASE8CPlS?v=975",
+   vIBGDa: "https:\/\/example.com\/VUtfM2d1DJM?v=668",
+   'feziec': "xwejiyz puvh te \u00e9\n"
+}, !1,],
+ jjVPrv: 'dvtjeh ix',
+ eMrvPT: "https:\/\/example.com\/69KpflMP6UX?v=61",
+ akIwlU: 'rsachdy otves dziqrpbw saead fo',
+ 'ghgsawwf': "https:\/\/example.com\/eMl4Y2i7Yen?v=28",
+ tncOkR: {
+  lLGbmj: null,
+  wODBfH: {
+   shvzYk: "https:\/\/example.com\/1ERvXwRQgRM?v=79",
+   'xxgx': 'sivljzun zqiywlf scpylkxrd',
+   'img': "nkeph dboogv ykdz \u00e9\n",
+   'srllrots': "py grecd gdoce \u00e9\n",
+   HEMFYQ: 'gfmsqyl kkbhghaem jazrtyopl fflxfa bzs',
+   'kqa': "bfkm leenn vmpd \u00e9\n"
+},
+  JihItL: 0x485ccd,
+  HgCLkQ: [167832, "https:\/\/example.com\/m0_irupsEyE?v=735", "hqscrmy mycgwodn qoyuxidf \u00e9\n",],
+  'ndsb': !1
+}
+},
+/* item 380 */ {
+ 'loadnpbx': !0,
+ 'zbhroxg': null,
+ 'ie': {
+  'iegfhfhv': "axu kdwiazd ul \u00e9\n",
+  'coppq': 874962,
+  jCotfb: 'etrtgzffu ozmg mm rlldqqb eehrydej vlegajw'
+},
+ Ohqekk: 17836
+},
+/* item 381 */ {
+ 'hsworrl': true,
+ 'eyns': false,
+ AHbfZS: {
+  'hjo': 'rl lek',
+  czChJx: -363935,
+  'nihztsp': 0x21339b,
+  'aaugt': {
+   'gyvmtrs': -774727,
+   'cg': -778558,
+   gHPsgW: 0xaa31e3,
+   'defa': undefined,
+   'mia': "https:\/\/example.com\/E7fsUDg17wZ?v=259",
+   'hiupayqx': null
+},
+  'ub': 0x97ea62,
+  LfVUvy: 589335
+}
+},
+/* item 382 */ {
+ 'snfzmxs': {
+  'fb': "hvjk vzklbvi awvtoclv \u00e9\n",
+  'qsrrg': undefined,
+  'hkcz': -819843,
+  cpLhAb: {
+   UdATFV: "chi sruhi oplsru \u00e9\n"
+},
+  'by': "bcrqo fguzushcq ewwq \u00e9\n",
+  'ebjiizt': {
+   GyLDNf: "qgtslebsw hgm qdb \u00e9\n",
+   'uvwq': 885089,
+   AmcEuH: !0,
+   'qcxbg': -21218,
+   JTzMfV: "https:\/\/example.com\/uNQ8YnWx37L?v=367",
+   'vveqp': 0x8d94c7
+}
+},
+ 'scuksucmt': 0x7d1329,
+ WqUZaQ: "https:\/\/example.com\/ERxKtsQ7lFS?v=426",
+ 'ws': 'ojcjb'
+},
+/* item 383 */ {
+ 'vdmxm': "rkgmx bjics ui \u00e9\n",
+ cWPXPL: {
+  ZLAiJm: {
+   FguvIW: 'iefnyeo awyitng hap',
+   'mgdlqoe': 0x6bd069,
+   'hedizfi': 0x9ce8f5,
+   lXOVfs: true,
+   'xdsiip': undefined,
+   TKzLlF: false
+},
+  nNOGnp: ['rzuklbv ixtmtfhm iiqld ifsxodokk', 'bmig tbajmp oywtva skb hg me', -230620,],
+  EdiIrV: {
+   'iisztods': 'pwzhuvuq ura titbsn cpgcd',
+   hDwqSZ: 'vqkra nwnpkgbr ibjtq fiykgg puzanagb jojmud',
+   NFTkcX: "hebn ldsnf lahbcql \u00e9\n",
+   pPzcGl: "https:\/\/example.com\/FRD9J7txYPy?v=984",
+   cmPvSz: 15289
+}
+},
+ fCzpjD: "salm dudn qtpathf \u00e9\n"
+},
+/* item 384 */ {
+ LyKNcD: {
+  dvhdiS: undefined,
+  tqraCN: [16114, false, !0, "https:\/\/example.com\/PVGXskyur2U?v=968", 0x1736a2,],
+  mwKnDB: 'gmctdlvn erocghiq adgignxwq el',
+  'xbeaubbd': false,
+  HdiMZV: -124004
+},
+ 'tmrievj': [0xbaa0b, 340245, 'rwyjh gyeowhctb cficcllkj rfjjvs', "mxmi pbb ubk \u00e9\n", 'ytol xexwo evvn wkwrhcm acz okqkimqb',],
+ 'nk': ["elfshdvut xjivwzgyc qk \u00e9\n", 485967, 538959,],
+ 'rxtck': {
+  pqmMLJ: "https:\/\/example.com\/NYXySsy0vAy?v=914",
+  mMhppm: 0xba546f,
+  sItHVw: ["https:\/\/example.com\/eSPyoAdfLk4?v=997", "ozlzy lws stepso \u00e9\n", "ifiwb lficse iy \u00e9\n", undefined, -702752,],
+  OupDiC: "tx xuxyddc tewchoyuz \u00e9\n",
+  'hzdcaptum': "kf zyy cykn \u00e9\n",
+  KLUknH: [,]
+},
+ HuiBwr: "otw tttret zidj \u00e9\n"
+},
+/* item 385 */ {
+ 'clkgm': [,]
+},
+/* item 386 */ {
+ 'rzeavfqg': 0x96e46,
+ UcqrKh: {
+  'vvglkkmk': {
+   'atjjorio': 'anfwlz wlikao',
+   snDbbD: "https:\/\/example.com\/hM40HvZXm0s?v=995"
+},
+  teysaY: [649768, 'myj lkire ezbos oi gknr ffbjvcj', "jt kkun xaswmlnzc \u00e9\n", "https:\/\/example.com\/WmHSWIuU4t0?v=333", -327566,],
+  'pjlihjwp': {
+   'rqmbrn': 0x269d42,
+   'lgtxf': -531903,
+   FHvAfB: 'xhobhemqk'
+}
+},
+ 'cbo': "https:\/\/example.com\/d_2Qlh_nq52?v=570",
+ wUKogX: {
+  'hz': null,
+  SVoQJL: "dvvsfk tudm ayiemkuo \u00e9\n",
+  hROsFx: {
+   FewiKt: "https:\/\/example.com\/-AUjcmmwu_O?v=763",
+   VWkBKq: !1,
+   KZrXkq: -87761,
+   YlyUET: "perzdme nvlqgj qt \u00e9\n",
+   OUCPRG: "https:\/\/example.com\/D5g0qUV5pxv?v=278",
+   ElydjO: "https:\/\/example.com\/W8gJkg_RVkN?v=954"
+}
+}
+},
+/* item 387 */ {
+ 'itjzc': 'ui vmesjjsu'
+},
+/* item 388 */ {
+ GwOCxp: 0xa6bfb1,
+ 'ko': {
+  eDQlHi: {
+   'bqw': -502423,
+   'bpqmidxg': 86386,
+   jiOwiT: 'hj wyhshk'
+},
+  ilioiq: {
+   'rrupebib': 560417,
+   MjvzuH: true
+},
+  'gxyhk': ["fbscy rfa od \u00e9\n", "wglb jeasygnpt lbmkt \u00e9\n", 0x1e3084,],
+  zPVeYW: ["https:\/\/example.com\/ImDZjy7h63B?v=419",],
+  'lwrlw': [!0, 0x47bbcd, 'vtwkpfvp pqqxr',]
+},
+ 'ivbv': 656290
+},
+/* item 389 */ {
+ 'dbeb': 0xaaba6,
+ 'bjgym': 0x82aa93,
+ izpIPN: "https:\/\/example.com\/jsGMezbGqZC?v=820"
+},
+/* item 390 */ {
+ DFXScL: undefined
+},
+/* item 391 */ {
+ 'si': "https:\/\/example.com\/0MGU-SitFqw?v=588",
+ 'kpf': 'kpl dnzrd ngeule jqpqwi',
+ 'syeeaza': 0xe86218
+},
+/* item 392 */ {
+ 'fgaxwjlqr': [{
+   'taif': true,
+   lJomaz: 0x13f494,
+   'atccfdqs': "https:\/\/example.com\/WdwmgDDAhVu?v=247",
+   'tw': undefined
+}, !0, {
+   'owwph': "cmu sdoewhm cs \u00e9\n",
+   CIgdhX: null,
+   RKhGyq: 'utmsydy objgbf ubsjz',
+   CyKVmo: "https:\/\/example.com\/9Mf8fsms021?v=320"
+},],
+ naetcN: "https:\/\/example.com\/H6S1rrIKU0s?v=895"
+},
+/* item 393 */ {
+ agpYfp: "https:\/\/example.com\/sE3d1LpAZey?v=393",
+ 'fnsaaadr': {
+  'zdbuo': 0xbd9d0b,
+  WRdgVr: 0xb70aba,
+  'ax': 0x114b08,
+  ohskCQ: null
+},
+ 'qyezbt': "https:\/\/example.com\/5qX3WKYpOCg?v=319"
+},
+/* item 394 */ {
+ 'gymhkhm': "ibithrypb whmdnwbx trzb \u00e9\n",
+ IGilqC: "https:\/\/example.com\/dS7gy6ygDl1?v=721",
+ 'dpch': null,
+ 'zcmjwwycx': !0,
+ CyUMFv: "https:\/\/example.com\/T82sPnSMlxg?v=796",
+ DbpdxP: {
+  'ap': null,
+  GvoMnN: 'yttzt xmlnnf',
+  nqQQTh: "tavopkkx rgt gecsyff \u00e9\n",
+  VSPaOA: 'ypzk jyovkvs rm bu hrcuoju mhzpmdoll',
+  'usrahxqu': "https:\/\/example.com\/xwPJA2mnSGG?v=448",
+  pQMPYf: {
+   'lwxkgyzq': 823591,
+   'pqalrrivv': "tgk ewenbq wrbxlaz \u00e9\n",
+   tYdBhH: "gmj wpz sqdaah \u00e9\n",
+   KCVXSD: false
+}
+}
+},
+/* item 395 */ {
+ cjnIhc: 'gxvcintfx nptmbsrrm',
+ 'zeutspv': "rmlgchlge sxdpaqsga wvgzyd \u00e9\n",
+ jhgPpN: {
+  NzlMRV: {
+   'gxeczayje': "https:\/\/example.com\/0dnq-kJmXwW?v=123",
+   'rgrfoe': 0xef6403,
+   'rsvijhsu': 0x912f9b,
+   'pbyxrihin': "https:\/\/example.com\/B5HN_zqz_bI?v=912"
+},
+  'sy': "https:\/\/example.com\/QcnlsW8H5sw?v=52",
+  'qvcnavut': 'rg gazjtbaq nvsanfe grsdbjx pldshter kd',
+  'fdtqkooi': 0x95028
+},
+ rMllGP: [{
+   VgCSSS: true,
+   DlnOyf: 0xb85a96,
+   'jfz': 0x8bd71d
+}, {
+   'iervxms': "https:\/\/example.com\/_qcwZhuixJK?v=831",
+   bmJTPS: !0,
+   vcJYkL: 0xed6ec8,
+   'ir': "https:\/\/example.com\/wX7bBksV3-D?v=696"
+}, false,],
+ IRofet: 0x295b08
+},
+/* item 396 */ {
+ HwUyDT: 0xf1f56,
+ vKTFzv: 'mtgeuk pfcrrvxgl lg xnkgdd xouwtjkg wnndgqc',
+ ZqcZmK: 47976,
+ 'jewdafgq': {
+  'xo': {
+   QJOtqh: "https:\/\/example.com\/GrnvOvvISsF?v=760"
+}
+}
+},
+/* item 397 */ {
+ nmDcuW: -514252,
+ 'gsrso': "wkmuqgbp qiwqnwv kwn \u00e9\n",
+ 'dwzf': {
+  'xzx': 0x23f580,
+  QpFIGR: 0x366a5a
+},
+ HLdJYE: "jlkglvad xffb hpqefltl \u00e9\n",
+ mqfTFQ: null,
+ 'apxbo': "xphlzjcn ntzrsprui tpdjtl \u00e9\n"
+},
+/* item 398 */ {
+ khtddS: -324093,
+ qbZlOy: "pcfodjpi mysoo hzsh \u00e9\n",
+ 'vojpkedj': -939389
+},
+/* item 399 */ {
+ 'eefkmkh': "https:\/\/example.com\/8BMYda8_0SY?v=276",
+ 'ek': -463859,
+ GfKwFi: {
+  'azkzsyv': 'dbvnzra qneyccxd yrwfilc dzghk',
+  'zckyrdtz': {
+   vITLgX: "tpkyydla kvfosha gzphgdjj \u00e9\n",
+   'zq': "https:\/\/example.com\/8JaPb-5xyHB?v=603",
+   LyGqfw: "omcf ccxdswnv aetaquve \u00e9\n"
+},
+  oGcvTD: -993915
+},
+ 'bg': 875347
+},
+/* item 400 */ {
+ YlVecy: 0x1d60b2,
+ NegOng: 224113,
+ ucKRZM: 0xfc15b9,
+ bAYzmS: {
+  'cunmt': "https:\/\/example.com\/PojL9AN2uHa?v=951",
+  sOpUnk: [undefined, true,],
+  'tdu': "https:\/\/example.com\/xgbpTdb1d52?v=804",
+  'tspxlip': [0x6e32a7, "esvn pmgqqedvb cevs \u00e9\n", 'jketo pkvhfjih', -262557,],
+  'ewqwi': 838616
+},
+ 'zburucp': 'espaxnb ajz'
+},
+/* item 401 */ {
+ 'odtnxf': {
+  'wynv': !0,
+  'yk': "https:\/\/example.com\/MGpLs6bL_t9?v=846"
+},
+ OxZsJd: {
+  'mnk': [,]
+},
+ FvhCDt: 0x2f309d,
+ mRztwJ: ["https:\/\/example.com\/kFZRujfxvEy?v=463",],
+ kGKzjo: null
+},
+/* item 402 */ {
+ TboyHS: 'yuqen xdjruckly xzjdmeis mkpiqfzu wscnn sufbsu',
+ 'wqfog': "vwsdcb oncnpva crtgjk \u00e9\n",
+ 'zaugberr': 723464,
+ 'rb': {
+  hoySkI: 0x162e4c,
+  'wshd': {
+   aJtDKH: "zrmfqt fcvuvlhzq rtzg \u00e9\n",
+   PcNpmO: 'qscqy guhnzmzs lezxcyncd'
+}
+}
+},
+/* item 403 */ {
+ CQWlvQ: 'wtdplj'
+},
+/* item 404 */ {
+ MoOgeq: [,],
+ 'ffd': "ahmat gkl djqaqlz \u00e9\n"
+},
+/* item 405 */ {
+ RCgPUg: 'kqqbm ukjbeldi cmwexu nd cffv',
+ 'egajrufd': null,
+ 'gwv': "kfuesm dkdt eoov \u00e9\n"
+},
+/* item 406 */ {
+ 'aijlsupo': [undefined, {
+   'uaau': "qnwbonxxt ekf nicqsqelv \u00e9\n",
+   'usu': 'dzxrlvhk locouqt bc'
+},],
+ 'bogko': 'pyxsj hkcb iuzn gyic ensk jvgdylwt',
+ 'bxzpacrlo': {
+  'kwihu': 265240,
+  'efkqs': 'nhdx vqxc',
+  'nywz': "ftrlvp rybou gvivmuno \u00e9\n"
+},
+ 'wodqjctn': {
+  'fuz': {
+   YADuTO: 'gtehyroa vzhuz nsfg',
+   'bh': 0x1033ea
+}
+},
+ 'dugz': 0x81268e
+},
+/* item 407 */ {
+ JMbpQe: 0x80561,
+ 'zprif': "https:\/\/example.com\/5DwMGbc-srT?v=833",
+ qeHREu: 'ng hkm',
+ 'macqbkuje': "https:\/\/example.com\/GA9TB13o75p?v=100"
+},
+/* item 408 */ {
+ fixnJk: 0x3f785c,
+ 'lwyp': "https:\/\/example.com\/YGJ_nEYQAvE?v=77",
+ yroNyp: 0xb9add1
+},
+/* item 409 */ {
+ 'pghcmj': 'lqutio ojnalu dclwrxjmh mqxgtxvux hfzeeiwi'
+},
+/* item 410 */ {
+ 'sulolsgc': "https:\/\/example.com\/2seDtJsSus0?v=741",
+ 'deqvty': 551443,
+ jgvqXj: 204921,
+ 'fuo': [-77558, "qmtdjm ysrcjdii qtrizq \u00e9\n", undefined, 0x588ca9,]
+},
+/* item 411 */ {
+ 'ww': 166320,
+ TIKQDy: {
+  'orkfdms': {
+   'amjdbddv': "rsveplkmk hsocew otk \u00e9\n",
+   'zlrpygz': 0xb9e7a2
+},
+  'wlnsdjfj': -703924,
+  SJoEEm: 'fdc nlzzicf',
+  'uvkr': {
+   'xxje': "https:\/\/example.com\/cjep5xO_iR8?v=246",
+   'mjiufcip': -188482
+}
+},
+ 'zmqnauj': "https:\/\/example.com\/SYXCRuX67g5?v=500"
+},
+/* item 412 */ {
+ usEXAa: "ooriwfarq qkamfzqe cjgiae \u00e9\n",
+ rHWsLb: {
+  'xxre': 'alyrdv',
+  LQCvOE: 965960,
+  'sycchdl': [true,],
+  hOLCzS: "nriwapq xdi rlzzsmg \u00e9\n"
+}
+},
+/* item 413 */ {
+ 'lavuei': {
+  'nw': -702732,
+  'cpcdbra': ["https:\/\/example.com\/XavTTlNA9dD?v=619", "dftisi ywqxdrln gkqiobnj \u00e9\n", "https:\/\/example.com\/Yzculgr9dBX?v=346",],
+  pLyhYS: [-265514, -56856, "piwrg mxfxrn rz \u00e9\n", true,],
+  'ahxprjlcd': !0,
+  'vq': undefined
+},
+ dMfawo: -767453
+},
+/* item 414 */ {
+ UeahQp: 'ntvlbqm'
+},
+/* item 415 */ {
+ qGfpXu: {
+  bnYsNJ: -409910,
+  'gjqeksvp': 0x121cc8,
+  fiBpPV: !0
+},
+ 'xwmqtopj': [true, "https:\/\/example.com\/gYKMV8DKCTT?v=827",],
+ MRfmMW: "tauv vtqracti kurzws \u00e9\n",
+ nkVpBk: ["dqtulyka bonvxuglu apvogdraf \u00e9\n", false,],
+ 'umhq': 'cgodvfpan emkqm tuopnyy qdj rvlcfdx',
+ 'nquragvb': 'jvsqlzsb'
+},
+/* item 416 */ {
+ 'hfcid': [,],
+ 'hqaobwu': {
+  'az': !0,
+  'vepbd': 0xa22e2b,
+  'xzet': "fydrspr tfklmnob yfa \u00e9\n",
+  KkWFpw: {
+   'jykxmw': !0,
+   WkLGxn: 428656,
+   'ttbfjotzg': 0xf79527,
+   kicJhK: -53874,
+   uMcNGT: "https:\/\/example.com\/1UNVQHusbLT?v=443"
+},
+  'dbmjueje': "hpcb mn vqiyjrh \u00e9\n"
+},
+ 'zepmoarp': 740496,
+ 'xzixdenhe': !0,
+ 'bsqtgeaen': [,]
+},
+/* item 417 */ {
+ IKagJL: !0,
+ 'tbytas': {
+  IOmABk: {
+   'lapnib': 0xd58e89,
+   'aahybd': undefined,
+   'ycltelag': -658432,
+   rRdHcG: 'igdrtu dfygljac inxtyeroc'
+},
+  'injtden': {
+   'nmzwrmpy': !1,
+   'zj': 0xd0b874,
+   'ztbyy': "https:\/\/example.com\/7IVgi2eRHjt?v=218"
+},
+  'ddisvwzv': null,
+  'ndv': 'xz wfva ndkzro rbkznks cnmsft'
+},
+ 'xk': undefined,
+ IvmuJd: {
+  'dbg': {
+   KcDsws: 'qz eiuuccmdw ethkhhhn xlajpl',
+   'fuof': true,
+   'nkynb': "jxjvcuh dxjifyysc uxrwsvo \u00e9\n"
+},
+  ZGqFwt: "hvcqih kl ipz \u00e9\n",
+  'bmdilxuc': ["https:\/\/example.com\/b3xhJgMosJe?v=248", 0x9890ac, 0xdff8a9, "knizsf kaoiziku oimmbgitb \u00e9\n", 'lkkzfsh',],
+  CWnUED: null,
+  'liqf': {
+   'lllve': 'quvf',
+   GFVRUK: 'vrzm jez skkfqrrib eg clmlt fjpnem',
+   'mmdklrouu': 0x1a0093
+},
+  'qvhvcttd': "gcrq dgxbu gavs \u00e9\n"
+},
+ 'sj': {
+  ITWjjR: {
+   'chejlvr': 'ljep bmkzylwf',
+   GJHLjw: 0xd3a1f4
+},
+  jFghdj: 0x1afb4b,
+  dDAbnb: "hdwzb hf nsdndfdit \u00e9\n",
+  CSFFyI: {
+   'zjoumi': 0x2ed762,
+   'brnmbjo': 0xad5a4d,
+   'pcmqp': !0,
+   'ddkjjzxo': 'idpr hvqgogcf droqsbpl'
+},
+  ikmeZW: {
+   lfwNUW: "he wkwvwbkxs md \u00e9\n"
+}
+},
+ ilFzHd: {
+  'cigg': {
+   'pbydmdfo': "lhyybyv pknaabzjt emxzj \u00e9\n",
+   vGNwVn: "wg ddgquf feknrbtd \u00e9\n",
+   'yawolk': 'aldoet jw vmomhvhcp'
+},
+  'gmn': "sf iqvj vnqzdjz \u00e9\n",
+  'oyh': {
+   bBMnKS: 0x6ed03a,
+   iYnbNn: "https:\/\/example.com\/_Y0j9XbyPQe?v=91"
+},
+  'ci': "https:\/\/example.com\/z5in6L8OhMy?v=301",
+  bexahG: "https:\/\/example.com\/9c40s8hstPz?v=388"
+}
+},
+/* item 418 */ {
+ 'vnuac': "https:\/\/example.com\/hlHRSuxkdFB?v=631",
+ BcnrDr: 176736,
+ EptVoJ: undefined
+},
+/* item 419 */ {
+ PDYqCO: {
+  'dkribqll': {
+   'muw': -453232,
+   'kfxkoytyv': "qnov xfvdudqf fkbgm \u00e9\n",
+   QTXAwa: "geilwygh ti pszkpywbz \u00e9\n",
+   'edjerm': 0xe766f9
+}
+}
+},
+/* item 420 */ {
+ 'aqoanlr': {
+  gPzxcU: -649591,
+  QMkAQW: -872341,
+  NuRPos: 0xa62658,
+  jdwGbV: {
+   'khpfk': 0xdbc9c8,
+   'qhnlhq': "https:\/\/example.com\/Rl49sUM0KMe?v=12",
+   RMuEvD: 316349,
+   'pmyx': null,
+   swpQHY: 0xae2367
+}
+}
+},
+/* item 421 */ {
+ 'wokrzdu': [true, !1,],
+ syanga: 'kdbinvmbf qzfbwb xdmz jgxmypoi pukddblr rl',
+ 'wj': -605296
+},
+/* item 422 */ {
+ QjYdTk: false
+},
+/* item 423 */ {
+ 'oerzzz': 0xeb3146,
+ 'ba': 'xhsbspzlu enbo',
+ 'jooghq': 'py hdcmgsxul paiggyr vocx igjdtc',
+ RCQSeU: {
+  'irfkz': "https:\/\/example.com\/qFiYe_Q3-rD?v=326",
+  hujriZ: !1,
+  'htkaichza': 0x2034e4,
+  kgiQQt: {
+   'poy': "iasbpocy qxvhtfc wzie \u00e9\n",
+   XncQgj: 571410,
+   zNxvvw: 0xd10d64,
+   ICozrg: 0xae222a,
+   'asemfmkk': !0
+},
+  'pcddlb': 'kadiozp ljgagban olqchqv ymm wddzchkt kapddlm',
+  OWvETm: "sfgafie ivyfdykfn sqqovp \u00e9\n"
+}
+},
+/* item 424 */ {
+ 'rgwtxdisv': "https:\/\/example.com\/mkKtvEa0Oe7?v=234",
+ 'ipnomjp': "sdlzdpxr fqsr ep \u00e9\n",
+ 'wqfodzab': 0xb2de02
+},
+/* item 425 */ {
+ 'jgwgri': "https:\/\/example.com\/fdO-nd1eB0y?v=262",
+ tvpdTa: {
+  DiaGFQ: {
+   zOvWXc: true,
+   'rbspf': "mfygamus gpop ikdlibal \u00e9\n",
+   PlxutN: 918707,
+   'qmxslzbf': "https:\/\/example.com\/KhTGMRjeOEJ?v=19"
+},
+  dMPQnY: -309653,
+  'venneku': 'vunojfl bbkyfzaib yhddngstr vixhjvs gvkyk',
+  'sbanruw': {
+   gxjhjd: "xh ptxeigbpw bfrlefmg \u00e9\n"
+},
+  'gjq': false,
+  'gmkbhxw': -265937
+}
+},
+/* item 426 */ {
+ 'oafh': ['ocsbh oux rvq qg zfm', null, 741583, "https:\/\/example.com\/rGDpqm7IDi7?v=457",],
+ 'wrudlan': "https:\/\/example.com\/LLS3wu3Iar0?v=629",
+ 'igopanh': 0x78f48b
+},
+/* item 427 */ {
+ 'qclgr': {
+  'jhxxt': {
+   BJGClg: true,
+   GULAJG: "pymow dby ek \u00e9\n"
+},
+  'nmviqqa': 'eyg'
+},
+ 'sryokhg': 'oneog axx',
+ CgCEwX: 'ruyozqqe nafwd ecugocne'
+},
+/* item 428 */ {
+ 'sok': !0,
+ 'qiedyok': -296086,
+ SbuqsP: 'sox lyjy',
+ FZClRI: "https:\/\/example.com\/q7VIhSs0tYd?v=726"
+},
+/* item 429 */ {
+ JTHuwp: 591919,
+ 'zhaq': true
+},
+/* item 430 */ {
+ ZZFezT: 0xfdee6,
+ 'rwrztze': 187781
+},
+/* item 431 */ {
+ SvofJR: "ejdkzlpy hyvyzwd rksysojbq \u00e9\n"
+},
+/* item 432 */ {
+ 'ewchrb': "fguhuw jertshjyo qifc \u00e9\n",
+ 'fpchfdgu': "https:\/\/example.com\/hrb4O1J17_d?v=415",
+ iQlQOI: 0xe8f449,
+ CljGeX: [['yluqjvwfw ve ak', 0x8435c2, "kfufa uh khfpxzf \u00e9\n", 'gcqcipnab ljyhpiog qsaiybqs pax oattsufl', 'vkcv wryr',], "https:\/\/example.com\/NR0KuFTIwC5?v=878", [,], 0x8202c9, 836081,],
+ fdjdPr: "https:\/\/example.com\/LCaR5nOVJpF?v=958"
+},
+/* item 433 */ {
+ 'mnz': 0xd4b2ff
+},
+/* item 434 */ {
+ aIpCbP: {
+  'yvmpejiqt': 0xe1ad9d,
+  'zchtvu': 0xf80ccb,
+  nAvGQG: "rpydmar nrfwmk bbtvuu \u00e9\n"
+},
+ 'jnjxkbf': !1,
+ EREJGZ: {
+  'hszip': "https:\/\/example.com\/HSK7zFltHqk?v=18"
+},
+ DaPRzy: {
+  'wrvgbjtzd': {
+   bzsIae: -827683,
+   'dsqtl': 0x826b3,
+   yAUSgh: 164771,
+   'rcq': 'xdsskcakq tqgqvxuin gykjoil',
+   OyrUTn: 'gq iwjv hmuyafrji gykdvful plzfefpa biwhfth',
+   'qjnnqihw': true
+},
+  'ql': "fljm vwklv bka \u00e9\n"
+}
+},
+/* item 435 */ {
+ fObnNU: 'ug ku pybkaqgev xjhrhq wbaylmh',
+ 'nhofya': "kckjtlwt ibjezs stkkcdihd \u00e9\n",
+ qzOhnB: -717566,
+ WLFWxP: ['taa eth edcl jqsp', -356538, null,],
+ 'djhvfgvte': 504789
+},
+/* item 436 */ {
+ 'dwtqruqxf': 703552
+},
+/* item 437 */ {
+ 'cicksaqh': "zplv gywa nzlo \u00e9\n",
+ 'vcbr': {
+  'wv': undefined,
+  kxNQxJ: {
+   OsgVdv: "https:\/\/example.com\/KfyuAJTtJmg?v=708",
+   jTekeh: "kqcc dl clapgbhuf \u00e9\n",
+   FqhbvU: false,
+   aIXFCV: "https:\/\/example.com\/FKnV8gsEeJc?v=519",
+   'zqorokkd': true,
+   'xez': 'ac qvq ozwdg plr'
+}
+},
+ qVjZxp: 'oajutz akashv kqvotefie zbxmwp vnnukgfnm bux',
+ mwQDMW: "https:\/\/example.com\/nbIZ3fxWOay?v=372",
+ 'xdqbk': {
+  'vctmrrg': -212554,
+  'rntgrshpz': ['amb isrgblfqd nwpgho gjw phory uoksxii', 0x63a343, !1,],
+  kpCdaI: null,
+  Hhsiig: "foia fhnir dlacxeyr \u00e9\n",
+  JUZtRr: {
+   MueTJK: 0x6b6f62,
+   'xzh': 577120,
+   IUeaGd: 0x50eb1,
+   'bj': 0x4d30c9,
+   'bjgucaxch': "tivk olmwjvcv idciz \u00e9\n"
+},
+  'wnwsstt': {
+   HTKxXJ: 'duwv zul efs dtfyzo hnbik bwk',
+   'kgucgpf': "https:\/\/example.com\/zo9H7737zJJ?v=746"
+}
+}
+},
+/* item 438 */ {
+ hxTLPD: !1
+},
+/* item 439 */ {
+ znNENQ: {
+  'qrxba': null,
+  nCNyVM: "qv fp bkffj \u00e9\n",
+  'loyb': [!0, "clmmejsw iblsj ws \u00e9\n",],
+  xmijBB: -878672,
+  xfSsYS: {
+   WOAkvu: 236796,
+   'fft': !0,
+   'scg': "https:\/\/example.com\/RSMbLRjWw3c?v=889",
+   ILKSlo: -347598
+}
+},
+ 'twjlud': {
+  'olbtg': {
+   'nc': false,
+   BAAbxh: 0xe507e6,
+   yvhfLb: "wus yjjoan bs \u00e9\n"
+},
+  'kao': "mksitg jnontmy qwe \u00e9\n"
+},
+ lUiLHM: {
+  'rnm': 'pbkqbh crzoyyr',
+  'ppcvoump': [false, -425743, 0x7fdcb1, -631164, 'fermoy pokzteo zgfx',],
+  rzOqNx: "https:\/\/example.com\/6L2m0aeNr5V?v=116",
+  'vgrrhl': [,],
+  doLlmJ: [441427, 'wsh jljeyjbz', 'ngy pm dqjvuvduf mwivlv', 'idclek acrz pceiu cjisvanu',]
+},
+ 'adcmrn': null
+},
+/* item 440 */ {
+ VpRDqW: "https:\/\/example.com\/MubqjzyLRwo?v=273",
+ vSOtLj: "zmqweorl jfff tv \u00e9\n",
+ 'kqqpwo': [{
+   XBulam: "dtuig lekczmm wpahsrc \u00e9\n"
+}, {
+   wusdoy: "https:\/\/example.com\/oh_aYe7cLSd?v=97",
+   cjwnNb: "lvdinzp atf cksuft \u00e9\n"
+}, [0xddec3a, "https:\/\/example.com\/Xwd5Lr6eWZX?v=447",],]
+},
+/* item 441 */ {
+ 'vfuwyhow': ["gou hjmew xq \u00e9\n", {
+   bvRuud: 513387,
+   'itdjjn': "https:\/\/example.com\/bg4w_OREB4O?v=114",
+   'his': 'zykbs hynjvvhe mkix ibzpf ooksicrz qmf',
+   'swsqqv': 'xjo',
+   'ezyvk': "azlarlu crwxw hzk \u00e9\n"
+}, {
+   'olejfm': false,
+   IoMWGn: "https:\/\/example.com\/LzloHbMkR8p?v=286",
+   mFRFdU: !1,
+   'mzuvv': "https:\/\/example.com\/VONAsMrTbUg?v=567"
+}, "https:\/\/example.com\/yL-ZodCDKCx?v=488",]
+},
+/* item 442 */ {
+ 'ynxetc': 588937,
+ eGCKIe: "kvrrstsan lzf sdtjljk \u00e9\n",
+ 'cwcprqxy': [,]
+},
+/* item 443 */ {
+ Ipozld: {
+  'cydxoz': {
+   'vx': true,
+   'beu': 'mlxl',
+   uUiKNr: 601785,
+   xyXJvB: "https:\/\/example.com\/exryuxSCWaA?v=71",
+   'qe': "ump xeqsumh sqqti \u00e9\n",
+   QxfCKH: -553510
+},
+  'pmgbkban': {
+   'zgo': "https:\/\/example.com\/d4j4J7kbW5E?v=6",
+   'byzspec': 0xcd1f4c
+},
+  'rsnxsphbf': 0xf5f1b7,
+  'vo': 'tbzthso pqwh tpl',
+  flgKmz: "uwmylnb irvyiyurl fwrhom \u00e9\n",
+  'mnac': "https:\/\/example.com\/xTjVpRKq3O7?v=913"
+},
+ 'ivad': true
+},
+/* item 444 */ {
+ 'meradbnp': 0x33c4f3,
+ HGHDWV: "https:\/\/example.com\/3-V5ukhi5V4?v=441"
+},
+/* item 445 */ {
+ 'kbclefdg': {
+  VTtrYx: "wjcjmdp tlr goryzuxin \u00e9\n"
+},
+ 'bcmvpi': 810397,
+ IGUmeq: ['qxkbft eo dby', 0xd890cb, -300720,],
+ 'nnhwljgjd': {
+  'tpzvsqhut': 583453,
+  'ok': {
+   TTHDUS: "qrtlynj egcqb enc \u00e9\n",
+   LIPVES: 0xe01dcf,
+   nZVeCA: -313009,
+   'zuglpinx': "https:\/\/example.com\/qYpRGFP-IPr?v=372",
+   ALjTYh: 0xfc38d9
+},
+  QouFCw: "https:\/\/example.com\/pbzyFF_M77L?v=612",
+  'fhpbj': "https:\/\/example.com\/40_NFfOehK8?v=350",
+  NanSNx: false
+},
+ 'hyydmk': "byuxod aaaakw ublkv \u00e9\n"
+},
+/* item 446 */ {
+ gvBZnx: [{
+   'jnunlmcr': "abewnd byobrv nwpfas \u00e9\n",
+   SUliuv: "https:\/\/example.com\/y4y5hyfmUV6?v=394",
+   EtCzgA: null
+},],
+ 'akavv': undefined,
+ 'fxru': 'tibghnufk epw nf'
+},
+/* item 447 */ {
+ 'kytmkyx': "djx okrwf jwuylbb \u00e9\n"
+},
+/* item 448 */ {
+ 'mupwehnje': [[,],],
+ OoeuiD: 0xd45e83,
+ 'mpzs': -346172
+},
+/* item 449 */ {
+ uNBDBf: 0xe7b956,
+ 'yqbffhdth': 'ubickdad',
+ 'olggcdwz': "https:\/\/example.com\/jstYnIaFl_O?v=718",
+ 'tlnjdn': 'fwzn',
+ hmNBAd: "vqdlsxs nijjhxtkb ikwfwyyu \u00e9\n"
+},
+/* item 450 */ {
+ 'psysxwf': {
+  vtDBsP: 0x827893,
+  'spqjmx': 'lp lqwprzfzk bichgprh zcyx',
+  'lh': 0x354ae4,
+  'oj': 'irsi iwgovis zsdi iqkalg lhcwzgbrs'
+},
+ hosVpK: "https:\/\/example.com\/0sHEU18nwdL?v=32",
+ bzxIQX: {
+  hSfAAL: 'zdhsvdsb jzhtwjmpg rgm dbihlbnek fhqqyaonj to',
+  'aqupr': {
+   nFbRZF: false
+}
+},
+ mIzxtK: "https:\/\/example.com\/WYdV6Fm60tf?v=708",
+ XJgTMX: 400957
+},
+/* item 451 */ {
+ 'kfuf': 'ebprswh sgou'
+},
+/* item 452 */ {
+ 'bmsdrri': undefined,
+ QKxtUz: false,
+ 'fca': "https:\/\/example.com\/O5gMl32zKMc?v=261",
+ GlcPKP: 0x1e7032,
+ RVlovu: "https:\/\/example.com\/6CfPMa2dImZ?v=243",
+ lDeMAf: "https:\/\/example.com\/LQSdw1v-hES?v=887"
+},
+/* item 453 */ {
+ prYxXJ: 210478,
+ eGKRir: {
+  AgtDAc: 213194,
+  'fdhkf': -118804
+},
+ QkuyzH: {
+  'zbfj': {
+   'frkge': "https:\/\/example.com\/hl_0jOZfdn0?v=708",
+   ZEibrs: 'xivvyj rytqdqoyx xgggm wjaklx dwynrlma sbfjr',
+   WTTvqh: "https:\/\/example.com\/26RjwyCrhWq?v=194"
+},
+  tEChtU: 0x40ad40,
+  'aqekvl': undefined,
+  MElvDo: "gejils fazjln jkosnd \u00e9\n"
+}
+},
+/* item 454 */ {
+ 'zlfvicli': 541070,
+ 'rfxlkwi': "aohywa glj fxq \u00e9\n",
+ cVwQsj: [153379, "https:\/\/example.com\/TWVisufhbaz?v=807", !1, 30265, {
+   Dnpxjw: "https:\/\/example.com\/pdPhkIu5OaS?v=361"
+},],
+ 'xd': "https:\/\/example.com\/-gV_dkS2dRS?v=783",
+ 'acj': [[false, false, 0xfebd18, 'qiatl cqpb', "pydk xu dadxnidd \u00e9\n",], 'sk izzzu bfd wgm arowoaxct vczbzci',],
+ 'bgpqkvfha': !0
+},
+/* item 455 */ {
+ PRkORW: null,
+ 'fndf': {
+  iJzkcv: -438418,
+  kJsMDr: 'od iw hq',
+  'mv': {
+   bfvYKH: "kazi jqvrypra tnpo \u00e9\n",
+   ugaElJ: "ssx tngeisk tvpvtx \u00e9\n",
+   gcYaeD: 0x712536,
+   pKgPUa: !1
+},
+  'atooiqc': 'fursldmwe ckqfex xzmlucqj'
+},
+ 'qbtn': {
+  'sxwlvid': "stlowyonc zfxpk tgwcumbt \u00e9\n",
+  'gymj': "kzhmtf avvzak ljmiay \u00e9\n",
+  FYVAiB: 0xc8fdae,
+  LPupkq: -10410,
+  'foesxvi': {
+   HwtXYO: "sh hdnzfq aoxl \u00e9\n",
+   'aqcoxai': 471007,
+   ifgUMl: 'zxckludq'
+},
+  'zgkz': ["https:\/\/example.com\/4W-ZMQUKGs3?v=812", 'fep',]
+}
+},
+/* item 456 */ {
+ hdveNC: "https:\/\/example.com\/0IhQPi6gi29?v=937",
+ EBVCKQ: 0x67e61d
+},
+/* item 457 */ {
+ gTwwxN: ["https:\/\/example.com\/yD78499nMI4?v=315", null,],
+ 'lamahrr': false,
+ 'hdt': "https:\/\/example.com\/fdnFA8KGubp?v=551",
+ 'njn': [{
+   bWvzal: 0xd8d1fc,
+   eCEQcL: 'wsd fmzvr',
+   'cvyn': 'tyjk',
+   'wl': 'wlmygvnr rnw',
+   'kxaganh': !1
+}, 'tcc iktudsrm em hxocow',]
+},
+/* item 458 */ {
+ AuwQWl: 'ddvuc'
+},
+/* item 459 */ {
+ 'dtaiioxqu': "https:\/\/example.com\/ysv_YDtAytL?v=915",
+ 'hjjj': "tq tymmlwo yfwtilgk \u00e9\n",
+ 'gmxwo': 407604,
+ APyCAd: 960749
+},
+/* item 460 */ {
+ 'yfjb': [{
+   'tvvr': !0,
+   xkIyWx: -451528,
+   enJtlL: "xxinv lrymqn tdge \u00e9\n",
+   'urzo': "https:\/\/example.com\/eJ8ssed4LvI?v=375",
+   bdXUgf: "ydadn zgnrwo ggacizoj \u00e9\n",
+   'inmgk': "kcchqv evxcife yztfqxzi \u00e9\n"
+}, 0x1a8025, 'afmgt kq vzob jlijyok hfl jhpmnrd',],
+ 'hb': [,],
+ 'kmvpqcm': undefined,
+ 'wvjanj': "vpo vqpt kpuo \u00e9\n",
+ nXPtta: !1,
+ CNQXOx: !1
+},
+/* item 461 */ {
+ 'qmvfrrjw': -646886,
+ 'mqn': undefined,
+ 'fcxcg': {
+  'ytdw': ["ngfnmo bi al \u00e9\n", 0xcfa3c, 0xacc1f4, 'xsnpmwen yb sp km kydzfqa', 443450,],
+  'sfs': {
+   UqTZvw: "glmmxp ap kfk \u00e9\n",
+   ADuDhI: 308630,
+   HXSdAi: 'tc axgvh ayrumyh'
+}
+},
+ 'pdp': "https:\/\/example.com\/qaF17hbybur?v=565",
+ 'wucae': ["https:\/\/example.com\/CIhqXGcTxW2?v=525",],
+ hcwLfD: 'mbvjjep'
+},
+/* item 462 */ {
+ 'aqpuuojt': "xvslycq ltq tifvzbau \u00e9\n",
+ MPBOrN: "https:\/\/example.com\/IQjkrokhozQ?v=596",
+ HoymzA: ["https:\/\/example.com\/rp6pi9A20HD?v=173", 'uidjil mxgn tdqqj', 0x62b561,],
+ SsNgLA: [{
+   YcEVtB: 0x49eab9
+}, 0xf5cc4a, "xushln yjwwbg qufm \u00e9\n", {
+   gjbdEX: !1,
+   OFwjyK: 443989
+},]
+},
+/* item 463 */ {
+ KfZJSt: undefined
+},
+/* item 464 */ {
+ 'dzfq': "khnb iyf jwnze \u00e9\n",
+ 'lplpotuk': {
+  RUiHUO: 'jwwwnl nkmt gn wazz vgsckbsfs',
+  WKjsLH: 745038,
+  'txawjkbqf': 42673,
+  'mqcolcq': 'kkik myf aksyhrh ytjjo',
+  'rmx': 0x82b292,
+  'lbr': 0x118ce0
+},
+ NQvzNC: [0xc764b0, {
+   'zywaq': "https:\/\/example.com\/HRvhAChy3EQ?v=984",
+   JKTMnT: 35456,
+   xiFQel: "https:\/\/example.com\/Abrtfhu_clk?v=182",
+   'mmnsn': true,
+   vChAoX: 765035,
+   vAtHzs: "https:\/\/example.com\/wDzi_mD-Tct?v=149"
+}, 80624,]
+},
+/* item 465 */ {
+ wAVIaX: {
+  evbALG: {
+   RYrnxk: !1,
+   uzjjtj: "https:\/\/example.com\/-VQB3XylKdp?v=994",
+   'mmqfif': true,
+   'eidkch': false,
+   'or': "mjar kyk hbwf \u00e9\n"
+},
+  XjDMcl: {
+   ttRcEi: "https:\/\/example.com\/830arnzSfO4?v=653"
+},
+  SWUOBr: undefined,
+  AKksFt: "https:\/\/example.com\/eK6icOnzP5G?v=488",
+  dotfpF: -355652
+},
+ XkQOpL: {
+  'ecyaohem': "https:\/\/example.com\/AashZz30p4c?v=994",
+  ezSRyl: "https:\/\/example.com\/yW6x0MNYX_M?v=60",
+  'nqocujc': !0,
+  'ddmwich': 'azmlep eackab hueswfoq nhgkgln muicft takkgwjnc',
+  'xghz': 0x2a2e13
+},
+ 'xwfao': 0xfe8b88,
+ 'rpu': "lglpni nqfbxl mpqgj \u00e9\n",
+ 'ozfebttej': "cdvalpy rudgj tgeemwyxs \u00e9\n",
+ lnuUVX: 'bybzbdro rg of hmh'
+},
+/* item 466 */ {
+ 'tiu': 'xinmskeo dsrmy hdypdznk cjkl yg zxzzp',
+ LnESpR: "https:\/\/example.com\/34ixsYnIwah?v=750",
+ zoUmsZ: 102857,
+ 'npaehzvr': 0xc1f3be,
+ 'tct': "https:\/\/example.com\/jcZyd9E17er?v=771",
+ PhuczZ: {
+  'vtruyaz': 'behakdgqn mmdrnojsn khxlv yqa okmcighw',
+  'dva': 0x935b80,
+  'yiaf': {
+   'ooeu': "qowgohc kovtm pskwrxn \u00e9\n",
+   VjsNWB: 183971
+},
+  OKYNPm: ["ugrhexyii sdcluiu eljdptgo \u00e9\n",]
+}
+},
+/* item 467 */ {
+ 'zkrkpqszv': {
+  IJBtdx: {
+   dpKWzc: 'ccigezjsh',
+   'fyyhsnzl': -226778
+},
+  YWRbfc: 'ag yzualdgqx qc'
+}
+},
+/* item 468 */ {
+ 'ce': "gxkftazr pp wye \u00e9\n",
+ WWFwOI: ["https:\/\/example.com\/INosi6zLe1A?v=359", -676969,]
+},
+/* item 469 */ {
+ OZztyn: false,
+ 'fvw': {
+  jFxIGd: 0x774f0a,
+  'qozf': {
+   'vnajq': "ymo xzdlpqe cuki \u00e9\n",
+   cpxDAi: 'flgjrbsv',
+   KLfNsC: "cf kzqvxufew oz \u00e9\n",
+   hQIcKm: -242259
+},
+  'xohatfh': undefined,
+  'woqr': 539074,
+  'itkbyaewd': {
+   'mjnol': 'ynpfcov mmp dk smjniulpw cukdtzw aiodhuwe',
+   'qgba': "mb mcfgqcgcs ekhllamg \u00e9\n",
+   'nqmpz': 0xc1d5a7,
+   'ofnohurb': "wosnj snlpvvhml hejlxsypl \u00e9\n",
+   wylkji: "https:\/\/example.com\/8CdPtx-2hYF?v=375"
+},
+  'sbeias': 0x79c6f4
+},
+ 'vsocao': "bfbdb wilhvhif rn \u00e9\n"
+},
+/* item 470 */ {
+ 'fwnmti': "https:\/\/example.com\/PwXn_m6bjjs?v=731"
+},
+/* item 471 */ {
+ 'ewiuagyh': 263783,
+ HrhmpG: "https:\/\/example.com\/OE7l0ud05WZ?v=748",
+ 'wk': {
+  'bgtwqqw': 'uusowqyl iecbxf wdm',
+  'mtlpp': -903421,
+  'apaczdmkc': "lqvzvfzlk oj yzpmcjsr \u00e9\n",
+  'wtdl': ["gbgbtfe opzcpdrqf smsahh \u00e9\n", "https:\/\/example.com\/mHCJqBk6Pij?v=475",],
+  TABMtN: {
+   zENCXA: "bkrhtf bvaz px \u00e9\n",
+   'vqf': 813091,
+   'vncsegnka': true,
+   twfGcb: -796408
+}
+},
+ plLcLO: [,],
+ 'rmvaeyldh': "https:\/\/example.com\/GcnJheXzGOc?v=75"
+},
+/* item 472 */ {
+ 'abin': "https:\/\/example.com\/VzPs1MfDn9u?v=700",
+ NFmlYT: {
+  'watsrszt': 'gzktfinyq ywb ntq',
+  'txidahj': 695012,
+  gYDzYs: "https:\/\/example.com\/xDXUTnZ6Cbv?v=69",
+  'zjvvrobk': 0x325639,
+  Ujkgsa: [-356092,]
+},
+ 'coscf': 'xhizkr awpkxc qgscc hpgmpr zw'
+},
+/* item 473 */ {
+ FABIWN: 'fqflyfk yftn kmgcfe'
+},
+/* item 474 */ {
+ STnVDx: "https:\/\/example.com\/ToXfxpJ0-ch?v=308",
+ 'pxhoojri': "https:\/\/example.com\/QnUU0NEs0Rk?v=274"
+},
+/* item 475 */ {
+ 'evodzo': 258734,
+ MRsdBX: -478330,
+ uebgmP: "https:\/\/example.com\/v10ddpOQlFQ?v=375"
+},
+/* item 476 */ {
+ gyILqL: [[false, 116105,], "https:\/\/example.com\/TL-RQ7XJL_-?v=30",]
+},
+/* item 477 */ {
+ 'oblckwl': 0x42b221,
+ 'exktu': "https:\/\/example.com\/S651aSKO8kT?v=745"
+},
+/* item 478 */ {
+ yMrgUl: -248869
+},
+/* item 479 */ {
+ xSAYkk: undefined,
+ wiFXkG: 644622,
+ 'lar': ["abpfhtirx jcvafaw vngn \u00e9\n", {
+   faKMHQ: "https:\/\/example.com\/AWkYFnZnr79?v=749",
+   'rjrgbebj': 438805,
+   tlfEvB: 194636,
+   LrqDtB: 0xfd732a
+}, 0x624d70, undefined,],
+ TmXCAa: {
+  NbXIIJ: 0xf385d5
+}
+},
+/* item 480 */ {
+ kgfYTA: 0xb798de,
+ FXGGFI: 795353,
+ 'lxxs': {
+  ElgHhJ: "https:\/\/example.com\/iBgj490umbl?v=754",
+  hZOMWN: null
+},
+ JkeMxD: "lqyndctai ktemqjb asxkk \u00e9\n"
+},
+/* item 481 */ {
+ 'wdttua': "https:\/\/example.com\/KZ51zCgxZuQ?v=468",
+ 'rcruri': {
+  tIfzvI: {
+   ctTMyR: 886871,
+   'zunvg': 'trtevnr lhubjwzn',
+   'oqwysvylg': 0x38605,
+   'jza': undefined,
+   azieWb: "https:\/\/example.com\/3WzHKEZXFJT?v=475"
+}
+},
+ rNMhhk: {
+  'roymjm': "https:\/\/example.com\/WUsETcvCA7_?v=62",
+  aAfheb: "ovnnieaaz oqzjqzgr eiquiwegq \u00e9\n"
+},
+ gNcREI: ["https:\/\/example.com\/9SkGS-8k3Se?v=42", !1,],
+ 'nxpqmvry': [null, 'btltduart mj lsp kx txqtnkrv tri',],
+ hyfuPC: null
+},
+/* item 482 */ {
+ APOVbo: 0xd37c32,
+ QfxeMd: "https:\/\/example.com\/jmLmB_amXd_?v=266",
+ 'lipiyk': {
+  'lrwthva': "srjmq xs yiw \u00e9\n",
+  LuqVFK: {
+   'tucph': 639633
+},
+  ivWGms: [!1,],
+  'om': {
+   'wnqq': 0x6b25ee,
+   SMvfth: 681301,
+   'mlhvfsnv': 0x594bd,
+   'vpwofi': 'lra rdlvapt ogoeud',
+   YNzvIm: 0x18d2
+},
+  PWAuzd: {
+   QkfDyN: 0x102b9b,
+   FToAzz: "nt mlh kt \u00e9\n",
+   'nyk': !0,
+   'noyc': 0x12070c
+},
+  khEgUZ: "cicva ms utg \u00e9\n"
+},
+ 'ycspruprz': 'wysazvapt krpei yja dgejhcmlr rpxtdkzz xumg'
+},
+/* item 483 */ {
+ 'bxpnfhfk': 0x9536db,
+ 'aynjzxy': 'kn ackqw'
+},
+/* item 484 */ {
+ 'bkkduz': "https:\/\/example.com\/RiY1xWfGdQQ?v=942",
+ 'gwibgmbhi': false
+},
+/* item 485 */ {
+ lUpGOO: 0x83be62,
+ 'aw': false,
+ 'mtrwgw': "eppmv mujami fybctc \u00e9\n"
+},
+/* item 486 */ {
+ VQqcmp: 'mgajsug sjxi tb'
+},
+/* item 487 */ {
+ 'dogn': "https:\/\/example.com\/0OmKexrwAlg?v=1",
+ odlMcs: {
+  kaEwGS: "lv emlv wfmqyi \u00e9\n"
+},
+ yMEyPO: [0x8d019a, [-709559, 0xb6a095, 'jw gijsqagw mroevejyf hxrjp',],],
+ 'vrt': "faf jzp ruvrbsnpj \u00e9\n",
+ 'bkgoko': 0x6d324b,
+ 'pxuscvbe': 0xa61cd0
+},
+/* item 488 */ {
+ 'rze': -246686,
+ ZQwolG: {
+  mAkbDU: "https:\/\/example.com\/Z3j_PTqujFH?v=773",
+  vundWj: ['jtcq pyz aqs bmytnfrqt', 0xac7b7f,],
+  SueJce: [!0,],
+  rRmgTP: 'oqjn gmtphbxp efazvqvs vk jape',
+  'cvpbigy': "https:\/\/example.com\/rqQGmaYvwFF?v=167"
+},
+ qmkHWA: 0xc5c624,
+ KkCRcM: "https:\/\/example.com\/TG_WRAqZY3j?v=933",
+ 'alfbjhlwl': "https:\/\/example.com\/UKt_teklfhj?v=858"
+},
+/* item 489 */ {
+ 'vojjx': [{
+   'jjoythqwp': 451585,
+   ebKLeV: "zpho abstvwxx zpotnwlk \u00e9\n"
+}, "tgjxj ykp xbld \u00e9\n", 'bn sq kn hjxjx', "nwbnfis suszpfs hjvsc \u00e9\n",]
+},
+/* item 490 */ {
+ 'rz': -775541,
+ 'cetx': [{
+   'dvmuaxuqu': "xwonqhxi cdryjmwr wcqtmlb \u00e9\n",
+   RIruii: true,
+   zmHQbD: -700556
+}, [0x84a327, "https:\/\/example.com\/uttu5jXa_sO?v=565", undefined, 18772,], {
+   LnFQTf: "barcglz oaoh mamnbbp \u00e9\n",
+   'lsfalfsgq': 0x3176f1,
+   LprHZO: 'udlrtxq rva msaicqk klvlhcghh xjizj thbvdhtj',
+   pJIofz: "https:\/\/example.com\/gWy3p9_HY4Q?v=217"
+},]
+},
+/* item 491 */ {
+ vJrbdm: ["khomefro kupeuhq xfiga \u00e9\n",],
+ 'glxeuufqq': 'ba oaefxi gv uc gxjqwm yhbtmopbm',
+ fBVRHP: "https:\/\/example.com\/jG_kZdIiK_d?v=819",
+ 'xvdq': 922930,
+ WGxNkr: [,]
+},
+/* item 492 */ {
+ 'hhhpagwc': {
+  vcoFHW: {
+   'gpuwtr': 0x4aa8e3,
+   qcfXsg: "dmdmet ugabdwped trddx \u00e9\n",
+   'vt': false,
+   fcXIhs: 0xb93b4d,
+   woUCcn: 'srhb plvzyyuj jxcld',
+   'rkmbdcvyx': -483591
+},
+  qqODrV: "byquhjcl yghvvknr sgmwerg \u00e9\n",
+  femyLD: 944020,
+  VAJneZ: "https:\/\/example.com\/LtN5zN2XcSR?v=616",
+  oWkuTK: "yujrtj rspanvkn bxtcwv \u00e9\n"
+},
+ 'sichcek': true
+},
+/* item 493 */ {
+ 'fzvx': [!1, "cpiocqseo uaghoj shj \u00e9\n", 0xf00cd, "kpudpvr nettbekiv atptujvd \u00e9\n", 'fdh',],
+ 'xwrqjvpqf': "https:\/\/example.com\/n1XPia8mgDR?v=175"
+},
+/* item 494 */ {
+ TTplxl: "okowrsynv xr ulyo \u00e9\n",
+ 'byuu': {
+  CdSOaZ: {
+   NahenX: 0xeab5
+},
+  KaKOhb: {
+   'lwyxdm': 'fmh libztynfo obisjn bnsgzcpin'
+},
+  'kjxd': -973287,
+  HQcQnX: 0xc402c9,
+  'crbbiu': "vz ngre mu \u00e9\n"
+}
+},
+/* item 495 */ {
+ 'fsjrp': {
+  fgxrZi: 908542,
+  pcZVir: [,],
+  YxnrwK: {
+   'avkpvksru': "https:\/\/example.com\/lRxr60-83Xc?v=949",
+   'iznpns': "https:\/\/example.com\/E6hBpH-91Oa?v=129",
+   jljCxG: null,
+   'ngmw': -451631
+},
+  'tadyx': undefined,
+  'cfmpshmt': "https:\/\/example.com\/ozlOn6r0fuJ?v=26"
+},
+ 'clhhjj': -98520
+},
+/* item 496 */ {
+ fkefOu: "kwglmssr tqcug hrjson \u00e9\n"
+},
+/* item 497 */ {
+ hYpzps: 0xadaf7c,
+ 'hyg': 'owndvpo upbhbpkgc xeudsctw vxaqvv',
+ 'eslk': 'yfqpta nxznvtkr nuheeuzzo',
+ OuYhTt: "https:\/\/example.com\/Q4Pq8vjbUIw?v=115",
+ NPasTe: "qnwfy bp czylcqy \u00e9\n"
+},
+/* item 498 */ {
+ 'ibybdlgm': {
+  'sxlhgqx': null
+},
+ JpkBKs: {
+  'qfvadzqz': {
+   ObQOjx: "https:\/\/example.com\/sSwa11eMZor?v=660",
+   'npuf': false,
+   'pwbfou': 671156
+},
+  'yzqkiocgg': 378481
+},
+ 'whvgkia': 0xd83052,
+ 'aqnva': 'obwbdl ouuwfzx nsfsz rn hisrwhv',
+ 'ih': null
+},
+/* item 499 */ {
+ 'imhqks': 'ewauvai ktierildu',
+ 'smai': "https:\/\/example.com\/XkwegXpPlAV?v=698",
+ 'gzndyicl': 0x26a10d,
+ EHqqGF: 935318
+},
+/* item 500 */ {
+ 'xiekw': 0xea0dee
+},
+/* item 501 */ {
+ 'rypufxmp': false,
+ foQORI: 907857,
+ NXAmMu: {
+  'rwj': ["https:\/\/example.com\/Z9HhBYHg2rj?v=328", -510450, "https:\/\/example.com\/t_fgJh9IrOz?v=970", !1, 0x9ed89,],
+  'or': {
+   'leifeuoiy': 'okwkynh wwnrh',
+   'ru': "https:\/\/example.com\/vwK5-XPhxK8?v=668",
+   VlDzaU: "oskvoc hyq kqi \u00e9\n",
+   'zrugw': 0x404cba
+},
+  'oiay': 0xf5602f
+}
+},
+/* item 502 */ {
+ guNrUo: {
+  'kayra': {
+   'na': "ho dvpexw tqtbzye \u00e9\n",
+   rAkmEo: false,
+   zSHLnI: "ohkieg dakxkebba wnu \u00e9\n"
+}
+},
+ Vmwajv: {
+  LXtwrG: [!0, "yx su zpkaw \u00e9\n", 0xb1dffa, "https:\/\/example.com\/AXUIHW1muWX?v=457", 'sdgzk njt',]
+}
+},
+/* item 503 */ {
+ DxnTzo: 'iyivijgxd iiwfimph'
+},
+/* item 504 */ {
+ uSuUHr: ["https:\/\/example.com\/H_sS3QYp9hW?v=265", 0xc6e392, {
+   'nuqpznda': true,
+   'rclykq': "hsocpbf ezhybj fuzqrmh \u00e9\n"
+}, "fvgstvav xuhuei rey \u00e9\n", "https:\/\/example.com\/h3MQH4VO31V?v=575",],
+ 'jmhsz': "https:\/\/example.com\/mA3PeGS9L3e?v=588"
+},
+/* item 505 */ {
+ xamjnx: -126538,
+ 'imygkzjg': [,]
+},
+/* item 506 */ {
+ 'oqgqacheq': {
+  CuQvuY: {
+   uMjPKQ: !0,
+   syCDuS: !0,
+   VMCGTa: 119020,
+   'tcgunq': "whsm zhiivnxvp pqrogsrf \u00e9\n",
+   'wxjfyz': 'mrzzan slz kqcjou',
+   SlUibh: null
+},
+  ffZlOC: {
+   CPGqIf: false,
+   'yoom': "bcdhumy bqrdvpz kjkbmwbq \u00e9\n",
+   dbzVIY: "https:\/\/example.com\/FQQkumnfJRB?v=169"
+},
+  'pmb': true,
+  UFKofW: [0x7cc54, 'yy thyfzrm kbf gdsfdjt', false,],
+  JeXPGU: 0x9bad3d,
+  'zvngfbo': -616307
+}
+},
+/* item 507 */ {
+ VPDyyb: "mgqfwxx bxsr gjlubvi \u00e9\n",
+ uHdzwX: {
+  qwiVIe: 'ctsmwat'
+},
+ 'zjhpzv': {
+  NRFGAw: 'untdlbe ywuiu iy'
+}
+},
+/* item 508 */ {
+ nBXzYp: "yvvlqtvun po hyevpqm \u00e9\n",
+ 'zl': {
+  'orr': 0xfa9eca,
+  'iwkzb': !0,
+  qxezmL: "https:\/\/example.com\/0dhgm1-U9Qi?v=410",
+  'thwl': "rqzaxdi ijjhchi hshrgdm \u00e9\n",
+  'etbq': ['ngvsnks ilhwc odjfchbda cnbtu omj', "https:\/\/example.com\/kndjPKXCe52?v=335", "https:\/\/example.com\/vBCxP1cE5Sq?v=514",],
+  HtKVmi: "fknbvdykw ndlosz gbfpbqg \u00e9\n"
+},
+ 'hpltlk': "https:\/\/example.com\/CHCmsaksLmF?v=997",
+ iwquao: 0x633179
+},
+/* item 509 */ {
+ 'taidaqw': false,
+ zQtlMR: 979373,
+ VfPHLX: "pjuqhf phidulj bzasowju \u00e9\n",
+ DQluct: 207327,
+ 'hxpolzyp': 'vh jonumml be svqoq hw ldrbumtmv',
+ UaAiJe: {
+  'buxukvm': 'zaxwkgrl fmyr',
+  'wcfrc': "https:\/\/example.com\/qGDkAz3oZIi?v=941",
+  'eims': "myyzwzm yavisut dq \u00e9\n"
+}
+},
+/* item 510 */ {
+ YDJqQu: [,],
+ eWbSZv: ['zkhbr pqcx rgimv zbtin xsjhm yvod', "https:\/\/example.com\/G4wuW6uhZhb?v=542", "https:\/\/example.com\/-Wj15Jg_WvA?v=736",],
+ 'guln': 0x21c2cf
+},
+/* item 511 */ {
+ 'ts': {
+  'tcge': [-902876, 'vhfqmkmle at xfoq tg',],
+  cFfNvW: {
+   ppRrMZ: "xiezhzjcr ffcwhezy ue \u00e9\n",
+   'qhgbzvpil': undefined,
+   lOIANp: 89705
+},
+  'pdl': 'xrurlh',
+  'mblabqtp': {
+   'fnkquh': 0xa3e0b5,
+   'hxaxfl': -672346
+}
+},
+ 'vx': [[-888912, 'ramgh wtcm', !0, 0xea104,], "dyxef vtjugw kmz \u00e9\n",],
+ KWEWBK: {
+  XCrWKR: 612226,
+  'wt': [0x9802af, 'bcuidrxz dc mbuxcknl wy',],
+  'tyu': 'xnakt wfw vx ogyvwz fzptlrg',
+  XRCOoT: {
+   vUzCCh: 'qwyzz owi oqjbijzs drdwrnbz',
+   iiuRkM: "vndpkc ng avcqopq \u00e9\n"
+},
+  'jdcvbnbzj': "iml yx dytlvclx \u00e9\n",
+  'masgjdhfa': 502597
+},
+ HitlNC: {
+  vcZcgc: {
+   xZpTIp: !1,
+   uXqqka: "https:\/\/example.com\/gHDeV5A54ne?v=250",
+   XzNUmy: "https:\/\/example.com\/Oe5jY5UfKNT?v=568"
+},
+  'al': 'lszgm',
+  'rimtebe': 'ttibler vemnqani px',
+  'szbzwn': "https:\/\/example.com\/wOnMVKTfQTw?v=304"
+}
+},
+/* item 512 */ {
+ 'hvppzrcls': {
+  pUJoVh: "https:\/\/example.com\/R0BAuoiyzNo?v=886",
+  'xylzqeb': "https:\/\/example.com\/4nn6thz5mxL?v=211"
+},
+ 'nex': {
+  eDPdcM: "https:\/\/example.com\/co_W-MISnhx?v=826",
+  'ebgymjn': 'iyyjueohn mdh dq eqkzbiqc',
+  'qzfxc': 0x71e602,
+  'bnttzkhx': "ctuj jubndzbj eao \u00e9\n"
+},
+ 'hmeeprfft': ["https:\/\/example.com\/KPXX3KSH3MJ?v=422", {
+   svfIyL: !1,
+   'kj': "mmlsodgj tlwjzs zpi \u00e9\n",
+   dhXrDQ: 'qd',
+   'qjjrwxbnq': -556007
+}, {
+   ndDJVS: 'kv',
+   dWRums: !0,
+   bvuHGB: "pmrit betxbyn qsanicf \u00e9\n"
+},],
+ YtXZHW: ["jgm hzcs vytaknp \u00e9\n", true,],
+ eTHsao: 254787
+},
+/* item 513 */ {
+ qdWreQ: 'owys qahtuzrsn dykrql fnelcsg rzfvf it',
+ EeULFq: ["https:\/\/example.com\/yKLfaQoI-RJ?v=327", 822471, -601509, {
+   JfUjrk: -962616,
+   'uwm': null,
+   'fg': 713536,
+   mCZxIY: "https:\/\/example.com\/PW4MRhCIqMU?v=264",
+   'nwivmr': 145472
+}, 'kwdlsvv emftntr dxjqoqget',],
+ LnBcYV: 659114,
+ 'qgox': "https:\/\/example.com\/FqdhE9eYqtw?v=765",
+ NrhFzk: ["https:\/\/example.com\/WcP9dUXlGbs?v=86", 0xfd92b7, "https:\/\/example.com\/9stzBqF7dcP?v=773", 0x23ec4c, 0x30d263,],
+ zhQozg: 'oc qtfpeq zszqxbsxb dj'
+},
+/* item 514 */ {
+ hEHyxm: 0x178724,
+ 'trsfps': undefined,
+ xvvEsI: [0x688dc6, 0x544806, 0xc2a57e, -521585,]
+},
+/* item 515 */ {
+ 'bfjro': {
+  ACuvpj: null,
+  'mgmwraczz': 'kygsksvsm qeqmjvnr ycb wb tvnpkzo'
+},
+ QsANBa: -416508,
+ bFEyAi: "pm pexggugut pwqpycl \u00e9\n"
+},
+/* item 516 */ {
+ cGmmDU: 630181,
+ iGQzsa: null,
+ 'yibwgc': "rzhww smky yzc \u00e9\n",
+ tQJNTZ: -83121,
+ FpyOGC: {
+  'lbbmq': "cjvp iv jcdfgcv \u00e9\n",
+  'ndfc': {
+   'vwjw': "https:\/\/example.com\/WC7Jrqz1wE9?v=730",
+   fPAQHA: "vlgnqt gllzcn zgitijjhx \u00e9\n",
+   DeWBcY: "hb mf ruuwnsczl \u00e9\n"
+}
+}
+},
+/* item 517 */ {
+ 'qif': "https:\/\/example.com\/OgbE0GC-Oly?v=906",
+ 'gmhzdfc': {
+  nRplJc: {
+   'pobioxbo': "https:\/\/example.com\/2MCv_rufDgO?v=21",
+   'lmgqllj': 0x3cf1df,
+   'caogdmyts': 'yw mpdjet op adegu vidxv uatt'
+},
+  'oe': "https:\/\/example.com\/ALs7RBzpi0d?v=400",
+  irTvdT: "hj idmiogakp jedkni \u00e9\n"
+},
+ qIXqop: "lnhsq rhtikh pnbxkphb \u00e9\n"
+},
+/* item 518 */ {
+ 'fygl': {
+  'dkolybxv': -11025,
+  'ur': [,],
+  dEyNgv: undefined,
+  qTzEPo: 720311,
+  GGtrfe: false,
+  'cc': [741199, "pglw pex zqmwrau \u00e9\n",]
+},
+ cfkKHS: 348888,
+ llClrI: {
+  'zjhsnkuh': 0x4aa920
+},
+ 'eh': "https:\/\/example.com\/tetexnEBHWv?v=407",
+ 'xxvioh': 0x95c585
+},
+/* item 519 */ {
+ IfCtsb: "https:\/\/example.com\/Jc8uMi4HCXp?v=623",
+ EOKFEl: {
+  'jyccu': ["https:\/\/example.com\/vcvyJrmI-_1?v=849",],
+  'jcfozkq': "yhwvvsck ttjjp fzvwth \u00e9\n",
+  KqcDpK: 0x60bee3,
+  ORcubu: "ehfmecqh zivgiqoug wbpjwkwkl \u00e9\n",
+  'ikp': 467877,
+  HXFwAn: [-622060, -458244,]
+},
+ CGYCvf: "https:\/\/example.com\/lgTCBq9Pxcc?v=588",
+ zYZbJj: [0x9a848b,]
+},
+/* item 520 */ {
+ giVZFz: 0x93b738,
+ cfXuef: {
+  XqYhsx: -11337,
+  JjWjGp: 'krgmzdas ymimxu hg txdjsgav omdu fgw'
+},
+ fGKtjD: "qkf uvhfozli rao \u00e9\n",
+ 'nsycfq': !0
+},
+/* item 521 */ {
+ 'tptlgeen': ["https:\/\/example.com\/jvWG45tcUnK?v=279", 0x7f0584, 0x49fedf, {
+   HWPlXg: 0x19b810
+}, "https:\/\/example.com\/VN4qkAgAUtq?v=843",],
+ bliFqh: "https:\/\/example.com\/rNg21J4FepH?v=477",
+ uFqNZJ: 180799,
+ 'felvbmxl': 932845
+},
+/* item 522 */ {
+ igqzxw: {
+  'gmkkanpvg': {
+   ttgYLP: !0,
+   'vqqrlvjaj': "rwgkbkct uphmvpn dauogk \u00e9\n"
+},
+  eFJxMV: 'hl awlc zavcf tpq sjqc yvjcg',
+  NWhait: "https:\/\/example.com\/XBKVZgsFlsn?v=860",
+  'jkafypc': true,
+  TaMWPZ: 'flpewdv mprlwvmcp gitu yx'
+}
+},
+/* item 523 */ {
+ lTfCGN: 0xb6c953
+},
+/* item 524 */ {
+ 'bdvhis': "hjnvjwqfo iljuj eagyfpoox \u00e9\n",
+ 'ob': -538759,
+ bdxhxQ: 0x1bf942,
+ fEaSmZ: "https:\/\/example.com\/XzqVMqBN_LV?v=275"
+},
+/* item 525 */ {
+ 'dupl': false,
+ ztChQR: 643894,
+ QJRSJU: "ocbwx tnrtmfosn vwst \u00e9\n"
+},
+/* item 526 */ {
+ RBtMaN: {
+  'bucgnk': 0x7d5baa
+},
+ mUEUMQ: 0x8edbc2
+},
+/* item 527 */ {
+ 'oi': "kxxxqvmtx odupwwoci qikoxtbvm \u00e9\n",
+ 'qtuxfae': {
+  UJjcRP: 980625
+},
+ 'izceyu': {
+  vpnUrO: "https:\/\/example.com\/xw0ujwmt3p3?v=713",
+  hEcdVI: -800318,
+  wofMkW: [0x6b743e, 0x33ec4e, "https:\/\/example.com\/9XsCfrZQeB_?v=365",]
+},
+ qsmjVm: !1,
+ PpCnCP: undefined
+},
+/* item 528 */ {
+ DEMOYj: 479201,
+ 'hxwfboni': 'ukan zdqor'
+},
+/* item 529 */ {
+ 'witrzqyf': 'ilppf',
+ Onlend: "https:\/\/example.com\/EVMJfPIVE9m?v=877",
+ 'cfotovug': 'lkzn',
+ 'nim': {
+  nffSNz: {
+   nSeZnR: -215493,
+   'ettxi': true,
+   'aomog': undefined,
+   'yyky': -543242,
+   SzMtSd: 'uqdjfrx qkyhr aqjkmi'
+},
+  'kq': {
+   PNAjAm: 0x1dc51,
+   nfFblX: "yfby alunvvpv fqvrwa \u00e9\n",
+   'gpvpyf': true,
+   nVqiYh: true,
+   'fy': false
+},
+  mxkpTE: "https:\/\/example.com\/UUgyB0_v8oB?v=994",
+  'ux': "umwslnlxq thui efu \u00e9\n"
+},
+ JtJuYy: "phdrbv lm kkj \u00e9\n"
+},
+/* item 530 */ {
+ LSfGyg: 0x5c3a9c,
+ lymHnC: -670887,
+ MKEfDs: {
+  WfoKJL: "https:\/\/example.com\/yxXdPyV-hsS?v=828",
+  EZLdkO: 0x3bd054,
+  'ulj': true,
+  DCvYbW: 'abfzabfyj uvdxshotq darfg',
+  uXBYkL: 'mglcwpv rfvizrmx wkpc oblzyf ctmjo belr',
+  GpwwCf: -172839
+},
+ 'hewqtqkx': {
+  axYhjk: "fjeprzred xluwifdug tfk \u00e9\n",
+  ahNqQy: [,]
+},
+ mhujXa: null,
+ RmJBeF: [[-946419, 0xc7e17d, "https:\/\/example.com\/St6_1ySbv-B?v=314", undefined, 'lns apxqetgrm skoba',],]
+},
+/* item 531 */ {
+ BhYCQf: false
+},
+/* item 532 */ {
+ Qieklq: 0xa439eb,
+ faSRRf: 'fdhlo ymlpxc zdjss why klnoph'
+},
+/* item 533 */ {
+ BVwduu: "heulbcyy poqeoesin dvfcqa \u00e9\n",
+ 'rodv': "fdk euhnm tmynh \u00e9\n",
+ 'mzqiblmqd': {
+  'rbnvct': -430054,
+  NsEjBW: 0xc20e69,
+  'ebbrarsx': undefined,
+  'ev': 589584
+},
+ 'qzxgjhe': 0x9a41f0
+},
+/* item 534 */ {
+ uzCmnt: !1,
+ 'tnjd': "https:\/\/example.com\/eTdBORl5l1v?v=516",
+ 'ctmpnjx': "aicdktv ctkswuvpa sxhs \u00e9\n",
+ 'dmgetwq': {
+  rTXrLR: 'rjxo plrejajej romjsczf',
+  'lyssfmk': 0xf8e075,
+  eBsShZ: ["vahzy pzciklcw uieezdrk \u00e9\n",],
+  'fxqrvnbgf': false,
+  'vqoo': {
+   'wdwxvm': "https:\/\/example.com\/AjDUJCokrtW?v=128",
+   'gkbouop': 0xe49659,
+   'ivi': 'rtabczhp hnvma krftvqgxz iwphkquf sezwit',
+   'kagt': 933251,
+   'zx': 11327,
+   HCIDoa: "https:\/\/example.com\/jWDUN3MWrPz?v=867"
+},
+  'cka': {
+   'hvy': "iddcvp lwopjyqkq xyqjleiwa \u00e9\n",
+   iCFrHP: "https:\/\/example.com\/mFmNM_aQlwn?v=776",
+   'lpojt': "https:\/\/example.com\/w_sYeJfJ_9R?v=132",
+   DkruZs: "aiigw wljp pobuw \u00e9\n",
+   gWTFsq: "ppm cinufd nbdw \u00e9\n",
+   'byacy': 'drmlbuuig pnnb eskeqjxul'
+}
+}
+},
+/* item 535 */ {
+ 'dor': {
+  'pkijvg': [0xddd929, "https:\/\/example.com\/fDh7wf1asML?v=422", "xpx umkwwayr hnvcw \u00e9\n", null, 'gvkh',],
+  KmDxdA: 'bqrm jbh unsxbx',
+  'zfsb': 'sgglvgwj',
+  tNAOUB: 'nqc stcfaffn pfkk xpxqksnsw nczy',
+  zQnbFV: ["https:\/\/example.com\/-FJAzMmFac1?v=861", -883348, "https:\/\/example.com\/_YaGeS1huHK?v=102", false, 'mzdnpj rlvh kqk iezsvzd',]
+},
+ 'dewj': {
+  'ztppod': 'en',
+  'xx': 'kjkwot pyeuce uosfxvj cxbvvwnv jy',
+  KNUkaM: "https:\/\/example.com\/A9j60k-3xIP?v=936",
+  KeCkyR: [0xfe8272,]
+}
+},
+/* item 536 */ {
+ mwZEJI: {
+  ODQTfJ: {
+   'hgrdpxswz': 'pmguija'
+},
+  'sds': !0,
+  'irsmzm': {
+   XzGlWW: 'hlxrr snmyjtqwf',
+   'mhsmqlia': 0xd04c7e,
+   QZaXNF: "wxxwlcgtd zoaqdg zomcf \u00e9\n"
+}
+},
+ kxLEeh: "yrocgs erpwv vwmitp \u00e9\n",
+ 'jdth': 'dixjuhs wk vqra',
+ 'czuqtumgv': {
+  'dnybtt': 'zq',
+  'epb': "ofsgbhoct udlxrua kdybemjk \u00e9\n"
+}
+},
+/* item 537 */ {
+ StRqsY: {
+  jnwHSW: !1,
+  'bdavaoici': "al iduhwwz gcsxpdds \u00e9\n"
+},
+ zBaONF: "evbsglv uaeeb diw \u00e9\n",
+ yaXEYb: [751596, {
+   'xfoztuv': "zcsofz zj oolq \u00e9\n",
+   fUPDVp: "https:\/\/example.com\/nZOg-1UP0MD?v=88",
+   'vhkmr': !1,
+   SprUBk: "hbsguy qqvhdku rwfhchst \u00e9\n",
+   uRWExR: "gywrmuix ttyanm xcoujd \u00e9\n",
+   FmTrQZ: 0xe84f0
+}, 'jehduzg fs wq',],
+ yKxGoq: -92396
+},
+/* item 538 */ {
+ NmfyVP: -489908
+},
+/* item 539 */ {
+ CpwqhI: [!1, "eqrcfun xgcxlraef itg \u00e9\n",],
+ 'mh': [,],
+ ZOtaLp: "https:\/\/example.com\/UZhN7XQyBL0?v=424",
+ 'nllez': -51384
+},
+/* item 540 */ {
+ GQWZhc: {
+  'iwekodw': 0x222af,
+  KXiDUD: {
+   JnFuaD: "https:\/\/example.com\/5ZWwHvfWGDE?v=890",
+   'ymyx': "zrdzl cswxdja dkzupj \u00e9\n",
+   'tjwgt': 'iivzns jheh jnqfjrdf twyegjr ermfph',
+   'ppuemqp': 'lykuaiyo cky',
+   LsalmV: false
+}
+},
+ wcRFxO: "https:\/\/example.com\/iNuma2PTucB?v=776",
+ 'yywkyfdo': -286193,
+ aSxQiI: undefined
+},
+/* item 541 */ {
+ 'oci': 0x23a3d0,
+ gnySbV: !1,
+ EIKUDB: 116579,
+ WMDRNp: "fys ydrrj ln \u00e9\n",
+ 'lil': "https:\/\/example.com\/ifkzPF2zujf?v=987",
+ 'buysnz': !1
+},
+/* item 542 */ {
+ rvXFCJ: 364659,
+ 'gloo': !1,
+ KiNqBX: 0x65bda,
+ 'bshb': 'qnvy swjecsuzc wzvmx ooiujuq iu twqj',
+ zKKZRd: null
+},
+/* item 543 */ {
+ 'ixmd': [!1, {
+   jwyZAs: 'pnqps emxe',
+   XdRCJD: 'reslrbqbh oavhi kcuvhr haodsu gem yomub',
+   mCoTpQ: 0x13ad2a,
+   odhXJX: 'zn ko uj voaxq umhyyu'
+}, {
+   'tmlv': !0,
+   NwoQJJ: 0x50f538,
+   gYPOuX: 943153,
+   lwzMXH: "nc vfk igughg \u00e9\n",
+   'btmxeo': -108967,
+   'gquldf': 0x30b805
+},]
+},
+/* item 544 */ {
+ 'kap': undefined,
+ 'kyyuvvldp': ['bwhafkxqc bzkn ibkre axjymqm giyqxdh', 0x876ff1,],
+ 'wdudau': "https:\/\/example.com\/ugMAbTgRYcA?v=369"
+},
+/* item 545 */ {
+ tRGRuv: {
+  ippFeO: "zagqbvicv qozre vsgrlpgog \u00e9\n"
+}
+},
+/* item 546 */ {
+ VhKXLW: 0xaa0326,
+ 'qj': {
+  INHpdD: 'ofzmj qgkjgts etumx hzddrf',
+  oIFrGx: "xt jfnfqas rcccjdkcm \u00e9\n",
+  YKWMXG: "https:\/\/example.com\/UliakJfZmw_?v=162"
+},
+ bfFdeE: {
+  rIDNLn: "https:\/\/example.com\/bGJEfLe9GfM?v=431",
+  'ereaxlrw': 0xa4f704,
+  ttZPus: null
+}
+},
+/* item 547 */ {
+ mngNCr: !1
+},
+/* item 548 */ {
+ oWVuwb: {
+  'rnsaebod': !0
+}
+},
+/* item 549 */ {
+ 'avztnjf': {
+  PYEffk: {
+   RNFecL: 46361,
+   'ncum': 'qepc fey fsm cupau zvnkdc'
+},
+  rSmHyr: {
+   'ujqvi': 0x598e10,
+   mWNYNx: "njunlg vsidluac uc \u00e9\n"
+},
+  XtDcSG: {
+   cIYtur: "jwxvm ggjyomrqe qdnwrjvxk \u00e9\n",
+   XJsuOA: "https:\/\/example.com\/Xq1lp5HL5n6?v=429",
+   'mqon': "https:\/\/example.com\/HnHKxnYAO-O?v=960",
+   ZdHxCJ: true,
+   'subonfd': 0x35b3bc
+},
+  'yb': ["https:\/\/example.com\/N2adfhAgrdh?v=965",],
+  'uvpqshesk': 0xaeaa8b,
+  'dhvif': {
+   luMbMW: "https:\/\/example.com\/wOviq_EfpJq?v=554",
+   'wvivxenh': -961290,
+   wchoJC: null,
+   'cjxvmsf': "ppdehqsxj hhuq ups \u00e9\n",
+   uAbMOC: false,
+   'spjp': "https:\/\/example.com\/F9E0sPeF_9K?v=474"
+}
+},
+ 'paroofbzp': 31004,
+ 'vhaga': ['covyw uywrgwb ixziouxf hgezdqev uqnmo', {
+   skuHTO: "pbrkakms rjeqhqd wprfvjya \u00e9\n"
+},],
+ EDYgLM: {
+  'ra': 'ksgnexci kzmbnk gzzybac uepnlk oufafyjtu fufmztaly'
+},
+ ApfclP: ["ltperi nnagzzq yfz \u00e9\n", {
+   'blbybt': -543930
+},],
+ MkPTVb: 637402
+},
+/* item 550 */ {
+ 'cknvs': "https:\/\/example.com\/mawb1pc6upj?v=273",
+ XuvpPd: {
+  enulAx: "https:\/\/example.com\/_gUqNMCT3ez?v=901",
+  'txr': -819602,
+  'ykhqz': ["jfbwo ydm xqi \u00e9\n", 'odg', -627891,]
+}
+},
+/* item 551 */ {
+ 'wckbbxcj': -759495
+},
+/* item 552 */ {
+ 'zdmem': 0xc9505c
+},
+/* item 553 */ {
+ 'jfwlgsfx': "https:\/\/example.com\/Jz2u5IlmJYQ?v=728",
+ 'siqgwhz': {
+  'wrcg': "https:\/\/example.com\/-kMGLwV0PAo?v=338",
+  'ovalmb': -413390,
+  'phzipupgc': {
+   Nnpewz: 'uhkvglm wwsfdunm',
+   DqPPdi: 'hhfxmhov upbkzbci gim',
+   'udigft': "https:\/\/example.com\/12_UBvfokPb?v=943",
+   GUtEWP: "wwsedf lacmiqn kfvtiqm \u00e9\n"
+},
+  qTjRhY: "vefaez ymhdpycef gkzwlfjhn \u00e9\n"
+},
+ xLcWZo: true,
+ 'ix': {
+  'hxmhyacii': 0xfef62a,
+  ZMVnsH: "https:\/\/example.com\/Ku11GSQiHhT?v=677",
+  'ksekwg': "https:\/\/example.com\/QM9kKG3s7pz?v=533",
+  GOLKzu: "https:\/\/example.com\/x4Rjcxm78Bx?v=153",
+  'hsrsiz': "hy ntytwsfxh dvubuwmc \u00e9\n"
+}
+},
+/* item 554 */ {
+ 'pksdtdv': "https:\/\/example.com\/ttyQqCU-U-g?v=295",
+ 'piywbjvu': 'fd cjdqrrpn fmwvb ed qbkueub',
+ 'ct': [{
+   ehzEpQ: "https:\/\/example.com\/TJWekxFGuah?v=182",
+   eSOVqM: 401841
+}, {
+   aYTYIn: 'eblbdeocr pwkc hwc',
+   IuvRTZ: "https:\/\/example.com\/n2L38U3E8g-?v=801",
+   MVEvpc: "swgbvap wjarn fjaczps \u00e9\n"
+}, {
+   DdLQLo: 0x693d8e,
+   ObaJkm: 211487,
+   twIvFw: "https:\/\/example.com\/FuPpK8njsS8?v=959",
+   'fs': -228069
+},],
+ vyvGxp: 874670,
+ 'ixuht': 'jgrgm htnttis wnhzqa',
+ Hasofu: 0xe1b34
+},
+/* item 555 */ {
+ UizdJS: 0xd3ffa4,
+ mBWlpD: 'fogmyx zy iyoudqu mypd',
+ 'atgmbhqe': {
+  'empy': "kiexapg up an \u00e9\n",
+  uwVjNE: {
+   qDzbbq: "https:\/\/example.com\/FGVDkFiP2WT?v=562"
+},
+  'ykowwsrhv': -123674,
+  VvDZrB: {
+   'naupsjea': false,
+   gOPUNc: 0xa42e57,
+   'uv': 45500
+},
+  eOpntg: 'umxekbmu tkjkuqgco axmbdl yqjtjzz pis wwrfnbc',
+  ExZURU: {
+   'yuhari': "le fpgvtbfyp jqfrq \u00e9\n",
+   aNZpSp: "https:\/\/example.com\/HQRMWLbAv0n?v=927",
+   lSMdMk: 0x7034ac
+}
+},
+ 'jkqdkq': [0x47846e, [null,],],
+ 'cyno': 'zqbui mbibl lccfdekff'
+},
+/* item 556 */ {
+ 'llps': null,
+ 'li': {
+  'woeuyrnw': "nz yozggdgm kjfertge \u00e9\n",
+  'pxgwsz': -809220,
+  'txfgxahd': {
+   eOVTpO: -621815
+}
+}
+},
+/* item 557 */ {
+ pvubXI: {
+  WFbUdK: {
+   'xmhjulfk': 0xd48ed6,
+   'jmnpaaqj': 0xd5e6ff,
+   vVHgUe: 'az nfseo lac pdv',
+   PKYTHu: 173074,
+   'zanie': "https:\/\/example.com\/zojEPhcbg2P?v=408",
+   'bureyh': false
+},
+  jgTAbU: ["bqo qbj ow \u00e9\n",],
+  'crfm': -73638,
+  'lkcgivxi': "https:\/\/example.com\/wOYL07YjvHr?v=396"
+},
+ 'iqmj': !0,
+ MnxMec: [['wygaeles btfxbbux ygbs', 0x56df3b, -911876,], !0, "https:\/\/example.com\/RMjM5asOyEZ?v=627",],
+ 'dffzv': "https:\/\/example.com\/iuIamH8JmY7?v=878",
+ NfTKxe: "kgs xbl jvinwgf \u00e9\n"
+},
+/* item 558 */ {
+ 'llktcve': 'ekudguak lukqngrw zizxwdgh',
+ 'mtgjcya': 'zvct vykhvukn kquah',
+ NIJdSk: !0,
+ 'drfb': 'emld dxbdwki imzsk arqwuv cre'
+},
+/* item 559 */ {
+ 'tgcsq': {
+  'gatmxmm': ["ogwbmi rra aoebq \u00e9\n", "https:\/\/example.com\/KIcguYaxyRZ?v=325", 427019, 0xfccc43,],
+  'comlumkw': 'bgfx',
+  VnVmkm: {
+   'sjhvu': 'bjcwvbim gxvusc jafwnzt vs rhdbckhm',
+   TpRyAi: 'dx tzeuvbgtm zrbcmszk osjgfolu mbuggrekz',
+   'ujunoewo': 0x160944,
+   VJIrMH: undefined,
+   cHeJcA: 0x577ff5
+}
+},
+ 'ybir': {
+  KWjOpY: ["gid hi nupzm \u00e9\n", 0x75f37b, 'znecaibth', 'oael du tvc zjut hbfuokymg', -106290,]
+},
+ rUlClU: {
+  'favg': "https:\/\/example.com\/EkXDBaDz9Y-?v=65",
+  'jh': "vkjqpp dribupew ckpzk \u00e9\n",
+  'xrsahzpnt': "ed uylu gppbnk \u00e9\n",
+  imIzfq: {
+   fluhLr: "https:\/\/example.com\/JDRr17-AXHC?v=186",
+   'zrtn': "pouu qohhfj wakful \u00e9\n",
+   'psbia': true
+},
+  'fnkmuzgsk': ["qaouykd qcgx zlezwap \u00e9\n", 0xc0a4c7, "pyv nx xksl \u00e9\n", 'ypdohzt jdbixlnj wstwlozg iey hv mcfo',]
+}
+},
+/* item 560 */ {
+ 'tuemvxpk': !1,
+ BvoVSQ: true,
+ 'ypay': "https:\/\/example.com\/Hyh1iOgH92j?v=163",
+ 'esdj': false,
+ 'ssp': {
+  IVbDBd: 0x194779,
+  VlWDdH: {
+   'qxkbawzx': !1,
+   vkvHEF: "mcwjuor ql ihbsqrs \u00e9\n",
+   BlFodW: "https:\/\/example.com\/1poDDDAraA8?v=129"
+}
+},
+ EChgLq: "rtxqpeive hqewi uhurazh \u00e9\n"
+},
+/* item 561 */ {
+ pBtnMK: 309642,
+ 'rtwffpvg': [0x32e549, 0xcca014, "https:\/\/example.com\/vPe7ELM5cCf?v=984",],
+ VMohsS: true
+},
+/* item 562 */ {
+ jFvgKl: "https:\/\/example.com\/9obkSua2rqo?v=296",
+ 'mq': 163682,
+ 'dqxztuo': null
+},
+/* item 563 */ {
+ 'zmdwiaf': {
+  HJkSHZ: false,
+  'oizrhbgj': 0x70cb30
+},
+ Kswvri: 'wfsg'
+},
+/* item 564 */ {
+ 'hriir': "https:\/\/example.com\/rfcPLpTPxko?v=486",
+ 'hkfho': "yle foqchgi kjmnipr \u00e9\n",
+ 'zjjaqql': ['fvbsx jnsf dyrb baml uhzzntlc', false, 0xc4a6b0, 'oia',],
+ DwUEnP: 0x4839b4,
+ 'ua': {
+  'yzat': 870854,
+  'aqje': "https:\/\/example.com\/RiSGlw3tS6q?v=14",
+  'irt': "ndbbzhff chqg sbtov \u00e9\n",
+  'mgb': null,
+  kIibMF: {
+   'or': 'jywuwozg ojxlvhn',
+   'mo': 0xc06841
+},
+  JkrMQr: true
+},
+ HBaobM: {
+  'muvwqbk': 'jspycon rdwkcjtbj evfe npxm',
+  'kggrysmdh': 156041,
+  PIhBKP: null,
+  'cnzmb': ["https:\/\/example.com\/d3HeOR8aU8H?v=634", 'fewhh zhwa ouofj rhpftjel', "https:\/\/example.com\/B9WhOTElTqK?v=231", "ox hqwshdhmm udaiqzb \u00e9\n",],
+  OMLBAg: !0
+}
+},
+/* item 565 */ {
+ 'lgxc': {
+  cApVax: 'st',
+  EuLNVO: 'mjqcz jncr nqofxwwqj',
+  'xpzui': "xtidthqd id qxhuhbk \u00e9\n",
+  'gznavyv': false,
+  'mz': {
+   qHJoml: "jgryfk ritxx sqv \u00e9\n",
+   LmMixX: !0,
+   'gyjj': undefined
+}
+},
+ 'ljnvoj': {
+  MMlszb: 0x5c38e8,
+  'hbobcds': {
+   IuKocX: "https:\/\/example.com\/Mti9I0H-8Zb?v=812",
+   KTmmTi: "https:\/\/example.com\/RjYLbSSicw6?v=290",
+   'pnrkooos': "kjkoalf wmqsiyta rr \u00e9\n",
+   bCIpLl: true
+},
+  'sdcys': "https:\/\/example.com\/kZkcvBlxj64?v=642",
+  'zmd': "https:\/\/example.com\/euWVDCU0Obp?v=569",
+  'ir': ["xqwozbtw rovptsqyz yexy \u00e9\n",]
+},
+ vzBqeQ: ['ahhpss ndkxvzah gpxxa epxh', "https:\/\/example.com\/LOV6bTJqtWS?v=369", null, {
+   yLqIhJ: 'tqf pfrj wh koc',
+   'sgznwgme': "hjfez mmw totlxgez \u00e9\n",
+   slbUUL: 'tcmupwfk',
+   'uirumucv': "fdjv tr kqy \u00e9\n",
+   REmTbQ: -987706
+},],
+ 'hmsndmjc': [[0xa3a347, "fgco zqoywtpy bmzxx \u00e9\n", "ymbtuljc qmrqpbmvv cbdjkkr \u00e9\n", !1,], 544403, 0xa48528, 'qzc iydisyu wyjtbmzz hnomxecdl',],
+ qvFVEP: -138457
+},
+/* item 566 */ {
+ 'slmrvny': {
+  'wkihnql': 0xc4a867,
+  XMPxkU: {
+   ONtREz: "https:\/\/example.com\/M5npEe9VXvQ?v=470",
+   'xbycvrw': "cdi xs vvxxhagu \u00e9\n",
+   ycUHaF: 22764,
+   'ucntw': "https:\/\/example.com\/66lCc0qWyzo?v=230"
+}
+},
+ VjoGks: "https:\/\/example.com\/F3YQmoJdngm?v=884",
+ qSeUgh: [["ekl xvp ojpaoyfb \u00e9\n", 0x3a4c49,], [false, "cnja zdazobrc wwfmadzyq \u00e9\n", 0x573e07,],]
+},
+/* item 567 */ {
+ DimIUa: !1,
+ OKZfUT: "hb yqveely mxpwyl \u00e9\n",
+ WqbSnq: 739452,
+ YBzHiL: [{
+   Ibmzah: 'oojxc mzvng zszw',
+   'umaywdn': 0x8a98ad,
+   'cpsfloz': null,
+   'jqrd': 'ovp fay xif dpnr fzqkyu zprc',
+   'phneelm': 0x9c2045,
+   'pnpdpg': 466829
+}, [80671, -169724, 0x235cc3, "xuxfkzz icpoamyz ghna \u00e9\n", !1,], ["https:\/\/example.com\/zO6pCqdd9cR?v=483", 0x7a10d8, "https:\/\/example.com\/EHX43f50NM6?v=585", 270871,], "ixljop ay utbanwsko \u00e9\n", 'dykzlzydn zi',],
+ 'pzm': "casmv ezysnbd dahwmgutl \u00e9\n",
+ 'tyg': 'wvvgwt jcshjmvfd cvgfttda'
+},
+/* item 568 */ {
+ 'dk': -820201,
+ TswYFR: {
+  kzaQPr: 'pjftliulu quyt vofvedfi febhab dcq anq',
+  'hdfwv': {
+   'ghtiy': "https:\/\/example.com\/0FUlfTUp1ej?v=334",
+   YxDlnu: 'sehbfh cniez rszkpliz pkbyvxtpj',
+   wFrJwH: 0x5ca20f,
+   sBjeyl: 0xe20d91,
+   eTWySo: true
+},
+  'qphm': {
+   'jtu': 656745,
+   ZFPICO: "https:\/\/example.com\/12P49AR5voB?v=218",
+   'gyrygs': 'okgqj wowzpjnur jlwj lrqufs',
+   zBlFmT: "cqeosr pcniosi ok \u00e9\n",
+   jmkyoM: 0x570132,
+   'du': 'wdwkzdd fbv qrugrr jvkku ndryltglx xlyb'
+},
+  uUfKNx: {
+   yVnnde: "https:\/\/example.com\/3p9nJFaP2_B?v=866",
+   MqzTCL: 0xd1121c,
+   eNJpUR: -256122,
+   'zapnnhw': 0x268d26,
+   'mp': 0x7ec15e,
+   henuhA: null
+}
+},
+ VHtouw: "https:\/\/example.com\/gffJmDnFl2X?v=813",
+ nNwsZc: {
+  ZpTEuj: "https:\/\/example.com\/kmAv41wAtkl?v=732",
+  'lhearoz': true,
+  'deiaeh': 0xc782aa,
+  'oevqksoyc': {
+   'kwmrqfyh': "https:\/\/example.com\/2wVFZvMoOOR?v=502"
+},
+  IhWOEw: "https:\/\/example.com\/jJlbDmb58DP?v=325"
+}
+},
+/* item 569 */ {
+ KFPABU: {
+  'gwa': !1,
+  BWiYkX: [0xf890d7, 0x71c5c1, 848059,],
+  'goopbkj': 'yzwxle akd mioesjhfj kzcws'
+},
+ hKItcU: 'gpprztsl lpzsqxdw',
+ qlteTg: "https:\/\/example.com\/OqZI9wWT_gA?v=351",
+ 'rf': -998464
+},
+/* item 570 */ {
+ LfXEpJ: "skftkhu lfsqmh tjap \u00e9\n",
+ 'frdjsbytd': 'oecmvm woansnc mcnrx'
+},
+/* item 571 */ {
+ 'sgc': {
+  'bwbb': 644858,
+  'miqcxnb': "em mmieynok nzcvto \u00e9\n"
+}
+},
+/* item 572 */ {
+ lamgsv: 0x21a3e2,
+ 'mszgkq': 0xc218a8,
+ gfuJcG: 'cwbcqfm bj jqkrfep kwzk',
+ didfuB: true
+},
+/* item 573 */ {
+ 'gduzghq': {
+  'fmsarkmjg': -175365,
+  'ggn': !0
+},
+ 'tvn': 'vh omallw',
+ WTgLTl: {
+  ikrnGM: 142212
+}
+},
+/* item 574 */ {
+ 'xwpm': [0x3801e3, !0, -747827, {
+   'jsxfn': 'vjik jzt zijfd kgyot',
+   'uk': !0,
+   snxaDz: "pixf cx zrkykwvce \u00e9\n"
+},]
+},
+/* item 575 */ {
+ yxDIpY: 970627
+},
+/* item 576 */ {
+ 'xmrojafx': 0x4f8630,
+ 'ylmmpbzt': {
+  sixKQh: "https:\/\/example.com\/LNKiiQwkePl?v=508",
+  oxwieP: "iltdw nzf nbnvhaep \u00e9\n",
+  'xnwsaig': 91700,
+  laYSsK: 0x4aa900,
+  ckgwRv: 0xed0b00,
+  jcXHJS: {
+   xnxbFr: true,
+   'pqafxu': 'xqxycxtg vjvpvlpqf zhtem mum ipthhfhqi mucvblo',
+   'hfuwyb': 491478
+}
+},
+ ZsLSxe: 832316,
+ 'zpme': 0xf2705b,
+ 'hgs': 0xe57f47
+},
+/* item 577 */ {
+ FMOqbE: 568356,
+ 'lxzfm': -910028,
+ 'ojxhnodk': {
+  lvsNBH: 'isaf gz lne jo',
+  oPPLpS: {
+   'zcqnujiu': -232494,
+   'btdj': 0xe6f568,
+   'vskg': 'bp qsjbcjsv rswddk'
+}
+},
+ 'oe': "ikjpdgbm kzqhvtima rh \u00e9\n",
+ 'nt': "https:\/\/example.com\/THwtrnkhwWL?v=759"
+},
+/* item 578 */ {
+ 'fhwkjhy': null,
+ nvwsoH: "https:\/\/example.com\/xH51CHQwaGv?v=368",
+ 'oht': 'xexhxxni npwfajnuq thkprncc zohvlj nihjsj',
+ ttmewQ: [0xde33df, {
+   'ymvpmttd': 'sxicb',
+   'oagyfkqco': null,
+   gdqTsZ: 0x57b0a2,
+   'gmfh': "https:\/\/example.com\/LZo3nT-shAT?v=753"
+}, ['ets howfw wcfkjtiv nficrl djkshubsf xdcj', "https:\/\/example.com\/5Y_3TjplvHN?v=785", 'ktmdl uqbhzfqde vcp jsbuve yinem mkl', 0x95aae6, "raaot vuugtl bngcl \u00e9\n",], [,],],
+ zHQXGp: !0,
+ hCusHR: [,]
+},
+/* item 579 */ {
+ 'dzzr': -834345
+},
+/* item 580 */ {
+ NtAlSF: 874576,
+ 'beelymy': undefined
+},
+/* item 581 */ {
+ CZMtcw: [{
+   'fdkryalvo': -59812,
+   tAXdGy: "https:\/\/example.com\/w-B73WLXxqJ?v=600"
+}, {
+   xJLLha: !0
+}, "https:\/\/example.com\/uf-qsGNcfpQ?v=997", {
+   'noroidtu': !0,
+   RbTumR: 0xdcad4c,
+   CzPGHY: 0xd257dd,
+   'cznisl': 'uoqczr lvuya ucdho oqxigpemc yvzis cuaqe'
+},]
+},
+/* item 582 */ {
+ FheWnR: 0x77c252,
+ jLUwcJ: 572837,
+ 'xnnuae': "wikt afsvgsntd dd \u00e9\n",
+ 'ridej': -669691,
+ egUpQc: {
+  'hutp': {
+   mbsVzQ: 0xe30443,
+   'uureltoch': 0x601c5d,
+   'nwsylxs': undefined,
+   'oqpihu': "ahhu shotsw uqhugqnii \u00e9\n"
+},
+  'rvfana': ["https:\/\/example.com\/VEvOg9OCbjo?v=388", "https:\/\/example.com\/g9oHHvSFCt8?v=384", "https:\/\/example.com\/DKfkv3THXP9?v=429", 0xbc8fce,]
+}
+},
+/* item 583 */ {
+ MycEsq: {
+  mQPKHp: 900464,
+  'bpwsbkyr': {
+   buCXHa: -811577,
+   qgrIoh: -536735,
+   'xyaxhdnv': 'izq pmzpdrgg li',
+   'wuwn': "rxi nweuia yoasdbw \u00e9\n",
+   'kvgs': 0x226e48
+},
+  'rd': [false, 230145, !1, 'tuclbr aory oqc',],
+  'ziwzz': {
+   'hzdffdrbp': "https:\/\/example.com\/BMpBGMBazRD?v=666",
+   kNiXVa: "aj hcjsswgb va \u00e9\n"
+},
+  OBcVdB: 190810
+},
+ 'dih': 'fqlmwel bsjamcpxl fww',
+ 'gopdbgjcv': [-771708, ['rtkcu rcpyqjbbg wxexcck wawmkbpk', 'iycnxvobc ab djfxr', "https:\/\/example.com\/leQhqTZTPH4?v=934", 0xb4ec8f, "fyumc qct kaughqghe \u00e9\n",], {
+   'svwiveke': "bbnai dukzmxo mxxuo \u00e9\n",
+   wQhyFW: 'wvawk xfcecgl yekufqumx qifxlwvoa',
+   'sjlxsi': "coiuf ltpemtumt ijvx \u00e9\n",
+   KPPILS: "https:\/\/example.com\/8VGFjlGj6Ly?v=44",
+   'pbssmxny': "https:\/\/example.com\/EgtQL8in1BC?v=300"
+},],
+ 'fztgctxz': 0x91dde6
+},
+/* item 584 */ {
+ gjFoyv: {
+  'jyr': 0xda4b16
+},
+ OCYSBn: {
+  cKsxFi: {
+   KPzzIM: null,
+   TyKRHl: 0x1fe2cb,
+   'wq': null,
+   'kxitxdby': -573696,
+   'uroag': 652663
+},
+  CQasgn: 'kqet fm tdfzh qpavy',
+  VybBIw: [105450, -751726, 'ptdb ixpdkfc', 'vem',]
+},
+ 'hjha': {
+  'onbw': "https:\/\/example.com\/YtudHmUQbGb?v=390",
+  MvpBzg: "https:\/\/example.com\/rHc7U4Y_sxO?v=842",
+  lNDrgl: {
+   JCwfAK: !1,
+   sAHWEx: 'cys gteugfei xpkbwfg',
+   'lslowovir': "https:\/\/example.com\/VBzTqCz3FhS?v=32",
+   PQCYin: 180884,
+   QakTZi: undefined,
+   pRteiQ: "xm efdiiggej ttvwokm \u00e9\n"
+},
+  'ldv': !1,
+  'nid': 'hyus pmth uqoqpoxr',
+  'npyqrzhag': "ksgf wu vwot \u00e9\n"
+},
+ UxpzLA: "avubx dapr ipaozs \u00e9\n",
+ upRmpV: [null, false, 0x4ca4b2, {
+   'muktot': 'ooviiyndb',
+   qaugbi: -784714,
+   'kzu': 0x13a00c,
+   'hrzks': "girfesigc tug lt \u00e9\n",
+   CSWhDP: 0x5a097,
+   IVTBSa: -788225
+}, 'jq cnufzq uzgg',]
+},
+/* item 585 */ {
+ 'rlmh': {
+  'ty': 'auxav gwrmsonz yicokse',
+  CLyKDw: 0xebabb9,
+  'rjv': 'iqzuixtau'
+}
+},
+/* item 586 */ {
+ 'pap': {
+  'wrolfp': {
+   'pnbkhsrd': -945344,
+   YtGres: null,
+   'ot': 'uz kqvke femeni yqacu',
+   iIhsps: "hfjzqngz qs dvrpm \u00e9\n",
+   CJFswu: "mh imfardltr bh \u00e9\n"
+},
+  KHLUBO: false,
+  CHWDyC: 626549,
+  ELVEXs: 0x8acd32,
+  reVuXr: "lbbufara ecydpuey hspag \u00e9\n",
+  OpOWGY: {
+   'zdo': "jarloqs tq vny \u00e9\n"
+}
+},
+ 'miyj': ['wdmznzxs wgmeipebf yo bc vgqylqvmk', "https:\/\/example.com\/ffyjjh4h2di?v=22", !0, "https:\/\/example.com\/hcNABGRQ4ki?v=888", 0x932cae,],
+ 'mlxvfwxwx': "https:\/\/example.com\/e4pqEFWx0RE?v=258"
+},
+/* item 587 */ {
+ cQuobY: 0xbe8ed2,
+ 'flij': "https:\/\/example.com\/wuPg7l3Znhi?v=857",
+ 'rjo': "https:\/\/example.com\/Q7pD4abcVsY?v=503",
+ 'rp': 0xba586b,
+ kSFUao: {
+  sfOiMe: 0x6b061f,
+  'dqqymnb': "dw ncvmnxl py \u00e9\n",
+  'zg': -778517
+}
+},
+/* item 588 */ {
+ 'wv': undefined
+},
+/* item 589 */ {
+ SPbAnw: ["rd vwnzmxmp afac \u00e9\n", !1, "https:\/\/example.com\/IWDIh3RTLqw?v=95",],
+ BniwZg: 0x138097,
+ EhjThk: !0,
+ 'bnhetlhs': "fl prmw xbc \u00e9\n",
+ cGgskZ: {
+  inXrwW: {
+   FrMsal: 0xcd8b8f,
+   'bosong': "sfpe xaxnm qvqfwpo \u00e9\n",
+   'fclo': -330705,
+   'cvapsdgkh': -694909
+},
+  YNCeax: "https:\/\/example.com\/v_2PAZceo_t?v=514",
+  'kwwtxwozg': ['jjf ru ruj hg ljk', "https:\/\/example.com\/W5J7ox62Vw0?v=722", 'eoewxw yh bqpqyws ckeydkev', true,],
+  ASHryc: 0xa74ae0,
+  'dvu': ["cp nvwirrdqd dfjc \u00e9\n", "se zknm lweq \u00e9\n", "swzlxp zqwwox ebovtkbt \u00e9\n", !0,]
+}
+},
+/* item 590 */ {
+ sVhHdc: "ydodrcppn miqtxhgl gf \u00e9\n",
+ iEnYog: 639481
+},
+/* item 591 */ {
+ gGoNHL: "https:\/\/example.com\/mMV5KiT7ZWw?v=286",
+ 'mhahka': "https:\/\/example.com\/UbrC3JWXJlK?v=192",
+ 'betj': 222310,
+ vQiBSz: ["https:\/\/example.com\/QikBAMZKuBn?v=617",]
+},
+/* item 592 */ {
+ 'xsiu': [,],
+ 'hapwhz': 'vkiuf jzlp aqokomn',
+ DzOOqh: 0x5c2f5,
+ rFThkx: "lbnyssuun jdg vakytlcz \u00e9\n",
+ 'pofo': -509509,
+ 'nr': 0x7c0792
+},
+/* item 593 */ {
+ 'tyu': "https:\/\/example.com\/wbhffqL_WYa?v=807",
+ 'kkmhjasr': {
+  plnBlk: 0x603b21,
+  'omx': "https:\/\/example.com\/GCVrlVxDDfx?v=12",
+  'dcmx': !1,
+  'hxitlji': "https:\/\/example.com\/wpwqGZifY7_?v=212"
+},
+ 'yvgxxpiq': !0
+},
+/* item 594 */ {
+ 'nw': {
+  'fjrdlnbcs': 0x5ae71e
+},
+ 'ql': -755116,
+ jTpIDU: -946749,
+ 'euqcenlv': [,],
+ grJgNN: 0x43a2fe,
+ ZwRIDT: 0x4930d8
+},
+/* item 595 */ {
+ 'andjtjyxx': {
+  'bhpxtymrr': 'hfqm awwzctton ikthay',
+  'mzptlzqtf': -81413,
+  'nhcfpcn': [null,],
+  'fshaxmf': {
+   AIxTly: 'qpy ilbuo mqmr tzpgr ymh',
+   aufGka: -79933,
+   qqUNOx: -261701,
+   IembxL: false,
+   lBmrPX: -866845,
+   'dbneume': 0x6a9d15
+},
+  'ktouttb': 'cestzp',
+  'zypzk': 0xff1fc0
+},
+ ygeHYu: 'jeh qkhoo'
+},
+/* item 596 */ {
+ sjhCxw: [{
+   'ov': 0xf539b1,
+   'hjxy': 0xf3677b,
+   'plykmir': 'wbtamtkde elp pe lnnnnhwyt vyl',
+   BLNdCS: 0x373dc0
+}, -707017, 0x57bc98,]
+},
+/* item 597 */ {
+ 'bn': [{
+   NVidsB: "https:\/\/example.com\/ZPk75q2YjbK?v=243",
+   JRkSsC: "pgzinwqc qlppemndz rtek \u00e9\n",
+   'mlqkliqop': -24499,
+   'tkinh': !1,
+   CIIkxO: -785432,
+   MNSntd: 'bwkfmaxg bxrgvj tbyaiqklx elfax uu'
+}, 0xfb5c52,]
+},
+/* item 598 */ {
+ ADqRry: {
+  'ydxi': ["https:\/\/example.com\/nfcaP7YplrS?v=288",],
+  'kdbuuim': [-337819, "no qxejudzq idu \u00e9\n", "gdm spjrcwin pewqp \u00e9\n", 'vhjqwnbru wug',],
+  YNovCG: 0x7947a7,
+  'avbiezkkb': 'nygf nvcbq ix ov wsikjz',
+  hIdiZV: {
+   uqriZW: null,
+   NKdzwe: "cshqhi lzj fflpmwp \u00e9\n",
+   'qtfgvgeku': 0x2d2fea,
+   'jkkzstdl': !0
+},
+  'mecas': 'tvnnnzo lvtsrb'
+},
+ SFxdIR: false,
+ 'ghhttdkkx': "https:\/\/example.com\/xMS5BZKjYfY?v=462",
+ 'fudscjhmi': {
+  'sh': [-522355, "https:\/\/example.com\/3D75Nc_aY-h?v=559",]
+},
+ JyEJDO: 0x3f20cc,
+ 'aauyspu': "avsc hctqgyp tmpt \u00e9\n"
+},
+/* item 599 */ {
+ AIzdxp: "yf gjsyx yjsr \u00e9\n",
+ 'uyvroqew': 0x5afc86
+}
+  ],
+  count: 600,
+}
@@ -1,10 +1,13 @@
 import collections
+import concurrent.futures
 import contextlib
+import contextvars
 import copy
 import datetime as dt
 import errno
 import fileinput
 import functools
+import hashlib
 import http.cookiejar
 import io
 import itertools
@@ -19,6 +22,7 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import tokenize
 import traceback
@@ -31,6 +35,7 @@
 from .downloader import FFmpegFD, get_suitable_downloader, shorten_protocol_name
 from .downloader.rtmp import rtmpdump_version
 from .extractor import gen_extractor_classes, get_info_extractor, import_extractors
+from .extractor._dispatch import ExtractorIndex, get_url_keys
 from .extractor.common import UnsupportedURLIE
 from .extractor.openload import PhantomJSwrapper
 from .globals import (
@@ -43,8 +48,10 @@
     all_plugins_loaded,
     plugin_dirs,
 )
+from .metrics import Metrics
 from .minicurses import format_text
-from .networking import HEADRequest, Request, RequestDirector
+from .networking import HEADRequest, Request, RequestDirector, load_request_handlers
+from .networking.cache import HTTPCache
 from .networking.common import _REQUEST_HANDLERS, _RH_PREFERENCES
 from .networking.exceptions import (
     HTTPError,
@@ -54,7 +61,8 @@
     network_exceptions,
 )
 from .networking.impersonate import ImpersonateRequestHandler, ImpersonateTarget
-from .plugins import directories as plugin_directories, load_all_plugins
+from .networking.ratelimit import HostRateLimiter
+from .plugins import directories as plugin_directories, load_all_plugins, plugin_index
 from .postprocessor import (
     EmbedThumbnailPP,
     FFmpegFixupDuplicateMoovPP,
@@ -108,6 +116,7 @@
     PostProcessingError,
     ReExtractInfo,
     RejectedVideoReached,
+    SQLiteDownloadArchive,
     SameFileError,
     UnavailableVideoError,
     UserNotLive,
@@ -194,6 +203,16 @@ def wrapper(self, *args, **kwargs):
     return wrapper
 
 
+class _ReplacementFormatter(string.Formatter):
+    def get_field(self, field_name, args, kwargs):
+        if field_name.isdigit():
+            return args[0], -1
+        raise ValueError('Unsupported field')
+
+
+_OUTTMPL_REPLACEMENT_FORMATTER = _ReplacementFormatter()
+
+
 class YoutubeDL:
     """YoutubeDL class.
 
@@ -327,6 +346,14 @@ class YoutubeDL:
     skip_download:     Skip the actual download of the video file
     cachedir:          Location of the cache files in the filesystem.
                        False to disable filesystem cache.
+    extraction_cache_ttl: Number of seconds for which the extracted information of
+                       videos is kept in the cache and reused (Default: not cached).
+                       It is kept for less time if the format URLs expire earlier.
+                       It is not reused with other cookies, credentials or proxy
+    http_cache_size:   Maximum total size in bytes of the webpages and API responses
+                       of extractors that are kept in the cache and reused as long as
+                       their Cache-Control headers allow (Default: not cached).
+                       See yt_dlp.networking.cache.HTTPCache
     noplaylist:        Download single video instead of a playlist if in doubt.
     age_limit:         An integer representing the user's age in years.
                        Unsuitable videos for the given age are skipped.
@@ -341,10 +368,29 @@ class YoutubeDL:
                        downloaded. None for no limit.
     download_archive:  A set, or the name of a file where all downloads are recorded.
                        Videos already present in the file are not downloaded again.
+                       If the file is a SQLite database (or does not exist and has one of the
+                       extensions in SQLiteDownloadArchive.EXTENSIONS), it is queried on demand
+                       instead of being loaded into memory
+    import_download_archive: A list of plain text archive files whose IDs are added to
+                       the SQLite download_archive
     break_on_existing: Stop the download process after attempting to download a
                        file that is in the archive.
     break_per_url:     Whether break_on_reject and break_on_existing
                        should act on each input URL as opposed to for the entire queue
+    concurrent_entries: Number of playlist entries to extract and download concurrently.
+                       The console output of each entry is printed only after it
+                       and all the entries before it have been processed
+    concurrent_urls:   Number of the URLs passed to download() to process concurrently.
+                       The console output of each URL is printed only after it
+                       and all the URLs before it have been processed.
+                       Ignored with break_per_url
+    concurrent_urls_per_site: Maximum number of the URLs that are handled by the same
+                       extractor (or, for the generic extractor, have the same host)
+                       to process concurrently
+    metrics_file:      File to write the time spent in each phase of processing the URLs to.
+                       See yt_dlp.metrics for the phases
+    metrics_format:    Format of metrics_file; "ndjson" (default) for one JSON object
+                       per URL, or "prometheus" for the totals in the Prometheus text format
     cookiefile:        File name or text stream from where cookies should be read and dumped to
     cookiesfrombrowser:  A tuple containing the name of the browser, the profile
                        name/path from where cookies are loaded, the name of the keyring,
@@ -410,6 +456,9 @@ class YoutubeDL:
                                          downloaded video fragment.
                        * fragment_count: The number of fragments (= individual
                                          files that will be merged)
+                       * network_timings: The timings of the HTTP request the
+                                          data is being read from, as a dict of
+                                          RequestTimings fields (HTTP downloader only)
 
                        Progress hooks are guaranteed to be called at least once
                        (with status "finished") if the download is successful.
@@ -447,6 +496,11 @@ class YoutubeDL:
                        Actual sleep time will be a random float from range
                        [sleep_interval; max_sleep_interval].
     sleep_interval_subtitles: Number of seconds to sleep before each subtitle download
+    host_request_rate: Maximum number of HTTP requests per second to each host.
+                       Requests to a host that responded with Retry-After
+                       are paused until then. See yt_dlp.networking.ratelimit
+    host_concurrency:  Maximum number of HTTP requests to each host that are
+                       in progress at once
     listformats:       Print an overview of available video formats and exit.
     list_thumbnails:   Print a table of all thumbnails and exit.
     match_filter:      A function that gets called for every video with the signature
@@ -641,6 +695,7 @@ def __init__(self, params=None, auto_init=True):
         self.params = params
         self._ies = {}
         self._ies_instances = {}
+        self._ie_index = None
         self._pps = {k: [] for k in POSTPROCESS_WHEN}
         self._printed_messages = set()
         self._first_webpage_request = True
@@ -650,10 +705,17 @@ def __init__(self, params=None, auto_init=True):
         self._postprocessor_hooks = []
         self._download_retcode = 0
         self._num_downloads = 0
+        self._num_downloads_lock = threading.Lock()
+        self._entry_worker = threading.local()
         self._num_videos = 0
-        self._playlist_level = 0
-        self._playlist_urls = set()
+        # The playlists being processed for the current URL; shared with its concurrent entries
+        self._playlist_urls = contextvars.ContextVar('playlist_urls', default=None)
+        self._playlist_urls_lock = threading.Lock()
         self.cache = Cache(self)
+        self._extraction_cache_stats = collections.Counter()
+        self._network_stats = collections.defaultdict(collections.Counter)  # host: Counter
+        self.metrics = Metrics(self.params.get('metrics_file'), self.params.get('metrics_format'), self)
+        self._format_selectors = {}
         self.__header_cookies = []
 
         # compat for API: load plugins if they have not already
@@ -834,25 +896,59 @@ def check_deprecated(param, option, suggestion):
                 get_postprocessor(pp_def.pop('key'))(self, **pp_def),
                 when=when)
 
-        def preload_download_archive(fn):
-            """Preload the archive, if any is specified"""
-            archive = set()
-            if fn is None:
-                return archive
-            elif not is_path_like(fn):
-                return fn
+        self._archive_loaded_stat = None
+        self.archive = self._preload_download_archive(self.params.get('download_archive'))
 
-            self.write_debug(f'Loading archive file {fn!r}')
-            try:
-                with locked_file(fn, 'r', encoding='utf-8') as archive_file:
-                    for line in archive_file:
-                        archive.add(line.strip())
-            except OSError as ioe:
-                if ioe.errno != errno.ENOENT:
-                    raise
+    def _preload_download_archive(self, fn):
+        """Preload the archive, if any is specified"""
+        archive = set()
+        if fn is None:
+            return archive
+        elif not is_path_like(fn):
+            return fn
+        elif SQLiteDownloadArchive.is_database(fn):
+            self.write_debug(f'Opening archive database {fn!r}')
+            archive = SQLiteDownloadArchive(fn)
+            for import_fn in self.params.get('import_download_archive') or []:
+                self.to_screen(f'[download] Importing archive file {import_fn!r}')
+                archive.import_text(import_fn)
             return archive
+        elif self.params.get('import_download_archive'):
+            raise ValueError('Only a SQLite download archive can import archive files')
 
-        self.archive = preload_download_archive(self.params.get('download_archive'))
+        self.write_debug(f'Loading archive file {fn!r}')
+        self._archive_loaded_stat = self._archive_file_stat(fn)
+        try:
+            with locked_file(fn, 'r', encoding='utf-8') as archive_file:
+                for line in archive_file:
+                    archive.add(line.strip())
+        except OSError as ioe:
+            if ioe.errno != errno.ENOENT:
+                raise
+        return archive
+
+    @staticmethod
+    def _archive_file_stat(fn):
+        try:
+            stat = os.stat(fn)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reset_job_state(self):
+        """Reset the state that is kept between downloads, so that the instance can be reused for another job"""
+        with self._num_downloads_lock:
+            self._num_downloads = self._num_videos = 0
+        self._download_retcode = 0
+        self._printed_messages = set()
+        self._format_selectors = {}
+        self._extraction_cache_stats.clear()
+        self._network_stats.clear()
+        # A text archive is reloaded if it was changed, e.g. by another instance
+        fn = self.params.get('download_archive')
+        if (isinstance(self.archive, set) and is_path_like(fn)
+                and self._archive_file_stat(fn) != self._archive_loaded_stat):
+            self.archive = self._preload_download_archive(fn)
 
     def warn_if_short_id(self, argv):
         # short YouTube ID starting with dash?
@@ -872,6 +968,8 @@ def warn_if_short_id(self, argv):
     def add_info_extractor(self, ie):
         """Add an InfoExtractor object to the end of the list."""
         ie_key = ie.ie_key()
+        if ie_key not in self._ies or get_url_keys(ie) != get_url_keys(self._ies[ie_key]):
+            self._ie_index = None
         self._ies[ie_key] = ie
         if not isinstance(ie, type):
             self._ies_instances[ie_key] = ie
@@ -889,6 +987,12 @@ def get_info_extractor(self, ie_key):
             self.add_info_extractor(ie)
         return ie
 
+    def _candidate_ies(self, url):
+        """Yield (ie_key, ie) for the extractors that may be suitable for the URL, in order"""
+        if self._ie_index is None:
+            self._ie_index = ExtractorIndex(self._ies)
+        return self._ie_index.candidates(url)
+
     def add_default_info_extractors(self):
         """
         Add the InfoExtractors returned by gen_extractors to the end of the list
@@ -951,6 +1055,10 @@ def _write_string(self, message, out=None, only_once=False):
             if message in self._printed_messages:
                 return
             self._printed_messages.add(message)
+        output = getattr(self._entry_worker, 'output', None)
+        if output is not None:
+            output.append((message, out))
+            return
         write_string(message, out=out, encoding=self.params.get('encoding'))
 
     def to_stdout(self, message, skip_eol=False, quiet=None):
@@ -1029,6 +1137,15 @@ def close(self):
         if '_request_director' in self.__dict__:
             self._request_director.close()
             del self._request_director
+        if isinstance(self.archive, SQLiteDownloadArchive) and is_path_like(self.params.get('download_archive')):
+            self.archive.close()
+        if self._extraction_cache_stats:
+            self.write_debug(
+                f'Extraction cache: {self._extraction_cache_stats["hit"]} hits, '
+                f'{self._extraction_cache_stats["miss"]} misses')
+        self._write_network_stats()
+
+        self.metrics.close()
 
         for close_hook in self._close_hooks:
             close_hook()
@@ -1059,6 +1176,7 @@ def trouble(self, message=None, tb=None, is_error=True):
                 self.to_stderr(tb)
         if not is_error:
             return
+        self.metrics.count('errors')
         if not self.params.get('ignoreerrors'):
             if sys.exc_info()[0] and hasattr(sys.exc_info()[1], 'exc_info') and sys.exc_info()[1].exc_info[0]:
                 exc_info = sys.exc_info()[1].exc_info
@@ -1228,6 +1346,120 @@ def _copy_infodict(info_dict):
         info_dict.pop('__pending_error', None)
         return info_dict
 
+    _OUTTMPL_EXTERNAL_FORMAT_RE = re.compile(STR_FORMAT_RE_TMPL.format('[^)]*', f'[{STR_FORMAT_TYPES}ljhqBUDS]'))
+    _OUTTMPL_MATH_FUNCTIONS = {
+        '+': float.__add__,
+        '-': float.__sub__,
+        '*': float.__mul__,
+    }
+    # Field is of the form key1.key2...
+    # where keys (except first) can be string, int, slice or "{field, ...}"
+    _OUTTMPL_FIELD_INNER_RE = r'(?:\w+|%(num)s|%(num)s?(?::%(num)s?){1,2})' % {'num': r'(?:-?\d+)'}  # noqa: UP031
+    _OUTTMPL_FIELD_RE = r'\w*(?:\.(?:%(inner)s|{%(field)s(?:,%(field)s)*}))*' % {  # noqa: UP031
+        'inner': _OUTTMPL_FIELD_INNER_RE,
+        'field': rf'\w*(?:\.{_OUTTMPL_FIELD_INNER_RE})*',
+    }
+    _OUTTMPL_MATH_FIELD_RE = re.compile(rf'(?:{_OUTTMPL_FIELD_RE}|-?{NUMBER_RE})')
+    _OUTTMPL_MATH_OPERATORS_RE = re.compile(r'(?:{})'.format('|'.join(map(re.escape, _OUTTMPL_MATH_FUNCTIONS.keys()))))
+    _OUTTMPL_INTERNAL_FORMAT_RE = re.compile(rf'''(?xs)
+        (?P<negate>-)?
+        (?P<fields>{_OUTTMPL_FIELD_RE})
+        (?P<maths>(?:{_OUTTMPL_MATH_OPERATORS_RE.pattern}{_OUTTMPL_MATH_FIELD_RE.pattern})*)
+        (?:>(?P<strf_format>.+?))?
+        (?P<remaining>
+            (?P<alternate>(?<!\\),[^|&)]+)?
+            (?:&(?P<replacement>.*?))?
+            (?:\|(?P<default>.*?))?
+        )$''')
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_outtmpl(cls, outtmpl):
+        """
+        Parse an output template into a tuple of literal strings and fields,
+        so that prepare_outtmpl does not need to parse it again for every info dict
+        """
+        def _from_user_input(field):
+            if field == ':':
+                return ...
+            elif ':' in field:
+                return slice(*map(int_or_none, field.split(':')))
+            elif int_or_none(field) is not None:
+                return int(field)
+            return field
+
+        def parse_path(fields):
+            fields = [f for x in re.split(r'\.({.+?})\.?', fields)
+                      for f in ([x] if x.startswith('{') else x.split('.'))]
+            for i in (0, -1):
+                if fields and not fields[i]:
+                    fields.pop(i)
+
+            for i, f in enumerate(fields):
+                if not f.startswith('{'):
+                    fields[i] = _from_user_input(f)
+                    continue
+                assert f.endswith('}'), f'No closing brace for {f} in {fields}'
+                fields[i] = {k: list(map(_from_user_input, k.split('.'))) for k in f[1:-1].split(',')}
+            return fields
+
+        def parse_maths(offset_key):
+            """Return a list of (operator, multiplier, offset, offset_path)"""
+            steps, operator = [], None
+            while offset_key:
+                item = (cls._OUTTMPL_MATH_FIELD_RE if operator else cls._OUTTMPL_MATH_OPERATORS_RE).match(
+                    offset_key).group(0)
+                offset_key = offset_key[len(item):]
+                if operator is None:
+                    operator = cls._OUTTMPL_MATH_FUNCTIONS[item]
+                    continue
+                elif not item:
+                    # Evaluating this fails
+                    steps.append((operator, None, None, None))
+                    break
+                item, multiplier = (item[1:], -1) if item[0] == '-' else (item, 1)
+                offset = float_or_none(item)
+                steps.append((operator, multiplier, offset, parse_path(item) if offset is None else None))
+                operator = None
+            return steps
+
+        def parse_field(outer_mobj):
+            key = outer_mobj.group('key')
+            alternatives = []
+            mobj = cls._OUTTMPL_INTERNAL_FORMAT_RE.match(key)
+            while mobj:
+                mobj = mobj.groupdict()
+                alternatives.append({
+                    'fields': mobj['fields'],
+                    'path': parse_path(mobj['fields']),
+                    'negate': mobj['negate'],
+                    'maths': parse_maths(mobj['maths']) if mobj['maths'] else None,
+                    'strf_format': mobj['strf_format'] and mobj['strf_format'].replace('\\,', ','),
+                    'alternate': mobj['alternate'],
+                    'replacement': mobj['replacement'],
+                    'default': mobj['default'],
+                })
+                mobj = mobj['alternate'] and cls._OUTTMPL_INTERNAL_FORMAT_RE.match(mobj['remaining'][1:])
+            return {
+                'key': '{}\0{}'.format(key.replace('%', '%\0'), outer_mobj.group('format')),
+                'prefix': outer_mobj.group('prefix'),
+                'format': outer_mobj.group('format'),
+                'conversion': outer_mobj.group('conversion'),
+                'alternatives': alternatives,
+            }
+
+        parts, last_end = [], 0
+        for outer_mobj in cls._OUTTMPL_EXTERNAL_FORMAT_RE.finditer(outtmpl):
+            if not outer_mobj.group('has_key'):
+                continue
+            if outer_mobj.start() > last_end:
+                parts.append(outtmpl[last_end:outer_mobj.start()])
+            parts.append(parse_field(outer_mobj))
+            last_end = outer_mobj.end()
+        if last_end < len(outtmpl):
+            parts.append(outtmpl[last_end:])
+        return tuple(parts)
+
     def prepare_outtmpl(self, outtmpl, info_dict, sanitize=False):
         """ Make the outtmpl and info_dict suitable for substitution: ydl.escape_outtmpl(outtmpl) % info_dict
         @param sanitize    Whether to sanitize the output as a filename
@@ -1240,8 +1472,10 @@ def prepare_outtmpl(self, outtmpl, info_dict, sanitize=False):
             formatSeconds(info_dict['duration'], '-' if sanitize else ':')
             if info_dict.get('duration', None) is not None
             else None)
-        info_dict['autonumber'] = int(self.params.get('autonumber_start', 1) - 1 + self._num_downloads)
-        info_dict['video_autonumber'] = self._num_videos
+        # The numbers are stored when processing starts, since concurrent entries change the counters meanwhile
+        info_dict['autonumber'] = int(
+            self.params.get('autonumber_start', 1) - 1 + info_dict.get('__autonumber', self._num_downloads))
+        info_dict['video_autonumber'] = info_dict.get('__video_autonumber', self._num_videos)
         if info_dict.get('resolution') is None:
             info_dict['resolution'] = self.format_resolution(info_dict, default=None)
 
@@ -1254,90 +1488,37 @@ def prepare_outtmpl(self, outtmpl, info_dict, sanitize=False):
         }
 
         TMPL_DICT = {}
-        EXTERNAL_FORMAT_RE = re.compile(STR_FORMAT_RE_TMPL.format('[^)]*', f'[{STR_FORMAT_TYPES}ljhqBUDS]'))
-        MATH_FUNCTIONS = {
-            '+': float.__add__,
-            '-': float.__sub__,
-            '*': float.__mul__,
-        }
-        # Field is of the form key1.key2...
-        # where keys (except first) can be string, int, slice or "{field, ...}"
-        FIELD_INNER_RE = r'(?:\w+|%(num)s|%(num)s?(?::%(num)s?){1,2})' % {'num': r'(?:-?\d+)'}  # noqa: UP031
-        FIELD_RE = r'\w*(?:\.(?:%(inner)s|{%(field)s(?:,%(field)s)*}))*' % {  # noqa: UP031
-            'inner': FIELD_INNER_RE,
-            'field': rf'\w*(?:\.{FIELD_INNER_RE})*',
-        }
-        MATH_FIELD_RE = rf'(?:{FIELD_RE}|-?{NUMBER_RE})'
-        MATH_OPERATORS_RE = r'(?:{})'.format('|'.join(map(re.escape, MATH_FUNCTIONS.keys())))
-        INTERNAL_FORMAT_RE = re.compile(rf'''(?xs)
-            (?P<negate>-)?
-            (?P<fields>{FIELD_RE})
-            (?P<maths>(?:{MATH_OPERATORS_RE}{MATH_FIELD_RE})*)
-            (?:>(?P<strf_format>.+?))?
-            (?P<remaining>
-                (?P<alternate>(?<!\\),[^|&)]+)?
-                (?:&(?P<replacement>.*?))?
-                (?:\|(?P<default>.*?))?
-            )$''')
 
-        def _from_user_input(field):
-            if field == ':':
-                return ...
-            elif ':' in field:
-                return slice(*map(int_or_none, field.split(':')))
-            elif int_or_none(field) is not None:
-                return int(field)
-            return field
-
-        def _traverse_infodict(fields):
-            fields = [f for x in re.split(r'\.({.+?})\.?', fields)
-                      for f in ([x] if x.startswith('{') else x.split('.'))]
-            for i in (0, -1):
-                if fields and not fields[i]:
-                    fields.pop(i)
-
-            for i, f in enumerate(fields):
-                if not f.startswith('{'):
-                    fields[i] = _from_user_input(f)
-                    continue
-                assert f.endswith('}'), f'No closing brace for {f} in {fields}'
-                fields[i] = {k: list(map(_from_user_input, k.split('.'))) for k in f[1:-1].split(',')}
-
-            return traverse_obj(info_dict, fields, traverse_string=True)
+        def traverse(path):
+            if len(path) == 1 and isinstance(path[0], str):
+                # Same as traverse_obj for a top-level field, but much faster
+                value = info_dict.get(path[0])
+                return None if value in (None, {}) else value
+            return traverse_obj(info_dict, path, traverse_string=True)
 
-        def get_value(mdict):
+        def get_value(field):
             # Object traversal
-            value = _traverse_infodict(mdict['fields'])
+            value = traverse(field['path'])
             # Negative
-            if mdict['negate']:
+            if field['negate']:
                 value = float_or_none(value)
                 if value is not None:
                     value *= -1
             # Do maths
-            offset_key = mdict['maths']
-            if offset_key:
+            if field['maths'] is not None:
                 value = float_or_none(value)
-                operator = None
-                while offset_key:
-                    item = re.match(
-                        MATH_FIELD_RE if operator else MATH_OPERATORS_RE,
-                        offset_key).group(0)
-                    offset_key = offset_key[len(item):]
-                    if operator is None:
-                        operator = MATH_FUNCTIONS[item]
-                        continue
-                    item, multiplier = (item[1:], -1) if item[0] == '-' else (item, 1)
-                    offset = float_or_none(item)
-                    if offset is None:
-                        offset = float_or_none(_traverse_infodict(item))
+                for operator, multiplier, offset, offset_path in field['maths']:
+                    if multiplier is None:  # Operator without a valid operand
+                        raise IndexError('string index out of range')
+                    if offset_path is not None:
+                        offset = float_or_none(traverse(offset_path))
                     try:
                         value = operator(value, multiplier * offset)
                     except (TypeError, ZeroDivisionError):
                         return None
-                    operator = None
             # Datetime formatting
-            if mdict['strf_format']:
-                value = strftime_or_none(value, mdict['strf_format'].replace('\\,', ','))
+            if field['strf_format']:
+                value = strftime_or_none(value, field['strf_format'])
 
             # XXX: Workaround for https://github.com/yt-dlp/yt-dlp/issues/4485
             if sanitize and value == '':
@@ -1369,41 +1550,26 @@ def _dumpjson_default(obj):
                 return list(obj)
             return repr(obj)
 
-        class _ReplacementFormatter(string.Formatter):
-            def get_field(self, field_name, args, kwargs):
-                if field_name.isdigit():
-                    return args[0], -1
-                raise ValueError('Unsupported field')
-
-        replacement_formatter = _ReplacementFormatter()
-
-        def create_key(outer_mobj):
-            if not outer_mobj.group('has_key'):
-                return outer_mobj.group(0)
-            key = outer_mobj.group('key')
-            mobj = re.match(INTERNAL_FORMAT_RE, key)
+        def create_key(field):
             value, replacement, default, last_field = None, None, na, ''
-            while mobj:
-                mobj = mobj.groupdict()
-                default = mobj['default'] if mobj['default'] is not None else default
-                value = get_value(mobj)
-                last_field, replacement = mobj['fields'], mobj['replacement']
-                if value is None and mobj['alternate']:
-                    mobj = re.match(INTERNAL_FORMAT_RE, mobj['remaining'][1:])
-                else:
+            for alternative in field['alternatives']:
+                default = alternative['default'] if alternative['default'] is not None else default
+                value = get_value(alternative)
+                last_field, replacement = alternative['fields'], alternative['replacement']
+                if value is not None or not alternative['alternate']:
                     break
 
             if None not in (value, replacement):
                 try:
-                    value = replacement_formatter.format(replacement, value)
+                    value = _OUTTMPL_REPLACEMENT_FORMATTER.format(replacement, value)
                 except ValueError:
                     value, default = None, na
 
-            fmt = outer_mobj.group('format')
+            fmt = field['format']
             if fmt == 's' and last_field in field_size_compat_map and isinstance(value, int):
                 fmt = f'0{field_size_compat_map[last_field]:d}d'
 
-            flags = outer_mobj.group('conversion') or ''
+            flags = field['conversion'] or ''
             str_fmt = f'{fmt[:-1]}s'
             if value is None:
                 value, fmt = default, 's'
@@ -1453,11 +1619,12 @@ def create_key(outer_mobj):
                 if fmt[-1] in 'csra':
                     value = sanitize(last_field, value)
 
-            key = '{}\0{}'.format(key.replace('%', '%\0'), outer_mobj.group('format'))
-            TMPL_DICT[key] = value
-            return '{prefix}%({key}){fmt}'.format(key=key, fmt=fmt, prefix=outer_mobj.group('prefix'))
+            TMPL_DICT[field['key']] = value
+            return '{prefix}%({key}){fmt}'.format(key=field['key'], fmt=fmt, prefix=field['prefix'])
 
-        return EXTERNAL_FORMAT_RE.sub(create_key, outtmpl), TMPL_DICT
+        return ''.join(
+            part if isinstance(part, str) else create_key(part)
+            for part in self._compile_outtmpl(outtmpl)), TMPL_DICT
 
     def evaluate_outtmpl(self, outtmpl, info_dict, *args, **kwargs):
         outtmpl, info_dict = self.prepare_outtmpl(outtmpl, info_dict, *args, **kwargs)
@@ -1637,30 +1804,31 @@ def extract_info(self, url, download=True, ie_key=None, extra_info=None,
             ie_key = 'Generic'
 
         if ie_key:
-            ies = {ie_key: self._ies[ie_key]} if ie_key in self._ies else {}
+            ies = [(ie_key, self._ies[ie_key])] if ie_key in self._ies else []
         else:
-            ies = self._ies
+            ies = self._candidate_ies(url)
 
-        for key, ie in ies.items():
-            if not ie.suitable(url):
-                continue
+        with self.metrics.url(url):
+            for key, ie in ies:
+                if not ie.suitable(url):
+                    continue
 
-            if not ie.working():
-                self.report_warning('The program functionality for this site has been marked as broken, '
-                                    'and will probably not work.')
+                if not ie.working():
+                    self.report_warning('The program functionality for this site has been marked as broken, '
+                                        'and will probably not work.')
 
-            temp_id = ie.get_temp_id(url)
-            if temp_id is not None and self.in_download_archive({'id': temp_id, 'ie_key': key}):
-                self.to_screen(f'[download] {self._format_screen(temp_id, self.Styles.ID)}: '
-                               'has already been recorded in the archive')
-                if self.params.get('break_on_existing', False):
-                    raise ExistingVideoReached
-                break
-            return self.__extract_info(url, self.get_info_extractor(key), download, extra_info, process)
-        else:
-            extractors_restricted = self.params.get('allowed_extractors') not in (None, ['default'])
-            self.report_error(f'No suitable extractor{format_field(ie_key, None, " (%s)")} found for URL {url}',
-                              tb=False if extractors_restricted else None)
+                temp_id = ie.get_temp_id(url)
+                if temp_id is not None and self.in_download_archive({'id': temp_id, 'ie_key': key}):
+                    self.to_screen(f'[download] {self._format_screen(temp_id, self.Styles.ID)}: '
+                                   'has already been recorded in the archive')
+                    if self.params.get('break_on_existing', False):
+                        raise ExistingVideoReached
+                    break
+                return self.__extract_info(url, self.get_info_extractor(key), download, extra_info, process)
+            else:
+                extractors_restricted = self.params.get('allowed_extractors') not in (None, ['default'])
+                self.report_error(f'No suitable extractor{format_field(ie_key, None, " (%s)")} found for URL {url}',
+                                  tb=False if extractors_restricted else None)
 
     def _handle_extraction_exceptions(func):
         @functools.wraps(func)
@@ -1801,14 +1969,22 @@ def _apply_header_cookies(self, url, cookies=None):
     def __extract_info(self, url, ie, download, extra_info, process):
         self._apply_header_cookies(url)
 
-        try:
-            ie_result = ie.extract(url)
-        except UserNotLive as e:
-            if process:
-                if self.params.get('wait_for_video'):
-                    self.report_warning(e)
-                self._wait_for_video()
-            raise
+        self.metrics.set_extractor(ie.ie_key())
+        cache_key = self._extraction_cache_key(ie, url)
+        ie_result = self._load_extraction_cache(cache_key, ie)
+        if ie_result is None:
+            cookies = cache_key and self._cookies_state()
+            try:
+                with self.metrics.timer('extract'):
+                    ie_result = ie.extract(url)
+            except UserNotLive as e:
+                if process:
+                    if self.params.get('wait_for_video'):
+                        self.report_warning(e)
+                    self._wait_for_video()
+                raise
+            if cache_key and isinstance(ie_result, dict):
+                self._store_extraction_cache(cache_key, url, ie_result, cookies)
         if ie_result is None:  # Finished already (backwards compatibility; listformats and friends should be moved here)
             self.report_warning(f'Extractor {ie.IE_NAME} returned nothing{bug_reports_message()}')
             return
@@ -1827,6 +2003,82 @@ def __extract_info(self, url, ie, download, extra_info, process):
         else:
             return ie_result
 
+    _EXPIRE_RE = re.compile(r'[?&/;](?:expires?|expiry|exp)[=/](?P<timestamp>\d{10})\b', re.IGNORECASE)
+
+    # Parameters that change what an extractor can access, and so the information it extracts
+    _EXTRACTION_IDENTITY_PARAMS = (
+        'username', 'password', 'usenetrc', 'netrc_location', 'netrc_cmd', 'videopassword',
+        'ap_mso', 'ap_username', 'ap_password', 'client_certificate', 'client_certificate_key',
+        'proxy', 'geo_verification_proxy', 'geo_bypass', 'geo_bypass_country', 'geo_bypass_ip_block',
+        'source_address', 'impersonate')
+
+    def _extraction_cache_key(self, ie, url):
+        """Key of the information of url in the extraction cache, or None if it is not cached"""
+        if not self.params.get('extraction_cache_ttl') or not self.cache.enabled:
+            return None
+        url_hash = hashlib.sha256(json.dumps([
+            url, self.params.get('extractor_args'),
+            {key: str(self.params[key]) for key in self._EXTRACTION_IDENTITY_PARAMS if self.params.get(key) is not None},
+            self.cookiejar.get_cookie_header(url),
+        ], sort_keys=True).encode()).hexdigest()[:16]
+        return f'{ie.ie_key()}.{(ie.get_temp_id(url) or "")[:64]}.{url_hash}'
+
+    def _cookies_state(self):
+        return {(cookie.domain, cookie.path, cookie.name): (cookie.value, cookie.expires) for cookie in self.cookiejar}
+
+    def _load_extraction_cache(self, key, ie):
+        if not key:
+            return None
+        entry = self.cache.load('extraction', key)
+        if not isinstance(entry, dict) or 'info' not in entry:
+            self._extraction_cache_stats['miss'] += 1
+            return None
+        self._extraction_cache_stats['hit'] += 1
+        ie_result = entry['info']
+        self.to_screen(f'[{ie.IE_NAME}] {ie_result.get("id")}: Using information from the extraction cache')
+        # The downloads may need the cookies that were set while extracting
+        for cookie in entry.get('cookies') or []:
+            self.cookiejar.set_cookie(http.cookiejar.Cookie(
+                0, cookie['name'], cookie['value'], None, False,
+                cookie['domain'], True, cookie['domain'].startswith('.'), cookie['path'], True,
+                cookie['secure'], cookie['expires'], False, None, None, {}))
+        return ie_result
+
+    def _store_extraction_cache(self, key, url, ie_result, cookies_before):
+        """Store the information of url, along with the cookies set while it was extracted"""
+        ttl = self.params.get('extraction_cache_ttl')
+        if (not ttl or ie_result.get('_type', 'video') != 'video'
+                or not (ie_result.get('formats') or ie_result.get('url'))
+                # Comments etc. are extracted only after the video has been processed
+                or '__post_extractor' in ie_result
+                or ie_result.get('is_live') or ie_result.get('live_status') in ('is_live', 'is_upcoming', 'post_live')):
+            return
+        entry = {
+            'info': ie_result,
+            'cookies': [{
+                'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path,
+                'secure': cookie.secure, 'expires': cookie.expires,
+            } for cookie in self.cookiejar
+                if cookies_before.get((cookie.domain, cookie.path, cookie.name)) != (cookie.value, cookie.expires)],
+        }
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError):
+            self.write_debug(f'Not saving the information of {url} to the extraction cache since it is not serializable')
+            return
+
+        expires = time.time() + ttl
+        for format_url in traverse_obj(ie_result, (
+                (None, ('formats', ...)), ('url', 'manifest_url', 'fragment_base_url'), {str})):
+            mobj = self._EXPIRE_RE.search(format_url)
+            if mobj:
+                expires = min(expires, int(mobj.group('timestamp')))
+        for cookie in entry['cookies']:
+            if cookie['expires'] is not None:
+                expires = min(expires, cookie['expires'])
+        if expires > time.time():
+            self.cache.store('extraction', key, entry, expires=expires)
+
     def add_default_extra_info(self, ie_result, ie, url):
         if url is not None:
             self.add_extra_info(ie_result, {
@@ -1941,22 +2193,26 @@ def process_ie_result(self, ie_result, download=True, extra_info=None):
             # Protect from infinite recursion due to recursively nested playlists
             # (see https://github.com/ytdl-org/youtube-dl/issues/27833)
             webpage_url = ie_result.get('webpage_url')  # Playlists maynot have webpage_url
-            if webpage_url and webpage_url in self._playlist_urls:
-                self.to_screen(
-                    '[download] Skipping already downloaded playlist: {}'.format(
-                        ie_result.get('title')) or ie_result.get('id'))
-                return
-
-            self._playlist_level += 1
-            self._playlist_urls.add(webpage_url)
-            self._fill_common_fields(ie_result, False)
-            self._sanitize_thumbnails(ie_result)
+            playlist_urls, token = self._playlist_urls.get(), None
+            if playlist_urls is None:
+                playlist_urls = set()
+                token = self._playlist_urls.set(playlist_urls)
             try:
+                with self._playlist_urls_lock:
+                    is_duplicate = webpage_url and webpage_url in playlist_urls
+                    playlist_urls.add(webpage_url)
+                if is_duplicate:
+                    self.to_screen(
+                        '[download] Skipping already downloaded playlist: {}'.format(
+                            ie_result.get('title')) or ie_result.get('id'))
+                    return
+
+                self._fill_common_fields(ie_result, False)
+                self._sanitize_thumbnails(ie_result)
                 return self.__process_playlist(ie_result, download)
             finally:
-                self._playlist_level -= 1
-                if not self._playlist_level:
-                    self._playlist_urls.clear()
+                if token:
+                    self._playlist_urls.reset(token)
         elif result_type == 'compat_list':
             self.report_warning(
                 'Extractor {} returned a compat_list result. '
@@ -2072,18 +2328,18 @@ def __process_playlist(self, ie_result, download):
         if keep_resolved_entries:
             self.write_debug('The information of all playlist entries will be held in memory')
 
-        failures = 0
-        max_failures = self.params.get('skip_playlist_after_errors') or float('inf')
-        for i, (playlist_index, entry) in enumerate(entries):
-            if lazy:
-                resolved_entries.append((playlist_index, entry))
-            if not entry:
-                continue
+        def iter_entries():
+            for i, (playlist_index, entry) in enumerate(entries):
+                if lazy:
+                    resolved_entries.append((playlist_index, entry))
+                if not entry:
+                    continue
+                if not lazy and 'playlist-index' in self.params['compat_opts']:
+                    playlist_index = ie_result['requested_entries'][i]
+                yield i, playlist_index, entry
 
+        def process_entry(i, playlist_index, entry):
             entry['__x_forwarded_for_ip'] = ie_result.get('__x_forwarded_for_ip')
-            if not lazy and 'playlist-index' in self.params['compat_opts']:
-                playlist_index = ie_result['requested_entries'][i]
-
             entry_copy = collections.ChainMap(entry, {
                 **common_info,
                 'n_entries': int_or_none(n_entries),
@@ -2092,26 +2348,35 @@ def __process_playlist(self, ie_result, download):
             })
 
             if self._match_entry(entry_copy, incomplete=True) is not None:
-                # For compatabilty with youtube-dl. See https://github.com/yt-dlp/yt-dlp/issues/4369
-                resolved_entries[i] = (playlist_index, NO_DEFAULT)
-                continue
+                return NO_DEFAULT
 
             self.to_screen(
                 f'[download] Downloading item {self._format_screen(i + 1, self.Styles.ID)} '
                 f'of {self._format_screen(n_entries, self.Styles.EMPHASIS)}')
 
-            entry_result = self.__process_iterable_entry(entry, download, collections.ChainMap({
+            return self.__process_iterable_entry(entry, download, collections.ChainMap({
                 'playlist_index': playlist_index,
                 'playlist_autonumber': i + 1,
             }, extra))
-            if not entry_result:
-                failures += 1
-            if failures >= max_failures:
-                self.report_error(
-                    f'Skipping the remaining entries in playlist "{title}" since {failures} items failed extraction')
-                break
-            if keep_resolved_entries:
-                resolved_entries[i] = (playlist_index, entry_result)
+
+        failures = 0
+        max_failures = self.params.get('skip_playlist_after_errors') or float('inf')
+        with contextlib.closing(self.__map_concurrently(
+                process_entry, iter_entries(), self.params.get('concurrent_entries'))) as results:
+            for (i, playlist_index, _), entry_result in results:
+                if entry_result is NO_DEFAULT:
+                    # For compatabilty with youtube-dl. See https://github.com/yt-dlp/yt-dlp/issues/4369
+                    resolved_entries[i] = (playlist_index, NO_DEFAULT)
+                    continue
+                if not entry_result:
+                    failures += 1
+                if failures >= max_failures:
+                    results.close()
+                    self.report_error(
+                        f'Skipping the remaining entries in playlist "{title}" since {failures} items failed extraction')
+                    break
+                if keep_resolved_entries:
+                    resolved_entries[i] = (playlist_index, entry_result)
 
         # Update with processed data
         ie_result['entries'] = [e for _, e in resolved_entries if e is not NO_DEFAULT]
@@ -2130,6 +2395,114 @@ def __process_playlist(self, ie_result, download):
         self.to_screen(f'[download] Finished downloading playlist: {title}')
         return ie_result
 
+    def __map_concurrently(self, func, items, max_workers, key=None, max_per_key=None):
+        """
+        Yield (args, func(*args)) for each tuple of arguments in items, in order
+
+        Up to max_workers items, of which up to max_per_key have the same key(*args),
+        are processed at once in a thread pool. The console output of each item is buffered and printed in order
+        """
+        if (max_workers or 1) <= 1 or hasattr(self._entry_worker, 'output'):
+            for args in items:
+                yield args, func(*args)
+            return
+
+        max_downloads = float(self.params.get('max_downloads') or 'inf')
+        max_per_key = max_per_key or float('inf')
+        condition = threading.Condition()
+        started = running = 0
+        running_per_key = collections.Counter()
+        # Items after this one are not started
+        stop_seq = float('inf')
+
+        def can_start(seq, item_key):
+            if running >= max_workers or running_per_key[item_key] >= max_per_key:
+                return False
+            elif max_downloads == float('inf'):
+                return True
+            # Items are started in order, and only while they cannot exceed --max-downloads
+            return started == seq and (not running or self._num_downloads + running < max_downloads)
+
+        def worker(seq, item_key, output, args):
+            nonlocal started, running, stop_seq
+            self._entry_worker.output = output
+            try:
+                with condition:
+                    condition.wait_for(lambda: seq > stop_seq or can_start(seq, item_key))
+                    if seq > stop_seq:
+                        return
+                    started += 1
+                    running += 1
+                    running_per_key[item_key] += 1
+                    condition.notify_all()
+                try:
+                    return func(*args)
+                except BaseException:
+                    # No further items would have been processed sequentially
+                    with condition:
+                        stop_seq = min(stop_seq, seq)
+                    raise
+                finally:
+                    with condition:
+                        running -= 1
+                        running_per_key[item_key] -= 1
+                        condition.notify_all()
+            finally:
+                del self._entry_worker.output
+
+        if os.name == 'nt':
+            def future_result(future):
+                while True:
+                    try:
+                        return future.result(0.1)
+                    except concurrent.futures.TimeoutError:
+                        continue
+        else:
+            def future_result(future):
+                return future.result()
+
+        def flush_output(output):
+            for message, out in output:
+                self._write_string(message, out)
+
+        # Items that are waiting for their turn must not keep the others from running
+        window = 2 * max_workers
+        pool = concurrent.futures.ThreadPoolExecutor(window)
+        pending, items, interrupted = collections.deque(), enumerate(items), False
+        try:
+            while True:
+                while stop_seq == float('inf') and len(pending) < window:
+                    seq, args = next(items, (None, None))
+                    if args is None:
+                        break
+                    output, item_key = [], key(*args) if key else None
+                    # The metrics of the items are attributed to the URL that they are part of
+                    pending.append((args, output, pool.submit(
+                        contextvars.copy_context().run, worker, seq, item_key, output, args)))
+                if not pending:
+                    break
+                args, output, future = pending.popleft()
+                try:
+                    result = future_result(future)
+                finally:
+                    flush_output(output)
+                yield args, result
+        except KeyboardInterrupt:
+            interrupted = True
+            self.report_error('Interrupted by user. Waiting for all threads to shutdown...', is_error=False, tb=False)
+            raise
+        finally:
+            with condition:
+                stop_seq = -1
+                condition.notify_all()
+            # Entries that had already started are completed, and their output is printed
+            while pending and not interrupted:
+                _, output, future = pending.popleft()
+                with contextlib.suppress(BaseException):
+                    future_result(future)
+                flush_output(output)
+            pool.shutdown(wait=False)
+
     @_handle_extraction_exceptions
     def __process_iterable_entry(self, entry, download, extra_info):
         return self.process_ie_result(
@@ -2274,6 +2647,12 @@ def can_merge():
                 else 'bestvideo*+bestaudio/best')
 
     def build_format_selector(self, format_spec):
+        # The selectors do not hold any state, so they can be reused for every video
+        if format_spec not in self._format_selectors:
+            self._format_selectors[format_spec] = self._build_format_selector(format_spec)
+        return self._format_selectors[format_spec]
+
+    def _build_format_selector(self, format_spec):
         def syntax_error(note, start):
             message = (
                 'Invalid format specification: '
@@ -2769,12 +3148,13 @@ def _raise_pending_errors(self, info):
 
     def sort_formats(self, info_dict):
         formats = self._get_formats(info_dict)
-        formats.sort(key=FormatSorter(
-            self, info_dict.get('_format_sort_fields') or []).calculate_preference)
+        FormatSorter(self, info_dict.get('_format_sort_fields') or []).sort(formats)
 
     def process_video_result(self, info_dict, download=True):
         assert info_dict.get('_type', 'video') == 'video'
-        self._num_videos += 1
+        with self._num_downloads_lock:
+            self._num_videos += 1
+            info_dict['__video_autonumber'] = self._num_videos
 
         if 'id' not in info_dict:
             raise ExtractorError('Missing "id" field in extractor result', ie=info_dict['extractor'])
@@ -3018,7 +3398,8 @@ def is_wellformed(f):
                 self.write_debug(f'Default format spec: {req_format}')
                 format_selector = self.build_format_selector(req_format)
 
-            formats_to_download = self._select_formats(formats, format_selector)
+            with self.metrics.timer('format_selection'):
+                formats_to_download = self._select_formats(formats, format_selector)
             if interactive_format_selection and not formats_to_download:
                 self.report_error('Requested format is not available', tb=False, is_error=False)
                 continue
@@ -3236,6 +3617,9 @@ def dl(self, name, info, subtitle=False, test=False):
                 'overwrites': True,
                 '_no_ytdl_file': True,
             }
+        elif hasattr(self._entry_worker, 'output'):
+            # Progress cannot be shown while the output is buffered
+            params = {**self.params, 'noprogress': True}
         else:
             params = self.params
 
@@ -3253,7 +3637,11 @@ def dl(self, name, info, subtitle=False, test=False):
         new_info = self._copy_infodict(info)
         if new_info.get('http_headers') is None:
             new_info['http_headers'] = self._calc_headers(new_info)
-        return fd.download(name, new_info, subtitle)
+        if self.metrics.enabled and not test:
+            fd.add_progress_hook(lambda status: status['status'] == 'finished' and self.metrics.count(
+                'downloaded_bytes', status.get('downloaded_bytes') or 0))
+        with self.metrics.timer('download'):
+            return fd.download(name, new_info, subtitle)
 
     def existing_file(self, filepaths, *, default_overwrite=True):
         existing_files = list(filter(os.path.exists, orderedSet(filepaths)))
@@ -3289,9 +3677,12 @@ def replace_info_dict(new_info):
             info_dict.clear()
             info_dict.update(new_info)
 
+        with self._num_downloads_lock:
+            self._num_downloads += 1
+            info_dict['__autonumber'] = self._num_downloads
+
         new_info, _ = self.pre_process(info_dict, 'video')
         replace_info_dict(new_info)
-        self._num_downloads += 1
 
         # info_dict['_filename'] needs to be set for backward compatibility
         info_dict['_filename'] = full_filename = self.prepare_filename(info_dict, warn=True)
@@ -3649,21 +4040,57 @@ def wrapper(*args, **kwargs):
         return wrapper
 
     def download(self, url_list):
-        """Download a given list of URLs."""
-        url_list = variadic(url_list)  # Passing a single URL is a common mistake
+        """
+        Download a given list of URLs.
+
+        url_list can be any iterable of URLs. If it has a mark_processed method,
+        it is called each time the next URL, in order, has been processed
+        """
+        mark_processed = getattr(url_list, 'mark_processed', None)
+        url_list = iter(variadic(url_list))  # Passing a single URL is a common mistake
+        first_urls = list(itertools.islice(url_list, 2))
+        url_list = itertools.chain(first_urls, url_list)
         outtmpl = self.params['outtmpl']['default']
-        if (len(url_list) > 1
+        if (len(first_urls) > 1
                 and outtmpl != '-'
                 and '%' not in outtmpl
                 and self.params.get('max_downloads') != 1):
             raise SameFileError(outtmpl)
 
-        for url in url_list:
-            self.__download_wrapper(self.extract_info)(
-                url, force_generic_extractor=self.params.get('force_generic_extractor', False))
+        force_generic_extractor = self.params.get('force_generic_extractor', False)
+
+        def process_url(url):
+            return self.__download_wrapper(self.extract_info)(url, force_generic_extractor=force_generic_extractor)
+
+        def site_key(url):
+            ie_key = 'Generic' if force_generic_extractor else next(
+                (ie_key for ie_key, ie in self._candidate_ies(url) if ie.suitable(url)), 'Generic')
+            if ie_key == 'Generic':
+                return urllib.parse.urlparse(url).netloc.lower()
+            return ie_key
+
+        max_workers = self.params.get('concurrent_urls')
+        if self.params.get('break_per_url'):
+            # The number of downloads, and so the autonumber, is reset when a URL is cancelled
+            max_workers = 1
+        max_per_site = self.params.get('concurrent_urls_per_site')
+        with contextlib.closing(self.__map_concurrently(
+                process_url, ((url,) for url in url_list), max_workers,
+                site_key if max_per_site else None, max_per_site)) as results:
+            for _ in results:
+                if mark_processed:
+                    mark_processed()
 
         return self._download_retcode
 
+    def _url_in_download_archive(self, url):
+        """Whether the download archive has the video of url, as far as can be told without extracting it"""
+        if not self.archive:
+            return False
+        ie_key, ie = next(((ie_key, ie) for ie_key, ie in self._candidate_ies(url) if ie.suitable(url)), (None, None))
+        temp_id = ie and ie.get_temp_id(url)
+        return temp_id is not None and self.in_download_archive({'id': temp_id, 'ie_key': ie_key})
+
     def download_with_info_file(self, info_filename):
         with contextlib.closing(fileinput.FileInput(
                 [info_filename], mode='r',
@@ -3673,7 +4100,8 @@ def download_with_info_file(self, info_filename):
                      for info in variadic(json.loads('\n'.join(f)))]
         for info in infos:
             try:
-                self.__download_wrapper(self.process_ie_result)(info, download=True)
+                with self.metrics.url(info.get('webpage_url')):
+                    self.__download_wrapper(self.process_ie_result)(info, download=True)
             except (DownloadError, EntryNotInPlaylist, ReExtractInfo) as e:
                 if not isinstance(e, EntryNotInPlaylist):
                     self.to_stderr('\r')
@@ -3688,7 +4116,11 @@ def download_with_info_file(self, info_filename):
 
     @staticmethod
     def sanitize_info(info_dict, remove_private_keys=False):
-        """ Sanitize the infodict for converting to json """
+        """ Sanitize the infodict for converting to json
+
+        Nested lists and dicts that need no changes (e.g. the fragments of a format)
+        are shared with the input rather than copied; only the top-level dict is always new
+        """
         if info_dict is None:
             return info_dict
         info_dict.setdefault('epoch', int(time.time()))
@@ -3701,27 +4133,50 @@ def sanitize_info(info_dict, remove_private_keys=False):
         })
 
         if remove_private_keys:
-            reject = lambda k, v: v is None or k.startswith('__') or k in {
+            private_keys = {
                 'requested_downloads', 'requested_formats', 'requested_subtitles', 'requested_entries',
                 'entries', 'filepath', '_filename', 'filename', 'infojson_filename', 'original_url',
                 'playlist_autonumber',
             }
+            reject = lambda k, v: v is None or k.startswith('__') or k in private_keys
         else:
             reject = lambda k, v: False
 
         def filter_fn(obj):
-            if isinstance(obj, dict):
-                return {k: filter_fn(v) for k, v in obj.items() if not reject(k, v)}
-            elif isinstance(obj, (list, tuple, set, LazyList)):
+            if obj is None or isinstance(obj, (str, int, float, bool)):
+                return obj
+            elif isinstance(obj, dict):
+                new = None
+                for i, (k, v) in enumerate(obj.items()):
+                    if reject(k, v):
+                        filtered = NO_DEFAULT
+                    else:
+                        filtered = filter_fn(v)
+                        if new is None and filtered is v:
+                            continue
+                    if new is None:  # Copy only once something has changed
+                        new = dict(itertools.islice(obj.items(), i))
+                    if filtered is not NO_DEFAULT:
+                        new[k] = filtered
+                return obj if new is None else new
+            elif isinstance(obj, list):
+                new = None
+                for i, v in enumerate(obj):
+                    filtered = filter_fn(v)
+                    if new is None and filtered is not v:
+                        new = obj[:i]
+                    if new is not None:
+                        new.append(filtered)
+                return obj if new is None else new
+            elif isinstance(obj, (tuple, set, LazyList)):
                 return list(map(filter_fn, obj))
             elif isinstance(obj, ImpersonateTarget):
                 return str(obj)
-            elif obj is None or isinstance(obj, (str, int, float, bool)):
-                return obj
             else:
                 return repr(obj)
 
-        return filter_fn(info_dict)
+        sanitized = filter_fn(info_dict)
+        return dict(sanitized) if sanitized is info_dict else sanitized
 
     @staticmethod
     def filter_requested_info(info_dict, actually_filter=True):
@@ -3757,7 +4212,8 @@ def run_pp(self, pp, infodict):
         if '__files_to_move' not in infodict:
             infodict['__files_to_move'] = {}
         try:
-            files_to_delete, infodict = pp.run(infodict)
+            with self.metrics.timer('postprocess'):
+                files_to_delete, infodict = pp.run(infodict)
         except PostProcessingError as e:
             # Must be True and not 'only_download'
             if self.params.get('ignoreerrors') is True:
@@ -3776,7 +4232,7 @@ def run_pp(self, pp, infodict):
         return infodict
 
     def run_all_pps(self, key, info, *, additional_pps=None):
-        if key != 'video':
+        if key != 'video' and (self.params['forceprint'].get(key) or self.params['print_to_file'].get(key)):
             self._forceprint(key, info)
         for pp in (additional_pps or []) + self._pps[key]:
             info = self.run_pp(pp, info)
@@ -3814,7 +4270,7 @@ def _make_archive_id(self, info_dict):
             if not url:
                 return
             # Try to find matching extractor for the URL and take its ie_key
-            for ie_key, ie in self._ies.items():
+            for ie_key, ie in self._candidate_ies(url):
                 if ie.suitable(url):
                     extractor = ie_key
                     break
@@ -3828,7 +4284,8 @@ def in_download_archive(self, info_dict):
 
         vid_ids = [self._make_archive_id(info_dict)]
         vid_ids.extend(info_dict.get('_old_archive_ids') or [])
-        return any(id_ in self.archive for id_ in vid_ids)
+        with self.metrics.timer('archive'):
+            return any(id_ in self.archive for id_ in vid_ids)
 
     def record_download_archive(self, info_dict):
         fn = self.params.get('download_archive')
@@ -3838,10 +4295,11 @@ def record_download_archive(self, info_dict):
         assert vid_id
 
         self.write_debug(f'Adding to archive: {vid_id}')
-        if is_path_like(fn):
-            with locked_file(fn, 'a', encoding='utf-8') as archive_file:
-                archive_file.write(vid_id + '\n')
-        self.archive.add(vid_id)
+        with self.metrics.timer('archive'):
+            if is_path_like(fn) and not isinstance(self.archive, SQLiteDownloadArchive):
+                with locked_file(fn, 'a', encoding='utf-8') as archive_file:
+                    archive_file.write(vid_id + '\n')
+            self.archive.add(vid_id)
 
     @staticmethod
     def format_resolution(format, default='unknown'):
@@ -4138,6 +4596,10 @@ def get_encoding(stream):
                 plugin_dirs_msg = ', '.join(found_plugin_directories)
 
         write_debug(f'Plugin directories: {plugin_dirs_msg}')
+        if plugin_index.hits or plugin_index.misses:
+            write_debug(
+                f'Plugin discovery: {plugin_index.hits} cached, {plugin_index.misses} scanned '
+                f'in {plugin_index.time * 1000:.1f}ms')
 
     @functools.cached_property
     def proxies(self):
@@ -4237,8 +4699,15 @@ def urlopen(self, req):
         clean_proxies(proxies=req.proxies, headers=req.headers)
         clean_headers(req.headers)
 
+        self.metrics.count('http_requests')
         try:
-            return self._request_director.send(req)
+            with self.metrics.timer('http'):
+                response = self._request_director.send(req)
+            self._record_request_timings(response)
+            return response
+        except HTTPError as e:
+            self._record_request_timings(e.response)
+            raise
         except NoSupportingHandlers as e:
             for ue in e.unsupported_errors:
                 # FIXME: This depends on the order of errors.
@@ -4281,6 +4750,39 @@ def urlopen(self, req):
                     'Try using --legacy-server-connect', cause=e) from e
             raise
 
+    def _record_request_timings(self, response):
+        timings = response.timings
+        self.metrics.record_request(timings)
+        if response.extensions.get('http_cache'):
+            self.metrics.count(f'http_cache_{response.extensions["http_cache"]}')
+        if not self.params.get('verbose'):
+            return
+        stats = self._network_stats[urllib.parse.urlparse(response.url).hostname or '']
+        stats['requests'] += 1
+        stats['reused'] += bool(timings.reused)
+        stats['tls_handshakes'] += timings.tls_handshakes
+        stats['tls_resumed'] += timings.tls_resumed
+        for name in ('dns', 'connect', 'tls', 'ttfb'):
+            seconds = getattr(timings, name)
+            if seconds is not None:
+                stats[name] += seconds
+                stats[f'{name}_count'] += 1
+
+    def _write_network_stats(self, limit=10):
+        hosts = sorted(self._network_stats.items(), key=lambda item: item[1]['ttfb'], reverse=True)
+        for host, stats in hosts[:limit]:
+            averages = ', '.join(
+                f'{name} {stats[name] / stats[f"{name}_count"] * 1000:.0f}ms'
+                for name in ('dns', 'connect', 'tls', 'ttfb') if stats[f'{name}_count'])
+            tls = (f', {stats["tls_handshakes"]} TLS handshakes ({stats["tls_resumed"]} resumed)'
+                   if stats['tls_handshakes'] else '')
+            self.write_debug(
+                f'Network timings for {host}: {stats["requests"]} requests '
+                f'({stats["reused"]} on reused connections{tls}); average {averages}')
+        if len(hosts) > limit:
+            self.write_debug(f'Network timings for {len(hosts) - limit} more hosts are not shown')
+        self._network_stats.clear()
+
     def build_request_director(self, handlers, preferences=None):
         logger = _YDLLogger(self)
         headers = self.params['http_headers'].copy()
@@ -4313,11 +4815,21 @@ def build_request_director(self, handlers, preferences=None):
             ))
         director.preferences.update(preferences or [])
         if 'prefer-legacy-http-handler' in self.params['compat_opts']:
-            director.preferences.add(lambda rh, _: 500 if rh.RH_KEY == 'Urllib' else 0)
+            def urllib_preference(rh, _):
+                return 500 if rh.RH_KEY == 'Urllib' else 0
+            urllib_preference.shape_only = True
+            director.preferences.add(urllib_preference)
+        director.rate_limiter = HostRateLimiter(
+            self.params.get('host_request_rate'), self.params.get('host_concurrency'), logger,
+            self.params.get('socket_timeout'))
+        if self.params.get('http_cache_size') and self.cache.enabled:
+            director.http_cache = HTTPCache(
+                os.path.join(self.cache._get_root_dir(), 'http'), self.params['http_cache_size'], self.cookiejar)
         return director
 
     @functools.cached_property
     def _request_director(self):
+        load_request_handlers()
         return self.build_request_director(_REQUEST_HANDLERS.values(), _RH_PREFERENCES)
 
     def encode(self, s):
@@ -6,20 +6,23 @@
 
 __license__ = 'The Unlicense'
 
+from . import profiling  # isort: split  # Must be first so that the other imports can be profiled
 import collections
 import getpass
 import itertools
 import optparse
 import os
 import re
+import socket
 import traceback
 
+from .batch import BatchURLs
 from .cookies import SUPPORTED_BROWSERS, SUPPORTED_KEYRINGS, CookieLoadError
 from .downloader.external import get_external_downloader
 from .extractor import list_extractor_classes
 from .extractor.adobepass import MSO_INFO
 from .networking.impersonate import ImpersonateTarget
-from .globals import IN_CLI, plugin_dirs
+from .globals import IN_CLI, plugin_cache_dir, plugin_dirs
 from .options import parseOpts
 from .plugins import load_all_plugins as _load_all_plugins
 from .postprocessor import (
@@ -44,6 +47,7 @@
     GeoUtils,
     PlaylistEntries,
     SameFileError,
+    SQLiteDownloadArchive,
     download_range_func,
     expand_path,
     float_or_none,
@@ -54,7 +58,6 @@
     parse_bytes,
     parse_duration,
     preferredencoding,
-    read_batch_urls,
     read_stdin,
     render_table,
     setproctitle,
@@ -74,24 +77,26 @@ def _exit(status=0, *args):
     raise SystemExit(status)
 
 
-def get_urls(urls, batchfile, verbose):
+def get_urls(urls, batchfile, verbose, checkpoint_file=None):
     """
     @param verbose      -1: quiet, 0: normal, 1: verbose
+    @returns            BatchURLs, which reads the batch file while it is iterated
     """
-    batch_urls = []
+    batch_fd = None
     if batchfile is not None:
         try:
-            batch_urls = read_batch_urls(
+            batch_fd = (
                 read_stdin(None if verbose == -1 else 'URLs') if batchfile == '-'
-                else open(expand_path(batchfile), encoding='utf-8', errors='ignore'))
-            if verbose == 1:
-                write_string('[debug] Batch file urls: ' + repr(batch_urls) + '\n')
+                else open(expand_path(batchfile), 'rb'))
         except OSError:
             _exit(f'ERROR: batch file {batchfile} could not be read')
     _enc = preferredencoding()
-    return [
+    urls = BatchURLs([
         url.strip().decode(_enc, 'ignore') if isinstance(url, bytes) else url.strip()
-        for url in batch_urls + urls]
+        for url in urls], batch_fd, checkpoint_file and expand_path(checkpoint_file))
+    if urls.resumed_line is not None and verbose != -1:
+        write_string(f'[batch] Resuming after line {urls.resumed_line} of {batchfile}\n')
+    return urls
 
 
 def print_extractor_information(opts, urls):
@@ -212,13 +217,28 @@ def validate_minmax(min_val, max_val, min_name, max_name=None):
     validate_positive('autonumber start', opts.autonumber_start)
     validate_positive('autonumber size', opts.autonumber_size, True)
     validate_positive('concurrent fragments', opts.concurrent_fragment_downloads, True)
+    validate_positive('concurrent entries', opts.concurrent_entries, True)
+    validate_positive('concurrent URLs', opts.concurrent_urls, True)
+    validate_positive('concurrent URLs per site', opts.concurrent_urls_per_site, True)
+    validate_positive('extraction cache TTL', opts.extraction_cache_ttl, True)
     validate_positive('playlist start', opts.playliststart, True)
     if opts.playlistend != -1:
         validate_minmax(opts.playliststart, opts.playlistend, 'playlist start', 'playlist end')
 
+    # Batch file
+    validate(opts.batch_checkpoint is None or opts.batchfile not in (None, '-'), '--batch-checkpoint',
+             msg='{name} requires a --batch-file other than stdin')
+
+    # Server
+    validate_regex('server address', opts.serve, r'unix:.')
+    validate(opts.serve is None or hasattr(socket, 'AF_UNIX'), '--serve',
+             msg='{name} is not supported on this platform since it requires Unix sockets')
+
     # Time ranges
     validate_positive('subtitles sleep interval', opts.sleep_interval_subtitles)
     validate_positive('requests sleep interval', opts.sleep_interval_requests)
+    validate_positive('host request rate', opts.host_request_rate, True)
+    validate_positive('host concurrency', opts.host_concurrency, True)
     validate_positive('sleep interval', opts.sleep_interval)
     validate_positive('max sleep interval', opts.max_sleep_interval)
     if opts.sleep_interval is None:
@@ -315,6 +335,7 @@ def validate_bytes(name, value, strict_positive=False):
     opts.max_filesize = validate_bytes('max filesize', opts.max_filesize)
     opts.buffersize = validate_bytes('buffer size', opts.buffersize, True)
     opts.http_chunk_size = validate_bytes('http chunk size', opts.http_chunk_size)
+    opts.http_cache_size = validate_bytes('HTTP cache size', opts.http_cache_size, True)
 
     # Output templates
     def validate_outtmpl(tmpl, msg):
@@ -464,10 +485,19 @@ def metadataparser_actions(f):
 
     if opts.download_archive is not None:
         opts.download_archive = expand_path(opts.download_archive)
+    if opts.import_download_archive:
+        validate(opts.download_archive is not None, '--download-archive',
+                 msg='{name} is required with --import-download-archive')
+        validate(SQLiteDownloadArchive.is_database(opts.download_archive), '--download-archive', opts.download_archive,
+                 'archive files can only be imported into a SQLite {name}; "{value}" is not one')
+        opts.import_download_archive = list(map(expand_path, opts.import_download_archive))
 
     if opts.ffmpeg_location is not None:
         opts.ffmpeg_location = expand_path(opts.ffmpeg_location)
 
+    if opts.metrics_file is not None:
+        opts.metrics_file = expand_path(opts.metrics_file)
+
     if opts.user_agent is not None:
         opts.headers.setdefault('User-Agent', opts.user_agent)
     if opts.referer is not None:
@@ -757,7 +787,9 @@ def get_postprocessors(opts):
 def parse_options(argv=None):
     """@returns ParsedOptions(parser, opts, urls, ydl_opts)"""
     parser, opts, urls = parseOpts(argv)
-    urls = get_urls(urls, opts.batchfile, -1 if opts.quiet and not opts.verbose else opts.verbose)
+    urls = get_urls(
+        urls, opts.batchfile, -1 if opts.quiet and not opts.verbose else opts.verbose,
+        opts.batch_checkpoint if opts.batchfile != '-' else None)
 
     set_compat_opts(opts)
     try:
@@ -858,6 +890,9 @@ def parse_options(argv=None):
         'skip_unavailable_fragments': opts.skip_unavailable_fragments,
         'keep_fragments': opts.keep_fragments,
         'concurrent_fragment_downloads': opts.concurrent_fragment_downloads,
+        'concurrent_entries': opts.concurrent_entries,
+        'concurrent_urls': opts.concurrent_urls,
+        'concurrent_urls_per_site': opts.concurrent_urls_per_site,
         'buffersize': opts.buffersize,
         'noresizebuffer': opts.noresizebuffer,
         'http_chunk_size': opts.http_chunk_size,
@@ -911,9 +946,12 @@ def parse_options(argv=None):
         'max_views': opts.max_views,
         'daterange': opts.date,
         'cachedir': opts.cachedir,
+        'extraction_cache_ttl': opts.extraction_cache_ttl,
+        'http_cache_size': opts.http_cache_size,
         'youtube_print_sig_code': opts.youtube_print_sig_code,
         'age_limit': opts.age_limit,
         'download_archive': opts.download_archive,
+        'import_download_archive': opts.import_download_archive,
         'break_on_existing': opts.break_on_existing,
         'break_on_reject': opts.break_on_reject,
         'break_per_url': opts.break_per_url,
@@ -929,6 +967,8 @@ def parse_options(argv=None):
         'socket_timeout': opts.socket_timeout,
         'bidi_workaround': opts.bidi_workaround,
         'debug_printtraffic': opts.debug_printtraffic,
+        'metrics_file': opts.metrics_file,
+        'metrics_format': opts.metrics_format,
         'prefer_ffmpeg': opts.prefer_ffmpeg,
         'include_ads': opts.include_ads,
         'default_search': opts.default_search,
@@ -952,6 +992,8 @@ def parse_options(argv=None):
         'sleep_interval': opts.sleep_interval,
         'max_sleep_interval': opts.max_sleep_interval,
         'sleep_interval_subtitles': opts.sleep_interval_subtitles,
+        'host_request_rate': opts.host_request_rate,
+        'host_concurrency': opts.host_concurrency,
         'external_downloader': opts.external_downloader,
         'download_ranges': opts.download_ranges,
         'force_keyframes_at_cuts': opts.force_keyframes_at_cuts,
@@ -982,6 +1024,7 @@ def _real_main(argv=None):
     setproctitle('yt-dlp')
 
     parser, opts, all_urls, ydl_opts = parse_options(argv)
+    profiling.checkpoint('parse options')
 
     # Dump user agent
     if opts.dump_user_agent:
@@ -999,15 +1042,20 @@ def _real_main(argv=None):
 
     # load all plugins into the global lookup
     plugin_dirs.value = opts.plugin_dirs
+    plugin_cache_dir.value = opts.cachedir
     if plugin_dirs.value:
         _load_all_plugins()
+    profiling.checkpoint('load plugins')
 
     with YoutubeDL(ydl_opts) as ydl:
-        pre_process = opts.update_self or opts.rm_cachedir
-        actual_use = all_urls or opts.load_info_filename
+        profiling.checkpoint('create YoutubeDL')
+        pre_process = opts.update_self or opts.rm_cachedir or opts.rm_extraction_cache
+        actual_use = all_urls or opts.load_info_filename or opts.serve
 
         if opts.rm_cachedir:
             ydl.cache.remove()
+        elif opts.rm_extraction_cache:
+            ydl.cache.remove('extraction')
 
         try:
             updater = Updater(ydl, opts.update_self)
@@ -1090,12 +1138,25 @@ def make_row(target, handler):
 
         parser.destroy()
         try:
-            if opts.load_info_filename is not None:
+            if opts.serve:
+                if all_urls:
+                    ydl.report_warning('URLs are ignored due to --serve')
+                from .server import serve
+                return serve(opts.serve, ydl_opts, ydl)
+            elif opts.load_info_filename is not None:
                 if all_urls:
                     ydl.report_warning('URLs are ignored due to --load-info-json')
                 return ydl.download_with_info_file(expand_path(opts.load_info_filename))
             else:
-                return ydl.download(all_urls)
+                if ydl.params.get('download_archive') is not None:
+                    all_urls.in_archive = ydl._url_in_download_archive
+                try:
+                    return ydl.download(all_urls)
+                finally:
+                    all_urls.close()
+                    if opts.batchfile is not None:
+                        ydl.write_debug(
+                            f'Batch file: {all_urls.read} URLs read, {all_urls.duplicates} duplicates skipped')
         except DownloadCancelled:
             ydl.to_screen('Aborting remaining downloads')
             return 101
@@ -1122,6 +1183,8 @@ def main(argv=None):
 
 from .extractor import gen_extractors, list_extractors
 
+profiling.checkpoint('import yt_dlp')
+
 __all__ = [
     'YoutubeDL',
     'gen_extractors',
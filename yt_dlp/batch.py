@@ -0,0 +1,235 @@
+"""Read the URLs of batch files (--batch-file) while they are being processed
+
+Batch files can have millions of lines, so they are not loaded into memory. With a download
+archive, repeated URLs are skipped using a Bloom filter, and the position in the batch file can
+be saved to a checkpoint file (--batch-checkpoint) so that an interrupted run continues from there
+"""
+
+import collections
+import contextlib
+import hashlib
+import json
+import operator
+import os
+import time
+
+from .utils import write_json_file, write_string
+from .utils._utils import _batch_url
+
+
+# The bits that each byte of the hash sets in the 8 words of a block
+_WORD_MASKS = [[1 << (word * 32 + byte % 32) for byte in range(256)] for word in range(8)]
+
+
+class BloomFilter:
+    """
+    A set of strings that uses a fixed amount of memory, at the cost of wrongly
+    reporting some items as present.
+
+    This is a split block Bloom filter: each item sets one bit in each of the eight 32-bit words
+    of one 256-bit block, so that a lookup only reads a single block. With the default of 64 bits
+    per item, the rate of false positives is about 1e-6 once the capacity is reached
+
+    @param capacity         The number of items that the filter is sized for
+    @param bits_per_item    Number of bits of memory per item
+    """
+
+    def __init__(self, capacity, bits_per_item=64):
+        self.capacity, self.count = capacity, 0
+        self._num_blocks = max(1, capacity * bits_per_item // 256)
+        self._bits = bytearray(self._num_blocks * 32)
+
+    def _locate(self, item):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        offset = int.from_bytes(digest[:8], 'little') % self._num_blocks * 32
+        return offset, sum(map(operator.getitem, _WORD_MASKS, digest[8:]))
+
+    def __contains__(self, item):
+        offset, mask = self._locate(item)
+        return int.from_bytes(self._bits[offset:offset + 32], 'little') & mask == mask
+
+    def add(self, item):
+        """Add item and return whether it may have been added before"""
+        offset, mask = self._locate(item)
+        block = int.from_bytes(self._bits[offset:offset + 32], 'little')
+        if block & mask == mask:
+            return True
+        self._bits[offset:offset + 32] = (block | mask).to_bytes(32, 'little')
+        self.count += 1
+        return False
+
+
+class ScalableBloomFilter:
+    """
+    A Bloom filter that grows with the number of items; once full,
+    a filter with 4 times the capacity is added
+    """
+
+    def __init__(self, initial_capacity=100_000):
+        self._filters = [BloomFilter(initial_capacity)]
+
+    def __contains__(self, item):
+        return any(item in bloom for bloom in self._filters)
+
+    def add(self, item):
+        """Add item and return whether it may have been added before"""
+        if any(item in bloom for bloom in self._filters[:-1]):
+            return True
+        last = self._filters[-1]
+        if last.count < last.capacity:
+            return last.add(item)
+        elif item in last:
+            return True
+        self._filters.append(BloomFilter(last.capacity * 4))
+        return self._filters[-1].add(item)
+
+
+class BatchURLs:
+    """
+    The URLs of a batch file followed by those given on the command line
+
+    The batch file is read while iterating. If in_archive is set, repeated URLs of the batch file are skipped:
+    when the Bloom filter reports a URL as seen, in_archive confirms that it is recorded in the download archive,
+    so that a false positive of the filter never drops a URL. Without in_archive, no URL is skipped, since the
+    Bloom filter alone cannot tell repeated URLs apart from false positives.
+    The URLs given on the command line are never skipped.
+
+    Call mark_processed() each time the next URL, in order, has been processed. If checkpoint_file
+    is given, the position after the last processed URL is saved to it, and reading resumes from
+    there the next time. The checkpoint is deleted once all the URLs have been processed.
+
+    @param urls             URLs given on the command line
+    @param batch_fd         File object of the batch file. It must be opened in binary mode to use checkpoint_file
+    @param checkpoint_file  Path of the file to save the position in the batch file to
+    """
+
+    CHECKPOINT_INTERVAL = 1  # Minimum number of seconds between writes of the checkpoint
+
+    def __init__(self, urls, batch_fd=None, checkpoint_file=None):
+        self.urls, self.checkpoint_file = urls, checkpoint_file
+        self.in_archive = None
+        self.read = self.duplicates = 0
+        self.resumed_line = None
+        self._fd = batch_fd
+        self._seen = ScalableBloomFilter()
+        self._lookahead = collections.deque()
+        # (offset, line number, line) after each URL that has not been processed yet
+        self._pending = collections.deque()
+        self._position = None  # (offset, line number, line) after the last processed URL
+        self._last_save = 0
+        self._exhausted = False
+        if checkpoint_file and batch_fd:
+            self._position = self._load_checkpoint()
+        self._urls = self._iter_urls()
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_file, encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            offset, line_number = checkpoint['offset'], checkpoint['line']
+            tail_length, tail_hash = checkpoint['tail_length'], checkpoint['tail_hash']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            write_string(f'WARNING: Ignoring invalid batch checkpoint {self.checkpoint_file}: {e}\n')
+            return None
+        # The last processed line must still be there, or this is not the file the checkpoint was saved for
+        self._fd.seek(max(offset - tail_length, 0))
+        tail = self._fd.read(tail_length)
+        if hashlib.sha256(tail).hexdigest() != tail_hash:
+            write_string('WARNING: The batch file has changed since the checkpoint was saved; starting over\n')
+            self._fd.seek(0)
+            return None
+        self.resumed_line = line_number
+        return offset, line_number, tail
+
+    def _iter_lines(self):
+        """Lines of the batch file, split at universal newlines like in text mode"""
+        for line in self._fd:
+            # Binary files are only split at \n
+            yield from line.splitlines(keepends=True) if isinstance(line, bytes) else (line,)
+
+    def _iter_urls(self):
+        """Yield (url, position after its line, whether it is from the batch file)"""
+        if self._fd:
+            with contextlib.closing(self._fd):
+                offset, line_number = (self._position or (0, 0, None))[:2]
+                for line in self._iter_lines():
+                    line_number += 1
+                    if isinstance(line, bytes):
+                        offset += len(line)
+                        position, line = (offset, line_number, line), line.decode('utf-8', 'ignore')
+                    else:
+                        position = None
+                    url = _batch_url(line)
+                    if url:
+                        self.read += 1
+                        yield url, position, True
+        for url in self.urls:
+            yield url, None, False
+
+    def _next_url(self):
+        for url, position, from_batch in self._urls:
+            if from_batch and self.in_archive and self._seen.add(url) and self.in_archive(url):
+                self.duplicates += 1
+                if position is None:
+                    continue
+                elif self._pending:
+                    # Nothing needs to be processed for this line, so the checkpoint can pass it
+                    # as soon as the URL before it has been processed
+                    self._pending[-1] = position
+                else:
+                    self._position = position
+                continue
+            self._pending.append(position)
+            return url
+        self._exhausted = True
+        return None
+
+    def __bool__(self):
+        if not self._lookahead and not self._exhausted:
+            url = self._next_url()
+            if url is not None:
+                self._lookahead.append(url)
+        return bool(self._lookahead)
+
+    def __iter__(self):
+        while True:
+            url = self._lookahead.popleft() if self._lookahead else self._next_url()
+            if url is None:
+                return
+            yield url
+
+    def mark_processed(self):
+        """Record that the earliest URL that was not processed yet has been processed"""
+        position = self._pending.popleft()
+        if position is not None:
+            self._position = position
+        if self.checkpoint_file and time.monotonic() - self._last_save >= self.CHECKPOINT_INTERVAL:
+            self.save_checkpoint()
+
+    def save_checkpoint(self):
+        if not self.checkpoint_file or not self._position:
+            return
+        offset, line_number, line = self._position
+        write_json_file({
+            'offset': offset,
+            'line': line_number,
+            'tail_length': len(line),
+            'tail_hash': hashlib.sha256(line).hexdigest(),
+        }, self.checkpoint_file)
+        self._last_save = time.monotonic()
+
+    @property
+    def completed(self):
+        return self._exhausted and not self._pending and not self._lookahead
+
+    def close(self):
+        self._urls.close()
+        if not self.checkpoint_file:
+            return
+        if self.completed:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.checkpoint_file)
+        else:
+            self.save_checkpoint()
@@ -3,6 +3,7 @@
 import os
 import re
 import shutil
+import time
 import traceback
 import urllib.parse
 
@@ -10,16 +11,20 @@
 from .version import __version__
 
 
+def get_cache_root(cachedir=None):
+    """Return the cache directory for the value of the "cachedir" param"""
+    if cachedir is None:
+        cache_root = os.getenv('XDG_CACHE_HOME', '~/.cache')
+        cachedir = os.path.join(cache_root, 'yt-dlp')
+    return expand_path(cachedir)
+
+
 class Cache:
     def __init__(self, ydl):
         self._ydl = ydl
 
     def _get_root_dir(self):
-        res = self._ydl.params.get('cachedir')
-        if res is None:
-            cache_root = os.getenv('XDG_CACHE_HOME', '~/.cache')
-            res = os.path.join(cache_root, 'yt-dlp')
-        return expand_path(res)
+        return get_cache_root(self._ydl.params.get('cachedir'))
 
     def _get_cache_fn(self, section, key, dtype):
         assert re.match(r'^[\w.-]+$', section), f'invalid section {section!r}'
@@ -30,7 +35,10 @@ def _get_cache_fn(self, section, key, dtype):
     def enabled(self):
         return self._ydl.params.get('cachedir') is not False
 
-    def store(self, section, key, data, dtype='json'):
+    def store(self, section, key, data, dtype='json', *, expires=None):
+        """
+        @param expires  Unix timestamp after which the data is no longer loaded
+        """
         assert dtype in ('json',)
 
         if not self.enabled:
@@ -40,7 +48,10 @@ def store(self, section, key, data, dtype='json'):
         try:
             os.makedirs(os.path.dirname(fn), exist_ok=True)
             self._ydl.write_debug(f'Saving {section}.{key} to cache')
-            write_json_file({'yt-dlp_version': __version__, 'data': data}, fn)
+            cache_data = {'yt-dlp_version': __version__, 'data': data}
+            if expires is not None:
+                cache_data['expires'] = expires
+            write_json_file(cache_data, fn)
         except Exception:
             tb = traceback.format_exc()
             self._ydl.report_warning(f'Writing cache to {fn!r} failed: {tb}')
@@ -49,9 +60,12 @@ def _validate(self, data, min_ver):
         version = traverse_obj(data, 'yt-dlp_version')
         if not version:  # Backward compatibility
             data, version = {'data': data}, '2022.08.19'
-        if not min_ver or version_tuple(version) >= version_tuple(min_ver):
+        if min_ver and version_tuple(version) < version_tuple(min_ver):
+            self._ydl.write_debug(f'Discarding old cache from version {version} (needs {min_ver})')
+        elif data.get('expires') is not None and data['expires'] <= time.time():
+            self._ydl.write_debug('Discarding expired cache')
+        else:
             return data['data']
-        self._ydl.write_debug(f'Discarding old cache from version {version} (needs {min_ver})')
 
     def load(self, section, key, dtype='json', default=None, *, min_ver=None):
         assert dtype in ('json',)
@@ -74,7 +88,8 @@ def load(self, section, key, dtype='json', default=None, *, min_ver=None):
 
         return default
 
-    def remove(self):
+    def remove(self, section=None):
+        """Delete the whole cache, or only the given section of it"""
         if not self.enabled:
             self._ydl.to_screen('Cache is disabled (Did you combine --no-cache-dir and --rm-cache-dir?)')
             return
@@ -82,6 +97,9 @@ def remove(self):
         cachedir = self._get_root_dir()
         if not any((term in cachedir) for term in ('cache', 'tmp')):
             raise Exception(f'Not removing directory {cachedir} - this does not look like a cache dir')
+        if section is not None:
+            assert re.match(r'^[\w.-]+$', section), f'invalid section {section!r}'
+            cachedir = os.path.join(cachedir, section)
 
         self._ydl.to_screen(
             f'Removing cache dir {cachedir} .', skip_eol=True)
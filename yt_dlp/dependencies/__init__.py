@@ -2,6 +2,8 @@
 """Imports all optional dependencies for the project.
 An attribute "_yt_dlp__identifier" may be inserted into the module if it uses an ambiguous namespace"""
 
+from importlib import import_module as _import_module
+
 try:
     import brotlicffi as brotli
 except ImportError:
@@ -11,6 +13,15 @@
         brotli = None
 
 
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+
 try:
     import certifi
 except ImportError:
@@ -51,21 +62,6 @@
     sqlite3 = None
 
 
-try:
-    import websockets
-except ImportError:
-    websockets = None
-
-try:
-    import urllib3
-except ImportError:
-    urllib3 = None
-
-try:
-    import requests
-except ImportError:
-    requests = None
-
 try:
     import xattr  # xattr or pyxattr
 except ImportError:
@@ -74,15 +70,28 @@
     if hasattr(xattr, 'set'):  # pyxattr
         xattr._yt_dlp__identifier = 'pyxattr'
 
-try:
-    import curl_cffi
-except ImportError:
-    curl_cffi = None
-
 from . import Cryptodome
 
-all_dependencies = {k: v for k, v in globals().items() if not k.startswith('_')}
-available_dependencies = {k: v for k, v in all_dependencies.items() if v}
+# These are slow to import and only needed by the request handlers,
+# so they are imported when they are first accessed
+_LAZY_DEPENDENCIES = ('websockets', 'urllib3', 'requests', 'curl_cffi')
+_EAGER_DEPENDENCIES = {k: v for k, v in globals().items() if not k.startswith('_')}
+
+
+def __getattr__(name):
+    if name in _LAZY_DEPENDENCIES:
+        try:
+            module = _import_module(name)
+        except ImportError:
+            module = None
+        globals()[name] = module
+        return module
+    elif name == 'all_dependencies':
+        lazy_dependencies = {k: globals()[k] if k in globals() else __getattr__(k) for k in _LAZY_DEPENDENCIES}
+        return {**_EAGER_DEPENDENCIES, **lazy_dependencies}
+    elif name == 'available_dependencies':
+        return {k: v for k, v in __getattr__('all_dependencies').items() if v}
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 # Deprecated
@@ -92,5 +101,6 @@
 __all__ = [
     'all_dependencies',
     'available_dependencies',
-    *all_dependencies.keys(),
+    *_EAGER_DEPENDENCIES.keys(),
+    *_LAZY_DEPENDENCIES,
 ]
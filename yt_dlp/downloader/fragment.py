@@ -5,11 +5,13 @@
 import os
 import struct
 import time
+import urllib.parse
 
 from .common import FileDownloader
 from .http import HttpFD
 from ..aes import aes_cbc_decrypt_bytes, unpad_pkcs7
 from ..networking import Request
+from ..networking._helper import dns_cache
 from ..networking.exceptions import HTTPError, IncompleteRead
 from ..utils import DownloadError, RetryManager, traverse_obj
 from ..utils.networking import HTTPHeaderDict
@@ -428,6 +430,12 @@ def interrupt_trigger_iter(fg):
         # so returning a intermediate result here instead of KeyboardInterrupt on live
         return result
 
+    def _prefetch_hosts(self, urls):
+        # With a proxy, host names may be resolved by the proxy, and looking them up here could leak them
+        if any(proxy != '__noproxy__' for key, proxy in self.ydl.proxies.items() if key != 'no'):
+            return
+        dns_cache.prefetch(urllib.parse.urlparse(url).hostname for url in urls if url)
+
     def download_and_append_fragments(
             self, ctx, fragments, info_dict, *, is_fatal=(lambda idx: False),
             pack_func=(lambda content, idx: content), finish_func=None,
@@ -435,6 +443,8 @@ def download_and_append_fragments(
 
         if not self.params.get('skip_unavailable_fragments', True):
             is_fatal = lambda _: True
+        if isinstance(fragments, list):
+            self._prefetch_hosts(fragment.get('url') for fragment in fragments)
 
         def download_fragment(fragment, ctx):
             if not interrupt_trigger[0]:
@@ -316,6 +316,7 @@ def retry(e):
                     'speed': speed,
                     'elapsed': now - ctx.start_time,
                     'ctx_id': info_dict.get('ctx_id'),
+                    'network_timings': ctx.data.timings.to_dict(),
                 }, info_dict)
 
                 if data_len is not None and byte_counter == data_len:
@@ -362,6 +363,7 @@ def retry(e):
                 'status': 'finished',
                 'elapsed': time.time() - ctx.start_time,
                 'ctx_id': info_dict.get('ctx_id'),
+                'network_timings': ctx.data.timings.to_dict(),
             }, info_dict)
 
             return True
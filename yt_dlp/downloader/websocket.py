@@ -1,4 +1,3 @@
-import asyncio
 import contextlib
 import os
 import signal
@@ -6,13 +5,14 @@
 
 from .common import FileDownloader
 from .external import FFmpegFD
-from ..dependencies import websockets
 
 
 class FFmpegSinkFD(FileDownloader):
     """ A sink to ffmpeg for downloading fragments in any form """
 
     def real_download(self, filename, info_dict):
+        import asyncio  # Slow to import and only needed here
+
         info_copy = info_dict.copy()
         info_copy['url'] = '-'
 
@@ -45,6 +45,8 @@ async def real_connection(self, sink, info_dict):
 
 class WebSocketFragmentFD(FFmpegSinkFD):
     async def real_connection(self, sink, info_dict):
+        from ..dependencies import websockets
+
         async with websockets.connect(info_dict['url'], extra_headers=info_dict.get('http_headers', {})) as ws:
             while True:
                 recv = await ws.recv()
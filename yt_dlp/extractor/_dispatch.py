@@ -0,0 +1,311 @@
+"""Index extractors by the hosts and literal prefixes that URLs matching their _VALID_URL must contain
+
+Matching a URL against every extractor in turn means running well over a thousand regexes.
+Instead, each pattern is statically expanded into the strings it can match to find the
+host names (as pairs of adjacent domain labels, e.g. "youtube.com") or the literal
+prefixes (e.g. "yts" for "ytsearch") that every URL it matches must contain.
+Only the extractors whose keys occur in the URL, along with those that could not be
+analysed, are then tested, in the original order. Hence the first suitable extractor
+is always the same as the one found by a linear scan.
+
+Since analysing all the patterns is slow, devscripts/make_lazy_extractors.py
+precomputes the keys into a table in lazy_extractors, which is used when available.
+"""
+
+import functools
+import re
+
+from ..globals import LAZY_EXTRACTORS
+from ..utils import variadic
+
+try:
+    sre_parse = re._parser
+except AttributeError:  # Python < 3.11
+    import sre_parse
+
+
+# Placeholders used when expanding a regex into the strings it can match
+_WILD = '\x00'  # Any (possibly empty) string that does not contain a "/"
+_WILD_ALL = '\x01'  # Any (possibly empty) string
+_END = '\x02'  # End of the URL
+
+PREFIX_LENGTH = 3
+_MAX_ALTERNATIVES = 256
+_MAX_SET_SIZE = 8
+
+_BOUNDARY_RE = re.compile(r'[/\x01\x02]')
+_TOKEN_RE = re.compile(r'[\w-]+|[\s\S]', re.ASCII)
+_WORD_RE = re.compile(r'[\w-]+', re.ASCII)
+
+_SECOND_LEVEL_LABELS = {'ac', 'co', 'com', 'edu', 'go', 'gob', 'gov', 'ne', 'net', 'or', 'org'}
+_BASE_CLASS_NAMES = ('InfoExtractor', 'LazyLoadExtractor')
+_REPEAT_OPS = tuple(filter(None, (
+    sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, 'POSSESSIVE_REPEAT', None))))
+_END_ATS = (sre_parse.AT_END, sre_parse.AT_END_STRING)
+_NO_SLASH_CATEGORIES = (sre_parse.CATEGORY_DIGIT, sre_parse.CATEGORY_WORD, sre_parse.CATEGORY_SPACE)
+
+
+class _TooComplex(Exception):
+    pass
+
+
+def _host_region(alternative):
+    """
+    Return (region, wild_end) for the part of an expanded alternative that a URL
+    will have between the scheme and the first "/", where wild_end denotes that
+    the region may be followed by more characters of the host.
+    Returns None if the alternative does not yet extend past the host
+    """
+    mobj = _BOUNDARY_RE.search(alternative)
+    if not mobj:
+        return None
+    elif mobj.group() == _WILD_ALL:
+        # The URL may have a "/" anywhere, so the position of its host is unknown
+        return '', True
+    elif mobj.group() == _END:
+        return alternative[:mobj.start()], False
+
+    start = 0
+    slash = mobj.start()
+    if slash > 0 and alternative[slash - 1] == ':':
+        if slash + 1 == len(alternative):
+            return None
+        elif alternative[slash + 1] == '/':
+            start = slash + 2
+        elif alternative[slash + 1] in (_WILD, _END):
+            return '', True
+    mobj = _BOUNDARY_RE.search(alternative, start)
+    if not mobj:
+        return None
+    return alternative[start:mobj.start()], mobj.group() == _WILD_ALL
+
+
+def _url_host_region(url):
+    slash = url.find('/')
+    start = slash + 2 if slash > 0 and url[slash - 1:slash + 2] == '://' else 0
+    end = url.find('/', start)
+    return url[start:] if end == -1 else url[start:end]
+
+
+def _is_complete(alternative):
+    return _host_region(alternative) is not None
+
+
+def _product(left, right):
+    result = set()
+    for a in left:
+        if _is_complete(a):
+            result.add(a)
+        else:
+            result.update(a + b for b in right)
+    if len(result) > _MAX_ALTERNATIVES:
+        raise _TooComplex
+    return result
+
+
+def _char(code):
+    # Non-ASCII characters can match ASCII ones with IGNORECASE (e.g. the Kelvin sign)
+    return chr(code).lower() if code < 128 else _WILD
+
+
+def _set_alternatives(items):
+    chars, negate, unbounded, slash = set(), False, False, False
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            chars.add(_char(av))
+            slash = slash or av == ord('/')
+        elif op is sre_parse.RANGE:
+            slash = slash or av[0] <= ord('/') <= av[1]
+            if av[1] - av[0] < _MAX_SET_SIZE:
+                chars.update(map(_char, range(av[0], av[1] + 1)))
+            else:
+                unbounded = True
+        elif op is sre_parse.CATEGORY:
+            unbounded = True
+            if av not in _NO_SLASH_CATEGORIES and not negate:
+                return {_WILD_ALL}
+        else:
+            return {_WILD_ALL}
+    if negate:
+        return {_WILD if slash else _WILD_ALL}
+    elif unbounded or len(chars) > _MAX_SET_SIZE:
+        return {_WILD_ALL if slash else _WILD}
+    return chars
+
+
+def _expand(pattern):
+    """Expand a parsed regex into the set of strings (with placeholders) that it can match"""
+    result = {''}
+    for op, av in pattern:
+        if all(map(_is_complete, result)):
+            break
+        elif op is sre_parse.LITERAL:
+            current = {_char(av)}
+        elif op is sre_parse.NOT_LITERAL:
+            current = {_WILD if av == ord('/') else _WILD_ALL}
+        elif op is sre_parse.IN:
+            current = _set_alternatives(av)
+        elif op is sre_parse.SUBPATTERN:
+            current = _expand(av[-1])
+        elif op is sre_parse.BRANCH:
+            current = set().union(*map(_expand, av[1]))
+        elif op in _REPEAT_OPS:
+            min_count, max_count, sub = av
+            current = _expand(sub)
+            if max_count != 1:
+                wild = _WILD_ALL if any(_WILD_ALL in s or '/' in s for s in current) else _WILD
+                current = _product({wild}, current)
+            if min_count == 0:
+                current.add('')
+        elif op is sre_parse.AT:
+            current = {_END if av in _END_ATS else ''}
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            current = {''}
+        elif op is sre_parse.GROUPREF_EXISTS:
+            current = _expand(av[1]) | (_expand(av[2]) if av[2] else {''})
+        elif op is getattr(sre_parse, 'ATOMIC_GROUP', None):
+            current = _expand(av)
+        else:
+            current = {_WILD_ALL}
+        result = _product(result, current)
+    return result
+
+
+def _alternative_key(alternative):
+    """Return the key that any URL matched by the expanded alternative must contain, or None"""
+    region, wild_end = _host_region(alternative + _WILD_ALL)
+    tokens = [*_TOKEN_RE.findall(region), _WILD if wild_end else '/']
+    hosts = [
+        (first, second) for idx, (first, dot, second) in enumerate(zip(tokens, tokens[1:], tokens[2:]))
+        if dot == '.' and _WORD_RE.fullmatch(first) and _WORD_RE.fullmatch(second)
+        and (idx == 0 or tokens[idx - 1] != _WILD) and tokens[idx + 3] != _WILD]
+    if hosts:
+        # Prefer "example.co.uk" over the much less selective "co.uk"
+        first, second = next((host for host in reversed(hosts) if host[0] not in _SECOND_LEVEL_LABELS), hosts[-1])
+        return 'host', f'{first}.{second}'
+
+    prefix = re.match(r'[^\x00-\x02]*', alternative).group()
+    if len(prefix) >= PREFIX_LENGTH:
+        return 'prefix', prefix[:PREFIX_LENGTH]
+    return None
+
+
+@functools.cache
+def _pattern_keys(pattern):
+    try:
+        alternatives = _expand(sre_parse.parse(pattern))
+    except (_TooComplex, re.error, RecursionError):
+        return None
+    keys = set()
+    for alternative in alternatives:
+        key = _alternative_key(alternative)
+        if not key:
+            return None
+        keys.add(key)
+    return frozenset(keys)
+
+
+def _overrides(ie, name):
+    return next(klass for klass in ie.__mro__ if name in klass.__dict__).__name__ not in _BASE_CLASS_NAMES
+
+
+@functools.cache
+def _generated_url_keys():
+    """Return {class name: (_VALID_URL, keys)} from the table generated into lazy_extractors, if it is used"""
+    if not LAZY_EXTRACTORS.value:
+        return {}
+    from . import lazy_extractors
+
+    table = getattr(lazy_extractors, '_URL_KEY_TABLE', None)
+    if table is None:  # Generated by an older version
+        return {}
+    url_keys = {name: set() for name in lazy_extractors._CLASS_LOOKUP}
+    for key, names in table.items():
+        for name in names:
+            url_keys[name].add(key)
+    wildcards = set(lazy_extractors._URL_KEY_WILDCARDS)
+    return {
+        name: (lazy_extractors._CLASS_LOOKUP[name]._VALID_URL, None if name in wildcards else frozenset(keys))
+        for name, keys in url_keys.items()}
+
+
+def get_url_keys(ie):
+    """
+    Return the keys of which at least one is contained in every URL suitable for the extractor.
+    An empty set means that it matches no URL, and None that the keys could not be determined
+    """
+    ie = ie if isinstance(ie, type) else type(ie)
+    if _overrides(ie, 'suitable') or _overrides(ie, '_match_valid_url'):
+        return None
+    valid_url = ie._VALID_URL
+    generated = _generated_url_keys().get(ie.__name__)
+    if generated and generated[0] == valid_url:
+        return generated[1]
+    return compute_url_keys(ie)
+
+
+def compute_url_keys(ie):
+    """Like get_url_keys, but always analyses the _VALID_URL of the extractor"""
+    ie = ie if isinstance(ie, type) else type(ie)
+    if _overrides(ie, 'suitable') or _overrides(ie, '_match_valid_url'):
+        return None
+    valid_url = ie._VALID_URL
+    if valid_url is False:
+        return frozenset()
+    elif not valid_url:
+        return None
+    keys = set()
+    for pattern in variadic(valid_url):
+        pattern_keys = _pattern_keys(pattern)
+        if pattern_keys is None:
+            return None
+        keys.update(pattern_keys)
+    return frozenset(keys)
+
+
+def get_keys_for_url(url):
+    """Return all the keys that are contained in the URL"""
+    url = url.lower()
+    keys = {('prefix', url[:PREFIX_LENGTH])}
+    region = _url_host_region(url)
+    words = list(_WORD_RE.finditer(region))
+    for first, second in zip(words, words[1:]):
+        if region[first.end():second.start()] == '.':
+            keys.add(('host', f'{first.group()}.{second.group()}'))
+    return keys
+
+
+class ExtractorIndex:
+    """
+    Find the extractors that may be suitable for a URL
+
+    @param ies  Mapping of ie_key to extractor classes or instances, in order of precedence.
+                Replacing the extractor of an existing ie_key with one that has the
+                same URL keys does not require the index to be rebuilt
+    """
+
+    def __init__(self, ies):
+        self._ies = ies
+        self._ie_keys = list(ies)
+        self._wildcards, self._buckets = [], {}
+        for idx, ie in enumerate(ies.values()):
+            keys = get_url_keys(ie)
+            if keys is None:
+                self._wildcards.append(idx)
+            for key in keys or ():
+                self._buckets.setdefault(key, []).append(idx)
+
+    def candidates(self, url):
+        """Yield (ie_key, ie) for every extractor that may be suitable for the URL, in order"""
+        if not isinstance(url, str) or not url.isascii():
+            indices = range(len(self._ie_keys))
+        else:
+            indices = set(self._wildcards)
+            for key in get_keys_for_url(url):
+                indices.update(self._buckets.get(key, ()))
+            indices = sorted(indices)
+        for idx in indices:
+            ie_key = self._ie_keys[idx]
+            yield ie_key, self._ies[ie_key]
@@ -573,6 +573,17 @@ class InfoExtractor:
     The _ENABLED attribute should be set to False for IEs that
     are disabled by default and must be explicitly enabled.
 
+    The _HTTP_CACHE attribute should be set to False for IEs whose webpages
+    and API responses must not be reused from the HTTP cache (--http-cache),
+    e.g. because the site sends Cache-Control headers that do not match the
+    responses. The cache is only used for requests made with _request_webpage.
+
+    The _HOST_REQUEST_RATE and _HOST_CONCURRENCY attributes may be set to the
+    maximum number of requests per second and in progress at once that the
+    hosts requested with _request_webpage tolerate. The limits then apply to
+    all the following requests to these hosts, including downloads, unless
+    the user passes --host-request-rate/--host-concurrency.
+
     The _WORKING attribute should be set to False for broken IEs
     in order to warn the users and skip the tests.
     """
@@ -585,6 +596,9 @@ class InfoExtractor:
     _GEO_IP_BLOCKS = None
     _WORKING = True
     _ENABLED = True
+    _HTTP_CACHE = True
+    _HOST_REQUEST_RATE = None
+    _HOST_CONCURRENCY = None
     _NETRC_MACHINE = None
     IE_DESC = None
     SEARCH_KEY = None
@@ -890,7 +904,9 @@ def _request_webpage(self, url_or_request, video_id, note=None, errnote=None, fa
             headers = (headers or {}).copy()
             headers.setdefault('X-Forwarded-For', self._x_forwarded_for_ip)
 
-        extensions = {}
+        extensions = {'http_cache': True} if self._HTTP_CACHE else {}
+        if self._HOST_REQUEST_RATE or self._HOST_CONCURRENCY:
+            extensions['rate_limit'] = (self._HOST_REQUEST_RATE, self._HOST_CONCURRENCY)
 
         available_target, requested_targets = self._downloader._parse_impersonate_targets(impersonate)
         if available_target:
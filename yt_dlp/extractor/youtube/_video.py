@@ -30,6 +30,7 @@
 from .pot.provider import PoTokenContext, PoTokenRequest
 from ..openload import PhantomJSwrapper
 from ...jsinterp import JSInterpreter, LocalNameSpace
+from ...metrics import timer as metrics_timer
 from ...networking.exceptions import HTTPError
 from ...utils import (
     NO_DEFAULT,
@@ -2213,7 +2214,8 @@ def _decrypt_signature(self, s, video_id, player_url):
             self._extract_signature_function, 'sig', player_url, self._signature_cache_id(s))
         func = extract_sig(video_id, player_url, s)
         self._print_sig_code(func, s)
-        return func(s)
+        with metrics_timer('jsinterp'):
+            return func(s)
 
     def _decrypt_nsig(self, s, video_id, player_url):
         """Turn the encrypted n field into a working signature"""
@@ -2230,7 +2232,8 @@ def _decrypt_nsig(self, s, video_id, player_url):
 
         try:
             extract_nsig = self._cached(self._extract_n_function_from_code, self._NSIG_FUNC_CACHE_ID, player_url)
-            ret = extract_nsig(jsi, func_code)(s)
+            with metrics_timer('jsinterp'):
+                ret = extract_nsig(jsi, func_code)(s)
         except JSInterpreter.Exception as e:
             try:
                 jsi = PhantomJSwrapper(self, timeout=5000)
@@ -2242,9 +2245,10 @@ def _decrypt_nsig(self, s, video_id, player_url):
             self.write_debug(e, only_once=True)
 
             args, func_body = func_code
-            ret = jsi.execute(
-                f'console.log(function({", ".join(args)}) {{ {func_body} }}({s!r}));',
-                video_id=video_id, note='Executing signature code').strip()
+            with metrics_timer('jsinterp'):
+                ret = jsi.execute(
+                    f'console.log(function({", ".join(args)}) {{ {func_body} }}({s!r}));',
+                    video_id=video_id, note='Executing signature code').strip()
 
         self.write_debug(f'Decrypted nsig {s} => {ret}')
         # Only cache nsig func JS code to disk if successful, and only once
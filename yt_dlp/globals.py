@@ -21,6 +21,7 @@ def __repr__(self, /):
 all_plugins_loaded = Indirect(False)
 plugin_specs = Indirect({})
 plugin_dirs = Indirect(['default'])
+plugin_cache_dir = Indirect(False)  # `False`=disabled, `None`=default cache dir, or a path
 
 plugin_ies = Indirect({})
 plugin_pps = Indirect({})
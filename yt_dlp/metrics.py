@@ -0,0 +1,264 @@
+"""Time the phases of the work done for each URL (--metrics-file)
+
+The metrics are written either as one JSON object per URL (NDJSON), or as totals in
+the Prometheus text format, e.g. for the textfile collector of the node exporter.
+The phases are:
+
+    extract             Running the extractor
+    http                Sending HTTP requests, until the response headers are received
+    http_dns            Resolving host names, as part of "http"
+    http_connect        Opening connections, as part of "http"
+    http_tls            TLS handshakes, as part of "http"
+    jsinterp            Running the JavaScript of players
+    format_selection    Selecting the formats to download
+    download            Downloading the selected formats
+    postprocess         Running postprocessors
+    archive             Looking up and recording videos in the download archive
+
+Phases can overlap, e.g. the HTTP requests of an extractor are also part of "extract"
+"""
+
+import collections
+import contextlib
+import contextvars
+import json
+import os
+import re
+import threading
+import time
+
+from .utils import DownloadCancelled
+
+URL_DURATION_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+_current_record = contextvars.ContextVar('metrics_record', default=None)
+
+
+class _URLRecord:
+    def __init__(self, metrics, url):
+        self.metrics, self.url = metrics, url
+        self.extractor = None
+        self.start, self.start_counter = time.time(), time.perf_counter()
+        self.phases = collections.defaultdict(lambda: [0, 0.])  # phase: [calls, seconds]
+        self.counters = collections.Counter()
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count, self.sum = 0, 0.
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bucket in enumerate(self.buckets):
+            if value <= bucket:
+                self.counts[i] += 1
+
+
+class Metrics:
+    """
+    Collects the time spent in each phase and counters, both in total and for each URL
+
+    @param filename     File to write the metrics to. If None, nothing is collected
+    @param fmt          One of FORMATS
+    @param ydl          YoutubeDL instance to report the errors of writing the file to.
+                        After an error, the file is no longer written
+    """
+
+    FORMATS = ('ndjson', 'prometheus')
+    WRITE_INTERVAL = 5  # Minimum number of seconds between rewrites of the Prometheus file
+
+    def __init__(self, filename=None, fmt=None, ydl=None):
+        self.filename, self.format = filename, fmt or 'ndjson'
+        self._ydl = ydl
+        assert self.format in self.FORMATS, f'Invalid metrics format {self.format!r}'
+        self.enabled = bool(filename)
+        self.phases = collections.defaultdict(lambda: [0, 0.])  # phase: [calls, seconds]
+        self.counters = collections.Counter()
+        self.urls = collections.Counter()  # (extractor, status): count
+        self.url_durations = collections.defaultdict(lambda: _Histogram(URL_DURATION_BUCKETS))  # extractor: histogram
+        self._lock = threading.Lock()
+        self._last_write = 0
+        self._file = None
+        self._write_failed = False
+
+    def _record(self):
+        record = _current_record.get()
+        return record if record and record.metrics is self else None
+
+    def add_time(self, phase, seconds):
+        record = self._record()
+        with self._lock:
+            for phases in (self.phases, record and record.phases):
+                if phases is not None:
+                    phases[phase][0] += 1
+                    phases[phase][1] += seconds
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        record = self._record()
+        with self._lock:
+            self.counters[name] += value
+            if record:
+                record.counters[name] += value
+
+    def record_request(self, timings):
+        """Add the RequestTimings of an HTTP request"""
+        if not self.enabled:
+            return
+        for name in ('dns', 'connect', 'tls'):
+            seconds = getattr(timings, name)
+            if seconds is not None:
+                self.add_time(f'http_{name}', seconds)
+        if timings.reused:
+            self.count('http_reused_connections')
+        if timings.tls_handshakes:
+            self.count('http_tls_handshakes', timings.tls_handshakes)
+        if timings.tls_resumed:
+            self.count('http_tls_resumed', timings.tls_resumed)
+
+    def set_extractor(self, ie_key):
+        """Set the extractor of the current URL, unless it is already known"""
+        record = self._record()
+        if record and not record.extractor:
+            record.extractor = ie_key
+
+    @contextlib.contextmanager
+    def _timer(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.perf_counter() - start)
+
+    def timer(self, phase):
+        """Context manager that adds the time spent inside it to phase"""
+        return self._timer(phase) if self.enabled else contextlib.nullcontext()
+
+    @contextlib.contextmanager
+    def url(self, url):
+        """Attribute the metrics collected inside this context to url, unless they already are to another URL"""
+        if not self.enabled or self._record():
+            yield
+            return
+        record = _URLRecord(self, url)
+        token = _current_record.set(record)
+        status = 'error'
+        try:
+            yield
+            status = 'error' if record.counters['errors'] else 'ok'
+        except DownloadCancelled:
+            status = 'cancelled'
+            raise
+        finally:
+            _current_record.reset(token)
+            self._finish(record, status)
+
+    def _finish(self, record, status):
+        seconds = time.perf_counter() - record.start_counter
+        with self._lock:
+            self.urls[record.extractor or '', status] += 1
+            self.url_durations[record.extractor or ''].observe(seconds)
+            if self.format == 'ndjson':
+                self._write_line(json.dumps({
+                    'url': record.url,
+                    'extractor': record.extractor,
+                    'status': status,
+                    'start': round(record.start, 3),
+                    'seconds': round(seconds, 6),
+                    'phases': {
+                        phase: {'calls': calls, 'seconds': round(phase_seconds, 6)}
+                        for phase, (calls, phase_seconds) in record.phases.items()},
+                    'counters': dict(record.counters),
+                }))
+        if self.format == 'prometheus' and time.monotonic() - self._last_write >= self.WRITE_INTERVAL:
+            self.write_prometheus()
+
+    def _write_line(self, line):
+        if self._write_failed:
+            return
+        try:
+            if not self._file:
+                self._file = open(self.filename, 'a', encoding='utf-8')
+            self._file.write(f'{line}\n')
+            self._file.flush()
+        except OSError as e:
+            self._report_write_error(e)
+
+    def _report_write_error(self, error):
+        self._write_failed = True
+        if self._file:
+            with contextlib.suppress(OSError):
+                self._file.close()
+            self._file = None
+        if self._ydl:
+            self._ydl.report_warning(f'Unable to write metrics to "{self.filename}": {error}; no more metrics will be written')
+
+    def to_prometheus(self):
+        """Return the totals in the Prometheus text format"""
+        lines = []
+
+        def metric(name, mtype, description, samples):
+            lines.extend((f'# HELP yt_dlp_{name} {description}', f'# TYPE yt_dlp_{name} {mtype}'))
+            for suffix, labels, value in samples:
+                labels = ','.join(f'{key}="{_escape_label(label)}"' for key, label in labels.items())
+                lines.append(f'yt_dlp_{name}{suffix}{{{labels}}} {value}' if labels else f'yt_dlp_{name}{suffix} {value}')
+
+        with self._lock:
+            metric('phase_seconds_total', 'counter', 'Time spent in each phase', [
+                ('', {'phase': phase}, seconds) for phase, (_, seconds) in sorted(self.phases.items())])
+            metric('phase_calls_total', 'counter', 'Number of times each phase was entered', [
+                ('', {'phase': phase}, calls) for phase, (calls, _) in sorted(self.phases.items())])
+            for name, value in sorted(self.counters.items()):
+                metric(f'{name}_total', 'counter', f'Number of {name.replace("_", " ")}', [('', {}, value)])
+            metric('urls_total', 'counter', 'Number of processed URLs', [
+                ('', {'extractor': extractor, 'status': status}, count)
+                for (extractor, status), count in sorted(self.urls.items())])
+            metric('url_duration_seconds', 'histogram', 'Time taken to process each URL', [
+                sample for extractor, histogram in sorted(self.url_durations.items()) for sample in (
+                    *(('_bucket', {'extractor': extractor, 'le': str(bucket)}, count)
+                      for bucket, count in zip(histogram.buckets, histogram.counts)),
+                    ('_bucket', {'extractor': extractor, 'le': '+Inf'}, histogram.count),
+                    ('_sum', {'extractor': extractor}, histogram.sum),
+                    ('_count', {'extractor': extractor}, histogram.count))])
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self):
+        if self._write_failed:
+            return
+        # The file is replaced atomically so that it is never read while incomplete
+        tmp_filename = f'{self.filename}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp_filename, self.filename)
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_filename)
+            self._report_write_error(e)
+        self._last_write = time.monotonic()
+
+    def close(self):
+        if not self.enabled:
+            return
+        if self.format == 'prometheus':
+            self.write_prometheus()
+        elif self._file:
+            try:
+                self._file.close()
+            except OSError as e:
+                self._report_write_error(e)
+            self._file = None
+
+
+def timer(phase):
+    """Context manager that adds the time spent inside it to phase, for the URL that is being processed"""
+    record = _current_record.get()
+    return record.metrics.timer(phase) if record else contextlib.nullcontext()
+
+
+def _escape_label(value):
+    return re.sub(r'[\\"\n]', lambda m: {'\n': r'\n'}.get(m.group(0), f'\\{m.group(0)}'), str(value))
@@ -1,4 +1,5 @@
 # flake8: noqa: F401
+import functools
 import warnings
 
 from .common import (
@@ -16,23 +17,35 @@
 from . import _urllib
 from ..utils import bug_reports_message
 
-try:
-    from . import _requests
-except ImportError:
-    pass
-except Exception as e:
-    warnings.warn(f'Failed to import "requests" request handler: {e}' + bug_reports_message())
-
-try:
-    from . import _websockets
-except ImportError:
-    pass
-except Exception as e:
-    warnings.warn(f'Failed to import "websockets" request handler: {e}' + bug_reports_message())
-
-try:
-    from . import _curlcffi
-except ImportError:
-    pass
-except Exception as e:
-    warnings.warn(f'Failed to import "curl_cffi" request handler: {e}' + bug_reports_message())
+
+@functools.cache
+def load_request_handlers():
+    """Import the request handlers that depend on optional dependencies
+
+    These are slow to import, so they are only loaded once a request director is built
+    """
+    try:
+        from . import _asyncio
+    except Exception as e:
+        warnings.warn(f'Failed to import "asyncio" request handler: {e}' + bug_reports_message())
+
+    try:
+        from . import _requests
+    except ImportError:
+        pass
+    except Exception as e:
+        warnings.warn(f'Failed to import "requests" request handler: {e}' + bug_reports_message())
+
+    try:
+        from . import _websockets
+    except ImportError:
+        pass
+    except Exception as e:
+        warnings.warn(f'Failed to import "websockets" request handler: {e}' + bug_reports_message())
+
+    try:
+        from . import _curlcffi
+    except ImportError:
+        pass
+    except Exception as e:
+        warnings.warn(f'Failed to import "curl_cffi" request handler: {e}' + bug_reports_message())
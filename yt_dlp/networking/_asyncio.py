@@ -0,0 +1,622 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import email.parser
+import functools
+import http.client
+import io
+import re
+import socket
+import ssl
+import threading
+import urllib.parse
+import urllib.request
+import urllib.response
+import weakref
+import zlib
+
+from ._helper import (
+    ConnectionPool,
+    ContentDecoder,
+    InstanceStoreMixin,
+    _request_timings,
+    add_accept_encoding_header,
+    create_connection,
+    create_socks_proxy_socket,
+    dns_cache,
+    get_redirect_method,
+    get_request_timings,
+    make_socks_proxy_opts,
+    measure_timing,
+    record_tls_handshake,
+)
+from .common import Features, RequestHandler, Response, register_rh
+from .exceptions import (
+    CertificateVerifyError,
+    HTTPError,
+    IncompleteRead,
+    ProxyError,
+    RequestError,
+    SSLError,
+    TransportError,
+)
+from ..dependencies import brotli, zstd
+from ..socks import ProxyError as SocksProxyError
+from ..utils.networking import normalize_url, select_proxy
+
+SUPPORTED_ENCODINGS = ['gzip', 'deflate']
+CONTENT_DECODE_ERRORS = [zlib.error]
+
+if brotli:
+    SUPPORTED_ENCODINGS.append('br')
+    CONTENT_DECODE_ERRORS.append(brotli.error)
+
+if zstd:
+    SUPPORTED_ENCODINGS.append('zstd')
+    CONTENT_DECODE_ERRORS.append(zstd.ZstdError)
+
+# Same limits and checks as http.client
+_MAX_HEADERS = 100
+_MAX_LINE = 65536
+_is_legal_header_name = re.compile(r'[^:\s][^:\r\n]*').fullmatch
+_is_illegal_header_value = re.compile(r'\n(?![ \t])|\r(?![ \t\n])').search
+_contains_control_chars = re.compile(r'[\x00-\x20\x7f]').search
+
+_MAX_REDIRECTS = 10
+# Redirect responses with a larger body are not read, and their connection is closed instead
+_MAX_DISCARD = 1 << 16
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _handle_error(e):
+    if isinstance(e, ssl.SSLCertVerificationError):
+        raise CertificateVerifyError(cause=e) from e
+    elif isinstance(e, ssl.SSLError):
+        raise SSLError(cause=e) from e
+    elif isinstance(e, SocksProxyError):
+        raise ProxyError(cause=e) from e
+    elif isinstance(e, (OSError, EOFError, asyncio.TimeoutError, http.client.HTTPException, *CONTENT_DECODE_ERRORS)):
+        raise TransportError(cause=e) from e
+
+
+def _call_soon(loop, func, *args):
+    """Call func in the thread of the event loop, which transports require"""
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    try:
+        if running_loop is loop or not loop.is_running():
+            func(*args)
+        else:
+            loop.call_soon_threadsafe(func, *args)
+    except RuntimeError:  # The event loop is closed
+        pass
+
+
+def _host_header(host, port, default_port):
+    if ':' in host:
+        host = f'[{host}]'
+    return host if port == default_port else f'{host}:{port}'
+
+
+def _proxy_authorization(proxy):
+    proxy = urllib.parse.urlparse(proxy)
+    if not proxy.username:
+        return None
+    credentials = f'{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or "")}'
+    return f'Basic {base64.b64encode(credentials.encode()).decode()}'
+
+
+def _pop_header(headers, name):
+    for key in [key for key in headers if key.lower() == name.lower()]:
+        del headers[key]
+
+
+def _build_head(method, target, headers):
+    if _contains_control_chars(method):
+        raise RequestError(f'method can\'t contain control characters. {method!r}')
+    if _contains_control_chars(target):
+        raise RequestError(f'URL can\'t contain control characters. {target!r}')
+    lines = [f'{method} {target} HTTP/1.1']
+    for name, value in headers.items():
+        if not _is_legal_header_name(name):
+            raise RequestError(f'Invalid header name {name!r}')
+        if _is_illegal_header_value(value):
+            raise RequestError(f'Invalid header value {value!r}')
+        lines.append(f'{name}: {value}')
+    try:
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    except UnicodeEncodeError as e:
+        raise RequestError(cause=e) from e
+
+
+async def _read_head(reader, verbose=False):
+    """Read the status line and headers of a response, like http.client.HTTPResponse.begin()"""
+    async def readline():
+        try:
+            line = await reader.readline()
+        except ValueError:  # Over the limit of the stream
+            raise http.client.LineTooLong('header line')
+        if verbose:
+            print('reply:', repr(line))
+        return line
+
+    while True:
+        line = await readline()
+        if not line:
+            raise http.client.RemoteDisconnected('Remote end closed connection without response')
+        version, _, rest = line.decode('iso-8859-1').rstrip('\r\n').partition(' ')
+        status, _, reason = rest.partition(' ')
+        if not version.startswith('HTTP/') or not status.isdigit() or not 100 <= int(status) <= 999:
+            raise http.client.BadStatusLine(line)
+
+        header_lines = []
+        while (line := await readline()) not in (b'\r\n', b'\n', b''):
+            header_lines.append(line)
+            if len(header_lines) > _MAX_HEADERS:
+                raise http.client.HTTPException(f'got more than {_MAX_HEADERS} headers')
+        # Skip interim responses, such as 100 Continue and 103 Early Hints
+        if not 100 <= int(status) < 200:
+            break
+
+    headers = email.parser.Parser(_class=http.client.HTTPMessage).parsestr(
+        b''.join(header_lines).decode('iso-8859-1'))
+    return version, int(status), reason.strip(), headers
+
+
+def _extract_cookies(cookiejar, url, headers):
+    cookiejar.extract_cookies(
+        urllib.response.addinfourl(io.BytesIO(), headers, url), urllib.request.Request(url))
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+    @staticmethod
+    def is_dropped(conn):
+        # An idle connection should have nothing to read: if it does, the server has closed it
+        return conn.writer.is_closing() or conn.reader.at_eof()
+
+
+class AsyncioResponseAdapter(Response):
+    """
+    Response whose body is read from an asyncio stream.
+
+    async_read() must be awaited in the event loop that received the response;
+    read() may be called from any other thread while that event loop is running.
+    """
+
+    def __init__(self, conn, release, url, method, version, status, reason, headers, timeout, loop):
+        super().__init__(fp=None, url=url, headers=headers, status=status, reason=reason)
+        self._conn = conn
+        self._release = release
+        self._timeout = timeout
+        self._loop = loop
+        self._decoder = ContentDecoder(headers.get('Content-Encoding', '')) or None
+        # Decoded data that has not been read yet
+        self._buffer = b''
+        self._raw_read = 0
+
+        # Determine how the body ends, like http.client.HTTPResponse.begin()
+        self._chunked = headers.get('Transfer-Encoding', '').lower() == 'chunked'
+        self._chunk_left = None
+        connection = headers.get('Connection', '').lower()
+        self._will_close = 'close' in connection or (version != 'HTTP/1.1' and 'keep-alive' not in connection)
+        self._length = None
+        if not self._chunked:
+            try:
+                self._length = int(headers.get('Content-Length'))
+            except (TypeError, ValueError):
+                pass
+            else:
+                if self._length < 0:
+                    self._length = None
+        if status in (204, 304) or method == 'HEAD':
+            self._length = 0
+        if self._length is None and not self._chunked:
+            self._will_close = True
+        if self._length == 0:
+            self._finish(True)
+
+    def readable(self):
+        return True
+
+    def _finish(self, complete):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._release(conn, complete and not self._will_close)
+
+    async def _io(self, aw):
+        return await asyncio.wait_for(aw, self._timeout)
+
+    async def _read_raw(self, amt):
+        """Read up to amt bytes of the body as sent by the server"""
+        if self._conn is None:
+            return b''
+        reader = self._conn.reader
+        if self._chunked:
+            if self._chunk_left is None:
+                line = await self._io(reader.readline())
+                if not line:
+                    raise IncompleteRead(partial=self._raw_read)
+                try:
+                    self._chunk_left = int(line.split(b';', 1)[0], 16)
+                except ValueError:
+                    raise TransportError(f'Invalid chunk size: {line!r}')
+                if not self._chunk_left:
+                    # Discard the trailer
+                    while (await self._io(reader.readline())) not in (b'\r\n', b'\n', b''):
+                        pass
+                    self._finish(True)
+                    return b''
+            data = await self._io(reader.read(min(amt, self._chunk_left)))
+            if not data:
+                raise IncompleteRead(partial=self._raw_read, expected=self._chunk_left)
+            self._chunk_left -= len(data)
+            if not self._chunk_left:
+                await self._io(reader.readexactly(2))  # CRLF at the end of the chunk
+                self._chunk_left = None
+        elif self._length is not None:
+            data = await self._io(reader.read(min(amt, self._length)))
+            if not data:
+                raise IncompleteRead(partial=self._raw_read, expected=self._length)
+            self._length -= len(data)
+            if not self._length:
+                self._finish(True)
+        else:
+            data = await self._io(reader.read(amt))
+            if not data:
+                self._finish(False)
+        self._raw_read += len(data)
+        return data
+
+    async def _read(self, amt):
+        if self._decoder is None and not self._buffer:
+            return await self._read_raw(amt)
+        while len(self._buffer) < amt and self._decoder is not None:
+            self._buffer += self._decoder.decompress(await self._read_raw(max(amt, _READ_CHUNK_SIZE)))
+            if self._conn is None:
+                # The body has been read in full
+                self._buffer += self._decoder.flush()
+                self._decoder = None
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    async def async_read(self, amt: int | None = None) -> bytes:
+        if amt is not None and amt < 0:
+            amt = None
+        try:
+            if amt is None:
+                chunks = []
+                while chunk := await self._read(_READ_CHUNK_SIZE):
+                    chunks.append(chunk)
+                data = b''.join(chunks)
+            else:
+                data = await self._read(amt) if amt else b''
+        except BaseException as e:
+            self._finish(False)
+            _handle_error(e)
+            raise
+        return self._record_read(data, amt)
+
+    def read(self, amt: int | None = None) -> bytes:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            raise RuntimeError('A response must be read with async_read() in the event loop that received it')
+        if not self._loop.is_running():
+            raise TransportError('The event loop that received the response is not running')
+        return asyncio.run_coroutine_threadsafe(self.async_read(amt), self._loop).result()
+
+    async def _discard(self):
+        """Read the rest of a small body so that the connection can be reused, or close it"""
+        if self._conn is not None and self._length is not None and self._length <= _MAX_DISCARD:
+            with contextlib.suppress(TransportError):
+                await self.async_read()
+        self.close()
+
+    def close(self):
+        if self._conn is not None:
+            _call_soon(self._loop, self._finish, False)
+        self.timings.finished()
+        io.IOBase.close(self)
+
+
+@register_rh
+class AsyncioRH(RequestHandler, InstanceStoreMixin):
+    """
+    Request handler built on asyncio streams, for HTTP/1.1
+
+    Requests sent with async_send() are handled natively in the calling event loop.
+    send() hands the request over to an event loop running in a background thread.
+    Connections are kept alive and reused within each event loop, until close() is called.
+    """
+    _SUPPORTED_URL_SCHEMES = ('http', 'https')
+    _SUPPORTED_PROXY_SCHEMES = ('http', 'socks4', 'socks4a', 'socks5', 'socks5h')
+    _SUPPORTED_FEATURES = (Features.NO_PROXY, Features.ALL_PROXY)
+    RH_NAME = 'asyncio'
+    _VALIDATE_SHAPE_ONLY = True
+
+    # Maximum number of idle connections kept per host, and for how long (in seconds)
+    POOL_MAXSIZE = 10
+    POOL_IDLE_TIMEOUT = 30
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._loop = self._loop_thread = None
+        self._pools = weakref.WeakKeyDictionary()
+
+    def close(self):
+        with self._lock:
+            loop, loop_thread, self._loop = self._loop, self._loop_thread, None
+            pools, self._pools = list(self._pools.items()), weakref.WeakKeyDictionary()
+        for pool_loop, pool in pools:
+            _call_soon(pool_loop, pool.close)
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+        self._clear_instances()
+
+    def _check_extensions(self, extensions):
+        super()._check_extensions(extensions)
+        extensions.pop('cookiejar', None)
+        extensions.pop('timeout', None)
+        extensions.pop('legacy_ssl', None)
+
+    def _create_instance(self, legacy_ssl_support=None):
+        return self._make_sslcontext(legacy_ssl_support=legacy_ssl_support)
+
+    def _prepare_headers(self, _, headers):
+        add_accept_encoding_header(headers, SUPPORTED_ENCODINGS)
+
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name=f'{self.RH_NAME} request handler', daemon=True)
+                self._loop_thread.start()
+            return self._loop
+
+    def _get_pool(self, loop):
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = ConnectionPool(
+                    self.POOL_MAXSIZE, self.POOL_IDLE_TIMEOUT, _Connection.is_dropped)
+            return pool
+
+    def _send(self, request):
+        future = asyncio.run_coroutine_threadsafe(
+            self._async_send_with_timings(request, get_request_timings()), self._get_loop())
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def _async_send_with_timings(self, request, timings):
+        # The coroutine runs in the context of the event loop thread, so the timings are passed on
+        token = _request_timings.set(timings)
+        try:
+            return await self._async_send(request)
+        finally:
+            _request_timings.reset(token)
+
+    async def _async_send(self, request):
+        headers = self._get_headers(request)
+        url, method, data = request.url, request.method, request.data
+        if data is not None and not isinstance(data, bytes):
+            data = await asyncio.to_thread(data.read) if hasattr(data, 'read') else b''.join(data)
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            try:
+                response = await self._send_once(request, url, method, headers, data)
+            except RequestError:
+                raise
+            except BaseException as e:
+                _handle_error(e)
+                raise
+
+            location = response.get_header('Location') if response.status in (301, 302, 303, 307, 308) else None
+            if not location:
+                break
+            await response._discard()
+
+            # As of RFC 2616 default charset is iso-8859-1 that is respected by Python 3
+            location = location.encode('iso-8859-1').decode(errors='replace')
+            new_url = normalize_url(urllib.parse.urljoin(url, location))
+            if urllib.parse.urlparse(new_url).scheme.lower() not in self._SUPPORTED_URL_SCHEMES:
+                raise HTTPError(response)
+            new_method = get_redirect_method(method, response.status)
+            # only remove payload if method changed (e.g. POST to GET)
+            if new_method != method:
+                data = None
+                _pop_header(headers, 'Content-Type')
+            # Technically the Cookie header should be in unredirected_hdrs,
+            # however in practice some may set it in normal headers anyway.
+            # We will remove it here to prevent any leaks.
+            _pop_header(headers, 'Cookie')
+            url, method = new_url, new_method
+        else:
+            raise HTTPError(response, redirect_loop=True)
+
+        if not 200 <= response.status < 300:
+            raise HTTPError(response)
+        return response
+
+    async def _send_once(self, request, url, method, headers, data):
+        loop = asyncio.get_running_loop()
+        timeout = self._calculate_timeout(request)
+        cookiejar = self._get_cookiejar(request)
+        legacy_ssl_support = request.extensions.get('legacy_ssl')
+        proxy = select_proxy(url, self._get_proxies(request))
+
+        parsed_url = urllib.parse.urlsplit(url)
+        scheme = parsed_url.scheme.lower()
+        default_port = 443 if scheme == 'https' else 80
+        host, port = parsed_url.hostname, parsed_url.port or default_port
+
+        headers = dict(headers)
+        header_names = {name.lower() for name in headers}
+        if 'host' not in header_names:
+            headers = {'Host': _host_header(host, port, default_port), **headers}
+        if 'cookie' not in header_names:
+            cookie = cookiejar.get_cookie_header(url)
+            if cookie:
+                headers['Cookie'] = cookie
+        _pop_header(headers, 'Content-Length')
+        if data is not None:
+            headers['Content-Length'] = str(len(data))
+        elif method in ('POST', 'PUT', 'PATCH'):
+            headers['Content-Length'] = '0'
+
+        target = urllib.parse.urlunsplit(('', '', parsed_url.path or '/', parsed_url.query, ''))
+        if proxy and scheme == 'http' and urllib.parse.urlparse(proxy).scheme.lower() == 'http':
+            # The request goes through the proxy rather than a tunnel
+            target = urllib.parse.urlunsplit(parsed_url._replace(fragment=''))
+            proxy_authorization = _proxy_authorization(proxy)
+            if proxy_authorization:
+                headers['Proxy-Authorization'] = proxy_authorization
+        head = _build_head(method, target, headers)
+        if self.verbose:
+            print('send:', repr(head + (data or b'')))
+
+        pool = self._get_pool(loop)
+        pool_key = (scheme, host, port, proxy, legacy_ssl_support)
+        conn = pool.get(pool_key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = await self._connect(loop, scheme, host, port, proxy, timeout, legacy_ssl_support)
+            try:
+                conn.writer.write(head + (data or b''))
+                await asyncio.wait_for(conn.writer.drain(), timeout)
+                version, status, reason, response_headers = await asyncio.wait_for(
+                    _read_head(conn.reader, self.verbose), timeout)
+                break
+            except (ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed the connection while it was idle; retry once on a new one
+                conn, reused = None, False
+            except BaseException:
+                conn.close()
+                raise
+
+        timings = get_request_timings()
+        if timings:
+            timings.reused = timings.connect is None
+        _extract_cookies(cookiejar, url, response_headers)
+        return AsyncioResponseAdapter(
+            conn, functools.partial(self._release_connection, pool, pool_key), url, method,
+            version, status, reason, response_headers, timeout, loop)
+
+    @staticmethod
+    def _release_connection(pool, pool_key, conn, reusable):
+        if reusable:
+            pool.put(pool_key, conn)
+        else:
+            conn.close()
+
+    async def _connect(self, loop, scheme, host, port, proxy, timeout, legacy_ssl_support):
+        proxy_scheme = proxy and urllib.parse.urlparse(proxy).scheme.lower()
+        if proxy_scheme and proxy_scheme.startswith('socks'):
+            # The SOCKS handshake is done in a thread, as our SOCKS client is blocking
+            proxy_args = make_socks_proxy_opts(proxy)
+            sock = await asyncio.to_thread(
+                create_connection, (proxy_args['addr'], proxy_args['port']), timeout=timeout,
+                source_address=(self.source_address, 0) if self.source_address else None,
+                _create_socket_func=functools.partial(create_socks_proxy_socket, (host, port), proxy_args))
+        elif proxy:
+            parsed_proxy = urllib.parse.urlparse(proxy)
+            sock = await self._open_socket(loop, parsed_proxy.hostname, parsed_proxy.port or 80, timeout)
+        else:
+            sock = await self._open_socket(loop, host, port, timeout)
+
+        try:
+            if proxy_scheme == 'http' and scheme == 'https':
+                with measure_timing('connect'):
+                    await self._tunnel(loop, sock, host, port, proxy, timeout)
+            if scheme == 'https':
+                with measure_timing('tls'):
+                    reader, writer = await asyncio.wait_for(asyncio.open_connection(
+                        sock=sock, ssl=self._get_instance(legacy_ssl_support=legacy_ssl_support),
+                        server_hostname=host, limit=_MAX_LINE), timeout)
+                # asyncio has no way to pass a session to resume, so every handshake is a full one
+                record_tls_handshake(writer.get_extra_info('ssl_object'))
+            else:
+                reader, writer = await asyncio.open_connection(sock=sock, limit=_MAX_LINE)
+        except BaseException:
+            sock.close()
+            raise
+        return _Connection(reader, writer)
+
+    async def _open_socket(self, loop, host, port, timeout):
+        # Like create_connection(), but without blocking the event loop
+        with measure_timing('dns'):
+            ip_addrs = dns_cache.get(host, port, type=socket.SOCK_STREAM)
+            if ip_addrs is None:
+                ip_addrs = await asyncio.wait_for(loop.run_in_executor(None, functools.partial(
+                    dns_cache.getaddrinfo, host, port, type=socket.SOCK_STREAM)), timeout)
+        if not ip_addrs:
+            raise OSError('getaddrinfo returns an empty list')
+        if self.source_address is not None:
+            af = socket.AF_INET if ':' not in self.source_address else socket.AF_INET6
+            ip_addrs = [addr for addr in ip_addrs if addr[0] == af]
+            if not ip_addrs:
+                raise OSError(
+                    f'No remote IPv{4 if af == socket.AF_INET else 6} addresses available for connect. '
+                    f'Can\'t use "{self.source_address}" as source address')
+
+        err = None
+        for af, socktype, proto, _, sa in ip_addrs:
+            sock = socket.socket(af, socktype, proto)
+            try:
+                sock.setblocking(False)
+                if self.source_address:
+                    sock.bind((self.source_address, 0))
+                with measure_timing('connect'):
+                    await asyncio.wait_for(loop.sock_connect(sock, sa), timeout)
+                return sock
+            except BaseException as e:
+                sock.close()
+                if not isinstance(e, (OSError, asyncio.TimeoutError)):
+                    raise
+                err = e
+        raise err
+
+    @staticmethod
+    async def _tunnel(loop, sock, host, port, proxy, timeout):
+        headers = {'Host': _host_header(host, port, None)}
+        proxy_authorization = _proxy_authorization(proxy)
+        if proxy_authorization:
+            headers['Proxy-Authorization'] = proxy_authorization
+        await asyncio.wait_for(loop.sock_sendall(sock, _build_head('CONNECT', headers['Host'], headers)), timeout)
+
+        # Read byte by byte so as not to consume anything past the response
+        response = b''
+        while not response.endswith(b'\r\n\r\n'):
+            data = await asyncio.wait_for(loop.sock_recv(sock, 1), timeout)
+            if not data:
+                raise ProxyError('Tunnel connection failed: the proxy closed the connection')
+            response += data
+            if len(response) > _MAX_LINE:
+                raise ProxyError('Tunnel connection failed: the response of the proxy is too long')
+        status_line = response.split(b'\r\n', 1)[0].decode('iso-8859-1')
+        _, _, status = status_line.partition(' ')
+        if not status.startswith('2'):
+            raise ProxyError(f'Tunnel connection failed: {status}')
@@ -6,7 +6,7 @@
 import re
 import urllib.parse
 
-from ._helper import InstanceStoreMixin
+from ._helper import InstanceStoreMixin, get_request_timings
 from ..utils.networking import select_proxy
 from .common import (
     Features,
@@ -38,7 +38,7 @@
     raise ImportError('Only curl_cffi versions 0.5.10 and 0.10.x are supported')
 
 import curl_cffi.requests
-from curl_cffi.const import CurlECode, CurlOpt
+from curl_cffi.const import CurlECode, CurlInfo, CurlOpt
 
 
 class CurlCFFIResponseReader(io.IOBase):
@@ -96,7 +96,7 @@ def __init__(self, response: curl_cffi.requests.Response):
 
     def read(self, amt=None):
         try:
-            return self.fp.read(amt)
+            return self._record_read(self.fp.read(amt), amt)
         except curl_cffi.requests.errors.RequestsError as e:
             if e.code == CurlECode.PARTIAL_FILE:
                 content_length = e.response and int_or_none(e.response.headers.get('Content-Length'))
@@ -158,6 +158,7 @@ class CurlCFFIRH(ImpersonateRequestHandler, InstanceStoreMixin):
     _SUPPORTED_URL_SCHEMES = ('http', 'https')
     _SUPPORTED_FEATURES = (Features.NO_PROXY, Features.ALL_PROXY)
     _SUPPORTED_PROXY_SCHEMES = ('http', 'https', 'socks4', 'socks4a', 'socks5', 'socks5h')
+    _VALIDATE_SHAPE_ONLY = True
     _SUPPORTED_IMPERSONATE_TARGET_MAP = {
         target: name if curl_cffi_version >= (0, 9) else curl_cffi.requests.BrowserType[name]
         for name, target in dict(sorted(itertools.chain.from_iterable(
@@ -188,6 +189,26 @@ def _check_extensions(self, extensions):
         # Impersonation generally uses a looser SSL configuration than urllib/requests.
         extensions.pop('legacy_ssl', None)
 
+    @staticmethod
+    def _record_timings(curl_response):
+        timings, curl = get_request_timings(), getattr(curl_response, 'curl', None)
+        if not timings or not curl:
+            return
+        # These are all known once the headers have been received. The times
+        # reported by curl are cumulative from the start of the transfer
+        try:
+            timings.reused = curl.getinfo(CurlInfo.NUM_CONNECTS) == 0
+            if timings.reused:
+                return
+            namelookup, connect, appconnect = (curl.getinfo(info) for info in (
+                CurlInfo.NAMELOOKUP_TIME, CurlInfo.CONNECT_TIME, CurlInfo.APPCONNECT_TIME))
+        except curl_cffi.CurlError:
+            return
+        timings.dns = namelookup
+        timings.connect = max(connect - namelookup, 0)
+        if appconnect:
+            timings.tls = max(appconnect - connect, 0)
+
     def send(self, request: Request) -> Response:
         target = self._get_request_target(request)
         try:
@@ -284,6 +305,7 @@ def _send(self, request: Request):
             else:
                 raise TransportError(cause=e) from e
 
+        self._record_timings(curl_response)
         response = CurlCFFIResponseAdapter(curl_response)
 
         if not 200 <= response.status < 300:
@@ -295,3 +317,6 @@ def _send(self, request: Request):
 @register_preference(CurlCFFIRH)
 def curl_cffi_preference(rh, request):
     return -100
+
+
+curl_cffi_preference.shape_only = True
@@ -1,24 +1,35 @@
 from __future__ import annotations
 
+import collections
 import contextlib
+import contextvars
 import functools
+import inspect
 import os
 import socket
 import ssl
 import sys
+import threading
+import time
 import typing
 import urllib.parse
 import urllib.request
+import weakref
+import zlib
 
 from .exceptions import RequestError
-from ..dependencies import certifi
+from ..dependencies import brotli, certifi, zstd
 from ..socks import ProxyType, sockssocket
 
 if typing.TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from .common import RequestTimings
     from ..utils.networking import HTTPHeaderDict
 
+_request_timings: contextvars.ContextVar[RequestTimings | None] = contextvars.ContextVar(
+    'request_timings', default=None)
+
 
 def ssl_load_certs(context: ssl.SSLContext, use_certifi=True):
     if certifi and use_certifi:
@@ -154,6 +165,23 @@ def make_ssl_context(
     return context
 
 
+_ssl_contexts = {}
+_ssl_contexts_lock = threading.Lock()
+
+
+def get_ssl_context(**kwargs):
+    """
+    Like make_ssl_context(), but the context is shared by all callers that use the same settings.
+    This lets connections made by different handlers resume each other's TLS sessions
+    """
+    key = tuple(sorted(kwargs.items()))
+    with _ssl_contexts_lock:
+        context = _ssl_contexts.get(key)
+        if context is None:
+            context = _ssl_contexts[key] = make_ssl_context(**kwargs)
+        return context
+
+
 class InstanceStoreMixin:
     def __init__(self, **kwargs):
         self.__instances = []
@@ -182,12 +210,353 @@ def _clear_instances(self):
         self.__instances.clear()
 
 
+class ConnectionPool:
+    """
+    Idle keep-alive connections, keyed by everything that determines what a connection is connected to.
+    Connections are taken out of the pool while in use, so each is used by one request at a time.
+
+    @param maxsize: Maximum number of idle connections kept per key
+    @param idle_timeout: Seconds after which an idle connection is closed
+    @param is_dropped: Function telling whether an idle connection has been closed by the other end
+    """
+
+    def __init__(self, maxsize, idle_timeout, is_dropped):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._is_dropped = is_dropped
+        self._idle = collections.defaultdict(collections.deque)
+        # Responses may release their connection while being garbage collected
+        self._lock = threading.RLock()
+        self._closed = False
+
+    def get(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                conn, released = idle.pop()
+                if time.monotonic() - released <= self.idle_timeout and not self._is_dropped(conn):
+                    return conn
+                conn.close()
+        return None
+
+    def put(self, key, conn):
+        with self._lock:
+            self._prune()
+            idle = self._idle[key]
+            if not self._closed and len(idle) < self.maxsize:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def _prune(self):
+        expired = time.monotonic() - self.idle_timeout
+        for key, idle in list(self._idle.items()):
+            while idle and idle[0][1] < expired:
+                idle.popleft()[0].close()
+            if not idle:
+                del self._idle[key]
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for idle in self._idle.values():
+                for conn, _ in idle:
+                    conn.close()
+            self._idle.clear()
+
+
+class DNSCache:
+    """
+    Cache of getaddrinfo() results, shared by the request handlers of the process.
+
+    getaddrinfo() does not tell the TTL of the records, so results are kept for a fixed time.
+    Failed lookups are kept for a shorter time, so that retries do not wait on the resolver each time.
+    Concurrent lookups of the same host are done only once.
+
+    @param ttl: Seconds for which a result is kept
+    @param negative_ttl: Seconds for which a failed lookup is kept
+    @param maxsize: Maximum number of results kept
+    """
+
+    # Number of hosts that prefetch() looks up at a time
+    PREFETCH_WORKERS = 4
+
+    def __init__(self, ttl=60, negative_ttl=5, maxsize=512):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        # (host, family, type, proto, flags) -> (expiry time, addresses or error)
+        self._cache = collections.OrderedDict()
+        # Keys that are being looked up -> Event set once the lookup is done
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _with_port(addrs, port):
+        return [(*addr[:4], (addr[4][0], port, *addr[4][2:])) for addr in addrs]
+
+    def _lookup(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if time.monotonic() >= expires:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _store(self, key, result, ttl):
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _result(result, port):
+        if isinstance(result, socket.gaierror):
+            raise socket.gaierror(*result.args)
+        return DNSCache._with_port(result, port)
+
+    def get(self, host, port, family=0, type=0, proto=0, flags=0):
+        """Return the cached result of getaddrinfo() for these arguments, or None if it is not cached"""
+        with self._lock:
+            result = self._lookup((host, family, type, proto, flags))
+        return None if result is None else self._result(result, port)
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        """Like socket.getaddrinfo(), but with cached results"""
+        key = (host, family, type, proto, flags)
+        while True:
+            with self._lock:
+                result = self._lookup(key)
+                if result is not None:
+                    return self._result(result, port)
+                event = self._pending.get(key)
+                if event is None:
+                    event = self._pending[key] = threading.Event()
+                    break
+            # Another thread is looking up the host, so wait for its result
+            event.wait()
+
+        try:
+            # The port is not part of the key, so that all ports of a host share the result
+            result = socket.getaddrinfo(host, None, family, type, proto, flags)
+        except socket.gaierror as e:
+            self._store(key, e, self.negative_ttl)
+            raise
+        else:
+            self._store(key, result, self.ttl)
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            event.set()
+        return self._with_port(result, port)
+
+    def prefetch(self, hosts):
+        """Look up hosts in the background, so that the results are cached by the time they are needed"""
+        with self._lock:
+            hosts = [host for host in dict.fromkeys(hosts) if host and not self._is_known(host)]
+        if not hosts:
+            return
+
+        def worker():
+            while True:
+                with lock:
+                    if not hosts:
+                        return
+                    host = hosts.pop()
+                with contextlib.suppress(OSError, UnicodeError):
+                    self.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+
+        lock = threading.Lock()
+        for _ in range(min(len(hosts), self.PREFETCH_WORKERS)):
+            threading.Thread(target=worker, name='dns prefetch', daemon=True).start()
+
+    def _is_known(self, host):
+        key = (host, 0, socket.SOCK_STREAM, 0, 0)
+        return key in self._pending or self._lookup(key) is not None
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+dns_cache = DNSCache()
+
+
+class TLSSessionCache:
+    """
+    The last TLS session with each host, so that new connections can resume it rather than do a full handshake.
+    A session can only be resumed with the SSLContext that created it, so sessions are kept per context.
+
+    @param maxsize: Maximum number of sessions kept per context
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._sessions = weakref.WeakKeyDictionary()  # SSLContext: OrderedDict of server hostname: session
+        self._lock = threading.Lock()
+
+    def get(self, context, server_hostname):
+        with self._lock:
+            sessions = self._sessions.get(context)
+            return sessions.get(server_hostname) if sessions else None
+
+    def save(self, ssl_object):
+        """
+        Keep the session of an SSLSocket or SSLObject.
+        With TLS 1.3 the server sends the session ticket after the handshake,
+        so this should be called once some data has been received
+        """
+        session = getattr(ssl_object, 'session', None)
+        if session is None or not ssl_object.server_hostname:
+            return
+        with self._lock:
+            sessions = self._sessions.setdefault(ssl_object.context, collections.OrderedDict())
+            sessions[ssl_object.server_hostname] = session
+            sessions.move_to_end(ssl_object.server_hostname)
+            while len(sessions) > self.maxsize:
+                sessions.popitem(last=False)
+
+    def wrap_socket(self, context, sock, server_hostname):
+        """Like SSLContext.wrap_socket(), but resumes the session with the host if there is one"""
+        with measure_timing('tls'):
+            ssl_sock = context.wrap_socket(
+                sock, server_hostname=server_hostname, session=self.get(context, server_hostname))
+        record_tls_handshake(ssl_sock)
+        return ssl_sock
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+
+tls_sessions = TLSSessionCache()
+
+
+class _DeflateDecoder:
+    """Decoder for "deflate", which servers send either as raw deflate or as zlib data"""
+
+    def __init__(self):
+        self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        # The data received while the format is unknown
+        self._data = b''
+
+    def decompress(self, data):
+        if self._data is None:
+            return self._obj.decompress(data)
+        self._data += data
+        try:
+            decoded = self._obj.decompress(data)
+        except zlib.error:
+            self._obj = zlib.decompressobj()
+            decoded = self._obj.decompress(self._data)
+            self._data = None
+            return decoded
+        if decoded:
+            self._data = None
+        return decoded
+
+    def flush(self):
+        return self._obj.flush()
+
+
+class _BrotliDecoder:
+    def __init__(self):
+        decompressor = brotli.Decompressor()
+        # brotlicffi only has decompress()
+        self.decompress = getattr(decompressor, 'process', None) or decompressor.decompress
+
+    def flush(self):
+        return b''
+
+
+class _ZstdDecoder:
+    """Decoder for "zstd", which may consist of several frames"""
+
+    def __init__(self):
+        self._obj = self._decompressor()
+
+    @staticmethod
+    def _decompressor():
+        decompressor = zstd.ZstdDecompressor()
+        # compression.zstd (Python 3.14+) decompresses incrementally; zstandard needs a decompressobj
+        return decompressor.decompressobj() if hasattr(decompressor, 'decompressobj') else decompressor
+
+    def decompress(self, data):
+        decoded = []
+        while data:
+            decoded.append(self._obj.decompress(data))
+            if not getattr(self._obj, 'eof', False):
+                break
+            data = self._obj.unused_data
+            self._obj = self._decompressor()
+        return b''.join(decoded)
+
+    def flush(self):
+        return b''
+
+
+class ContentDecoder:
+    """
+    Incremental decoder for the Content-Encoding of a response.
+    Encodings that are not supported are left as they are
+    """
+
+    def __init__(self, content_encoding):
+        # Content-Encoding header lists the encodings in order that they were applied [1].
+        # To decompress, we simply do the reverse.
+        # [1]: https://datatracker.ietf.org/doc/html/rfc9110#name-content-encoding
+        self._decoders = []
+        for encoding in (e.strip().lower() for e in reversed(content_encoding.split(','))):
+            if encoding == 'gzip':
+                # There may be junk added the end of the file
+                # We ignore it by only ever decoding a single gzip payload
+                self._decoders.append(zlib.decompressobj(wbits=zlib.MAX_WBITS | 16))
+            elif encoding == 'deflate':
+                self._decoders.append(_DeflateDecoder())
+            elif encoding == 'br' and brotli:
+                self._decoders.append(_BrotliDecoder())
+            elif encoding == 'zstd' and zstd:
+                self._decoders.append(_ZstdDecoder())
+
+    def __bool__(self):
+        return bool(self._decoders)
+
+    def decompress(self, data):
+        for decoder in self._decoders:
+            if not data:
+                break
+            data = decoder.decompress(data)
+        return data
+
+    def flush(self):
+        """Decode the data that is left once the whole body has been passed to decompress()"""
+        data = b''
+        for decoder in self._decoders:
+            data = (decoder.decompress(data) if data else b'') + decoder.flush()
+        return data
+
+
 def add_accept_encoding_header(headers: HTTPHeaderDict, supported_encodings: Iterable[str]):
     if 'Accept-Encoding' not in headers:
         headers['Accept-Encoding'] = ', '.join(supported_encodings) or 'identity'
 
 
 def wrap_request_errors(func):
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except RequestError as e:
+                if e.handler is None:
+                    e.handler = self
+                raise
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         try:
@@ -199,6 +568,40 @@ def wrapper(self, *args, **kwargs):
     return wrapper
 
 
+def get_request_timings() -> RequestTimings | None:
+    """Get the timings of the request that is being sent by a RequestHandler in this context"""
+    return _request_timings.get()
+
+
+def record_tls_handshake(ssl_object):
+    """Count a TLS handshake of the request that is being sent, given the SSLSocket or SSLObject"""
+    timings = _request_timings.get()
+    if timings is None or not hasattr(ssl_object, 'session_reused'):
+        return
+    timings.add('tls_handshakes', 1)
+    if ssl_object.session_reused:
+        timings.add('tls_resumed', 1)
+
+
+@contextlib.contextmanager
+def measure_timing(name, exclude=()):
+    """
+    Add the time spent inside this context to the timing `name` of the request that is being sent.
+    Time added to the timings in `exclude` meanwhile is not counted
+    """
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+    excluded = sum(getattr(timings, key) or 0 for key in exclude)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings.add(name, elapsed - (sum(getattr(timings, key) or 0 for key in exclude) - excluded))
+
+
 def _socket_connect(ip_addr, timeout, source_address):
     af, socktype, proto, canonname, sa = ip_addr
     sock = socket.socket(af, socktype, proto)
@@ -243,7 +646,8 @@ def create_connection(
     # This filters the addresses based on the given source_address.
     # Based on: https://github.com/python/cpython/blob/main/Lib/socket.py#L810
     host, port = address
-    ip_addrs = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    with measure_timing('dns'):
+        ip_addrs = dns_cache.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
     if not ip_addrs:
         raise OSError('getaddrinfo returns an empty list')
     if source_address is not None:
@@ -257,7 +661,8 @@ def create_connection(
     err = None
     for ip_addr in ip_addrs:
         try:
-            sock = _create_socket_func(ip_addr, timeout, source_address)
+            with measure_timing('connect'):
+                sock = _create_socket_func(ip_addr, timeout, source_address)
             # Explicitly break __traceback__ reference cycle
             # https://bugs.python.org/issue36820
             err = None
@@ -39,7 +39,10 @@
     create_connection,
     create_socks_proxy_socket,
     get_redirect_method,
+    get_request_timings,
     make_socks_proxy_opts,
+    measure_timing,
+    record_tls_handshake,
 )
 from .common import (
     Features,
@@ -127,9 +130,9 @@ def read(self, amt: int | None = None):
             if amt is None:
                 # Python 3.9 preallocates the whole read buffer, read in chunks
                 read_chunk = functools.partial(self.fp.read, 1 << 20, decode_content=True)
-                return b''.join(iter(read_chunk, b''))
+                return self._record_read(b''.join(iter(read_chunk, b'')))
             # Interact with urllib3 response directly.
-            return self.fp.read(amt, decode_content=True)
+            return self._record_read(self.fp.read(amt, decode_content=True), amt)
 
         # See urllib3.response.HTTPResponse.read() for exceptions raised on read
         except urllib3.exceptions.SSLError as e:
@@ -164,13 +167,18 @@ def __init__(self, ssl_context=None, proxy_ssl_context=None, source_address=None
         super().__init__(**kwargs)
 
     def init_poolmanager(self, *args, **kwargs):
-        return super().init_poolmanager(*args, **kwargs, **self._pm_args)
+        super().init_poolmanager(*args, **kwargs, **self._pm_args)
+        self.poolmanager.pool_classes_by_scheme = TIMED_POOL_CLASSES_BY_SCHEME
 
     def proxy_manager_for(self, proxy, **proxy_kwargs):
         extra_kwargs = {}
-        if not proxy.lower().startswith('socks') and self._proxy_ssl_context:
+        is_socks = proxy.lower().startswith('socks')
+        if not is_socks and self._proxy_ssl_context:
             extra_kwargs['proxy_ssl_context'] = self._proxy_ssl_context
-        return super().proxy_manager_for(proxy, **proxy_kwargs, **self._pm_args, **extra_kwargs)
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs, **self._pm_args, **extra_kwargs)
+        if not is_socks:
+            manager.pool_classes_by_scheme = TIMED_POOL_CLASSES_BY_SCHEME
+        return manager
 
     # Skip `requests` internal verification; we use our own SSLContext
     def cert_verify(*args, **kwargs):
@@ -252,6 +260,7 @@ class RequestsRH(RequestHandler, InstanceStoreMixin):
     _SUPPORTED_PROXY_SCHEMES = ('http', 'https', 'socks4', 'socks4a', 'socks5', 'socks5h')
     _SUPPORTED_FEATURES = (Features.NO_PROXY, Features.ALL_PROXY)
     RH_NAME = 'requests'
+    _VALIDATE_SHAPE_ONLY = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -351,6 +360,10 @@ def _send(self, request):
             # Miscellaneous Requests exceptions. May not necessary be network related e.g. InvalidURL
             raise RequestError(cause=e) from e
 
+        timings = get_request_timings()
+        if timings:
+            timings.reused = timings.connect is None
+
         res = RequestsResponseAdapter(requests_res)
 
         if not 200 <= res.status < 300:
@@ -364,6 +377,50 @@ def requests_preference(rh, request):
     return 100
 
 
+requests_preference.shape_only = True
+
+
+class TimedHTTPConnection(urllib3.connection.HTTPConnection):
+    def _new_conn(self):
+        # Use our create_connection() rather than urllib3's, so that host names are looked up in the DNS cache
+        try:
+            sock = create_connection(
+                address=(self._dns_host, self.port),
+                timeout=self.timeout,
+                source_address=self.source_address)
+        except (socket.timeout, TimeoutError) as e:
+            raise urllib3.exceptions.ConnectTimeoutError(
+                self, f'Connection to {self.host} timed out. (connect timeout={self.timeout})') from e
+        except OSError as e:
+            raise urllib3.exceptions.NewConnectionError(
+                self, f'Failed to establish a new connection: {e}') from e
+        for option in self.socket_options or ():
+            sock.setsockopt(*option)
+        return sock
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, urllib3.connection.HTTPSConnection):
+    def connect(self):
+        with measure_timing('tls', exclude=('dns', 'connect')):
+            super().connect()
+        # urllib3 does not resume TLS sessions
+        record_tls_handshake(getattr(self.sock, 'sslobj', self.sock))
+
+
+class TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+TIMED_POOL_CLASSES_BY_SCHEME = {
+    'http': TimedHTTPConnectionPool,
+    'https': TimedHTTPSConnectionPool,
+}
+
+
 # Use our socks proxy implementation with requests to avoid an extra dependency.
 class SocksHTTPConnection(urllib3.connection.HTTPConnection):
     def __init__(self, _socks_options, *args, **kwargs):  # must use _socks_options to pass PoolKey checks
@@ -388,7 +445,7 @@ def _new_conn(self):
                 self, f'Failed to establish a new connection: {e}') from e
 
 
-class SocksHTTPSConnection(SocksHTTPConnection, urllib3.connection.HTTPSConnection):
+class SocksHTTPSConnection(SocksHTTPConnection, TimedHTTPSConnection):
     pass
 
 
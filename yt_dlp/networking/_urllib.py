@@ -3,6 +3,7 @@
 import functools
 import http.client
 import io
+import select
 import ssl
 import urllib.error
 import urllib.parse
@@ -20,12 +21,16 @@
 )
 
 from ._helper import (
+    ConnectionPool,
+    ContentDecoder,
     InstanceStoreMixin,
     add_accept_encoding_header,
     create_connection,
     create_socks_proxy_socket,
     get_redirect_method,
+    get_request_timings,
     make_socks_proxy_opts,
+    tls_sessions,
 )
 from .common import Features, RequestHandler, Response, register_rh
 from .exceptions import (
@@ -37,7 +42,7 @@
     SSLError,
     TransportError,
 )
-from ..dependencies import brotli
+from ..dependencies import brotli, zstd
 from ..socks import ProxyError as SocksProxyError
 from ..utils import update_url_query
 from ..utils.networking import normalize_url, select_proxy
@@ -49,6 +54,10 @@
     SUPPORTED_ENCODINGS.append('br')
     CONTENT_DECODE_ERRORS.append(brotli.error)
 
+if zstd:
+    SUPPORTED_ENCODINGS.append('zstd')
+    CONTENT_DECODE_ERRORS.append(zstd.ZstdError)
+
 
 def _create_http_connection(http_class, source_address, *args, **kwargs):
     hc = http_class(*args, **kwargs)
@@ -59,9 +68,84 @@ def _create_http_connection(http_class, source_address, *args, **kwargs):
     if source_address is not None:
         hc.source_address = (source_address, 0)
 
+    # SocksConnection does the TLS handshake in its own connect()
+    if type(hc).connect is http.client.HTTPSConnection.connect:
+        hc.connect = functools.partial(_tls_connect, hc)
+
     return hc
 
 
+def _is_connection_dropped(conn):
+    # An idle connection should have nothing to read: if it does, the server has closed it (or sent garbage)
+    try:
+        return conn.sock is None or bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+class _KeepAliveHTTPResponse(http.client.HTTPResponse):
+    """HTTPResponse that hands its connection back to the pool once the body has been read"""
+    _release_conn = None
+    _trailer_read = False
+
+    def _read_and_discard_trailer(self):
+        super()._read_and_discard_trailer()
+        self._trailer_read = True
+
+    def _close_conn(self):
+        super()._close_conn()
+        release, self._release_conn = self._release_conn, None
+        if release:
+            # The response is also closed when it is discarded before the whole body was read,
+            # in which case what is left of the body would be read as the next response
+            release(not self.will_close and (self.length == 0 or self._trailer_read))
+
+
+def _tls_connect(conn):
+    # Same as http.client.HTTPSConnection.connect(), but resumes the TLS session with the host if possible
+    http.client.HTTPConnection.connect(conn)
+    conn.sock = tls_sessions.wrap_socket(conn._context, conn.sock, conn._tunnel_host or conn.host)
+
+
+class _DecodingReader(io.RawIOBase):
+    """Decodes the body of a response as it is read, so that it need not be read in full first"""
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, fp: http.client.HTTPResponse, decoder):
+        self._fp = fp
+        self._decoder = decoder
+        self._buffer = b''
+        self._raw_read = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer and self._decoder is not None:
+            # read() would wait for the whole chunk size to be received
+            data = self._fp.read1(self.CHUNK_SIZE)
+            if data:
+                self._raw_read += len(data)
+                self._buffer = self._decoder.decompress(data)
+            elif self._fp.length:
+                # Unlike read(), read1() does not complain if the connection is closed early
+                raise IncompleteRead(partial=self._raw_read, expected=self._fp.length)
+            else:
+                # read1() leaves it to read() to finish the response and release the connection
+                self._fp.read()
+                self._buffer, self._decoder = self._decoder.flush(), None
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._fp.close()
+        super().close()
+
+
 class HTTPHandler(urllib.request.AbstractHTTPHandler):
     """Handler for HTTP requests and responses.
 
@@ -77,10 +161,18 @@ class HTTPHandler(urllib.request.AbstractHTTPHandler):
     public domain.
     """
 
+    # Maximum number of idle connections kept per host, and for how long (in seconds)
+    POOL_MAXSIZE = 10
+    POOL_IDLE_TIMEOUT = 30
+
+    # Errors of a request sent on an idle connection which the server had closed in the meantime
+    _STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
     def __init__(self, context=None, source_address=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._source_address = source_address
         self._context = context
+        self._pool = ConnectionPool(self.POOL_MAXSIZE, self.POOL_IDLE_TIMEOUT, _is_connection_dropped)
 
     @staticmethod
     def _make_conn_class(base, req):
@@ -91,39 +183,106 @@ def _make_conn_class(base, req):
         return conn_class
 
     def http_open(self, req):
+        pool_key = ('http', req.host, req.headers.get('Ytdl-socks-proxy'))
         conn_class = self._make_conn_class(http.client.HTTPConnection, req)
         return self.do_open(functools.partial(
-            _create_http_connection, conn_class, self._source_address), req)
+            _create_http_connection, conn_class, self._source_address), req, pool_key=pool_key)
 
     def https_open(self, req):
+        pool_key = ('https', req.host, req.headers.get('Ytdl-socks-proxy'))
         conn_class = self._make_conn_class(http.client.HTTPSConnection, req)
         return self.do_open(
             functools.partial(
                 _create_http_connection, conn_class, self._source_address),
-            req, context=self._context)
+            req, pool_key=pool_key, context=self._context)
+
+    def do_open(self, http_class, req, pool_key=None, **http_conn_args):
+        """
+        Like AbstractHTTPHandler.do_open, but reuses the connection for later requests to the same host
+        once the response has been read (unless either side asked for the connection to be closed)
+        """
+        host = req.host
+        if not host:
+            raise urllib.error.URLError('no host given')
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers = {name.title(): val for name, val in headers.items()}
+
+        tunnel_headers = {}
+        if req._tunnel_host and 'Proxy-Authorization' in headers:
+            # Proxy-Authorization should not be sent to the origin server
+            tunnel_headers['Proxy-Authorization'] = headers.pop('Proxy-Authorization')
+
+        if pool_key is not None:
+            # A tunnel can only be shared by requests that would have set it up the same way
+            pool_key = (*pool_key, req._tunnel_host, tuple(tunnel_headers.items()))
+        keep_alive = pool_key is not None and headers.get('Connection', '').lower() != 'close'
+        if not keep_alive:
+            headers['Connection'] = 'close'
+
+        conn = self._pool.get(pool_key) if pool_key else None
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = http_class(host, timeout=req.timeout, **http_conn_args)
+                if req._tunnel_host:
+                    conn.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            else:
+                conn.timeout = req.timeout
+                conn.sock.settimeout(req.timeout)
+            conn.set_debuglevel(self._debuglevel)
+            conn.response_class = _KeepAliveHTTPResponse
+
+            try:
+                r = self._request(conn, req, headers)
+                break
+            except Exception as e:
+                conn.close()
+                cause = e.reason if isinstance(e, urllib.error.URLError) else e
+                if not (reused and isinstance(cause, self._STALE_CONNECTION_ERRORS)
+                        and (req.data is None or isinstance(req.data, bytes))):
+                    raise
+                # The server closed the connection while it was idle; retry once on a new one
+                conn, reused = None, False
+
+        if isinstance(conn.sock, ssl.SSLSocket):
+            # The session ticket has been received along with the response, at the latest
+            tls_sessions.save(conn.sock)
+
+        if not keep_alive:
+            # Make sure the socket is closed when the response object goes away
+            if conn.sock:
+                conn.sock.close()
+                conn.sock = None
+        else:
+            r._release_conn = functools.partial(self._release_connection, pool_key, conn)
+            if r.length == 0:
+                # Nothing to read, so the connection can be reused right away
+                r._close_conn()
+
+        r.url = req.get_full_url()
+        # urllib clients expect the response to have the reason in .msg
+        r.msg = r.reason
+        return r
 
     @staticmethod
-    def deflate(data):
-        if not data:
-            return data
+    def _request(conn, req, headers):
         try:
-            return zlib.decompress(data, -zlib.MAX_WBITS)
-        except zlib.error:
-            return zlib.decompress(data)
+            conn.request(req.get_method(), req.selector, req.data, headers,
+                         encode_chunked=req.has_header('Transfer-encoding'))
+        except OSError as err:  # timeout error
+            raise urllib.error.URLError(err)
+        return conn.getresponse()
 
-    @staticmethod
-    def brotli(data):
-        if not data:
-            return data
-        return brotli.decompress(data)
+    def _release_connection(self, pool_key, conn, reusable):
+        if reusable and conn.sock is not None:
+            self._pool.put(pool_key, conn)
+        else:
+            conn.close()
 
-    @staticmethod
-    def gz(data):
-        # There may be junk added the end of the file
-        # We ignore it by only ever decoding a single gzip payload
-        if not data:
-            return data
-        return zlib.decompress(data, wbits=zlib.MAX_WBITS | 16)
+    def close(self):
+        self._pool.close()
 
     def http_request(self, req):
         # According to RFC 3986, URLs can not contain non-ASCII characters, however this is not
@@ -146,20 +305,11 @@ def http_request(self, req):
     def http_response(self, req, resp):
         old_resp = resp
 
-        # Content-Encoding header lists the encodings in order that they were applied [1].
-        # To decompress, we simply do the reverse.
-        # [1]: https://datatracker.ietf.org/doc/html/rfc9110#name-content-encoding
-        decoded_response = None
-        for encoding in (e.strip() for e in reversed(resp.headers.get('Content-encoding', '').split(','))):
-            if encoding == 'gzip':
-                decoded_response = self.gz(decoded_response or resp.read())
-            elif encoding == 'deflate':
-                decoded_response = self.deflate(decoded_response or resp.read())
-            elif encoding == 'br' and brotli:
-                decoded_response = self.brotli(decoded_response or resp.read())
-
-        if decoded_response is not None:
-            resp = urllib.request.addinfourl(io.BytesIO(decoded_response), old_resp.headers, old_resp.url, old_resp.code)
+        decoder = ContentDecoder(resp.headers.get('Content-encoding', ''))
+        if decoder:
+            resp = urllib.request.addinfourl(
+                io.BufferedReader(_DecodingReader(old_resp, decoder), _DecodingReader.CHUNK_SIZE),
+                old_resp.headers, old_resp.url, old_resp.code)
             resp.msg = old_resp.msg
         # Percent-encode redirect URL of Location HTTP header to satisfy RFC 3986 (see
         # https://github.com/ytdl-org/youtube-dl/issues/6457).
@@ -195,7 +345,7 @@ def connect(self):
                 _create_socket_func=functools.partial(
                     create_socks_proxy_socket, (self.host, self.port), proxy_args))
             if isinstance(self, http.client.HTTPSConnection):
-                self.sock = self._context.wrap_socket(self.sock, server_hostname=self.host)
+                self.sock = tls_sessions.wrap_socket(self._context, self.sock, self.host)
 
     return SocksConnection
 
@@ -306,7 +456,7 @@ def __init__(self, res: http.client.HTTPResponse | urllib.response.addinfourl):
 
     def read(self, amt=None):
         try:
-            return self.fp.read(amt)
+            return self._record_read(self.fp.read(amt), amt)
         except Exception as e:
             handle_response_read_exceptions(e)
             raise e
@@ -336,6 +486,7 @@ class UrllibRH(RequestHandler, InstanceStoreMixin):
     _SUPPORTED_PROXY_SCHEMES = ('http', 'socks4', 'socks4a', 'socks5', 'socks5h')
     _SUPPORTED_FEATURES = (Features.NO_PROXY, Features.ALL_PROXY)
     RH_NAME = 'urllib'
+    _VALIDATE_SHAPE_ONLY = True
 
     def __init__(self, *, enable_file_urls: bool = False, **kwargs):
         super().__init__(**kwargs)
@@ -343,6 +494,9 @@ def __init__(self, *, enable_file_urls: bool = False, **kwargs):
         if self.enable_file_urls:
             self._SUPPORTED_URL_SCHEMES = (*self._SUPPORTED_URL_SCHEMES, 'file')
 
+    def close(self):
+        self._clear_instances()
+
     def _check_extensions(self, extensions):
         super()._check_extensions(extensions)
         extensions.pop('cookiejar', None)
@@ -395,6 +549,7 @@ def _send(self, request):
             cookiejar=self._get_cookiejar(request),
             legacy_ssl_support=request.extensions.get('legacy_ssl'),
         )
+        timings = get_request_timings()
         try:
             res = opener.open(urllib_req, timeout=self._calculate_timeout(request))
         except urllib.error.HTTPError as e:
@@ -421,5 +576,8 @@ def _send(self, request):
         except Exception as e:
             handle_response_read_exceptions(e)
             raise  # unexpected
+        finally:
+            if timings and urllib.parse.urlparse(request.url).scheme.lower() in ('http', 'https'):
+                timings.reused = timings.connect is None
 
         return UrllibResponseAdapter(res)
@@ -99,6 +99,7 @@ class WebsocketsRH(WebSocketRequestHandler):
     _SUPPORTED_PROXY_SCHEMES = ('socks4', 'socks4a', 'socks5', 'socks5h')
     _SUPPORTED_FEATURES = (Features.ALL_PROXY, Features.NO_PROXY)
     RH_NAME = 'websockets'
+    _VALIDATE_SHAPE_ONLY = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -0,0 +1,296 @@
+"""On-disk cache of HTTP responses (--http-cache)"""
+
+from __future__ import annotations
+
+import contextlib
+import email.utils
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import typing
+from email.message import Message
+
+from .common import Request, Response
+from .exceptions import HTTPError
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+    from http.cookiejar import CookieJar
+
+
+def _parse_date(value):
+    try:
+        return email.utils.mktime_tz(email.utils.parsedate_tz(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _cache_control(value):
+    """Parse a Cache-Control header into a dict of the lowercase directives and their values"""
+    return {
+        mobj.group('name').lower(): mobj.group('value') or mobj.group('quoted')
+        for mobj in re.finditer(r'(?P<name>[\w-]+)(?:\s*=\s*(?:"(?P<quoted>[^"]*)"|(?P<value>[^\s,]*)))?', value or '')
+    }
+
+
+def _seconds(value):
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HTTPCache:
+    """
+    Cache of HTTP responses on disk.
+
+    Only GET requests without a body or a Range header are cached, and only complete 200 responses are stored.
+    A stored response is reused as long as it is fresh according to its Cache-Control, Expires and Age headers.
+    Once stale, it is revalidated with If-None-Match/If-Modified-Since, and a 304 from the server reuses the stored body.
+    Requests are keyed by their URL, headers and cookies, so that a response is never reused for a request
+    with different credentials; responses that set cookies or have Cache-Control: no-store are not stored.
+    The least recently used responses are evicted when the total size of the cache exceeds max_size.
+
+    Whether a response was served from the cache is in response.extensions['http_cache']:
+    "hit", "revalidated" or "miss".
+
+    @param directory: Directory to store the responses in.
+    @param max_size: Maximum total size of the stored responses, in bytes.
+    @param cookiejar: Cookie jar used by the request handlers.
+    """
+
+    # RFC 9111 4.2.2: responses without explicit freshness may be fresh for 10% of the time since they were
+    # last modified. This is capped so that a page that has not changed for years is still revalidated daily
+    HEURISTIC_FRESHNESS_FRACTION = 0.1
+    HEURISTIC_FRESHNESS_MAX = 24 * 60 * 60
+    # Headers that describe the transfer of the body rather than the body, which is stored decoded
+    _TRANSFER_HEADERS = ('Content-Encoding', 'Content-Length', 'Transfer-Encoding')
+
+    def __init__(self, directory: str, max_size: int, cookiejar: CookieJar | None = None):
+        self.directory = directory
+        self.max_size = max_size
+        self.cookiejar = cookiejar
+        self._lock = threading.Lock()
+
+    def send(self, request: Request, send: Callable[[Request], Response]) -> Response:
+        """Send a request with send(), or answer it from the cache"""
+        request_cc = _cache_control(request.headers.get('Cache-Control'))
+        if (request.method != 'GET' or request.data is not None
+                or 'Range' in request.headers or 'no-store' in request_cc):
+            return send(request)
+
+        key = self._key(request)
+        entry = self._load(key)
+        if not entry:
+            return self._store(key, send(request))
+
+        if (self._freshness_lifetime(entry) > self._current_age(entry)
+                and 'no-cache' not in request_cc and _seconds(request_cc.get('max-age')) != 0):
+            response = self._cached_response(key, entry, 'hit')
+            if response:
+                return response
+
+        headers = Message()
+        for name, value in entry['headers']:
+            headers[name] = value
+        if not (headers.get('ETag') or headers.get('Last-Modified')):
+            return self._store(key, send(request))
+
+        conditional_request = request.copy()
+        if headers.get('ETag'):
+            conditional_request.headers['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            conditional_request.headers['If-Modified-Since'] = headers['Last-Modified']
+        try:
+            response = send(conditional_request)
+        except HTTPError as e:
+            if e.status != 304:
+                raise
+            e.response.close()
+            return (self._cached_response(key, self._revalidated(key, entry, e.response), 'revalidated')
+                    or self._store(key, send(request)))
+        return self._store(key, response)
+
+    def _key(self, request):
+        cookiejar = request.extensions.get('cookiejar')
+        if cookiejar is None:
+            cookiejar = self.cookiejar
+        return hashlib.sha256(json.dumps([
+            request.method, request.url, sorted((name.lower(), value) for name, value in request.headers.items()),
+            cookiejar.get_cookie_header(request.url) if cookiejar is not None else None,
+            str(request.extensions.get('impersonate')),
+        ]).encode()).hexdigest()
+
+    def _path(self, key, ext):
+        return os.path.join(self.directory, f'{key}.{ext}')
+
+    def _load(self, key):
+        try:
+            with open(self._path(key, 'json'), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.isfile(self._path(key, 'body')):
+            return None
+        return entry
+
+    def _write_entry(self, key, entry):
+        with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.directory, prefix=f'{key}.', suffix='.json.part', delete=False) as f:
+            json.dump(entry, f)
+        os.replace(f.name, self._path(key, 'json'))
+
+    @staticmethod
+    def _current_age(entry):
+        """Current age of a stored response (RFC 9111 4.2.3)"""
+        headers = dict((name.lower(), value) for name, value in entry['headers'])
+        date = _parse_date(headers.get('date'))
+        apparent_age = max(entry['time'] - date, 0) if date else 0
+        corrected_age = max(apparent_age, _seconds(headers.get('age')) or 0)
+        return corrected_age + max(time.time() - entry['time'], 0)
+
+    def _freshness_lifetime(self, entry):
+        """Freshness lifetime of a stored response (RFC 9111 4.2.1)"""
+        headers = dict((name.lower(), value) for name, value in entry['headers'])
+        cache_control = _cache_control(headers.get('cache-control'))
+        if 'no-cache' in cache_control:
+            return 0
+        max_age = _seconds(cache_control.get('max-age'))
+        if max_age is not None:
+            return max_age
+        date = _parse_date(headers.get('date')) or entry['time']
+        if 'expires' in headers:
+            expires = _parse_date(headers['expires'])
+            return max(expires - date, 0) if expires else 0
+        last_modified = _parse_date(headers.get('last-modified'))
+        if last_modified:
+            return min(max(date - last_modified, 0) * self.HEURISTIC_FRESHNESS_FRACTION, self.HEURISTIC_FRESHNESS_MAX)
+        return 0
+
+    def _revalidated(self, key, entry, response):
+        """Update a stored response with the headers of a 304 (RFC 9111 4.3.4)"""
+        updated = {name.lower() for name in response.headers} - {name.lower() for name in self._TRANSFER_HEADERS}
+        entry = {
+            **entry,
+            'headers': [
+                *((name, value) for name, value in entry['headers'] if name.lower() not in updated),
+                *((name, value) for name, value in response.headers.items() if name.lower() in updated),
+            ],
+            'time': time.time(),
+        }
+        with contextlib.suppress(OSError):
+            self._write_entry(key, entry)
+        return entry
+
+    def _cached_response(self, key, entry, status):
+        try:
+            fp = open(self._path(key, 'body'), 'rb')
+        except OSError:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(self._path(key, 'json'))  # For eviction of the least recently used
+        headers = Message()
+        for name, value in entry['headers']:
+            headers[name] = value
+        headers['Content-Length'] = str(entry['size'])
+        return Response(fp, entry['url'], headers, entry['status'], entry.get('reason'), extensions={'http_cache': status})
+
+    def _store(self, key, response):
+        response.extensions['http_cache'] = 'miss'
+        cache_control = _cache_control(response.headers.get('Cache-Control'))
+        if (response.status != 200 or 'no-store' in cache_control or 'Set-Cookie' in response.headers
+                or response.headers.get('Vary') == '*'):
+            return response
+        entry = {
+            'url': response.url,
+            'status': response.status,
+            'reason': response.reason,
+            'headers': [
+                (name, value) for name, value in response.headers.items()
+                if name.lower() not in {name.lower() for name in self._TRANSFER_HEADERS}],
+            'time': time.time(),
+        }
+        if not self._freshness_lifetime(entry) and not (
+                response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            return response
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            body = tempfile.NamedTemporaryFile(dir=self.directory, prefix=f'{key}.', suffix='.body.part', delete=False)
+        except OSError:
+            return response
+        return _CachingResponse(
+            response, body, self.max_size, lambda size: self._commit(key, entry, body.name, size))
+
+    def _commit(self, key, entry, body_filename, size):
+        os.replace(body_filename, self._path(key, 'body'))
+        self._write_entry(key, {**entry, 'size': size})
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries, total_size = [], 0
+            for dirent in os.scandir(self.directory):
+                key, _, ext = dirent.name.partition('.')
+                with contextlib.suppress(OSError):
+                    stat = dirent.stat()
+                    total_size += stat.st_size
+                    if ext == 'json':
+                        entries.append((stat.st_mtime, key))
+            if total_size <= self.max_size:
+                return
+            for _, key in sorted(entries):
+                for ext in ('json', 'body'):
+                    with contextlib.suppress(OSError):
+                        total_size -= os.path.getsize(self._path(key, ext))
+                        os.remove(self._path(key, ext))
+                if total_size <= self.max_size:
+                    break
+
+
+class _CachingResponse(Response):
+    """Response that writes its body to the cache as it is read, and commits it once it has been read completely"""
+
+    def __init__(self, response: Response, body: typing.BinaryIO, max_size: int, commit: Callable[[int], None]):
+        super().__init__(response, response.url, response.headers, response.status, response.reason, response.extensions)
+        self.timings = response.timings
+        self._body = body
+        self._max_size = max_size
+        self._commit = commit
+        self._size = 0
+
+    def read(self, amt: int | None = None) -> bytes:
+        try:
+            data = self.fp.read(amt)
+        except BaseException:
+            self._discard()
+            raise
+        if self._body:
+            try:
+                self._body.write(data)
+                self._size += len(data)
+                if self._size > self._max_size:
+                    self._discard()
+                elif amt is None or (not data and amt != 0):
+                    self._body.close()
+                    self._commit(self._size)
+                    self._body = None
+            except OSError:
+                self._discard()
+        return data
+
+    def _discard(self):
+        if not self._body:
+            return
+        self._body.close()
+        with contextlib.suppress(OSError):
+            os.remove(self._body.name)
+        self._body = None
+
+    def close(self):
+        # An incomplete body is not stored
+        self._discard()
+        return super().close()
@@ -2,9 +2,11 @@
 
 import abc
 import copy
+import dataclasses
 import enum
 import functools
 import io
+import time
 import typing
 import urllib.parse
 import urllib.request
@@ -13,8 +15,9 @@
 from email.message import Message
 from http import HTTPStatus
 
-from ._helper import make_ssl_context, wrap_request_errors
+from ._helper import _request_timings, get_ssl_context, wrap_request_errors
 from .exceptions import (
+    HTTPError,
     NoSupportingHandlers,
     RequestError,
     TransportError,
@@ -35,6 +38,13 @@
 
 
 def register_preference(*handlers: type[RequestHandler]):
+    """
+    Register a preference function for the given handlers (or all handlers if none are given)
+
+    A preference function that only depends on the handler and on the shape of the request
+    (its URL scheme, proxies and extensions) can set a `shape_only` attribute to True,
+    which allows RequestDirector to cache the order of the handlers for requests of the same shape.
+    """
     assert all(issubclass(handler, RequestHandler) for handler in handlers)
 
     def outer(preference: Preference):
@@ -57,15 +67,33 @@ class RequestDirector:
     can be registered into the `preferences` set. These are used to sort handlers
     in order of preference.
 
+    If all the preference functions have a `shape_only` attribute set to True (see register_preference)
+    and all the handlers have `_VALIDATE_SHAPE_ONLY` set to True (see RequestHandler),
+    the supporting handlers of a request, in order of preference, are cached by the shape of the request:
+    its URL scheme, proxies and extensions (which include the impersonate target).
+    The cache is cleared when handlers or preferences are added or removed.
+
+    Requests with the `http_cache` extension set to True are answered from `http_cache`
+    (a yt_dlp.networking.cache.HTTPCache), if it is set.
+    Requests are sent once `rate_limiter` (a yt_dlp.networking.ratelimit.HostRateLimiter)
+    allows, if it is set. The `rate_limit` extension configures the limits of the host.
+
     @param logger: Logger instance.
     @param verbose: Print debug request information to stdout.
     """
 
+    _EXTENSIONS = ('http_cache', 'rate_limit')
+    _HANDLER_CACHE_SIZE = 128
+
     def __init__(self, logger, verbose=False):
         self.handlers: dict[str, RequestHandler] = {}
         self.preferences: set[Preference] = set()
         self.logger = logger  # TODO(Grub4k): default logger
         self.verbose = verbose
+        self.http_cache = None
+        self.rate_limiter = None
+        self._handler_cache = {}
+        self._handler_cache_state = None
 
     def close(self):
         for handler in self.handlers.values():
@@ -91,6 +119,58 @@ def _print_verbose(self, msg):
         if self.verbose:
             self.logger.stdout(f'director: {msg}')
 
+    def _iter_supporting_handlers(self, handlers, request, unsupported_errors):
+        for handler in handlers:
+            self._print_verbose(f'Checking if "{handler.RH_NAME}" supports this request.')
+            try:
+                handler.validate(request)
+            except UnsupportedRequest as e:
+                self._print_verbose(
+                    f'"{handler.RH_NAME}" cannot handle this request (reason: {error_to_str(e)})')
+                unsupported_errors.append(e)
+                continue
+
+            yield handler
+
+    def _get_supporting_handlers(self, request, unsupported_errors):
+        """Supporting handlers in order of preference, cached by the shape of the request"""
+        state = (tuple(self.handlers.values()), frozenset(self.preferences))
+        if state != self._handler_cache_state:
+            self._handler_cache = (
+                {} if all(getattr(pref, 'shape_only', False) for pref in self.preferences)
+                and all(handler._VALIDATE_SHAPE_ONLY for handler in self.handlers.values()) else None)
+            self._handler_cache_state = state
+
+        cache, key = self._handler_cache, None
+        if cache is not None:
+            key = (
+                # The scheme parsed by RequestHandler._check_url_scheme only depends on the part before the first colon
+                request.url.partition(':')[0].lower(),
+                tuple(request.proxies.items()),
+                tuple(request.extensions.items()))
+            try:
+                cached = cache.get(key)
+            except TypeError:  # Unhashable extensions
+                key = None
+        if key is None:
+            return self._iter_supporting_handlers(self._get_handlers(request), request, unsupported_errors)
+
+        if cached:
+            self._print_verbose('Using the cached handlers for requests of this shape')
+        else:
+            errors = []
+            cached = list(self._iter_supporting_handlers(self._get_handlers(request), request, errors)), errors
+            if len(cache) >= self._HANDLER_CACHE_SIZE:
+                cache.clear()
+            cache[key] = cached
+        unsupported_errors.extend(cached[1])
+        return cached[0]
+
+    def _report_unexpected_error(self, handler, error):
+        self.logger.error(
+            f'[{handler.RH_NAME}] Unexpected error: {error_to_str(error)}{bug_reports_message()}',
+            is_error=False)
+
     def send(self, request: Request) -> Response:
         """
         Passes a request onto a suitable RequestHandler
@@ -100,31 +180,84 @@ def send(self, request: Request) -> Response:
 
         assert isinstance(request, Request)
 
+        request, extensions = self._pop_extensions(request)
+        send = self._send
+        if self.rate_limiter:
+            send = functools.partial(self.rate_limiter.send, send=send, limits=extensions.get('rate_limit'))
+        if extensions.get('http_cache') and self.http_cache:
+            return self.http_cache.send(request, send)
+        return send(request)
+
+    @staticmethod
+    def _pop_extensions(request):
+        """Split off the extensions that are handled by the director, and not passed on to the handlers"""
+        if request.extensions.keys().isdisjoint(RequestDirector._EXTENSIONS):
+            return request, {}
+        request = request.copy()
+        return request, {
+            key: request.extensions.pop(key) for key in RequestDirector._EXTENSIONS if key in request.extensions}
+
+    def _send(self, request):
+        start = time.perf_counter()
         unexpected_errors = []
         unsupported_errors = []
-        for handler in self._get_handlers(request):
-            self._print_verbose(f'Checking if "{handler.RH_NAME}" supports this request.')
+        for handler in self._get_supporting_handlers(request, unsupported_errors):
+            self._print_verbose(f'Sending request via "{handler.RH_NAME}"')
+            queue_time = time.perf_counter() - start
             try:
-                handler.validate(request)
-            except UnsupportedRequest as e:
-                self._print_verbose(
-                    f'"{handler.RH_NAME}" cannot handle this request (reason: {error_to_str(e)})')
-                unsupported_errors.append(e)
+                response = handler.send(request)
+            except HTTPError as e:
+                e.response.timings.queue = queue_time
+                raise
+            except RequestError:
+                raise
+            except Exception as e:
+                self._report_unexpected_error(handler, e)
+                unexpected_errors.append(e)
                 continue
 
+            assert isinstance(response, Response)
+            response.timings.queue = queue_time
+            return response
+
+        raise NoSupportingHandlers(unsupported_errors, unexpected_errors)
+
+    async def async_send(self, request: Request) -> Response:
+        """
+        Passes a request onto a suitable RequestHandler, from a coroutine.
+
+        Handlers that send requests natively with asyncio are tried first, in order of preference.
+        The other handlers send the request in a worker thread.
+        """
+        if not self.handlers:
+            raise RequestError('No request handlers configured')
+
+        assert isinstance(request, Request)
+
+        # The cache reads and writes files and the rate limiter blocks, so they are not used here
+        request, _ = self._pop_extensions(request)
+        start = time.perf_counter()
+        unexpected_errors = []
+        unsupported_errors = []
+        handlers = sorted(
+            self._get_supporting_handlers(request, unsupported_errors), key=lambda rh: not rh.native_async)
+        for handler in handlers:
             self._print_verbose(f'Sending request via "{handler.RH_NAME}"')
+            queue_time = time.perf_counter() - start
             try:
-                response = handler.send(request)
+                response = await handler.async_send(request)
+            except HTTPError as e:
+                e.response.timings.queue = queue_time
+                raise
             except RequestError:
                 raise
             except Exception as e:
-                self.logger.error(
-                    f'[{handler.RH_NAME}] Unexpected error: {error_to_str(e)}{bug_reports_message()}',
-                    is_error=False)
+                self._report_unexpected_error(handler, e)
                 unexpected_errors.append(e)
                 continue
 
             assert isinstance(response, Response)
+            response.timings.queue = queue_time
             return response
 
         raise NoSupportingHandlers(unsupported_errors, unexpected_errors)
@@ -156,6 +289,10 @@ class RequestHandler(abc.ABC):
     Concrete subclasses need to redefine the _send(request) method,
     which handles the underlying request logic and returns a Response.
 
+    Requests can also be sent from a coroutine with async_send(). By default, this runs
+    _send(request) in a worker thread. Subclasses that can send requests natively with asyncio
+    should redefine the _async_send(request) coroutine as well.
+
     RH_NAME class variable may contain a display name for the RequestHandler.
     By default, this is generated from the class name.
 
@@ -178,6 +315,11 @@ class RequestHandler(abc.ABC):
 
     The above may be set to None to disable the checks.
 
+    `_VALIDATE_SHAPE_ONLY` may be set to True if validate() only depends on the shape of the request:
+    its URL scheme, proxies and extensions. RequestDirector then caches the result for requests of
+    the same shape, if all its handlers set it. It is reset to False for subclasses that redefine
+    _validate() without setting it again.
+
     Parameters:
     @param logger: logger instance
     @param headers: HTTP Headers to include when sending requests.
@@ -219,6 +361,13 @@ class RequestHandler(abc.ABC):
     _SUPPORTED_URL_SCHEMES = ()
     _SUPPORTED_PROXY_SCHEMES = ()
     _SUPPORTED_FEATURES = ()
+    _VALIDATE_SHAPE_ONLY = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A redefined _validate() may depend on any part of the request
+        if '_validate' in vars(cls) and '_VALIDATE_SHAPE_ONLY' not in vars(cls):
+            cls._VALIDATE_SHAPE_ONLY = False
 
     def __init__(
         self, *,
@@ -250,7 +399,7 @@ def __init__(
         super().__init__()
 
     def _make_sslcontext(self, legacy_ssl_support=None):
-        return make_ssl_context(
+        return get_ssl_context(
             verify=self.verify,
             legacy_support=legacy_ssl_support if legacy_ssl_support is not None else self.legacy_ssl_support,
             use_certifi=not self.prefer_system_certs,
@@ -356,13 +505,59 @@ def validate(self, request: Request):
     def send(self, request: Request) -> Response:
         if not isinstance(request, Request):
             raise TypeError('Expected an instance of Request')
-        return self._send(request)
+        timings = RequestTimings()
+        token = _request_timings.set(timings)
+        try:
+            response = self._send(request)
+        except HTTPError as e:
+            e.response.timings = timings.received_headers()
+            raise
+        finally:
+            _request_timings.reset(token)
+        response.timings = timings.received_headers()
+        return response
+
+    @wrap_request_errors
+    async def async_send(self, request: Request) -> Response:
+        """Send a request from a coroutine. Like send(), but does not block the event loop"""
+        if not isinstance(request, Request):
+            raise TypeError('Expected an instance of Request')
+        timings = RequestTimings()
+        token = _request_timings.set(timings)
+        try:
+            response = await self._async_send(request)
+        except HTTPError as e:
+            e.response.timings = timings.received_headers()
+            raise
+        finally:
+            _request_timings.reset(token)
+        response.timings = timings.received_headers()
+        return response
 
     @abc.abstractmethod
     def _send(self, request: Request):
-        """Handle a request from start to finish. Redefine in subclasses."""
+        """Handle a request from start to finish. Redefine in subclasses.
+
+        While this runs, the RequestTimings of the request can be retrieved with
+        get_request_timings() to fill in the timings that the handler can measure
+        """
         pass
 
+    async def _async_send(self, request: Request):
+        """Handle a request from start to finish in a coroutine.
+
+        By default, _send() is run in a worker thread.
+        Redefine in subclasses that can send requests natively with asyncio.
+        """
+        import asyncio  # Slow to import and only needed here
+
+        return await asyncio.to_thread(self._send, request)
+
+    @classproperty
+    def native_async(cls):
+        """Whether the handler sends requests natively with asyncio, rather than in a worker thread"""
+        return cls._async_send is not RequestHandler._async_send
+
     def close(self):  # noqa: B027
         pass
 
@@ -509,6 +704,55 @@ def copy(self):
 PUTRequest = functools.partial(Request, method='PUT')
 
 
+@dataclasses.dataclass
+class RequestTimings:
+    """
+    Timings of a request, in seconds, as far as the request handler can measure them.
+    Timings that could not be measured are None.
+
+    All but `queue` are measured from when the request handler started to send the request.
+    If the request was redirected, the time spent on each connection is added up.
+
+    @param queue: Time spent selecting a request handler before the request was sent
+    @param dns: Time spent resolving host names
+    @param connect: Time spent opening connections, including proxy handshakes
+    @param tls: Time spent in TLS handshakes
+    @param ttfb: Time until the headers of the response were received
+    @param total: Time until the response was read in full or closed
+    @param bytes_received: Number of bytes of the response body that were read, after decoding
+    @param reused: Whether the request was sent over a connection that was already open
+    @param tls_handshakes: Number of TLS handshakes done
+    @param tls_resumed: Number of TLS handshakes that resumed an earlier session
+    """
+
+    queue: float | None = None
+    dns: float | None = None
+    connect: float | None = None
+    tls: float | None = None
+    ttfb: float | None = None
+    total: float | None = None
+    bytes_received: int = 0
+    reused: bool | None = None
+    tls_handshakes: int = 0
+    tls_resumed: int = 0
+    start: float = dataclasses.field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    def add(self, name, seconds):
+        setattr(self, name, (getattr(self, name) or 0) + seconds)
+
+    def received_headers(self):
+        if self.ttfb is None:
+            self.ttfb = time.perf_counter() - self.start
+        return self
+
+    def finished(self):
+        if self.total is None:
+            self.total = time.perf_counter() - self.start
+
+    def to_dict(self):
+        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self) if field.repr}
+
+
 class Response(io.IOBase):
     """
     Base class for HTTP response adapters.
@@ -523,6 +767,11 @@ class Response(io.IOBase):
     @param status: Response HTTP status code. Default is 200 OK.
     @param reason: HTTP status reason. Will use built-in reasons based on status code if not provided.
     @param extensions: Dictionary of handler-specific response extensions.
+
+    The `timings` attribute holds the RequestTimings of the request.
+    Subclasses that redefine read() should pass the data read to _record_read()
+
+    Responses can also be read from a coroutine with async_read() and async_close().
     """
 
     def __init__(
@@ -546,22 +795,42 @@ def __init__(
         except ValueError:
             self.reason = None
         self.extensions = extensions or {}
+        self.timings = RequestTimings()
 
     def readable(self):
         return self.fp.readable()
 
+    def _record_read(self, data: bytes, amt: int | None = None) -> bytes:
+        self.timings.bytes_received += len(data)
+        if amt is None or (not data and amt != 0):
+            self.timings.finished()
+        return data
+
     def read(self, amt: int | None = None) -> bytes:
         # Expected errors raised here should be of type RequestError or subclasses.
         # Subclasses should redefine this method with more precise error handling.
         try:
-            return self.fp.read(amt)
+            return self._record_read(self.fp.read(amt), amt)
         except Exception as e:
             raise TransportError(cause=e) from e
 
+    async def async_read(self, amt: int | None = None) -> bytes:
+        """
+        Read from a coroutine. Like read(), but does not block the event loop.
+        By default, read() is run in a worker thread
+        """
+        import asyncio  # Slow to import and only needed here
+
+        return await asyncio.to_thread(self.read, amt)
+
     def close(self):
+        self.timings.finished()
         self.fp.close()
         return super().close()
 
+    async def async_close(self):
+        self.close()
+
     def get_header(self, name, default=None):
         """Get header for name.
         If there are multiple matching headers, return all seperated by comma."""
@@ -153,3 +153,6 @@ def impersonate_preference(rh, request):
     if request.extensions.get('impersonate') or rh.impersonate:
         return 1000
     return 0
+
+
+impersonate_preference.shape_only = True
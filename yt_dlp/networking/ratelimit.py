@@ -0,0 +1,211 @@
+"""Per-host rate limiting of HTTP requests (--host-request-rate, --host-concurrency)"""
+
+from __future__ import annotations
+
+import email.utils
+import threading
+import time
+import typing
+import urllib.parse
+import weakref
+
+from .common import DEFAULT_TIMEOUT, Request, Response
+from .exceptions import HTTPError
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def parse_retry_after(value, now=None):
+    """Number of seconds to wait from a Retry-After header, which is either a number of seconds or an HTTP date"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdecimal():
+        return int(value)
+    try:
+        date = email.utils.mktime_tz(email.utils.parsedate_tz(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return max(date - (time.time() if now is None else now), 0)
+
+
+class HostLimit:
+    """
+    Token bucket and in-flight counter of the requests to one host.
+
+    Up to `rate` requests are sent per second, after an initial burst of up to `rate` requests,
+    and at most `max_requests` requests are in progress at once.
+    A request is in progress until its response has been read or closed.
+    """
+
+    def __init__(self, rate: float | None = None, max_requests: int | None = None):
+        self.rate = rate
+        self.max_requests = max_requests
+        self.in_flight = 0
+        self.paused_until = 0
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+
+    @property
+    def _capacity(self):
+        return max(self.rate or 0, 1)
+
+    def configure(self, rate=None, max_requests=None):
+        with self._condition:
+            if rate:
+                self.rate = rate
+                self._tokens = min(self._tokens, self._capacity)
+            if max_requests:
+                self.max_requests = max_requests
+            self._condition.notify_all()
+
+    def acquire(self, in_flight=True, timeout=None):
+        """
+        Wait until the limits allow a request. in_flight=False only waits for the rate limit.
+        Returns False if no request in progress finished within timeout seconds;
+        the request is then counted as in progress regardless
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        timed_out = False
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self.rate:
+                    self._tokens = min(self._tokens + (now - self._updated) * self.rate, self._capacity)
+                self._updated = now
+                if in_flight and self.max_requests and self.in_flight >= self.max_requests and not timed_out:
+                    if deadline is not None and now >= deadline:
+                        timed_out = True
+                    else:
+                        self._condition.wait(None if deadline is None else deadline - now)
+                    continue
+                wait = self.paused_until - now
+                if wait <= 0 and self.rate and self._tokens < 1:
+                    wait = (1 - self._tokens) / self.rate
+                if wait <= 0:
+                    if self.rate:
+                        self._tokens -= 1
+                    if in_flight:
+                        self.in_flight += 1
+                    return not timed_out
+                self._condition.wait(wait)
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def pause(self, seconds):
+        """Send no requests for this many seconds, then resume at the configured rate"""
+        with self._condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class HostRateLimiter:
+    """
+    Limits the rate and the concurrency of the requests to each host.
+
+    Hosts are only limited once a limit is configured for them, either with the default
+    rate/max_requests, or with the `rate_limit` extension of a request: a (rate, max_requests) tuple,
+    which then applies to all the following requests to the host. The defaults take precedence.
+    WebSocket connections are rate limited, but do not count towards max_requests,
+    since they stay open for as long as they are used.
+    When a limited host answers with a 429 or 503 and a Retry-After header,
+    no requests are sent to it until then (at most MAX_RETRY_AFTER seconds).
+    A response that is kept around without being read or closed holds its slot, so a request that
+    waits for a slot for longer than the timeout of the request is sent anyway, with a warning.
+
+    @param rate: Default maximum number of requests per second to each host.
+    @param max_requests: Default maximum number of requests in progress to each host.
+    @param logger: Logger instance.
+    @param timeout: Default timeout of the requests, in seconds.
+    """
+
+    MAX_RETRY_AFTER = 300
+
+    def __init__(self, rate: float | None = None, max_requests: int | None = None, logger=None, timeout=None):
+        self.rate = rate
+        self.max_requests = max_requests
+        self.logger = logger
+        self.timeout = float(timeout or DEFAULT_TIMEOUT)
+        self.hosts: dict[str, HostLimit] = {}
+        self._lock = threading.Lock()
+
+    def _get_limit(self, host, limits):
+        if limits:
+            # The defaults are set by the user, so they take precedence over the limits of requests
+            rate, max_requests = self.rate or limits[0], self.max_requests or limits[1]
+        else:
+            rate, max_requests = self.rate, self.max_requests
+        with self._lock:
+            limit = self.hosts.get(host)
+            if limit is None:
+                if not (rate or max_requests):
+                    return None
+                limit = self.hosts[host] = HostLimit(rate, max_requests)
+                return limit
+        if limits:
+            limit.configure(rate, max_requests)
+        return limit
+
+    def send(self, request: Request, send: Callable[[Request], Response], limits=None) -> Response:
+        """Send a request with send() once the limits of its host allow"""
+        host = urllib.parse.urlparse(request.url).hostname or ''
+        limit = self._get_limit(host, limits)
+        if limit is None:
+            return send(request)
+
+        # The response of a WebSocket request is the connection, which is returned as is
+        in_flight = urllib.parse.urlparse(request.url).scheme.lower() not in ('ws', 'wss')
+        release = limit.release if in_flight else lambda: None
+        if not limit.acquire(in_flight, float(request.extensions.get('timeout') or self.timeout)) and self.logger:
+            self.logger.warning(
+                f'Timed out waiting for one of the {limit.max_requests} requests in progress to {host} to finish; '
+                'sending the request anyway')
+        try:
+            response = send(request)
+        except HTTPError as e:
+            release()
+            retry_after = e.status in (429, 503) and parse_retry_after(e.response.headers.get('Retry-After'))
+            if retry_after:
+                retry_after = min(retry_after, self.MAX_RETRY_AFTER)
+                if self.logger:
+                    self.logger.warning(
+                        f'{host} responded with HTTP Error {e.status}; '
+                        f'pausing requests to it for {retry_after:.0f} seconds')
+                limit.pause(retry_after)
+            raise
+        except BaseException:
+            release()
+            raise
+        if not (in_flight and limit.max_requests) or request.method == 'HEAD':
+            release()
+            return response
+        return _LimitedResponse(response, release)
+
+
+class _LimitedResponse(Response):
+    """Response that releases its slot of the host limit once it has been read completely or closed"""
+
+    def __init__(self, response: Response, release: Callable[[], None]):
+        super().__init__(response, response.url, response.headers, response.status, response.reason, response.extensions)
+        self.timings = response.timings
+        # Also release the slot if the response is not closed
+        self._release = weakref.finalize(self, release)
+
+    def read(self, amt: int | None = None) -> bytes:
+        try:
+            data = self.fp.read(amt)
+        except BaseException:
+            self._release()
+            raise
+        if amt is None or (not data and amt != 0):
+            self._release()
+        return data
+
+    def close(self):
+        self._release()
+        return super().close()
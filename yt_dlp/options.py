@@ -470,6 +470,13 @@ def _preset_alias_callback(option, opt_str, value, parser):
         '--no-flat-playlist',
         action='store_false', dest='extract_flat',
         help='Fully extract the videos of a playlist (default)')
+    general.add_option(
+        '--serve',
+        dest='serve', metavar='unix:PATH', default=None,
+        help=(
+            'Do not process any URLs; instead keep running and accept extraction and download jobs '
+            'as JSON-RPC 2.0 requests on the given Unix socket. '
+            'Options given on the command line apply to all jobs. See "Server mode" for details'))
     general.add_option(
         '--live-from-start',
         action='store_true', dest='live_from_start',
@@ -744,11 +751,20 @@ def _preset_alias_callback(option, opt_str, value, parser):
     selection.add_option(
         '--download-archive', metavar='FILE',
         dest='download_archive',
-        help='Download only videos not listed in the archive file. Record the IDs of all downloaded videos in it')
+        help=(
+            'Download only videos not listed in the archive file. Record the IDs of all downloaded videos in it. '
+            'If FILE has a .db, .sqlite or .sqlite3 extension (or is an existing SQLite database), '
+            'an indexed database that is not loaded into memory and can be shared by concurrent processes is used'))
     selection.add_option(
         '--no-download-archive',
         dest='download_archive', action='store_const', const=None,
         help='Do not use archive file (default)')
+    selection.add_option(
+        '--import-download-archive', metavar='FILE',
+        dest='import_download_archive', action='append',
+        help=(
+            'Add the IDs in a plain text archive file to the SQLite --download-archive. '
+            'Can be used multiple times'))
     selection.add_option(
         '--max-downloads',
         dest='max_downloads', metavar='NUMBER', type=int, default=None,
@@ -980,6 +996,25 @@ def _preset_alias_callback(option, opt_str, value, parser):
         '-N', '--concurrent-fragments',
         dest='concurrent_fragment_downloads', metavar='N', default=1, type=int,
         help='Number of fragments of a dash/hlsnative video that should be downloaded concurrently (default is %default)')
+    downloader.add_option(
+        '--concurrent-entries',
+        dest='concurrent_entries', metavar='N', default=1, type=int,
+        help=(
+            'Number of playlist entries that should be extracted and downloaded concurrently (default is %default). '
+            'The output of each entry is printed once all the preceding entries have finished'))
+    downloader.add_option(
+        '--concurrent-urls',
+        dest='concurrent_urls', metavar='N', default=1, type=int,
+        help=(
+            'Number of input URLs that should be processed concurrently (default is %default). '
+            'The output of each URL is printed once all the preceding URLs have finished. '
+            'Ignored with --break-per-input'))
+    downloader.add_option(
+        '--concurrent-urls-per-site',
+        dest='concurrent_urls_per_site', metavar='N', default=None, type=int,
+        help=(
+            'Maximum number of the concurrently processed input URLs that are handled by the same extractor, '
+            'or for generic URLs, that have the same host (default: no limit)'))
     downloader.add_option(
         '-r', '--limit-rate', '--rate-limit',
         dest='ratelimit', metavar='RATE',
@@ -1192,6 +1227,17 @@ def _preset_alias_callback(option, opt_str, value, parser):
         '--sleep-subtitles', metavar='SECONDS',
         dest='sleep_interval_subtitles', default=0, type=int,
         help='Number of seconds to sleep before each subtitle download')
+    workarounds.add_option(
+        '--host-request-rate', metavar='RATE',
+        dest='host_request_rate', type=float,
+        help=(
+            'Maximum number of HTTP requests per second to each host, '
+            'shared by the extractors and all concurrent downloads (e.g. 2.5). '
+            'When a limited host responds with a Retry-After header, no more requests are sent to it until then'))
+    workarounds.add_option(
+        '--host-concurrency', metavar='N',
+        dest='host_concurrency', type=int,
+        help='Maximum number of HTTP requests to each host that are in progress at once, including reading the responses')
 
     verbosity = optparse.OptionGroup(parser, 'Verbosity and Simulation Options')
     verbosity.add_option(
@@ -1354,6 +1400,20 @@ def _preset_alias_callback(option, opt_str, value, parser):
         '--print-traffic', '--dump-headers',
         dest='debug_printtraffic', action='store_true', default=False,
         help='Display sent and read HTTP traffic')
+    verbosity.add_option(
+        '--metrics-file',
+        metavar='FILE', dest='metrics_file', default=None,
+        help=(
+            'Write the time spent in each phase of processing the URLs (extraction, HTTP requests, '
+            'JavaScript interpretation, format selection, download, postprocessing and download archive I/O) '
+            'and counters to FILE'))
+    verbosity.add_option(
+        '--metrics-format',
+        metavar='FORMAT', dest='metrics_format', default='ndjson', choices=('ndjson', 'prometheus'),
+        help=(
+            'Format of --metrics-file. One of "ndjson" (default) to append a JSON object per URL, '
+            'or "prometheus" for the totals in the Prometheus text format (e.g. for the textfile collector '
+            'of the node exporter)'))
     verbosity.add_option(
         '-C', '--call-home',
         dest='call_home', action='store_true', default=False,
@@ -1376,6 +1436,12 @@ def _preset_alias_callback(option, opt_str, value, parser):
         '--no-batch-file',
         dest='batchfile', action='store_const', const=None,
         help='Do not read URLs from batch file (default)')
+    filesystem.add_option(
+        '--batch-checkpoint',
+        dest='batch_checkpoint', metavar='FILE',
+        help=(
+            'Save the position in the batch file to FILE as URLs are processed, and resume from it '
+            'if it exists. The file is deleted once all URLs have been processed'))
     filesystem.add_option(
         '--id', default=False,
         action='store_true', dest='useid', help=optparse.SUPPRESS_HELP)
@@ -1565,6 +1631,29 @@ def _preset_alias_callback(option, opt_str, value, parser):
         '--rm-cache-dir',
         action='store_true', dest='rm_cachedir',
         help='Delete all filesystem cache files')
+    filesystem.add_option(
+        '--extraction-cache-ttl',
+        metavar='SECONDS', dest='extraction_cache_ttl', type=float, default=None,
+        help=(
+            'Keep the extracted information of videos in the cache directory for this many seconds, '
+            'and reuse it instead of extracting the same URL again (default: disabled). '
+            'The information expires earlier if the format URLs do. '
+            'Changing options other than --extractor-args does not invalidate the cache'))
+    filesystem.add_option(
+        '--rm-extraction-cache',
+        action='store_true', dest='rm_extraction_cache',
+        help='Delete the cached extracted information of all videos')
+    filesystem.add_option(
+        '--http-cache',
+        metavar='SIZE', dest='http_cache_size', default=None,
+        help=(
+            'Keep the webpages and API responses downloaded by extractors in the cache directory, up to SIZE '
+            'in total (e.g. 50K or 100M), and reuse them as long as their Cache-Control headers allow (default: disabled). '
+            'Stale responses are revalidated with the server when possible'))
+    filesystem.add_option(
+        '--no-http-cache',
+        action='store_const', const=None, dest='http_cache_size',
+        help='Do not cache HTTP responses (default)')
 
     thumbnail = optparse.OptionGroup(parser, 'Thumbnail Options')
     thumbnail.add_option(
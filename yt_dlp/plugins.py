@@ -7,9 +7,12 @@
 import importlib.util
 import inspect
 import itertools
+import json
 import os
 import pkgutil
+import stat
 import sys
+import time
 import traceback
 import zipimport
 from pathlib import Path
@@ -17,6 +20,7 @@
 
 from .globals import (
     Indirect,
+    plugin_cache_dir,
     plugin_dirs,
     all_plugins_loaded,
     plugin_specs,
@@ -28,8 +32,10 @@
     get_user_config_dirs,
     merge_dicts,
     orderedSet,
+    write_json_file,
     write_string,
 )
+from .version import __version__
 
 PACKAGE_NAME = 'yt_dlp_plugins'
 COMPAT_PACKAGE_NAME = 'ytdlp_plugins'
@@ -79,24 +85,26 @@ def dirs_in_zip(archive):
     return ()
 
 
-def default_plugin_paths():
-    def _get_package_paths(*root_paths, containing_folder):
+def default_plugin_sources():
+    """
+    Yield the default places to look for plugins as (kind, path), where kind is
+    'folder' for directories whose entries are candidate paths, or 'path' for candidate paths
+    """
+    def _get_package_folders(*root_paths, containing_folder):
         for config_dir in orderedSet(map(Path, root_paths), lazy=True):
             # We need to filter the base path added when running __main__.py directly
-            if config_dir == _BASE_PACKAGE_PATH:
-                continue
-            with contextlib.suppress(OSError):
-                yield from (config_dir / containing_folder).iterdir()
+            if config_dir != _BASE_PACKAGE_PATH:
+                yield 'folder', config_dir / containing_folder
 
     # Load from yt-dlp config folders
-    yield from _get_package_paths(
+    yield from _get_package_folders(
         *get_user_config_dirs('yt-dlp'),
         *get_system_config_dirs('yt-dlp'),
         containing_folder='plugins',
     )
 
     # Load from yt-dlp-plugins folders
-    yield from _get_package_paths(
+    yield from _get_package_folders(
         get_executable_path(),
         *get_user_config_dirs(''),
         *get_system_config_dirs(''),
@@ -104,7 +112,16 @@ def _get_package_paths(*root_paths, containing_folder):
     )
 
     # Load from PYTHONPATH directories
-    yield from (path for path in map(Path, sys.path) if path != _BASE_PACKAGE_PATH)
+    yield from (('path', path) for path in map(Path, sys.path) if path != _BASE_PACKAGE_PATH)
+
+
+def default_plugin_paths():
+    for kind, path in default_plugin_sources():
+        if kind == 'path':
+            yield path
+        else:
+            with contextlib.suppress(OSError):
+                yield from path.iterdir()
 
 
 def candidate_plugin_paths(candidate):
@@ -114,6 +131,142 @@ def candidate_plugin_paths(candidate):
     yield from candidate_path.iterdir()
 
 
+def _path_signature(path, listed=False):
+    """
+    A value that changes when the result of checking path for plugins may change.
+    The mtime of a directory only matters if its entries were listed
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if stat.S_ISDIR(st.st_mode):
+        return st.st_mtime_ns if listed else 'dir'
+    return [st.st_mtime_ns, st.st_size]
+
+
+class PluginIndex:
+    """
+    Caches the search locations of the plugin packages, so that runs without plugin changes
+    do not have to list the plugin folders and read the zip files on the search path.
+
+    Each result is stored with the signatures of all the paths that were looked at to find it,
+    and it is only reused while they are unchanged. The index is also saved to the cache
+    directory given by plugin_cache_dir, unless it is False
+    """
+
+    MAX_ENTRIES = 64
+    # Modification times are not precise on some filesystems, so changes made right after
+    # a scan may not be noticed. Results depending on such recent changes are not kept
+    RACY_MTIME_NS = 2_000_000_000
+
+    def __init__(self):
+        self.hits, self.misses, self.time = 0, 0, 0.
+        self._entries, self._filename = None, None
+
+    def clear(self):
+        self._entries = None
+
+    def _get_filename(self):
+        if plugin_cache_dir.value is False:
+            return None
+        from .cache import get_cache_root
+        return os.path.join(get_cache_root(plugin_cache_dir.value), 'plugins', 'index.json')
+
+    def _load(self):
+        filename = self._get_filename()
+        if self._entries is not None and filename == self._filename:
+            return
+        self._entries, self._filename = {}, filename
+        if not filename:
+            return
+        with contextlib.suppress(OSError, ValueError):
+            with open(filename, encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get('yt-dlp_version') == __version__:
+                self._entries = data.get('data') or {}
+
+    def _save(self):
+        if not self._filename:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._filename), exist_ok=True)
+            write_json_file({'yt-dlp_version': __version__, 'data': self._entries}, self._filename)
+        except Exception as e:
+            write_string(f'WARNING: Writing plugin index to {self._filename!r} failed: {e}\n')
+
+    @staticmethod
+    def _is_valid(entry):
+        for path, signature in entry['signatures'].items():
+            try:
+                if _path_signature(path, listed=isinstance(signature, int)) != signature:
+                    return False
+            except OSError:
+                if signature != 'error':
+                    return False
+        return True
+
+    @staticmethod
+    def _scan(fullname, sources, signatures):
+        def candidate_paths(kind, path):
+            if kind == 'path':
+                return [path]
+            signatures[str(path)] = _path_signature(path, listed=True)
+            if kind == 'custom':
+                return candidate_plugin_paths(path)
+            with contextlib.suppress(OSError):
+                return list(path.iterdir())
+            return []
+
+        parts = Path(*fullname.split('.'))
+        for path in orderedSet(itertools.chain.from_iterable(
+                itertools.starmap(candidate_paths, sources)), lazy=True):
+            candidate = path / parts
+            try:
+                signature = _path_signature(candidate)
+            except PermissionError as e:
+                write_string(f'Permission error while accessing modules in "{e.filename}"\n')
+                signatures[str(candidate)] = 'error'
+                continue
+            signatures[str(candidate)] = signature
+            if signature == 'dir':
+                yield candidate
+            elif path.suffix in ('.zip', '.egg', '.whl'):
+                signatures[str(path)] = archive_signature = _path_signature(path)
+                if isinstance(archive_signature, list) and parts in dirs_in_zip(path):
+                    yield candidate
+
+    def search_locations(self, fullname, sources):
+        start = time.perf_counter()
+        sources = [(kind, Path(path)) for kind, path in sources]
+        key = json.dumps([fullname, [(kind, str(path)) for kind, path in sources]])
+        try:
+            self._load()
+            entry = self._entries.get(key)
+            if entry and self._is_valid(entry):
+                self.hits += 1
+                return list(map(Path, entry['locations']))
+
+            self.misses += 1
+            signatures = {}
+            locations = list(self._scan(fullname, sources, signatures))
+            self._entries.pop(key, None)
+            racy_time = time.time_ns() - self.RACY_MTIME_NS
+            if not any(
+                    (signature[0] if isinstance(signature, list) else signature) > racy_time
+                    for signature in signatures.values() if isinstance(signature, (int, list))):
+                self._entries[key] = {'locations': list(map(str, locations)), 'signatures': signatures}
+                while len(self._entries) > self.MAX_ENTRIES:
+                    self._entries.pop(next(iter(self._entries)))
+                self._save()
+            return locations
+        finally:
+            self.time += time.perf_counter() - start
+
+
+plugin_index = PluginIndex()
+
+
 class PluginFinder(importlib.abc.MetaPathFinder):
     """
     This class provides one or multiple namespace packages.
@@ -129,22 +282,10 @@ def __init__(self, *packages):
                 for name in packages))
 
     def search_locations(self, fullname):
-        candidate_locations = itertools.chain.from_iterable(
-            default_plugin_paths() if candidate == 'default' else candidate_plugin_paths(candidate)
+        return plugin_index.search_locations(fullname, itertools.chain.from_iterable(
+            default_plugin_sources() if candidate == 'default' else [('custom', candidate)]
             for candidate in plugin_dirs.value
-        )
-
-        parts = Path(*fullname.split('.'))
-        for path in orderedSet(candidate_locations, lazy=True):
-            candidate = path / parts
-            try:
-                if candidate.is_dir():
-                    yield candidate
-                elif path.suffix in ('.zip', '.egg', '.whl') and path.is_file():
-                    if parts in dirs_in_zip(path):
-                        yield candidate
-            except PermissionError as e:
-                write_string(f'Permission error while accessing modules in "{e.filename}"\n')
+        ))
 
     def find_spec(self, fullname, path=None, target=None):
         if fullname not in self.packages:
@@ -161,6 +302,7 @@ def find_spec(self, fullname, path=None, target=None):
 
     def invalidate_caches(self):
         dirs_in_zip.cache_clear()
+        plugin_index.clear()
         for package in self.packages:
             if package in sys.modules:
                 del sys.modules[package]
@@ -0,0 +1,110 @@
+"""Break down the startup time of yt-dlp by module and phase
+
+Set the environment variable YTDLP_PROFILE_IMPORTS to print a report to stderr on exit.
+Only the standard library may be imported here, since this is set up before anything else
+"""
+
+import atexit
+import contextlib
+import os
+import sys
+import time
+
+
+class _TimedLoader:
+    def __init__(self, profiler, name, loader, find_time):
+        self._profiler, self._name, self._loader, self._find_time = profiler, name, loader, find_time
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._profiler._measure_import(self._name, self._find_time):
+            self._loader.exec_module(module)
+
+
+class StartupProfiler:
+    """Records how long each module takes to import and how long each phase of the startup takes
+
+    The import times are measured like "python -X importtime": the self time of a module
+    excludes the time taken to import the modules that it imports
+    """
+
+    def __init__(self):
+        self.start = self._last_checkpoint = time.perf_counter()
+        self.imports = {}  # name: [self time, cumulative time]
+        self.phases = []  # [(name, duration)]; each phase lasts until the next checkpoint
+        self._stack = []
+
+    # The meta path finder protocol
+    def find_spec(self, fullname, path=None, target=None):
+        start = time.perf_counter()
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(self, fullname, spec.loader, time.perf_counter() - start)
+        return spec
+
+    def invalidate_caches(self):
+        pass
+
+    @contextlib.contextmanager
+    def _measure_import(self, name, find_time):
+        self._stack.append(0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cumulative = time.perf_counter() - start + find_time
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += cumulative
+            self.imports[name] = [cumulative - children, cumulative]
+
+    def checkpoint(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last_checkpoint))
+        self._last_checkpoint = now
+
+    def report(self, out=None, limit=25):
+        out = out or sys.stderr
+        out.write(f'[profile] Startup phases (total {(time.perf_counter() - self.start) * 1000:.1f} ms):\n')
+        for name, duration in [*self.phases, ('(rest)', time.perf_counter() - self._last_checkpoint)]:
+            out.write(f'[profile] {duration * 1000:9.1f} ms  {name}\n')
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        out.write(f'[profile] Slowest of {len(self.imports)} imports (self / cumulative):\n')
+        for name, (self_time, cumulative) in slowest:
+            out.write(f'[profile] {self_time * 1000:9.1f} ms {cumulative * 1000:9.1f} ms  {name}\n')
+        out.flush()
+
+
+_profiler = None
+
+
+def enable():
+    """Start profiling the imports and phases, and print a report at exit"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        sys.meta_path.insert(0, _profiler)
+        atexit.register(_profiler.report)
+    return _profiler
+
+
+def checkpoint(name):
+    """Mark the end of a startup phase that began at the previous checkpoint, if profiling is enabled"""
+    if _profiler:
+        _profiler.checkpoint(name)
+
+
+if os.environ.get('YTDLP_PROFILE_IMPORTS'):
+    enable()
@@ -0,0 +1,270 @@
+"""Serve extraction and download jobs over a local socket (--serve)
+
+The protocol is JSON-RPC 2.0 with one JSON document per line. Supported methods:
+
+    extract_info   {"url": URL, "download": false, "process": true, "params": {}}
+                   Returns the sanitized info dict
+    download       {"urls": [URL, ...], "params": {}}
+                   Returns {"retcode": RETCODE}
+    version        Returns {"version": VERSION}
+
+"params" are YoutubeDL parameters that are applied on top of those given on the
+command line for this job only. While a job runs, "log", "progress" and
+"postprocessor" notifications are sent with a "job" field set to the request's id.
+
+Jobs sent on one connection are run one after the other; use several connections
+to run jobs concurrently. YoutubeDL instances are kept warm between jobs and
+are reused by jobs with the same params.
+"""
+
+import collections
+import contextlib
+import inspect
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+
+from .YoutubeDL import YoutubeDL
+from .utils import DownloadCancelled, DownloadError, variadic
+from .version import __version__
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+DOWNLOAD_ERROR = -32000
+
+_PROGRESS_FIELDS = (
+    'status', 'filename', 'tmpfilename', 'downloaded_bytes', 'total_bytes', 'total_bytes_estimate',
+    'elapsed', 'eta', 'speed', 'fragment_index', 'fragment_count', 'network_timings', 'postprocessor')
+
+
+class JSONRPCError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class _JobLogger:
+    """Forwards the messages of a YoutubeDL instance to the job that is currently using it"""
+
+    def __init__(self):
+        self.emit = None
+
+    def _log(self, level, message):
+        if self.emit:
+            self.emit('log', {'level': level, 'message': message})
+
+    def debug(self, message):
+        self._log('debug', message)
+
+    def info(self, message):
+        self._log('info', message)
+
+    def warning(self, message):
+        self._log('warning', message)
+
+    def error(self, message):
+        self._log('error', message)
+
+    def _hook(self, method, status):
+        if self.emit:
+            info_dict = status.get('info_dict') or {}
+            self.emit(method, {
+                **{k: status[k] for k in _PROGRESS_FIELDS if status.get(k) is not None},
+                'id': info_dict.get('id'),
+                'title': info_dict.get('title'),
+            })
+
+    def progress_hook(self, status):
+        self._hook('progress', status)
+
+    def postprocessor_hook(self, status):
+        self._hook('postprocessor', status)
+
+
+class YoutubeDLPool:
+    """Keeps idle YoutubeDL instances around so that jobs do not pay for their setup
+
+    @param params       The YoutubeDL params shared by all jobs
+    @param max_idle     Maximum number of idle instances kept for each set of job params
+    """
+
+    def __init__(self, params, max_idle=4):
+        self.params = {**params, 'noprogress': True}
+        self.max_idle = max_idle
+        self._idle = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def _create(self, job_params):
+        logger = _JobLogger()
+        ydl = YoutubeDL({**self.params, **job_params, 'logger': logger})
+        ydl.add_progress_hook(logger.progress_hook)
+        ydl.add_postprocessor_hook(logger.postprocessor_hook)
+        return ydl, logger
+
+    @contextlib.contextmanager
+    def checkout(self, job_params, emit):
+        key = json.dumps(job_params, sort_keys=True)
+        with self._lock:
+            idle = self._idle[key]
+            entry = idle.pop() if idle else None
+        if entry is None:
+            entry = self._create(job_params)
+
+        ydl, logger = entry
+        ydl._reset_job_state()
+        logger.emit = emit
+        try:
+            yield ydl
+        finally:
+            logger.emit = None
+            with self._lock:
+                idle = self._idle[key]
+                if len(idle) < self.max_idle:
+                    idle.append(entry)
+                    entry = None
+            if entry:
+                ydl.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, collections.defaultdict(list)
+        for ydl, _ in (entry for entries in idle.values() for entry in entries):
+            ydl.close()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        self._write_lock = threading.Lock()
+
+    def send(self, obj):
+        data = json.dumps(obj, default=repr).encode() + b'\n'
+        with self._write_lock:
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                self.send({'jsonrpc': '2.0', 'id': None, 'error': {'code': PARSE_ERROR, 'message': str(e)}})
+                continue
+            job_id = request.get('id') if isinstance(request, dict) else None
+
+            def emit(method, params, job_id=job_id):
+                self.send({'jsonrpc': '2.0', 'method': method, 'params': {'job': job_id, **params}})
+
+            response = self.server.run_job(request, emit)
+            if response is not None:
+                self.send(response)
+
+
+# UnixStreamServer is missing where AF_UNIX is unavailable; serve() refuses to run there
+class JSONRPCServer(socketserver.ThreadingMixIn, getattr(socketserver, 'UnixStreamServer', socketserver.TCPServer)):
+    daemon_threads = True
+
+    def __init__(self, path, params, ydl=None):
+        self.ydl = ydl
+        self.pool = YoutubeDLPool(params)
+        with contextlib.suppress(FileNotFoundError):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError(f'{path} exists and is not a socket')
+            os.remove(path)  # Left behind by a previous server
+        super().__init__(path, _RequestHandler)
+
+    def server_bind(self):
+        # The socket is created with the permissions set by the umask, so other users
+        # could connect to it between bind() and a chmod()
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.close()
+        with contextlib.suppress(OSError):
+            os.remove(self.server_address)
+
+    def run_job(self, request, emit):
+        """Run a single JSON-RPC request. Returns the response, or None for notifications"""
+        id_ = request.get('id') if isinstance(request, dict) else None
+        is_notification = isinstance(request, dict) and 'id' not in request
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                raise JSONRPCError(INVALID_REQUEST, 'Invalid request')
+            method = getattr(self, f'_rpc_{request["method"]}', None)
+            if not method:
+                raise JSONRPCError(METHOD_NOT_FOUND, f'Method not found: {request["method"]}')
+            params = request.get('params') or {}
+            if not isinstance(params, dict) or not isinstance(params.get('params') or {}, dict):
+                raise JSONRPCError(INVALID_PARAMS, 'params must be an object')
+            try:
+                inspect.signature(method).bind(emit, **params)
+            except TypeError as e:
+                raise JSONRPCError(INVALID_PARAMS, str(e))
+            result = method(emit, **params)
+        except JSONRPCError as e:
+            error = {'code': e.code, 'message': str(e)}
+        except DownloadError as e:
+            error = {'code': DOWNLOAD_ERROR, 'message': str(e)}
+        except Exception as e:
+            if self.ydl:
+                self.ydl.report_warning(f'Job {id_!r} failed with an unexpected error: {e!r}')
+            error = {'code': INTERNAL_ERROR, 'message': repr(e)}
+        else:
+            return None if is_notification else {'jsonrpc': '2.0', 'id': id_, 'result': result}
+        return None if is_notification else {'jsonrpc': '2.0', 'id': id_, 'error': error}
+
+    def _rpc_version(self, emit):
+        return {'version': __version__}
+
+    def _rpc_extract_info(self, emit, url, download=False, process=True, params=None):
+        with self.pool.checkout(params or {}, emit) as ydl:
+            return ydl.sanitize_info(ydl.extract_info(url, download=download, process=process))
+
+    def _rpc_download(self, emit, urls, params=None):
+        with self.pool.checkout(params or {}, emit) as ydl:
+            try:
+                return {'retcode': ydl.download(list(variadic(urls)))}
+            except DownloadCancelled:
+                return {'retcode': 101}
+
+
+def parse_address(address):
+    """Return the socket path of an address of the form unix:PATH, or None if it is invalid"""
+    scheme, _, path = address.partition(':')
+    if scheme != 'unix' or not path:
+        return None
+    return path
+
+
+def serve(address, params, ydl=None):
+    """Serve jobs on address until interrupted
+
+    @param params   The YoutubeDL params that are shared by all jobs
+    @param ydl      YoutubeDL instance used to report the state of the server
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise OSError('Unix sockets are not supported on this platform')
+    path = parse_address(address)
+    if not path:
+        raise ValueError(f'Invalid server address {address!r}; it must be of the form unix:PATH')
+    with JSONRPCServer(path, params, ydl) as server:
+        if ydl:
+            ydl.to_screen(f'[serve] Listening on {address}')
+        try:
+            server.serve_forever()
+        finally:
+            if ydl:
+                ydl.to_screen('[serve] Shutting down')
@@ -35,6 +35,7 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import traceback
 import types
@@ -51,7 +52,7 @@
     compat_expanduser,
     compat_HTMLParseError,
 )
-from ..dependencies import xattr
+from ..dependencies import sqlite3, xattr
 from ..globals import IN_CLI, WINDOWS_VT_MODE
 
 __name__ = __name__.rsplit('.', 1)[0]  # noqa: A001 # Pretend to be the parent module
@@ -1663,6 +1664,67 @@ def __iter__(self):
         return iter(self.f)
 
 
+class SQLiteDownloadArchive:
+    """
+    A download archive stored in an indexed SQLite database
+
+    Unlike the plain text archive, lookups do not require the whole archive to be loaded
+    into memory, and the database can be shared by many concurrent processes
+    """
+    EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+    _MAGIC = b'SQLite format 3\x00'
+    _IMPORT_BATCH_SIZE = 10000
+
+    def __init__(self, filename, timeout=60):
+        if not sqlite3:
+            raise ImportError('A SQLite download archive requires Python to be compiled with sqlite3 support')
+        self._lock = threading.Lock()
+        # autocommit mode; every write is a separate transaction unless batched
+        self._conn = sqlite3.connect(filename, timeout=timeout, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode = WAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS archive (id TEXT PRIMARY KEY NOT NULL) WITHOUT ROWID')
+
+    @classmethod
+    def is_database(cls, filename):
+        """Whether the file is (or, if it does not exist, should be created as) a SQLite archive"""
+        try:
+            with open(filename, 'rb') as f:
+                header = f.read(len(cls._MAGIC))
+        except OSError:
+            return os.path.splitext(filename)[1].lower() in cls.EXTENSIONS
+        return header == cls._MAGIC or (not header and os.path.splitext(filename)[1].lower() in cls.EXTENSIONS)
+
+    def __contains__(self, vid_id):
+        with self._lock:
+            return self._conn.execute('SELECT 1 FROM archive WHERE id = ?', (vid_id,)).fetchone() is not None
+
+    def add(self, vid_id):
+        with self._lock:
+            self._conn.execute('INSERT OR IGNORE INTO archive (id) VALUES (?)', (vid_id,))
+
+    def update(self, vid_ids):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany('INSERT OR IGNORE INTO archive (id) VALUES (?)', ((i,) for i in vid_ids))
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def import_text(self, filename):
+        """Add the IDs in a plain text download archive"""
+        with locked_file(filename, 'r', encoding='utf-8') as archive_file:
+            ids = filter(None, map(str.strip, archive_file))
+            while batch := list(itertools.islice(ids, self._IMPORT_BATCH_SIZE)):
+                self.update(batch)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 @functools.cache
 def get_filesystem_encoding():
     encoding = sys.getfilesystemencoding()
@@ -2555,23 +2617,25 @@ def parse_qs(url, **kwargs):
     return urllib.parse.parse_qs(urllib.parse.urlparse(url).query, **kwargs)
 
 
-def read_batch_urls(batch_fd):
-    def fixup(url):
-        if not isinstance(url, str):
-            url = url.decode('utf-8', 'replace')
-        BOM_UTF8 = ('\xef\xbb\xbf', '\ufeff')
-        for bom in BOM_UTF8:
-            if url.startswith(bom):
-                url = url[len(bom):]
-        url = url.lstrip()
-        if not url or url.startswith(('#', ';', ']')):
-            return False
-        # "#" cannot be stripped out since it is part of the URI
-        # However, it can be safely stripped out if following a whitespace
-        return re.split(r'\s#', url, maxsplit=1)[0].rstrip()
+def _batch_url(line):
+    """Return the URL in a line of a batch file, or False if there is none"""
+    if not isinstance(line, str):
+        line = line.decode('utf-8', 'replace')
+    BOM_UTF8 = ('\xef\xbb\xbf', '\ufeff')
+    for bom in BOM_UTF8:
+        if line.startswith(bom):
+            line = line[len(bom):]
+    line = line.lstrip()
+    if not line or line.startswith(('#', ';', ']')):
+        return False
+    # "#" cannot be stripped out since it is part of the URI
+    # However, it can be safely stripped out if following a whitespace
+    return re.split(r'\s#', line, maxsplit=1)[0].rstrip()
+
 
+def read_batch_urls(batch_fd):
     with contextlib.closing(batch_fd) as fd:
-        return [url for url in map(fixup, fd) if url]
+        return [url for url in map(_batch_url, fd) if url]
 
 
 def urlencode_postdata(*args, **kargs):
@@ -3210,84 +3274,115 @@ def filter_using_list(row, filter_array):
     return '\n'.join(''.join(row).rstrip() for row in table)
 
 
-def _match_one(filter_part, dct, incomplete):
-    # TODO: Generalize code with YoutubeDL._build_format_filter
-    STRING_OPERATORS = {
-        '*=': operator.contains,
-        '^=': lambda attr, value: attr.startswith(value),
-        '$=': lambda attr, value: attr.endswith(value),
-        '~=': lambda attr, value: re.search(value, attr),
-    }
-    COMPARISON_OPERATORS = {
-        **STRING_OPERATORS,
-        '<=': operator.le,  # "<=" must be defined above "<"
-        '<': operator.lt,
-        '>=': operator.ge,
-        '>': operator.gt,
-        '=': operator.eq,
-    }
+_MATCH_STRING_OPERATORS = {
+    '*=': operator.contains,
+    '^=': lambda attr, value: attr.startswith(value),
+    '$=': lambda attr, value: attr.endswith(value),
+    '~=': lambda attr, value: re.search(value, attr),
+}
+_MATCH_COMPARISON_OPERATORS = {
+    **_MATCH_STRING_OPERATORS,
+    '<=': operator.le,  # "<=" must be defined above "<"
+    '<': operator.lt,
+    '>=': operator.ge,
+    '>': operator.gt,
+    '=': operator.eq,
+}
+_MATCH_UNARY_OPERATORS = {
+    '': lambda v: (v is True) if isinstance(v, bool) else (v is not None),
+    '!': lambda v: (v is False) if isinstance(v, bool) else (v is None),
+}
+_MATCH_COMPARISON_RE = re.compile(r'''(?x)
+    (?P<key>[a-z_]+)
+    \s*(?P<negation>!\s*)?(?P<op>{})(?P<none_inclusive>\s*\?)?\s*
+    (?:
+        (?P<quote>["\'])(?P<quotedstrval>.+?)(?P=quote)|
+        (?P<strval>.+?)
+    )
+    '''.format('|'.join(map(re.escape, _MATCH_COMPARISON_OPERATORS.keys()))))
+_MATCH_UNARY_RE = re.compile(r'''(?x)
+    (?P<op>{})\s*(?P<key>[a-z_]+)
+    '''.format('|'.join(map(re.escape, _MATCH_UNARY_OPERATORS.keys()))))
 
-    if isinstance(incomplete, bool):
-        is_incomplete = lambda _: incomplete
-    else:
-        is_incomplete = lambda k: k in incomplete
 
-    operator_rex = re.compile(r'''(?x)
-        (?P<key>[a-z_]+)
-        \s*(?P<negation>!\s*)?(?P<op>{})(?P<none_inclusive>\s*\?)?\s*
-        (?:
-            (?P<quote>["\'])(?P<quotedstrval>.+?)(?P=quote)|
-            (?P<strval>.+?)
-        )
-        '''.format('|'.join(map(re.escape, COMPARISON_OPERATORS.keys()))))
-    m = operator_rex.fullmatch(filter_part.strip())
+@functools.lru_cache(maxsize=256)
+def _compile_match_one(filter_part):
+    """ Parse a single filter part into a predicate(dct, is_incomplete)
+    Invalid filter parts only raise once the predicate is called
+    """
+    m = _MATCH_COMPARISON_RE.fullmatch(filter_part.strip())
     if m:
-        m = m.groupdict()
-        unnegated_op = COMPARISON_OPERATORS[m['op']]
-        if m['negation']:
+        key, op_name, none_inclusive = m.group('key', 'op', 'none_inclusive')
+        unnegated_op = _MATCH_COMPARISON_OPERATORS[op_name]
+        if m.group('negation'):
             op = lambda attr, value: not unnegated_op(attr, value)
         else:
             op = unnegated_op
-        comparison_value = m['quotedstrval'] or m['strval']
-        if m['quote']:
-            comparison_value = comparison_value.replace(r'\{}'.format(m['quote']), m['quote'])
-        actual_value = dct.get(m['key'])
-        numeric_comparison = None
-        if isinstance(actual_value, (int, float)):
-            # If the original field is a string and matching comparisonvalue is
-            # a number we should respect the origin of the original field
-            # and process comparison value as a string (see
-            # https://github.com/ytdl-org/youtube-dl/issues/11082)
-            try:
-                numeric_comparison = int(comparison_value)
-            except ValueError:
-                numeric_comparison = parse_filesize(comparison_value)
-                if numeric_comparison is None:
-                    numeric_comparison = parse_filesize(f'{comparison_value}B')
-                if numeric_comparison is None:
-                    numeric_comparison = parse_duration(comparison_value)
-        if numeric_comparison is not None and m['op'] in STRING_OPERATORS:
-            raise ValueError('Operator {} only supports string values!'.format(m['op']))
-        if actual_value is None:
-            return is_incomplete(m['key']) or m['none_inclusive']
-        return op(actual_value, comparison_value if numeric_comparison is None else numeric_comparison)
-
-    UNARY_OPERATORS = {
-        '': lambda v: (v is True) if isinstance(v, bool) else (v is not None),
-        '!': lambda v: (v is False) if isinstance(v, bool) else (v is None),
-    }
-    operator_rex = re.compile(r'''(?x)
-        (?P<op>{})\s*(?P<key>[a-z_]+)
-        '''.format('|'.join(map(re.escape, UNARY_OPERATORS.keys()))))
-    m = operator_rex.fullmatch(filter_part.strip())
+        comparison_value = m.group('quotedstrval') or m.group('strval')
+        if m.group('quote'):
+            comparison_value = comparison_value.replace(r'\{}'.format(m.group('quote')), m.group('quote'))
+        # The numeric value is only needed when the field is a number; compute it once on first use
+        numeric_cache = []
+
+        def numeric_comparison_value():
+            if not numeric_cache:
+                try:
+                    numeric_comparison = int(comparison_value)
+                except ValueError:
+                    numeric_comparison = parse_filesize(comparison_value)
+                    if numeric_comparison is None:
+                        numeric_comparison = parse_filesize(f'{comparison_value}B')
+                    if numeric_comparison is None:
+                        numeric_comparison = parse_duration(comparison_value)
+                numeric_cache.append(numeric_comparison)
+            return numeric_cache[0]
+
+        def predicate(dct, is_incomplete):
+            actual_value = dct.get(key)
+            if actual_value is None:
+                return is_incomplete(key) or none_inclusive
+            numeric_comparison = None
+            if isinstance(actual_value, (int, float)):
+                numeric_comparison = numeric_comparison_value()
+                if numeric_comparison is not None:
+                    if op_name in _MATCH_STRING_OPERATORS:
+                        raise ValueError(f'Operator {op_name} only supports string values!')
+                    return op(actual_value, numeric_comparison)
+            return op(actual_value, comparison_value)
+        return predicate
+
+    m = _MATCH_UNARY_RE.fullmatch(filter_part.strip())
     if m:
-        op = UNARY_OPERATORS[m.group('op')]
-        actual_value = dct.get(m.group('key'))
-        if is_incomplete(m.group('key')) and actual_value is None:
-            return True
-        return op(actual_value)
+        key, op = m.group('key'), _MATCH_UNARY_OPERATORS[m.group('op')]
+
+        def predicate(dct, is_incomplete):
+            actual_value = dct.get(key)
+            if actual_value is None and is_incomplete(key):
+                return True
+            return op(actual_value)
+        return predicate
 
-    raise ValueError(f'Invalid filter part {filter_part!r}')
+    def predicate(dct, is_incomplete):
+        raise ValueError(f'Invalid filter part {filter_part!r}')
+    return predicate
+
+
+@functools.lru_cache(maxsize=256)
+def compile_match_str(filter_str):
+    """ Compile a match_str filter into a function(dct, incomplete=False)
+    The filter is parsed only once, so the result is cheap to call repeatedly
+    """
+    predicates = tuple(
+        _compile_match_one(filter_part.replace(r'\&', '&'))
+        for filter_part in re.split(r'(?<!\\)&', filter_str))
+
+    def match(dct, incomplete=False):
+        if isinstance(incomplete, bool):
+            is_incomplete = lambda _: incomplete
+        else:
+            is_incomplete = lambda k: k in incomplete
+        return all(predicate(dct, is_incomplete) for predicate in predicates)
+    return match
 
 
 def match_str(filter_str, dct, incomplete=False):
@@ -3297,9 +3392,7 @@ def match_str(filter_str, dct, incomplete=False):
                        Can be True/False to indicate all/none of the keys may be missing.
                        All conditions on incomplete keys pass if the key is missing
     """
-    return all(
-        _match_one(filter_part.replace(r'\&', '&'), dct, incomplete)
-        for filter_part in re.split(r'(?<!\\)&', filter_str))
+    return compile_match_str(filter_str)(dct, incomplete)
 
 
 def match_filter_func(filters, breaking_filters=None):
@@ -3314,13 +3407,15 @@ def match_filter_func(filters, breaking_filters=None):
     if interactive:
         filters.remove('-')
 
+    compiled_filters = [compile_match_str(f) for f in filters]
+
     @function_with_repr.set_repr(repr_)
     def _match_func(info_dict, incomplete=False):
         ret = breaking_filters(info_dict, incomplete)
         if ret is not None:
             raise RejectedVideoReached(ret)
 
-        if not filters or any(match_str(f, info_dict, incomplete) for f in filters):
+        if not filters or any(match(info_dict, incomplete) for match in compiled_filters):
             return NO_DEFAULT if interactive and not incomplete else None
         else:
             video_title = info_dict.get('title') or info_dict.get('id') or 'entry'
@@ -5407,6 +5502,7 @@ def __init__(self, ydl, field_preference):
         self.ydl = ydl
         self._order = []
         self.evaluate_params(self.ydl.params, field_preference)
+        self._field_preferences = [self._compile_field_preference(field) for field in self._order]
         if ydl.params.get('verbose'):
             self.print_verbose_info(self.ydl.write_debug)
 
@@ -5573,6 +5669,83 @@ def _calculate_field_preference(self, format_, field):
             value = get_value(field)
         return self._calculate_field_preference_from_value(format_, field, type_, value)
 
+    def _compile_order(self, field):
+        """Return a function equivalent to _resolve_field_value(field, value, True) for an "ordered" field"""
+        order_list = (self._use_free_order and self._get_field_setting(field, 'order_free')) or self._get_field_setting(field, 'order')
+        list_length = len(order_list)
+        empty_pos = order_list.index('') if '' in order_list else list_length + 1
+        patterns = [
+            (list_length - i, re.compile(regex)) for i, regex in enumerate(order_list) if regex
+        ] if self._get_field_setting(field, 'regex') else None
+
+        def resolve(value):
+            if value is not None:
+                value = value.lower()
+                if patterns is not None:
+                    return next((pos for pos, pattern in patterns if pattern.match(value)), list_length - empty_pos)
+            return list_length - (order_list.index(value) if value in order_list else empty_pos)
+        return resolve
+
+    def _compile_field_preference(self, field):
+        """
+        Return a function equivalent to _calculate_field_preference(format_, field)
+        that looks up the settings of the field only once
+        """
+        get_setting = functools.partial(self._get_field_setting, field)
+        type_ = get_setting('type')
+        if type_ == 'multiple':
+            type_ = 'field'  # Only 'field' is allowed in multiple for now
+            keys = tuple(self._get_field_setting(f, 'field') for f in get_setting('field'))
+            function = get_setting('function')
+            get_value = lambda format_: function(format_.get(key) for key in keys)
+        else:
+            key = get_setting('field')
+            get_value = lambda format_: format_.get(key)
+
+        reverse, closest, limit = get_setting('reverse'), get_setting('closest'), get_setting('limit')
+        if type_ == 'extractor':
+            maximum = get_setting('max')
+            convert_value = lambda value: -1 if value is None or (maximum is not None and value >= maximum) else value
+        elif type_ == 'boolean':
+            in_list, not_in_list = get_setting('in_list'), get_setting('not_in_list')
+            convert_value = lambda value: 0 if (
+                (in_list is None or value in in_list) and (not_in_list is None or value not in not_in_list)) else -1
+        elif type_ == 'ordered':
+            convert_value = (
+                self._compile_order(field) if get_setting('convert') == 'order'
+                else functools.partial(self._resolve_field_value, field, convert_none=True))
+        else:
+            convert_value = None
+
+        default = get_setting('default')
+        # The conversion of a "float_string" field changes to "string" once a non-numeric value is seen
+        is_string = (
+            (lambda: self._get_field_setting(field, 'convert') == 'string') if get_setting('convert') == 'float_string'
+            else (lambda: True) if get_setting('convert') == 'string'
+            else (lambda: False))
+
+        def calculate(format_):
+            value = get_value(format_)
+            if convert_value is not None:
+                value = convert_value(value)
+
+            # try to convert to number; same as float_or_none(value, default=default)
+            try:
+                val_num = default if value is None else float(value)
+            except (ValueError, TypeError):
+                val_num = default
+            is_num = not is_string() and val_num is not None
+            if is_num:
+                value = val_num
+
+            return ((-10, 0) if value is None
+                    else (1, value, 0) if not is_num  # if a field has mixed strings and numbers, strings are sorted higher
+                    else (0, -abs(value - limit), value - limit if reverse else limit - value) if closest
+                    else (0, value, 0) if not reverse and (limit is None or value <= limit)
+                    else (0, -value, 0) if limit is None or (reverse and value == limit) or value > limit
+                    else (-1, value, 0))
+        return calculate
+
     @staticmethod
     def _fill_sorting_fields(format):
         # Determine missing protocol
@@ -5611,7 +5784,15 @@ def _fill_sorting_fields(format):
 
     def calculate_preference(self, format):
         self._fill_sorting_fields(format)
-        return tuple(self._calculate_field_preference(format, field) for field in self._order)
+        return tuple(calculate(format) for calculate in self._field_preferences)
+
+    def sort(self, formats):
+        """Sort the formats in place, from the worst to the best"""
+        for format_ in formats:
+            self._fill_sorting_fields(format_)
+        # Compute the preferences field by field, to avoid the per-format overhead
+        keys = list(zip(*(list(map(calculate, formats)) for calculate in self._field_preferences)))
+        formats[:] = [formats[i] for i in sorted(range(len(formats)), key=keys.__getitem__)]
 
 
 def filesize_from_tbr(tbr, duration):